@@ -1,7 +1,12 @@
-from typing import Any
+from typing import Any, TypeVar
 
+from github_graphql_client.queries.compiled import QueryLike
 from github_graphql_client.transport.base import BaseAsyncTransport
 
+from .typed import GraphQLResponse, decode_response
+
+T = TypeVar("T")
+
 
 class AsyncGraphQLClient:
     """Async GraphQL client based on `BaseAsyncTransport` transport."""
@@ -27,6 +32,24 @@ class AsyncGraphQLClient:
         await self.transport.close()
 
     async def execute_async(
-        self, query: str, variables: dict[str, Any], **kwargs: Any
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
     ) -> dict[str, Any]:
         return await self.transport.execute(query, variables, **kwargs)
+
+    async def execute_raw_async(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        return await self.transport.execute_raw(query, variables, **kwargs)
+
+    async def execute_typed_async(
+        self,
+        query: QueryLike,
+        variables: dict[str, Any],
+        response_model: type[T],
+        trusted: bool = False,
+        **kwargs: Any,
+    ) -> GraphQLResponse[T]:
+        body = await self.transport.execute_bytes(query, variables, **kwargs)
+        return decode_response(
+            body, response_model, trusted, self.transport.codec
+        )
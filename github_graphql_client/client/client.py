@@ -1,29 +1,191 @@
 import asyncio
-from typing import Any, Union
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from graphql import GraphQLSchema
 
+from github_graphql_client.queries.compiled import QueryLike, get_query_text
 from github_graphql_client.transport.base import (
     BaseAsyncTransport,
     BaseTransport,
 )
 
 from .async_client import AsyncGraphQLClient
+from .result import ExecutionResult
+from .runtime import EventLoopThread
+from .scheduler import BatchScheduler
 from .sync_client import SyncGraphQLClient
+from .typed import GraphQLResponse
+from .validation import QueryValidator
+
+T = TypeVar("T")
 
 
 class GraphQLClient(SyncGraphQLClient, AsyncGraphQLClient):
-    """GraphQL client."""
+    """GraphQL client.
+
+    With `persistent=True` the transport is connected once and kept open
+    until `close()` is called. For async transports the session lives on
+    a background event loop thread, so warm keep-alive connections are
+    reused by every `execute` and `execute_batch` call.
+
+    `max_in_flight` caps the number of concurrent requests of an async
+    `execute_batch`; by default all queries of a batch are sent at once.
+    `max_workers` runs a sync `execute_batch` on a thread pool of that
+    size instead of one query after another; the connection pool of the
+    transport is grown to `max_workers` if it is smaller.
+
+    With a `schema` (see `github_graphql_client.schema.load_schema`) every
+    query is validated against it before it is sent, by the sync and the
+    async methods, and an invalid query raises its first `GraphQLError`
+    without a request; the verdict is cached per query text.
+    """
 
     transport: Union[BaseTransport, BaseAsyncTransport]
 
     def __init__(
-        self, transport: Union[BaseTransport, BaseAsyncTransport]
+        self,
+        transport: Union[BaseTransport, BaseAsyncTransport],
+        persistent: bool = False,
+        max_in_flight: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        schema: Optional[GraphQLSchema] = None,
     ) -> None:
         super().__init__(transport)
+        self.persistent = persistent
+        self.scheduler = BatchScheduler(max_in_flight)
+        self.max_workers = max_workers
+        self.validator = QueryValidator(schema) if schema is not None else None
+        self._size_pool()
+
+        self._runtime: Optional[EventLoopThread] = None
+        self._connected = False
+        self._lock = threading.Lock()
+
+    def _size_pool(self) -> None:
+        """Grow the connection pool of a sync transport to `max_workers`,
+        threads beyond the pool size would discard their connections."""
+        pool_maxsize = getattr(self.transport, "pool_maxsize", None)
+        if (
+            pool_maxsize is None
+            or self.max_workers is None
+            or pool_maxsize >= self.max_workers
+        ):
+            return
+
+        if getattr(self.transport, "session", None) is not None:
+            warnings.warn(
+                f"pool_maxsize={pool_maxsize} of the connected transport is "
+                f"smaller than max_workers={self.max_workers}",
+                stacklevel=3,
+            )
+        else:
+            self.transport.pool_maxsize = self.max_workers
+
+    def _start(self) -> None:
+        """Connect the transport once for the persistent mode."""
+        with self._lock:
+            if self._connected:
+                return
+
+            if isinstance(self.transport, BaseAsyncTransport):
+                self._runtime = EventLoopThread()
+                self._runtime.start()
+                self._runtime.run(self.connect_async())
+            else:
+                self.connect_sync()
+
+            self._connected = True
+
+    def close(self) -> None:
+        """Close the persistent transport session and its event loop."""
+        with self._lock:
+            if not self._connected:
+                return
+
+            if self._runtime is not None:
+                try:
+                    self._runtime.run(self.close_async())
+                finally:
+                    self._runtime.stop()
+                    self._runtime = None
+            else:
+                self.close_sync()
+
+            self._connected = False
+
+    def _validate(self, *queries: QueryLike) -> None:
+        if self.validator is not None:
+            for query in queries:
+                self.validator.validate(get_query_text(query))
+
+    async def execute_async(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        self._validate(query)
+        return await super().execute_async(query, variables, **kwargs)
+
+    async def execute_raw_async(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        self._validate(query)
+        return await super().execute_raw_async(query, variables, **kwargs)
+
+    async def execute_typed_async(
+        self,
+        query: QueryLike,
+        variables: dict[str, Any],
+        response_model: type[T],
+        trusted: bool = False,
+        **kwargs: Any,
+    ) -> GraphQLResponse[T]:
+        self._validate(query)
+        return await super().execute_typed_async(
+            query, variables, response_model, trusted, **kwargs
+        )
+
+    def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run `coro` to completion from sync code."""
+        if self.persistent:
+            self._start()
+            return self._runtime.run(coro)
+
+        return asyncio.run(coro)
+
+    @asynccontextmanager
+    async def _session_async(self) -> AsyncIterator["GraphQLClient"]:
+        if self.persistent:
+            yield self
+        else:
+            async with self as client:
+                yield client
+
+    @contextmanager
+    def _session_sync(self) -> Iterator["GraphQLClient"]:
+        if self.persistent:
+            self._start()
+            yield self
+        else:
+            with self as client:
+                yield client
 
     async def _execute_async(
-        self, query: str, variables: dict[str, Any], **kwargs: Any
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
     ) -> dict[str, Any]:
-        async with self as client:
+        async with self._session_async() as client:
             data = await client.execute_async(
                 query,
                 variables,
@@ -31,57 +193,160 @@ class GraphQLClient(SyncGraphQLClient, AsyncGraphQLClient):
             )
         return data
 
-    async def _execute_batch_async(
+    async def _execute_typed_async(
         self,
-        queries: list[str],
-        variables: list[dict[str, Any]],
+        query: QueryLike,
+        variables: dict[str, Any],
+        response_model: type[T],
+        trusted: bool = False,
         **kwargs: Any,
-    ) -> list[dict[str, Any]]:
-        tasks = []
+    ) -> GraphQLResponse[T]:
+        async with self._session_async() as client:
+            return await client.execute_typed_async(
+                query, variables, response_model, trusted, **kwargs
+            )
 
-        async with self as client:
-            for i in range(len(queries)):
-                query = queries[i]
-                vars = variables[i]
+    async def _execute_result_async(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> ExecutionResult:
+        tic = time.perf_counter()
+        try:
+            payload = await self.execute_raw_async(query, variables, **kwargs)
+        except Exception as e:
+            return ExecutionResult(
+                exception=e, elapsed=time.perf_counter() - tic
+            )
 
-                tasks.append(client.execute_async(query, vars, **kwargs))
+        return ExecutionResult.from_payload(payload, time.perf_counter() - tic)
+
+    def _execute_result_sync(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> ExecutionResult:
+        tic = time.perf_counter()
+        try:
+            self._validate(query)
+            payload = self.execute_raw_sync(query, variables, **kwargs)
+        except Exception as e:
+            return ExecutionResult(
+                exception=e, elapsed=time.perf_counter() - tic
+            )
+
+        return ExecutionResult.from_payload(payload, time.perf_counter() - tic)
+
+    async def _execute_batch_results_async(
+        self,
+        queries: list[QueryLike],
+        variables: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> list[ExecutionResult]:
+        async with self._session_async() as client:
+            jobs = [
+                partial(client._execute_result_async, query, vars, **kwargs)
+                for query, vars in zip(queries, variables)
+            ]
+            return await self.scheduler.run(jobs)
 
-            result_data = await asyncio.gather(*tasks)
+    async def _execute_batch_async(
+        self,
+        queries: list[QueryLike],
+        variables: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        async with self._session_async() as client:
+            jobs = [
+                partial(client.execute_async, query, vars, **kwargs)
+                for query, vars in zip(queries, variables)
+            ]
+            result_data = await self.scheduler.run(jobs)
 
-        return list(result_data)
+        return result_data
 
     def execute(
-        self, query: str, variables: dict[str, Any], **kwargs: Any
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
     ) -> dict[str, Any]:
         """Execute GraphQL query."""
+        self._validate(query)
 
         if isinstance(self.transport, BaseAsyncTransport):
-            return asyncio.run(self._execute_async(query, variables, **kwargs))
+            return self._run(self._execute_async(query, variables, **kwargs))
         else:
-            with self as client:
+            with self._session_sync() as client:
                 return client.execute_sync(query, variables, **kwargs)
 
+    def execute_typed(
+        self,
+        query: QueryLike,
+        variables: dict[str, Any],
+        response_model: type[T],
+        trusted: bool = False,
+        **kwargs: Any,
+    ) -> GraphQLResponse[T]:
+        """Execute GraphQL query and validate the raw response body
+        straight into `response_model` models for `data`.
+
+        With `trusted=True` the models are built without validation, see
+        `decode_response`.
+        """
+        self._validate(query)
+
+        if isinstance(self.transport, BaseAsyncTransport):
+            return self._run(
+                self._execute_typed_async(
+                    query, variables, response_model, trusted, **kwargs
+                )
+            )
+        else:
+            with self._session_sync() as client:
+                return client.execute_typed_sync(
+                    query, variables, response_model, trusted, **kwargs
+                )
+
     def execute_batch(
         self,
-        queries: list[str],
+        queries: list[QueryLike],
         variables: list[dict[str, Any]],
         **kwargs: Any,
     ) -> list[dict[str, Any]]:
         """Execute a batch of GraphQL queries."""
+        self._validate(*queries)
 
         if isinstance(self.transport, BaseAsyncTransport):
-            return asyncio.run(
+            return self._run(
                 self._execute_batch_async(queries, variables, **kwargs)
             )
         else:
-            results = []
-            with self as client:
-                for i in range(len(queries)):
-                    query = queries[i]
-                    vars = variables[i]
+            with self._session_sync() as client:
+                execute = partial(client.execute_sync, **kwargs)
+
+                if self.max_workers is None:
+                    return list(map(execute, queries, variables))
+
+                with ThreadPoolExecutor(self.max_workers) as executor:
+                    return list(executor.map(execute, queries, variables))
 
-                    res = client.execute_sync(query, vars, **kwargs)
+    def execute_batch_results(
+        self,
+        queries: list[QueryLike],
+        variables: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> list[ExecutionResult]:
+        """Execute a batch of GraphQL queries without failing as a whole.
+
+        Returns an `ExecutionResult` with the data, GraphQL errors, raised
+        exception and timing of every query, so a failed query does not
+        discard the results of the others.
+        """
+
+        if isinstance(self.transport, BaseAsyncTransport):
+            return self._run(
+                self._execute_batch_results_async(queries, variables, **kwargs)
+            )
+        else:
+            with self._session_sync() as client:
+                execute = partial(client._execute_result_sync, **kwargs)
 
-                    results.append(res)
+                if self.max_workers is None:
+                    return list(map(execute, queries, variables))
 
-            return results
+                with ThreadPoolExecutor(self.max_workers) as executor:
+                    return list(executor.map(execute, queries, variables))
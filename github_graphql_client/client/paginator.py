@@ -0,0 +1,166 @@
+import asyncio
+import contextlib
+import queue
+import threading
+from typing import Any, AsyncIterator, Iterator, Optional, Union
+
+from graphql_query import Operation
+
+from github_graphql_client.queries.pagination import paginate_operation
+
+from .async_client import AsyncGraphQLClient
+from .client import GraphQLClient
+
+_DONE = object()
+
+
+class Paginator:
+    """Iterate over all pages of a connection with cursor pagination.
+
+    Only the current page is kept in memory, so arbitrarily large
+    connections can be crawled.
+
+        operation, variables = get_repository_issues_operation(...)
+        pages = Paginator(client, operation, variables, "repository.issues")
+        for page in pages:
+            ...
+
+    With `prefetch=n` the request for the next page is sent as soon as the
+    cursor of the current page is known, and up to `n` pages are buffered
+    while the consumer is still processing earlier ones.
+    """
+
+    def __init__(
+        self,
+        client: Union[GraphQLClient, AsyncGraphQLClient],
+        operation: Operation,
+        variables: dict[str, Any],
+        path: str,
+        prefetch: int = 0,
+        **kwargs: Any,
+    ) -> None:
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+
+        self.client = client
+        self.paginated = paginate_operation(operation, path)
+        self.query = self.paginated.operation.render()
+        self.variables = variables
+        self.prefetch = prefetch
+        self.kwargs = kwargs
+
+    def _variables(self, cursor: Optional[str]) -> dict[str, Any]:
+        return {**self.variables, self.paginated.cursor_variable: cursor}
+
+    def _pages(self) -> Iterator[dict[str, Any]]:
+        cursor = None
+        while True:
+            data = self.client.execute(
+                self.query, self._variables(cursor), **self.kwargs
+            )
+            connection = self.paginated.get_connection(data)
+            if connection is None:
+                return
+
+            yield connection
+
+            cursor = self.paginated.next_cursor(connection)
+            if cursor is None:
+                return
+
+    async def _pages_async(self) -> AsyncIterator[dict[str, Any]]:
+        cursor = None
+        while True:
+            data = await self.client.execute_async(
+                self.query, self._variables(cursor), **self.kwargs
+            )
+            connection = self.paginated.get_connection(data)
+            if connection is None:
+                return
+
+            yield connection
+
+            cursor = self.paginated.next_cursor(connection)
+            if cursor is None:
+                return
+
+    def _prefetch_pages(self) -> Iterator[dict[str, Any]]:
+        buffer: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stopped = threading.Event()
+
+        def put(item: Any) -> bool:
+            while not stopped.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce() -> None:
+            try:
+                for page in self._pages():
+                    if not put(page):
+                        return
+            except BaseException as e:
+                put(e)
+            else:
+                put(_DONE)
+
+        producer = threading.Thread(
+            target=produce, name="graphql-paginator", daemon=True
+        )
+        producer.start()
+
+        try:
+            while True:
+                item = buffer.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+            producer.join()
+
+    async def _prefetch_pages_async(self) -> AsyncIterator[dict[str, Any]]:
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch)
+
+        async def produce() -> None:
+            try:
+                async for page in self._pages_async():
+                    await buffer.put(page)
+            except Exception as e:
+                await buffer.put(e)
+            else:
+                await buffer.put(_DONE)
+
+        producer = asyncio.create_task(produce())
+
+        try:
+            while True:
+                item = await buffer.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Yield connection pages using `GraphQLClient.execute`."""
+        if self.prefetch:
+            return self._prefetch_pages()
+
+        return self._pages()
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield connection pages using `execute_async`."""
+        if self.prefetch:
+            return self._prefetch_pages_async()
+
+        return self._pages_async()
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class ExecutionResult:
+    """The outcome of one query of a batch.
+
+    `errors` holds the GraphQL `errors` of the response, `exception` the
+    error raised while executing the query and `elapsed` the duration in
+    seconds including retries.
+    """
+
+    data: Optional[dict[str, Any]] = None
+    errors: Optional[list[dict[str, Any]]] = None
+    exception: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None and not self.errors
+
+    @classmethod
+    def from_payload(
+        cls, payload: dict[str, Any], elapsed: float
+    ) -> "ExecutionResult":
+        return cls(
+            data=payload.get("data"),
+            errors=payload.get("errors"),
+            elapsed=elapsed,
+        )
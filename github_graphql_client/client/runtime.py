@@ -0,0 +1,57 @@
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """An asyncio event loop running forever in a background thread."""
+
+    loop: Optional[asyncio.AbstractEventLoop]
+
+    def __init__(self, name: str = "graphql-client-loop") -> None:
+        self.name = name
+        self.loop = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the event loop thread."""
+        if self.is_running:
+            raise Exception("EventLoopThread is already running")
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_forever, name=self.name, daemon=True
+        )
+        self._thread.start()
+
+    def _run_forever(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Submit `coro` to the loop and block until it is done."""
+        if self.loop is None or not self.is_running:
+            coro.close()
+            raise Exception("EventLoopThread is not running")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result()
+
+    def stop(self) -> None:
+        """Stop the loop, wait for the thread and close the loop."""
+        if self.loop is None:
+            return
+
+        if self.is_running:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+
+        self.loop.close()
+        self.loop = None
+        self._thread = None
@@ -0,0 +1,47 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class BatchScheduler:
+    """Run a batch of coroutines with at most `max_in_flight` at once.
+
+    Jobs are taken from a FIFO work queue by a fixed pool of workers, so
+    the number of in-flight requests stays at the limit until the queue
+    is drained and results keep the order of the submitted jobs.
+    """
+
+    def __init__(self, max_in_flight: Optional[int] = None) -> None:
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be a positive integer")
+
+        self.max_in_flight = max_in_flight
+
+    async def run(self, jobs: Sequence[Callable[[], Awaitable[T]]]) -> list[T]:
+        """Run `jobs` and return their results in the original order."""
+        if self.max_in_flight is None:
+            return list(await asyncio.gather(*(job() for job in jobs)))
+
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for i in range(len(jobs)):
+            queue.put_nowait(i)
+
+        results: list[Any] = [None] * len(jobs)
+
+        async def worker() -> None:
+            while not queue.empty():
+                i = queue.get_nowait()
+                results[i] = await jobs[i]()
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_in_flight, len(jobs)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        return results
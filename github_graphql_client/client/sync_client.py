@@ -1,7 +1,12 @@
-from typing import Any
+from typing import Any, TypeVar
 
+from github_graphql_client.queries.compiled import QueryLike
 from github_graphql_client.transport.base import BaseTransport
 
+from .typed import GraphQLResponse, decode_response
+
+T = TypeVar("T")
+
 
 class SyncGraphQLClient:
     """Sync GraphQL client based on `BaseTransport` transport."""
@@ -27,6 +32,24 @@ class SyncGraphQLClient:
         self.transport.close()
 
     def execute_sync(
-        self, query: str, variables: dict[str, Any], **kwargs: Any
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
     ) -> dict[str, Any]:
         return self.transport.execute(query, variables, **kwargs)
+
+    def execute_raw_sync(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        return self.transport.execute_raw(query, variables, **kwargs)
+
+    def execute_typed_sync(
+        self,
+        query: QueryLike,
+        variables: dict[str, Any],
+        response_model: type[T],
+        trusted: bool = False,
+        **kwargs: Any,
+    ) -> GraphQLResponse[T]:
+        body = self.transport.execute_bytes(query, variables, **kwargs)
+        return decode_response(
+            body, response_model, trusted, self.transport.codec
+        )
@@ -0,0 +1,202 @@
+import copy
+import sys
+import typing
+from collections import ChainMap
+from enum import Enum
+from typing import Any, Callable, ForwardRef, Mapping, Optional, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from github_graphql_client.codegen.runtime import OTHER
+
+T = TypeVar("T")
+
+Converter = Callable[[Any], Any]
+
+_object_setattr = object.__setattr__
+
+_IMMUTABLE = (type(None), bool, int, float, str, bytes, tuple, Enum)
+
+
+class _Plan:
+    """How to construct a model from response data: the response key,
+    attribute name and value converter of every field, and the defaults of
+    missing fields."""
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.fields: dict[str, tuple[str, Optional[Converter]]] = {}
+        self.defaults: dict[str, Any] = {}
+        self.mutable_defaults: dict[str, Any] = {}
+        self.default_factories: dict[str, Callable[[], Any]] = {}
+
+        for name, info in model.model_fields.items():
+            namespace = _namespace(model, name)
+            key = info.alias or name
+            self.fields[key] = (name, _converter(namespace, info.annotation))
+            if info.default_factory is not None:
+                # factories taking the validated data are not supported
+                self.default_factories[name] = info.default_factory
+            elif isinstance(info.default, _IMMUTABLE):
+                self.defaults[name] = info.default
+            elif info.default is not PydanticUndefined:
+                self.mutable_defaults[name] = info.default
+
+
+_plans: dict[type, _Plan] = {}
+
+
+def _namespace(model: type, name: str) -> Mapping[str, Any]:
+    """The globals of the module declaring field `name` of `model`, and of
+    the module of `model`."""
+    namespaces = [vars(sys.modules[model.__module__])]
+    for base in model.__mro__:
+        if name in getattr(base, "__annotations__", {}):
+            namespaces.insert(0, vars(sys.modules[base.__module__]))
+            break
+    return ChainMap(*namespaces)
+
+
+def _resolve(namespace: Mapping[str, Any], annotation: Any) -> Any:
+    """Evaluate a forward reference left unresolved by deferred building."""
+    if isinstance(annotation, str):
+        annotation = ForwardRef(annotation)
+    if isinstance(annotation, ForwardRef):
+        return eval(annotation.__forward_arg__, {}, namespace)
+    return annotation
+
+
+def _tag(member: Any, metadata: tuple) -> Optional[str]:
+    for item in metadata:
+        tag = getattr(item, "tag", None)
+        if isinstance(tag, str):
+            return tag
+
+    if isinstance(member, type) and issubclass(member, BaseModel):
+        info = member.model_fields.get("typename__")
+        if info is not None and isinstance(info.default, str):
+            return info.default
+        return member.__name__
+    return None
+
+
+def _union(
+    namespace: Mapping[str, Any], members: tuple
+) -> Optional[Converter]:
+    converters: dict[Optional[str], Optional[Converter]] = {}
+    for member in members:
+        metadata: tuple = ()
+        if typing.get_origin(member) is typing.Annotated:
+            member, *rest = typing.get_args(member)
+            metadata = tuple(rest)
+        member = _resolve(namespace, member)
+        converters.setdefault(
+            _tag(member, metadata), _converter(namespace, member)
+        )
+
+    if len(converters) == 1:
+        return next(iter(converters.values()))
+
+    # without an `OTHER` member, values of an unknown type are left as is
+    fallback = converters.get(OTHER)
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        converter = converters.get(value.get("__typename"), fallback)
+        return value if converter is None else converter(value)
+
+    return convert
+
+
+def _converter(
+    namespace: Mapping[str, Any], annotation: Any
+) -> Optional[Converter]:
+    """The function converting a non-null response value of `annotation`,
+    or None if the value is used as is."""
+    annotation = _resolve(namespace, annotation)
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Annotated:
+        if (
+            isinstance(args[0], ForwardRef)
+            or typing.get_origin(args[0]) is not typing.Union
+        ):
+            return _converter(namespace, args[0])
+        # a discriminated union
+        return _union(namespace, typing.get_args(args[0]))
+
+    if origin is typing.Union:
+        members = tuple(arg for arg in args if arg is not type(None))
+        if len(members) == 1:
+            return _converter(namespace, members[0])
+        return _union(namespace, members)
+
+    if origin is list:
+        item = _converter(namespace, args[0]) if args else None
+        if item is None:
+            return None
+        return lambda values: [
+            None if value is None else item(value) for value in values
+        ]
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return lambda data: construct_model(annotation, data)
+        if issubclass(annotation, Enum):
+            return annotation
+
+    # scalars, literals and `Any`
+    return None
+
+
+def _get_plan(model: type[BaseModel]) -> _Plan:
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = _Plan(model)
+    return plan
+
+
+def construct_model(model: type[T], data: dict[str, Any]) -> T:
+    """Build a `model` instance from trusted response `data` without
+    validation, like a recursive `model_construct` converting nested
+    models, lists, enums and `__typename` unions.
+
+    Missing fields are only filled with defaults; models need no built
+    validator, so selections of the full schema models work too.
+    """
+    plan = _get_plan(model)
+
+    fields = plan.fields
+    values = {}
+    # responses only hold the selected fields, far fewer than the fields of
+    # the schema models
+    for key, value in data.items():
+        field = fields.get(key)
+        if field is None:
+            continue
+        name, convert = field
+        if convert is not None and value is not None:
+            value = convert(value)
+        values[name] = value
+
+    fields_set = set(values)
+    if len(values) < len(fields):
+        values = {**plan.defaults, **values}
+        for name, default in plan.mutable_defaults.items():
+            if name not in fields_set:
+                values[name] = copy.deepcopy(default)
+        for name, factory in plan.default_factories.items():
+            if name not in fields_set:
+                values[name] = factory()
+
+    if model.__pydantic_post_init__:
+        return model.model_construct(fields_set, **values)
+
+    instance = model.__new__(model)
+    _object_setattr(instance, "__dict__", values)
+    _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
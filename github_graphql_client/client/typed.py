@@ -0,0 +1,94 @@
+import sys
+from functools import lru_cache
+from typing import Any, Generic, Optional, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from github_graphql_client.transport.codec import JSONCodec, get_default_codec
+
+from .trusted import construct_model
+
+T = TypeVar("T")
+
+
+class GraphQLResponse(BaseModel, Generic[T]):
+    """The root of a GraphQL response with `data` of type `T`."""
+
+    data: Optional[T] = None
+    errors: Optional[list[dict[str, Any]]] = None
+
+
+@lru_cache(maxsize=None)
+def get_response_adapter(
+    response_model: type[T],
+) -> TypeAdapter[GraphQLResponse[T]]:
+    """The cached validator of responses with `data` of `response_model`."""
+    return TypeAdapter(GraphQLResponse[response_model])
+
+
+def is_struct(response_model: type) -> bool:
+    """Whether `response_model` is a msgspec `Struct`."""
+    # a Struct cannot exist without msgspec being imported
+    msgspec = sys.modules.get("msgspec")
+    return (
+        msgspec is not None
+        and isinstance(response_model, type)
+        and issubclass(response_model, msgspec.Struct)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_response_decoder(response_model: type[T]) -> Any:
+    """The cached msgspec decoder of responses with `data` of the
+    `response_model` Struct. It decodes into a Struct with the `data` and
+    `errors` attributes of `GraphQLResponse`."""
+    import msgspec
+
+    response_type = msgspec.defstruct(
+        f"GraphQLResponse[{response_model.__name__}]",
+        [
+            ("data", Optional[response_model], None),
+            ("errors", Optional[list[dict[str, Any]]], None),
+        ],
+        kw_only=True,
+    )
+    return msgspec.json.Decoder(response_type)
+
+
+def construct_response(
+    payload: dict[str, Any], response_model: type[T]
+) -> GraphQLResponse[T]:
+    """Build the `GraphQLResponse` of a decoded response `payload` with
+    `construct_model`, without validation."""
+    data = payload.get("data")
+    return GraphQLResponse.model_construct(
+        data=None if data is None else construct_model(response_model, data),
+        errors=payload.get("errors"),
+    )
+
+
+def decode_response(
+    body: bytes,
+    response_model: type[T],
+    trusted: bool = False,
+    codec: Optional[JSONCodec] = None,
+) -> GraphQLResponse[T]:
+    """Validate the response `body` into models in a single pass, without
+    building an intermediate dict. msgspec `Struct` models are decoded
+    with msgspec.
+
+    With `trusted=True` pydantic models are not validated: the body is
+    decoded with `codec` and the models are built by `construct_model`.
+    This is meant for the schema models of `github_graphql_client.model`,
+    whose required fields are missing from any selection and whose
+    validators take seconds to build. Projection models validate faster
+    than they are constructed.
+    """
+    if is_struct(response_model):
+        return get_response_decoder(response_model).decode(body)
+
+    if trusted:
+        codec = codec or get_default_codec()
+        return construct_response(codec.loads(body), response_model)
+
+    return get_response_adapter(response_model).validate_json(body)
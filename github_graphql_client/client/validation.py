@@ -0,0 +1,34 @@
+from functools import lru_cache
+from typing import Optional
+
+from graphql import GraphQLError, GraphQLSchema, Source, parse, validate
+
+
+class QueryValidator:
+    """Validate queries against a local copy of the schema before they are
+    sent, so a malformed query fails without a round trip.
+
+    Every distinct query text is parsed and validated once, the verdict is
+    cached by the text with at most `maxsize` entries, so executing the
+    same query again costs a dict lookup.
+    """
+
+    def __init__(self, schema: GraphQLSchema, maxsize: int = 1024) -> None:
+        self.schema = schema
+        self._errors = lru_cache(maxsize)(self._validate)
+
+    def _validate(self, query: str) -> Optional[GraphQLError]:
+        try:
+            document = parse(Source(query))
+        except GraphQLError as e:
+            return e
+
+        errors = validate(self.schema, document)
+        return errors[0] if errors else None
+
+    def validate(self, query: str) -> None:
+        """Raise the first `GraphQLError` of `query`, if any."""
+        error = self._errors(query)
+        if error is not None:
+            # the cached error would collect the tracebacks of every raise
+            raise error.with_traceback(None)
@@ -0,0 +1,549 @@
+import keyword
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Sequence, Union
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLEnumType,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    is_abstract_type,
+    parse,
+    validate,
+)
+from graphql_query import Operation
+
+from github_graphql_client.queries.typename import with_typename
+
+from .runtime import OTHER
+
+HEADER = """# generated by github_graphql_client.codegen, do not edit
+from __future__ import annotations
+
+{imports}
+"""
+
+SCALARS = {
+    "Int": "int",
+    "Float": "float",
+    "String": "str",
+    "Boolean": "bool",
+    "ID": "str",
+}
+# GitHub serializes all custom scalars (DateTime, URI, HTML, ...) as strings
+DEFAULT_SCALAR = "str"
+
+BACKENDS = ("pydantic", "msgspec")
+
+TYPENAME = "__typename"
+
+
+@dataclass
+class _Selection:
+    """The field nodes selected under one response key."""
+
+    name: str
+    # the type defining the field, the parent type or a fragment type
+    type: GraphQLNamedType
+    nodes: list[FieldNode] = field(default_factory=list)
+    # only selected for some of the possible types, by a fragment
+    conditional: bool = False
+
+
+def _pascal_case(name: str) -> str:
+    return name[:1].upper() + name[1:]
+
+
+def _python_name(key: str) -> str:
+    if key == TYPENAME:
+        return "typename__"
+    if keyword.iskeyword(key) or key.startswith("_"):
+        return re.sub("^_+", "", key) + "_"
+    return key
+
+
+def _description(text: Optional[str]) -> list[str]:
+    if not text:
+        return []
+    lines = [line.rstrip() for line in text.replace('"""', "'''").split("\n")]
+    return ['    """', *(f"    {line}".rstrip() for line in lines), '    """']
+
+
+def _literal(names: Sequence[str]) -> str:
+    return f"Literal[{', '.join(repr(name) for name in names)}]"
+
+
+class ProjectionGenerator:
+    """Generates models of the exact response shape of GraphQL operations:
+    one model per selection set, with just the selected fields under their
+    response keys (aliases), typed from `schema`.
+
+    A selection on a union or interface with fragments on some of its
+    types becomes a union discriminated by `__typename`: one model for
+    every type with fields of its own, and one `...Other` model for all
+    other types. The selection must include `__typename`: it is added to
+    every selection set of a `graphql_query.Operation` by `add`, documents
+    are used as they are.
+
+    With `backend="msgspec"` the models are msgspec `Struct`s, which are
+    decoded straight from the response bytes and take a fraction of the
+    memory of pydantic models; the generated module needs the `msgspec`
+    extra. They are declared with `gc=False`: decoded responses cannot
+    contain reference cycles. Union members are tagged Structs, which
+    have no `typename__` attribute, their type is the class. A Struct has
+    a single tag, so the other types get a subclass of the `...Other`
+    Struct each.
+    """
+
+    def __init__(
+        self, schema: GraphQLSchema, backend: str = "pydantic"
+    ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}")
+
+        self.schema = schema
+        self.backend = backend
+
+        self._classes: list[str] = []
+        self._class_names: set[str] = set()
+        self._enums: dict[str, GraphQLEnumType] = {}
+        self._typing: set[str] = set()
+        self._base: set[str] = (
+            {"BaseModel"} if backend == "pydantic" else {"Struct"}
+        )
+        self._runtime: set[str] = set()
+        self._fragments: dict[str, FragmentDefinitionNode] = {}
+
+    def add(self, operation: Union[Operation, str, DocumentNode]) -> None:
+        """Add models for the operations of a `graphql_query.Operation` or
+        a GraphQL document. Raises `GraphQLError` for invalid documents.
+
+        `__typename` is added to the selections of an `Operation`, see
+        `github_graphql_client.queries.typename.with_typename`: the models
+        decode the responses of `with_typename(operation)`, which is the
+        operation to send."""
+        if isinstance(operation, Operation):
+            operation = with_typename(operation).render()
+        if isinstance(operation, str):
+            operation = parse(operation)
+
+        errors = validate(self.schema, operation)
+        if errors:
+            raise errors[0]
+
+        fragments = {
+            definition.name.value: definition
+            for definition in operation.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+        for definition in operation.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                self._fragments = fragments
+                self._add_operation(definition)
+
+    def _add_operation(self, operation: OperationDefinitionNode) -> None:
+        if operation.name is None:
+            raise GraphQLError(
+                "Cannot generate models for an anonymous operation",
+                operation,
+            )
+
+        root_type = self.schema.get_root_type(operation.operation)
+        self._model(
+            _pascal_case(operation.name.value),
+            root_type,
+            [operation.selection_set],
+        )
+
+    def _collect(
+        self,
+        parent_type: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        selections: dict[str, _Selection],
+        scope_type: Optional[GraphQLNamedType] = None,
+        conditional: bool = False,
+    ) -> None:
+        scope_type = scope_type or parent_type
+
+        for node in selection_set.selections:
+            if isinstance(node, FieldNode):
+                key = node.alias.value if node.alias else node.name.value
+                selection = selections.setdefault(
+                    key,
+                    _Selection(
+                        node.name.value, scope_type, conditional=conditional
+                    ),
+                )
+                selection.nodes.append(node)
+                selection.conditional &= conditional
+                continue
+
+            if isinstance(node, FragmentSpreadNode):
+                fragment = self._fragments[node.name.value]
+                type_condition = fragment.type_condition
+                fragment_selection_set = fragment.selection_set
+            elif isinstance(node, InlineFragmentNode):
+                type_condition = node.type_condition
+                fragment_selection_set = node.selection_set
+            else:
+                continue
+
+            fragment_type = (
+                scope_type
+                if type_condition is None
+                else self.schema.get_type(type_condition.name.value)
+            )
+            covers = self._covers(fragment_type, parent_type)
+            if not covers and isinstance(parent_type, GraphQLObjectType):
+                # never applies to this type
+                continue
+
+            self._collect(
+                parent_type,
+                fragment_selection_set,
+                selections,
+                fragment_type,
+                conditional or not covers,
+            )
+
+    def _covers(
+        self, type_condition: GraphQLNamedType, parent_type: GraphQLNamedType
+    ) -> bool:
+        """Whether every value of `parent_type` matches `type_condition`."""
+        if type_condition is parent_type:
+            return True
+        if isinstance(parent_type, GraphQLObjectType) and is_abstract_type(
+            type_condition
+        ):
+            return self.schema.is_sub_type(type_condition, parent_type)
+        return False
+
+    def _annotation(
+        self, type_: GraphQLOutputType, named: str, nullable: bool = True
+    ) -> str:
+        if isinstance(type_, GraphQLNonNull):
+            return self._annotation(type_.of_type, named, nullable=False)
+
+        if isinstance(type_, GraphQLList):
+            self._typing.add("List")
+            annotation = f"List[{self._annotation(type_.of_type, named)}]"
+        else:
+            annotation = named
+
+        if nullable:
+            self._typing.add("Optional")
+            return f"Optional[{annotation}]"
+        return annotation
+
+    def _named(
+        self,
+        class_name: str,
+        named_type: GraphQLNamedType,
+        nodes: list[FieldNode],
+    ) -> str:
+        if isinstance(named_type, GraphQLScalarType):
+            return SCALARS.get(named_type.name, DEFAULT_SCALAR)
+
+        if isinstance(named_type, GraphQLEnumType):
+            self._enums[named_type.name] = named_type
+            return named_type.name
+
+        selection_sets = [node.selection_set for node in nodes]
+        if is_abstract_type(named_type):
+            return self._abstract(class_name, named_type, selection_sets)
+
+        return self._model(class_name, named_type, selection_sets)
+
+    def _signature(
+        self, selections: dict[str, _Selection]
+    ) -> dict[str, tuple[int, bool]]:
+        return {
+            key: (len(selection.nodes), selection.conditional)
+            for key, selection in selections.items()
+        }
+
+    def _abstract(
+        self,
+        class_name: str,
+        abstract_type: GraphQLNamedType,
+        selection_sets: list[SelectionSetNode],
+    ) -> str:
+        """One model if all possible types select the same fields, else a
+        union of models discriminated by `__typename`."""
+        common: dict[str, _Selection] = {}
+        for selection_set in selection_sets:
+            self._collect(abstract_type, selection_set, common)
+        common = {
+            key: selection
+            for key, selection in common.items()
+            if not selection.conditional
+        }
+
+        specific = []
+        others = []
+        for possible_type in self.schema.get_possible_types(abstract_type):
+            selections: dict[str, _Selection] = {}
+            for selection_set in selection_sets:
+                self._collect(possible_type, selection_set, selections)
+
+            if self._signature(selections) == self._signature(common):
+                others.append(possible_type.name)
+            else:
+                specific.append(possible_type)
+
+        if not specific:
+            return self._model(class_name, abstract_type, selection_sets)
+
+        if TYPENAME not in common:
+            raise GraphQLError(
+                f"Selections on {abstract_type.name} with fragments need "
+                f"`{TYPENAME}` to tell the types apart",
+                selection_sets[0],
+            )
+
+        members = {
+            self._model(
+                class_name + possible_type.name,
+                possible_type,
+                selection_sets,
+                typenames=[possible_type.name],
+            ): possible_type.name
+            for possible_type in specific
+        }
+        if others:
+            members.update(
+                self._others(
+                    class_name, abstract_type, selection_sets, sorted(others)
+                )
+            )
+
+        self._typing.update(("TypeAlias", "Union"))
+        if self.backend == "msgspec":
+            # Structs are tagged with their `__typename`
+            alias = f"{class_name}: TypeAlias = Union[{', '.join(members)}]"
+        else:
+            self._typing.add("Annotated")
+            self._base.add("Tag")
+            self._runtime.add("typename_discriminator")
+            tags = ", ".join(repr(typename.name) for typename in specific)
+            alias = "\n".join(
+                [
+                    f"{class_name}: TypeAlias = Annotated[",
+                    "    Union[",
+                    *(
+                        f"        Annotated[{member}, Tag('{tag}')],"
+                        for member, tag in members.items()
+                    ),
+                    "    ],",
+                    f"    typename_discriminator({tags}),",
+                    "]",
+                ]
+            )
+
+        self._class_names.add(class_name)
+        self._classes.append(alias)
+        return class_name
+
+    def _others(
+        self,
+        class_name: str,
+        abstract_type: GraphQLNamedType,
+        selection_sets: list[SelectionSetNode],
+        typenames: list[str],
+    ) -> dict[str, str]:
+        """The union members of the types without fields of their own."""
+        other_name = class_name + OTHER
+
+        if self.backend == "pydantic":
+            self._model(other_name, abstract_type, selection_sets, [])
+            return {other_name: OTHER}
+
+        # a Struct has a single tag, so every type needs a subclass
+        self._model(other_name, abstract_type, selection_sets, [])
+        members = {}
+        for typename in typenames:
+            member = other_name + typename
+            self._class_names.add(member)
+            self._classes.append(
+                f"class {member}({other_name}, tag='{typename}'):\n    pass"
+            )
+            members[member] = typename
+        return members
+
+    def _field(
+        self,
+        class_name: str,
+        parent_type: GraphQLNamedType,
+        key: str,
+        selection: _Selection,
+        typenames: Optional[list[str]] = None,
+    ) -> Optional[str]:
+        name = _python_name(key)
+
+        if selection.name == TYPENAME:
+            if typenames is not None and self.backend == "msgspec":
+                # the tag of the Struct
+                return None
+
+            if typenames:
+                self._typing.add("Literal")
+                annotation = _literal(typenames)
+            elif isinstance(parent_type, GraphQLObjectType):
+                self._typing.add("Literal")
+                annotation = _literal([parent_type.name])
+            else:
+                annotation = "str"
+            if selection.conditional:
+                self._typing.add("Optional")
+                annotation = f"Optional[{annotation}]"
+            nullable = selection.conditional
+        else:
+            definition = selection.type.fields[selection.name]
+            named_type = definition.type
+            while isinstance(named_type, (GraphQLNonNull, GraphQLList)):
+                named_type = named_type.of_type
+
+            named = self._named(
+                class_name + _pascal_case(key), named_type, selection.nodes
+            )
+            field_type = definition.type
+            if selection.conditional and isinstance(
+                field_type, GraphQLNonNull
+            ):
+                field_type = field_type.of_type
+            annotation = self._annotation(field_type, named)
+            nullable = not isinstance(field_type, GraphQLNonNull)
+
+        if name != key:
+            if self.backend == "msgspec":
+                self._base.add("field")
+                default = "default=None, " if nullable else ""
+                value = f"field({default}name='{key}')"
+            else:
+                self._base.add("Field")
+                default = "None" if nullable else "..."
+                value = f"Field({default}, alias='{key}')"
+            return f"    {name}: {annotation} = {value}"
+        if nullable:
+            return f"    {name}: {annotation} = None"
+        return f"    {name}: {annotation}"
+
+    def _model(
+        self,
+        class_name: str,
+        parent_type: GraphQLNamedType,
+        selection_sets: Iterable[SelectionSetNode],
+        typenames: Optional[list[str]] = None,
+    ) -> str:
+        """Add the model of `selection_sets` on `parent_type`. With
+        `typenames` it is a union member for these types."""
+        if class_name in self._class_names:
+            raise GraphQLError(f"Duplicate model name {class_name}")
+        self._class_names.add(class_name)
+
+        selections: dict[str, _Selection] = {}
+        for selection_set in selection_sets:
+            self._collect(parent_type, selection_set, selections)
+        if typenames is not None and is_abstract_type(parent_type):
+            # the other types of a union, fragments do not apply to them
+            selections = {
+                key: selection
+                for key, selection in selections.items()
+                if not selection.conditional
+            }
+
+        if self.backend == "msgspec":
+            options = "kw_only=True, gc=False"
+            if typenames is not None:
+                options += f", tag_field='{TYPENAME}'"
+            if typenames:
+                options += f", tag='{typenames[0]}'"
+            lines = [f"class {class_name}(Struct, {options}):"]
+        else:
+            lines = [f"class {class_name}(BaseModel):"]
+        lines.extend(_description(parent_type.description))
+        fields = [
+            self._field(class_name, parent_type, key, selection, typenames)
+            for key, selection in selections.items()
+        ]
+        fields = [line for line in fields if line is not None]
+        if len(lines) > 1 and fields:
+            lines.append("")
+        lines.extend(fields or ["    pass"])
+
+        # nested models are added first
+        self._classes.append("\n".join(lines))
+        return class_name
+
+    def _enum(self, enum: GraphQLEnumType) -> str:
+        lines = [f"class {enum.name}(Enum):"]
+        lines.extend(_description(enum.description))
+        lines.append("")
+        lines.extend(
+            f"    {name} = '{value.value}'"
+            for name, value in enum.values.items()
+        )
+        return "\n".join(lines)
+
+    def render(self) -> str:
+        """Render the module source of all added operations."""
+        imports = []
+        if self._enums:
+            imports.append("from enum import Enum")
+        if self._typing:
+            names = ", ".join(sorted(self._typing))
+            imports.append(f"from typing import {names}")
+        imports.append("")
+        imports.append(
+            f"from {self.backend} import {', '.join(sorted(self._base))}"
+        )
+        if self._runtime:
+            imports.append("")
+            imports.append(
+                "from github_graphql_client.codegen.runtime import "
+                + ", ".join(sorted(self._runtime))
+            )
+
+        definitions = [
+            self._enum(enum) for _, enum in sorted(self._enums.items())
+        ]
+        definitions.extend(self._classes)
+
+        return (
+            HEADER.format(imports="\n".join(imports))
+            + "\n\n"
+            + "\n\n\n".join(definitions)
+            + "\n"
+        )
+
+
+def generate_projection_models(
+    operations: Iterable[Union[Operation, str, DocumentNode]],
+    schema: GraphQLSchema,
+    backend: str = "pydantic",
+) -> str:
+    """Generate the module source of projection models for `operations`.
+
+    The model of the `data` of an operation is named after the operation,
+    nested models after the operation and the response keys leading to
+    them, e.g. `GetRepositoryIssuesRepositoryIssues`.
+    """
+    generator = ProjectionGenerator(schema, backend)
+    for operation in operations:
+        generator.add(operation)
+
+    return generator.render()
@@ -0,0 +1,288 @@
+from typing import Iterable, Union
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLInputObjectType,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLType,
+    GraphQLUnionType,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    TypeInfo,
+    TypeInfoVisitor,
+    VariableDefinitionNode,
+    Visitor,
+    get_named_type,
+    is_required_argument,
+    parse,
+    specified_directives,
+    specified_scalar_types,
+    type_from_ast,
+    validate,
+    visit,
+)
+from graphql_query import Operation
+
+from github_graphql_client.queries.marketplaceCategories import (
+    get_marketplace_categories_operation,
+)
+from github_graphql_client.queries.pagination import paginate_operation
+from github_graphql_client.queries.rateLimit import with_rate_limit
+from github_graphql_client.queries.repository import (
+    get_repository_issues_operation,
+)
+from github_graphql_client.queries.typename import with_typename
+
+TYPENAME = "__typename"
+
+
+class _Collector(Visitor):
+    """Collects the types and fields an operation reaches."""
+
+    def __init__(self, pruner: "SchemaPruner", type_info: TypeInfo) -> None:
+        super().__init__()
+        self.pruner = pruner
+        self.type_info = type_info
+
+    def enter_operation_definition(
+        self, node: OperationDefinitionNode, *args
+    ) -> None:
+        self.pruner.reach(self.type_info.get_type())
+
+    def enter_variable_definition(
+        self, node: VariableDefinitionNode, *args
+    ) -> None:
+        self.pruner.reach(type_from_ast(self.pruner.schema, node.type))
+
+    def enter_field(self, node: FieldNode, *args) -> None:
+        if node.name.value == TYPENAME:
+            return
+
+        parent = self.type_info.get_parent_type()
+        self.pruner.selected.setdefault(parent.name, set()).add(
+            node.name.value
+        )
+        self.pruner.reach(self.type_info.get_type())
+
+    def enter_argument(self, *args) -> None:
+        argument = self.type_info.get_argument()
+        if argument is not None:
+            self.pruner.reach(argument.type)
+
+    def enter_inline_fragment(self, node: InlineFragmentNode, *args) -> None:
+        self.pruner.reach(self.type_info.get_type())
+
+    def enter_fragment_definition(
+        self, node: FragmentDefinitionNode, *args
+    ) -> None:
+        self.pruner.reach(self.type_info.get_type())
+
+
+class SchemaPruner:
+    """Prunes `schema` to the types reached by a set of operations.
+
+    The pruned schema has the root types, the types of the selected
+    fields, fragments, arguments and variables, and the input types those
+    refer to. Object types and interfaces keep every field whose type and
+    required argument types are kept, so all selected fields and more;
+    union members and interface fields are added where the schema would
+    be invalid otherwise. Custom directives are dropped.
+    """
+
+    def __init__(self, schema: GraphQLSchema) -> None:
+        self.schema = schema
+        self.types: set[str] = set(specified_scalar_types)
+        self.selected: dict[str, set[str]] = {}
+
+    def add(self, operation: Union[Operation, str, DocumentNode]) -> None:
+        """Add the types reached by a `graphql_query.Operation` or a GraphQL
+        document. Raises `GraphQLError` for invalid documents."""
+        if isinstance(operation, Operation):
+            operation = operation.render()
+        if isinstance(operation, str):
+            operation = parse(operation)
+
+        errors = validate(self.schema, operation)
+        if errors:
+            raise errors[0]
+
+        type_info = TypeInfo(self.schema)
+        visit(
+            operation,
+            TypeInfoVisitor(type_info, _Collector(self, type_info)),
+        )
+
+    def reach(self, type_: GraphQLType) -> None:
+        named = get_named_type(type_)
+        if named is None or named.name in self.types:
+            return
+
+        self.types.add(named.name)
+        if isinstance(named, GraphQLInputObjectType):
+            for field in named.fields.values():
+                self.reach(field.type)
+
+    def _is_kept(self, type_: GraphQLType) -> bool:
+        return get_named_type(type_).name in self.types
+
+    def fields(
+        self, type_: Union[GraphQLObjectType, GraphQLInterfaceType]
+    ) -> dict[str, GraphQLField]:
+        """The kept fields of an object type or interface."""
+        return {
+            name: field
+            for name, field in type_.fields.items()
+            if self._is_kept(field.type)
+            and all(
+                self._is_kept(argument.type)
+                for argument in field.args.values()
+                if is_required_argument(argument)
+            )
+        }
+
+    def _complete(self) -> None:
+        """Add the types a valid schema needs: members of unions without
+        any, and the types of interface fields on their implementations."""
+        changed = True
+        while changed:
+            changed = False
+            for name in sorted(self.types):
+                type_ = self.schema.type_map[name]
+                missing: list[GraphQLNamedType] = []
+
+                if isinstance(type_, GraphQLUnionType):
+                    if not any(self._is_kept(t) for t in type_.types):
+                        missing.extend(type_.types)
+
+                elif isinstance(
+                    type_, (GraphQLObjectType, GraphQLInterfaceType)
+                ):
+                    for interface in type_.interfaces:
+                        if not self._is_kept(interface):
+                            continue
+                        for field_name in self.fields(interface):
+                            field = type_.fields[field_name]
+                            missing.append(get_named_type(field.type))
+
+                for missing_type in missing:
+                    if not self._is_kept(missing_type):
+                        self.reach(missing_type)
+                        changed = True
+
+    def prune(self) -> GraphQLSchema:
+        """Build the pruned schema of the operations added so far."""
+        self._complete()
+
+        pruned: dict[str, GraphQLNamedType] = {}
+
+        def ref(type_: GraphQLType) -> GraphQLType:
+            if isinstance(type_, GraphQLNonNull):
+                return GraphQLNonNull(ref(type_.of_type))
+            if isinstance(type_, GraphQLList):
+                return GraphQLList(ref(type_.of_type))
+            # scalars, enums and input types are shared with `schema`
+            return pruned.get(type_.name, type_)
+
+        def fields(type_):
+            return lambda: {
+                name: GraphQLField(
+                    ref(field.type),
+                    args={
+                        arg_name: GraphQLArgument(
+                            ref(argument.type),
+                            default_value=argument.default_value,
+                            description=argument.description,
+                            deprecation_reason=argument.deprecation_reason,
+                            out_name=argument.out_name,
+                        )
+                        for arg_name, argument in field.args.items()
+                        if self._is_kept(argument.type)
+                    },
+                    description=field.description,
+                    deprecation_reason=field.deprecation_reason,
+                )
+                for name, field in self.fields(type_).items()
+            }
+
+        def interfaces(type_):
+            return lambda: [
+                pruned[interface.name]
+                for interface in type_.interfaces
+                if self._is_kept(interface)
+            ]
+
+        for name in sorted(self.types):
+            type_ = self.schema.type_map[name]
+            if isinstance(type_, GraphQLObjectType):
+                pruned[name] = GraphQLObjectType(
+                    name,
+                    fields(type_),
+                    interfaces(type_),
+                    description=type_.description,
+                )
+            elif isinstance(type_, GraphQLInterfaceType):
+                pruned[name] = GraphQLInterfaceType(
+                    name,
+                    fields(type_),
+                    interfaces=interfaces(type_),
+                    description=type_.description,
+                )
+            elif isinstance(type_, GraphQLUnionType):
+                pruned[name] = GraphQLUnionType(
+                    name,
+                    lambda type_=type_: [
+                        pruned[member.name]
+                        for member in type_.types
+                        if self._is_kept(member)
+                    ],
+                    description=type_.description,
+                )
+            else:
+                pruned[name] = type_
+
+        def root(type_):
+            return None if type_ is None else pruned.get(type_.name)
+
+        return GraphQLSchema(
+            query=root(self.schema.query_type),
+            mutation=root(self.schema.mutation_type),
+            subscription=root(self.schema.subscription_type),
+            types=[pruned[name] for name in sorted(pruned)],
+            directives=specified_directives,
+            description=self.schema.description,
+        )
+
+
+def prune_schema(
+    schema: GraphQLSchema,
+    operations: Iterable[Union[Operation, str, DocumentNode]],
+) -> GraphQLSchema:
+    """The subset of `schema` reached by `operations`, see `SchemaPruner`."""
+    pruner = SchemaPruner(schema)
+    for operation in operations:
+        pruner.add(operation)
+
+    return pruner.prune()
+
+
+def get_query_operations() -> list[Operation]:
+    """The operations of the query builders, as sent by the client, which
+    `scripts/prune_schema.py` prunes the schema and the models to."""
+    # the variable values do not change the documents
+    repository_issues, _ = get_repository_issues_operation(
+        "owner", "name", 1, "OPEN"
+    )
+    return [
+        with_typename(with_rate_limit(repository_issues)),
+        paginate_operation(repository_issues, "repository.issues").operation,
+        get_marketplace_categories_operation(False, False, [])[0],
+    ]
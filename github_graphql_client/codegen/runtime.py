@@ -0,0 +1,30 @@
+from typing import Any, Optional
+
+from pydantic import Discriminator
+
+# the tag of the union member for the types without a model of their own
+OTHER = "Other"
+
+
+def get_typename(value: Any) -> Optional[str]:
+    """The `__typename` of raw response data or of a model."""
+    if isinstance(value, dict):
+        return value.get("__typename")
+    return getattr(value, "typename__", None)
+
+
+def typename_discriminator(*typenames: str) -> Discriminator:
+    """Discriminate a union of models tagged with their `__typename`.
+
+    Values of any other type go to the member tagged `OTHER`, so the
+    union keeps working when the schema gains new types.
+    """
+    known = frozenset(typenames)
+
+    def get_tag(value: Any) -> Optional[str]:
+        typename = get_typename(value)
+        if typename is None or typename in known:
+            return typename
+        return OTHER
+
+    return Discriminator(get_tag)
@@ -0,0 +1,3 @@
+"""Generated models of the GitHub GraphQL schema, split into modules by
+`scripts/split_models.py`. Import them from `github_graphql_client.model`,
+which loads the modules on first access."""
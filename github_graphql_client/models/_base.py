@@ -0,0 +1,9 @@
+from pydantic import BaseModel as _BaseModel
+from pydantic import ConfigDict
+
+
+class BaseModel(_BaseModel):
+    # the validators of models referring to each other are built on first
+    # use, after `github_graphql_client.model` has loaded the referenced
+    # modules
+    model_config = ConfigDict(defer_build=True)
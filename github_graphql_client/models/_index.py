@@ -0,0 +1,5073 @@
+# generated by scripts/split_models.py, do not edit
+
+MODULES = {
+    "AbortQueuedMigrationsInput": "abort_queued_migrations_input",
+    "AbortQueuedMigrationsPayload": "abort_queued_migrations_payload",
+    "AbortRepositoryMigrationInput": "abort_repository_migration_input",
+    "AbortRepositoryMigrationPayload": "abort_repository_migration_payload",
+    "AcceptEnterpriseAdministratorInvitationInput": "accept_enterprise_administrator_invitation_input",
+    "AcceptEnterpriseAdministratorInvitationPayload": "accept_enterprise_administrator_invitation_payload",
+    "AcceptTopicSuggestionInput": "accept_topic_suggestion_input",
+    "AcceptTopicSuggestionPayload": "accept_topic_suggestion_payload",
+    "Actor": "actor",
+    "ActorLocation": "actor_location",
+    "AddAssigneesToAssignableInput": "add_assignees_to_assignable_input",
+    "AddAssigneesToAssignablePayload": "add_assignees_to_assignable_payload",
+    "AddCommentInput": "add_comment_input",
+    "AddCommentPayload": "add_comment_payload",
+    "AddDiscussionCommentInput": "add_discussion_comment_input",
+    "AddDiscussionCommentPayload": "add_discussion_comment_payload",
+    "AddDiscussionPollVoteInput": "add_discussion_poll_vote_input",
+    "AddDiscussionPollVotePayload": "add_discussion_poll_vote_payload",
+    "AddEnterpriseOrganizationMemberInput": "add_enterprise_organization_member_input",
+    "AddEnterpriseOrganizationMemberPayload": "add_enterprise_organization_member_payload",
+    "AddEnterpriseSupportEntitlementInput": "add_enterprise_support_entitlement_input",
+    "AddEnterpriseSupportEntitlementPayload": "add_enterprise_support_entitlement_payload",
+    "AddLabelsToLabelableInput": "add_labels_to_labelable_input",
+    "AddLabelsToLabelablePayload": "add_labels_to_labelable_payload",
+    "AddProjectCardInput": "add_project_card_input",
+    "AddProjectCardPayload": "add_project_card_payload",
+    "AddProjectColumnInput": "add_project_column_input",
+    "AddProjectColumnPayload": "add_project_column_payload",
+    "AddProjectV2DraftIssueInput": "add_project_v2_draft_issue_input",
+    "AddProjectV2DraftIssuePayload": "add_project_v2_draft_issue_payload",
+    "AddProjectV2ItemByIdInput": "add_project_v2_item_by_id_input",
+    "AddProjectV2ItemByIdPayload": "add_project_v2_item_by_id_payload",
+    "AddPullRequestReviewCommentInput": "add_pull_request_review_comment_input",
+    "AddPullRequestReviewCommentPayload": "add_pull_request_review_comment_payload",
+    "AddPullRequestReviewInput": "add_pull_request_review_input",
+    "AddPullRequestReviewPayload": "add_pull_request_review_payload",
+    "AddPullRequestReviewThreadInput": "add_pull_request_review_thread_input",
+    "AddPullRequestReviewThreadPayload": "add_pull_request_review_thread_payload",
+    "AddPullRequestReviewThreadReplyInput": "add_pull_request_review_thread_reply_input",
+    "AddPullRequestReviewThreadReplyPayload": "add_pull_request_review_thread_reply_payload",
+    "AddReactionInput": "add_reaction_input",
+    "AddReactionPayload": "add_reaction_payload",
+    "AddStarInput": "add_star_input",
+    "AddStarPayload": "add_star_payload",
+    "AddUpvoteInput": "add_upvote_input",
+    "AddUpvotePayload": "add_upvote_payload",
+    "AddVerifiableDomainInput": "add_verifiable_domain_input",
+    "AddVerifiableDomainPayload": "add_verifiable_domain_payload",
+    "AnnouncementBanner": "announcement_banner",
+    "ApproveDeploymentsInput": "approve_deployments_input",
+    "ApproveDeploymentsPayload": "approve_deployments_payload",
+    "ApproveVerifiableDomainInput": "approve_verifiable_domain_input",
+    "ApproveVerifiableDomainPayload": "approve_verifiable_domain_payload",
+    "ArchiveProjectV2ItemInput": "archive_project_v2_item_input",
+    "ArchiveProjectV2ItemPayload": "archive_project_v2_item_payload",
+    "ArchiveRepositoryInput": "archive_repository_input",
+    "ArchiveRepositoryPayload": "archive_repository_payload",
+    "AuditLogOrder": "audit_log_order",
+    "Blob": "blob",
+    "Bot": "bot",
+    "BranchNamePatternParameters": "branch_name_pattern_parameters",
+    "BranchNamePatternParametersInput": "branch_name_pattern_parameters_input",
+    "BulkSponsorship": "bulk_sponsorship",
+    "CancelEnterpriseAdminInvitationInput": "cancel_enterprise_admin_invitation_input",
+    "CancelEnterpriseAdminInvitationPayload": "cancel_enterprise_admin_invitation_payload",
+    "CancelSponsorshipInput": "cancel_sponsorship_input",
+    "CancelSponsorshipPayload": "cancel_sponsorship_payload",
+    "ChangeUserStatusInput": "change_user_status_input",
+    "ChangeUserStatusPayload": "change_user_status_payload",
+    "CheckAnnotation": "check_annotation",
+    "CheckAnnotationConnection": "check_annotation_connection",
+    "CheckAnnotationData": "check_annotation_data",
+    "CheckAnnotationEdge": "check_annotation_edge",
+    "CheckAnnotationPosition": "check_annotation_position",
+    "CheckAnnotationRange": "check_annotation_range",
+    "CheckAnnotationSpan": "check_annotation_span",
+    "CheckRunAction": "check_run_action",
+    "CheckRunFilter": "check_run_filter",
+    "CheckRunOutput": "check_run_output",
+    "CheckRunOutputImage": "check_run_output_image",
+    "CheckRunStateCount": "check_run_state_count",
+    "CheckStep": "check_step",
+    "CheckStepConnection": "check_step_connection",
+    "CheckStepEdge": "check_step_edge",
+    "CheckSuiteAutoTriggerPreference": "check_suite_auto_trigger_preference",
+    "CheckSuiteFilter": "check_suite_filter",
+    "ClearLabelsFromLabelableInput": "clear_labels_from_labelable_input",
+    "ClearLabelsFromLabelablePayload": "clear_labels_from_labelable_payload",
+    "ClearProjectV2ItemFieldValueInput": "clear_project_v2_item_field_value_input",
+    "ClearProjectV2ItemFieldValuePayload": "clear_project_v2_item_field_value_payload",
+    "CloneProjectInput": "clone_project_input",
+    "CloneProjectPayload": "clone_project_payload",
+    "CloneTemplateRepositoryInput": "clone_template_repository_input",
+    "CloneTemplateRepositoryPayload": "clone_template_repository_payload",
+    "Closable": "closable",
+    "CloseDiscussionInput": "close_discussion_input",
+    "CloseDiscussionPayload": "close_discussion_payload",
+    "CloseIssueInput": "close_issue_input",
+    "CloseIssuePayload": "close_issue_payload",
+    "ClosePullRequestInput": "close_pull_request_input",
+    "ClosePullRequestPayload": "close_pull_request_payload",
+    "CodeOfConduct": "code_of_conduct",
+    "Comment": "comment",
+    "CommentDeletedEvent": "comment_deleted_event",
+    "CommitAuthor": "commit_author",
+    "CommitAuthorEmailPatternParameters": "commit_author_email_pattern_parameters",
+    "CommitAuthorEmailPatternParametersInput": "commit_author_email_pattern_parameters_input",
+    "CommitContributionOrder": "commit_contribution_order",
+    "CommitMessage": "commit_message",
+    "CommitMessagePatternParameters": "commit_message_pattern_parameters",
+    "CommitMessagePatternParametersInput": "commit_message_pattern_parameters_input",
+    "CommittableBranch": "committable_branch",
+    "CommitterEmailPatternParameters": "committer_email_pattern_parameters",
+    "CommitterEmailPatternParametersInput": "committer_email_pattern_parameters_input",
+    "ContributingGuidelines": "contributing_guidelines",
+    "ContributionCalendar": "contribution_calendar",
+    "ContributionCalendarDay": "contribution_calendar_day",
+    "ContributionCalendarMonth": "contribution_calendar_month",
+    "ContributionCalendarWeek": "contribution_calendar_week",
+    "ContributionOrder": "contribution_order",
+    "ConvertProjectCardNoteToIssueInput": "convert_project_card_note_to_issue_input",
+    "ConvertProjectCardNoteToIssuePayload": "convert_project_card_note_to_issue_payload",
+    "ConvertPullRequestToDraftInput": "convert_pull_request_to_draft_input",
+    "ConvertPullRequestToDraftPayload": "convert_pull_request_to_draft_payload",
+    "CopyProjectV2Input": "copy_project_v2_input",
+    "CopyProjectV2Payload": "copy_project_v2_payload",
+    "Assignable": "core",
+    "AuditEntry": "core",
+    "Contribution": "core",
+    "GitObject": "core",
+    "GitSignature": "core",
+    "Labelable": "core",
+    "MemberStatusable": "core",
+    "OrganizationAuditEntryData": "core",
+    "PackageOwner": "core",
+    "ProfileOwner": "core",
+    "ProjectOwner": "core",
+    "ProjectV2FieldCommon": "core",
+    "ProjectV2ItemFieldValueCommon": "core",
+    "ProjectV2Owner": "core",
+    "ProjectV2Recent": "core",
+    "Reactable": "core",
+    "RepositoryAuditEntryData": "core",
+    "RepositoryDiscussionAuthor": "core",
+    "RepositoryDiscussionCommentAuthor": "core",
+    "RepositoryInfo": "core",
+    "RepositoryNode": "core",
+    "RepositoryOwner": "core",
+    "Sponsorable": "core",
+    "Starrable": "core",
+    "TeamAuditEntryData": "core",
+    "TopicAuditEntryData": "core",
+    "AddedToMergeQueueEvent": "core",
+    "AddedToProjectEvent": "core",
+    "App": "core",
+    "AssignedEvent": "core",
+    "AutoMergeDisabledEvent": "core",
+    "AutoMergeEnabledEvent": "core",
+    "AutoMergeRequest": "core",
+    "AutoRebaseEnabledEvent": "core",
+    "AutoSquashEnabledEvent": "core",
+    "AutomaticBaseChangeFailedEvent": "core",
+    "AutomaticBaseChangeSucceededEvent": "core",
+    "BaseRefChangedEvent": "core",
+    "BaseRefDeletedEvent": "core",
+    "BaseRefForcePushedEvent": "core",
+    "Blame": "core",
+    "BlameRange": "core",
+    "BranchProtectionRule": "core",
+    "BranchProtectionRuleConflict": "core",
+    "BranchProtectionRuleConflictConnection": "core",
+    "BranchProtectionRuleConflictEdge": "core",
+    "BranchProtectionRuleConnection": "core",
+    "BranchProtectionRuleEdge": "core",
+    "BypassForcePushAllowance": "core",
+    "BypassForcePushAllowanceConnection": "core",
+    "BypassForcePushAllowanceEdge": "core",
+    "BypassPullRequestAllowance": "core",
+    "BypassPullRequestAllowanceConnection": "core",
+    "BypassPullRequestAllowanceEdge": "core",
+    "CheckRun": "core",
+    "CheckRunConnection": "core",
+    "CheckRunEdge": "core",
+    "CheckSuite": "core",
+    "CheckSuiteConnection": "core",
+    "CheckSuiteEdge": "core",
+    "ClosedEvent": "core",
+    "Commit": "core",
+    "CommitComment": "core",
+    "CommitCommentConnection": "core",
+    "CommitCommentEdge": "core",
+    "CommitCommentThread": "core",
+    "CommitConnection": "core",
+    "CommitContributionsByRepository": "core",
+    "CommitEdge": "core",
+    "CommitHistoryConnection": "core",
+    "Comparison": "core",
+    "ComparisonCommitConnection": "core",
+    "ConnectedEvent": "core",
+    "ContributionsCollection": "core",
+    "ConvertToDraftEvent": "core",
+    "ConvertedNoteToIssueEvent": "core",
+    "ConvertedToDiscussionEvent": "core",
+    "CreatedCommitContribution": "core",
+    "CreatedCommitContributionConnection": "core",
+    "CreatedCommitContributionEdge": "core",
+    "CreatedIssueContribution": "core",
+    "CreatedIssueContributionConnection": "core",
+    "CreatedIssueContributionEdge": "core",
+    "CreatedPullRequestContribution": "core",
+    "CreatedPullRequestContributionConnection": "core",
+    "CreatedPullRequestContributionEdge": "core",
+    "CreatedPullRequestReviewContribution": "core",
+    "CreatedPullRequestReviewContributionConnection": "core",
+    "CreatedPullRequestReviewContributionEdge": "core",
+    "CreatedRepositoryContribution": "core",
+    "CreatedRepositoryContributionConnection": "core",
+    "CreatedRepositoryContributionEdge": "core",
+    "CrossReferencedEvent": "core",
+    "DemilestonedEvent": "core",
+    "DependabotUpdate": "core",
+    "DependencyGraphDependency": "core",
+    "DependencyGraphDependencyConnection": "core",
+    "DependencyGraphDependencyEdge": "core",
+    "DependencyGraphManifest": "core",
+    "DependencyGraphManifestConnection": "core",
+    "DependencyGraphManifestEdge": "core",
+    "DeployedEvent": "core",
+    "Deployment": "core",
+    "DeploymentConnection": "core",
+    "DeploymentEdge": "core",
+    "DeploymentEnvironmentChangedEvent": "core",
+    "DeploymentProtectionRule": "core",
+    "DeploymentProtectionRuleConnection": "core",
+    "DeploymentProtectionRuleEdge": "core",
+    "DeploymentRequest": "core",
+    "DeploymentRequestConnection": "core",
+    "DeploymentRequestEdge": "core",
+    "DeploymentReview": "core",
+    "DeploymentReviewConnection": "core",
+    "DeploymentReviewEdge": "core",
+    "DeploymentReviewerConnection": "core",
+    "DeploymentReviewerEdge": "core",
+    "DeploymentStatus": "core",
+    "DeploymentStatusConnection": "core",
+    "DeploymentStatusEdge": "core",
+    "DisconnectedEvent": "core",
+    "Discussion": "core",
+    "DiscussionCategory": "core",
+    "DiscussionCategoryConnection": "core",
+    "DiscussionCategoryEdge": "core",
+    "DiscussionComment": "core",
+    "DiscussionCommentConnection": "core",
+    "DiscussionCommentEdge": "core",
+    "DiscussionConnection": "core",
+    "DiscussionEdge": "core",
+    "DiscussionPoll": "core",
+    "DiscussionPollOption": "core",
+    "DiscussionPollOptionConnection": "core",
+    "DiscussionPollOptionEdge": "core",
+    "DraftIssue": "core",
+    "Enterprise": "core",
+    "EnterpriseAdministratorConnection": "core",
+    "EnterpriseAdministratorEdge": "core",
+    "EnterpriseAdministratorInvitation": "core",
+    "EnterpriseAdministratorInvitationConnection": "core",
+    "EnterpriseAdministratorInvitationEdge": "core",
+    "EnterpriseConnection": "core",
+    "EnterpriseEdge": "core",
+    "EnterpriseFailedInvitationConnection": "core",
+    "EnterpriseFailedInvitationEdge": "core",
+    "EnterpriseIdentityProvider": "core",
+    "EnterpriseMemberConnection": "core",
+    "EnterpriseMemberEdge": "core",
+    "EnterpriseOrganizationMembershipConnection": "core",
+    "EnterpriseOrganizationMembershipEdge": "core",
+    "EnterpriseOutsideCollaboratorConnection": "core",
+    "EnterpriseOutsideCollaboratorEdge": "core",
+    "EnterpriseOwnerInfo": "core",
+    "EnterprisePendingMemberInvitationConnection": "core",
+    "EnterprisePendingMemberInvitationEdge": "core",
+    "EnterpriseServerInstallation": "core",
+    "EnterpriseServerInstallationConnection": "core",
+    "EnterpriseServerInstallationEdge": "core",
+    "EnterpriseServerInstallationMembershipConnection": "core",
+    "EnterpriseServerInstallationMembershipEdge": "core",
+    "EnterpriseServerUserAccount": "core",
+    "EnterpriseServerUserAccountConnection": "core",
+    "EnterpriseServerUserAccountEdge": "core",
+    "EnterpriseServerUserAccountEmail": "core",
+    "EnterpriseServerUserAccountEmailConnection": "core",
+    "EnterpriseServerUserAccountEmailEdge": "core",
+    "EnterpriseServerUserAccountsUpload": "core",
+    "EnterpriseServerUserAccountsUploadConnection": "core",
+    "EnterpriseServerUserAccountsUploadEdge": "core",
+    "EnterpriseUserAccount": "core",
+    "Environment": "core",
+    "EnvironmentConnection": "core",
+    "EnvironmentEdge": "core",
+    "ExternalIdentity": "core",
+    "ExternalIdentityConnection": "core",
+    "ExternalIdentityEdge": "core",
+    "FollowerConnection": "core",
+    "FollowingConnection": "core",
+    "Gist": "core",
+    "GistComment": "core",
+    "GistCommentConnection": "core",
+    "GistCommentEdge": "core",
+    "GistConnection": "core",
+    "GistEdge": "core",
+    "GitActor": "core",
+    "GitActorConnection": "core",
+    "GitActorEdge": "core",
+    "HeadRefDeletedEvent": "core",
+    "HeadRefForcePushedEvent": "core",
+    "HeadRefRestoredEvent": "core",
+    "IpAllowListEntry": "core",
+    "IpAllowListEntryConnection": "core",
+    "IpAllowListEntryEdge": "core",
+    "Issue": "core",
+    "IssueComment": "core",
+    "IssueCommentConnection": "core",
+    "IssueCommentEdge": "core",
+    "IssueConnection": "core",
+    "IssueContributionsByRepository": "core",
+    "IssueEdge": "core",
+    "IssueTemplate": "core",
+    "IssueTimelineConnection": "core",
+    "IssueTimelineItemEdge": "core",
+    "IssueTimelineItemsConnection": "core",
+    "IssueTimelineItemsEdge": "core",
+    "JoinedGitHubContribution": "core",
+    "Label": "core",
+    "LabelConnection": "core",
+    "LabelEdge": "core",
+    "LabeledEvent": "core",
+    "LinkedBranch": "core",
+    "LinkedBranchConnection": "core",
+    "LinkedBranchEdge": "core",
+    "Mannequin": "core",
+    "MannequinConnection": "core",
+    "MannequinEdge": "core",
+    "MarkedAsDuplicateEvent": "core",
+    "MembersCanDeleteReposClearAuditEntry": "core",
+    "MembersCanDeleteReposDisableAuditEntry": "core",
+    "MembersCanDeleteReposEnableAuditEntry": "core",
+    "MergeQueue": "core",
+    "MergeQueueEntry": "core",
+    "MergeQueueEntryConnection": "core",
+    "MergeQueueEntryEdge": "core",
+    "MergedEvent": "core",
+    "Milestone": "core",
+    "MilestoneConnection": "core",
+    "MilestoneEdge": "core",
+    "MilestonedEvent": "core",
+    "MovedColumnsInProjectEvent": "core",
+    "OIDCProvider": "core",
+    "OauthApplicationCreateAuditEntry": "core",
+    "OrgAddBillingManagerAuditEntry": "core",
+    "OrgAddMemberAuditEntry": "core",
+    "OrgBlockUserAuditEntry": "core",
+    "OrgConfigDisableCollaboratorsOnlyAuditEntry": "core",
+    "OrgConfigEnableCollaboratorsOnlyAuditEntry": "core",
+    "OrgCreateAuditEntry": "core",
+    "OrgDisableOauthAppRestrictionsAuditEntry": "core",
+    "OrgDisableSamlAuditEntry": "core",
+    "OrgDisableTwoFactorRequirementAuditEntry": "core",
+    "OrgEnableOauthAppRestrictionsAuditEntry": "core",
+    "OrgEnableSamlAuditEntry": "core",
+    "OrgEnableTwoFactorRequirementAuditEntry": "core",
+    "OrgInviteMemberAuditEntry": "core",
+    "OrgInviteToBusinessAuditEntry": "core",
+    "OrgOauthAppAccessApprovedAuditEntry": "core",
+    "OrgOauthAppAccessBlockedAuditEntry": "core",
+    "OrgOauthAppAccessDeniedAuditEntry": "core",
+    "OrgOauthAppAccessRequestedAuditEntry": "core",
+    "OrgOauthAppAccessUnblockedAuditEntry": "core",
+    "OrgRemoveBillingManagerAuditEntry": "core",
+    "OrgRemoveMemberAuditEntry": "core",
+    "OrgRemoveOutsideCollaboratorAuditEntry": "core",
+    "OrgRestoreMemberAuditEntry": "core",
+    "OrgRestoreMemberMembershipOrganizationAuditEntryData": "core",
+    "OrgRestoreMemberMembershipRepositoryAuditEntryData": "core",
+    "OrgRestoreMemberMembershipTeamAuditEntryData": "core",
+    "OrgUnblockUserAuditEntry": "core",
+    "OrgUpdateDefaultRepositoryPermissionAuditEntry": "core",
+    "OrgUpdateMemberAuditEntry": "core",
+    "OrgUpdateMemberRepositoryCreationPermissionAuditEntry": "core",
+    "OrgUpdateMemberRepositoryInvitationPermissionAuditEntry": "core",
+    "Organization": "core",
+    "OrganizationAuditEntryConnection": "core",
+    "OrganizationAuditEntryEdge": "core",
+    "OrganizationConnection": "core",
+    "OrganizationEdge": "core",
+    "OrganizationEnterpriseOwnerConnection": "core",
+    "OrganizationEnterpriseOwnerEdge": "core",
+    "OrganizationIdentityProvider": "core",
+    "OrganizationInvitation": "core",
+    "OrganizationInvitationConnection": "core",
+    "OrganizationInvitationEdge": "core",
+    "OrganizationMemberConnection": "core",
+    "OrganizationMemberEdge": "core",
+    "Package": "core",
+    "PackageConnection": "core",
+    "PackageEdge": "core",
+    "PackageFile": "core",
+    "PackageFileConnection": "core",
+    "PackageFileEdge": "core",
+    "PackageVersion": "core",
+    "PackageVersionConnection": "core",
+    "PackageVersionEdge": "core",
+    "PermissionSource": "core",
+    "PinnableItemConnection": "core",
+    "PinnableItemEdge": "core",
+    "PinnedDiscussion": "core",
+    "PinnedDiscussionConnection": "core",
+    "PinnedDiscussionEdge": "core",
+    "PinnedEvent": "core",
+    "PinnedIssue": "core",
+    "PinnedIssueConnection": "core",
+    "PinnedIssueEdge": "core",
+    "PrivateRepositoryForkingDisableAuditEntry": "core",
+    "PrivateRepositoryForkingEnableAuditEntry": "core",
+    "ProfileItemShowcase": "core",
+    "Project": "core",
+    "ProjectCard": "core",
+    "ProjectCardConnection": "core",
+    "ProjectCardEdge": "core",
+    "ProjectColumn": "core",
+    "ProjectColumnConnection": "core",
+    "ProjectColumnEdge": "core",
+    "ProjectConnection": "core",
+    "ProjectEdge": "core",
+    "ProjectV2": "core",
+    "ProjectV2Connection": "core",
+    "ProjectV2Edge": "core",
+    "ProjectV2Field": "core",
+    "ProjectV2FieldConfigurationConnection": "core",
+    "ProjectV2FieldConfigurationEdge": "core",
+    "ProjectV2FieldConnection": "core",
+    "ProjectV2FieldEdge": "core",
+    "ProjectV2Item": "core",
+    "ProjectV2ItemConnection": "core",
+    "ProjectV2ItemEdge": "core",
+    "ProjectV2ItemFieldDateValue": "core",
+    "ProjectV2ItemFieldIterationValue": "core",
+    "ProjectV2ItemFieldLabelValue": "core",
+    "ProjectV2ItemFieldMilestoneValue": "core",
+    "ProjectV2ItemFieldNumberValue": "core",
+    "ProjectV2ItemFieldPullRequestValue": "core",
+    "ProjectV2ItemFieldRepositoryValue": "core",
+    "ProjectV2ItemFieldReviewerValue": "core",
+    "ProjectV2ItemFieldSingleSelectValue": "core",
+    "ProjectV2ItemFieldTextValue": "core",
+    "ProjectV2ItemFieldUserValue": "core",
+    "ProjectV2ItemFieldValueConnection": "core",
+    "ProjectV2ItemFieldValueEdge": "core",
+    "ProjectV2IterationField": "core",
+    "ProjectV2SingleSelectField": "core",
+    "ProjectV2SortBy": "core",
+    "ProjectV2SortByConnection": "core",
+    "ProjectV2SortByEdge": "core",
+    "ProjectV2SortByField": "core",
+    "ProjectV2SortByFieldConnection": "core",
+    "ProjectV2SortByFieldEdge": "core",
+    "ProjectV2View": "core",
+    "ProjectV2ViewConnection": "core",
+    "ProjectV2ViewEdge": "core",
+    "ProjectV2Workflow": "core",
+    "ProjectV2WorkflowConnection": "core",
+    "ProjectV2WorkflowEdge": "core",
+    "PullRequest": "core",
+    "PullRequestCommit": "core",
+    "PullRequestCommitCommentThread": "core",
+    "PullRequestCommitConnection": "core",
+    "PullRequestCommitEdge": "core",
+    "PullRequestConnection": "core",
+    "PullRequestContributionsByRepository": "core",
+    "PullRequestEdge": "core",
+    "PullRequestReview": "core",
+    "PullRequestReviewComment": "core",
+    "PullRequestReviewCommentConnection": "core",
+    "PullRequestReviewCommentEdge": "core",
+    "PullRequestReviewConnection": "core",
+    "PullRequestReviewContributionsByRepository": "core",
+    "PullRequestReviewEdge": "core",
+    "PullRequestReviewThread": "core",
+    "PullRequestReviewThreadConnection": "core",
+    "PullRequestReviewThreadEdge": "core",
+    "PullRequestRevisionMarker": "core",
+    "PullRequestTemplate": "core",
+    "PullRequestTimelineConnection": "core",
+    "PullRequestTimelineItemEdge": "core",
+    "PullRequestTimelineItemsConnection": "core",
+    "PullRequestTimelineItemsEdge": "core",
+    "Push": "core",
+    "PushAllowance": "core",
+    "PushAllowanceConnection": "core",
+    "PushAllowanceEdge": "core",
+    "ReactingUserConnection": "core",
+    "ReactingUserEdge": "core",
+    "Reaction": "core",
+    "ReactionConnection": "core",
+    "ReactionEdge": "core",
+    "ReactionGroup": "core",
+    "ReactorConnection": "core",
+    "ReactorEdge": "core",
+    "ReadyForReviewEvent": "core",
+    "Ref": "core",
+    "RefConnection": "core",
+    "RefEdge": "core",
+    "ReferencedEvent": "core",
+    "Release": "core",
+    "ReleaseAsset": "core",
+    "ReleaseAssetConnection": "core",
+    "ReleaseAssetEdge": "core",
+    "ReleaseConnection": "core",
+    "ReleaseEdge": "core",
+    "RemovedFromMergeQueueEvent": "core",
+    "RemovedFromProjectEvent": "core",
+    "RenamedTitleEvent": "core",
+    "RepoAccessAuditEntry": "core",
+    "RepoAddMemberAuditEntry": "core",
+    "RepoAddTopicAuditEntry": "core",
+    "RepoArchivedAuditEntry": "core",
+    "RepoChangeMergeSettingAuditEntry": "core",
+    "RepoConfigDisableAnonymousGitAccessAuditEntry": "core",
+    "RepoConfigDisableCollaboratorsOnlyAuditEntry": "core",
+    "RepoConfigDisableContributorsOnlyAuditEntry": "core",
+    "RepoConfigDisableSockpuppetDisallowedAuditEntry": "core",
+    "RepoConfigEnableAnonymousGitAccessAuditEntry": "core",
+    "RepoConfigEnableCollaboratorsOnlyAuditEntry": "core",
+    "RepoConfigEnableContributorsOnlyAuditEntry": "core",
+    "RepoConfigEnableSockpuppetDisallowedAuditEntry": "core",
+    "RepoConfigLockAnonymousGitAccessAuditEntry": "core",
+    "RepoConfigUnlockAnonymousGitAccessAuditEntry": "core",
+    "RepoCreateAuditEntry": "core",
+    "RepoDestroyAuditEntry": "core",
+    "RepoRemoveMemberAuditEntry": "core",
+    "RepoRemoveTopicAuditEntry": "core",
+    "Repository": "core",
+    "RepositoryCollaboratorConnection": "core",
+    "RepositoryCollaboratorEdge": "core",
+    "RepositoryConnection": "core",
+    "RepositoryEdge": "core",
+    "RepositoryInvitation": "core",
+    "RepositoryInvitationConnection": "core",
+    "RepositoryInvitationEdge": "core",
+    "RepositoryRule": "core",
+    "RepositoryRuleConnection": "core",
+    "RepositoryRuleEdge": "core",
+    "RepositoryRuleset": "core",
+    "RepositoryRulesetBypassActor": "core",
+    "RepositoryRulesetBypassActorConnection": "core",
+    "RepositoryRulesetBypassActorEdge": "core",
+    "RepositoryRulesetConnection": "core",
+    "RepositoryRulesetEdge": "core",
+    "RepositoryTopic": "core",
+    "RepositoryTopicConnection": "core",
+    "RepositoryTopicEdge": "core",
+    "RepositoryVisibilityChangeDisableAuditEntry": "core",
+    "RepositoryVisibilityChangeEnableAuditEntry": "core",
+    "RepositoryVulnerabilityAlert": "core",
+    "RepositoryVulnerabilityAlertConnection": "core",
+    "RepositoryVulnerabilityAlertEdge": "core",
+    "RequestedReviewerConnection": "core",
+    "RequestedReviewerEdge": "core",
+    "RequiredStatusCheckDescription": "core",
+    "RestrictedContribution": "core",
+    "ReviewDismissalAllowance": "core",
+    "ReviewDismissalAllowanceConnection": "core",
+    "ReviewDismissalAllowanceEdge": "core",
+    "ReviewDismissedEvent": "core",
+    "ReviewRequest": "core",
+    "ReviewRequestConnection": "core",
+    "ReviewRequestEdge": "core",
+    "ReviewRequestRemovedEvent": "core",
+    "ReviewRequestedEvent": "core",
+    "SponsorConnection": "core",
+    "SponsorEdge": "core",
+    "SponsorsActivity": "core",
+    "SponsorsActivityConnection": "core",
+    "SponsorsActivityEdge": "core",
+    "SponsorsListing": "core",
+    "SponsorsListingFeaturedItem": "core",
+    "SponsorsTier": "core",
+    "SponsorsTierAdminInfo": "core",
+    "SponsorsTierConnection": "core",
+    "SponsorsTierEdge": "core",
+    "Sponsorship": "core",
+    "SponsorshipConnection": "core",
+    "SponsorshipEdge": "core",
+    "SponsorshipNewsletter": "core",
+    "SponsorshipNewsletterConnection": "core",
+    "SponsorshipNewsletterEdge": "core",
+    "StargazerConnection": "core",
+    "StargazerEdge": "core",
+    "StarredRepositoryConnection": "core",
+    "StarredRepositoryEdge": "core",
+    "Status": "core",
+    "StatusCheckRollup": "core",
+    "StatusCheckRollupContextConnection": "core",
+    "StatusCheckRollupContextEdge": "core",
+    "StatusContext": "core",
+    "StripeConnectAccount": "core",
+    "SuggestedReviewer": "core",
+    "Team": "core",
+    "TeamAddMemberAuditEntry": "core",
+    "TeamAddRepositoryAuditEntry": "core",
+    "TeamChangeParentTeamAuditEntry": "core",
+    "TeamConnection": "core",
+    "TeamDiscussion": "core",
+    "TeamDiscussionComment": "core",
+    "TeamDiscussionCommentConnection": "core",
+    "TeamDiscussionCommentEdge": "core",
+    "TeamDiscussionConnection": "core",
+    "TeamDiscussionEdge": "core",
+    "TeamEdge": "core",
+    "TeamMemberConnection": "core",
+    "TeamMemberEdge": "core",
+    "TeamRemoveMemberAuditEntry": "core",
+    "TeamRemoveRepositoryAuditEntry": "core",
+    "TeamRepositoryConnection": "core",
+    "TeamRepositoryEdge": "core",
+    "Topic": "core",
+    "TransferredEvent": "core",
+    "Tree": "core",
+    "TreeEntry": "core",
+    "UnassignedEvent": "core",
+    "UnlabeledEvent": "core",
+    "UnmarkedAsDuplicateEvent": "core",
+    "UnpinnedEvent": "core",
+    "User": "core",
+    "UserBlockedEvent": "core",
+    "UserConnection": "core",
+    "UserEdge": "core",
+    "UserList": "core",
+    "UserListConnection": "core",
+    "UserListEdge": "core",
+    "UserListItemsConnection": "core",
+    "UserListItemsEdge": "core",
+    "UserStatus": "core",
+    "UserStatusConnection": "core",
+    "UserStatusEdge": "core",
+    "VerifiableDomain": "core",
+    "VerifiableDomainConnection": "core",
+    "VerifiableDomainEdge": "core",
+    "Workflow": "core",
+    "WorkflowRun": "core",
+    "WorkflowRunConnection": "core",
+    "WorkflowRunEdge": "core",
+    "WorkflowRunFile": "core",
+    "CreateAttributionInvitationInput": "create_attribution_invitation_input",
+    "CreateAttributionInvitationPayload": "create_attribution_invitation_payload",
+    "CreateBranchProtectionRuleInput": "create_branch_protection_rule_input",
+    "CreateBranchProtectionRulePayload": "create_branch_protection_rule_payload",
+    "CreateCheckRunInput": "create_check_run_input",
+    "CreateCheckRunPayload": "create_check_run_payload",
+    "CreateCheckSuiteInput": "create_check_suite_input",
+    "CreateCheckSuitePayload": "create_check_suite_payload",
+    "CreateCommitOnBranchInput": "create_commit_on_branch_input",
+    "CreateCommitOnBranchPayload": "create_commit_on_branch_payload",
+    "CreateDeploymentInput": "create_deployment_input",
+    "CreateDeploymentPayload": "create_deployment_payload",
+    "CreateDeploymentStatusInput": "create_deployment_status_input",
+    "CreateDeploymentStatusPayload": "create_deployment_status_payload",
+    "CreateDiscussionInput": "create_discussion_input",
+    "CreateDiscussionPayload": "create_discussion_payload",
+    "CreateEnterpriseOrganizationInput": "create_enterprise_organization_input",
+    "CreateEnterpriseOrganizationPayload": "create_enterprise_organization_payload",
+    "CreateEnvironmentInput": "create_environment_input",
+    "CreateEnvironmentPayload": "create_environment_payload",
+    "CreateIpAllowListEntryInput": "create_ip_allow_list_entry_input",
+    "CreateIpAllowListEntryPayload": "create_ip_allow_list_entry_payload",
+    "CreateIssueInput": "create_issue_input",
+    "CreateIssuePayload": "create_issue_payload",
+    "CreateLabelInput": "create_label_input",
+    "CreateLabelPayload": "create_label_payload",
+    "CreateLinkedBranchInput": "create_linked_branch_input",
+    "CreateLinkedBranchPayload": "create_linked_branch_payload",
+    "CreateMigrationSourceInput": "create_migration_source_input",
+    "CreateMigrationSourcePayload": "create_migration_source_payload",
+    "CreateProjectInput": "create_project_input",
+    "CreateProjectPayload": "create_project_payload",
+    "CreateProjectV2FieldInput": "create_project_v2_field_input",
+    "CreateProjectV2FieldPayload": "create_project_v2_field_payload",
+    "CreateProjectV2Input": "create_project_v2_input",
+    "CreateProjectV2Payload": "create_project_v2_payload",
+    "CreatePullRequestInput": "create_pull_request_input",
+    "CreatePullRequestPayload": "create_pull_request_payload",
+    "CreateRefInput": "create_ref_input",
+    "CreateRefPayload": "create_ref_payload",
+    "CreateRepositoryInput": "create_repository_input",
+    "CreateRepositoryPayload": "create_repository_payload",
+    "CreateRepositoryRulesetInput": "create_repository_ruleset_input",
+    "CreateRepositoryRulesetPayload": "create_repository_ruleset_payload",
+    "CreateSponsorsListingInput": "create_sponsors_listing_input",
+    "CreateSponsorsListingPayload": "create_sponsors_listing_payload",
+    "CreateSponsorsTierInput": "create_sponsors_tier_input",
+    "CreateSponsorsTierPayload": "create_sponsors_tier_payload",
+    "CreateSponsorshipInput": "create_sponsorship_input",
+    "CreateSponsorshipPayload": "create_sponsorship_payload",
+    "CreateSponsorshipsInput": "create_sponsorships_input",
+    "CreateSponsorshipsPayload": "create_sponsorships_payload",
+    "CreateTeamDiscussionCommentInput": "create_team_discussion_comment_input",
+    "CreateTeamDiscussionCommentPayload": "create_team_discussion_comment_payload",
+    "CreateTeamDiscussionInput": "create_team_discussion_input",
+    "CreateTeamDiscussionPayload": "create_team_discussion_payload",
+    "CreateUserListInput": "create_user_list_input",
+    "CreateUserListPayload": "create_user_list_payload",
+    "CVSS": "cvss",
+    "CWE": "cwe",
+    "CWEConnection": "cweconnection",
+    "CWEEdge": "cweedge",
+    "DeclineTopicSuggestionInput": "decline_topic_suggestion_input",
+    "DeclineTopicSuggestionPayload": "decline_topic_suggestion_payload",
+    "Deletable": "deletable",
+    "DeleteBranchProtectionRuleInput": "delete_branch_protection_rule_input",
+    "DeleteBranchProtectionRulePayload": "delete_branch_protection_rule_payload",
+    "DeleteDeploymentInput": "delete_deployment_input",
+    "DeleteDeploymentPayload": "delete_deployment_payload",
+    "DeleteDiscussionCommentInput": "delete_discussion_comment_input",
+    "DeleteDiscussionCommentPayload": "delete_discussion_comment_payload",
+    "DeleteDiscussionInput": "delete_discussion_input",
+    "DeleteDiscussionPayload": "delete_discussion_payload",
+    "DeleteEnvironmentInput": "delete_environment_input",
+    "DeleteEnvironmentPayload": "delete_environment_payload",
+    "DeleteIpAllowListEntryInput": "delete_ip_allow_list_entry_input",
+    "DeleteIpAllowListEntryPayload": "delete_ip_allow_list_entry_payload",
+    "DeleteIssueCommentInput": "delete_issue_comment_input",
+    "DeleteIssueCommentPayload": "delete_issue_comment_payload",
+    "DeleteIssueInput": "delete_issue_input",
+    "DeleteIssuePayload": "delete_issue_payload",
+    "DeleteLabelInput": "delete_label_input",
+    "DeleteLabelPayload": "delete_label_payload",
+    "DeleteLinkedBranchInput": "delete_linked_branch_input",
+    "DeleteLinkedBranchPayload": "delete_linked_branch_payload",
+    "DeletePackageVersionInput": "delete_package_version_input",
+    "DeletePackageVersionPayload": "delete_package_version_payload",
+    "DeleteProjectCardInput": "delete_project_card_input",
+    "DeleteProjectCardPayload": "delete_project_card_payload",
+    "DeleteProjectColumnInput": "delete_project_column_input",
+    "DeleteProjectColumnPayload": "delete_project_column_payload",
+    "DeleteProjectInput": "delete_project_input",
+    "DeleteProjectPayload": "delete_project_payload",
+    "DeleteProjectV2FieldInput": "delete_project_v2_field_input",
+    "DeleteProjectV2FieldPayload": "delete_project_v2_field_payload",
+    "DeleteProjectV2Input": "delete_project_v2_input",
+    "DeleteProjectV2ItemInput": "delete_project_v2_item_input",
+    "DeleteProjectV2ItemPayload": "delete_project_v2_item_payload",
+    "DeleteProjectV2Payload": "delete_project_v2_payload",
+    "DeleteProjectV2WorkflowInput": "delete_project_v2_workflow_input",
+    "DeleteProjectV2WorkflowPayload": "delete_project_v2_workflow_payload",
+    "DeletePullRequestReviewCommentInput": "delete_pull_request_review_comment_input",
+    "DeletePullRequestReviewCommentPayload": "delete_pull_request_review_comment_payload",
+    "DeletePullRequestReviewInput": "delete_pull_request_review_input",
+    "DeletePullRequestReviewPayload": "delete_pull_request_review_payload",
+    "DeleteRefInput": "delete_ref_input",
+    "DeleteRefPayload": "delete_ref_payload",
+    "DeleteRepositoryRulesetInput": "delete_repository_ruleset_input",
+    "DeleteRepositoryRulesetPayload": "delete_repository_ruleset_payload",
+    "DeleteTeamDiscussionCommentInput": "delete_team_discussion_comment_input",
+    "DeleteTeamDiscussionCommentPayload": "delete_team_discussion_comment_payload",
+    "DeleteTeamDiscussionInput": "delete_team_discussion_input",
+    "DeleteTeamDiscussionPayload": "delete_team_discussion_payload",
+    "DeleteUserListInput": "delete_user_list_input",
+    "DeleteUserListPayload": "delete_user_list_payload",
+    "DeleteVerifiableDomainInput": "delete_verifiable_domain_input",
+    "DeleteVerifiableDomainPayload": "delete_verifiable_domain_payload",
+    "DependabotUpdateError": "dependabot_update_error",
+    "DeployKey": "deploy_key",
+    "DeployKeyConnection": "deploy_key_connection",
+    "DeployKeyEdge": "deploy_key_edge",
+    "DeploymentOrder": "deployment_order",
+    "DequeuePullRequestInput": "dequeue_pull_request_input",
+    "DequeuePullRequestPayload": "dequeue_pull_request_payload",
+    "DisablePullRequestAutoMergeInput": "disable_pull_request_auto_merge_input",
+    "DisablePullRequestAutoMergePayload": "disable_pull_request_auto_merge_payload",
+    "DiscussionOrder": "discussion_order",
+    "DiscussionPollOptionOrder": "discussion_poll_option_order",
+    "DismissPullRequestReviewInput": "dismiss_pull_request_review_input",
+    "DismissPullRequestReviewPayload": "dismiss_pull_request_review_payload",
+    "DismissRepositoryVulnerabilityAlertInput": "dismiss_repository_vulnerability_alert_input",
+    "DismissRepositoryVulnerabilityAlertPayload": "dismiss_repository_vulnerability_alert_payload",
+    "DraftPullRequestReviewComment": "draft_pull_request_review_comment",
+    "DraftPullRequestReviewThread": "draft_pull_request_review_thread",
+    "EnablePullRequestAutoMergeInput": "enable_pull_request_auto_merge_input",
+    "EnablePullRequestAutoMergePayload": "enable_pull_request_auto_merge_payload",
+    "EnqueuePullRequestInput": "enqueue_pull_request_input",
+    "EnqueuePullRequestPayload": "enqueue_pull_request_payload",
+    "EnterpriseAdministratorInvitationOrder": "enterprise_administrator_invitation_order",
+    "EnterpriseAuditEntryData": "enterprise_audit_entry_data",
+    "EnterpriseBillingInfo": "enterprise_billing_info",
+    "EnterpriseMemberOrder": "enterprise_member_order",
+    "EnterpriseOrder": "enterprise_order",
+    "EnterpriseRepositoryInfo": "enterprise_repository_info",
+    "EnterpriseRepositoryInfoConnection": "enterprise_repository_info_connection",
+    "EnterpriseRepositoryInfoEdge": "enterprise_repository_info_edge",
+    "EnterpriseServerInstallationOrder": "enterprise_server_installation_order",
+    "EnterpriseServerUserAccountEmailOrder": "enterprise_server_user_account_email_order",
+    "EnterpriseServerUserAccountOrder": "enterprise_server_user_account_order",
+    "EnterpriseServerUserAccountsUploadOrder": "enterprise_server_user_accounts_upload_order",
+    "ActorType": "enums",
+    "AuditLogOrderField": "enums",
+    "CheckAnnotationLevel": "enums",
+    "CheckConclusionState": "enums",
+    "CheckRunState": "enums",
+    "CheckRunType": "enums",
+    "CheckStatusState": "enums",
+    "CollaboratorAffiliation": "enums",
+    "CommentAuthorAssociation": "enums",
+    "CommentCannotUpdateReason": "enums",
+    "CommitContributionOrderField": "enums",
+    "ComparisonStatus": "enums",
+    "ContributionLevel": "enums",
+    "DefaultRepositoryPermissionField": "enums",
+    "DependencyGraphEcosystem": "enums",
+    "DeploymentOrderField": "enums",
+    "DeploymentProtectionRuleType": "enums",
+    "DeploymentReviewState": "enums",
+    "DeploymentState": "enums",
+    "DeploymentStatusState": "enums",
+    "DiffSide": "enums",
+    "DiscussionCloseReason": "enums",
+    "DiscussionOrderField": "enums",
+    "DiscussionPollOptionOrderField": "enums",
+    "DiscussionState": "enums",
+    "DiscussionStateReason": "enums",
+    "DismissReason": "enums",
+    "EnterpriseAdministratorInvitationOrderField": "enums",
+    "EnterpriseAdministratorRole": "enums",
+    "EnterpriseAllowPrivateRepositoryForkingPolicyValue": "enums",
+    "EnterpriseDefaultRepositoryPermissionSettingValue": "enums",
+    "EnterpriseEnabledDisabledSettingValue": "enums",
+    "EnterpriseEnabledSettingValue": "enums",
+    "EnterpriseMemberOrderField": "enums",
+    "EnterpriseMembersCanCreateRepositoriesSettingValue": "enums",
+    "EnterpriseMembersCanMakePurchasesSettingValue": "enums",
+    "EnterpriseMembershipType": "enums",
+    "EnterpriseOrderField": "enums",
+    "EnterpriseServerInstallationOrderField": "enums",
+    "EnterpriseServerUserAccountEmailOrderField": "enums",
+    "EnterpriseServerUserAccountOrderField": "enums",
+    "EnterpriseServerUserAccountsUploadOrderField": "enums",
+    "EnterpriseServerUserAccountsUploadSyncState": "enums",
+    "EnterpriseUserAccountMembershipRole": "enums",
+    "EnterpriseUserDeployment": "enums",
+    "EnvironmentOrderField": "enums",
+    "FileViewedState": "enums",
+    "FundingPlatform": "enums",
+    "GistOrderField": "enums",
+    "GistPrivacy": "enums",
+    "GitSignatureState": "enums",
+    "IdentityProviderConfigurationState": "enums",
+    "IpAllowListEnabledSettingValue": "enums",
+    "IpAllowListEntryOrderField": "enums",
+    "IpAllowListForInstalledAppsEnabledSettingValue": "enums",
+    "IssueClosedStateReason": "enums",
+    "IssueCommentOrderField": "enums",
+    "IssueOrderField": "enums",
+    "IssueState": "enums",
+    "IssueStateReason": "enums",
+    "IssueTimelineItemsItemType": "enums",
+    "LabelOrderField": "enums",
+    "LanguageOrderField": "enums",
+    "LockReason": "enums",
+    "MannequinOrderField": "enums",
+    "MergeCommitMessage": "enums",
+    "MergeCommitTitle": "enums",
+    "MergeQueueEntryState": "enums",
+    "MergeQueueMergingStrategy": "enums",
+    "MergeStateStatus": "enums",
+    "MergeableState": "enums",
+    "MigrationSourceType": "enums",
+    "MigrationState": "enums",
+    "MilestoneOrderField": "enums",
+    "MilestoneState": "enums",
+    "NotificationRestrictionSettingValue": "enums",
+    "OIDCProviderType": "enums",
+    "OauthApplicationCreateAuditEntryState": "enums",
+    "OperationType": "enums",
+    "OrderDirection": "enums",
+    "OrgAddMemberAuditEntryPermission": "enums",
+    "OrgCreateAuditEntryBillingPlan": "enums",
+    "OrgEnterpriseOwnerOrderField": "enums",
+    "OrgRemoveBillingManagerAuditEntryReason": "enums",
+    "OrgRemoveMemberAuditEntryMembershipType": "enums",
+    "OrgRemoveMemberAuditEntryReason": "enums",
+    "OrgRemoveOutsideCollaboratorAuditEntryMembershipType": "enums",
+    "OrgRemoveOutsideCollaboratorAuditEntryReason": "enums",
+    "OrgUpdateDefaultRepositoryPermissionAuditEntryPermission": "enums",
+    "OrgUpdateMemberAuditEntryPermission": "enums",
+    "OrgUpdateMemberRepositoryCreationPermissionAuditEntryVisibility": "enums",
+    "OrganizationInvitationRole": "enums",
+    "OrganizationInvitationSource": "enums",
+    "OrganizationInvitationType": "enums",
+    "OrganizationMemberRole": "enums",
+    "OrganizationMembersCanCreateRepositoriesSettingValue": "enums",
+    "OrganizationMigrationState": "enums",
+    "OrganizationOrderField": "enums",
+    "PackageFileOrderField": "enums",
+    "PackageOrderField": "enums",
+    "PackageType": "enums",
+    "PackageVersionOrderField": "enums",
+    "PatchStatus": "enums",
+    "PinnableItemType": "enums",
+    "PinnedDiscussionGradient": "enums",
+    "PinnedDiscussionPattern": "enums",
+    "ProjectCardArchivedState": "enums",
+    "ProjectCardState": "enums",
+    "ProjectColumnPurpose": "enums",
+    "ProjectOrderField": "enums",
+    "ProjectState": "enums",
+    "ProjectTemplate": "enums",
+    "ProjectV2CustomFieldType": "enums",
+    "ProjectV2FieldOrderField": "enums",
+    "ProjectV2FieldType": "enums",
+    "ProjectV2ItemFieldValueOrderField": "enums",
+    "ProjectV2ItemOrderField": "enums",
+    "ProjectV2ItemType": "enums",
+    "ProjectV2OrderField": "enums",
+    "ProjectV2Roles": "enums",
+    "ProjectV2SingleSelectFieldOptionColor": "enums",
+    "ProjectV2State": "enums",
+    "ProjectV2ViewLayout": "enums",
+    "ProjectV2ViewOrderField": "enums",
+    "ProjectV2WorkflowsOrderField": "enums",
+    "PullRequestBranchUpdateMethod": "enums",
+    "PullRequestMergeMethod": "enums",
+    "PullRequestOrderField": "enums",
+    "PullRequestReviewCommentState": "enums",
+    "PullRequestReviewDecision": "enums",
+    "PullRequestReviewEvent": "enums",
+    "PullRequestReviewState": "enums",
+    "PullRequestReviewThreadSubjectType": "enums",
+    "PullRequestState": "enums",
+    "PullRequestTimelineItemsItemType": "enums",
+    "PullRequestUpdateState": "enums",
+    "ReactionContent": "enums",
+    "ReactionOrderField": "enums",
+    "RefOrderField": "enums",
+    "ReleaseOrderField": "enums",
+    "RepoAccessAuditEntryVisibility": "enums",
+    "RepoAddMemberAuditEntryVisibility": "enums",
+    "RepoArchivedAuditEntryVisibility": "enums",
+    "RepoChangeMergeSettingAuditEntryMergeType": "enums",
+    "RepoCreateAuditEntryVisibility": "enums",
+    "RepoDestroyAuditEntryVisibility": "enums",
+    "RepoRemoveMemberAuditEntryVisibility": "enums",
+    "ReportedContentClassifiers": "enums",
+    "RepositoryAffiliation": "enums",
+    "RepositoryContributionType": "enums",
+    "RepositoryInteractionLimit": "enums",
+    "RepositoryInteractionLimitExpiry": "enums",
+    "RepositoryInteractionLimitOrigin": "enums",
+    "RepositoryInvitationOrderField": "enums",
+    "RepositoryLockReason": "enums",
+    "RepositoryMigrationOrderDirection": "enums",
+    "RepositoryMigrationOrderField": "enums",
+    "RepositoryOrderField": "enums",
+    "RepositoryPermission": "enums",
+    "RepositoryPrivacy": "enums",
+    "RepositoryRuleType": "enums",
+    "RepositoryRulesetBypassActorBypassMode": "enums",
+    "RepositoryRulesetTarget": "enums",
+    "RepositoryVisibility": "enums",
+    "RepositoryVulnerabilityAlertDependencyScope": "enums",
+    "RepositoryVulnerabilityAlertState": "enums",
+    "RequestableCheckStatusState": "enums",
+    "RoleInOrganization": "enums",
+    "RuleEnforcement": "enums",
+    "SamlDigestAlgorithm": "enums",
+    "SamlSignatureAlgorithm": "enums",
+    "SavedReplyOrderField": "enums",
+    "SearchType": "enums",
+    "SecurityAdvisoryClassification": "enums",
+    "SecurityAdvisoryEcosystem": "enums",
+    "SecurityAdvisoryIdentifierType": "enums",
+    "SecurityAdvisoryOrderField": "enums",
+    "SecurityAdvisorySeverity": "enums",
+    "SecurityVulnerabilityOrderField": "enums",
+    "SocialAccountProvider": "enums",
+    "SponsorOrderField": "enums",
+    "SponsorableOrderField": "enums",
+    "SponsorsActivityAction": "enums",
+    "SponsorsActivityOrderField": "enums",
+    "SponsorsActivityPeriod": "enums",
+    "SponsorsCountryOrRegionCode": "enums",
+    "SponsorsGoalKind": "enums",
+    "SponsorsListingFeaturedItemFeatureableType": "enums",
+    "SponsorsTierOrderField": "enums",
+    "SponsorshipNewsletterOrderField": "enums",
+    "SponsorshipOrderField": "enums",
+    "SponsorshipPaymentSource": "enums",
+    "SponsorshipPrivacy": "enums",
+    "SquashMergeCommitMessage": "enums",
+    "SquashMergeCommitTitle": "enums",
+    "StarOrderField": "enums",
+    "StatusState": "enums",
+    "SubscriptionState": "enums",
+    "TeamDiscussionCommentOrderField": "enums",
+    "TeamDiscussionOrderField": "enums",
+    "TeamMemberOrderField": "enums",
+    "TeamMemberRole": "enums",
+    "TeamMembershipType": "enums",
+    "TeamNotificationSetting": "enums",
+    "TeamOrderField": "enums",
+    "TeamPrivacy": "enums",
+    "TeamRepositoryOrderField": "enums",
+    "TeamReviewAssignmentAlgorithm": "enums",
+    "TeamRole": "enums",
+    "ThreadSubscriptionFormAction": "enums",
+    "ThreadSubscriptionState": "enums",
+    "TopicSuggestionDeclineReason": "enums",
+    "TrackedIssueStates": "enums",
+    "UserBlockDuration": "enums",
+    "UserStatusOrderField": "enums",
+    "VerifiableDomainOrderField": "enums",
+    "WorkflowRunOrderField": "enums",
+    "WorkflowState": "enums",
+    "Environments": "environments",
+    "ExternalIdentityAttribute": "external_identity_attribute",
+    "ExternalIdentitySamlAttributes": "external_identity_saml_attributes",
+    "ExternalIdentityScimAttributes": "external_identity_scim_attributes",
+    "FileAddition": "file_addition",
+    "FileChanges": "file_changes",
+    "FileDeletion": "file_deletion",
+    "FollowOrganizationInput": "follow_organization_input",
+    "FollowOrganizationPayload": "follow_organization_payload",
+    "FollowUserInput": "follow_user_input",
+    "FollowUserPayload": "follow_user_payload",
+    "FundingLink": "funding_link",
+    "GenericHovercardContext": "generic_hovercard_context",
+    "GistFile": "gist_file",
+    "GistOrder": "gist_order",
+    "GitHubMetadata": "git_hub_metadata",
+    "GpgSignature": "gpg_signature",
+    "GrantEnterpriseOrganizationsMigratorRoleInput": "grant_enterprise_organizations_migrator_role_input",
+    "GrantEnterpriseOrganizationsMigratorRolePayload": "grant_enterprise_organizations_migrator_role_payload",
+    "GrantMigratorRoleInput": "grant_migrator_role_input",
+    "GrantMigratorRolePayload": "grant_migrator_role_payload",
+    "Hovercard": "hovercard",
+    "HovercardContext": "hovercard_context",
+    "ImportProjectInput": "import_project_input",
+    "ImportProjectPayload": "import_project_payload",
+    "InviteEnterpriseAdminInput": "invite_enterprise_admin_input",
+    "InviteEnterpriseAdminPayload": "invite_enterprise_admin_payload",
+    "IpAllowListEntryOrder": "ip_allow_list_entry_order",
+    "IssueCommentOrder": "issue_comment_order",
+    "IssueFilters": "issue_filters",
+    "IssueOrder": "issue_order",
+    "LabelOrder": "label_order",
+    "Language": "language",
+    "LanguageConnection": "language_connection",
+    "LanguageEdge": "language_edge",
+    "LanguageOrder": "language_order",
+    "License": "license",
+    "LicenseRule": "license_rule",
+    "LinkProjectV2ToRepositoryInput": "link_project_v2_to_repository_input",
+    "LinkProjectV2ToRepositoryPayload": "link_project_v2_to_repository_payload",
+    "LinkProjectV2ToTeamInput": "link_project_v2_to_team_input",
+    "LinkProjectV2ToTeamPayload": "link_project_v2_to_team_payload",
+    "LinkRepositoryToProjectInput": "link_repository_to_project_input",
+    "LinkRepositoryToProjectPayload": "link_repository_to_project_payload",
+    "LockLockableInput": "lock_lockable_input",
+    "LockLockablePayload": "lock_lockable_payload",
+    "Lockable": "lockable",
+    "LockedEvent": "locked_event",
+    "MannequinOrder": "mannequin_order",
+    "MarkDiscussionCommentAsAnswerInput": "mark_discussion_comment_as_answer_input",
+    "MarkDiscussionCommentAsAnswerPayload": "mark_discussion_comment_as_answer_payload",
+    "MarkFileAsViewedInput": "mark_file_as_viewed_input",
+    "MarkFileAsViewedPayload": "mark_file_as_viewed_payload",
+    "MarkProjectV2AsTemplateInput": "mark_project_v2_as_template_input",
+    "MarkProjectV2AsTemplatePayload": "mark_project_v2_as_template_payload",
+    "MarkPullRequestReadyForReviewInput": "mark_pull_request_ready_for_review_input",
+    "MarkPullRequestReadyForReviewPayload": "mark_pull_request_ready_for_review_payload",
+    "MarketplaceCategory": "marketplace_category",
+    "MarketplaceListing": "marketplace_listing",
+    "MarketplaceListingConnection": "marketplace_listing_connection",
+    "MarketplaceListingEdge": "marketplace_listing_edge",
+    "MemberFeatureRequestNotification": "member_feature_request_notification",
+    "MentionedEvent": "mentioned_event",
+    "MergeBranchInput": "merge_branch_input",
+    "MergeBranchPayload": "merge_branch_payload",
+    "MergePullRequestInput": "merge_pull_request_input",
+    "MergePullRequestPayload": "merge_pull_request_payload",
+    "MergeQueueConfiguration": "merge_queue_configuration",
+    "Migration": "migration",
+    "MigrationSource": "migration_source",
+    "MilestoneOrder": "milestone_order",
+    "Minimizable": "minimizable",
+    "MinimizeCommentInput": "minimize_comment_input",
+    "MinimizeCommentPayload": "minimize_comment_payload",
+    "MoveProjectCardInput": "move_project_card_input",
+    "MoveProjectCardPayload": "move_project_card_payload",
+    "MoveProjectColumnInput": "move_project_column_input",
+    "MoveProjectColumnPayload": "move_project_column_payload",
+    "Node": "node",
+    "OauthApplicationAuditEntryData": "oauth_application_audit_entry_data",
+    "OrgEnterpriseOwnerOrder": "org_enterprise_owner_order",
+    "OrganizationMigration": "organization_migration",
+    "OrganizationOrder": "organization_order",
+    "OrganizationTeamsHovercardContext": "organization_teams_hovercard_context",
+    "OrganizationsHovercardContext": "organizations_hovercard_context",
+    "PackageFileOrder": "package_file_order",
+    "PackageOrder": "package_order",
+    "PackageStatistics": "package_statistics",
+    "PackageTag": "package_tag",
+    "PackageVersionOrder": "package_version_order",
+    "PackageVersionStatistics": "package_version_statistics",
+    "PageInfo": "page_info",
+    "PinIssueInput": "pin_issue_input",
+    "PinIssuePayload": "pin_issue_payload",
+    "ProjectCardImport": "project_card_import",
+    "ProjectColumnImport": "project_column_import",
+    "ProjectOrder": "project_order",
+    "ProjectProgress": "project_progress",
+    "ProjectV2ActorConnection": "project_v2_actor_connection",
+    "ProjectV2ActorEdge": "project_v2_actor_edge",
+    "ProjectV2Collaborator": "project_v2_collaborator",
+    "ProjectV2FieldOrder": "project_v2_field_order",
+    "ProjectV2FieldValue": "project_v2_field_value",
+    "ProjectV2Filters": "project_v2_filters",
+    "ProjectV2ItemFieldValueOrder": "project_v2_item_field_value_order",
+    "ProjectV2ItemOrder": "project_v2_item_order",
+    "ProjectV2IterationFieldConfiguration": "project_v2_iteration_field_configuration",
+    "ProjectV2IterationFieldIteration": "project_v2_iteration_field_iteration",
+    "ProjectV2Order": "project_v2_order",
+    "ProjectV2SingleSelectFieldOption": "project_v2_single_select_field_option",
+    "ProjectV2SingleSelectFieldOptionInput": "project_v2_single_select_field_option_input",
+    "ProjectV2ViewOrder": "project_v2_view_order",
+    "ProjectV2WorkflowOrder": "project_v2_workflow_order",
+    "PublicKey": "public_key",
+    "PublicKeyConnection": "public_key_connection",
+    "PublicKeyEdge": "public_key_edge",
+    "PublishSponsorsTierInput": "publish_sponsors_tier_input",
+    "PublishSponsorsTierPayload": "publish_sponsors_tier_payload",
+    "PullRequestChangedFile": "pull_request_changed_file",
+    "PullRequestChangedFileConnection": "pull_request_changed_file_connection",
+    "PullRequestChangedFileEdge": "pull_request_changed_file_edge",
+    "PullRequestOrder": "pull_request_order",
+    "PullRequestParameters": "pull_request_parameters",
+    "PullRequestParametersInput": "pull_request_parameters_input",
+    "PullRequestThread": "pull_request_thread",
+    "RateLimit": "rate_limit",
+    "ReactionOrder": "reaction_order",
+    "RefNameConditionTarget": "ref_name_condition_target",
+    "RefNameConditionTargetInput": "ref_name_condition_target_input",
+    "RefOrder": "ref_order",
+    "RefUpdate": "ref_update",
+    "RefUpdateRule": "ref_update_rule",
+    "RegenerateEnterpriseIdentityProviderRecoveryCodesInput": "regenerate_enterprise_identity_provider_recovery_codes_input",
+    "RegenerateEnterpriseIdentityProviderRecoveryCodesPayload": "regenerate_enterprise_identity_provider_recovery_codes_payload",
+    "RegenerateVerifiableDomainTokenInput": "regenerate_verifiable_domain_token_input",
+    "RegenerateVerifiableDomainTokenPayload": "regenerate_verifiable_domain_token_payload",
+    "RejectDeploymentsInput": "reject_deployments_input",
+    "RejectDeploymentsPayload": "reject_deployments_payload",
+    "ReleaseOrder": "release_order",
+    "RemoveAssigneesFromAssignableInput": "remove_assignees_from_assignable_input",
+    "RemoveAssigneesFromAssignablePayload": "remove_assignees_from_assignable_payload",
+    "RemoveEnterpriseAdminInput": "remove_enterprise_admin_input",
+    "RemoveEnterpriseAdminPayload": "remove_enterprise_admin_payload",
+    "RemoveEnterpriseIdentityProviderInput": "remove_enterprise_identity_provider_input",
+    "RemoveEnterpriseIdentityProviderPayload": "remove_enterprise_identity_provider_payload",
+    "RemoveEnterpriseMemberInput": "remove_enterprise_member_input",
+    "RemoveEnterpriseMemberPayload": "remove_enterprise_member_payload",
+    "RemoveEnterpriseOrganizationInput": "remove_enterprise_organization_input",
+    "RemoveEnterpriseOrganizationPayload": "remove_enterprise_organization_payload",
+    "RemoveEnterpriseSupportEntitlementInput": "remove_enterprise_support_entitlement_input",
+    "RemoveEnterpriseSupportEntitlementPayload": "remove_enterprise_support_entitlement_payload",
+    "RemoveLabelsFromLabelableInput": "remove_labels_from_labelable_input",
+    "RemoveLabelsFromLabelablePayload": "remove_labels_from_labelable_payload",
+    "RemoveOutsideCollaboratorInput": "remove_outside_collaborator_input",
+    "RemoveOutsideCollaboratorPayload": "remove_outside_collaborator_payload",
+    "RemoveReactionInput": "remove_reaction_input",
+    "RemoveReactionPayload": "remove_reaction_payload",
+    "RemoveStarInput": "remove_star_input",
+    "RemoveStarPayload": "remove_star_payload",
+    "RemoveUpvoteInput": "remove_upvote_input",
+    "RemoveUpvotePayload": "remove_upvote_payload",
+    "ReopenDiscussionInput": "reopen_discussion_input",
+    "ReopenDiscussionPayload": "reopen_discussion_payload",
+    "ReopenIssueInput": "reopen_issue_input",
+    "ReopenIssuePayload": "reopen_issue_payload",
+    "ReopenPullRequestInput": "reopen_pull_request_input",
+    "ReopenPullRequestPayload": "reopen_pull_request_payload",
+    "ReopenedEvent": "reopened_event",
+    "RepositoryCodeowners": "repository_codeowners",
+    "RepositoryCodeownersError": "repository_codeowners_error",
+    "RepositoryContactLink": "repository_contact_link",
+    "RepositoryIdConditionTarget": "repository_id_condition_target",
+    "RepositoryIdConditionTargetInput": "repository_id_condition_target_input",
+    "RepositoryInteractionAbility": "repository_interaction_ability",
+    "RepositoryInvitationOrder": "repository_invitation_order",
+    "RepositoryMigration": "repository_migration",
+    "RepositoryMigrationConnection": "repository_migration_connection",
+    "RepositoryMigrationEdge": "repository_migration_edge",
+    "RepositoryMigrationOrder": "repository_migration_order",
+    "RepositoryNameConditionTarget": "repository_name_condition_target",
+    "RepositoryNameConditionTargetInput": "repository_name_condition_target_input",
+    "RepositoryOrder": "repository_order",
+    "RepositoryRuleConditions": "repository_rule_conditions",
+    "RepositoryRuleConditionsInput": "repository_rule_conditions_input",
+    "RepositoryRuleInput": "repository_rule_input",
+    "RepositoryRulesetBypassActorInput": "repository_ruleset_bypass_actor_input",
+    "RequestReviewsInput": "request_reviews_input",
+    "RequestReviewsPayload": "request_reviews_payload",
+    "RequirableByPullRequest": "requirable_by_pull_request",
+    "RequiredDeploymentsParameters": "required_deployments_parameters",
+    "RequiredDeploymentsParametersInput": "required_deployments_parameters_input",
+    "RequiredStatusCheckInput": "required_status_check_input",
+    "RequiredStatusChecksParameters": "required_status_checks_parameters",
+    "RequiredStatusChecksParametersInput": "required_status_checks_parameters_input",
+    "RerequestCheckSuiteInput": "rerequest_check_suite_input",
+    "RerequestCheckSuitePayload": "rerequest_check_suite_payload",
+    "ResolveReviewThreadInput": "resolve_review_thread_input",
+    "ResolveReviewThreadPayload": "resolve_review_thread_payload",
+    "RetireSponsorsTierInput": "retire_sponsors_tier_input",
+    "RetireSponsorsTierPayload": "retire_sponsors_tier_payload",
+    "RevertPullRequestInput": "revert_pull_request_input",
+    "RevertPullRequestPayload": "revert_pull_request_payload",
+    "ReviewStatusHovercardContext": "review_status_hovercard_context",
+    "RevokeEnterpriseOrganizationsMigratorRoleInput": "revoke_enterprise_organizations_migrator_role_input",
+    "RevokeEnterpriseOrganizationsMigratorRolePayload": "revoke_enterprise_organizations_migrator_role_payload",
+    "RevokeMigratorRoleInput": "revoke_migrator_role_input",
+    "RevokeMigratorRolePayload": "revoke_migrator_role_payload",
+    "RuleParametersInput": "rule_parameters_input",
+    "SavedReply": "saved_reply",
+    "SavedReplyConnection": "saved_reply_connection",
+    "SavedReplyEdge": "saved_reply_edge",
+    "SavedReplyOrder": "saved_reply_order",
+    "Base64String": "scalars",
+    "BigInt": "scalars",
+    "Boolean": "scalars",
+    "Date": "scalars",
+    "DateTime": "scalars",
+    "Float": "scalars",
+    "GitObjectID": "scalars",
+    "GitRefname": "scalars",
+    "GitSSHRemote": "scalars",
+    "GitTimestamp": "scalars",
+    "HTML": "scalars",
+    "ID": "scalars",
+    "Int": "scalars",
+    "PreciseDateTime": "scalars",
+    "String": "scalars",
+    "URI": "scalars",
+    "X509Certificate": "scalars",
+    "SearchResultItemConnection": "search_result_item_connection",
+    "SearchResultItemEdge": "search_result_item_edge",
+    "SecurityAdvisory": "security_advisory",
+    "SecurityAdvisoryConnection": "security_advisory_connection",
+    "SecurityAdvisoryEdge": "security_advisory_edge",
+    "SecurityAdvisoryIdentifier": "security_advisory_identifier",
+    "SecurityAdvisoryIdentifierFilter": "security_advisory_identifier_filter",
+    "SecurityAdvisoryOrder": "security_advisory_order",
+    "SecurityAdvisoryPackage": "security_advisory_package",
+    "SecurityAdvisoryPackageVersion": "security_advisory_package_version",
+    "SecurityAdvisoryReference": "security_advisory_reference",
+    "SecurityVulnerability": "security_vulnerability",
+    "SecurityVulnerabilityConnection": "security_vulnerability_connection",
+    "SecurityVulnerabilityEdge": "security_vulnerability_edge",
+    "SecurityVulnerabilityOrder": "security_vulnerability_order",
+    "SetEnterpriseIdentityProviderInput": "set_enterprise_identity_provider_input",
+    "SetEnterpriseIdentityProviderPayload": "set_enterprise_identity_provider_payload",
+    "SetOrganizationInteractionLimitInput": "set_organization_interaction_limit_input",
+    "SetOrganizationInteractionLimitPayload": "set_organization_interaction_limit_payload",
+    "SetRepositoryInteractionLimitInput": "set_repository_interaction_limit_input",
+    "SetRepositoryInteractionLimitPayload": "set_repository_interaction_limit_payload",
+    "SetUserInteractionLimitInput": "set_user_interaction_limit_input",
+    "SetUserInteractionLimitPayload": "set_user_interaction_limit_payload",
+    "SmimeSignature": "smime_signature",
+    "SocialAccount": "social_account",
+    "SocialAccountConnection": "social_account_connection",
+    "SocialAccountEdge": "social_account_edge",
+    "SponsorOrder": "sponsor_order",
+    "SponsorableItemConnection": "sponsorable_item_connection",
+    "SponsorableItemEdge": "sponsorable_item_edge",
+    "SponsorableOrder": "sponsorable_order",
+    "SponsorsActivityOrder": "sponsors_activity_order",
+    "SponsorsGoal": "sponsors_goal",
+    "SponsorsTierOrder": "sponsors_tier_order",
+    "SponsorshipNewsletterOrder": "sponsorship_newsletter_order",
+    "SponsorshipOrder": "sponsorship_order",
+    "SshSignature": "ssh_signature",
+    "StarOrder": "star_order",
+    "StartOrganizationMigrationInput": "start_organization_migration_input",
+    "StartOrganizationMigrationPayload": "start_organization_migration_payload",
+    "StartRepositoryMigrationInput": "start_repository_migration_input",
+    "StartRepositoryMigrationPayload": "start_repository_migration_payload",
+    "StatusCheckConfiguration": "status_check_configuration",
+    "StatusCheckConfigurationInput": "status_check_configuration_input",
+    "StatusContextStateCount": "status_context_state_count",
+    "SubmitPullRequestReviewInput": "submit_pull_request_review_input",
+    "SubmitPullRequestReviewPayload": "submit_pull_request_review_payload",
+    "Submodule": "submodule",
+    "SubmoduleConnection": "submodule_connection",
+    "SubmoduleEdge": "submodule_edge",
+    "Subscribable": "subscribable",
+    "SubscribableThread": "subscribable_thread",
+    "SubscribedEvent": "subscribed_event",
+    "Tag": "tag",
+    "TagNamePatternParameters": "tag_name_pattern_parameters",
+    "TagNamePatternParametersInput": "tag_name_pattern_parameters_input",
+    "TeamDiscussionCommentOrder": "team_discussion_comment_order",
+    "TeamDiscussionOrder": "team_discussion_order",
+    "TeamMemberOrder": "team_member_order",
+    "TeamOrder": "team_order",
+    "TeamRepositoryOrder": "team_repository_order",
+    "TextMatch": "text_match",
+    "TextMatchHighlight": "text_match_highlight",
+    "TransferEnterpriseOrganizationInput": "transfer_enterprise_organization_input",
+    "TransferEnterpriseOrganizationPayload": "transfer_enterprise_organization_payload",
+    "TransferIssueInput": "transfer_issue_input",
+    "TransferIssuePayload": "transfer_issue_payload",
+    "UnarchiveProjectV2ItemInput": "unarchive_project_v2_item_input",
+    "UnarchiveProjectV2ItemPayload": "unarchive_project_v2_item_payload",
+    "UnarchiveRepositoryInput": "unarchive_repository_input",
+    "UnarchiveRepositoryPayload": "unarchive_repository_payload",
+    "UnfollowOrganizationInput": "unfollow_organization_input",
+    "UnfollowOrganizationPayload": "unfollow_organization_payload",
+    "UnfollowUserInput": "unfollow_user_input",
+    "UnfollowUserPayload": "unfollow_user_payload",
+    "UniformResourceLocatable": "uniform_resource_locatable",
+    "Assignee": "unions",
+    "AuditEntryActor": "unions",
+    "BranchActorAllowanceActor": "unions",
+    "BypassActor": "unions",
+    "Claimable": "unions",
+    "Closer": "unions",
+    "CreatedIssueOrRestrictedContribution": "unions",
+    "CreatedPullRequestOrRestrictedContribution": "unions",
+    "CreatedRepositoryOrRestrictedContribution": "unions",
+    "DeploymentReviewer": "unions",
+    "EnterpriseMember": "unions",
+    "IpAllowListOwner": "unions",
+    "IssueOrPullRequest": "unions",
+    "IssueTimelineItem": "unions",
+    "IssueTimelineItems": "unions",
+    "MilestoneItem": "unions",
+    "OrgRestoreMemberAuditEntryMembership": "unions",
+    "OrganizationAuditEntry": "unions",
+    "OrganizationOrUser": "unions",
+    "PermissionGranter": "unions",
+    "PinnableItem": "unions",
+    "ProjectCardItem": "unions",
+    "ProjectV2Actor": "unions",
+    "ProjectV2FieldConfiguration": "unions",
+    "ProjectV2ItemContent": "unions",
+    "ProjectV2ItemFieldValue": "unions",
+    "PullRequestTimelineItem": "unions",
+    "PullRequestTimelineItems": "unions",
+    "PushAllowanceActor": "unions",
+    "Reactor": "unions",
+    "ReferencedSubject": "unions",
+    "RenamedTitleSubject": "unions",
+    "RequestedReviewer": "unions",
+    "ReviewDismissalAllowanceActor": "unions",
+    "RuleParameters": "unions",
+    "RuleSource": "unions",
+    "SearchResultItem": "unions",
+    "Sponsor": "unions",
+    "SponsorableItem": "unions",
+    "SponsorsListingFeatureableItem": "unions",
+    "StatusCheckRollupContext": "unions",
+    "UserListItems": "unions",
+    "VerifiableDomainOwner": "unions",
+    "UnknownSignature": "unknown_signature",
+    "UnlinkProjectV2FromRepositoryInput": "unlink_project_v2_from_repository_input",
+    "UnlinkProjectV2FromRepositoryPayload": "unlink_project_v2_from_repository_payload",
+    "UnlinkProjectV2FromTeamInput": "unlink_project_v2_from_team_input",
+    "UnlinkProjectV2FromTeamPayload": "unlink_project_v2_from_team_payload",
+    "UnlinkRepositoryFromProjectInput": "unlink_repository_from_project_input",
+    "UnlinkRepositoryFromProjectPayload": "unlink_repository_from_project_payload",
+    "UnlockLockableInput": "unlock_lockable_input",
+    "UnlockLockablePayload": "unlock_lockable_payload",
+    "UnlockedEvent": "unlocked_event",
+    "UnmarkDiscussionCommentAsAnswerInput": "unmark_discussion_comment_as_answer_input",
+    "UnmarkDiscussionCommentAsAnswerPayload": "unmark_discussion_comment_as_answer_payload",
+    "UnmarkFileAsViewedInput": "unmark_file_as_viewed_input",
+    "UnmarkFileAsViewedPayload": "unmark_file_as_viewed_payload",
+    "UnmarkIssueAsDuplicateInput": "unmark_issue_as_duplicate_input",
+    "UnmarkIssueAsDuplicatePayload": "unmark_issue_as_duplicate_payload",
+    "UnmarkProjectV2AsTemplateInput": "unmark_project_v2_as_template_input",
+    "UnmarkProjectV2AsTemplatePayload": "unmark_project_v2_as_template_payload",
+    "UnminimizeCommentInput": "unminimize_comment_input",
+    "UnminimizeCommentPayload": "unminimize_comment_payload",
+    "UnpinIssueInput": "unpin_issue_input",
+    "UnpinIssuePayload": "unpin_issue_payload",
+    "UnresolveReviewThreadInput": "unresolve_review_thread_input",
+    "UnresolveReviewThreadPayload": "unresolve_review_thread_payload",
+    "UnsubscribeFromNotificationsInput": "unsubscribe_from_notifications_input",
+    "UnsubscribeFromNotificationsPayload": "unsubscribe_from_notifications_payload",
+    "UnsubscribedEvent": "unsubscribed_event",
+    "Updatable": "updatable",
+    "UpdatableComment": "updatable_comment",
+    "UpdateBranchProtectionRuleInput": "update_branch_protection_rule_input",
+    "UpdateBranchProtectionRulePayload": "update_branch_protection_rule_payload",
+    "UpdateCheckRunInput": "update_check_run_input",
+    "UpdateCheckRunPayload": "update_check_run_payload",
+    "UpdateCheckSuitePreferencesInput": "update_check_suite_preferences_input",
+    "UpdateCheckSuitePreferencesPayload": "update_check_suite_preferences_payload",
+    "UpdateDiscussionCommentInput": "update_discussion_comment_input",
+    "UpdateDiscussionCommentPayload": "update_discussion_comment_payload",
+    "UpdateDiscussionInput": "update_discussion_input",
+    "UpdateDiscussionPayload": "update_discussion_payload",
+    "UpdateEnterpriseAdministratorRoleInput": "update_enterprise_administrator_role_input",
+    "UpdateEnterpriseAdministratorRolePayload": "update_enterprise_administrator_role_payload",
+    "UpdateEnterpriseAllowPrivateRepositoryForkingSettingInput": "update_enterprise_allow_private_repository_forking_setting_input",
+    "UpdateEnterpriseAllowPrivateRepositoryForkingSettingPayload": "update_enterprise_allow_private_repository_forking_setting_payload",
+    "UpdateEnterpriseDefaultRepositoryPermissionSettingInput": "update_enterprise_default_repository_permission_setting_input",
+    "UpdateEnterpriseDefaultRepositoryPermissionSettingPayload": "update_enterprise_default_repository_permission_setting_payload",
+    "UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingInput": "update_enterprise_members_can_change_repository_visibility_setting_input",
+    "UpdateEnterpriseMembersCanChangeRepositoryVisibilitySettingPayload": "update_enterprise_members_can_change_repository_visibility_setting_payload",
+    "UpdateEnterpriseMembersCanCreateRepositoriesSettingInput": "update_enterprise_members_can_create_repositories_setting_input",
+    "UpdateEnterpriseMembersCanCreateRepositoriesSettingPayload": "update_enterprise_members_can_create_repositories_setting_payload",
+    "UpdateEnterpriseMembersCanDeleteIssuesSettingInput": "update_enterprise_members_can_delete_issues_setting_input",
+    "UpdateEnterpriseMembersCanDeleteIssuesSettingPayload": "update_enterprise_members_can_delete_issues_setting_payload",
+    "UpdateEnterpriseMembersCanDeleteRepositoriesSettingInput": "update_enterprise_members_can_delete_repositories_setting_input",
+    "UpdateEnterpriseMembersCanDeleteRepositoriesSettingPayload": "update_enterprise_members_can_delete_repositories_setting_payload",
+    "UpdateEnterpriseMembersCanInviteCollaboratorsSettingInput": "update_enterprise_members_can_invite_collaborators_setting_input",
+    "UpdateEnterpriseMembersCanInviteCollaboratorsSettingPayload": "update_enterprise_members_can_invite_collaborators_setting_payload",
+    "UpdateEnterpriseMembersCanMakePurchasesSettingInput": "update_enterprise_members_can_make_purchases_setting_input",
+    "UpdateEnterpriseMembersCanMakePurchasesSettingPayload": "update_enterprise_members_can_make_purchases_setting_payload",
+    "UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingInput": "update_enterprise_members_can_update_protected_branches_setting_input",
+    "UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingPayload": "update_enterprise_members_can_update_protected_branches_setting_payload",
+    "UpdateEnterpriseMembersCanViewDependencyInsightsSettingInput": "update_enterprise_members_can_view_dependency_insights_setting_input",
+    "UpdateEnterpriseMembersCanViewDependencyInsightsSettingPayload": "update_enterprise_members_can_view_dependency_insights_setting_payload",
+    "UpdateEnterpriseOrganizationProjectsSettingInput": "update_enterprise_organization_projects_setting_input",
+    "UpdateEnterpriseOrganizationProjectsSettingPayload": "update_enterprise_organization_projects_setting_payload",
+    "UpdateEnterpriseOwnerOrganizationRoleInput": "update_enterprise_owner_organization_role_input",
+    "UpdateEnterpriseOwnerOrganizationRolePayload": "update_enterprise_owner_organization_role_payload",
+    "UpdateEnterpriseProfileInput": "update_enterprise_profile_input",
+    "UpdateEnterpriseProfilePayload": "update_enterprise_profile_payload",
+    "UpdateEnterpriseRepositoryProjectsSettingInput": "update_enterprise_repository_projects_setting_input",
+    "UpdateEnterpriseRepositoryProjectsSettingPayload": "update_enterprise_repository_projects_setting_payload",
+    "UpdateEnterpriseTeamDiscussionsSettingInput": "update_enterprise_team_discussions_setting_input",
+    "UpdateEnterpriseTeamDiscussionsSettingPayload": "update_enterprise_team_discussions_setting_payload",
+    "UpdateEnterpriseTwoFactorAuthenticationRequiredSettingInput": "update_enterprise_two_factor_authentication_required_setting_input",
+    "UpdateEnterpriseTwoFactorAuthenticationRequiredSettingPayload": "update_enterprise_two_factor_authentication_required_setting_payload",
+    "UpdateEnvironmentInput": "update_environment_input",
+    "UpdateEnvironmentPayload": "update_environment_payload",
+    "UpdateIpAllowListEnabledSettingInput": "update_ip_allow_list_enabled_setting_input",
+    "UpdateIpAllowListEnabledSettingPayload": "update_ip_allow_list_enabled_setting_payload",
+    "UpdateIpAllowListEntryInput": "update_ip_allow_list_entry_input",
+    "UpdateIpAllowListEntryPayload": "update_ip_allow_list_entry_payload",
+    "UpdateIpAllowListForInstalledAppsEnabledSettingInput": "update_ip_allow_list_for_installed_apps_enabled_setting_input",
+    "UpdateIpAllowListForInstalledAppsEnabledSettingPayload": "update_ip_allow_list_for_installed_apps_enabled_setting_payload",
+    "UpdateIssueCommentInput": "update_issue_comment_input",
+    "UpdateIssueCommentPayload": "update_issue_comment_payload",
+    "UpdateIssueInput": "update_issue_input",
+    "UpdateIssuePayload": "update_issue_payload",
+    "UpdateLabelInput": "update_label_input",
+    "UpdateLabelPayload": "update_label_payload",
+    "UpdateNotificationRestrictionSettingInput": "update_notification_restriction_setting_input",
+    "UpdateNotificationRestrictionSettingPayload": "update_notification_restriction_setting_payload",
+    "UpdateOrganizationAllowPrivateRepositoryForkingSettingInput": "update_organization_allow_private_repository_forking_setting_input",
+    "UpdateOrganizationAllowPrivateRepositoryForkingSettingPayload": "update_organization_allow_private_repository_forking_setting_payload",
+    "UpdateOrganizationWebCommitSignoffSettingInput": "update_organization_web_commit_signoff_setting_input",
+    "UpdateOrganizationWebCommitSignoffSettingPayload": "update_organization_web_commit_signoff_setting_payload",
+    "UpdateParameters": "update_parameters",
+    "UpdateParametersInput": "update_parameters_input",
+    "UpdatePatreonSponsorabilityInput": "update_patreon_sponsorability_input",
+    "UpdatePatreonSponsorabilityPayload": "update_patreon_sponsorability_payload",
+    "UpdateProjectCardInput": "update_project_card_input",
+    "UpdateProjectCardPayload": "update_project_card_payload",
+    "UpdateProjectColumnInput": "update_project_column_input",
+    "UpdateProjectColumnPayload": "update_project_column_payload",
+    "UpdateProjectInput": "update_project_input",
+    "UpdateProjectPayload": "update_project_payload",
+    "UpdateProjectV2CollaboratorsInput": "update_project_v2_collaborators_input",
+    "UpdateProjectV2CollaboratorsPayload": "update_project_v2_collaborators_payload",
+    "UpdateProjectV2DraftIssueInput": "update_project_v2_draft_issue_input",
+    "UpdateProjectV2DraftIssuePayload": "update_project_v2_draft_issue_payload",
+    "UpdateProjectV2Input": "update_project_v2_input",
+    "UpdateProjectV2ItemFieldValueInput": "update_project_v2_item_field_value_input",
+    "UpdateProjectV2ItemFieldValuePayload": "update_project_v2_item_field_value_payload",
+    "UpdateProjectV2ItemPositionInput": "update_project_v2_item_position_input",
+    "UpdateProjectV2ItemPositionPayload": "update_project_v2_item_position_payload",
+    "UpdateProjectV2Payload": "update_project_v2_payload",
+    "UpdatePullRequestBranchInput": "update_pull_request_branch_input",
+    "UpdatePullRequestBranchPayload": "update_pull_request_branch_payload",
+    "UpdatePullRequestInput": "update_pull_request_input",
+    "UpdatePullRequestPayload": "update_pull_request_payload",
+    "UpdatePullRequestReviewCommentInput": "update_pull_request_review_comment_input",
+    "UpdatePullRequestReviewCommentPayload": "update_pull_request_review_comment_payload",
+    "UpdatePullRequestReviewInput": "update_pull_request_review_input",
+    "UpdatePullRequestReviewPayload": "update_pull_request_review_payload",
+    "UpdateRefInput": "update_ref_input",
+    "UpdateRefPayload": "update_ref_payload",
+    "UpdateRefsInput": "update_refs_input",
+    "UpdateRefsPayload": "update_refs_payload",
+    "UpdateRepositoryInput": "update_repository_input",
+    "UpdateRepositoryPayload": "update_repository_payload",
+    "UpdateRepositoryRulesetInput": "update_repository_ruleset_input",
+    "UpdateRepositoryRulesetPayload": "update_repository_ruleset_payload",
+    "UpdateRepositoryWebCommitSignoffSettingInput": "update_repository_web_commit_signoff_setting_input",
+    "UpdateRepositoryWebCommitSignoffSettingPayload": "update_repository_web_commit_signoff_setting_payload",
+    "UpdateSponsorshipPreferencesInput": "update_sponsorship_preferences_input",
+    "UpdateSponsorshipPreferencesPayload": "update_sponsorship_preferences_payload",
+    "UpdateSubscriptionInput": "update_subscription_input",
+    "UpdateSubscriptionPayload": "update_subscription_payload",
+    "UpdateTeamDiscussionCommentInput": "update_team_discussion_comment_input",
+    "UpdateTeamDiscussionCommentPayload": "update_team_discussion_comment_payload",
+    "UpdateTeamDiscussionInput": "update_team_discussion_input",
+    "UpdateTeamDiscussionPayload": "update_team_discussion_payload",
+    "UpdateTeamReviewAssignmentInput": "update_team_review_assignment_input",
+    "UpdateTeamReviewAssignmentPayload": "update_team_review_assignment_payload",
+    "UpdateTeamsRepositoryInput": "update_teams_repository_input",
+    "UpdateTeamsRepositoryPayload": "update_teams_repository_payload",
+    "UpdateTopicsInput": "update_topics_input",
+    "UpdateTopicsPayload": "update_topics_payload",
+    "UpdateUserListInput": "update_user_list_input",
+    "UpdateUserListPayload": "update_user_list_payload",
+    "UpdateUserListsForItemInput": "update_user_lists_for_item_input",
+    "UpdateUserListsForItemPayload": "update_user_lists_for_item_payload",
+    "UserContentEdit": "user_content_edit",
+    "UserContentEditConnection": "user_content_edit_connection",
+    "UserContentEditEdge": "user_content_edit_edge",
+    "UserEmailMetadata": "user_email_metadata",
+    "UserListSuggestion": "user_list_suggestion",
+    "UserStatusOrder": "user_status_order",
+    "VerifiableDomainOrder": "verifiable_domain_order",
+    "VerifyVerifiableDomainInput": "verify_verifiable_domain_input",
+    "VerifyVerifiableDomainPayload": "verify_verifiable_domain_payload",
+    "ViewerHovercardContext": "viewer_hovercard_context",
+    "Votable": "votable",
+    "WorkflowFileReference": "workflow_file_reference",
+    "WorkflowFileReferenceInput": "workflow_file_reference_input",
+    "WorkflowRunOrder": "workflow_run_order",
+    "WorkflowsParameters": "workflows_parameters",
+    "WorkflowsParametersInput": "workflows_parameters_input",
+}
+
+DEPENDENCIES = {
+    "abort_queued_migrations_input": (
+        "ID",
+        "String",
+    ),
+    "abort_queued_migrations_payload": (
+        "Boolean",
+        "String",
+    ),
+    "abort_repository_migration_input": (
+        "ID",
+        "String",
+    ),
+    "abort_repository_migration_payload": (
+        "Boolean",
+        "String",
+    ),
+    "accept_enterprise_administrator_invitation_input": (
+        "ID",
+        "String",
+    ),
+    "accept_enterprise_administrator_invitation_payload": (
+        "EnterpriseAdministratorInvitation",
+        "String",
+    ),
+    "accept_topic_suggestion_input": (
+        "ID",
+        "String",
+    ),
+    "accept_topic_suggestion_payload": (
+        "String",
+        "Topic",
+    ),
+    "actor": (
+        "String",
+        "URI",
+    ),
+    "actor_location": (
+        "String",
+    ),
+    "add_assignees_to_assignable_input": (
+        "ID",
+        "String",
+    ),
+    "add_assignees_to_assignable_payload": (
+        "Assignable",
+        "String",
+    ),
+    "add_comment_input": (
+        "ID",
+        "String",
+    ),
+    "add_comment_payload": (
+        "IssueCommentEdge",
+        "IssueTimelineItemEdge",
+        "Node",
+        "String",
+    ),
+    "add_discussion_comment_input": (
+        "ID",
+        "String",
+    ),
+    "add_discussion_comment_payload": (
+        "DiscussionComment",
+        "String",
+    ),
+    "add_discussion_poll_vote_input": (
+        "ID",
+        "String",
+    ),
+    "add_discussion_poll_vote_payload": (
+        "DiscussionPollOption",
+        "String",
+    ),
+    "add_enterprise_organization_member_input": (
+        "ID",
+        "OrganizationMemberRole",
+        "String",
+    ),
+    "add_enterprise_organization_member_payload": (
+        "String",
+        "User",
+    ),
+    "add_enterprise_support_entitlement_input": (
+        "ID",
+        "String",
+    ),
+    "add_enterprise_support_entitlement_payload": (
+        "String",
+    ),
+    "add_labels_to_labelable_input": (
+        "ID",
+        "String",
+    ),
+    "add_labels_to_labelable_payload": (
+        "Labelable",
+        "String",
+    ),
+    "add_project_card_input": (
+        "ID",
+        "String",
+    ),
+    "add_project_card_payload": (
+        "ProjectCardEdge",
+        "ProjectColumn",
+        "String",
+    ),
+    "add_project_column_input": (
+        "ID",
+        "String",
+    ),
+    "add_project_column_payload": (
+        "Project",
+        "ProjectColumnEdge",
+        "String",
+    ),
+    "add_project_v2_draft_issue_input": (
+        "ID",
+        "String",
+    ),
+    "add_project_v2_draft_issue_payload": (
+        "ProjectV2Item",
+        "String",
+    ),
+    "add_project_v2_item_by_id_input": (
+        "ID",
+        "String",
+    ),
+    "add_project_v2_item_by_id_payload": (
+        "ProjectV2Item",
+        "String",
+    ),
+    "add_pull_request_review_comment_input": (
+        "GitObjectID",
+        "ID",
+        "Int",
+        "String",
+    ),
+    "add_pull_request_review_comment_payload": (
+        "PullRequestReviewComment",
+        "PullRequestReviewCommentEdge",
+        "String",
+    ),
+    "add_pull_request_review_input": (
+        "DraftPullRequestReviewComment",
+        "DraftPullRequestReviewThread",
+        "GitObjectID",
+        "ID",
+        "PullRequestReviewEvent",
+        "String",
+    ),
+    "add_pull_request_review_payload": (
+        "PullRequestReview",
+        "PullRequestReviewEdge",
+        "String",
+    ),
+    "add_pull_request_review_thread_input": (
+        "DiffSide",
+        "ID",
+        "Int",
+        "PullRequestReviewThreadSubjectType",
+        "String",
+    ),
+    "add_pull_request_review_thread_payload": (
+        "PullRequestReviewThread",
+        "String",
+    ),
+    "add_pull_request_review_thread_reply_input": (
+        "ID",
+        "String",
+    ),
+    "add_pull_request_review_thread_reply_payload": (
+        "PullRequestReviewComment",
+        "String",
+    ),
+    "add_reaction_input": (
+        "ID",
+        "ReactionContent",
+        "String",
+    ),
+    "add_reaction_payload": (
+        "Reactable",
+        "Reaction",
+        "ReactionGroup",
+        "String",
+    ),
+    "add_star_input": (
+        "ID",
+        "String",
+    ),
+    "add_star_payload": (
+        "Starrable",
+        "String",
+    ),
+    "add_upvote_input": (
+        "ID",
+        "String",
+    ),
+    "add_upvote_payload": (
+        "String",
+        "Votable",
+    ),
+    "add_verifiable_domain_input": (
+        "ID",
+        "String",
+        "URI",
+    ),
+    "add_verifiable_domain_payload": (
+        "String",
+        "VerifiableDomain",
+    ),
+    "announcement_banner": (
+        "Boolean",
+        "DateTime",
+        "String",
+    ),
+    "approve_deployments_input": (
+        "ID",
+        "String",
+    ),
+    "approve_deployments_payload": (
+        "Deployment",
+        "String",
+    ),
+    "approve_verifiable_domain_input": (
+        "ID",
+        "String",
+    ),
+    "approve_verifiable_domain_payload": (
+        "String",
+        "VerifiableDomain",
+    ),
+    "archive_project_v2_item_input": (
+        "ID",
+        "String",
+    ),
+    "archive_project_v2_item_payload": (
+        "ProjectV2Item",
+        "String",
+    ),
+    "archive_repository_input": (
+        "ID",
+        "String",
+    ),
+    "archive_repository_payload": (
+        "Repository",
+        "String",
+    ),
+    "audit_log_order": (
+        "AuditLogOrderField",
+        "OrderDirection",
+    ),
+    "blob": (
+        "Boolean",
+        "GitObjectID",
+        "ID",
+        "Int",
+        "Repository",
+        "String",
+        "URI",
+    ),
+    "bot": (
+        "DateTime",
+        "ID",
+        "Int",
+        "String",
+        "URI",
+    ),
+    "branch_name_pattern_parameters": (
+        "Boolean",
+        "String",
+    ),
+    "branch_name_pattern_parameters_input": (
+        "Boolean",
+        "String",
+    ),
+    "bulk_sponsorship": (
+        "ID",
+        "Int",
+        "String",
+    ),
+    "cancel_enterprise_admin_invitation_input": (
+        "ID",
+        "String",
+    ),
+    "cancel_enterprise_admin_invitation_payload": (
+        "EnterpriseAdministratorInvitation",
+        "String",
+    ),
+    "cancel_sponsorship_input": (
+        "ID",
+        "String",
+    ),
+    "cancel_sponsorship_payload": (
+        "SponsorsTier",
+        "String",
+    ),
+    "change_user_status_input": (
+        "Boolean",
+        "DateTime",
+        "ID",
+        "String",
+    ),
+    "change_user_status_payload": (
+        "String",
+        "UserStatus",
+    ),
+    "check_annotation": (
+        "CheckAnnotationLevel",
+        "CheckAnnotationSpan",
+        "Int",
+        "String",
+        "URI",
+    ),
+    "check_annotation_connection": (
+        "CheckAnnotation",
+        "CheckAnnotationEdge",
+        "Int",
+        "PageInfo",
+    ),
+    "check_annotation_data": (
+        "CheckAnnotationLevel",
+        "CheckAnnotationRange",
+        "String",
+    ),
+    "check_annotation_edge": (
+        "CheckAnnotation",
+        "String",
+    ),
+    "check_annotation_position": (
+        "Int",
+    ),
+    "check_annotation_range": (
+        "Int",
+    ),
+    "check_annotation_span": (
+        "CheckAnnotationPosition",
+    ),
+    "check_run_action": (
+        "String",
+    ),
+    "check_run_filter": (
+        "CheckConclusionState",
+        "CheckRunType",
+        "CheckStatusState",
+        "Int",
+        "String",
+    ),
+    "check_run_output": (
+        "CheckAnnotationData",
+        "CheckRunOutputImage",
+        "String",
+    ),
+    "check_run_output_image": (
+        "String",
+        "URI",
+    ),
+    "check_run_state_count": (
+        "CheckRunState",
+        "Int",
+    ),
+    "check_step": (
+        "CheckConclusionState",
+        "CheckStatusState",
+        "DateTime",
+        "Int",
+        "String",
+    ),
+    "check_step_connection": (
+        "CheckStep",
+        "CheckStepEdge",
+        "Int",
+        "PageInfo",
+    ),
+    "check_step_edge": (
+        "CheckStep",
+        "String",
+    ),
+    "check_suite_auto_trigger_preference": (
+        "Boolean",
+        "ID",
+    ),
+    "check_suite_filter": (
+        "Int",
+        "String",
+    ),
+    "clear_labels_from_labelable_input": (
+        "ID",
+        "String",
+    ),
+    "clear_labels_from_labelable_payload": (
+        "Labelable",
+        "String",
+    ),
+    "clear_project_v2_item_field_value_input": (
+        "ID",
+        "String",
+    ),
+    "clear_project_v2_item_field_value_payload": (
+        "ProjectV2Item",
+        "String",
+    ),
+    "clone_project_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "clone_project_payload": (
+        "Project",
+        "String",
+    ),
+    "clone_template_repository_input": (
+        "Boolean",
+        "ID",
+        "RepositoryVisibility",
+        "String",
+    ),
+    "clone_template_repository_payload": (
+        "Repository",
+        "String",
+    ),
+    "closable": (
+        "Boolean",
+        "DateTime",
+    ),
+    "close_discussion_input": (
+        "DiscussionCloseReason",
+        "ID",
+        "String",
+    ),
+    "close_discussion_payload": (
+        "Discussion",
+        "String",
+    ),
+    "close_issue_input": (
+        "ID",
+        "IssueClosedStateReason",
+        "String",
+    ),
+    "close_issue_payload": (
+        "Issue",
+        "String",
+    ),
+    "close_pull_request_input": (
+        "ID",
+        "String",
+    ),
+    "close_pull_request_payload": (
+        "PullRequest",
+        "String",
+    ),
+    "code_of_conduct": (
+        "ID",
+        "String",
+        "URI",
+    ),
+    "comment": (
+        "Actor",
+        "Boolean",
+        "CommentAuthorAssociation",
+        "DateTime",
+        "HTML",
+        "ID",
+        "String",
+        "UserContentEditConnection",
+    ),
+    "comment_deleted_event": (
+        "Actor",
+        "DateTime",
+        "ID",
+        "Int",
+    ),
+    "commit_author": (
+        "ID",
+        "String",
+    ),
+    "commit_author_email_pattern_parameters": (
+        "Boolean",
+        "String",
+    ),
+    "commit_author_email_pattern_parameters_input": (
+        "Boolean",
+        "String",
+    ),
+    "commit_contribution_order": (
+        "CommitContributionOrderField",
+        "OrderDirection",
+    ),
+    "commit_message": (
+        "String",
+    ),
+    "commit_message_pattern_parameters": (
+        "Boolean",
+        "String",
+    ),
+    "commit_message_pattern_parameters_input": (
+        "Boolean",
+        "String",
+    ),
+    "committable_branch": (
+        "ID",
+        "String",
+    ),
+    "committer_email_pattern_parameters": (
+        "Boolean",
+        "String",
+    ),
+    "committer_email_pattern_parameters_input": (
+        "Boolean",
+        "String",
+    ),
+    "contributing_guidelines": (
+        "String",
+        "URI",
+    ),
+    "contribution_calendar": (
+        "Boolean",
+        "ContributionCalendarMonth",
+        "ContributionCalendarWeek",
+        "Int",
+        "String",
+    ),
+    "contribution_calendar_day": (
+        "ContributionLevel",
+        "Date",
+        "Int",
+        "String",
+    ),
+    "contribution_calendar_month": (
+        "Date",
+        "Int",
+        "String",
+    ),
+    "contribution_calendar_week": (
+        "ContributionCalendarDay",
+        "Date",
+    ),
+    "contribution_order": (
+        "OrderDirection",
+    ),
+    "convert_project_card_note_to_issue_input": (
+        "ID",
+        "String",
+    ),
+    "convert_project_card_note_to_issue_payload": (
+        "ProjectCard",
+        "String",
+    ),
+    "convert_pull_request_to_draft_input": (
+        "ID",
+        "String",
+    ),
+    "convert_pull_request_to_draft_payload": (
+        "PullRequest",
+        "String",
+    ),
+    "copy_project_v2_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "copy_project_v2_payload": (
+        "ProjectV2",
+        "String",
+    ),
+    "core": (
+        "ActorLocation",
+        "Assignee",
+        "AuditEntryActor",
+        "Base64String",
+        "BigInt",
+        "Boolean",
+        "Bot",
+        "BranchActorAllowanceActor",
+        "BranchNamePatternParameters",
+        "BypassActor",
+        "CheckAnnotationConnection",
+        "CheckConclusionState",
+        "CheckRunStateCount",
+        "CheckStatusState",
+        "CheckStepConnection",
+        "Closer",
+        "CodeOfConduct",
+        "CommentAuthorAssociation",
+        "CommentCannotUpdateReason",
+        "CommentDeletedEvent",
+        "CommitAuthorEmailPatternParameters",
+        "CommitMessagePatternParameters",
+        "CommitterEmailPatternParameters",
+        "ComparisonStatus",
+        "ContributingGuidelines",
+        "ContributionCalendar",
+        "CreatedIssueOrRestrictedContribution",
+        "CreatedPullRequestOrRestrictedContribution",
+        "CreatedRepositoryOrRestrictedContribution",
+        "Date",
+        "DateTime",
+        "DefaultRepositoryPermissionField",
+        "DependabotUpdateError",
+        "DeployKeyConnection",
+        "DeploymentProtectionRuleType",
+        "DeploymentReviewState",
+        "DeploymentReviewer",
+        "DeploymentState",
+        "DeploymentStatusState",
+        "DiffSide",
+        "DiscussionStateReason",
+        "EnterpriseAdministratorRole",
+        "EnterpriseAllowPrivateRepositoryForkingPolicyValue",
+        "EnterpriseBillingInfo",
+        "EnterpriseDefaultRepositoryPermissionSettingValue",
+        "EnterpriseEnabledDisabledSettingValue",
+        "EnterpriseEnabledSettingValue",
+        "EnterpriseMember",
+        "EnterpriseMembersCanCreateRepositoriesSettingValue",
+        "EnterpriseMembersCanMakePurchasesSettingValue",
+        "EnterpriseRepositoryInfoConnection",
+        "EnterpriseServerUserAccountsUploadSyncState",
+        "EnterpriseUserAccountMembershipRole",
+        "ExternalIdentitySamlAttributes",
+        "ExternalIdentityScimAttributes",
+        "Float",
+        "FundingLink",
+        "GistFile",
+        "GitObjectID",
+        "GitSSHRemote",
+        "GitSignatureState",
+        "GitTimestamp",
+        "HTML",
+        "Hovercard",
+        "ID",
+        "Int",
+        "IpAllowListEnabledSettingValue",
+        "IpAllowListForInstalledAppsEnabledSettingValue",
+        "IpAllowListOwner",
+        "IssueOrPullRequest",
+        "IssueState",
+        "IssueStateReason",
+        "IssueTimelineItem",
+        "IssueTimelineItems",
+        "Language",
+        "LanguageConnection",
+        "License",
+        "LockReason",
+        "LockedEvent",
+        "MentionedEvent",
+        "MergeCommitMessage",
+        "MergeCommitTitle",
+        "MergeQueueConfiguration",
+        "MergeQueueEntryState",
+        "MergeStateStatus",
+        "MergeableState",
+        "MilestoneItem",
+        "MilestoneState",
+        "NotificationRestrictionSettingValue",
+        "OIDCProviderType",
+        "OauthApplicationCreateAuditEntryState",
+        "OperationType",
+        "OrderDirection",
+        "OrgAddMemberAuditEntryPermission",
+        "OrgCreateAuditEntryBillingPlan",
+        "OrgRemoveBillingManagerAuditEntryReason",
+        "OrgRemoveMemberAuditEntryMembershipType",
+        "OrgRemoveMemberAuditEntryReason",
+        "OrgRemoveOutsideCollaboratorAuditEntryMembershipType",
+        "OrgRemoveOutsideCollaboratorAuditEntryReason",
+        "OrgRestoreMemberAuditEntryMembership",
+        "OrgUpdateDefaultRepositoryPermissionAuditEntryPermission",
+        "OrgUpdateMemberAuditEntryPermission",
+        "OrgUpdateMemberRepositoryCreationPermissionAuditEntryVisibility",
+        "OrganizationAuditEntry",
+        "OrganizationInvitationRole",
+        "OrganizationInvitationSource",
+        "OrganizationInvitationType",
+        "OrganizationMemberRole",
+        "PackageStatistics",
+        "PackageType",
+        "PackageVersionStatistics",
+        "PageInfo",
+        "PermissionGranter",
+        "PinnableItem",
+        "PinnedDiscussionGradient",
+        "PinnedDiscussionPattern",
+        "PreciseDateTime",
+        "ProjectCardItem",
+        "ProjectCardState",
+        "ProjectColumnPurpose",
+        "ProjectProgress",
+        "ProjectState",
+        "ProjectV2FieldConfiguration",
+        "ProjectV2FieldType",
+        "ProjectV2ItemContent",
+        "ProjectV2ItemFieldValue",
+        "ProjectV2ItemType",
+        "ProjectV2IterationFieldConfiguration",
+        "ProjectV2SingleSelectFieldOption",
+        "ProjectV2SingleSelectFieldOptionColor",
+        "ProjectV2ViewLayout",
+        "PublicKeyConnection",
+        "PullRequestChangedFileConnection",
+        "PullRequestMergeMethod",
+        "PullRequestParameters",
+        "PullRequestReviewCommentState",
+        "PullRequestReviewDecision",
+        "PullRequestReviewState",
+        "PullRequestReviewThreadSubjectType",
+        "PullRequestState",
+        "PullRequestTimelineItem",
+        "PullRequestTimelineItems",
+        "PushAllowanceActor",
+        "ReactionContent",
+        "Reactor",
+        "RefUpdateRule",
+        "ReferencedSubject",
+        "RenamedTitleSubject",
+        "ReopenedEvent",
+        "RepoAccessAuditEntryVisibility",
+        "RepoAddMemberAuditEntryVisibility",
+        "RepoArchivedAuditEntryVisibility",
+        "RepoChangeMergeSettingAuditEntryMergeType",
+        "RepoCreateAuditEntryVisibility",
+        "RepoDestroyAuditEntryVisibility",
+        "RepoRemoveMemberAuditEntryVisibility",
+        "RepositoryCodeowners",
+        "RepositoryContactLink",
+        "RepositoryInteractionAbility",
+        "RepositoryLockReason",
+        "RepositoryMigrationConnection",
+        "RepositoryPermission",
+        "RepositoryRuleConditions",
+        "RepositoryRuleType",
+        "RepositoryRulesetBypassActorBypassMode",
+        "RepositoryRulesetTarget",
+        "RepositoryVisibility",
+        "RepositoryVulnerabilityAlertDependencyScope",
+        "RepositoryVulnerabilityAlertState",
+        "RequestedReviewer",
+        "RequiredDeploymentsParameters",
+        "RequiredStatusChecksParameters",
+        "ReviewDismissalAllowanceActor",
+        "RoleInOrganization",
+        "RuleEnforcement",
+        "RuleParameters",
+        "RuleSource",
+        "SamlDigestAlgorithm",
+        "SamlSignatureAlgorithm",
+        "SavedReplyConnection",
+        "SecurityAdvisory",
+        "SecurityVulnerability",
+        "SocialAccountConnection",
+        "Sponsor",
+        "SponsorsActivityAction",
+        "SponsorsGoal",
+        "SponsorsListingFeatureableItem",
+        "SponsorshipPaymentSource",
+        "SponsorshipPrivacy",
+        "SquashMergeCommitMessage",
+        "SquashMergeCommitTitle",
+        "StatusCheckRollupContext",
+        "StatusContextStateCount",
+        "StatusState",
+        "String",
+        "Submodule",
+        "SubmoduleConnection",
+        "SubscribedEvent",
+        "SubscriptionState",
+        "TagNamePatternParameters",
+        "TeamMemberRole",
+        "TeamNotificationSetting",
+        "TeamPrivacy",
+        "TeamReviewAssignmentAlgorithm",
+        "ThreadSubscriptionFormAction",
+        "ThreadSubscriptionState",
+        "URI",
+        "UnlockedEvent",
+        "UnsubscribedEvent",
+        "UpdateParameters",
+        "UserBlockDuration",
+        "UserContentEditConnection",
+        "UserListItems",
+        "UserListSuggestion",
+        "VerifiableDomainOwner",
+        "WorkflowState",
+        "WorkflowsParameters",
+        "X509Certificate",
+    ),
+    "create_attribution_invitation_input": (
+        "ID",
+        "String",
+    ),
+    "create_attribution_invitation_payload": (
+        "Claimable",
+        "Mannequin",
+        "Organization",
+        "String",
+        "User",
+    ),
+    "create_branch_protection_rule_input": (
+        "Boolean",
+        "ID",
+        "Int",
+        "RequiredStatusCheckInput",
+        "String",
+    ),
+    "create_branch_protection_rule_payload": (
+        "BranchProtectionRule",
+        "String",
+    ),
+    "create_check_run_input": (
+        "CheckConclusionState",
+        "CheckRunAction",
+        "CheckRunOutput",
+        "DateTime",
+        "GitObjectID",
+        "ID",
+        "RequestableCheckStatusState",
+        "String",
+        "URI",
+    ),
+    "create_check_run_payload": (
+        "CheckRun",
+        "String",
+    ),
+    "create_check_suite_input": (
+        "GitObjectID",
+        "ID",
+        "String",
+    ),
+    "create_check_suite_payload": (
+        "CheckSuite",
+        "String",
+    ),
+    "create_commit_on_branch_input": (
+        "CommitMessage",
+        "CommittableBranch",
+        "FileChanges",
+        "GitObjectID",
+        "String",
+    ),
+    "create_commit_on_branch_payload": (
+        "Commit",
+        "Ref",
+        "String",
+    ),
+    "create_deployment_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "create_deployment_payload": (
+        "Boolean",
+        "Deployment",
+        "String",
+    ),
+    "create_deployment_status_input": (
+        "Boolean",
+        "DeploymentStatusState",
+        "ID",
+        "String",
+    ),
+    "create_deployment_status_payload": (
+        "DeploymentStatus",
+        "String",
+    ),
+    "create_discussion_input": (
+        "ID",
+        "String",
+    ),
+    "create_discussion_payload": (
+        "Discussion",
+        "String",
+    ),
+    "create_enterprise_organization_input": (
+        "ID",
+        "String",
+    ),
+    "create_enterprise_organization_payload": (
+        "Enterprise",
+        "Organization",
+        "String",
+    ),
+    "create_environment_input": (
+        "ID",
+        "String",
+    ),
+    "create_environment_payload": (
+        "Environment",
+        "String",
+    ),
+    "create_ip_allow_list_entry_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "create_ip_allow_list_entry_payload": (
+        "IpAllowListEntry",
+        "String",
+    ),
+    "create_issue_input": (
+        "ID",
+        "String",
+    ),
+    "create_issue_payload": (
+        "Issue",
+        "String",
+    ),
+    "create_label_input": (
+        "ID",
+        "String",
+    ),
+    "create_label_payload": (
+        "Label",
+        "String",
+    ),
+    "create_linked_branch_input": (
+        "GitObjectID",
+        "ID",
+        "String",
+    ),
+    "create_linked_branch_payload": (
+        "Issue",
+        "LinkedBranch",
+        "String",
+    ),
+    "create_migration_source_input": (
+        "ID",
+        "MigrationSourceType",
+        "String",
+    ),
+    "create_migration_source_payload": (
+        "MigrationSource",
+        "String",
+    ),
+    "create_project_input": (
+        "ID",
+        "ProjectTemplate",
+        "String",
+    ),
+    "create_project_payload": (
+        "Project",
+        "String",
+    ),
+    "create_project_v2_field_input": (
+        "ID",
+        "ProjectV2CustomFieldType",
+        "ProjectV2SingleSelectFieldOptionInput",
+        "String",
+    ),
+    "create_project_v2_field_payload": (
+        "ProjectV2Field",
+        "ProjectV2FieldConfiguration",
+        "ProjectV2IterationField",
+        "ProjectV2SingleSelectField",
+        "String",
+    ),
+    "create_project_v2_input": (
+        "ID",
+        "String",
+    ),
+    "create_project_v2_payload": (
+        "ProjectV2",
+        "String",
+    ),
+    "create_pull_request_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "create_pull_request_payload": (
+        "PullRequest",
+        "String",
+    ),
+    "create_ref_input": (
+        "GitObjectID",
+        "ID",
+        "String",
+    ),
+    "create_ref_payload": (
+        "Ref",
+        "String",
+    ),
+    "create_repository_input": (
+        "Boolean",
+        "ID",
+        "RepositoryVisibility",
+        "String",
+        "URI",
+    ),
+    "create_repository_payload": (
+        "Repository",
+        "String",
+    ),
+    "create_repository_ruleset_input": (
+        "ID",
+        "RepositoryRuleConditionsInput",
+        "RepositoryRuleInput",
+        "RepositoryRulesetBypassActorInput",
+        "RepositoryRulesetTarget",
+        "RuleEnforcement",
+        "String",
+    ),
+    "create_repository_ruleset_payload": (
+        "RepositoryRuleset",
+        "String",
+    ),
+    "create_sponsors_listing_input": (
+        "SponsorsCountryOrRegionCode",
+        "String",
+    ),
+    "create_sponsors_listing_payload": (
+        "SponsorsListing",
+        "String",
+    ),
+    "create_sponsors_tier_input": (
+        "Boolean",
+        "ID",
+        "Int",
+        "String",
+    ),
+    "create_sponsors_tier_payload": (
+        "SponsorsTier",
+        "String",
+    ),
+    "create_sponsorship_input": (
+        "Boolean",
+        "ID",
+        "Int",
+        "SponsorshipPrivacy",
+        "String",
+    ),
+    "create_sponsorship_payload": (
+        "Sponsorship",
+        "String",
+    ),
+    "create_sponsorships_input": (
+        "Boolean",
+        "BulkSponsorship",
+        "SponsorshipPrivacy",
+        "String",
+    ),
+    "create_sponsorships_payload": (
+        "Sponsorable",
+        "String",
+    ),
+    "create_team_discussion_comment_input": (
+        "ID",
+        "String",
+    ),
+    "create_team_discussion_comment_payload": (
+        "String",
+        "TeamDiscussionComment",
+    ),
+    "create_team_discussion_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "create_team_discussion_payload": (
+        "String",
+        "TeamDiscussion",
+    ),
+    "create_user_list_input": (
+        "Boolean",
+        "String",
+    ),
+    "create_user_list_payload": (
+        "String",
+        "User",
+        "UserList",
+    ),
+    "cvss": (
+        "Float",
+        "String",
+    ),
+    "cwe": (
+        "ID",
+        "String",
+    ),
+    "cweconnection": (
+        "CWE",
+        "CWEEdge",
+        "Int",
+        "PageInfo",
+    ),
+    "cweedge": (
+        "CWE",
+        "String",
+    ),
+    "decline_topic_suggestion_input": (
+        "ID",
+        "String",
+        "TopicSuggestionDeclineReason",
+    ),
+    "decline_topic_suggestion_payload": (
+        "String",
+        "Topic",
+    ),
+    "deletable": (
+        "Boolean",
+    ),
+    "delete_branch_protection_rule_input": (
+        "ID",
+        "String",
+    ),
+    "delete_branch_protection_rule_payload": (
+        "String",
+    ),
+    "delete_deployment_input": (
+        "ID",
+        "String",
+    ),
+    "delete_deployment_payload": (
+        "String",
+    ),
+    "delete_discussion_comment_input": (
+        "ID",
+        "String",
+    ),
+    "delete_discussion_comment_payload": (
+        "DiscussionComment",
+        "String",
+    ),
+    "delete_discussion_input": (
+        "ID",
+        "String",
+    ),
+    "delete_discussion_payload": (
+        "Discussion",
+        "String",
+    ),
+    "delete_environment_input": (
+        "ID",
+        "String",
+    ),
+    "delete_environment_payload": (
+        "String",
+    ),
+    "delete_ip_allow_list_entry_input": (
+        "ID",
+        "String",
+    ),
+    "delete_ip_allow_list_entry_payload": (
+        "IpAllowListEntry",
+        "String",
+    ),
+    "delete_issue_comment_input": (
+        "ID",
+        "String",
+    ),
+    "delete_issue_comment_payload": (
+        "String",
+    ),
+    "delete_issue_input": (
+        "ID",
+        "String",
+    ),
+    "delete_issue_payload": (
+        "Repository",
+        "String",
+    ),
+    "delete_label_input": (
+        "ID",
+        "String",
+    ),
+    "delete_label_payload": (
+        "String",
+    ),
+    "delete_linked_branch_input": (
+        "ID",
+        "String",
+    ),
+    "delete_linked_branch_payload": (
+        "Issue",
+        "String",
+    ),
+    "delete_package_version_input": (
+        "ID",
+        "String",
+    ),
+    "delete_package_version_payload": (
+        "Boolean",
+        "String",
+    ),
+    "delete_project_card_input": (
+        "ID",
+        "String",
+    ),
+    "delete_project_card_payload": (
+        "ID",
+        "ProjectColumn",
+        "String",
+    ),
+    "delete_project_column_input": (
+        "ID",
+        "String",
+    ),
+    "delete_project_column_payload": (
+        "ID",
+        "Project",
+        "String",
+    ),
+    "delete_project_input": (
+        "ID",
+        "String",
+    ),
+    "delete_project_payload": (
+        "ProjectOwner",
+        "String",
+    ),
+    "delete_project_v2_field_input": (
+        "ID",
+        "String",
+    ),
+    "delete_project_v2_field_payload": (
+        "ProjectV2Field",
+        "ProjectV2FieldConfiguration",
+        "ProjectV2IterationField",
+        "ProjectV2SingleSelectField",
+        "String",
+    ),
+    "delete_project_v2_input": (
+        "ID",
+        "String",
+    ),
+    "delete_project_v2_item_input": (
+        "ID",
+        "String",
+    ),
+    "delete_project_v2_item_payload": (
+        "ID",
+        "String",
+    ),
+    "delete_project_v2_payload": (
+        "ProjectV2",
+        "String",
+    ),
+    "delete_project_v2_workflow_input": (
+        "ID",
+        "String",
+    ),
+    "delete_project_v2_workflow_payload": (
+        "ID",
+        "ProjectV2",
+        "String",
+    ),
+    "delete_pull_request_review_comment_input": (
+        "ID",
+        "String",
+    ),
+    "delete_pull_request_review_comment_payload": (
+        "PullRequestReview",
+        "PullRequestReviewComment",
+        "String",
+    ),
+    "delete_pull_request_review_input": (
+        "ID",
+        "String",
+    ),
+    "delete_pull_request_review_payload": (
+        "PullRequestReview",
+        "String",
+    ),
+    "delete_ref_input": (
+        "ID",
+        "String",
+    ),
+    "delete_ref_payload": (
+        "String",
+    ),
+    "delete_repository_ruleset_input": (
+        "ID",
+        "String",
+    ),
+    "delete_repository_ruleset_payload": (
+        "String",
+    ),
+    "delete_team_discussion_comment_input": (
+        "ID",
+        "String",
+    ),
+    "delete_team_discussion_comment_payload": (
+        "String",
+    ),
+    "delete_team_discussion_input": (
+        "ID",
+        "String",
+    ),
+    "delete_team_discussion_payload": (
+        "String",
+    ),
+    "delete_user_list_input": (
+        "ID",
+        "String",
+    ),
+    "delete_user_list_payload": (
+        "String",
+        "User",
+    ),
+    "delete_verifiable_domain_input": (
+        "ID",
+        "String",
+    ),
+    "delete_verifiable_domain_payload": (
+        "Enterprise",
+        "Organization",
+        "String",
+        "VerifiableDomainOwner",
+    ),
+    "dependabot_update_error": (
+        "String",
+    ),
+    "deploy_key": (
+        "Boolean",
+        "DateTime",
+        "ID",
+        "String",
+    ),
+    "deploy_key_connection": (
+        "DeployKey",
+        "DeployKeyEdge",
+        "Int",
+        "PageInfo",
+    ),
+    "deploy_key_edge": (
+        "DeployKey",
+        "String",
+    ),
+    "deployment_order": (
+        "DeploymentOrderField",
+        "OrderDirection",
+    ),
+    "dequeue_pull_request_input": (
+        "ID",
+        "String",
+    ),
+    "dequeue_pull_request_payload": (
+        "MergeQueueEntry",
+        "String",
+    ),
+    "disable_pull_request_auto_merge_input": (
+        "ID",
+        "String",
+    ),
+    "disable_pull_request_auto_merge_payload": (
+        "Actor",
+        "PullRequest",
+        "String",
+    ),
+    "discussion_order": (
+        "DiscussionOrderField",
+        "OrderDirection",
+    ),
+    "discussion_poll_option_order": (
+        "DiscussionPollOptionOrderField",
+        "OrderDirection",
+    ),
+    "dismiss_pull_request_review_input": (
+        "ID",
+        "String",
+    ),
+    "dismiss_pull_request_review_payload": (
+        "PullRequestReview",
+        "String",
+    ),
+    "dismiss_repository_vulnerability_alert_input": (
+        "DismissReason",
+        "ID",
+        "String",
+    ),
+    "dismiss_repository_vulnerability_alert_payload": (
+        "RepositoryVulnerabilityAlert",
+        "String",
+    ),
+    "draft_pull_request_review_comment": (
+        "Int",
+        "String",
+    ),
+    "draft_pull_request_review_thread": (
+        "DiffSide",
+        "Int",
+        "String",
+    ),
+    "enable_pull_request_auto_merge_input": (
+        "GitObjectID",
+        "ID",
+        "PullRequestMergeMethod",
+        "String",
+    ),
+    "enable_pull_request_auto_merge_payload": (
+        "Actor",
+        "PullRequest",
+        "String",
+    ),
+    "enqueue_pull_request_input": (
+        "Boolean",
+        "GitObjectID",
+        "ID",
+        "String",
+    ),
+    "enqueue_pull_request_payload": (
+        "MergeQueueEntry",
+        "String",
+    ),
+    "enterprise_administrator_invitation_order": (
+        "EnterpriseAdministratorInvitationOrderField",
+        "OrderDirection",
+    ),
+    "enterprise_audit_entry_data": (
+        "String",
+        "URI",
+    ),
+    "enterprise_billing_info": (
+        "Float",
+        "Int",
+    ),
+    "enterprise_member_order": (
+        "EnterpriseMemberOrderField",
+        "OrderDirection",
+    ),
+    "enterprise_order": (
+        "EnterpriseOrderField",
+        "OrderDirection",
+    ),
+    "enterprise_repository_info": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "enterprise_repository_info_connection": (
+        "EnterpriseRepositoryInfo",
+        "EnterpriseRepositoryInfoEdge",
+        "Int",
+        "PageInfo",
+    ),
+    "enterprise_repository_info_edge": (
+        "EnterpriseRepositoryInfo",
+        "String",
+    ),
+    "enterprise_server_installation_order": (
+        "EnterpriseServerInstallationOrderField",
+        "OrderDirection",
+    ),
+    "enterprise_server_user_account_email_order": (
+        "EnterpriseServerUserAccountEmailOrderField",
+        "OrderDirection",
+    ),
+    "enterprise_server_user_account_order": (
+        "EnterpriseServerUserAccountOrderField",
+        "OrderDirection",
+    ),
+    "enterprise_server_user_accounts_upload_order": (
+        "EnterpriseServerUserAccountsUploadOrderField",
+        "OrderDirection",
+    ),
+    "enums": (),
+    "environments": (
+        "EnvironmentOrderField",
+        "OrderDirection",
+    ),
+    "external_identity_attribute": (
+        "String",
+    ),
+    "external_identity_saml_attributes": (
+        "ExternalIdentityAttribute",
+        "String",
+        "UserEmailMetadata",
+    ),
+    "external_identity_scim_attributes": (
+        "String",
+        "UserEmailMetadata",
+    ),
+    "file_addition": (
+        "Base64String",
+        "String",
+    ),
+    "file_changes": (
+        "FileAddition",
+        "FileDeletion",
+    ),
+    "file_deletion": (
+        "String",
+    ),
+    "follow_organization_input": (
+        "ID",
+        "String",
+    ),
+    "follow_organization_payload": (
+        "Organization",
+        "String",
+    ),
+    "follow_user_input": (
+        "ID",
+        "String",
+    ),
+    "follow_user_payload": (
+        "String",
+        "User",
+    ),
+    "funding_link": (
+        "FundingPlatform",
+        "URI",
+    ),
+    "generic_hovercard_context": (
+        "String",
+    ),
+    "gist_file": (
+        "Boolean",
+        "Int",
+        "Language",
+        "String",
+    ),
+    "gist_order": (
+        "GistOrderField",
+        "OrderDirection",
+    ),
+    "git_hub_metadata": (
+        "Boolean",
+        "GitObjectID",
+        "String",
+    ),
+    "gpg_signature": (
+        "Boolean",
+        "GitSignatureState",
+        "String",
+        "User",
+    ),
+    "grant_enterprise_organizations_migrator_role_input": (
+        "ID",
+        "String",
+    ),
+    "grant_enterprise_organizations_migrator_role_payload": (
+        "OrganizationConnection",
+        "String",
+    ),
+    "grant_migrator_role_input": (
+        "ActorType",
+        "ID",
+        "String",
+    ),
+    "grant_migrator_role_payload": (
+        "Boolean",
+        "String",
+    ),
+    "hovercard": (
+        "HovercardContext",
+    ),
+    "hovercard_context": (
+        "String",
+    ),
+    "import_project_input": (
+        "Boolean",
+        "ProjectColumnImport",
+        "String",
+    ),
+    "import_project_payload": (
+        "Project",
+        "String",
+    ),
+    "invite_enterprise_admin_input": (
+        "EnterpriseAdministratorRole",
+        "ID",
+        "String",
+    ),
+    "invite_enterprise_admin_payload": (
+        "EnterpriseAdministratorInvitation",
+        "String",
+    ),
+    "ip_allow_list_entry_order": (
+        "IpAllowListEntryOrderField",
+        "OrderDirection",
+    ),
+    "issue_comment_order": (
+        "IssueCommentOrderField",
+        "OrderDirection",
+    ),
+    "issue_filters": (
+        "Boolean",
+        "DateTime",
+        "IssueState",
+        "String",
+    ),
+    "issue_order": (
+        "IssueOrderField",
+        "OrderDirection",
+    ),
+    "label_order": (
+        "LabelOrderField",
+        "OrderDirection",
+    ),
+    "language": (
+        "ID",
+        "String",
+    ),
+    "language_connection": (
+        "Int",
+        "Language",
+        "LanguageEdge",
+        "PageInfo",
+    ),
+    "language_edge": (
+        "Int",
+        "Language",
+        "String",
+    ),
+    "language_order": (
+        "LanguageOrderField",
+        "OrderDirection",
+    ),
+    "license": (
+        "Boolean",
+        "ID",
+        "LicenseRule",
+        "String",
+        "URI",
+    ),
+    "license_rule": (
+        "String",
+    ),
+    "link_project_v2_to_repository_input": (
+        "ID",
+        "String",
+    ),
+    "link_project_v2_to_repository_payload": (
+        "Repository",
+        "String",
+    ),
+    "link_project_v2_to_team_input": (
+        "ID",
+        "String",
+    ),
+    "link_project_v2_to_team_payload": (
+        "String",
+        "Team",
+    ),
+    "link_repository_to_project_input": (
+        "ID",
+        "String",
+    ),
+    "link_repository_to_project_payload": (
+        "Project",
+        "Repository",
+        "String",
+    ),
+    "lock_lockable_input": (
+        "ID",
+        "LockReason",
+        "String",
+    ),
+    "lock_lockable_payload": (
+        "Actor",
+        "Lockable",
+        "String",
+    ),
+    "lockable": (
+        "Boolean",
+        "LockReason",
+    ),
+    "locked_event": (
+        "Actor",
+        "DateTime",
+        "ID",
+        "LockReason",
+        "Lockable",
+    ),
+    "mannequin_order": (
+        "MannequinOrderField",
+        "OrderDirection",
+    ),
+    "mark_discussion_comment_as_answer_input": (
+        "ID",
+        "String",
+    ),
+    "mark_discussion_comment_as_answer_payload": (
+        "Discussion",
+        "String",
+    ),
+    "mark_file_as_viewed_input": (
+        "ID",
+        "String",
+    ),
+    "mark_file_as_viewed_payload": (
+        "PullRequest",
+        "String",
+    ),
+    "mark_project_v2_as_template_input": (
+        "ID",
+        "String",
+    ),
+    "mark_project_v2_as_template_payload": (
+        "ProjectV2",
+        "String",
+    ),
+    "mark_pull_request_ready_for_review_input": (
+        "ID",
+        "String",
+    ),
+    "mark_pull_request_ready_for_review_payload": (
+        "PullRequest",
+        "String",
+    ),
+    "marketplace_category": (
+        "ID",
+        "Int",
+        "String",
+        "URI",
+    ),
+    "marketplace_listing": (
+        "App",
+        "Boolean",
+        "HTML",
+        "ID",
+        "MarketplaceCategory",
+        "String",
+        "URI",
+    ),
+    "marketplace_listing_connection": (
+        "Int",
+        "MarketplaceListing",
+        "MarketplaceListingEdge",
+        "PageInfo",
+    ),
+    "marketplace_listing_edge": (
+        "MarketplaceListing",
+        "String",
+    ),
+    "member_feature_request_notification": (
+        "DateTime",
+        "ID",
+        "String",
+    ),
+    "mentioned_event": (
+        "Actor",
+        "DateTime",
+        "ID",
+        "Int",
+    ),
+    "merge_branch_input": (
+        "ID",
+        "String",
+    ),
+    "merge_branch_payload": (
+        "Commit",
+        "String",
+    ),
+    "merge_pull_request_input": (
+        "GitObjectID",
+        "ID",
+        "PullRequestMergeMethod",
+        "String",
+    ),
+    "merge_pull_request_payload": (
+        "Actor",
+        "PullRequest",
+        "String",
+    ),
+    "merge_queue_configuration": (
+        "Int",
+        "MergeQueueMergingStrategy",
+        "PullRequestMergeMethod",
+    ),
+    "migration": (
+        "Boolean",
+        "DateTime",
+        "ID",
+        "Int",
+        "MigrationSource",
+        "MigrationState",
+        "String",
+        "URI",
+    ),
+    "migration_source": (
+        "ID",
+        "MigrationSourceType",
+        "String",
+        "URI",
+    ),
+    "milestone_order": (
+        "MilestoneOrderField",
+        "OrderDirection",
+    ),
+    "minimizable": (
+        "Boolean",
+        "String",
+    ),
+    "minimize_comment_input": (
+        "ID",
+        "ReportedContentClassifiers",
+        "String",
+    ),
+    "minimize_comment_payload": (
+        "Minimizable",
+        "String",
+    ),
+    "move_project_card_input": (
+        "ID",
+        "String",
+    ),
+    "move_project_card_payload": (
+        "ProjectCardEdge",
+        "String",
+    ),
+    "move_project_column_input": (
+        "ID",
+        "String",
+    ),
+    "move_project_column_payload": (
+        "ProjectColumnEdge",
+        "String",
+    ),
+    "node": (
+        "ID",
+    ),
+    "oauth_application_audit_entry_data": (
+        "String",
+        "URI",
+    ),
+    "org_enterprise_owner_order": (
+        "OrderDirection",
+        "OrgEnterpriseOwnerOrderField",
+    ),
+    "organization_migration": (
+        "DateTime",
+        "ID",
+        "Int",
+        "OrganizationMigrationState",
+        "String",
+        "URI",
+    ),
+    "organization_order": (
+        "OrderDirection",
+        "OrganizationOrderField",
+    ),
+    "organization_teams_hovercard_context": (
+        "Int",
+        "String",
+        "TeamConnection",
+        "URI",
+    ),
+    "organizations_hovercard_context": (
+        "Int",
+        "OrganizationConnection",
+        "String",
+    ),
+    "package_file_order": (
+        "OrderDirection",
+        "PackageFileOrderField",
+    ),
+    "package_order": (
+        "OrderDirection",
+        "PackageOrderField",
+    ),
+    "package_statistics": (
+        "Int",
+    ),
+    "package_tag": (
+        "ID",
+        "PackageVersion",
+        "String",
+    ),
+    "package_version_order": (
+        "OrderDirection",
+        "PackageVersionOrderField",
+    ),
+    "package_version_statistics": (
+        "Int",
+    ),
+    "page_info": (
+        "Boolean",
+        "String",
+    ),
+    "pin_issue_input": (
+        "ID",
+        "String",
+    ),
+    "pin_issue_payload": (
+        "Issue",
+        "String",
+    ),
+    "project_card_import": (
+        "Int",
+        "String",
+    ),
+    "project_column_import": (
+        "Int",
+        "ProjectCardImport",
+        "String",
+    ),
+    "project_order": (
+        "OrderDirection",
+        "ProjectOrderField",
+    ),
+    "project_progress": (
+        "Boolean",
+        "Float",
+        "Int",
+    ),
+    "project_v2_actor_connection": (
+        "Int",
+        "PageInfo",
+        "ProjectV2Actor",
+        "ProjectV2ActorEdge",
+        "Team",
+        "User",
+    ),
+    "project_v2_actor_edge": (
+        "ProjectV2Actor",
+        "String",
+        "Team",
+        "User",
+    ),
+    "project_v2_collaborator": (
+        "ID",
+        "ProjectV2Roles",
+    ),
+    "project_v2_field_order": (
+        "OrderDirection",
+        "ProjectV2FieldOrderField",
+    ),
+    "project_v2_field_value": (
+        "Date",
+        "Float",
+        "String",
+    ),
+    "project_v2_filters": (
+        "ProjectV2State",
+    ),
+    "project_v2_item_field_value_order": (
+        "OrderDirection",
+        "ProjectV2ItemFieldValueOrderField",
+    ),
+    "project_v2_item_order": (
+        "OrderDirection",
+        "ProjectV2ItemOrderField",
+    ),
+    "project_v2_iteration_field_configuration": (
+        "Int",
+        "ProjectV2IterationFieldIteration",
+    ),
+    "project_v2_iteration_field_iteration": (
+        "Date",
+        "Int",
+        "String",
+    ),
+    "project_v2_order": (
+        "OrderDirection",
+        "ProjectV2OrderField",
+    ),
+    "project_v2_single_select_field_option": (
+        "ProjectV2SingleSelectFieldOptionColor",
+        "String",
+    ),
+    "project_v2_single_select_field_option_input": (
+        "ProjectV2SingleSelectFieldOptionColor",
+        "String",
+    ),
+    "project_v2_view_order": (
+        "OrderDirection",
+        "ProjectV2ViewOrderField",
+    ),
+    "project_v2_workflow_order": (
+        "OrderDirection",
+        "ProjectV2WorkflowsOrderField",
+    ),
+    "public_key": (
+        "Boolean",
+        "DateTime",
+        "ID",
+        "String",
+    ),
+    "public_key_connection": (
+        "Int",
+        "PageInfo",
+        "PublicKey",
+        "PublicKeyEdge",
+    ),
+    "public_key_edge": (
+        "PublicKey",
+        "String",
+    ),
+    "publish_sponsors_tier_input": (
+        "ID",
+        "String",
+    ),
+    "publish_sponsors_tier_payload": (
+        "SponsorsTier",
+        "String",
+    ),
+    "pull_request_changed_file": (
+        "FileViewedState",
+        "Int",
+        "PatchStatus",
+        "String",
+    ),
+    "pull_request_changed_file_connection": (
+        "Int",
+        "PageInfo",
+        "PullRequestChangedFile",
+        "PullRequestChangedFileEdge",
+    ),
+    "pull_request_changed_file_edge": (
+        "PullRequestChangedFile",
+        "String",
+    ),
+    "pull_request_order": (
+        "OrderDirection",
+        "PullRequestOrderField",
+    ),
+    "pull_request_parameters": (
+        "Boolean",
+        "Int",
+    ),
+    "pull_request_parameters_input": (
+        "Boolean",
+        "Int",
+    ),
+    "pull_request_thread": (
+        "Boolean",
+        "DiffSide",
+        "ID",
+        "Int",
+        "PullRequest",
+        "PullRequestReviewCommentConnection",
+        "PullRequestReviewThreadSubjectType",
+        "Repository",
+        "String",
+        "User",
+    ),
+    "rate_limit": (
+        "DateTime",
+        "Int",
+    ),
+    "reaction_order": (
+        "OrderDirection",
+        "ReactionOrderField",
+    ),
+    "ref_name_condition_target": (
+        "String",
+    ),
+    "ref_name_condition_target_input": (
+        "String",
+    ),
+    "ref_order": (
+        "OrderDirection",
+        "RefOrderField",
+    ),
+    "ref_update": (
+        "Boolean",
+        "GitObjectID",
+        "GitRefname",
+    ),
+    "ref_update_rule": (
+        "Boolean",
+        "Int",
+        "String",
+    ),
+    "regenerate_enterprise_identity_provider_recovery_codes_input": (
+        "ID",
+        "String",
+    ),
+    "regenerate_enterprise_identity_provider_recovery_codes_payload": (
+        "EnterpriseIdentityProvider",
+        "String",
+    ),
+    "regenerate_verifiable_domain_token_input": (
+        "ID",
+        "String",
+    ),
+    "regenerate_verifiable_domain_token_payload": (
+        "String",
+    ),
+    "reject_deployments_input": (
+        "ID",
+        "String",
+    ),
+    "reject_deployments_payload": (
+        "Deployment",
+        "String",
+    ),
+    "release_order": (
+        "OrderDirection",
+        "ReleaseOrderField",
+    ),
+    "remove_assignees_from_assignable_input": (
+        "ID",
+        "String",
+    ),
+    "remove_assignees_from_assignable_payload": (
+        "Assignable",
+        "String",
+    ),
+    "remove_enterprise_admin_input": (
+        "ID",
+        "String",
+    ),
+    "remove_enterprise_admin_payload": (
+        "Enterprise",
+        "String",
+        "User",
+    ),
+    "remove_enterprise_identity_provider_input": (
+        "ID",
+        "String",
+    ),
+    "remove_enterprise_identity_provider_payload": (
+        "EnterpriseIdentityProvider",
+        "String",
+    ),
+    "remove_enterprise_member_input": (
+        "ID",
+        "String",
+    ),
+    "remove_enterprise_member_payload": (
+        "Enterprise",
+        "String",
+        "User",
+    ),
+    "remove_enterprise_organization_input": (
+        "ID",
+        "String",
+    ),
+    "remove_enterprise_organization_payload": (
+        "Enterprise",
+        "Organization",
+        "String",
+        "User",
+    ),
+    "remove_enterprise_support_entitlement_input": (
+        "ID",
+        "String",
+    ),
+    "remove_enterprise_support_entitlement_payload": (
+        "String",
+    ),
+    "remove_labels_from_labelable_input": (
+        "ID",
+        "String",
+    ),
+    "remove_labels_from_labelable_payload": (
+        "Labelable",
+        "String",
+    ),
+    "remove_outside_collaborator_input": (
+        "ID",
+        "String",
+    ),
+    "remove_outside_collaborator_payload": (
+        "String",
+        "User",
+    ),
+    "remove_reaction_input": (
+        "ID",
+        "ReactionContent",
+        "String",
+    ),
+    "remove_reaction_payload": (
+        "Reactable",
+        "Reaction",
+        "ReactionGroup",
+        "String",
+    ),
+    "remove_star_input": (
+        "ID",
+        "String",
+    ),
+    "remove_star_payload": (
+        "Starrable",
+        "String",
+    ),
+    "remove_upvote_input": (
+        "ID",
+        "String",
+    ),
+    "remove_upvote_payload": (
+        "String",
+        "Votable",
+    ),
+    "reopen_discussion_input": (
+        "ID",
+        "String",
+    ),
+    "reopen_discussion_payload": (
+        "Discussion",
+        "String",
+    ),
+    "reopen_issue_input": (
+        "ID",
+        "String",
+    ),
+    "reopen_issue_payload": (
+        "Issue",
+        "String",
+    ),
+    "reopen_pull_request_input": (
+        "ID",
+        "String",
+    ),
+    "reopen_pull_request_payload": (
+        "PullRequest",
+        "String",
+    ),
+    "reopened_event": (
+        "Actor",
+        "Closable",
+        "DateTime",
+        "ID",
+        "IssueStateReason",
+    ),
+    "repository_codeowners": (
+        "RepositoryCodeownersError",
+    ),
+    "repository_codeowners_error": (
+        "Int",
+        "String",
+    ),
+    "repository_contact_link": (
+        "String",
+        "URI",
+    ),
+    "repository_id_condition_target": (
+        "ID",
+    ),
+    "repository_id_condition_target_input": (
+        "ID",
+    ),
+    "repository_interaction_ability": (
+        "DateTime",
+        "RepositoryInteractionLimit",
+        "RepositoryInteractionLimitOrigin",
+    ),
+    "repository_invitation_order": (
+        "OrderDirection",
+        "RepositoryInvitationOrderField",
+    ),
+    "repository_migration": (
+        "Boolean",
+        "DateTime",
+        "ID",
+        "Int",
+        "MigrationSource",
+        "MigrationState",
+        "String",
+        "URI",
+    ),
+    "repository_migration_connection": (
+        "Int",
+        "PageInfo",
+        "RepositoryMigration",
+        "RepositoryMigrationEdge",
+    ),
+    "repository_migration_edge": (
+        "RepositoryMigration",
+        "String",
+    ),
+    "repository_migration_order": (
+        "RepositoryMigrationOrderDirection",
+        "RepositoryMigrationOrderField",
+    ),
+    "repository_name_condition_target": (
+        "Boolean",
+        "String",
+    ),
+    "repository_name_condition_target_input": (
+        "Boolean",
+        "String",
+    ),
+    "repository_order": (
+        "OrderDirection",
+        "RepositoryOrderField",
+    ),
+    "repository_rule_conditions": (
+        "RefNameConditionTarget",
+        "RepositoryIdConditionTarget",
+        "RepositoryNameConditionTarget",
+    ),
+    "repository_rule_conditions_input": (
+        "RefNameConditionTargetInput",
+        "RepositoryIdConditionTargetInput",
+        "RepositoryNameConditionTargetInput",
+    ),
+    "repository_rule_input": (
+        "ID",
+        "RepositoryRuleType",
+        "RuleParametersInput",
+    ),
+    "repository_ruleset_bypass_actor_input": (
+        "Boolean",
+        "ID",
+        "Int",
+        "RepositoryRulesetBypassActorBypassMode",
+    ),
+    "request_reviews_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "request_reviews_payload": (
+        "Actor",
+        "PullRequest",
+        "String",
+        "UserEdge",
+    ),
+    "requirable_by_pull_request": (
+        "Boolean",
+    ),
+    "required_deployments_parameters": (
+        "String",
+    ),
+    "required_deployments_parameters_input": (
+        "String",
+    ),
+    "required_status_check_input": (
+        "ID",
+        "String",
+    ),
+    "required_status_checks_parameters": (
+        "Boolean",
+        "StatusCheckConfiguration",
+    ),
+    "required_status_checks_parameters_input": (
+        "Boolean",
+        "StatusCheckConfigurationInput",
+    ),
+    "rerequest_check_suite_input": (
+        "ID",
+        "String",
+    ),
+    "rerequest_check_suite_payload": (
+        "CheckSuite",
+        "String",
+    ),
+    "resolve_review_thread_input": (
+        "ID",
+        "String",
+    ),
+    "resolve_review_thread_payload": (
+        "PullRequestReviewThread",
+        "String",
+    ),
+    "retire_sponsors_tier_input": (
+        "ID",
+        "String",
+    ),
+    "retire_sponsors_tier_payload": (
+        "SponsorsTier",
+        "String",
+    ),
+    "revert_pull_request_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "revert_pull_request_payload": (
+        "PullRequest",
+        "String",
+    ),
+    "review_status_hovercard_context": (
+        "PullRequestReviewDecision",
+        "String",
+    ),
+    "revoke_enterprise_organizations_migrator_role_input": (
+        "ID",
+        "String",
+    ),
+    "revoke_enterprise_organizations_migrator_role_payload": (
+        "OrganizationConnection",
+        "String",
+    ),
+    "revoke_migrator_role_input": (
+        "ActorType",
+        "ID",
+        "String",
+    ),
+    "revoke_migrator_role_payload": (
+        "Boolean",
+        "String",
+    ),
+    "rule_parameters_input": (
+        "BranchNamePatternParametersInput",
+        "CommitAuthorEmailPatternParametersInput",
+        "CommitMessagePatternParametersInput",
+        "CommitterEmailPatternParametersInput",
+        "PullRequestParametersInput",
+        "RequiredDeploymentsParametersInput",
+        "RequiredStatusChecksParametersInput",
+        "TagNamePatternParametersInput",
+        "UpdateParametersInput",
+        "WorkflowsParametersInput",
+    ),
+    "saved_reply": (
+        "Actor",
+        "HTML",
+        "ID",
+        "Int",
+        "String",
+    ),
+    "saved_reply_connection": (
+        "Int",
+        "PageInfo",
+        "SavedReply",
+        "SavedReplyEdge",
+    ),
+    "saved_reply_edge": (
+        "SavedReply",
+        "String",
+    ),
+    "saved_reply_order": (
+        "OrderDirection",
+        "SavedReplyOrderField",
+    ),
+    "scalars": (),
+    "search_result_item_connection": (
+        "App",
+        "Discussion",
+        "Int",
+        "Issue",
+        "MarketplaceListing",
+        "Organization",
+        "PageInfo",
+        "PullRequest",
+        "Repository",
+        "SearchResultItem",
+        "SearchResultItemEdge",
+        "User",
+    ),
+    "search_result_item_edge": (
+        "App",
+        "Discussion",
+        "Issue",
+        "MarketplaceListing",
+        "Organization",
+        "PullRequest",
+        "Repository",
+        "SearchResultItem",
+        "String",
+        "TextMatch",
+        "User",
+    ),
+    "security_advisory": (
+        "CVSS",
+        "CWEConnection",
+        "DateTime",
+        "ID",
+        "Int",
+        "SecurityAdvisoryClassification",
+        "SecurityAdvisoryIdentifier",
+        "SecurityAdvisoryReference",
+        "SecurityAdvisorySeverity",
+        "SecurityVulnerabilityConnection",
+        "String",
+        "URI",
+    ),
+    "security_advisory_connection": (
+        "Int",
+        "PageInfo",
+        "SecurityAdvisory",
+        "SecurityAdvisoryEdge",
+    ),
+    "security_advisory_edge": (
+        "SecurityAdvisory",
+        "String",
+    ),
+    "security_advisory_identifier": (
+        "String",
+    ),
+    "security_advisory_identifier_filter": (
+        "SecurityAdvisoryIdentifierType",
+        "String",
+    ),
+    "security_advisory_order": (
+        "OrderDirection",
+        "SecurityAdvisoryOrderField",
+    ),
+    "security_advisory_package": (
+        "SecurityAdvisoryEcosystem",
+        "String",
+    ),
+    "security_advisory_package_version": (
+        "String",
+    ),
+    "security_advisory_reference": (
+        "URI",
+    ),
+    "security_vulnerability": (
+        "DateTime",
+        "SecurityAdvisory",
+        "SecurityAdvisoryPackage",
+        "SecurityAdvisoryPackageVersion",
+        "SecurityAdvisorySeverity",
+        "String",
+    ),
+    "security_vulnerability_connection": (
+        "Int",
+        "PageInfo",
+        "SecurityVulnerability",
+        "SecurityVulnerabilityEdge",
+    ),
+    "security_vulnerability_edge": (
+        "SecurityVulnerability",
+        "String",
+    ),
+    "security_vulnerability_order": (
+        "OrderDirection",
+        "SecurityVulnerabilityOrderField",
+    ),
+    "set_enterprise_identity_provider_input": (
+        "ID",
+        "SamlDigestAlgorithm",
+        "SamlSignatureAlgorithm",
+        "String",
+        "URI",
+    ),
+    "set_enterprise_identity_provider_payload": (
+        "EnterpriseIdentityProvider",
+        "String",
+    ),
+    "set_organization_interaction_limit_input": (
+        "ID",
+        "RepositoryInteractionLimit",
+        "RepositoryInteractionLimitExpiry",
+        "String",
+    ),
+    "set_organization_interaction_limit_payload": (
+        "Organization",
+        "String",
+    ),
+    "set_repository_interaction_limit_input": (
+        "ID",
+        "RepositoryInteractionLimit",
+        "RepositoryInteractionLimitExpiry",
+        "String",
+    ),
+    "set_repository_interaction_limit_payload": (
+        "Repository",
+        "String",
+    ),
+    "set_user_interaction_limit_input": (
+        "ID",
+        "RepositoryInteractionLimit",
+        "RepositoryInteractionLimitExpiry",
+        "String",
+    ),
+    "set_user_interaction_limit_payload": (
+        "String",
+        "User",
+    ),
+    "smime_signature": (
+        "Boolean",
+        "GitSignatureState",
+        "String",
+        "User",
+    ),
+    "social_account": (
+        "SocialAccountProvider",
+        "String",
+        "URI",
+    ),
+    "social_account_connection": (
+        "Int",
+        "PageInfo",
+        "SocialAccount",
+        "SocialAccountEdge",
+    ),
+    "social_account_edge": (
+        "SocialAccount",
+        "String",
+    ),
+    "sponsor_order": (
+        "OrderDirection",
+        "SponsorOrderField",
+    ),
+    "sponsorable_item_connection": (
+        "Int",
+        "Organization",
+        "PageInfo",
+        "SponsorableItem",
+        "SponsorableItemEdge",
+        "User",
+    ),
+    "sponsorable_item_edge": (
+        "Organization",
+        "SponsorableItem",
+        "String",
+        "User",
+    ),
+    "sponsorable_order": (
+        "OrderDirection",
+        "SponsorableOrderField",
+    ),
+    "sponsors_activity_order": (
+        "OrderDirection",
+        "SponsorsActivityOrderField",
+    ),
+    "sponsors_goal": (
+        "Int",
+        "SponsorsGoalKind",
+        "String",
+    ),
+    "sponsors_tier_order": (
+        "OrderDirection",
+        "SponsorsTierOrderField",
+    ),
+    "sponsorship_newsletter_order": (
+        "OrderDirection",
+        "SponsorshipNewsletterOrderField",
+    ),
+    "sponsorship_order": (
+        "OrderDirection",
+        "SponsorshipOrderField",
+    ),
+    "ssh_signature": (
+        "Boolean",
+        "GitSignatureState",
+        "String",
+        "User",
+    ),
+    "star_order": (
+        "OrderDirection",
+        "StarOrderField",
+    ),
+    "start_organization_migration_input": (
+        "ID",
+        "String",
+        "URI",
+    ),
+    "start_organization_migration_payload": (
+        "OrganizationMigration",
+        "String",
+    ),
+    "start_repository_migration_input": (
+        "Boolean",
+        "ID",
+        "String",
+        "URI",
+    ),
+    "start_repository_migration_payload": (
+        "RepositoryMigration",
+        "String",
+    ),
+    "status_check_configuration": (
+        "Int",
+        "String",
+    ),
+    "status_check_configuration_input": (
+        "Int",
+        "String",
+    ),
+    "status_context_state_count": (
+        "Int",
+        "StatusState",
+    ),
+    "submit_pull_request_review_input": (
+        "ID",
+        "PullRequestReviewEvent",
+        "String",
+    ),
+    "submit_pull_request_review_payload": (
+        "PullRequestReview",
+        "String",
+    ),
+    "submodule": (
+        "Base64String",
+        "GitObjectID",
+        "String",
+        "URI",
+    ),
+    "submodule_connection": (
+        "Int",
+        "PageInfo",
+        "Submodule",
+        "SubmoduleEdge",
+    ),
+    "submodule_edge": (
+        "String",
+        "Submodule",
+    ),
+    "subscribable": (
+        "Boolean",
+        "ID",
+        "SubscriptionState",
+    ),
+    "subscribable_thread": (
+        "ID",
+        "ThreadSubscriptionFormAction",
+        "ThreadSubscriptionState",
+    ),
+    "subscribed_event": (
+        "Actor",
+        "DateTime",
+        "ID",
+        "Subscribable",
+    ),
+    "tag": (
+        "GitActor",
+        "GitObjectID",
+        "ID",
+        "Repository",
+        "String",
+        "URI",
+    ),
+    "tag_name_pattern_parameters": (
+        "Boolean",
+        "String",
+    ),
+    "tag_name_pattern_parameters_input": (
+        "Boolean",
+        "String",
+    ),
+    "team_discussion_comment_order": (
+        "OrderDirection",
+        "TeamDiscussionCommentOrderField",
+    ),
+    "team_discussion_order": (
+        "OrderDirection",
+        "TeamDiscussionOrderField",
+    ),
+    "team_member_order": (
+        "OrderDirection",
+        "TeamMemberOrderField",
+    ),
+    "team_order": (
+        "OrderDirection",
+        "TeamOrderField",
+    ),
+    "team_repository_order": (
+        "OrderDirection",
+        "TeamRepositoryOrderField",
+    ),
+    "text_match": (
+        "String",
+        "TextMatchHighlight",
+    ),
+    "text_match_highlight": (
+        "Int",
+        "String",
+    ),
+    "transfer_enterprise_organization_input": (
+        "ID",
+        "String",
+    ),
+    "transfer_enterprise_organization_payload": (
+        "Organization",
+        "String",
+    ),
+    "transfer_issue_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "transfer_issue_payload": (
+        "Issue",
+        "String",
+    ),
+    "unarchive_project_v2_item_input": (
+        "ID",
+        "String",
+    ),
+    "unarchive_project_v2_item_payload": (
+        "ProjectV2Item",
+        "String",
+    ),
+    "unarchive_repository_input": (
+        "ID",
+        "String",
+    ),
+    "unarchive_repository_payload": (
+        "Repository",
+        "String",
+    ),
+    "unfollow_organization_input": (
+        "ID",
+        "String",
+    ),
+    "unfollow_organization_payload": (
+        "Organization",
+        "String",
+    ),
+    "unfollow_user_input": (
+        "ID",
+        "String",
+    ),
+    "unfollow_user_payload": (
+        "String",
+        "User",
+    ),
+    "uniform_resource_locatable": (
+        "URI",
+    ),
+    "unions": (),
+    "unknown_signature": (
+        "Boolean",
+        "GitSignatureState",
+        "String",
+        "User",
+    ),
+    "unlink_project_v2_from_repository_input": (
+        "ID",
+        "String",
+    ),
+    "unlink_project_v2_from_repository_payload": (
+        "Repository",
+        "String",
+    ),
+    "unlink_project_v2_from_team_input": (
+        "ID",
+        "String",
+    ),
+    "unlink_project_v2_from_team_payload": (
+        "String",
+        "Team",
+    ),
+    "unlink_repository_from_project_input": (
+        "ID",
+        "String",
+    ),
+    "unlink_repository_from_project_payload": (
+        "Project",
+        "Repository",
+        "String",
+    ),
+    "unlock_lockable_input": (
+        "ID",
+        "String",
+    ),
+    "unlock_lockable_payload": (
+        "Actor",
+        "Lockable",
+        "String",
+    ),
+    "unlocked_event": (
+        "Actor",
+        "DateTime",
+        "ID",
+        "Lockable",
+    ),
+    "unmark_discussion_comment_as_answer_input": (
+        "ID",
+        "String",
+    ),
+    "unmark_discussion_comment_as_answer_payload": (
+        "Discussion",
+        "String",
+    ),
+    "unmark_file_as_viewed_input": (
+        "ID",
+        "String",
+    ),
+    "unmark_file_as_viewed_payload": (
+        "PullRequest",
+        "String",
+    ),
+    "unmark_issue_as_duplicate_input": (
+        "ID",
+        "String",
+    ),
+    "unmark_issue_as_duplicate_payload": (
+        "Issue",
+        "IssueOrPullRequest",
+        "PullRequest",
+        "String",
+    ),
+    "unmark_project_v2_as_template_input": (
+        "ID",
+        "String",
+    ),
+    "unmark_project_v2_as_template_payload": (
+        "ProjectV2",
+        "String",
+    ),
+    "unminimize_comment_input": (
+        "ID",
+        "String",
+    ),
+    "unminimize_comment_payload": (
+        "Minimizable",
+        "String",
+    ),
+    "unpin_issue_input": (
+        "ID",
+        "String",
+    ),
+    "unpin_issue_payload": (
+        "Issue",
+        "String",
+    ),
+    "unresolve_review_thread_input": (
+        "ID",
+        "String",
+    ),
+    "unresolve_review_thread_payload": (
+        "PullRequestReviewThread",
+        "String",
+    ),
+    "unsubscribe_from_notifications_input": (
+        "ID",
+        "String",
+    ),
+    "unsubscribe_from_notifications_payload": (
+        "Boolean",
+        "String",
+    ),
+    "unsubscribed_event": (
+        "Actor",
+        "DateTime",
+        "ID",
+        "Subscribable",
+    ),
+    "updatable": (
+        "Boolean",
+    ),
+    "updatable_comment": (
+        "CommentCannotUpdateReason",
+    ),
+    "update_branch_protection_rule_input": (
+        "Boolean",
+        "ID",
+        "Int",
+        "RequiredStatusCheckInput",
+        "String",
+    ),
+    "update_branch_protection_rule_payload": (
+        "BranchProtectionRule",
+        "String",
+    ),
+    "update_check_run_input": (
+        "CheckConclusionState",
+        "CheckRunAction",
+        "CheckRunOutput",
+        "DateTime",
+        "ID",
+        "RequestableCheckStatusState",
+        "String",
+        "URI",
+    ),
+    "update_check_run_payload": (
+        "CheckRun",
+        "String",
+    ),
+    "update_check_suite_preferences_input": (
+        "CheckSuiteAutoTriggerPreference",
+        "ID",
+        "String",
+    ),
+    "update_check_suite_preferences_payload": (
+        "Repository",
+        "String",
+    ),
+    "update_discussion_comment_input": (
+        "ID",
+        "String",
+    ),
+    "update_discussion_comment_payload": (
+        "DiscussionComment",
+        "String",
+    ),
+    "update_discussion_input": (
+        "ID",
+        "String",
+    ),
+    "update_discussion_payload": (
+        "Discussion",
+        "String",
+    ),
+    "update_enterprise_administrator_role_input": (
+        "EnterpriseAdministratorRole",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_administrator_role_payload": (
+        "String",
+    ),
+    "update_enterprise_allow_private_repository_forking_setting_input": (
+        "EnterpriseAllowPrivateRepositoryForkingPolicyValue",
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_allow_private_repository_forking_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_default_repository_permission_setting_input": (
+        "EnterpriseDefaultRepositoryPermissionSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_default_repository_permission_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_members_can_change_repository_visibility_setting_input": (
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_members_can_change_repository_visibility_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_members_can_create_repositories_setting_input": (
+        "Boolean",
+        "EnterpriseMembersCanCreateRepositoriesSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_members_can_create_repositories_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_members_can_delete_issues_setting_input": (
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_members_can_delete_issues_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_members_can_delete_repositories_setting_input": (
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_members_can_delete_repositories_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_members_can_invite_collaborators_setting_input": (
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_members_can_invite_collaborators_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_members_can_make_purchases_setting_input": (
+        "EnterpriseMembersCanMakePurchasesSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_members_can_make_purchases_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_members_can_update_protected_branches_setting_input": (
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_members_can_update_protected_branches_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_members_can_view_dependency_insights_setting_input": (
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_members_can_view_dependency_insights_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_organization_projects_setting_input": (
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_organization_projects_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_owner_organization_role_input": (
+        "ID",
+        "RoleInOrganization",
+        "String",
+    ),
+    "update_enterprise_owner_organization_role_payload": (
+        "String",
+    ),
+    "update_enterprise_profile_input": (
+        "ID",
+        "String",
+    ),
+    "update_enterprise_profile_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_repository_projects_setting_input": (
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_repository_projects_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_team_discussions_setting_input": (
+        "EnterpriseEnabledDisabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_team_discussions_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_enterprise_two_factor_authentication_required_setting_input": (
+        "EnterpriseEnabledSettingValue",
+        "ID",
+        "String",
+    ),
+    "update_enterprise_two_factor_authentication_required_setting_payload": (
+        "Enterprise",
+        "String",
+    ),
+    "update_environment_input": (
+        "Boolean",
+        "ID",
+        "Int",
+        "String",
+    ),
+    "update_environment_payload": (
+        "Environment",
+        "String",
+    ),
+    "update_ip_allow_list_enabled_setting_input": (
+        "ID",
+        "IpAllowListEnabledSettingValue",
+        "String",
+    ),
+    "update_ip_allow_list_enabled_setting_payload": (
+        "App",
+        "Enterprise",
+        "IpAllowListOwner",
+        "Organization",
+        "String",
+    ),
+    "update_ip_allow_list_entry_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "update_ip_allow_list_entry_payload": (
+        "IpAllowListEntry",
+        "String",
+    ),
+    "update_ip_allow_list_for_installed_apps_enabled_setting_input": (
+        "ID",
+        "IpAllowListForInstalledAppsEnabledSettingValue",
+        "String",
+    ),
+    "update_ip_allow_list_for_installed_apps_enabled_setting_payload": (
+        "App",
+        "Enterprise",
+        "IpAllowListOwner",
+        "Organization",
+        "String",
+    ),
+    "update_issue_comment_input": (
+        "ID",
+        "String",
+    ),
+    "update_issue_comment_payload": (
+        "IssueComment",
+        "String",
+    ),
+    "update_issue_input": (
+        "ID",
+        "IssueState",
+        "String",
+    ),
+    "update_issue_payload": (
+        "Actor",
+        "Issue",
+        "String",
+    ),
+    "update_label_input": (
+        "ID",
+        "String",
+    ),
+    "update_label_payload": (
+        "Label",
+        "String",
+    ),
+    "update_notification_restriction_setting_input": (
+        "ID",
+        "NotificationRestrictionSettingValue",
+        "String",
+    ),
+    "update_notification_restriction_setting_payload": (
+        "Enterprise",
+        "Organization",
+        "String",
+        "VerifiableDomainOwner",
+    ),
+    "update_organization_allow_private_repository_forking_setting_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "update_organization_allow_private_repository_forking_setting_payload": (
+        "Organization",
+        "String",
+    ),
+    "update_organization_web_commit_signoff_setting_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "update_organization_web_commit_signoff_setting_payload": (
+        "Organization",
+        "String",
+    ),
+    "update_parameters": (
+        "Boolean",
+    ),
+    "update_parameters_input": (
+        "Boolean",
+    ),
+    "update_patreon_sponsorability_input": (
+        "Boolean",
+        "String",
+    ),
+    "update_patreon_sponsorability_payload": (
+        "SponsorsListing",
+        "String",
+    ),
+    "update_project_card_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "update_project_card_payload": (
+        "ProjectCard",
+        "String",
+    ),
+    "update_project_column_input": (
+        "ID",
+        "String",
+    ),
+    "update_project_column_payload": (
+        "ProjectColumn",
+        "String",
+    ),
+    "update_project_input": (
+        "Boolean",
+        "ID",
+        "ProjectState",
+        "String",
+    ),
+    "update_project_payload": (
+        "Project",
+        "String",
+    ),
+    "update_project_v2_collaborators_input": (
+        "ID",
+        "ProjectV2Collaborator",
+        "String",
+    ),
+    "update_project_v2_collaborators_payload": (
+        "ProjectV2ActorConnection",
+        "String",
+    ),
+    "update_project_v2_draft_issue_input": (
+        "ID",
+        "String",
+    ),
+    "update_project_v2_draft_issue_payload": (
+        "DraftIssue",
+        "String",
+    ),
+    "update_project_v2_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "update_project_v2_item_field_value_input": (
+        "ID",
+        "ProjectV2FieldValue",
+        "String",
+    ),
+    "update_project_v2_item_field_value_payload": (
+        "ProjectV2Item",
+        "String",
+    ),
+    "update_project_v2_item_position_input": (
+        "ID",
+        "String",
+    ),
+    "update_project_v2_item_position_payload": (
+        "ProjectV2ItemConnection",
+        "String",
+    ),
+    "update_project_v2_payload": (
+        "ProjectV2",
+        "String",
+    ),
+    "update_pull_request_branch_input": (
+        "GitObjectID",
+        "ID",
+        "PullRequestBranchUpdateMethod",
+        "String",
+    ),
+    "update_pull_request_branch_payload": (
+        "PullRequest",
+        "String",
+    ),
+    "update_pull_request_input": (
+        "Boolean",
+        "ID",
+        "PullRequestUpdateState",
+        "String",
+    ),
+    "update_pull_request_payload": (
+        "Actor",
+        "PullRequest",
+        "String",
+    ),
+    "update_pull_request_review_comment_input": (
+        "ID",
+        "String",
+    ),
+    "update_pull_request_review_comment_payload": (
+        "PullRequestReviewComment",
+        "String",
+    ),
+    "update_pull_request_review_input": (
+        "ID",
+        "String",
+    ),
+    "update_pull_request_review_payload": (
+        "PullRequestReview",
+        "String",
+    ),
+    "update_ref_input": (
+        "Boolean",
+        "GitObjectID",
+        "ID",
+        "String",
+    ),
+    "update_ref_payload": (
+        "Ref",
+        "String",
+    ),
+    "update_refs_input": (
+        "ID",
+        "RefUpdate",
+        "String",
+    ),
+    "update_refs_payload": (
+        "String",
+    ),
+    "update_repository_input": (
+        "Boolean",
+        "ID",
+        "String",
+        "URI",
+    ),
+    "update_repository_payload": (
+        "Repository",
+        "String",
+    ),
+    "update_repository_ruleset_input": (
+        "ID",
+        "RepositoryRuleConditionsInput",
+        "RepositoryRuleInput",
+        "RepositoryRulesetBypassActorInput",
+        "RepositoryRulesetTarget",
+        "RuleEnforcement",
+        "String",
+    ),
+    "update_repository_ruleset_payload": (
+        "RepositoryRuleset",
+        "String",
+    ),
+    "update_repository_web_commit_signoff_setting_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "update_repository_web_commit_signoff_setting_payload": (
+        "Repository",
+        "String",
+    ),
+    "update_sponsorship_preferences_input": (
+        "Boolean",
+        "ID",
+        "SponsorshipPrivacy",
+        "String",
+    ),
+    "update_sponsorship_preferences_payload": (
+        "Sponsorship",
+        "String",
+    ),
+    "update_subscription_input": (
+        "ID",
+        "String",
+        "SubscriptionState",
+    ),
+    "update_subscription_payload": (
+        "String",
+        "Subscribable",
+    ),
+    "update_team_discussion_comment_input": (
+        "ID",
+        "String",
+    ),
+    "update_team_discussion_comment_payload": (
+        "String",
+        "TeamDiscussionComment",
+    ),
+    "update_team_discussion_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "update_team_discussion_payload": (
+        "String",
+        "TeamDiscussion",
+    ),
+    "update_team_review_assignment_input": (
+        "Boolean",
+        "ID",
+        "Int",
+        "String",
+        "TeamReviewAssignmentAlgorithm",
+    ),
+    "update_team_review_assignment_payload": (
+        "String",
+        "Team",
+    ),
+    "update_teams_repository_input": (
+        "ID",
+        "RepositoryPermission",
+        "String",
+    ),
+    "update_teams_repository_payload": (
+        "Repository",
+        "String",
+        "Team",
+    ),
+    "update_topics_input": (
+        "ID",
+        "String",
+    ),
+    "update_topics_payload": (
+        "Repository",
+        "String",
+    ),
+    "update_user_list_input": (
+        "Boolean",
+        "ID",
+        "String",
+    ),
+    "update_user_list_payload": (
+        "String",
+        "UserList",
+    ),
+    "update_user_lists_for_item_input": (
+        "ID",
+        "String",
+    ),
+    "update_user_lists_for_item_payload": (
+        "Repository",
+        "String",
+        "User",
+        "UserList",
+        "UserListItems",
+    ),
+    "user_content_edit": (
+        "Actor",
+        "DateTime",
+        "ID",
+        "String",
+    ),
+    "user_content_edit_connection": (
+        "Int",
+        "PageInfo",
+        "UserContentEdit",
+        "UserContentEditEdge",
+    ),
+    "user_content_edit_edge": (
+        "String",
+        "UserContentEdit",
+    ),
+    "user_email_metadata": (
+        "Boolean",
+        "String",
+    ),
+    "user_list_suggestion": (
+        "ID",
+        "String",
+    ),
+    "user_status_order": (
+        "OrderDirection",
+        "UserStatusOrderField",
+    ),
+    "verifiable_domain_order": (
+        "OrderDirection",
+        "VerifiableDomainOrderField",
+    ),
+    "verify_verifiable_domain_input": (
+        "ID",
+        "String",
+    ),
+    "verify_verifiable_domain_payload": (
+        "String",
+        "VerifiableDomain",
+    ),
+    "viewer_hovercard_context": (
+        "String",
+        "User",
+    ),
+    "votable": (
+        "Boolean",
+        "Int",
+    ),
+    "workflow_file_reference": (
+        "Int",
+        "String",
+    ),
+    "workflow_file_reference_input": (
+        "Int",
+        "String",
+    ),
+    "workflow_run_order": (
+        "OrderDirection",
+        "WorkflowRunOrderField",
+    ),
+    "workflows_parameters": (
+        "WorkflowFileReference",
+    ),
+    "workflows_parameters_input": (
+        "WorkflowFileReferenceInput",
+    ),
+}
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AbortRepositoryMigrationInput(BaseModel):
+    """
+    Autogenerated input type of AbortRepositoryMigration
+    """
+
+    clientMutationId: Optional[String] = None
+    migrationId: ID
+    typename__: Optional[Literal['AbortRepositoryMigrationInput']] = Field(
+        'AbortRepositoryMigrationInput', alias='__typename'
+    )
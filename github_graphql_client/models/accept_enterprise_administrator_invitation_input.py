@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AcceptEnterpriseAdministratorInvitationInput(BaseModel):
+    """
+    Autogenerated input type of AcceptEnterpriseAdministratorInvitation
+    """
+
+    clientMutationId: Optional[String] = None
+    invitationId: ID
+    typename__: Optional[
+        Literal['AcceptEnterpriseAdministratorInvitationInput']
+    ] = Field(
+        'AcceptEnterpriseAdministratorInvitationInput', alias='__typename'
+    )
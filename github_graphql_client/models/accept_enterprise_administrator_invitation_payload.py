@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AcceptEnterpriseAdministratorInvitationPayload(BaseModel):
+    """
+    Autogenerated return type of AcceptEnterpriseAdministratorInvitation
+    """
+
+    clientMutationId: Optional[String] = None
+    invitation: Optional[EnterpriseAdministratorInvitation] = None
+    message: Optional[String] = None
+    typename__: Optional[
+        Literal['AcceptEnterpriseAdministratorInvitationPayload']
+    ] = Field(
+        'AcceptEnterpriseAdministratorInvitationPayload', alias='__typename'
+    )
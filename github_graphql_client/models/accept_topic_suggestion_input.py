@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AcceptTopicSuggestionInput(BaseModel):
+    """
+    Autogenerated input type of AcceptTopicSuggestion
+    """
+
+    clientMutationId: Optional[String] = None
+    name: String
+    repositoryId: ID
+    typename__: Optional[Literal['AcceptTopicSuggestionInput']] = Field(
+        'AcceptTopicSuggestionInput', alias='__typename'
+    )
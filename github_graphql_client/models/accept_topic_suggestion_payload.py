@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AcceptTopicSuggestionPayload(BaseModel):
+    """
+    Autogenerated return type of AcceptTopicSuggestion
+    """
+
+    clientMutationId: Optional[String] = None
+    topic: Optional[Topic] = None
+    typename__: Optional[Literal['AcceptTopicSuggestionPayload']] = Field(
+        'AcceptTopicSuggestionPayload', alias='__typename'
+    )
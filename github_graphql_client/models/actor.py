@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Actor(BaseModel):
+    """
+    Represents an object which can take actions on GitHub. Typically a User or Bot.
+    """
+
+    avatarUrl: URI
+    login: String
+    resourcePath: URI
+    url: URI
+    typename__: Optional[Literal['Actor']] = Field('Actor', alias='__typename')
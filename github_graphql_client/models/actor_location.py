@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ActorLocation(BaseModel):
+    """
+    Location information for an actor
+    """
+
+    city: Optional[String] = None
+    country: Optional[String] = None
+    countryCode: Optional[String] = None
+    region: Optional[String] = None
+    regionCode: Optional[String] = None
+    typename__: Optional[Literal['ActorLocation']] = Field(
+        'ActorLocation', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddAssigneesToAssignableInput(BaseModel):
+    """
+    Autogenerated input type of AddAssigneesToAssignable
+    """
+
+    assignableId: ID
+    assigneeIds: List[ID]
+    clientMutationId: Optional[String] = None
+    typename__: Optional[Literal['AddAssigneesToAssignableInput']] = Field(
+        'AddAssigneesToAssignableInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddAssigneesToAssignablePayload(BaseModel):
+    """
+    Autogenerated return type of AddAssigneesToAssignable
+    """
+
+    assignable: Optional[Assignable] = None
+    clientMutationId: Optional[String] = None
+    typename__: Optional[Literal['AddAssigneesToAssignablePayload']] = Field(
+        'AddAssigneesToAssignablePayload', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddCommentInput(BaseModel):
+    """
+    Autogenerated input type of AddComment
+    """
+
+    body: String
+    clientMutationId: Optional[String] = None
+    subjectId: ID
+    typename__: Optional[Literal['AddCommentInput']] = Field(
+        'AddCommentInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddCommentPayload(BaseModel):
+    """
+    Autogenerated return type of AddComment
+    """
+
+    clientMutationId: Optional[String] = None
+    commentEdge: Optional[IssueCommentEdge] = None
+    subject: Optional[Node] = None
+    timelineEdge: Optional[IssueTimelineItemEdge] = None
+    typename__: Optional[Literal['AddCommentPayload']] = Field(
+        'AddCommentPayload', alias='__typename'
+    )
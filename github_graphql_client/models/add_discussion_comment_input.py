@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddDiscussionCommentInput(BaseModel):
+    """
+    Autogenerated input type of AddDiscussionComment
+    """
+
+    body: String
+    clientMutationId: Optional[String] = None
+    discussionId: ID
+    replyToId: Optional[ID] = None
+    typename__: Optional[Literal['AddDiscussionCommentInput']] = Field(
+        'AddDiscussionCommentInput', alias='__typename'
+    )
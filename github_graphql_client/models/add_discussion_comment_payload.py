@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddDiscussionCommentPayload(BaseModel):
+    """
+    Autogenerated return type of AddDiscussionComment
+    """
+
+    clientMutationId: Optional[String] = None
+    comment: Optional[DiscussionComment] = None
+    typename__: Optional[Literal['AddDiscussionCommentPayload']] = Field(
+        'AddDiscussionCommentPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddDiscussionPollVoteInput(BaseModel):
+    """
+    Autogenerated input type of AddDiscussionPollVote
+    """
+
+    clientMutationId: Optional[String] = None
+    pollOptionId: ID
+    typename__: Optional[Literal['AddDiscussionPollVoteInput']] = Field(
+        'AddDiscussionPollVoteInput', alias='__typename'
+    )
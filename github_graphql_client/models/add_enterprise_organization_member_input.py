@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddEnterpriseOrganizationMemberInput(BaseModel):
+    """
+    Autogenerated input type of AddEnterpriseOrganizationMember
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    organizationId: ID
+    role: Optional[OrganizationMemberRole] = None
+    userIds: List[ID]
+    typename__: Optional[
+        Literal['AddEnterpriseOrganizationMemberInput']
+    ] = Field('AddEnterpriseOrganizationMemberInput', alias='__typename')
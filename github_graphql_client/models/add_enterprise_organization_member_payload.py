@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddEnterpriseOrganizationMemberPayload(BaseModel):
+    """
+    Autogenerated return type of AddEnterpriseOrganizationMember
+    """
+
+    clientMutationId: Optional[String] = None
+    users: Optional[List[User]] = Field(default_factory=list)
+    typename__: Optional[
+        Literal['AddEnterpriseOrganizationMemberPayload']
+    ] = Field('AddEnterpriseOrganizationMemberPayload', alias='__typename')
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddLabelsToLabelableInput(BaseModel):
+    """
+    Autogenerated input type of AddLabelsToLabelable
+    """
+
+    clientMutationId: Optional[String] = None
+    labelIds: List[ID]
+    labelableId: ID
+    typename__: Optional[Literal['AddLabelsToLabelableInput']] = Field(
+        'AddLabelsToLabelableInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddProjectCardInput(BaseModel):
+    """
+    Autogenerated input type of AddProjectCard
+    """
+
+    clientMutationId: Optional[String] = None
+    contentId: Optional[ID] = None
+    note: Optional[String] = None
+    projectColumnId: ID
+    typename__: Optional[Literal['AddProjectCardInput']] = Field(
+        'AddProjectCardInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddProjectCardPayload(BaseModel):
+    """
+    Autogenerated return type of AddProjectCard
+    """
+
+    cardEdge: Optional[ProjectCardEdge] = None
+    clientMutationId: Optional[String] = None
+    projectColumn: Optional[ProjectColumn] = None
+    typename__: Optional[Literal['AddProjectCardPayload']] = Field(
+        'AddProjectCardPayload', alias='__typename'
+    )
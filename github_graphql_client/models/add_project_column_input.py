@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddProjectColumnInput(BaseModel):
+    """
+    Autogenerated input type of AddProjectColumn
+    """
+
+    clientMutationId: Optional[String] = None
+    name: String
+    projectId: ID
+    typename__: Optional[Literal['AddProjectColumnInput']] = Field(
+        'AddProjectColumnInput', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddProjectV2DraftIssueInput(BaseModel):
+    """
+    Autogenerated input type of AddProjectV2DraftIssue
+    """
+
+    assigneeIds: Optional[List[ID]] = None
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    projectId: ID
+    title: String
+    typename__: Optional[Literal['AddProjectV2DraftIssueInput']] = Field(
+        'AddProjectV2DraftIssueInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddProjectV2DraftIssuePayload(BaseModel):
+    """
+    Autogenerated return type of AddProjectV2DraftIssue
+    """
+
+    clientMutationId: Optional[String] = None
+    projectItem: Optional[ProjectV2Item] = None
+    typename__: Optional[Literal['AddProjectV2DraftIssuePayload']] = Field(
+        'AddProjectV2DraftIssuePayload', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddProjectV2ItemByIdInput(BaseModel):
+    """
+    Autogenerated input type of AddProjectV2ItemById
+    """
+
+    clientMutationId: Optional[String] = None
+    contentId: ID
+    projectId: ID
+    typename__: Optional[Literal['AddProjectV2ItemByIdInput']] = Field(
+        'AddProjectV2ItemByIdInput', alias='__typename'
+    )
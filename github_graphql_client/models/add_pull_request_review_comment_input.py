@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddPullRequestReviewCommentInput(BaseModel):
+    """
+    Autogenerated input type of AddPullRequestReviewComment
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    commitOID: Optional[GitObjectID] = None
+    inReplyTo: Optional[ID] = None
+    path: Optional[String] = None
+    position: Optional[Int] = None
+    pullRequestId: Optional[ID] = None
+    pullRequestReviewId: Optional[ID] = None
+    typename__: Optional[Literal['AddPullRequestReviewCommentInput']] = Field(
+        'AddPullRequestReviewCommentInput', alias='__typename'
+    )
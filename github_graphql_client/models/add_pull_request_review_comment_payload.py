@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddPullRequestReviewCommentPayload(BaseModel):
+    """
+    Autogenerated return type of AddPullRequestReviewComment
+    """
+
+    clientMutationId: Optional[String] = None
+    comment: Optional[PullRequestReviewComment] = None
+    commentEdge: Optional[PullRequestReviewCommentEdge] = None
+    typename__: Optional[
+        Literal['AddPullRequestReviewCommentPayload']
+    ] = Field('AddPullRequestReviewCommentPayload', alias='__typename')
@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddPullRequestReviewInput(BaseModel):
+    """
+    Autogenerated input type of AddPullRequestReview
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    comments: Optional[List[Optional[DraftPullRequestReviewComment]]] = None
+    commitOID: Optional[GitObjectID] = None
+    event: Optional[PullRequestReviewEvent] = None
+    pullRequestId: ID
+    threads: Optional[List[Optional[DraftPullRequestReviewThread]]] = None
+    typename__: Optional[Literal['AddPullRequestReviewInput']] = Field(
+        'AddPullRequestReviewInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddPullRequestReviewPayload(BaseModel):
+    """
+    Autogenerated return type of AddPullRequestReview
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequestReview: Optional[PullRequestReview] = None
+    reviewEdge: Optional[PullRequestReviewEdge] = None
+    typename__: Optional[Literal['AddPullRequestReviewPayload']] = Field(
+        'AddPullRequestReviewPayload', alias='__typename'
+    )
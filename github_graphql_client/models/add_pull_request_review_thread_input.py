@@ -0,0 +1,29 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddPullRequestReviewThreadInput(BaseModel):
+    """
+    Autogenerated input type of AddPullRequestReviewThread
+    """
+
+    body: String
+    clientMutationId: Optional[String] = None
+    line: Optional[Int] = None
+    path: String
+    pullRequestId: Optional[ID] = None
+    pullRequestReviewId: Optional[ID] = None
+    side: Optional[DiffSide] = 'RIGHT'
+    startLine: Optional[Int] = None
+    startSide: Optional[DiffSide] = 'RIGHT'
+    subjectType: Optional[PullRequestReviewThreadSubjectType] = 'LINE'
+    typename__: Optional[Literal['AddPullRequestReviewThreadInput']] = Field(
+        'AddPullRequestReviewThreadInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddPullRequestReviewThreadReplyInput(BaseModel):
+    """
+    Autogenerated input type of AddPullRequestReviewThreadReply
+    """
+
+    body: String
+    clientMutationId: Optional[String] = None
+    pullRequestReviewId: Optional[ID] = None
+    pullRequestReviewThreadId: ID
+    typename__: Optional[
+        Literal['AddPullRequestReviewThreadReplyInput']
+    ] = Field('AddPullRequestReviewThreadReplyInput', alias='__typename')
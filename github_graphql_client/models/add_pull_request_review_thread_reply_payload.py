@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddPullRequestReviewThreadReplyPayload(BaseModel):
+    """
+    Autogenerated return type of AddPullRequestReviewThreadReply
+    """
+
+    clientMutationId: Optional[String] = None
+    comment: Optional[PullRequestReviewComment] = None
+    typename__: Optional[
+        Literal['AddPullRequestReviewThreadReplyPayload']
+    ] = Field('AddPullRequestReviewThreadReplyPayload', alias='__typename')
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddReactionInput(BaseModel):
+    """
+    Autogenerated input type of AddReaction
+    """
+
+    clientMutationId: Optional[String] = None
+    content: ReactionContent
+    subjectId: ID
+    typename__: Optional[Literal['AddReactionInput']] = Field(
+        'AddReactionInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddReactionPayload(BaseModel):
+    """
+    Autogenerated return type of AddReaction
+    """
+
+    clientMutationId: Optional[String] = None
+    reaction: Optional[Reaction] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    subject: Optional[Reactable] = None
+    typename__: Optional[Literal['AddReactionPayload']] = Field(
+        'AddReactionPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddStarPayload(BaseModel):
+    """
+    Autogenerated return type of AddStar
+    """
+
+    clientMutationId: Optional[String] = None
+    starrable: Optional[Starrable] = None
+    typename__: Optional[Literal['AddStarPayload']] = Field(
+        'AddStarPayload', alias='__typename'
+    )
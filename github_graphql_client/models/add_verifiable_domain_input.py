@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddVerifiableDomainInput(BaseModel):
+    """
+    Autogenerated input type of AddVerifiableDomain
+    """
+
+    clientMutationId: Optional[String] = None
+    domain: URI
+    ownerId: ID
+    typename__: Optional[Literal['AddVerifiableDomainInput']] = Field(
+        'AddVerifiableDomainInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AddVerifiableDomainPayload(BaseModel):
+    """
+    Autogenerated return type of AddVerifiableDomain
+    """
+
+    clientMutationId: Optional[String] = None
+    domain: Optional[VerifiableDomain] = None
+    typename__: Optional[Literal['AddVerifiableDomainPayload']] = Field(
+        'AddVerifiableDomainPayload', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AnnouncementBanner(BaseModel):
+    """
+    Represents an announcement banner.
+    """
+
+    announcement: Optional[String] = None
+    announcementExpiresAt: Optional[DateTime] = None
+    announcementUserDismissible: Optional[Boolean] = None
+    typename__: Optional[Literal['AnnouncementBanner']] = Field(
+        'AnnouncementBanner', alias='__typename'
+    )
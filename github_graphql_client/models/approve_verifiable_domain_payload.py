@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ApproveVerifiableDomainPayload(BaseModel):
+    """
+    Autogenerated return type of ApproveVerifiableDomain
+    """
+
+    clientMutationId: Optional[String] = None
+    domain: Optional[VerifiableDomain] = None
+    typename__: Optional[Literal['ApproveVerifiableDomainPayload']] = Field(
+        'ApproveVerifiableDomainPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ArchiveRepositoryInput(BaseModel):
+    """
+    Autogenerated input type of ArchiveRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    repositoryId: ID
+    typename__: Optional[Literal['ArchiveRepositoryInput']] = Field(
+        'ArchiveRepositoryInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class AuditLogOrder(BaseModel):
+    """
+    Ordering options for Audit Log connections.
+    """
+
+    direction: Optional[OrderDirection] = None
+    field: Optional[AuditLogOrderField] = None
+    typename__: Optional[Literal['AuditLogOrder']] = Field(
+        'AuditLogOrder', alias='__typename'
+    )
@@ -0,0 +1,29 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .core import GitObject
+from .node import Node
+
+
+class Blob(GitObject, Node):
+    """
+    Represents a Git blob.
+    """
+
+    abbreviatedOid: String
+    byteSize: Int
+    commitResourcePath: URI
+    commitUrl: URI
+    id: ID
+    isBinary: Optional[Boolean] = None
+    isTruncated: Boolean
+    oid: GitObjectID
+    repository: Repository
+    text: Optional[String] = None
+    typename__: Optional[Literal['Blob']] = Field('Blob', alias='__typename')
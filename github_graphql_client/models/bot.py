@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .actor import Actor
+from .node import Node
+from .uniform_resource_locatable import UniformResourceLocatable
+
+
+class Bot(Actor, Node, UniformResourceLocatable):
+    """
+    A special type of user which takes actions on behalf of GitHub Apps.
+    """
+
+    avatarUrl: URI
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    id: ID
+    login: String
+    resourcePath: URI
+    updatedAt: DateTime
+    url: URI
+    typename__: Optional[Literal['Bot']] = Field('Bot', alias='__typename')
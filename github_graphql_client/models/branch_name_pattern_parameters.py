@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class BranchNamePatternParameters(BaseModel):
+    """
+    Parameters to be used for the branch_name_pattern rule
+    """
+
+    name: Optional[String] = None
+    negate: Boolean
+    operator: String
+    pattern: String
+    typename__: Optional[Literal['BranchNamePatternParameters']] = Field(
+        'BranchNamePatternParameters', alias='__typename'
+    )
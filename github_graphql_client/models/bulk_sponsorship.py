@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class BulkSponsorship(BaseModel):
+    """
+    Information about a sponsorship to make for a user or organization with a GitHub
+    Sponsors profile, as part of sponsoring many users or organizations at once.
+    """
+
+    amount: Int
+    sponsorableId: Optional[ID] = None
+    sponsorableLogin: Optional[String] = None
+    typename__: Optional[Literal['BulkSponsorship']] = Field(
+        'BulkSponsorship', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CancelEnterpriseAdminInvitationInput(BaseModel):
+    """
+    Autogenerated input type of CancelEnterpriseAdminInvitation
+    """
+
+    clientMutationId: Optional[String] = None
+    invitationId: ID
+    typename__: Optional[
+        Literal['CancelEnterpriseAdminInvitationInput']
+    ] = Field('CancelEnterpriseAdminInvitationInput', alias='__typename')
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CancelEnterpriseAdminInvitationPayload(BaseModel):
+    """
+    Autogenerated return type of CancelEnterpriseAdminInvitation
+    """
+
+    clientMutationId: Optional[String] = None
+    invitation: Optional[EnterpriseAdministratorInvitation] = None
+    message: Optional[String] = None
+    typename__: Optional[
+        Literal['CancelEnterpriseAdminInvitationPayload']
+    ] = Field('CancelEnterpriseAdminInvitationPayload', alias='__typename')
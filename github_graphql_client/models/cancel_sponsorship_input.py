@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CancelSponsorshipInput(BaseModel):
+    """
+    Autogenerated input type of CancelSponsorship
+    """
+
+    clientMutationId: Optional[String] = None
+    sponsorId: Optional[ID] = None
+    sponsorLogin: Optional[String] = None
+    sponsorableId: Optional[ID] = None
+    sponsorableLogin: Optional[String] = None
+    typename__: Optional[Literal['CancelSponsorshipInput']] = Field(
+        'CancelSponsorshipInput', alias='__typename'
+    )
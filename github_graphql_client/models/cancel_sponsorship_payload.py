@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CancelSponsorshipPayload(BaseModel):
+    """
+    Autogenerated return type of CancelSponsorship
+    """
+
+    clientMutationId: Optional[String] = None
+    sponsorsTier: Optional[SponsorsTier] = None
+    typename__: Optional[Literal['CancelSponsorshipPayload']] = Field(
+        'CancelSponsorshipPayload', alias='__typename'
+    )
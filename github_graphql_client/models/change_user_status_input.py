@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ChangeUserStatusInput(BaseModel):
+    """
+    Autogenerated input type of ChangeUserStatus
+    """
+
+    clientMutationId: Optional[String] = None
+    emoji: Optional[String] = None
+    expiresAt: Optional[DateTime] = None
+    limitedAvailability: Optional[Boolean] = False
+    message: Optional[String] = None
+    organizationId: Optional[ID] = None
+    typename__: Optional[Literal['ChangeUserStatusInput']] = Field(
+        'ChangeUserStatusInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ChangeUserStatusPayload(BaseModel):
+    """
+    Autogenerated return type of ChangeUserStatus
+    """
+
+    clientMutationId: Optional[String] = None
+    status: Optional[UserStatus] = None
+    typename__: Optional[Literal['ChangeUserStatusPayload']] = Field(
+        'ChangeUserStatusPayload', alias='__typename'
+    )
@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckAnnotation(BaseModel):
+    """
+    A single check annotation.
+    """
+
+    annotationLevel: Optional[CheckAnnotationLevel] = None
+    blobUrl: URI
+    databaseId: Optional[Int] = None
+    location: CheckAnnotationSpan
+    message: String
+    path: String
+    rawDetails: Optional[String] = None
+    title: Optional[String] = None
+    typename__: Optional[Literal['CheckAnnotation']] = Field(
+        'CheckAnnotation', alias='__typename'
+    )
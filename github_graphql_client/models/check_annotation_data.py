@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckAnnotationData(BaseModel):
+    """
+    Information from a check run analysis to specific lines of code.
+    """
+
+    annotationLevel: CheckAnnotationLevel
+    location: CheckAnnotationRange
+    message: String
+    path: String
+    rawDetails: Optional[String] = None
+    title: Optional[String] = None
+    typename__: Optional[Literal['CheckAnnotationData']] = Field(
+        'CheckAnnotationData', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckAnnotationPosition(BaseModel):
+    """
+    A character position in a check annotation.
+    """
+
+    column: Optional[Int] = None
+    line: Int
+    typename__: Optional[Literal['CheckAnnotationPosition']] = Field(
+        'CheckAnnotationPosition', alias='__typename'
+    )
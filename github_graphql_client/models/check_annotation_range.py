@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckAnnotationRange(BaseModel):
+    """
+    Information from a check run analysis to specific lines of code.
+    """
+
+    endColumn: Optional[Int] = None
+    endLine: Int
+    startColumn: Optional[Int] = None
+    startLine: Int
+    typename__: Optional[Literal['CheckAnnotationRange']] = Field(
+        'CheckAnnotationRange', alias='__typename'
+    )
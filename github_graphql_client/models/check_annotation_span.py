@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckAnnotationSpan(BaseModel):
+    """
+    An inclusive pair of positions for a check annotation.
+    """
+
+    end: CheckAnnotationPosition
+    start: CheckAnnotationPosition
+    typename__: Optional[Literal['CheckAnnotationSpan']] = Field(
+        'CheckAnnotationSpan', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckRunAction(BaseModel):
+    """
+    Possible further actions the integrator can perform.
+    """
+
+    description: String
+    identifier: String
+    label: String
+    typename__: Optional[Literal['CheckRunAction']] = Field(
+        'CheckRunAction', alias='__typename'
+    )
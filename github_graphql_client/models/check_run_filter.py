@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckRunFilter(BaseModel):
+    """
+    The filters that are available when fetching check runs.
+    """
+
+    appId: Optional[Int] = None
+    checkName: Optional[String] = None
+    checkType: Optional[CheckRunType] = None
+    conclusions: Optional[List[CheckConclusionState]] = None
+    status: Optional[CheckStatusState] = None
+    statuses: Optional[List[CheckStatusState]] = None
+    typename__: Optional[Literal['CheckRunFilter']] = Field(
+        'CheckRunFilter', alias='__typename'
+    )
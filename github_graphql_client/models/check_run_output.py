@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckRunOutput(BaseModel):
+    """
+    Descriptive details about the check run.
+    """
+
+    annotations: Optional[List[CheckAnnotationData]] = None
+    images: Optional[List[CheckRunOutputImage]] = None
+    summary: String
+    text: Optional[String] = None
+    title: String
+    typename__: Optional[Literal['CheckRunOutput']] = Field(
+        'CheckRunOutput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckRunOutputImage(BaseModel):
+    """
+    Images attached to the check run output displayed in the GitHub pull request UI.
+    """
+
+    alt: String
+    caption: Optional[String] = None
+    imageUrl: URI
+    typename__: Optional[Literal['CheckRunOutputImage']] = Field(
+        'CheckRunOutputImage', alias='__typename'
+    )
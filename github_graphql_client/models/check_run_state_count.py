@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckRunStateCount(BaseModel):
+    """
+    Represents a count of the state of a check run.
+    """
+
+    count: Int
+    state: CheckRunState
+    typename__: Optional[Literal['CheckRunStateCount']] = Field(
+        'CheckRunStateCount', alias='__typename'
+    )
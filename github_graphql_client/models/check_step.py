@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckStep(BaseModel):
+    """
+    A single check step.
+    """
+
+    completedAt: Optional[DateTime] = None
+    conclusion: Optional[CheckConclusionState] = None
+    externalId: Optional[String] = None
+    name: String
+    number: Int
+    secondsToCompletion: Optional[Int] = None
+    startedAt: Optional[DateTime] = None
+    status: CheckStatusState
+    typename__: Optional[Literal['CheckStep']] = Field(
+        'CheckStep', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckSuiteAutoTriggerPreference(BaseModel):
+    """
+    The auto-trigger preferences that are available for check suites.
+    """
+
+    appId: ID
+    setting: Boolean
+    typename__: Optional[Literal['CheckSuiteAutoTriggerPreference']] = Field(
+        'CheckSuiteAutoTriggerPreference', alias='__typename'
+    )
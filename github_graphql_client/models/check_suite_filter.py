@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CheckSuiteFilter(BaseModel):
+    """
+    The filters that are available when fetching check suites.
+    """
+
+    appId: Optional[Int] = None
+    checkName: Optional[String] = None
+    typename__: Optional[Literal['CheckSuiteFilter']] = Field(
+        'CheckSuiteFilter', alias='__typename'
+    )
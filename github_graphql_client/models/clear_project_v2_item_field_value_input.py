@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ClearProjectV2ItemFieldValueInput(BaseModel):
+    """
+    Autogenerated input type of ClearProjectV2ItemFieldValue
+    """
+
+    clientMutationId: Optional[String] = None
+    fieldId: ID
+    itemId: ID
+    projectId: ID
+    typename__: Optional[Literal['ClearProjectV2ItemFieldValueInput']] = Field(
+        'ClearProjectV2ItemFieldValueInput', alias='__typename'
+    )
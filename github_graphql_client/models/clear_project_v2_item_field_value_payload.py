@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ClearProjectV2ItemFieldValuePayload(BaseModel):
+    """
+    Autogenerated return type of ClearProjectV2ItemFieldValue
+    """
+
+    clientMutationId: Optional[String] = None
+    projectV2Item: Optional[ProjectV2Item] = None
+    typename__: Optional[
+        Literal['ClearProjectV2ItemFieldValuePayload']
+    ] = Field('ClearProjectV2ItemFieldValuePayload', alias='__typename')
@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CloneProjectInput(BaseModel):
+    """
+    Autogenerated input type of CloneProject
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    includeWorkflows: Boolean
+    name: String
+    public: Optional[Boolean] = None
+    sourceId: ID
+    targetOwnerId: ID
+    typename__: Optional[Literal['CloneProjectInput']] = Field(
+        'CloneProjectInput', alias='__typename'
+    )
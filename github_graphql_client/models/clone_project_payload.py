@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CloneProjectPayload(BaseModel):
+    """
+    Autogenerated return type of CloneProject
+    """
+
+    clientMutationId: Optional[String] = None
+    jobStatusId: Optional[String] = None
+    project: Optional[Project] = None
+    typename__: Optional[Literal['CloneProjectPayload']] = Field(
+        'CloneProjectPayload', alias='__typename'
+    )
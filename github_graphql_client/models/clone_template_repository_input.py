@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CloneTemplateRepositoryInput(BaseModel):
+    """
+    Autogenerated input type of CloneTemplateRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    description: Optional[String] = None
+    includeAllBranches: Optional[Boolean] = False
+    name: String
+    ownerId: ID
+    repositoryId: ID
+    visibility: RepositoryVisibility
+    typename__: Optional[Literal['CloneTemplateRepositoryInput']] = Field(
+        'CloneTemplateRepositoryInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Closable(BaseModel):
+    """
+    An object that can be closed
+    """
+
+    closed: Boolean
+    closedAt: Optional[DateTime] = None
+    viewerCanClose: Boolean
+    viewerCanReopen: Boolean
+    typename__: Optional[Literal['Closable']] = Field(
+        'Closable', alias='__typename'
+    )
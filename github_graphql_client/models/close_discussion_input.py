@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CloseDiscussionInput(BaseModel):
+    """
+    Autogenerated input type of CloseDiscussion
+    """
+
+    clientMutationId: Optional[String] = None
+    discussionId: ID
+    reason: Optional[DiscussionCloseReason] = 'RESOLVED'
+    typename__: Optional[Literal['CloseDiscussionInput']] = Field(
+        'CloseDiscussionInput', alias='__typename'
+    )
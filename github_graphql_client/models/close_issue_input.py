@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CloseIssueInput(BaseModel):
+    """
+    Autogenerated input type of CloseIssue
+    """
+
+    clientMutationId: Optional[String] = None
+    issueId: ID
+    stateReason: Optional[IssueClosedStateReason] = None
+    typename__: Optional[Literal['CloseIssueInput']] = Field(
+        'CloseIssueInput', alias='__typename'
+    )
@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class CodeOfConduct(Node):
+    """
+    The Code of Conduct for a repository
+    """
+
+    body: Optional[String] = None
+    id: ID
+    key: String
+    name: String
+    resourcePath: Optional[URI] = None
+    url: Optional[URI] = None
+    typename__: Optional[Literal['CodeOfConduct']] = Field(
+        'CodeOfConduct', alias='__typename'
+    )
@@ -0,0 +1,34 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Comment(BaseModel):
+    """
+    Represents a comment.
+    """
+
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    editor: Optional[Actor] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    lastEditedAt: Optional[DateTime] = None
+    publishedAt: Optional[DateTime] = None
+    updatedAt: DateTime
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerDidAuthor: Boolean
+    typename__: Optional[Literal['Comment']] = Field(
+        'Comment', alias='__typename'
+    )
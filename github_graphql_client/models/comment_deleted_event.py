@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class CommentDeletedEvent(Node):
+    """
+    Represents a 'comment_deleted' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    deletedCommentAuthor: Optional[Actor] = None
+    id: ID
+    typename__: Optional[Literal['CommentDeletedEvent']] = Field(
+        'CommentDeletedEvent', alias='__typename'
+    )
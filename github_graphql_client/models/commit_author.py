@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CommitAuthor(BaseModel):
+    """
+    Specifies an author for filtering Git commits.
+    """
+
+    emails: Optional[List[String]] = None
+    id: Optional[ID] = None
+    typename__: Optional[Literal['CommitAuthor']] = Field(
+        'CommitAuthor', alias='__typename'
+    )
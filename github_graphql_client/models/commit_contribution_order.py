@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CommitContributionOrder(BaseModel):
+    """
+    Ordering options for commit contribution connections.
+    """
+
+    direction: OrderDirection
+    field: CommitContributionOrderField
+    typename__: Optional[Literal['CommitContributionOrder']] = Field(
+        'CommitContributionOrder', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CommitMessage(BaseModel):
+    """
+    A message to include with a new commit
+    """
+
+    body: Optional[String] = None
+    headline: String
+    typename__: Optional[Literal['CommitMessage']] = Field(
+        'CommitMessage', alias='__typename'
+    )
@@ -0,0 +1,42 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CommittableBranch(BaseModel):
+    """
+    A git ref for a commit to be appended to.
+
+    The ref must be a branch, i.e. its fully qualified name must start
+    with `refs/heads/` (although the input is not required to be fully
+    qualified).
+
+    The Ref may be specified by its global node ID or by the
+    `repositoryNameWithOwner` and `branchName`.
+
+    ### Examples
+
+    Specify a branch using a global node ID:
+
+        { "id": "MDM6UmVmMTpyZWZzL2hlYWRzL21haW4=" }
+
+    Specify a branch using `repositoryNameWithOwner` and `branchName`:
+
+        {
+          "repositoryNameWithOwner": "github/graphql-client",
+          "branchName": "main"
+        }
+    """
+
+    branchName: Optional[String] = None
+    id: Optional[ID] = None
+    repositoryNameWithOwner: Optional[String] = None
+    typename__: Optional[Literal['CommittableBranch']] = Field(
+        'CommittableBranch', alias='__typename'
+    )
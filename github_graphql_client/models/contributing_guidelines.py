@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ContributingGuidelines(BaseModel):
+    """
+    The Contributing Guidelines for a repository.
+    """
+
+    body: Optional[String] = None
+    resourcePath: Optional[URI] = None
+    url: Optional[URI] = None
+    typename__: Optional[Literal['ContributingGuidelines']] = Field(
+        'ContributingGuidelines', alias='__typename'
+    )
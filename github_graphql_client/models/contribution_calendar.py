@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ContributionCalendar(BaseModel):
+    """
+    A calendar of contributions made on GitHub by a user.
+    """
+
+    colors: List[String]
+    isHalloween: Boolean
+    months: List[ContributionCalendarMonth]
+    totalContributions: Int
+    weeks: List[ContributionCalendarWeek]
+    typename__: Optional[Literal['ContributionCalendar']] = Field(
+        'ContributionCalendar', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ContributionCalendarDay(BaseModel):
+    """
+    Represents a single day of contributions on GitHub by a user.
+    """
+
+    color: String
+    contributionCount: Int
+    contributionLevel: ContributionLevel
+    date: Date
+    weekday: Int
+    typename__: Optional[Literal['ContributionCalendarDay']] = Field(
+        'ContributionCalendarDay', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ContributionCalendarMonth(BaseModel):
+    """
+    A month of contributions in a user's contribution graph.
+    """
+
+    firstDay: Date
+    name: String
+    totalWeeks: Int
+    year: Int
+    typename__: Optional[Literal['ContributionCalendarMonth']] = Field(
+        'ContributionCalendarMonth', alias='__typename'
+    )
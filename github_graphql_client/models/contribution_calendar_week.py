@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ContributionCalendarWeek(BaseModel):
+    """
+    A week of contributions in a user's contribution graph.
+    """
+
+    contributionDays: List[ContributionCalendarDay]
+    firstDay: Date
+    typename__: Optional[Literal['ContributionCalendarWeek']] = Field(
+        'ContributionCalendarWeek', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ConvertProjectCardNoteToIssueInput(BaseModel):
+    """
+    Autogenerated input type of ConvertProjectCardNoteToIssue
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    projectCardId: ID
+    repositoryId: ID
+    title: Optional[String] = None
+    typename__: Optional[
+        Literal['ConvertProjectCardNoteToIssueInput']
+    ] = Field('ConvertProjectCardNoteToIssueInput', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ConvertProjectCardNoteToIssuePayload(BaseModel):
+    """
+    Autogenerated return type of ConvertProjectCardNoteToIssue
+    """
+
+    clientMutationId: Optional[String] = None
+    projectCard: Optional[ProjectCard] = None
+    typename__: Optional[
+        Literal['ConvertProjectCardNoteToIssuePayload']
+    ] = Field('ConvertProjectCardNoteToIssuePayload', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ConvertPullRequestToDraftPayload(BaseModel):
+    """
+    Autogenerated return type of ConvertPullRequestToDraft
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['ConvertPullRequestToDraftPayload']] = Field(
+        'ConvertPullRequestToDraftPayload', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CopyProjectV2Input(BaseModel):
+    """
+    Autogenerated input type of CopyProjectV2
+    """
+
+    clientMutationId: Optional[String] = None
+    includeDraftIssues: Optional[Boolean] = False
+    ownerId: ID
+    projectId: ID
+    title: String
+    typename__: Optional[Literal['CopyProjectV2Input']] = Field(
+        'CopyProjectV2Input', alias='__typename'
+    )
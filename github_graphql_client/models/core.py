@@ -0,0 +1,10581 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .actor import Actor
+from .announcement_banner import AnnouncementBanner
+from .closable import Closable
+from .comment import Comment
+from .deletable import Deletable
+from .enterprise_audit_entry_data import EnterpriseAuditEntryData
+from .lockable import Lockable
+from .minimizable import Minimizable
+from .node import Node
+from .oauth_application_audit_entry_data import OauthApplicationAuditEntryData
+from .requirable_by_pull_request import RequirableByPullRequest
+from .subscribable import Subscribable
+from .subscribable_thread import SubscribableThread
+from .uniform_resource_locatable import UniformResourceLocatable
+from .updatable import Updatable
+from .updatable_comment import UpdatableComment
+from .votable import Votable
+
+
+class Assignable(BaseModel):
+    """
+    An object that can have users assigned to it.
+    """
+
+    assignees: UserConnection
+    typename__: Optional[Literal['Assignable']] = Field(
+        'Assignable', alias='__typename'
+    )
+
+
+class AuditEntry(BaseModel):
+    """
+    An entry in the audit log.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    operationType: Optional[OperationType] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['AuditEntry']] = Field(
+        'AuditEntry', alias='__typename'
+    )
+
+
+class Contribution(BaseModel):
+    """
+    Represents a contribution a user made on GitHub, such as opening an issue.
+    """
+
+    isRestricted: Boolean
+    occurredAt: DateTime
+    resourcePath: URI
+    url: URI
+    user: User
+    typename__: Optional[Literal['Contribution']] = Field(
+        'Contribution', alias='__typename'
+    )
+
+
+class GitObject(BaseModel):
+    """
+    Represents a Git object.
+    """
+
+    abbreviatedOid: String
+    commitResourcePath: URI
+    commitUrl: URI
+    id: ID
+    oid: GitObjectID
+    repository: Repository
+    typename__: Optional[Literal['GitObject']] = Field(
+        'GitObject', alias='__typename'
+    )
+
+
+class GitSignature(BaseModel):
+    """
+    Information about a signature (GPG or S/MIME) on a Commit or Tag.
+    """
+
+    email: String
+    isValid: Boolean
+    payload: String
+    signature: String
+    signer: Optional[User] = None
+    state: GitSignatureState
+    wasSignedByGitHub: Boolean
+    typename__: Optional[Literal['GitSignature']] = Field(
+        'GitSignature', alias='__typename'
+    )
+
+
+class Labelable(BaseModel):
+    """
+    An object that can have labels assigned to it.
+    """
+
+    labels: Optional[LabelConnection] = None
+    typename__: Optional[Literal['Labelable']] = Field(
+        'Labelable', alias='__typename'
+    )
+
+
+class MemberStatusable(BaseModel):
+    """
+    Entities that have members who can set status messages.
+    """
+
+    memberStatuses: UserStatusConnection
+    typename__: Optional[Literal['MemberStatusable']] = Field(
+        'MemberStatusable', alias='__typename'
+    )
+
+
+class OrganizationAuditEntryData(BaseModel):
+    """
+    Metadata for an audit entry with action org.*
+    """
+
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrganizationAuditEntryData']] = Field(
+        'OrganizationAuditEntryData', alias='__typename'
+    )
+
+
+class PackageOwner(BaseModel):
+    """
+    Represents an owner of a package.
+    """
+
+    id: ID
+    packages: PackageConnection
+    typename__: Optional[Literal['PackageOwner']] = Field(
+        'PackageOwner', alias='__typename'
+    )
+
+
+class ProfileOwner(BaseModel):
+    """
+    Represents any entity on GitHub that has a profile page.
+    """
+
+    anyPinnableItems: Boolean
+    email: Optional[String] = None
+    id: ID
+    itemShowcase: ProfileItemShowcase
+    location: Optional[String] = None
+    login: String
+    name: Optional[String] = None
+    pinnableItems: PinnableItemConnection
+    pinnedItems: PinnableItemConnection
+    pinnedItemsRemaining: Int
+    viewerCanChangePinnedItems: Boolean
+    websiteUrl: Optional[URI] = None
+    typename__: Optional[Literal['ProfileOwner']] = Field(
+        'ProfileOwner', alias='__typename'
+    )
+
+
+class ProjectOwner(BaseModel):
+    """
+    Represents an owner of a Project.
+    """
+
+    id: ID
+    project: Optional[Project] = None
+    projects: ProjectConnection
+    projectsResourcePath: URI
+    projectsUrl: URI
+    viewerCanCreateProjects: Boolean
+    typename__: Optional[Literal['ProjectOwner']] = Field(
+        'ProjectOwner', alias='__typename'
+    )
+
+
+class ProjectV2FieldCommon(BaseModel):
+    """
+    Common fields across different project field types
+    """
+
+    createdAt: DateTime
+    dataType: ProjectV2FieldType
+    databaseId: Optional[Int] = None
+    id: ID
+    name: String
+    project: ProjectV2
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2FieldCommon']] = Field(
+        'ProjectV2FieldCommon', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldValueCommon(BaseModel):
+    """
+    Common fields across different project field value types
+    """
+
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    field: ProjectV2FieldConfiguration
+    id: ID
+    item: ProjectV2Item
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2ItemFieldValueCommon']] = Field(
+        'ProjectV2ItemFieldValueCommon', alias='__typename'
+    )
+
+
+class ProjectV2Owner(BaseModel):
+    """
+    Represents an owner of a project.
+    """
+
+    id: ID
+    projectV2: Optional[ProjectV2] = None
+    projectsV2: ProjectV2Connection
+    typename__: Optional[Literal['ProjectV2Owner']] = Field(
+        'ProjectV2Owner', alias='__typename'
+    )
+
+
+class ProjectV2Recent(BaseModel):
+    """
+    Recent projects for the owner.
+    """
+
+    recentProjects: ProjectV2Connection
+    typename__: Optional[Literal['ProjectV2Recent']] = Field(
+        'ProjectV2Recent', alias='__typename'
+    )
+
+
+class Reactable(BaseModel):
+    """
+    Represents a subject that can be reacted on.
+    """
+
+    databaseId: Optional[Int] = None
+    id: ID
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    viewerCanReact: Boolean
+    typename__: Optional[Literal['Reactable']] = Field(
+        'Reactable', alias='__typename'
+    )
+
+
+class RepositoryAuditEntryData(BaseModel):
+    """
+    Metadata for an audit entry with action repo.*
+    """
+
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    typename__: Optional[Literal['RepositoryAuditEntryData']] = Field(
+        'RepositoryAuditEntryData', alias='__typename'
+    )
+
+
+class RepositoryDiscussionAuthor(BaseModel):
+    """
+    Represents an author of discussions in repositories.
+    """
+
+    repositoryDiscussions: DiscussionConnection
+    typename__: Optional[Literal['RepositoryDiscussionAuthor']] = Field(
+        'RepositoryDiscussionAuthor', alias='__typename'
+    )
+
+
+class RepositoryDiscussionCommentAuthor(BaseModel):
+    """
+    Represents an author of discussion comments in repositories.
+    """
+
+    repositoryDiscussionComments: DiscussionCommentConnection
+    typename__: Optional[Literal['RepositoryDiscussionCommentAuthor']] = Field(
+        'RepositoryDiscussionCommentAuthor', alias='__typename'
+    )
+
+
+class RepositoryInfo(BaseModel):
+    """
+    A subset of repository info.
+    """
+
+    archivedAt: Optional[DateTime] = None
+    createdAt: DateTime
+    description: Optional[String] = None
+    descriptionHTML: HTML
+    forkCount: Int
+    hasDiscussionsEnabled: Boolean
+    hasIssuesEnabled: Boolean
+    hasProjectsEnabled: Boolean
+    hasWikiEnabled: Boolean
+    homepageUrl: Optional[URI] = None
+    isArchived: Boolean
+    isFork: Boolean
+    isInOrganization: Boolean
+    isLocked: Boolean
+    isMirror: Boolean
+    isPrivate: Boolean
+    isTemplate: Boolean
+    licenseInfo: Optional[License] = None
+    lockReason: Optional[RepositoryLockReason] = None
+    mirrorUrl: Optional[URI] = None
+    name: String
+    nameWithOwner: String
+    openGraphImageUrl: URI
+    owner: RepositoryOwner
+    pushedAt: Optional[DateTime] = None
+    resourcePath: URI
+    shortDescriptionHTML: HTML
+    updatedAt: DateTime
+    url: URI
+    usesCustomOpenGraphImage: Boolean
+    visibility: RepositoryVisibility
+    typename__: Optional[Literal['RepositoryInfo']] = Field(
+        'RepositoryInfo', alias='__typename'
+    )
+
+
+class RepositoryNode(BaseModel):
+    """
+    Represents a object that belongs to a repository.
+    """
+
+    repository: Repository
+    typename__: Optional[Literal['RepositoryNode']] = Field(
+        'RepositoryNode', alias='__typename'
+    )
+
+
+class RepositoryOwner(BaseModel):
+    """
+    Represents an owner of a Repository.
+    """
+
+    avatarUrl: URI
+    id: ID
+    login: String
+    repositories: RepositoryConnection
+    repository: Optional[Repository] = None
+    resourcePath: URI
+    url: URI
+    typename__: Optional[Literal['RepositoryOwner']] = Field(
+        'RepositoryOwner', alias='__typename'
+    )
+
+
+class Sponsorable(BaseModel):
+    """
+    Entities that can sponsor or be sponsored through GitHub Sponsors.
+    """
+
+    estimatedNextSponsorsPayoutInCents: Int
+    hasSponsorsListing: Boolean
+    isSponsoredBy: Boolean
+    isSponsoringViewer: Boolean
+    monthlyEstimatedSponsorsIncomeInCents: Int
+    sponsoring: SponsorConnection
+    sponsors: SponsorConnection
+    sponsorsActivities: SponsorsActivityConnection
+    sponsorsListing: Optional[SponsorsListing] = None
+    sponsorshipForViewerAsSponsor: Optional[Sponsorship] = None
+    sponsorshipForViewerAsSponsorable: Optional[Sponsorship] = None
+    sponsorshipNewsletters: SponsorshipNewsletterConnection
+    sponsorshipsAsMaintainer: SponsorshipConnection
+    sponsorshipsAsSponsor: SponsorshipConnection
+    totalSponsorshipAmountAsSponsorInCents: Optional[Int] = None
+    viewerCanSponsor: Boolean
+    viewerIsSponsoring: Boolean
+    typename__: Optional[Literal['Sponsorable']] = Field(
+        'Sponsorable', alias='__typename'
+    )
+
+
+class Starrable(BaseModel):
+    """
+    Things that can be starred.
+    """
+
+    id: ID
+    stargazerCount: Int
+    stargazers: StargazerConnection
+    viewerHasStarred: Boolean
+    typename__: Optional[Literal['Starrable']] = Field(
+        'Starrable', alias='__typename'
+    )
+
+
+class TeamAuditEntryData(BaseModel):
+    """
+    Metadata for an audit entry with action team.*
+    """
+
+    team: Optional[Team] = None
+    teamName: Optional[String] = None
+    teamResourcePath: Optional[URI] = None
+    teamUrl: Optional[URI] = None
+    typename__: Optional[Literal['TeamAuditEntryData']] = Field(
+        'TeamAuditEntryData', alias='__typename'
+    )
+
+
+class TopicAuditEntryData(BaseModel):
+    """
+    Metadata for an audit entry with a topic.
+    """
+
+    topic: Optional[Topic] = None
+    topicName: Optional[String] = None
+    typename__: Optional[Literal['TopicAuditEntryData']] = Field(
+        'TopicAuditEntryData', alias='__typename'
+    )
+
+
+class AddedToMergeQueueEvent(Node):
+    """
+    Represents an 'added_to_merge_queue' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    enqueuer: Optional[User] = None
+    id: ID
+    mergeQueue: Optional[MergeQueue] = None
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['AddedToMergeQueueEvent']] = Field(
+        'AddedToMergeQueueEvent', alias='__typename'
+    )
+
+
+class AddedToProjectEvent(Node):
+    """
+    Represents a 'added_to_project' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    id: ID
+    project: Optional[Project] = None
+    projectCard: Optional[ProjectCard] = None
+    projectColumnName: String
+    typename__: Optional[Literal['AddedToProjectEvent']] = Field(
+        'AddedToProjectEvent', alias='__typename'
+    )
+
+
+class App(Node):
+    """
+    A GitHub App.
+    """
+
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    description: Optional[String] = None
+    id: ID
+    ipAllowListEntries: IpAllowListEntryConnection
+    logoBackgroundColor: String
+    logoUrl: URI
+    name: String
+    slug: String
+    updatedAt: DateTime
+    url: URI
+    typename__: Optional[Literal['App']] = Field('App', alias='__typename')
+
+
+class AssignedEvent(Node):
+    """
+    Represents an 'assigned' event on any assignable object.
+    """
+
+    actor: Optional[Actor] = None
+    assignable: Assignable
+    assignee: Optional[Assignee] = None
+    createdAt: DateTime
+    id: ID
+    user: Optional[User] = None
+    typename__: Optional[Literal['AssignedEvent']] = Field(
+        'AssignedEvent', alias='__typename'
+    )
+
+
+class AutoMergeDisabledEvent(Node):
+    """
+    Represents a 'auto_merge_disabled' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    disabler: Optional[User] = None
+    id: ID
+    pullRequest: Optional[PullRequest] = None
+    reason: Optional[String] = None
+    reasonCode: Optional[String] = None
+    typename__: Optional[Literal['AutoMergeDisabledEvent']] = Field(
+        'AutoMergeDisabledEvent', alias='__typename'
+    )
+
+
+class AutoMergeEnabledEvent(Node):
+    """
+    Represents a 'auto_merge_enabled' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    enabler: Optional[User] = None
+    id: ID
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['AutoMergeEnabledEvent']] = Field(
+        'AutoMergeEnabledEvent', alias='__typename'
+    )
+
+
+class AutoMergeRequest(BaseModel):
+    """
+    Represents an auto-merge request for a pull request
+    """
+
+    authorEmail: Optional[String] = None
+    commitBody: Optional[String] = None
+    commitHeadline: Optional[String] = None
+    enabledAt: Optional[DateTime] = None
+    enabledBy: Optional[Actor] = None
+    mergeMethod: PullRequestMergeMethod
+    pullRequest: PullRequest
+    typename__: Optional[Literal['AutoMergeRequest']] = Field(
+        'AutoMergeRequest', alias='__typename'
+    )
+
+
+class AutoRebaseEnabledEvent(Node):
+    """
+    Represents a 'auto_rebase_enabled' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    enabler: Optional[User] = None
+    id: ID
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['AutoRebaseEnabledEvent']] = Field(
+        'AutoRebaseEnabledEvent', alias='__typename'
+    )
+
+
+class AutoSquashEnabledEvent(Node):
+    """
+    Represents a 'auto_squash_enabled' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    enabler: Optional[User] = None
+    id: ID
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['AutoSquashEnabledEvent']] = Field(
+        'AutoSquashEnabledEvent', alias='__typename'
+    )
+
+
+class AutomaticBaseChangeFailedEvent(Node):
+    """
+    Represents a 'automatic_base_change_failed' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    newBase: String
+    oldBase: String
+    pullRequest: PullRequest
+    typename__: Optional[Literal['AutomaticBaseChangeFailedEvent']] = Field(
+        'AutomaticBaseChangeFailedEvent', alias='__typename'
+    )
+
+
+class AutomaticBaseChangeSucceededEvent(Node):
+    """
+    Represents a 'automatic_base_change_succeeded' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    newBase: String
+    oldBase: String
+    pullRequest: PullRequest
+    typename__: Optional[Literal['AutomaticBaseChangeSucceededEvent']] = Field(
+        'AutomaticBaseChangeSucceededEvent', alias='__typename'
+    )
+
+
+class BaseRefChangedEvent(Node):
+    """
+    Represents a 'base_ref_changed' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    currentRefName: String
+    databaseId: Optional[Int] = None
+    id: ID
+    previousRefName: String
+    pullRequest: PullRequest
+    typename__: Optional[Literal['BaseRefChangedEvent']] = Field(
+        'BaseRefChangedEvent', alias='__typename'
+    )
+
+
+class BaseRefDeletedEvent(Node):
+    """
+    Represents a 'base_ref_deleted' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    baseRefName: Optional[String] = None
+    createdAt: DateTime
+    id: ID
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['BaseRefDeletedEvent']] = Field(
+        'BaseRefDeletedEvent', alias='__typename'
+    )
+
+
+class BaseRefForcePushedEvent(Node):
+    """
+    Represents a 'base_ref_force_pushed' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    afterCommit: Optional[Commit] = None
+    beforeCommit: Optional[Commit] = None
+    createdAt: DateTime
+    id: ID
+    pullRequest: PullRequest
+    ref: Optional[Ref] = None
+    typename__: Optional[Literal['BaseRefForcePushedEvent']] = Field(
+        'BaseRefForcePushedEvent', alias='__typename'
+    )
+
+
+class Blame(BaseModel):
+    """
+    Represents a Git blame.
+    """
+
+    ranges: List[BlameRange]
+    typename__: Optional[Literal['Blame']] = Field('Blame', alias='__typename')
+
+
+class BlameRange(BaseModel):
+    """
+    Represents a range of information from a Git blame.
+    """
+
+    age: Int
+    commit: Commit
+    endingLine: Int
+    startingLine: Int
+    typename__: Optional[Literal['BlameRange']] = Field(
+        'BlameRange', alias='__typename'
+    )
+
+
+class BranchProtectionRule(Node):
+    """
+    A branch protection rule.
+    """
+
+    allowsDeletions: Boolean
+    allowsForcePushes: Boolean
+    blocksCreations: Boolean
+    branchProtectionRuleConflicts: BranchProtectionRuleConflictConnection
+    bypassForcePushAllowances: BypassForcePushAllowanceConnection
+    bypassPullRequestAllowances: BypassPullRequestAllowanceConnection
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    dismissesStaleReviews: Boolean
+    id: ID
+    isAdminEnforced: Boolean
+    lockAllowsFetchAndMerge: Boolean
+    lockBranch: Boolean
+    matchingRefs: RefConnection
+    pattern: String
+    pushAllowances: PushAllowanceConnection
+    repository: Optional[Repository] = None
+    requireLastPushApproval: Boolean
+    requiredApprovingReviewCount: Optional[Int] = None
+    requiredDeploymentEnvironments: Optional[List[Optional[String]]] = Field(
+        default_factory=list
+    )
+    requiredStatusCheckContexts: Optional[List[Optional[String]]] = Field(
+        default_factory=list
+    )
+    requiredStatusChecks: Optional[
+        List[RequiredStatusCheckDescription]
+    ] = Field(default_factory=list)
+    requiresApprovingReviews: Boolean
+    requiresCodeOwnerReviews: Boolean
+    requiresCommitSignatures: Boolean
+    requiresConversationResolution: Boolean
+    requiresDeployments: Boolean
+    requiresLinearHistory: Boolean
+    requiresStatusChecks: Boolean
+    requiresStrictStatusChecks: Boolean
+    restrictsPushes: Boolean
+    restrictsReviewDismissals: Boolean
+    reviewDismissalAllowances: ReviewDismissalAllowanceConnection
+    typename__: Optional[Literal['BranchProtectionRule']] = Field(
+        'BranchProtectionRule', alias='__typename'
+    )
+
+
+class BranchProtectionRuleConflict(BaseModel):
+    """
+    A conflict between two branch protection rules.
+    """
+
+    branchProtectionRule: Optional[BranchProtectionRule] = None
+    conflictingBranchProtectionRule: Optional[BranchProtectionRule] = None
+    ref: Optional[Ref] = None
+    typename__: Optional[Literal['BranchProtectionRuleConflict']] = Field(
+        'BranchProtectionRuleConflict', alias='__typename'
+    )
+
+
+class BranchProtectionRuleConflictConnection(BaseModel):
+    """
+    The connection type for BranchProtectionRuleConflict.
+    """
+
+    edges: Optional[List[Optional[BranchProtectionRuleConflictEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[BranchProtectionRuleConflict]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['BranchProtectionRuleConflictConnection']
+    ] = Field('BranchProtectionRuleConflictConnection', alias='__typename')
+
+
+class BranchProtectionRuleConflictEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[BranchProtectionRuleConflict] = None
+    typename__: Optional[Literal['BranchProtectionRuleConflictEdge']] = Field(
+        'BranchProtectionRuleConflictEdge', alias='__typename'
+    )
+
+
+class BranchProtectionRuleConnection(BaseModel):
+    """
+    The connection type for BranchProtectionRule.
+    """
+
+    edges: Optional[List[Optional[BranchProtectionRuleEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[BranchProtectionRule]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['BranchProtectionRuleConnection']] = Field(
+        'BranchProtectionRuleConnection', alias='__typename'
+    )
+
+
+class BranchProtectionRuleEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[BranchProtectionRule] = None
+    typename__: Optional[Literal['BranchProtectionRuleEdge']] = Field(
+        'BranchProtectionRuleEdge', alias='__typename'
+    )
+
+
+class BypassForcePushAllowance(Node):
+    """
+    A user, team, or app who has the ability to bypass a force push requirement on a protected branch.
+    """
+
+    actor: Optional[BranchActorAllowanceActor] = None
+    branchProtectionRule: Optional[BranchProtectionRule] = None
+    id: ID
+    typename__: Optional[Literal['BypassForcePushAllowance']] = Field(
+        'BypassForcePushAllowance', alias='__typename'
+    )
+
+
+class BypassForcePushAllowanceConnection(BaseModel):
+    """
+    The connection type for BypassForcePushAllowance.
+    """
+
+    edges: Optional[List[Optional[BypassForcePushAllowanceEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[BypassForcePushAllowance]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['BypassForcePushAllowanceConnection']
+    ] = Field('BypassForcePushAllowanceConnection', alias='__typename')
+
+
+class BypassForcePushAllowanceEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[BypassForcePushAllowance] = None
+    typename__: Optional[Literal['BypassForcePushAllowanceEdge']] = Field(
+        'BypassForcePushAllowanceEdge', alias='__typename'
+    )
+
+
+class BypassPullRequestAllowance(Node):
+    """
+    A user, team, or app who has the ability to bypass a pull request requirement on a protected branch.
+    """
+
+    actor: Optional[BranchActorAllowanceActor] = None
+    branchProtectionRule: Optional[BranchProtectionRule] = None
+    id: ID
+    typename__: Optional[Literal['BypassPullRequestAllowance']] = Field(
+        'BypassPullRequestAllowance', alias='__typename'
+    )
+
+
+class BypassPullRequestAllowanceConnection(BaseModel):
+    """
+    The connection type for BypassPullRequestAllowance.
+    """
+
+    edges: Optional[List[Optional[BypassPullRequestAllowanceEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[BypassPullRequestAllowance]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['BypassPullRequestAllowanceConnection']
+    ] = Field('BypassPullRequestAllowanceConnection', alias='__typename')
+
+
+class BypassPullRequestAllowanceEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[BypassPullRequestAllowance] = None
+    typename__: Optional[Literal['BypassPullRequestAllowanceEdge']] = Field(
+        'BypassPullRequestAllowanceEdge', alias='__typename'
+    )
+
+
+class CheckRun(Node, RequirableByPullRequest, UniformResourceLocatable):
+    """
+    A check run.
+    """
+
+    annotations: Optional[CheckAnnotationConnection] = None
+    checkSuite: CheckSuite
+    completedAt: Optional[DateTime] = None
+    conclusion: Optional[CheckConclusionState] = None
+    databaseId: Optional[Int] = None
+    deployment: Optional[Deployment] = None
+    detailsUrl: Optional[URI] = None
+    externalId: Optional[String] = None
+    id: ID
+    isRequired: Boolean
+    name: String
+    pendingDeploymentRequest: Optional[DeploymentRequest] = None
+    permalink: URI
+    repository: Repository
+    resourcePath: URI
+    startedAt: Optional[DateTime] = None
+    status: CheckStatusState
+    steps: Optional[CheckStepConnection] = None
+    summary: Optional[String] = None
+    text: Optional[String] = None
+    title: Optional[String] = None
+    url: URI
+    typename__: Optional[Literal['CheckRun']] = Field(
+        'CheckRun', alias='__typename'
+    )
+
+
+class CheckRunConnection(BaseModel):
+    """
+    The connection type for CheckRun.
+    """
+
+    edges: Optional[List[Optional[CheckRunEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[CheckRun]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['CheckRunConnection']] = Field(
+        'CheckRunConnection', alias='__typename'
+    )
+
+
+class CheckRunEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[CheckRun] = None
+    typename__: Optional[Literal['CheckRunEdge']] = Field(
+        'CheckRunEdge', alias='__typename'
+    )
+
+
+class CheckSuite(Node):
+    """
+    A check suite.
+    """
+
+    app: Optional[App] = None
+    branch: Optional[Ref] = None
+    checkRuns: Optional[CheckRunConnection] = None
+    commit: Commit
+    conclusion: Optional[CheckConclusionState] = None
+    createdAt: DateTime
+    creator: Optional[User] = None
+    databaseId: Optional[Int] = None
+    id: ID
+    matchingPullRequests: Optional[PullRequestConnection] = None
+    push: Optional[Push] = None
+    repository: Repository
+    resourcePath: URI
+    status: CheckStatusState
+    updatedAt: DateTime
+    url: URI
+    workflowRun: Optional[WorkflowRun] = None
+    typename__: Optional[Literal['CheckSuite']] = Field(
+        'CheckSuite', alias='__typename'
+    )
+
+
+class CheckSuiteConnection(BaseModel):
+    """
+    The connection type for CheckSuite.
+    """
+
+    edges: Optional[List[Optional[CheckSuiteEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[CheckSuite]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['CheckSuiteConnection']] = Field(
+        'CheckSuiteConnection', alias='__typename'
+    )
+
+
+class CheckSuiteEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[CheckSuite] = None
+    typename__: Optional[Literal['CheckSuiteEdge']] = Field(
+        'CheckSuiteEdge', alias='__typename'
+    )
+
+
+class ClosedEvent(Node, UniformResourceLocatable):
+    """
+    Represents a 'closed' event on any `Closable`.
+    """
+
+    actor: Optional[Actor] = None
+    closable: Closable
+    closer: Optional[Closer] = None
+    createdAt: DateTime
+    id: ID
+    resourcePath: URI
+    stateReason: Optional[IssueStateReason] = None
+    url: URI
+    typename__: Optional[Literal['ClosedEvent']] = Field(
+        'ClosedEvent', alias='__typename'
+    )
+
+
+class Commit(GitObject, Node, Subscribable, UniformResourceLocatable):
+    """
+    Represents a Git commit.
+    """
+
+    abbreviatedOid: String
+    additions: Int
+    associatedPullRequests: Optional[PullRequestConnection] = None
+    author: Optional[GitActor] = None
+    authoredByCommitter: Boolean
+    authoredDate: DateTime
+    authors: GitActorConnection
+    blame: Blame
+    changedFiles: Int
+    changedFilesIfAvailable: Optional[Int] = None
+    checkSuites: Optional[CheckSuiteConnection] = None
+    comments: CommitCommentConnection
+    commitResourcePath: URI
+    commitUrl: URI
+    committedDate: DateTime
+    committedViaWeb: Boolean
+    committer: Optional[GitActor] = None
+    deletions: Int
+    deployments: Optional[DeploymentConnection] = None
+    file: Optional[TreeEntry] = None
+    history: CommitHistoryConnection
+    id: ID
+    message: String
+    messageBody: String
+    messageBodyHTML: HTML
+    messageHeadline: String
+    messageHeadlineHTML: HTML
+    oid: GitObjectID
+    onBehalfOf: Optional[Organization] = None
+    parents: CommitConnection
+    pushedDate: Optional[DateTime] = None
+    repository: Repository
+    resourcePath: URI
+    signature: Optional[GitSignature] = None
+    status: Optional[Status] = None
+    statusCheckRollup: Optional[StatusCheckRollup] = None
+    submodules: SubmoduleConnection
+    tarballUrl: URI
+    tree: Tree
+    treeResourcePath: URI
+    treeUrl: URI
+    url: URI
+    viewerCanSubscribe: Boolean
+    viewerSubscription: Optional[SubscriptionState] = None
+    zipballUrl: URI
+    typename__: Optional[Literal['Commit']] = Field(
+        'Commit', alias='__typename'
+    )
+
+
+class CommitComment(
+    Comment,
+    Deletable,
+    Minimizable,
+    Node,
+    Reactable,
+    RepositoryNode,
+    Updatable,
+    UpdatableComment,
+):
+    """
+    Represents a comment on a given Commit.
+    """
+
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    commit: Optional[Commit] = None
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    editor: Optional[Actor] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    isMinimized: Boolean
+    lastEditedAt: Optional[DateTime] = None
+    minimizedReason: Optional[String] = None
+    path: Optional[String] = None
+    position: Optional[Int] = None
+    publishedAt: Optional[DateTime] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    repository: Repository
+    resourcePath: URI
+    updatedAt: DateTime
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanDelete: Boolean
+    viewerCanMinimize: Boolean
+    viewerCanReact: Boolean
+    viewerCanUpdate: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    typename__: Optional[Literal['CommitComment']] = Field(
+        'CommitComment', alias='__typename'
+    )
+
+
+class CommitCommentConnection(BaseModel):
+    """
+    The connection type for CommitComment.
+    """
+
+    edges: Optional[List[Optional[CommitCommentEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[CommitComment]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['CommitCommentConnection']] = Field(
+        'CommitCommentConnection', alias='__typename'
+    )
+
+
+class CommitCommentEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[CommitComment] = None
+    typename__: Optional[Literal['CommitCommentEdge']] = Field(
+        'CommitCommentEdge', alias='__typename'
+    )
+
+
+class CommitCommentThread(Node, RepositoryNode):
+    """
+    A thread of comments on a commit.
+    """
+
+    comments: CommitCommentConnection
+    commit: Optional[Commit] = None
+    id: ID
+    path: Optional[String] = None
+    position: Optional[Int] = None
+    repository: Repository
+    typename__: Optional[Literal['CommitCommentThread']] = Field(
+        'CommitCommentThread', alias='__typename'
+    )
+
+
+class CommitConnection(BaseModel):
+    """
+    The connection type for Commit.
+    """
+
+    edges: Optional[List[Optional[CommitEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Commit]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['CommitConnection']] = Field(
+        'CommitConnection', alias='__typename'
+    )
+
+
+class CommitContributionsByRepository(BaseModel):
+    """
+    This aggregates commits made by a user within one repository.
+    """
+
+    contributions: CreatedCommitContributionConnection
+    repository: Repository
+    resourcePath: URI
+    url: URI
+    typename__: Optional[Literal['CommitContributionsByRepository']] = Field(
+        'CommitContributionsByRepository', alias='__typename'
+    )
+
+
+class CommitEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Commit] = None
+    typename__: Optional[Literal['CommitEdge']] = Field(
+        'CommitEdge', alias='__typename'
+    )
+
+
+class CommitHistoryConnection(BaseModel):
+    """
+    The connection type for Commit.
+    """
+
+    edges: Optional[List[Optional[CommitEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Commit]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['CommitHistoryConnection']] = Field(
+        'CommitHistoryConnection', alias='__typename'
+    )
+
+
+class Comparison(Node):
+    """
+    Represents a comparison between two commit revisions.
+    """
+
+    aheadBy: Int
+    baseTarget: GitObject
+    behindBy: Int
+    commits: ComparisonCommitConnection
+    headTarget: GitObject
+    id: ID
+    status: ComparisonStatus
+    typename__: Optional[Literal['Comparison']] = Field(
+        'Comparison', alias='__typename'
+    )
+
+
+class ComparisonCommitConnection(BaseModel):
+    """
+    The connection type for Commit.
+    """
+
+    authorCount: Int
+    edges: Optional[List[Optional[CommitEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Commit]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ComparisonCommitConnection']] = Field(
+        'ComparisonCommitConnection', alias='__typename'
+    )
+
+
+class ConnectedEvent(Node):
+    """
+    Represents a 'connected' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    isCrossRepository: Boolean
+    source: ReferencedSubject
+    subject: ReferencedSubject
+    typename__: Optional[Literal['ConnectedEvent']] = Field(
+        'ConnectedEvent', alias='__typename'
+    )
+
+
+class ContributionsCollection(BaseModel):
+    """
+    A contributions collection aggregates contributions such as opened issues and commits created by a user.
+    """
+
+    commitContributionsByRepository: List[CommitContributionsByRepository]
+    contributionCalendar: ContributionCalendar
+    contributionYears: List[Int]
+    doesEndInCurrentMonth: Boolean
+    earliestRestrictedContributionDate: Optional[Date] = None
+    endedAt: DateTime
+    firstIssueContribution: Optional[
+        CreatedIssueOrRestrictedContribution
+    ] = None
+    firstPullRequestContribution: Optional[
+        CreatedPullRequestOrRestrictedContribution
+    ] = None
+    firstRepositoryContribution: Optional[
+        CreatedRepositoryOrRestrictedContribution
+    ] = None
+    hasActivityInThePast: Boolean
+    hasAnyContributions: Boolean
+    hasAnyRestrictedContributions: Boolean
+    isSingleDay: Boolean
+    issueContributions: CreatedIssueContributionConnection
+    issueContributionsByRepository: List[IssueContributionsByRepository]
+    joinedGitHubContribution: Optional[JoinedGitHubContribution] = None
+    latestRestrictedContributionDate: Optional[Date] = None
+    mostRecentCollectionWithActivity: Optional[ContributionsCollection] = None
+    mostRecentCollectionWithoutActivity: Optional[
+        ContributionsCollection
+    ] = None
+    popularIssueContribution: Optional[CreatedIssueContribution] = None
+    popularPullRequestContribution: Optional[
+        CreatedPullRequestContribution
+    ] = None
+    pullRequestContributions: CreatedPullRequestContributionConnection
+    pullRequestContributionsByRepository: List[
+        PullRequestContributionsByRepository
+    ]
+    pullRequestReviewContributions: CreatedPullRequestReviewContributionConnection
+    pullRequestReviewContributionsByRepository: List[
+        PullRequestReviewContributionsByRepository
+    ]
+    repositoryContributions: CreatedRepositoryContributionConnection
+    restrictedContributionsCount: Int
+    startedAt: DateTime
+    totalCommitContributions: Int
+    totalIssueContributions: Int
+    totalPullRequestContributions: Int
+    totalPullRequestReviewContributions: Int
+    totalRepositoriesWithContributedCommits: Int
+    totalRepositoriesWithContributedIssues: Int
+    totalRepositoriesWithContributedPullRequestReviews: Int
+    totalRepositoriesWithContributedPullRequests: Int
+    totalRepositoryContributions: Int
+    user: User
+    typename__: Optional[Literal['ContributionsCollection']] = Field(
+        'ContributionsCollection', alias='__typename'
+    )
+
+
+class ConvertToDraftEvent(Node, UniformResourceLocatable):
+    """
+    Represents a 'convert_to_draft' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    pullRequest: PullRequest
+    resourcePath: URI
+    url: URI
+    typename__: Optional[Literal['ConvertToDraftEvent']] = Field(
+        'ConvertToDraftEvent', alias='__typename'
+    )
+
+
+class ConvertedNoteToIssueEvent(Node):
+    """
+    Represents a 'converted_note_to_issue' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    id: ID
+    project: Optional[Project] = None
+    projectCard: Optional[ProjectCard] = None
+    projectColumnName: String
+    typename__: Optional[Literal['ConvertedNoteToIssueEvent']] = Field(
+        'ConvertedNoteToIssueEvent', alias='__typename'
+    )
+
+
+class ConvertedToDiscussionEvent(Node):
+    """
+    Represents a 'converted_to_discussion' event on a given issue.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    discussion: Optional[Discussion] = None
+    id: ID
+    typename__: Optional[Literal['ConvertedToDiscussionEvent']] = Field(
+        'ConvertedToDiscussionEvent', alias='__typename'
+    )
+
+
+class CreatedCommitContribution(Contribution):
+    """
+    Represents the contribution a user made by committing to a repository.
+    """
+
+    commitCount: Int
+    isRestricted: Boolean
+    occurredAt: DateTime
+    repository: Repository
+    resourcePath: URI
+    url: URI
+    user: User
+    typename__: Optional[Literal['CreatedCommitContribution']] = Field(
+        'CreatedCommitContribution', alias='__typename'
+    )
+
+
+class CreatedCommitContributionConnection(BaseModel):
+    """
+    The connection type for CreatedCommitContribution.
+    """
+
+    edges: Optional[List[Optional[CreatedCommitContributionEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[CreatedCommitContribution]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['CreatedCommitContributionConnection']
+    ] = Field('CreatedCommitContributionConnection', alias='__typename')
+
+
+class CreatedCommitContributionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[CreatedCommitContribution] = None
+    typename__: Optional[Literal['CreatedCommitContributionEdge']] = Field(
+        'CreatedCommitContributionEdge', alias='__typename'
+    )
+
+
+class CreatedIssueContribution(Contribution):
+    """
+    Represents the contribution a user made on GitHub by opening an issue.
+    """
+
+    isRestricted: Boolean
+    issue: Issue
+    occurredAt: DateTime
+    resourcePath: URI
+    url: URI
+    user: User
+    typename__: Optional[Literal['CreatedIssueContribution']] = Field(
+        'CreatedIssueContribution', alias='__typename'
+    )
+
+
+class CreatedIssueContributionConnection(BaseModel):
+    """
+    The connection type for CreatedIssueContribution.
+    """
+
+    edges: Optional[List[Optional[CreatedIssueContributionEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[CreatedIssueContribution]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['CreatedIssueContributionConnection']
+    ] = Field('CreatedIssueContributionConnection', alias='__typename')
+
+
+class CreatedIssueContributionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[CreatedIssueContribution] = None
+    typename__: Optional[Literal['CreatedIssueContributionEdge']] = Field(
+        'CreatedIssueContributionEdge', alias='__typename'
+    )
+
+
+class CreatedPullRequestContribution(Contribution):
+    """
+    Represents the contribution a user made on GitHub by opening a pull request.
+    """
+
+    isRestricted: Boolean
+    occurredAt: DateTime
+    pullRequest: PullRequest
+    resourcePath: URI
+    url: URI
+    user: User
+    typename__: Optional[Literal['CreatedPullRequestContribution']] = Field(
+        'CreatedPullRequestContribution', alias='__typename'
+    )
+
+
+class CreatedPullRequestContributionConnection(BaseModel):
+    """
+    The connection type for CreatedPullRequestContribution.
+    """
+
+    edges: Optional[
+        List[Optional[CreatedPullRequestContributionEdge]]
+    ] = Field(default_factory=list)
+    nodes: Optional[List[Optional[CreatedPullRequestContribution]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['CreatedPullRequestContributionConnection']
+    ] = Field('CreatedPullRequestContributionConnection', alias='__typename')
+
+
+class CreatedPullRequestContributionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[CreatedPullRequestContribution] = None
+    typename__: Optional[
+        Literal['CreatedPullRequestContributionEdge']
+    ] = Field('CreatedPullRequestContributionEdge', alias='__typename')
+
+
+class CreatedPullRequestReviewContribution(Contribution):
+    """
+    Represents the contribution a user made by leaving a review on a pull request.
+    """
+
+    isRestricted: Boolean
+    occurredAt: DateTime
+    pullRequest: PullRequest
+    pullRequestReview: PullRequestReview
+    repository: Repository
+    resourcePath: URI
+    url: URI
+    user: User
+    typename__: Optional[
+        Literal['CreatedPullRequestReviewContribution']
+    ] = Field('CreatedPullRequestReviewContribution', alias='__typename')
+
+
+class CreatedPullRequestReviewContributionConnection(BaseModel):
+    """
+    The connection type for CreatedPullRequestReviewContribution.
+    """
+
+    edges: Optional[
+        List[Optional[CreatedPullRequestReviewContributionEdge]]
+    ] = Field(default_factory=list)
+    nodes: Optional[
+        List[Optional[CreatedPullRequestReviewContribution]]
+    ] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['CreatedPullRequestReviewContributionConnection']
+    ] = Field(
+        'CreatedPullRequestReviewContributionConnection', alias='__typename'
+    )
+
+
+class CreatedPullRequestReviewContributionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[CreatedPullRequestReviewContribution] = None
+    typename__: Optional[
+        Literal['CreatedPullRequestReviewContributionEdge']
+    ] = Field('CreatedPullRequestReviewContributionEdge', alias='__typename')
+
+
+class CreatedRepositoryContribution(Contribution):
+    """
+    Represents the contribution a user made on GitHub by creating a repository.
+    """
+
+    isRestricted: Boolean
+    occurredAt: DateTime
+    repository: Repository
+    resourcePath: URI
+    url: URI
+    user: User
+    typename__: Optional[Literal['CreatedRepositoryContribution']] = Field(
+        'CreatedRepositoryContribution', alias='__typename'
+    )
+
+
+class CreatedRepositoryContributionConnection(BaseModel):
+    """
+    The connection type for CreatedRepositoryContribution.
+    """
+
+    edges: Optional[List[Optional[CreatedRepositoryContributionEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[CreatedRepositoryContribution]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['CreatedRepositoryContributionConnection']
+    ] = Field('CreatedRepositoryContributionConnection', alias='__typename')
+
+
+class CreatedRepositoryContributionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[CreatedRepositoryContribution] = None
+    typename__: Optional[Literal['CreatedRepositoryContributionEdge']] = Field(
+        'CreatedRepositoryContributionEdge', alias='__typename'
+    )
+
+
+class CrossReferencedEvent(Node, UniformResourceLocatable):
+    """
+    Represents a mention made by one issue or pull request to another.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    isCrossRepository: Boolean
+    referencedAt: DateTime
+    resourcePath: URI
+    source: ReferencedSubject
+    target: ReferencedSubject
+    url: URI
+    willCloseTarget: Boolean
+    typename__: Optional[Literal['CrossReferencedEvent']] = Field(
+        'CrossReferencedEvent', alias='__typename'
+    )
+
+
+class DemilestonedEvent(Node):
+    """
+    Represents a 'demilestoned' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    milestoneTitle: String
+    subject: MilestoneItem
+    typename__: Optional[Literal['DemilestonedEvent']] = Field(
+        'DemilestonedEvent', alias='__typename'
+    )
+
+
+class DependabotUpdate(RepositoryNode):
+    """
+    A Dependabot Update for a dependency in a repository
+    """
+
+    error: Optional[DependabotUpdateError] = None
+    pullRequest: Optional[PullRequest] = None
+    repository: Repository
+    typename__: Optional[Literal['DependabotUpdate']] = Field(
+        'DependabotUpdate', alias='__typename'
+    )
+
+
+class DependencyGraphDependency(BaseModel):
+    """
+    A dependency manifest entry
+    """
+
+    hasDependencies: Boolean
+    packageLabel: String
+    packageManager: Optional[String] = None
+    packageName: String
+    repository: Optional[Repository] = None
+    requirements: String
+    typename__: Optional[Literal['DependencyGraphDependency']] = Field(
+        'DependencyGraphDependency', alias='__typename'
+    )
+
+
+class DependencyGraphDependencyConnection(BaseModel):
+    """
+    The connection type for DependencyGraphDependency.
+    """
+
+    edges: Optional[List[Optional[DependencyGraphDependencyEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DependencyGraphDependency]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['DependencyGraphDependencyConnection']
+    ] = Field('DependencyGraphDependencyConnection', alias='__typename')
+
+
+class DependencyGraphDependencyEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DependencyGraphDependency] = None
+    typename__: Optional[Literal['DependencyGraphDependencyEdge']] = Field(
+        'DependencyGraphDependencyEdge', alias='__typename'
+    )
+
+
+class DependencyGraphManifest(Node):
+    """
+    Dependency manifest for a repository
+    """
+
+    blobPath: String
+    dependencies: Optional[DependencyGraphDependencyConnection] = None
+    dependenciesCount: Optional[Int] = None
+    exceedsMaxSize: Boolean
+    filename: String
+    id: ID
+    parseable: Boolean
+    repository: Repository
+    typename__: Optional[Literal['DependencyGraphManifest']] = Field(
+        'DependencyGraphManifest', alias='__typename'
+    )
+
+
+class DependencyGraphManifestConnection(BaseModel):
+    """
+    The connection type for DependencyGraphManifest.
+    """
+
+    edges: Optional[List[Optional[DependencyGraphManifestEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DependencyGraphManifest]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DependencyGraphManifestConnection']] = Field(
+        'DependencyGraphManifestConnection', alias='__typename'
+    )
+
+
+class DependencyGraphManifestEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DependencyGraphManifest] = None
+    typename__: Optional[Literal['DependencyGraphManifestEdge']] = Field(
+        'DependencyGraphManifestEdge', alias='__typename'
+    )
+
+
+class DeployedEvent(Node):
+    """
+    Represents a 'deployed' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    deployment: Deployment
+    id: ID
+    pullRequest: PullRequest
+    ref: Optional[Ref] = None
+    typename__: Optional[Literal['DeployedEvent']] = Field(
+        'DeployedEvent', alias='__typename'
+    )
+
+
+class Deployment(Node):
+    """
+    Represents triggered deployment instance.
+    """
+
+    commit: Optional[Commit] = None
+    commitOid: String
+    createdAt: DateTime
+    creator: Actor
+    databaseId: Optional[Int] = None
+    description: Optional[String] = None
+    environment: Optional[String] = None
+    id: ID
+    latestEnvironment: Optional[String] = None
+    latestStatus: Optional[DeploymentStatus] = None
+    originalEnvironment: Optional[String] = None
+    payload: Optional[String] = None
+    ref: Optional[Ref] = None
+    repository: Repository
+    state: Optional[DeploymentState] = None
+    statuses: Optional[DeploymentStatusConnection] = None
+    task: Optional[String] = None
+    updatedAt: DateTime
+    typename__: Optional[Literal['Deployment']] = Field(
+        'Deployment', alias='__typename'
+    )
+
+
+class DeploymentConnection(BaseModel):
+    """
+    The connection type for Deployment.
+    """
+
+    edges: Optional[List[Optional[DeploymentEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Deployment]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DeploymentConnection']] = Field(
+        'DeploymentConnection', alias='__typename'
+    )
+
+
+class DeploymentEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Deployment] = None
+    typename__: Optional[Literal['DeploymentEdge']] = Field(
+        'DeploymentEdge', alias='__typename'
+    )
+
+
+class DeploymentEnvironmentChangedEvent(Node):
+    """
+    Represents a 'deployment_environment_changed' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    deploymentStatus: DeploymentStatus
+    id: ID
+    pullRequest: PullRequest
+    typename__: Optional[Literal['DeploymentEnvironmentChangedEvent']] = Field(
+        'DeploymentEnvironmentChangedEvent', alias='__typename'
+    )
+
+
+class DeploymentProtectionRule(BaseModel):
+    """
+    A protection rule.
+    """
+
+    databaseId: Optional[Int] = None
+    preventSelfReview: Optional[Boolean] = None
+    reviewers: DeploymentReviewerConnection
+    timeout: Int
+    type: DeploymentProtectionRuleType
+    typename__: Optional[Literal['DeploymentProtectionRule']] = Field(
+        'DeploymentProtectionRule', alias='__typename'
+    )
+
+
+class DeploymentProtectionRuleConnection(BaseModel):
+    """
+    The connection type for DeploymentProtectionRule.
+    """
+
+    edges: Optional[List[Optional[DeploymentProtectionRuleEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DeploymentProtectionRule]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['DeploymentProtectionRuleConnection']
+    ] = Field('DeploymentProtectionRuleConnection', alias='__typename')
+
+
+class DeploymentProtectionRuleEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DeploymentProtectionRule] = None
+    typename__: Optional[Literal['DeploymentProtectionRuleEdge']] = Field(
+        'DeploymentProtectionRuleEdge', alias='__typename'
+    )
+
+
+class DeploymentRequest(BaseModel):
+    """
+    A request to deploy a workflow run to an environment.
+    """
+
+    currentUserCanApprove: Boolean
+    environment: Environment
+    reviewers: DeploymentReviewerConnection
+    waitTimer: Int
+    waitTimerStartedAt: Optional[DateTime] = None
+    typename__: Optional[Literal['DeploymentRequest']] = Field(
+        'DeploymentRequest', alias='__typename'
+    )
+
+
+class DeploymentRequestConnection(BaseModel):
+    """
+    The connection type for DeploymentRequest.
+    """
+
+    edges: Optional[List[Optional[DeploymentRequestEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DeploymentRequest]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DeploymentRequestConnection']] = Field(
+        'DeploymentRequestConnection', alias='__typename'
+    )
+
+
+class DeploymentRequestEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DeploymentRequest] = None
+    typename__: Optional[Literal['DeploymentRequestEdge']] = Field(
+        'DeploymentRequestEdge', alias='__typename'
+    )
+
+
+class DeploymentReview(Node):
+    """
+    A deployment review.
+    """
+
+    comment: String
+    databaseId: Optional[Int] = None
+    environments: EnvironmentConnection
+    id: ID
+    state: DeploymentReviewState
+    user: User
+    typename__: Optional[Literal['DeploymentReview']] = Field(
+        'DeploymentReview', alias='__typename'
+    )
+
+
+class DeploymentReviewConnection(BaseModel):
+    """
+    The connection type for DeploymentReview.
+    """
+
+    edges: Optional[List[Optional[DeploymentReviewEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DeploymentReview]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DeploymentReviewConnection']] = Field(
+        'DeploymentReviewConnection', alias='__typename'
+    )
+
+
+class DeploymentReviewEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DeploymentReview] = None
+    typename__: Optional[Literal['DeploymentReviewEdge']] = Field(
+        'DeploymentReviewEdge', alias='__typename'
+    )
+
+
+class DeploymentReviewerConnection(BaseModel):
+    """
+    The connection type for DeploymentReviewer.
+    """
+
+    edges: Optional[List[Optional[DeploymentReviewerEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DeploymentReviewer]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DeploymentReviewerConnection']] = Field(
+        'DeploymentReviewerConnection', alias='__typename'
+    )
+
+
+class DeploymentReviewerEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DeploymentReviewer] = None
+    typename__: Optional[Literal['DeploymentReviewerEdge']] = Field(
+        'DeploymentReviewerEdge', alias='__typename'
+    )
+
+
+class DeploymentStatus(Node):
+    """
+    Describes the status of a given deployment attempt.
+    """
+
+    createdAt: DateTime
+    creator: Actor
+    deployment: Deployment
+    description: Optional[String] = None
+    environment: Optional[String] = None
+    environmentUrl: Optional[URI] = None
+    id: ID
+    logUrl: Optional[URI] = None
+    state: DeploymentStatusState
+    updatedAt: DateTime
+    typename__: Optional[Literal['DeploymentStatus']] = Field(
+        'DeploymentStatus', alias='__typename'
+    )
+
+
+class DeploymentStatusConnection(BaseModel):
+    """
+    The connection type for DeploymentStatus.
+    """
+
+    edges: Optional[List[Optional[DeploymentStatusEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DeploymentStatus]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DeploymentStatusConnection']] = Field(
+        'DeploymentStatusConnection', alias='__typename'
+    )
+
+
+class DeploymentStatusEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DeploymentStatus] = None
+    typename__: Optional[Literal['DeploymentStatusEdge']] = Field(
+        'DeploymentStatusEdge', alias='__typename'
+    )
+
+
+class DisconnectedEvent(Node):
+    """
+    Represents a 'disconnected' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    isCrossRepository: Boolean
+    source: ReferencedSubject
+    subject: ReferencedSubject
+    typename__: Optional[Literal['DisconnectedEvent']] = Field(
+        'DisconnectedEvent', alias='__typename'
+    )
+
+
+class Discussion(
+    Closable,
+    Comment,
+    Deletable,
+    Labelable,
+    Lockable,
+    Node,
+    Reactable,
+    RepositoryNode,
+    Subscribable,
+    Updatable,
+    Votable,
+):
+    """
+    A discussion in a repository.
+    """
+
+    activeLockReason: Optional[LockReason] = None
+    answer: Optional[DiscussionComment] = None
+    answerChosenAt: Optional[DateTime] = None
+    answerChosenBy: Optional[Actor] = None
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    category: DiscussionCategory
+    closed: Boolean
+    closedAt: Optional[DateTime] = None
+    comments: DiscussionCommentConnection
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    editor: Optional[Actor] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    isAnswered: Optional[Boolean] = None
+    labels: Optional[LabelConnection] = None
+    lastEditedAt: Optional[DateTime] = None
+    locked: Boolean
+    number: Int
+    poll: Optional[DiscussionPoll] = None
+    publishedAt: Optional[DateTime] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    repository: Repository
+    resourcePath: URI
+    stateReason: Optional[DiscussionStateReason] = None
+    title: String
+    updatedAt: DateTime
+    upvoteCount: Int
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanClose: Boolean
+    viewerCanDelete: Boolean
+    viewerCanReact: Boolean
+    viewerCanReopen: Boolean
+    viewerCanSubscribe: Boolean
+    viewerCanUpdate: Boolean
+    viewerCanUpvote: Boolean
+    viewerDidAuthor: Boolean
+    viewerHasUpvoted: Boolean
+    viewerSubscription: Optional[SubscriptionState] = None
+    typename__: Optional[Literal['Discussion']] = Field(
+        'Discussion', alias='__typename'
+    )
+
+
+class DiscussionCategory(Node, RepositoryNode):
+    """
+    A category for discussions in a repository.
+    """
+
+    createdAt: DateTime
+    description: Optional[String] = None
+    emoji: String
+    emojiHTML: HTML
+    id: ID
+    isAnswerable: Boolean
+    name: String
+    repository: Repository
+    slug: String
+    updatedAt: DateTime
+    typename__: Optional[Literal['DiscussionCategory']] = Field(
+        'DiscussionCategory', alias='__typename'
+    )
+
+
+class DiscussionCategoryConnection(BaseModel):
+    """
+    The connection type for DiscussionCategory.
+    """
+
+    edges: Optional[List[Optional[DiscussionCategoryEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DiscussionCategory]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DiscussionCategoryConnection']] = Field(
+        'DiscussionCategoryConnection', alias='__typename'
+    )
+
+
+class DiscussionCategoryEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DiscussionCategory] = None
+    typename__: Optional[Literal['DiscussionCategoryEdge']] = Field(
+        'DiscussionCategoryEdge', alias='__typename'
+    )
+
+
+class DiscussionComment(
+    Comment,
+    Deletable,
+    Minimizable,
+    Node,
+    Reactable,
+    Updatable,
+    UpdatableComment,
+    Votable,
+):
+    """
+    A comment on a discussion.
+    """
+
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    deletedAt: Optional[DateTime] = None
+    discussion: Optional[Discussion] = None
+    editor: Optional[Actor] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    isAnswer: Boolean
+    isMinimized: Boolean
+    lastEditedAt: Optional[DateTime] = None
+    minimizedReason: Optional[String] = None
+    publishedAt: Optional[DateTime] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    replies: DiscussionCommentConnection
+    replyTo: Optional[DiscussionComment] = None
+    resourcePath: URI
+    updatedAt: DateTime
+    upvoteCount: Int
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanDelete: Boolean
+    viewerCanMarkAsAnswer: Boolean
+    viewerCanMinimize: Boolean
+    viewerCanReact: Boolean
+    viewerCanUnmarkAsAnswer: Boolean
+    viewerCanUpdate: Boolean
+    viewerCanUpvote: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    viewerHasUpvoted: Boolean
+    typename__: Optional[Literal['DiscussionComment']] = Field(
+        'DiscussionComment', alias='__typename'
+    )
+
+
+class DiscussionCommentConnection(BaseModel):
+    """
+    The connection type for DiscussionComment.
+    """
+
+    edges: Optional[List[Optional[DiscussionCommentEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DiscussionComment]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DiscussionCommentConnection']] = Field(
+        'DiscussionCommentConnection', alias='__typename'
+    )
+
+
+class DiscussionCommentEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DiscussionComment] = None
+    typename__: Optional[Literal['DiscussionCommentEdge']] = Field(
+        'DiscussionCommentEdge', alias='__typename'
+    )
+
+
+class DiscussionConnection(BaseModel):
+    """
+    The connection type for Discussion.
+    """
+
+    edges: Optional[List[Optional[DiscussionEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Discussion]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DiscussionConnection']] = Field(
+        'DiscussionConnection', alias='__typename'
+    )
+
+
+class DiscussionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Discussion] = None
+    typename__: Optional[Literal['DiscussionEdge']] = Field(
+        'DiscussionEdge', alias='__typename'
+    )
+
+
+class DiscussionPoll(Node):
+    """
+    A poll for a discussion.
+    """
+
+    discussion: Optional[Discussion] = None
+    id: ID
+    options: Optional[DiscussionPollOptionConnection] = None
+    question: String
+    totalVoteCount: Int
+    viewerCanVote: Boolean
+    viewerHasVoted: Boolean
+    typename__: Optional[Literal['DiscussionPoll']] = Field(
+        'DiscussionPoll', alias='__typename'
+    )
+
+
+class DiscussionPollOption(Node):
+    """
+    An option for a discussion poll.
+    """
+
+    id: ID
+    option: String
+    poll: Optional[DiscussionPoll] = None
+    totalVoteCount: Int
+    viewerHasVoted: Boolean
+    typename__: Optional[Literal['DiscussionPollOption']] = Field(
+        'DiscussionPollOption', alias='__typename'
+    )
+
+
+class DiscussionPollOptionConnection(BaseModel):
+    """
+    The connection type for DiscussionPollOption.
+    """
+
+    edges: Optional[List[Optional[DiscussionPollOptionEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DiscussionPollOption]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DiscussionPollOptionConnection']] = Field(
+        'DiscussionPollOptionConnection', alias='__typename'
+    )
+
+
+class DiscussionPollOptionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[DiscussionPollOption] = None
+    typename__: Optional[Literal['DiscussionPollOptionEdge']] = Field(
+        'DiscussionPollOptionEdge', alias='__typename'
+    )
+
+
+class DraftIssue(Node):
+    """
+    A draft issue within a project.
+    """
+
+    assignees: UserConnection
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    id: ID
+    projectV2Items: ProjectV2ItemConnection
+    projectsV2: ProjectV2Connection
+    title: String
+    updatedAt: DateTime
+    typename__: Optional[Literal['DraftIssue']] = Field(
+        'DraftIssue', alias='__typename'
+    )
+
+
+class Enterprise(AnnouncementBanner, Node):
+    """
+    An account to manage multiple organizations with consolidated policy and billing.
+    """
+
+    announcement: Optional[String] = None
+    announcementExpiresAt: Optional[DateTime] = None
+    announcementUserDismissible: Optional[Boolean] = None
+    avatarUrl: URI
+    billingInfo: Optional[EnterpriseBillingInfo] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    description: Optional[String] = None
+    descriptionHTML: HTML
+    id: ID
+    location: Optional[String] = None
+    members: EnterpriseMemberConnection
+    name: String
+    organizations: OrganizationConnection
+    ownerInfo: Optional[EnterpriseOwnerInfo] = None
+    resourcePath: URI
+    slug: String
+    url: URI
+    viewerIsAdmin: Boolean
+    websiteUrl: Optional[URI] = None
+    typename__: Optional[Literal['Enterprise']] = Field(
+        'Enterprise', alias='__typename'
+    )
+
+
+class EnterpriseAdministratorConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[EnterpriseAdministratorEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['EnterpriseAdministratorConnection']] = Field(
+        'EnterpriseAdministratorConnection', alias='__typename'
+    )
+
+
+class EnterpriseAdministratorEdge(BaseModel):
+    """
+    A User who is an administrator of an enterprise.
+    """
+
+    cursor: String
+    node: Optional[User] = None
+    role: EnterpriseAdministratorRole
+    typename__: Optional[Literal['EnterpriseAdministratorEdge']] = Field(
+        'EnterpriseAdministratorEdge', alias='__typename'
+    )
+
+
+class EnterpriseAdministratorInvitation(Node):
+    """
+    An invitation for a user to become an owner or billing manager of an enterprise.
+    """
+
+    createdAt: DateTime
+    email: Optional[String] = None
+    enterprise: Enterprise
+    id: ID
+    invitee: Optional[User] = None
+    inviter: Optional[User] = None
+    role: EnterpriseAdministratorRole
+    typename__: Optional[Literal['EnterpriseAdministratorInvitation']] = Field(
+        'EnterpriseAdministratorInvitation', alias='__typename'
+    )
+
+
+class EnterpriseAdministratorInvitationConnection(BaseModel):
+    """
+    The connection type for EnterpriseAdministratorInvitation.
+    """
+
+    edges: Optional[
+        List[Optional[EnterpriseAdministratorInvitationEdge]]
+    ] = Field(default_factory=list)
+    nodes: Optional[List[Optional[EnterpriseAdministratorInvitation]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['EnterpriseAdministratorInvitationConnection']
+    ] = Field(
+        'EnterpriseAdministratorInvitationConnection', alias='__typename'
+    )
+
+
+class EnterpriseAdministratorInvitationEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[EnterpriseAdministratorInvitation] = None
+    typename__: Optional[
+        Literal['EnterpriseAdministratorInvitationEdge']
+    ] = Field('EnterpriseAdministratorInvitationEdge', alias='__typename')
+
+
+class EnterpriseConnection(BaseModel):
+    """
+    The connection type for Enterprise.
+    """
+
+    edges: Optional[List[Optional[EnterpriseEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Enterprise]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['EnterpriseConnection']] = Field(
+        'EnterpriseConnection', alias='__typename'
+    )
+
+
+class EnterpriseEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Enterprise] = None
+    typename__: Optional[Literal['EnterpriseEdge']] = Field(
+        'EnterpriseEdge', alias='__typename'
+    )
+
+
+class EnterpriseFailedInvitationConnection(BaseModel):
+    """
+    The connection type for OrganizationInvitation.
+    """
+
+    edges: Optional[List[Optional[EnterpriseFailedInvitationEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[OrganizationInvitation]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    totalUniqueUserCount: Int
+    typename__: Optional[
+        Literal['EnterpriseFailedInvitationConnection']
+    ] = Field('EnterpriseFailedInvitationConnection', alias='__typename')
+
+
+class EnterpriseFailedInvitationEdge(BaseModel):
+    """
+    A failed invitation to be a member in an enterprise organization.
+    """
+
+    cursor: String
+    node: Optional[OrganizationInvitation] = None
+    typename__: Optional[Literal['EnterpriseFailedInvitationEdge']] = Field(
+        'EnterpriseFailedInvitationEdge', alias='__typename'
+    )
+
+
+class EnterpriseIdentityProvider(Node):
+    """
+    An identity provider configured to provision identities for an enterprise.
+    Visible to enterprise owners or enterprise owners' personal access tokens
+    (classic) with read:enterprise or admin:enterprise scope.
+    """
+
+    digestMethod: Optional[SamlDigestAlgorithm] = None
+    enterprise: Optional[Enterprise] = None
+    externalIdentities: ExternalIdentityConnection
+    id: ID
+    idpCertificate: Optional[X509Certificate] = None
+    issuer: Optional[String] = None
+    recoveryCodes: Optional[List[String]] = Field(default_factory=list)
+    signatureMethod: Optional[SamlSignatureAlgorithm] = None
+    ssoUrl: Optional[URI] = None
+    typename__: Optional[Literal['EnterpriseIdentityProvider']] = Field(
+        'EnterpriseIdentityProvider', alias='__typename'
+    )
+
+
+class EnterpriseMemberConnection(BaseModel):
+    """
+    The connection type for EnterpriseMember.
+    """
+
+    edges: Optional[List[Optional[EnterpriseMemberEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[EnterpriseMember]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['EnterpriseMemberConnection']] = Field(
+        'EnterpriseMemberConnection', alias='__typename'
+    )
+
+
+class EnterpriseMemberEdge(BaseModel):
+    """
+    A User who is a member of an enterprise through one or more organizations.
+    """
+
+    cursor: String
+    node: Optional[EnterpriseMember] = None
+    typename__: Optional[Literal['EnterpriseMemberEdge']] = Field(
+        'EnterpriseMemberEdge', alias='__typename'
+    )
+
+
+class EnterpriseOrganizationMembershipConnection(BaseModel):
+    """
+    The connection type for Organization.
+    """
+
+    edges: Optional[
+        List[Optional[EnterpriseOrganizationMembershipEdge]]
+    ] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Organization]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['EnterpriseOrganizationMembershipConnection']
+    ] = Field('EnterpriseOrganizationMembershipConnection', alias='__typename')
+
+
+class EnterpriseOrganizationMembershipEdge(BaseModel):
+    """
+    An enterprise organization that a user is a member of.
+    """
+
+    cursor: String
+    node: Optional[Organization] = None
+    role: EnterpriseUserAccountMembershipRole
+    typename__: Optional[
+        Literal['EnterpriseOrganizationMembershipEdge']
+    ] = Field('EnterpriseOrganizationMembershipEdge', alias='__typename')
+
+
+class EnterpriseOutsideCollaboratorConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[EnterpriseOutsideCollaboratorEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['EnterpriseOutsideCollaboratorConnection']
+    ] = Field('EnterpriseOutsideCollaboratorConnection', alias='__typename')
+
+
+class EnterpriseOutsideCollaboratorEdge(BaseModel):
+    """
+    A User who is an outside collaborator of an enterprise through one or more organizations.
+    """
+
+    cursor: String
+    node: Optional[User] = None
+    repositories: EnterpriseRepositoryInfoConnection
+    typename__: Optional[Literal['EnterpriseOutsideCollaboratorEdge']] = Field(
+        'EnterpriseOutsideCollaboratorEdge', alias='__typename'
+    )
+
+
+class EnterpriseOwnerInfo(BaseModel):
+    """
+    Enterprise information visible to enterprise owners or enterprise owners'
+    personal access tokens (classic) with read:enterprise or admin:enterprise scope.
+    """
+
+    admins: EnterpriseAdministratorConnection
+    affiliatedUsersWithTwoFactorDisabled: UserConnection
+    affiliatedUsersWithTwoFactorDisabledExist: Boolean
+    allowPrivateRepositoryForkingSetting: EnterpriseEnabledDisabledSettingValue
+    allowPrivateRepositoryForkingSettingOrganizations: OrganizationConnection
+    allowPrivateRepositoryForkingSettingPolicyValue: Optional[
+        EnterpriseAllowPrivateRepositoryForkingPolicyValue
+    ] = None
+    defaultRepositoryPermissionSetting: EnterpriseDefaultRepositoryPermissionSettingValue
+    defaultRepositoryPermissionSettingOrganizations: OrganizationConnection
+    domains: VerifiableDomainConnection
+    enterpriseServerInstallations: EnterpriseServerInstallationConnection
+    failedInvitations: EnterpriseFailedInvitationConnection
+    ipAllowListEnabledSetting: IpAllowListEnabledSettingValue
+    ipAllowListEntries: IpAllowListEntryConnection
+    ipAllowListForInstalledAppsEnabledSetting: IpAllowListForInstalledAppsEnabledSettingValue
+    isUpdatingDefaultRepositoryPermission: Boolean
+    isUpdatingTwoFactorRequirement: Boolean
+    membersCanChangeRepositoryVisibilitySetting: EnterpriseEnabledDisabledSettingValue
+    membersCanChangeRepositoryVisibilitySettingOrganizations: OrganizationConnection
+    membersCanCreateInternalRepositoriesSetting: Optional[Boolean] = None
+    membersCanCreatePrivateRepositoriesSetting: Optional[Boolean] = None
+    membersCanCreatePublicRepositoriesSetting: Optional[Boolean] = None
+    membersCanCreateRepositoriesSetting: Optional[
+        EnterpriseMembersCanCreateRepositoriesSettingValue
+    ] = None
+    membersCanCreateRepositoriesSettingOrganizations: OrganizationConnection
+    membersCanDeleteIssuesSetting: EnterpriseEnabledDisabledSettingValue
+    membersCanDeleteIssuesSettingOrganizations: OrganizationConnection
+    membersCanDeleteRepositoriesSetting: EnterpriseEnabledDisabledSettingValue
+    membersCanDeleteRepositoriesSettingOrganizations: OrganizationConnection
+    membersCanInviteCollaboratorsSetting: EnterpriseEnabledDisabledSettingValue
+    membersCanInviteCollaboratorsSettingOrganizations: OrganizationConnection
+    membersCanMakePurchasesSetting: EnterpriseMembersCanMakePurchasesSettingValue
+    membersCanUpdateProtectedBranchesSetting: EnterpriseEnabledDisabledSettingValue
+    membersCanUpdateProtectedBranchesSettingOrganizations: OrganizationConnection
+    membersCanViewDependencyInsightsSetting: EnterpriseEnabledDisabledSettingValue
+    membersCanViewDependencyInsightsSettingOrganizations: OrganizationConnection
+    notificationDeliveryRestrictionEnabledSetting: NotificationRestrictionSettingValue
+    oidcProvider: Optional[OIDCProvider] = None
+    organizationProjectsSetting: EnterpriseEnabledDisabledSettingValue
+    organizationProjectsSettingOrganizations: OrganizationConnection
+    outsideCollaborators: EnterpriseOutsideCollaboratorConnection
+    pendingAdminInvitations: EnterpriseAdministratorInvitationConnection
+    pendingCollaboratorInvitations: RepositoryInvitationConnection
+    pendingMemberInvitations: EnterprisePendingMemberInvitationConnection
+    repositoryProjectsSetting: EnterpriseEnabledDisabledSettingValue
+    repositoryProjectsSettingOrganizations: OrganizationConnection
+    samlIdentityProvider: Optional[EnterpriseIdentityProvider] = None
+    samlIdentityProviderSettingOrganizations: OrganizationConnection
+    supportEntitlements: EnterpriseMemberConnection
+    teamDiscussionsSetting: EnterpriseEnabledDisabledSettingValue
+    teamDiscussionsSettingOrganizations: OrganizationConnection
+    twoFactorRequiredSetting: EnterpriseEnabledSettingValue
+    twoFactorRequiredSettingOrganizations: OrganizationConnection
+    typename__: Optional[Literal['EnterpriseOwnerInfo']] = Field(
+        'EnterpriseOwnerInfo', alias='__typename'
+    )
+
+
+class EnterprisePendingMemberInvitationConnection(BaseModel):
+    """
+    The connection type for OrganizationInvitation.
+    """
+
+    edges: Optional[
+        List[Optional[EnterprisePendingMemberInvitationEdge]]
+    ] = Field(default_factory=list)
+    nodes: Optional[List[Optional[OrganizationInvitation]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    totalUniqueUserCount: Int
+    typename__: Optional[
+        Literal['EnterprisePendingMemberInvitationConnection']
+    ] = Field(
+        'EnterprisePendingMemberInvitationConnection', alias='__typename'
+    )
+
+
+class EnterprisePendingMemberInvitationEdge(BaseModel):
+    """
+    An invitation to be a member in an enterprise organization.
+    """
+
+    cursor: String
+    node: Optional[OrganizationInvitation] = None
+    typename__: Optional[
+        Literal['EnterprisePendingMemberInvitationEdge']
+    ] = Field('EnterprisePendingMemberInvitationEdge', alias='__typename')
+
+
+class EnterpriseServerInstallation(Node):
+    """
+    An Enterprise Server installation.
+    """
+
+    createdAt: DateTime
+    customerName: String
+    hostName: String
+    id: ID
+    isConnected: Boolean
+    updatedAt: DateTime
+    userAccounts: EnterpriseServerUserAccountConnection
+    userAccountsUploads: EnterpriseServerUserAccountsUploadConnection
+    typename__: Optional[Literal['EnterpriseServerInstallation']] = Field(
+        'EnterpriseServerInstallation', alias='__typename'
+    )
+
+
+class EnterpriseServerInstallationConnection(BaseModel):
+    """
+    The connection type for EnterpriseServerInstallation.
+    """
+
+    edges: Optional[List[Optional[EnterpriseServerInstallationEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[EnterpriseServerInstallation]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['EnterpriseServerInstallationConnection']
+    ] = Field('EnterpriseServerInstallationConnection', alias='__typename')
+
+
+class EnterpriseServerInstallationEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[EnterpriseServerInstallation] = None
+    typename__: Optional[Literal['EnterpriseServerInstallationEdge']] = Field(
+        'EnterpriseServerInstallationEdge', alias='__typename'
+    )
+
+
+class EnterpriseServerInstallationMembershipConnection(BaseModel):
+    """
+    The connection type for EnterpriseServerInstallation.
+    """
+
+    edges: Optional[
+        List[Optional[EnterpriseServerInstallationMembershipEdge]]
+    ] = Field(default_factory=list)
+    nodes: Optional[List[Optional[EnterpriseServerInstallation]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['EnterpriseServerInstallationMembershipConnection']
+    ] = Field(
+        'EnterpriseServerInstallationMembershipConnection', alias='__typename'
+    )
+
+
+class EnterpriseServerInstallationMembershipEdge(BaseModel):
+    """
+    An Enterprise Server installation that a user is a member of.
+    """
+
+    cursor: String
+    node: Optional[EnterpriseServerInstallation] = None
+    role: EnterpriseUserAccountMembershipRole
+    typename__: Optional[
+        Literal['EnterpriseServerInstallationMembershipEdge']
+    ] = Field('EnterpriseServerInstallationMembershipEdge', alias='__typename')
+
+
+class EnterpriseServerUserAccount(Node):
+    """
+    A user account on an Enterprise Server installation.
+    """
+
+    createdAt: DateTime
+    emails: EnterpriseServerUserAccountEmailConnection
+    enterpriseServerInstallation: EnterpriseServerInstallation
+    id: ID
+    isSiteAdmin: Boolean
+    login: String
+    profileName: Optional[String] = None
+    remoteCreatedAt: DateTime
+    remoteUserId: Int
+    updatedAt: DateTime
+    typename__: Optional[Literal['EnterpriseServerUserAccount']] = Field(
+        'EnterpriseServerUserAccount', alias='__typename'
+    )
+
+
+class EnterpriseServerUserAccountConnection(BaseModel):
+    """
+    The connection type for EnterpriseServerUserAccount.
+    """
+
+    edges: Optional[List[Optional[EnterpriseServerUserAccountEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[EnterpriseServerUserAccount]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['EnterpriseServerUserAccountConnection']
+    ] = Field('EnterpriseServerUserAccountConnection', alias='__typename')
+
+
+class EnterpriseServerUserAccountEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[EnterpriseServerUserAccount] = None
+    typename__: Optional[Literal['EnterpriseServerUserAccountEdge']] = Field(
+        'EnterpriseServerUserAccountEdge', alias='__typename'
+    )
+
+
+class EnterpriseServerUserAccountEmail(Node):
+    """
+    An email belonging to a user account on an Enterprise Server installation.
+    """
+
+    createdAt: DateTime
+    email: String
+    id: ID
+    isPrimary: Boolean
+    updatedAt: DateTime
+    userAccount: EnterpriseServerUserAccount
+    typename__: Optional[Literal['EnterpriseServerUserAccountEmail']] = Field(
+        'EnterpriseServerUserAccountEmail', alias='__typename'
+    )
+
+
+class EnterpriseServerUserAccountEmailConnection(BaseModel):
+    """
+    The connection type for EnterpriseServerUserAccountEmail.
+    """
+
+    edges: Optional[
+        List[Optional[EnterpriseServerUserAccountEmailEdge]]
+    ] = Field(default_factory=list)
+    nodes: Optional[List[Optional[EnterpriseServerUserAccountEmail]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['EnterpriseServerUserAccountEmailConnection']
+    ] = Field('EnterpriseServerUserAccountEmailConnection', alias='__typename')
+
+
+class EnterpriseServerUserAccountEmailEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[EnterpriseServerUserAccountEmail] = None
+    typename__: Optional[
+        Literal['EnterpriseServerUserAccountEmailEdge']
+    ] = Field('EnterpriseServerUserAccountEmailEdge', alias='__typename')
+
+
+class EnterpriseServerUserAccountsUpload(Node):
+    """
+    A user accounts upload from an Enterprise Server installation.
+    """
+
+    createdAt: DateTime
+    enterprise: Enterprise
+    enterpriseServerInstallation: EnterpriseServerInstallation
+    id: ID
+    name: String
+    syncState: EnterpriseServerUserAccountsUploadSyncState
+    updatedAt: DateTime
+    typename__: Optional[
+        Literal['EnterpriseServerUserAccountsUpload']
+    ] = Field('EnterpriseServerUserAccountsUpload', alias='__typename')
+
+
+class EnterpriseServerUserAccountsUploadConnection(BaseModel):
+    """
+    The connection type for EnterpriseServerUserAccountsUpload.
+    """
+
+    edges: Optional[
+        List[Optional[EnterpriseServerUserAccountsUploadEdge]]
+    ] = Field(default_factory=list)
+    nodes: Optional[
+        List[Optional[EnterpriseServerUserAccountsUpload]]
+    ] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['EnterpriseServerUserAccountsUploadConnection']
+    ] = Field(
+        'EnterpriseServerUserAccountsUploadConnection', alias='__typename'
+    )
+
+
+class EnterpriseServerUserAccountsUploadEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[EnterpriseServerUserAccountsUpload] = None
+    typename__: Optional[
+        Literal['EnterpriseServerUserAccountsUploadEdge']
+    ] = Field('EnterpriseServerUserAccountsUploadEdge', alias='__typename')
+
+
+class EnterpriseUserAccount(Actor, Node):
+    """
+    An account for a user who is an admin of an enterprise or a member of an enterprise through one or more organizations.
+    """
+
+    avatarUrl: URI
+    createdAt: DateTime
+    enterprise: Enterprise
+    enterpriseInstallations: EnterpriseServerInstallationMembershipConnection
+    id: ID
+    login: String
+    name: Optional[String] = None
+    organizations: EnterpriseOrganizationMembershipConnection
+    resourcePath: URI
+    updatedAt: DateTime
+    url: URI
+    user: Optional[User] = None
+    typename__: Optional[Literal['EnterpriseUserAccount']] = Field(
+        'EnterpriseUserAccount', alias='__typename'
+    )
+
+
+class Environment(Node):
+    """
+    An environment.
+    """
+
+    databaseId: Optional[Int] = None
+    id: ID
+    name: String
+    protectionRules: DeploymentProtectionRuleConnection
+    typename__: Optional[Literal['Environment']] = Field(
+        'Environment', alias='__typename'
+    )
+
+
+class EnvironmentConnection(BaseModel):
+    """
+    The connection type for Environment.
+    """
+
+    edges: Optional[List[Optional[EnvironmentEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Environment]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['EnvironmentConnection']] = Field(
+        'EnvironmentConnection', alias='__typename'
+    )
+
+
+class EnvironmentEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Environment] = None
+    typename__: Optional[Literal['EnvironmentEdge']] = Field(
+        'EnvironmentEdge', alias='__typename'
+    )
+
+
+class ExternalIdentity(Node):
+    """
+    An external identity provisioned by SAML SSO or SCIM. If SAML is configured on
+    the organization, the external identity is visible to (1) organization owners,
+    (2) organization owners' personal access tokens (classic) with read:org or
+    admin:org scope, (3) GitHub App with an installation token with read or write
+    access to members. If SAML is configured on the enterprise, the external
+    identity is visible to (1) enterprise owners, (2) enterprise owners' personal
+    access tokens (classic) with read:enterprise or admin:enterprise scope.
+    """
+
+    guid: String
+    id: ID
+    organizationInvitation: Optional[OrganizationInvitation] = None
+    samlIdentity: Optional[ExternalIdentitySamlAttributes] = None
+    scimIdentity: Optional[ExternalIdentityScimAttributes] = None
+    user: Optional[User] = None
+    typename__: Optional[Literal['ExternalIdentity']] = Field(
+        'ExternalIdentity', alias='__typename'
+    )
+
+
+class ExternalIdentityConnection(BaseModel):
+    """
+    The connection type for ExternalIdentity.
+    """
+
+    edges: Optional[List[Optional[ExternalIdentityEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ExternalIdentity]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ExternalIdentityConnection']] = Field(
+        'ExternalIdentityConnection', alias='__typename'
+    )
+
+
+class ExternalIdentityEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ExternalIdentity] = None
+    typename__: Optional[Literal['ExternalIdentityEdge']] = Field(
+        'ExternalIdentityEdge', alias='__typename'
+    )
+
+
+class FollowerConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[UserEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['FollowerConnection']] = Field(
+        'FollowerConnection', alias='__typename'
+    )
+
+
+class FollowingConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[UserEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['FollowingConnection']] = Field(
+        'FollowingConnection', alias='__typename'
+    )
+
+
+class Gist(Node, Starrable, UniformResourceLocatable):
+    """
+    A Gist.
+    """
+
+    comments: GistCommentConnection
+    createdAt: DateTime
+    description: Optional[String] = None
+    files: Optional[List[Optional[GistFile]]] = Field(default_factory=list)
+    forks: GistConnection
+    id: ID
+    isFork: Boolean
+    isPublic: Boolean
+    name: String
+    owner: Optional[RepositoryOwner] = None
+    pushedAt: Optional[DateTime] = None
+    resourcePath: URI
+    stargazerCount: Int
+    stargazers: StargazerConnection
+    updatedAt: DateTime
+    url: URI
+    viewerHasStarred: Boolean
+    typename__: Optional[Literal['Gist']] = Field('Gist', alias='__typename')
+
+
+class GistComment(
+    Comment, Deletable, Minimizable, Node, Updatable, UpdatableComment
+):
+    """
+    Represents a comment on an Gist.
+    """
+
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    editor: Optional[Actor] = None
+    gist: Gist
+    id: ID
+    includesCreatedEdit: Boolean
+    isMinimized: Boolean
+    lastEditedAt: Optional[DateTime] = None
+    minimizedReason: Optional[String] = None
+    publishedAt: Optional[DateTime] = None
+    updatedAt: DateTime
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanDelete: Boolean
+    viewerCanMinimize: Boolean
+    viewerCanUpdate: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    typename__: Optional[Literal['GistComment']] = Field(
+        'GistComment', alias='__typename'
+    )
+
+
+class GistCommentConnection(BaseModel):
+    """
+    The connection type for GistComment.
+    """
+
+    edges: Optional[List[Optional[GistCommentEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[GistComment]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['GistCommentConnection']] = Field(
+        'GistCommentConnection', alias='__typename'
+    )
+
+
+class GistCommentEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[GistComment] = None
+    typename__: Optional[Literal['GistCommentEdge']] = Field(
+        'GistCommentEdge', alias='__typename'
+    )
+
+
+class GistConnection(BaseModel):
+    """
+    The connection type for Gist.
+    """
+
+    edges: Optional[List[Optional[GistEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Gist]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['GistConnection']] = Field(
+        'GistConnection', alias='__typename'
+    )
+
+
+class GistEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Gist] = None
+    typename__: Optional[Literal['GistEdge']] = Field(
+        'GistEdge', alias='__typename'
+    )
+
+
+class GitActor(BaseModel):
+    """
+    Represents an actor in a Git commit (ie. an author or committer).
+    """
+
+    avatarUrl: URI
+    date: Optional[GitTimestamp] = None
+    email: Optional[String] = None
+    name: Optional[String] = None
+    user: Optional[User] = None
+    typename__: Optional[Literal['GitActor']] = Field(
+        'GitActor', alias='__typename'
+    )
+
+
+class GitActorConnection(BaseModel):
+    """
+    The connection type for GitActor.
+    """
+
+    edges: Optional[List[Optional[GitActorEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[GitActor]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['GitActorConnection']] = Field(
+        'GitActorConnection', alias='__typename'
+    )
+
+
+class GitActorEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[GitActor] = None
+    typename__: Optional[Literal['GitActorEdge']] = Field(
+        'GitActorEdge', alias='__typename'
+    )
+
+
+class HeadRefDeletedEvent(Node):
+    """
+    Represents a 'head_ref_deleted' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    headRef: Optional[Ref] = None
+    headRefName: String
+    id: ID
+    pullRequest: PullRequest
+    typename__: Optional[Literal['HeadRefDeletedEvent']] = Field(
+        'HeadRefDeletedEvent', alias='__typename'
+    )
+
+
+class HeadRefForcePushedEvent(Node):
+    """
+    Represents a 'head_ref_force_pushed' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    afterCommit: Optional[Commit] = None
+    beforeCommit: Optional[Commit] = None
+    createdAt: DateTime
+    id: ID
+    pullRequest: PullRequest
+    ref: Optional[Ref] = None
+    typename__: Optional[Literal['HeadRefForcePushedEvent']] = Field(
+        'HeadRefForcePushedEvent', alias='__typename'
+    )
+
+
+class HeadRefRestoredEvent(Node):
+    """
+    Represents a 'head_ref_restored' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    pullRequest: PullRequest
+    typename__: Optional[Literal['HeadRefRestoredEvent']] = Field(
+        'HeadRefRestoredEvent', alias='__typename'
+    )
+
+
+class IpAllowListEntry(Node):
+    """
+    An IP address or range of addresses that is allowed to access an owner's resources.
+    """
+
+    allowListValue: String
+    createdAt: DateTime
+    id: ID
+    isActive: Boolean
+    name: Optional[String] = None
+    owner: IpAllowListOwner
+    updatedAt: DateTime
+    typename__: Optional[Literal['IpAllowListEntry']] = Field(
+        'IpAllowListEntry', alias='__typename'
+    )
+
+
+class IpAllowListEntryConnection(BaseModel):
+    """
+    The connection type for IpAllowListEntry.
+    """
+
+    edges: Optional[List[Optional[IpAllowListEntryEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[IpAllowListEntry]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['IpAllowListEntryConnection']] = Field(
+        'IpAllowListEntryConnection', alias='__typename'
+    )
+
+
+class IpAllowListEntryEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[IpAllowListEntry] = None
+    typename__: Optional[Literal['IpAllowListEntryEdge']] = Field(
+        'IpAllowListEntryEdge', alias='__typename'
+    )
+
+
+class Issue(
+    Assignable,
+    Closable,
+    Comment,
+    Deletable,
+    Labelable,
+    Lockable,
+    Node,
+    ProjectV2Owner,
+    Reactable,
+    RepositoryNode,
+    Subscribable,
+    SubscribableThread,
+    UniformResourceLocatable,
+    Updatable,
+    UpdatableComment,
+):
+    """
+    An Issue is a place to discuss ideas, enhancements, tasks, and bugs for a project.
+    """
+
+    activeLockReason: Optional[LockReason] = None
+    assignees: UserConnection
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyResourcePath: URI
+    bodyText: String
+    bodyUrl: URI
+    closed: Boolean
+    closedAt: Optional[DateTime] = None
+    comments: IssueCommentConnection
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    editor: Optional[Actor] = None
+    fullDatabaseId: Optional[BigInt] = None
+    hovercard: Hovercard
+    id: ID
+    includesCreatedEdit: Boolean
+    isPinned: Optional[Boolean] = None
+    isReadByViewer: Optional[Boolean] = None
+    labels: Optional[LabelConnection] = None
+    lastEditedAt: Optional[DateTime] = None
+    linkedBranches: LinkedBranchConnection
+    locked: Boolean
+    milestone: Optional[Milestone] = None
+    number: Int
+    participants: UserConnection
+    projectCards: ProjectCardConnection
+    projectItems: ProjectV2ItemConnection
+    projectV2: Optional[ProjectV2] = None
+    projectsV2: ProjectV2Connection
+    publishedAt: Optional[DateTime] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    repository: Repository
+    resourcePath: URI
+    state: IssueState
+    stateReason: Optional[IssueStateReason] = None
+    timeline: IssueTimelineConnection
+    timelineItems: IssueTimelineItemsConnection
+    title: String
+    titleHTML: String
+    trackedInIssues: IssueConnection
+    trackedIssues: IssueConnection
+    trackedIssuesCount: Int
+    updatedAt: DateTime
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanClose: Boolean
+    viewerCanDelete: Boolean
+    viewerCanReact: Boolean
+    viewerCanReopen: Boolean
+    viewerCanSubscribe: Boolean
+    viewerCanUpdate: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    viewerSubscription: Optional[SubscriptionState] = None
+    viewerThreadSubscriptionFormAction: Optional[
+        ThreadSubscriptionFormAction
+    ] = None
+    viewerThreadSubscriptionStatus: Optional[ThreadSubscriptionState] = None
+    typename__: Optional[Literal['Issue']] = Field('Issue', alias='__typename')
+
+
+class IssueComment(
+    Comment,
+    Deletable,
+    Minimizable,
+    Node,
+    Reactable,
+    RepositoryNode,
+    Updatable,
+    UpdatableComment,
+):
+    """
+    Represents a comment on an Issue.
+    """
+
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    editor: Optional[Actor] = None
+    fullDatabaseId: Optional[BigInt] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    isMinimized: Boolean
+    issue: Issue
+    lastEditedAt: Optional[DateTime] = None
+    minimizedReason: Optional[String] = None
+    publishedAt: Optional[DateTime] = None
+    pullRequest: Optional[PullRequest] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    repository: Repository
+    resourcePath: URI
+    updatedAt: DateTime
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanDelete: Boolean
+    viewerCanMinimize: Boolean
+    viewerCanReact: Boolean
+    viewerCanUpdate: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    typename__: Optional[Literal['IssueComment']] = Field(
+        'IssueComment', alias='__typename'
+    )
+
+
+class IssueCommentConnection(BaseModel):
+    """
+    The connection type for IssueComment.
+    """
+
+    edges: Optional[List[Optional[IssueCommentEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[IssueComment]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['IssueCommentConnection']] = Field(
+        'IssueCommentConnection', alias='__typename'
+    )
+
+
+class IssueCommentEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[IssueComment] = None
+    typename__: Optional[Literal['IssueCommentEdge']] = Field(
+        'IssueCommentEdge', alias='__typename'
+    )
+
+
+class IssueConnection(BaseModel):
+    """
+    The connection type for Issue.
+    """
+
+    edges: Optional[List[Optional[IssueEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Issue]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['IssueConnection']] = Field(
+        'IssueConnection', alias='__typename'
+    )
+
+
+class IssueContributionsByRepository(BaseModel):
+    """
+    This aggregates issues opened by a user within one repository.
+    """
+
+    contributions: CreatedIssueContributionConnection
+    repository: Repository
+    typename__: Optional[Literal['IssueContributionsByRepository']] = Field(
+        'IssueContributionsByRepository', alias='__typename'
+    )
+
+
+class IssueEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Issue] = None
+    typename__: Optional[Literal['IssueEdge']] = Field(
+        'IssueEdge', alias='__typename'
+    )
+
+
+class IssueTemplate(BaseModel):
+    """
+    A repository issue template.
+    """
+
+    about: Optional[String] = None
+    assignees: UserConnection
+    body: Optional[String] = None
+    filename: String
+    labels: Optional[LabelConnection] = None
+    name: String
+    title: Optional[String] = None
+    typename__: Optional[Literal['IssueTemplate']] = Field(
+        'IssueTemplate', alias='__typename'
+    )
+
+
+class IssueTimelineConnection(BaseModel):
+    """
+    The connection type for IssueTimelineItem.
+    """
+
+    edges: Optional[List[Optional[IssueTimelineItemEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[IssueTimelineItem]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['IssueTimelineConnection']] = Field(
+        'IssueTimelineConnection', alias='__typename'
+    )
+
+
+class IssueTimelineItemEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[IssueTimelineItem] = None
+    typename__: Optional[Literal['IssueTimelineItemEdge']] = Field(
+        'IssueTimelineItemEdge', alias='__typename'
+    )
+
+
+class IssueTimelineItemsConnection(BaseModel):
+    """
+    The connection type for IssueTimelineItems.
+    """
+
+    edges: Optional[List[Optional[IssueTimelineItemsEdge]]] = Field(
+        default_factory=list
+    )
+    filteredCount: Int
+    nodes: Optional[List[Optional[IssueTimelineItems]]] = Field(
+        default_factory=list
+    )
+    pageCount: Int
+    pageInfo: PageInfo
+    totalCount: Int
+    updatedAt: DateTime
+    typename__: Optional[Literal['IssueTimelineItemsConnection']] = Field(
+        'IssueTimelineItemsConnection', alias='__typename'
+    )
+
+
+class IssueTimelineItemsEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[IssueTimelineItems] = None
+    typename__: Optional[Literal['IssueTimelineItemsEdge']] = Field(
+        'IssueTimelineItemsEdge', alias='__typename'
+    )
+
+
+class JoinedGitHubContribution(Contribution):
+    """
+    Represents a user signing up for a GitHub account.
+    """
+
+    isRestricted: Boolean
+    occurredAt: DateTime
+    resourcePath: URI
+    url: URI
+    user: User
+    typename__: Optional[Literal['JoinedGitHubContribution']] = Field(
+        'JoinedGitHubContribution', alias='__typename'
+    )
+
+
+class Label(Node):
+    """
+    A label for categorizing Issues, Pull Requests, Milestones, or Discussions with a given Repository.
+    """
+
+    color: String
+    createdAt: Optional[DateTime] = None
+    description: Optional[String] = None
+    id: ID
+    isDefault: Boolean
+    issues: IssueConnection
+    name: String
+    pullRequests: PullRequestConnection
+    repository: Repository
+    resourcePath: URI
+    updatedAt: Optional[DateTime] = None
+    url: URI
+    typename__: Optional[Literal['Label']] = Field('Label', alias='__typename')
+
+
+class LabelConnection(BaseModel):
+    """
+    The connection type for Label.
+    """
+
+    edges: Optional[List[Optional[LabelEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Label]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['LabelConnection']] = Field(
+        'LabelConnection', alias='__typename'
+    )
+
+
+class LabelEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Label] = None
+    typename__: Optional[Literal['LabelEdge']] = Field(
+        'LabelEdge', alias='__typename'
+    )
+
+
+class LabeledEvent(Node):
+    """
+    Represents a 'labeled' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    label: Label
+    labelable: Labelable
+    typename__: Optional[Literal['LabeledEvent']] = Field(
+        'LabeledEvent', alias='__typename'
+    )
+
+
+class LinkedBranch(Node):
+    """
+    A branch linked to an issue.
+    """
+
+    id: ID
+    ref: Optional[Ref] = None
+    typename__: Optional[Literal['LinkedBranch']] = Field(
+        'LinkedBranch', alias='__typename'
+    )
+
+
+class LinkedBranchConnection(BaseModel):
+    """
+    The connection type for LinkedBranch.
+    """
+
+    edges: Optional[List[Optional[LinkedBranchEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[LinkedBranch]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['LinkedBranchConnection']] = Field(
+        'LinkedBranchConnection', alias='__typename'
+    )
+
+
+class LinkedBranchEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[LinkedBranch] = None
+    typename__: Optional[Literal['LinkedBranchEdge']] = Field(
+        'LinkedBranchEdge', alias='__typename'
+    )
+
+
+class Mannequin(Actor, Node, UniformResourceLocatable):
+    """
+    A placeholder user for attribution of imported data on GitHub.
+    """
+
+    avatarUrl: URI
+    claimant: Optional[User] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    email: Optional[String] = None
+    id: ID
+    login: String
+    resourcePath: URI
+    updatedAt: DateTime
+    url: URI
+    typename__: Optional[Literal['Mannequin']] = Field(
+        'Mannequin', alias='__typename'
+    )
+
+
+class MannequinConnection(BaseModel):
+    """
+    The connection type for Mannequin.
+    """
+
+    edges: Optional[List[Optional[MannequinEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Mannequin]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['MannequinConnection']] = Field(
+        'MannequinConnection', alias='__typename'
+    )
+
+
+class MannequinEdge(BaseModel):
+    """
+    Represents a mannequin.
+    """
+
+    cursor: String
+    node: Optional[Mannequin] = None
+    typename__: Optional[Literal['MannequinEdge']] = Field(
+        'MannequinEdge', alias='__typename'
+    )
+
+
+class MarkedAsDuplicateEvent(Node):
+    """
+    Represents a 'marked_as_duplicate' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    canonical: Optional[IssueOrPullRequest] = None
+    createdAt: DateTime
+    duplicate: Optional[IssueOrPullRequest] = None
+    id: ID
+    isCrossRepository: Boolean
+    typename__: Optional[Literal['MarkedAsDuplicateEvent']] = Field(
+        'MarkedAsDuplicateEvent', alias='__typename'
+    )
+
+
+class MembersCanDeleteReposClearAuditEntry(
+    AuditEntry, EnterpriseAuditEntryData, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a members_can_delete_repos.clear event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    enterpriseResourcePath: Optional[URI] = None
+    enterpriseSlug: Optional[String] = None
+    enterpriseUrl: Optional[URI] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['MembersCanDeleteReposClearAuditEntry']
+    ] = Field('MembersCanDeleteReposClearAuditEntry', alias='__typename')
+
+
+class MembersCanDeleteReposDisableAuditEntry(
+    AuditEntry, EnterpriseAuditEntryData, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a members_can_delete_repos.disable event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    enterpriseResourcePath: Optional[URI] = None
+    enterpriseSlug: Optional[String] = None
+    enterpriseUrl: Optional[URI] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['MembersCanDeleteReposDisableAuditEntry']
+    ] = Field('MembersCanDeleteReposDisableAuditEntry', alias='__typename')
+
+
+class MembersCanDeleteReposEnableAuditEntry(
+    AuditEntry, EnterpriseAuditEntryData, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a members_can_delete_repos.enable event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    enterpriseResourcePath: Optional[URI] = None
+    enterpriseSlug: Optional[String] = None
+    enterpriseUrl: Optional[URI] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['MembersCanDeleteReposEnableAuditEntry']
+    ] = Field('MembersCanDeleteReposEnableAuditEntry', alias='__typename')
+
+
+class MergeQueue(Node):
+    """
+    The queue of pull request entries to be merged into a protected branch in a repository.
+    """
+
+    configuration: Optional[MergeQueueConfiguration] = None
+    entries: Optional[MergeQueueEntryConnection] = None
+    id: ID
+    nextEntryEstimatedTimeToMerge: Optional[Int] = None
+    repository: Optional[Repository] = None
+    resourcePath: URI
+    url: URI
+    typename__: Optional[Literal['MergeQueue']] = Field(
+        'MergeQueue', alias='__typename'
+    )
+
+
+class MergeQueueEntry(Node):
+    """
+    Entries in a MergeQueue
+    """
+
+    baseCommit: Optional[Commit] = None
+    enqueuedAt: DateTime
+    enqueuer: Actor
+    estimatedTimeToMerge: Optional[Int] = None
+    headCommit: Optional[Commit] = None
+    id: ID
+    jump: Boolean
+    mergeQueue: Optional[MergeQueue] = None
+    position: Int
+    pullRequest: Optional[PullRequest] = None
+    solo: Boolean
+    state: MergeQueueEntryState
+    typename__: Optional[Literal['MergeQueueEntry']] = Field(
+        'MergeQueueEntry', alias='__typename'
+    )
+
+
+class MergeQueueEntryConnection(BaseModel):
+    """
+    The connection type for MergeQueueEntry.
+    """
+
+    edges: Optional[List[Optional[MergeQueueEntryEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[MergeQueueEntry]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['MergeQueueEntryConnection']] = Field(
+        'MergeQueueEntryConnection', alias='__typename'
+    )
+
+
+class MergeQueueEntryEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[MergeQueueEntry] = None
+    typename__: Optional[Literal['MergeQueueEntryEdge']] = Field(
+        'MergeQueueEntryEdge', alias='__typename'
+    )
+
+
+class MergedEvent(Node, UniformResourceLocatable):
+    """
+    Represents a 'merged' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    commit: Optional[Commit] = None
+    createdAt: DateTime
+    id: ID
+    mergeRef: Optional[Ref] = None
+    mergeRefName: String
+    pullRequest: PullRequest
+    resourcePath: URI
+    url: URI
+    typename__: Optional[Literal['MergedEvent']] = Field(
+        'MergedEvent', alias='__typename'
+    )
+
+
+class Milestone(Closable, Node, UniformResourceLocatable):
+    """
+    Represents a Milestone object on a given repository.
+    """
+
+    closed: Boolean
+    closedAt: Optional[DateTime] = None
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    description: Optional[String] = None
+    dueOn: Optional[DateTime] = None
+    id: ID
+    issues: IssueConnection
+    number: Int
+    progressPercentage: Float
+    pullRequests: PullRequestConnection
+    repository: Repository
+    resourcePath: URI
+    state: MilestoneState
+    title: String
+    updatedAt: DateTime
+    url: URI
+    viewerCanClose: Boolean
+    viewerCanReopen: Boolean
+    typename__: Optional[Literal['Milestone']] = Field(
+        'Milestone', alias='__typename'
+    )
+
+
+class MilestoneConnection(BaseModel):
+    """
+    The connection type for Milestone.
+    """
+
+    edges: Optional[List[Optional[MilestoneEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Milestone]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['MilestoneConnection']] = Field(
+        'MilestoneConnection', alias='__typename'
+    )
+
+
+class MilestoneEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Milestone] = None
+    typename__: Optional[Literal['MilestoneEdge']] = Field(
+        'MilestoneEdge', alias='__typename'
+    )
+
+
+class MilestonedEvent(Node):
+    """
+    Represents a 'milestoned' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    milestoneTitle: String
+    subject: MilestoneItem
+    typename__: Optional[Literal['MilestonedEvent']] = Field(
+        'MilestonedEvent', alias='__typename'
+    )
+
+
+class MovedColumnsInProjectEvent(Node):
+    """
+    Represents a 'moved_columns_in_project' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    id: ID
+    previousProjectColumnName: String
+    project: Optional[Project] = None
+    projectCard: Optional[ProjectCard] = None
+    projectColumnName: String
+    typename__: Optional[Literal['MovedColumnsInProjectEvent']] = Field(
+        'MovedColumnsInProjectEvent', alias='__typename'
+    )
+
+
+class OIDCProvider(Node):
+    """
+    An OIDC identity provider configured to provision identities for an enterprise.
+    Visible to enterprise owners or enterprise owners' personal access tokens
+    (classic) with read:enterprise or admin:enterprise scope.
+    """
+
+    enterprise: Optional[Enterprise] = None
+    externalIdentities: ExternalIdentityConnection
+    id: ID
+    providerType: OIDCProviderType
+    tenantId: String
+    typename__: Optional[Literal['OIDCProvider']] = Field(
+        'OIDCProvider', alias='__typename'
+    )
+
+
+class OauthApplicationCreateAuditEntry(
+    AuditEntry,
+    Node,
+    OauthApplicationAuditEntryData,
+    OrganizationAuditEntryData,
+):
+    """
+    Audit log entry for a oauth_application.create event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    applicationUrl: Optional[URI] = None
+    callbackUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    oauthApplicationName: Optional[String] = None
+    oauthApplicationResourcePath: Optional[URI] = None
+    oauthApplicationUrl: Optional[URI] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    rateLimit: Optional[Int] = None
+    state: Optional[OauthApplicationCreateAuditEntryState] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OauthApplicationCreateAuditEntry']] = Field(
+        'OauthApplicationCreateAuditEntry', alias='__typename'
+    )
+
+
+class OrgAddBillingManagerAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.add_billing_manager
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    invitationEmail: Optional[String] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgAddBillingManagerAuditEntry']] = Field(
+        'OrgAddBillingManagerAuditEntry', alias='__typename'
+    )
+
+
+class OrgAddMemberAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.add_member
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    permission: Optional[OrgAddMemberAuditEntryPermission] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgAddMemberAuditEntry']] = Field(
+        'OrgAddMemberAuditEntry', alias='__typename'
+    )
+
+
+class OrgBlockUserAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.block_user
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    blockedUser: Optional[User] = None
+    blockedUserName: Optional[String] = None
+    blockedUserResourcePath: Optional[URI] = None
+    blockedUserUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgBlockUserAuditEntry']] = Field(
+        'OrgBlockUserAuditEntry', alias='__typename'
+    )
+
+
+class OrgConfigDisableCollaboratorsOnlyAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.config.disable_collaborators_only event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgConfigDisableCollaboratorsOnlyAuditEntry']
+    ] = Field(
+        'OrgConfigDisableCollaboratorsOnlyAuditEntry', alias='__typename'
+    )
+
+
+class OrgConfigEnableCollaboratorsOnlyAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.config.enable_collaborators_only event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgConfigEnableCollaboratorsOnlyAuditEntry']
+    ] = Field('OrgConfigEnableCollaboratorsOnlyAuditEntry', alias='__typename')
+
+
+class OrgCreateAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.create event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    billingPlan: Optional[OrgCreateAuditEntryBillingPlan] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgCreateAuditEntry']] = Field(
+        'OrgCreateAuditEntry', alias='__typename'
+    )
+
+
+class OrgDisableOauthAppRestrictionsAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.disable_oauth_app_restrictions event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgDisableOauthAppRestrictionsAuditEntry']
+    ] = Field('OrgDisableOauthAppRestrictionsAuditEntry', alias='__typename')
+
+
+class OrgDisableSamlAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.disable_saml event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    digestMethodUrl: Optional[URI] = None
+    id: ID
+    issuerUrl: Optional[URI] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    signatureMethodUrl: Optional[URI] = None
+    singleSignOnUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgDisableSamlAuditEntry']] = Field(
+        'OrgDisableSamlAuditEntry', alias='__typename'
+    )
+
+
+class OrgDisableTwoFactorRequirementAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.disable_two_factor_requirement event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgDisableTwoFactorRequirementAuditEntry']
+    ] = Field('OrgDisableTwoFactorRequirementAuditEntry', alias='__typename')
+
+
+class OrgEnableOauthAppRestrictionsAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.enable_oauth_app_restrictions event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgEnableOauthAppRestrictionsAuditEntry']
+    ] = Field('OrgEnableOauthAppRestrictionsAuditEntry', alias='__typename')
+
+
+class OrgEnableSamlAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.enable_saml event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    digestMethodUrl: Optional[URI] = None
+    id: ID
+    issuerUrl: Optional[URI] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    signatureMethodUrl: Optional[URI] = None
+    singleSignOnUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgEnableSamlAuditEntry']] = Field(
+        'OrgEnableSamlAuditEntry', alias='__typename'
+    )
+
+
+class OrgEnableTwoFactorRequirementAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.enable_two_factor_requirement event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgEnableTwoFactorRequirementAuditEntry']
+    ] = Field('OrgEnableTwoFactorRequirementAuditEntry', alias='__typename')
+
+
+class OrgInviteMemberAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.invite_member event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    email: Optional[String] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationInvitation: Optional[OrganizationInvitation] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgInviteMemberAuditEntry']] = Field(
+        'OrgInviteMemberAuditEntry', alias='__typename'
+    )
+
+
+class OrgInviteToBusinessAuditEntry(
+    AuditEntry, EnterpriseAuditEntryData, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.invite_to_business event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    enterpriseResourcePath: Optional[URI] = None
+    enterpriseSlug: Optional[String] = None
+    enterpriseUrl: Optional[URI] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgInviteToBusinessAuditEntry']] = Field(
+        'OrgInviteToBusinessAuditEntry', alias='__typename'
+    )
+
+
+class OrgOauthAppAccessApprovedAuditEntry(
+    AuditEntry,
+    Node,
+    OauthApplicationAuditEntryData,
+    OrganizationAuditEntryData,
+):
+    """
+    Audit log entry for a org.oauth_app_access_approved event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    oauthApplicationName: Optional[String] = None
+    oauthApplicationResourcePath: Optional[URI] = None
+    oauthApplicationUrl: Optional[URI] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgOauthAppAccessApprovedAuditEntry']
+    ] = Field('OrgOauthAppAccessApprovedAuditEntry', alias='__typename')
+
+
+class OrgOauthAppAccessBlockedAuditEntry(
+    AuditEntry,
+    Node,
+    OauthApplicationAuditEntryData,
+    OrganizationAuditEntryData,
+):
+    """
+    Audit log entry for a org.oauth_app_access_blocked event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    oauthApplicationName: Optional[String] = None
+    oauthApplicationResourcePath: Optional[URI] = None
+    oauthApplicationUrl: Optional[URI] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgOauthAppAccessBlockedAuditEntry']
+    ] = Field('OrgOauthAppAccessBlockedAuditEntry', alias='__typename')
+
+
+class OrgOauthAppAccessDeniedAuditEntry(
+    AuditEntry,
+    Node,
+    OauthApplicationAuditEntryData,
+    OrganizationAuditEntryData,
+):
+    """
+    Audit log entry for a org.oauth_app_access_denied event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    oauthApplicationName: Optional[String] = None
+    oauthApplicationResourcePath: Optional[URI] = None
+    oauthApplicationUrl: Optional[URI] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgOauthAppAccessDeniedAuditEntry']] = Field(
+        'OrgOauthAppAccessDeniedAuditEntry', alias='__typename'
+    )
+
+
+class OrgOauthAppAccessRequestedAuditEntry(
+    AuditEntry,
+    Node,
+    OauthApplicationAuditEntryData,
+    OrganizationAuditEntryData,
+):
+    """
+    Audit log entry for a org.oauth_app_access_requested event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    oauthApplicationName: Optional[String] = None
+    oauthApplicationResourcePath: Optional[URI] = None
+    oauthApplicationUrl: Optional[URI] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgOauthAppAccessRequestedAuditEntry']
+    ] = Field('OrgOauthAppAccessRequestedAuditEntry', alias='__typename')
+
+
+class OrgOauthAppAccessUnblockedAuditEntry(
+    AuditEntry,
+    Node,
+    OauthApplicationAuditEntryData,
+    OrganizationAuditEntryData,
+):
+    """
+    Audit log entry for a org.oauth_app_access_unblocked event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    oauthApplicationName: Optional[String] = None
+    oauthApplicationResourcePath: Optional[URI] = None
+    oauthApplicationUrl: Optional[URI] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgOauthAppAccessUnblockedAuditEntry']
+    ] = Field('OrgOauthAppAccessUnblockedAuditEntry', alias='__typename')
+
+
+class OrgRemoveBillingManagerAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.remove_billing_manager event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    reason: Optional[OrgRemoveBillingManagerAuditEntryReason] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgRemoveBillingManagerAuditEntry']] = Field(
+        'OrgRemoveBillingManagerAuditEntry', alias='__typename'
+    )
+
+
+class OrgRemoveMemberAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.remove_member event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    membershipTypes: Optional[
+        List[OrgRemoveMemberAuditEntryMembershipType]
+    ] = Field(default_factory=list)
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    reason: Optional[OrgRemoveMemberAuditEntryReason] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgRemoveMemberAuditEntry']] = Field(
+        'OrgRemoveMemberAuditEntry', alias='__typename'
+    )
+
+
+class OrgRemoveOutsideCollaboratorAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.remove_outside_collaborator event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    membershipTypes: Optional[
+        List[OrgRemoveOutsideCollaboratorAuditEntryMembershipType]
+    ] = Field(default_factory=list)
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    reason: Optional[OrgRemoveOutsideCollaboratorAuditEntryReason] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgRemoveOutsideCollaboratorAuditEntry']
+    ] = Field('OrgRemoveOutsideCollaboratorAuditEntry', alias='__typename')
+
+
+class OrgRestoreMemberAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.restore_member event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    restoredCustomEmailRoutingsCount: Optional[Int] = None
+    restoredIssueAssignmentsCount: Optional[Int] = None
+    restoredMemberships: Optional[
+        List[OrgRestoreMemberAuditEntryMembership]
+    ] = Field(default_factory=list)
+    restoredMembershipsCount: Optional[Int] = None
+    restoredRepositoriesCount: Optional[Int] = None
+    restoredRepositoryStarsCount: Optional[Int] = None
+    restoredRepositoryWatchesCount: Optional[Int] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgRestoreMemberAuditEntry']] = Field(
+        'OrgRestoreMemberAuditEntry', alias='__typename'
+    )
+
+
+class OrgRestoreMemberMembershipOrganizationAuditEntryData(
+    OrganizationAuditEntryData
+):
+    """
+    Metadata for an organization membership for org.restore_member actions
+    """
+
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgRestoreMemberMembershipOrganizationAuditEntryData']
+    ] = Field(
+        'OrgRestoreMemberMembershipOrganizationAuditEntryData',
+        alias='__typename',
+    )
+
+
+class OrgRestoreMemberMembershipRepositoryAuditEntryData(
+    RepositoryAuditEntryData
+):
+    """
+    Metadata for a repository membership for org.restore_member actions
+    """
+
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgRestoreMemberMembershipRepositoryAuditEntryData']
+    ] = Field(
+        'OrgRestoreMemberMembershipRepositoryAuditEntryData',
+        alias='__typename',
+    )
+
+
+class OrgRestoreMemberMembershipTeamAuditEntryData(TeamAuditEntryData):
+    """
+    Metadata for a team membership for org.restore_member actions
+    """
+
+    team: Optional[Team] = None
+    teamName: Optional[String] = None
+    teamResourcePath: Optional[URI] = None
+    teamUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgRestoreMemberMembershipTeamAuditEntryData']
+    ] = Field(
+        'OrgRestoreMemberMembershipTeamAuditEntryData', alias='__typename'
+    )
+
+
+class OrgUnblockUserAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.unblock_user
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    blockedUser: Optional[User] = None
+    blockedUserName: Optional[String] = None
+    blockedUserResourcePath: Optional[URI] = None
+    blockedUserUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgUnblockUserAuditEntry']] = Field(
+        'OrgUnblockUserAuditEntry', alias='__typename'
+    )
+
+
+class OrgUpdateDefaultRepositoryPermissionAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.update_default_repository_permission
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    permission: Optional[
+        OrgUpdateDefaultRepositoryPermissionAuditEntryPermission
+    ] = None
+    permissionWas: Optional[
+        OrgUpdateDefaultRepositoryPermissionAuditEntryPermission
+    ] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgUpdateDefaultRepositoryPermissionAuditEntry']
+    ] = Field(
+        'OrgUpdateDefaultRepositoryPermissionAuditEntry', alias='__typename'
+    )
+
+
+class OrgUpdateMemberAuditEntry(AuditEntry, Node, OrganizationAuditEntryData):
+    """
+    Audit log entry for a org.update_member event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    permission: Optional[OrgUpdateMemberAuditEntryPermission] = None
+    permissionWas: Optional[OrgUpdateMemberAuditEntryPermission] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrgUpdateMemberAuditEntry']] = Field(
+        'OrgUpdateMemberAuditEntry', alias='__typename'
+    )
+
+
+class OrgUpdateMemberRepositoryCreationPermissionAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.update_member_repository_creation_permission event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    canCreateRepositories: Optional[Boolean] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    visibility: Optional[
+        OrgUpdateMemberRepositoryCreationPermissionAuditEntryVisibility
+    ] = None
+    typename__: Optional[
+        Literal['OrgUpdateMemberRepositoryCreationPermissionAuditEntry']
+    ] = Field(
+        'OrgUpdateMemberRepositoryCreationPermissionAuditEntry',
+        alias='__typename',
+    )
+
+
+class OrgUpdateMemberRepositoryInvitationPermissionAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a org.update_member_repository_invitation_permission event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    canInviteOutsideCollaboratorsToRepositories: Optional[Boolean] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['OrgUpdateMemberRepositoryInvitationPermissionAuditEntry']
+    ] = Field(
+        'OrgUpdateMemberRepositoryInvitationPermissionAuditEntry',
+        alias='__typename',
+    )
+
+
+class Organization(
+    Actor,
+    AnnouncementBanner,
+    MemberStatusable,
+    Node,
+    PackageOwner,
+    ProfileOwner,
+    ProjectOwner,
+    ProjectV2Owner,
+    ProjectV2Recent,
+    RepositoryDiscussionAuthor,
+    RepositoryDiscussionCommentAuthor,
+    RepositoryOwner,
+    Sponsorable,
+    UniformResourceLocatable,
+):
+    """
+    An account on GitHub, with one or more owners, that has repositories, members and teams.
+    """
+
+    announcement: Optional[String] = None
+    announcementExpiresAt: Optional[DateTime] = None
+    announcementUserDismissible: Optional[Boolean] = None
+    anyPinnableItems: Boolean
+    archivedAt: Optional[DateTime] = None
+    auditLog: OrganizationAuditEntryConnection
+    avatarUrl: URI
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    description: Optional[String] = None
+    descriptionHTML: Optional[String] = None
+    domains: Optional[VerifiableDomainConnection] = None
+    email: Optional[String] = None
+    enterpriseOwners: OrganizationEnterpriseOwnerConnection
+    estimatedNextSponsorsPayoutInCents: Int
+    hasSponsorsListing: Boolean
+    id: ID
+    interactionAbility: Optional[RepositoryInteractionAbility] = None
+    ipAllowListEnabledSetting: IpAllowListEnabledSettingValue
+    ipAllowListEntries: IpAllowListEntryConnection
+    ipAllowListForInstalledAppsEnabledSetting: IpAllowListForInstalledAppsEnabledSettingValue
+    isSponsoredBy: Boolean
+    isSponsoringViewer: Boolean
+    isVerified: Boolean
+    itemShowcase: ProfileItemShowcase
+    location: Optional[String] = None
+    login: String
+    mannequins: MannequinConnection
+    memberStatuses: UserStatusConnection
+    membersCanForkPrivateRepositories: Boolean
+    membersWithRole: OrganizationMemberConnection
+    monthlyEstimatedSponsorsIncomeInCents: Int
+    name: Optional[String] = None
+    newTeamResourcePath: URI
+    newTeamUrl: URI
+    notificationDeliveryRestrictionEnabledSetting: NotificationRestrictionSettingValue
+    organizationBillingEmail: Optional[String] = None
+    packages: PackageConnection
+    pendingMembers: UserConnection
+    pinnableItems: PinnableItemConnection
+    pinnedItems: PinnableItemConnection
+    pinnedItemsRemaining: Int
+    project: Optional[Project] = None
+    projectV2: Optional[ProjectV2] = None
+    projects: ProjectConnection
+    projectsResourcePath: URI
+    projectsUrl: URI
+    projectsV2: ProjectV2Connection
+    recentProjects: ProjectV2Connection
+    repositories: RepositoryConnection
+    repository: Optional[Repository] = None
+    repositoryDiscussionComments: DiscussionCommentConnection
+    repositoryDiscussions: DiscussionConnection
+    repositoryMigrations: RepositoryMigrationConnection
+    requiresTwoFactorAuthentication: Optional[Boolean] = None
+    resourcePath: URI
+    ruleset: Optional[RepositoryRuleset] = None
+    rulesets: Optional[RepositoryRulesetConnection] = None
+    samlIdentityProvider: Optional[OrganizationIdentityProvider] = None
+    sponsoring: SponsorConnection
+    sponsors: SponsorConnection
+    sponsorsActivities: SponsorsActivityConnection
+    sponsorsListing: Optional[SponsorsListing] = None
+    sponsorshipForViewerAsSponsor: Optional[Sponsorship] = None
+    sponsorshipForViewerAsSponsorable: Optional[Sponsorship] = None
+    sponsorshipNewsletters: SponsorshipNewsletterConnection
+    sponsorshipsAsMaintainer: SponsorshipConnection
+    sponsorshipsAsSponsor: SponsorshipConnection
+    team: Optional[Team] = None
+    teams: TeamConnection
+    teamsResourcePath: URI
+    teamsUrl: URI
+    totalSponsorshipAmountAsSponsorInCents: Optional[Int] = None
+    twitterUsername: Optional[String] = None
+    updatedAt: DateTime
+    url: URI
+    viewerCanAdminister: Boolean
+    viewerCanChangePinnedItems: Boolean
+    viewerCanCreateProjects: Boolean
+    viewerCanCreateRepositories: Boolean
+    viewerCanCreateTeams: Boolean
+    viewerCanSponsor: Boolean
+    viewerIsAMember: Boolean
+    viewerIsFollowing: Boolean
+    viewerIsSponsoring: Boolean
+    webCommitSignoffRequired: Boolean
+    websiteUrl: Optional[URI] = None
+    typename__: Optional[Literal['Organization']] = Field(
+        'Organization', alias='__typename'
+    )
+
+
+class OrganizationAuditEntryConnection(BaseModel):
+    """
+    The connection type for OrganizationAuditEntry.
+    """
+
+    edges: Optional[List[Optional[OrganizationAuditEntryEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[OrganizationAuditEntry]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['OrganizationAuditEntryConnection']] = Field(
+        'OrganizationAuditEntryConnection', alias='__typename'
+    )
+
+
+class OrganizationAuditEntryEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[OrganizationAuditEntry] = None
+    typename__: Optional[Literal['OrganizationAuditEntryEdge']] = Field(
+        'OrganizationAuditEntryEdge', alias='__typename'
+    )
+
+
+class OrganizationConnection(BaseModel):
+    """
+    A list of organizations managed by an enterprise.
+    """
+
+    edges: Optional[List[Optional[OrganizationEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Organization]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['OrganizationConnection']] = Field(
+        'OrganizationConnection', alias='__typename'
+    )
+
+
+class OrganizationEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Organization] = None
+    typename__: Optional[Literal['OrganizationEdge']] = Field(
+        'OrganizationEdge', alias='__typename'
+    )
+
+
+class OrganizationEnterpriseOwnerConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[OrganizationEnterpriseOwnerEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['OrganizationEnterpriseOwnerConnection']
+    ] = Field('OrganizationEnterpriseOwnerConnection', alias='__typename')
+
+
+class OrganizationEnterpriseOwnerEdge(BaseModel):
+    """
+    An enterprise owner in the context of an organization that is part of the enterprise.
+    """
+
+    cursor: String
+    node: Optional[User] = None
+    organizationRole: RoleInOrganization
+    typename__: Optional[Literal['OrganizationEnterpriseOwnerEdge']] = Field(
+        'OrganizationEnterpriseOwnerEdge', alias='__typename'
+    )
+
+
+class OrganizationIdentityProvider(Node):
+    """
+    An Identity Provider configured to provision SAML and SCIM identities for
+    Organizations. Visible to (1) organization owners, (2) organization owners'
+    personal access tokens (classic) with read:org or admin:org scope, (3) GitHub
+    App with an installation token with read or write access to members.
+    """
+
+    digestMethod: Optional[URI] = None
+    externalIdentities: ExternalIdentityConnection
+    id: ID
+    idpCertificate: Optional[X509Certificate] = None
+    issuer: Optional[String] = None
+    organization: Optional[Organization] = None
+    signatureMethod: Optional[URI] = None
+    ssoUrl: Optional[URI] = None
+    typename__: Optional[Literal['OrganizationIdentityProvider']] = Field(
+        'OrganizationIdentityProvider', alias='__typename'
+    )
+
+
+class OrganizationInvitation(Node):
+    """
+    An Invitation for a user to an organization.
+    """
+
+    createdAt: DateTime
+    email: Optional[String] = None
+    id: ID
+    invitationSource: OrganizationInvitationSource
+    invitationType: OrganizationInvitationType
+    invitee: Optional[User] = None
+    inviter: User
+    organization: Organization
+    role: OrganizationInvitationRole
+    typename__: Optional[Literal['OrganizationInvitation']] = Field(
+        'OrganizationInvitation', alias='__typename'
+    )
+
+
+class OrganizationInvitationConnection(BaseModel):
+    """
+    The connection type for OrganizationInvitation.
+    """
+
+    edges: Optional[List[Optional[OrganizationInvitationEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[OrganizationInvitation]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['OrganizationInvitationConnection']] = Field(
+        'OrganizationInvitationConnection', alias='__typename'
+    )
+
+
+class OrganizationInvitationEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[OrganizationInvitation] = None
+    typename__: Optional[Literal['OrganizationInvitationEdge']] = Field(
+        'OrganizationInvitationEdge', alias='__typename'
+    )
+
+
+class OrganizationMemberConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[OrganizationMemberEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['OrganizationMemberConnection']] = Field(
+        'OrganizationMemberConnection', alias='__typename'
+    )
+
+
+class OrganizationMemberEdge(BaseModel):
+    """
+    Represents a user within an organization.
+    """
+
+    cursor: String
+    hasTwoFactorEnabled: Optional[Boolean] = None
+    node: Optional[User] = None
+    role: Optional[OrganizationMemberRole] = None
+    typename__: Optional[Literal['OrganizationMemberEdge']] = Field(
+        'OrganizationMemberEdge', alias='__typename'
+    )
+
+
+class Package(Node):
+    """
+    Information for an uploaded package.
+    """
+
+    id: ID
+    latestVersion: Optional[PackageVersion] = None
+    name: String
+    packageType: PackageType
+    repository: Optional[Repository] = None
+    statistics: Optional[PackageStatistics] = None
+    version: Optional[PackageVersion] = None
+    versions: PackageVersionConnection
+    typename__: Optional[Literal['Package']] = Field(
+        'Package', alias='__typename'
+    )
+
+
+class PackageConnection(BaseModel):
+    """
+    The connection type for Package.
+    """
+
+    edges: Optional[List[Optional[PackageEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Package]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PackageConnection']] = Field(
+        'PackageConnection', alias='__typename'
+    )
+
+
+class PackageEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Package] = None
+    typename__: Optional[Literal['PackageEdge']] = Field(
+        'PackageEdge', alias='__typename'
+    )
+
+
+class PackageFile(Node):
+    """
+    A file in a package version.
+    """
+
+    id: ID
+    md5: Optional[String] = None
+    name: String
+    packageVersion: Optional[PackageVersion] = None
+    sha1: Optional[String] = None
+    sha256: Optional[String] = None
+    size: Optional[Int] = None
+    updatedAt: DateTime
+    url: Optional[URI] = None
+    typename__: Optional[Literal['PackageFile']] = Field(
+        'PackageFile', alias='__typename'
+    )
+
+
+class PackageFileConnection(BaseModel):
+    """
+    The connection type for PackageFile.
+    """
+
+    edges: Optional[List[Optional[PackageFileEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PackageFile]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PackageFileConnection']] = Field(
+        'PackageFileConnection', alias='__typename'
+    )
+
+
+class PackageFileEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PackageFile] = None
+    typename__: Optional[Literal['PackageFileEdge']] = Field(
+        'PackageFileEdge', alias='__typename'
+    )
+
+
+class PackageVersion(Node):
+    """
+    Information about a specific package version.
+    """
+
+    files: PackageFileConnection
+    id: ID
+    package: Optional[Package] = None
+    platform: Optional[String] = None
+    preRelease: Boolean
+    readme: Optional[String] = None
+    release: Optional[Release] = None
+    statistics: Optional[PackageVersionStatistics] = None
+    summary: Optional[String] = None
+    version: String
+    typename__: Optional[Literal['PackageVersion']] = Field(
+        'PackageVersion', alias='__typename'
+    )
+
+
+class PackageVersionConnection(BaseModel):
+    """
+    The connection type for PackageVersion.
+    """
+
+    edges: Optional[List[Optional[PackageVersionEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PackageVersion]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PackageVersionConnection']] = Field(
+        'PackageVersionConnection', alias='__typename'
+    )
+
+
+class PackageVersionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PackageVersion] = None
+    typename__: Optional[Literal['PackageVersionEdge']] = Field(
+        'PackageVersionEdge', alias='__typename'
+    )
+
+
+class PermissionSource(BaseModel):
+    """
+    A level of permission and source for a user's access to a repository.
+    """
+
+    organization: Organization
+    permission: DefaultRepositoryPermissionField
+    roleName: Optional[String] = None
+    source: PermissionGranter
+    typename__: Optional[Literal['PermissionSource']] = Field(
+        'PermissionSource', alias='__typename'
+    )
+
+
+class PinnableItemConnection(BaseModel):
+    """
+    The connection type for PinnableItem.
+    """
+
+    edges: Optional[List[Optional[PinnableItemEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PinnableItem]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PinnableItemConnection']] = Field(
+        'PinnableItemConnection', alias='__typename'
+    )
+
+
+class PinnableItemEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PinnableItem] = None
+    typename__: Optional[Literal['PinnableItemEdge']] = Field(
+        'PinnableItemEdge', alias='__typename'
+    )
+
+
+class PinnedDiscussion(Node, RepositoryNode):
+    """
+    A Pinned Discussion is a discussion pinned to a repository's index page.
+    """
+
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    discussion: Discussion
+    gradientStopColors: List[String]
+    id: ID
+    pattern: PinnedDiscussionPattern
+    pinnedBy: Actor
+    preconfiguredGradient: Optional[PinnedDiscussionGradient] = None
+    repository: Repository
+    updatedAt: DateTime
+    typename__: Optional[Literal['PinnedDiscussion']] = Field(
+        'PinnedDiscussion', alias='__typename'
+    )
+
+
+class PinnedDiscussionConnection(BaseModel):
+    """
+    The connection type for PinnedDiscussion.
+    """
+
+    edges: Optional[List[Optional[PinnedDiscussionEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PinnedDiscussion]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PinnedDiscussionConnection']] = Field(
+        'PinnedDiscussionConnection', alias='__typename'
+    )
+
+
+class PinnedDiscussionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PinnedDiscussion] = None
+    typename__: Optional[Literal['PinnedDiscussionEdge']] = Field(
+        'PinnedDiscussionEdge', alias='__typename'
+    )
+
+
+class PinnedEvent(Node):
+    """
+    Represents a 'pinned' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    issue: Issue
+    typename__: Optional[Literal['PinnedEvent']] = Field(
+        'PinnedEvent', alias='__typename'
+    )
+
+
+class PinnedIssue(Node):
+    """
+    A Pinned Issue is a issue pinned to a repository's index page.
+    """
+
+    databaseId: Optional[Int] = None
+    fullDatabaseId: Optional[BigInt] = None
+    id: ID
+    issue: Issue
+    pinnedBy: Actor
+    repository: Repository
+    typename__: Optional[Literal['PinnedIssue']] = Field(
+        'PinnedIssue', alias='__typename'
+    )
+
+
+class PinnedIssueConnection(BaseModel):
+    """
+    The connection type for PinnedIssue.
+    """
+
+    edges: Optional[List[Optional[PinnedIssueEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PinnedIssue]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PinnedIssueConnection']] = Field(
+        'PinnedIssueConnection', alias='__typename'
+    )
+
+
+class PinnedIssueEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PinnedIssue] = None
+    typename__: Optional[Literal['PinnedIssueEdge']] = Field(
+        'PinnedIssueEdge', alias='__typename'
+    )
+
+
+class PrivateRepositoryForkingDisableAuditEntry(
+    AuditEntry,
+    EnterpriseAuditEntryData,
+    Node,
+    OrganizationAuditEntryData,
+    RepositoryAuditEntryData,
+):
+    """
+    Audit log entry for a private_repository_forking.disable event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    enterpriseResourcePath: Optional[URI] = None
+    enterpriseSlug: Optional[String] = None
+    enterpriseUrl: Optional[URI] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['PrivateRepositoryForkingDisableAuditEntry']
+    ] = Field('PrivateRepositoryForkingDisableAuditEntry', alias='__typename')
+
+
+class PrivateRepositoryForkingEnableAuditEntry(
+    AuditEntry,
+    EnterpriseAuditEntryData,
+    Node,
+    OrganizationAuditEntryData,
+    RepositoryAuditEntryData,
+):
+    """
+    Audit log entry for a private_repository_forking.enable event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    enterpriseResourcePath: Optional[URI] = None
+    enterpriseSlug: Optional[String] = None
+    enterpriseUrl: Optional[URI] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['PrivateRepositoryForkingEnableAuditEntry']
+    ] = Field('PrivateRepositoryForkingEnableAuditEntry', alias='__typename')
+
+
+class ProfileItemShowcase(BaseModel):
+    """
+    A curatable list of repositories relating to a repository owner, which defaults
+    to showing the most popular repositories they own.
+    """
+
+    hasPinnedItems: Boolean
+    items: PinnableItemConnection
+    typename__: Optional[Literal['ProfileItemShowcase']] = Field(
+        'ProfileItemShowcase', alias='__typename'
+    )
+
+
+class Project(Closable, Node, Updatable):
+    """
+    Projects manage issues, pull requests and notes within a project owner.
+    """
+
+    body: Optional[String] = None
+    bodyHTML: HTML
+    closed: Boolean
+    closedAt: Optional[DateTime] = None
+    columns: ProjectColumnConnection
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    id: ID
+    name: String
+    number: Int
+    owner: ProjectOwner
+    pendingCards: ProjectCardConnection
+    progress: ProjectProgress
+    resourcePath: URI
+    state: ProjectState
+    updatedAt: DateTime
+    url: URI
+    viewerCanClose: Boolean
+    viewerCanReopen: Boolean
+    viewerCanUpdate: Boolean
+    typename__: Optional[Literal['Project']] = Field(
+        'Project', alias='__typename'
+    )
+
+
+class ProjectCard(Node):
+    """
+    A card in a project.
+    """
+
+    column: Optional[ProjectColumn] = None
+    content: Optional[ProjectCardItem] = None
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    id: ID
+    isArchived: Boolean
+    note: Optional[String] = None
+    project: Project
+    resourcePath: URI
+    state: Optional[ProjectCardState] = None
+    updatedAt: DateTime
+    url: URI
+    typename__: Optional[Literal['ProjectCard']] = Field(
+        'ProjectCard', alias='__typename'
+    )
+
+
+class ProjectCardConnection(BaseModel):
+    """
+    The connection type for ProjectCard.
+    """
+
+    edges: Optional[List[Optional[ProjectCardEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectCard]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectCardConnection']] = Field(
+        'ProjectCardConnection', alias='__typename'
+    )
+
+
+class ProjectCardEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectCard] = None
+    typename__: Optional[Literal['ProjectCardEdge']] = Field(
+        'ProjectCardEdge', alias='__typename'
+    )
+
+
+class ProjectColumn(Node):
+    """
+    A column inside a project.
+    """
+
+    cards: ProjectCardConnection
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    id: ID
+    name: String
+    project: Project
+    purpose: Optional[ProjectColumnPurpose] = None
+    resourcePath: URI
+    updatedAt: DateTime
+    url: URI
+    typename__: Optional[Literal['ProjectColumn']] = Field(
+        'ProjectColumn', alias='__typename'
+    )
+
+
+class ProjectColumnConnection(BaseModel):
+    """
+    The connection type for ProjectColumn.
+    """
+
+    edges: Optional[List[Optional[ProjectColumnEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectColumn]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectColumnConnection']] = Field(
+        'ProjectColumnConnection', alias='__typename'
+    )
+
+
+class ProjectColumnEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectColumn] = None
+    typename__: Optional[Literal['ProjectColumnEdge']] = Field(
+        'ProjectColumnEdge', alias='__typename'
+    )
+
+
+class ProjectConnection(BaseModel):
+    """
+    A list of projects associated with the owner.
+    """
+
+    edges: Optional[List[Optional[ProjectEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Project]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectConnection']] = Field(
+        'ProjectConnection', alias='__typename'
+    )
+
+
+class ProjectEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Project] = None
+    typename__: Optional[Literal['ProjectEdge']] = Field(
+        'ProjectEdge', alias='__typename'
+    )
+
+
+class ProjectV2(Closable, Node, Updatable):
+    """
+    New projects that manage issues, pull requests and drafts using tables and boards.
+    """
+
+    closed: Boolean
+    closedAt: Optional[DateTime] = None
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    field: Optional[ProjectV2FieldConfiguration] = None
+    fields: ProjectV2FieldConfigurationConnection
+    id: ID
+    items: ProjectV2ItemConnection
+    number: Int
+    owner: ProjectV2Owner
+    public: Boolean
+    readme: Optional[String] = None
+    repositories: RepositoryConnection
+    resourcePath: URI
+    shortDescription: Optional[String] = None
+    teams: TeamConnection
+    template: Boolean
+    title: String
+    updatedAt: DateTime
+    url: URI
+    view: Optional[ProjectV2View] = None
+    viewerCanClose: Boolean
+    viewerCanReopen: Boolean
+    viewerCanUpdate: Boolean
+    views: ProjectV2ViewConnection
+    workflow: Optional[ProjectV2Workflow] = None
+    workflows: ProjectV2WorkflowConnection
+    typename__: Optional[Literal['ProjectV2']] = Field(
+        'ProjectV2', alias='__typename'
+    )
+
+
+class ProjectV2Connection(BaseModel):
+    """
+    The connection type for ProjectV2.
+    """
+
+    edges: Optional[List[Optional[ProjectV2Edge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectV2Connection']] = Field(
+        'ProjectV2Connection', alias='__typename'
+    )
+
+
+class ProjectV2Edge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2] = None
+    typename__: Optional[Literal['ProjectV2Edge']] = Field(
+        'ProjectV2Edge', alias='__typename'
+    )
+
+
+class ProjectV2Field(Node, ProjectV2FieldCommon):
+    """
+    A field inside a project.
+    """
+
+    createdAt: DateTime
+    dataType: ProjectV2FieldType
+    databaseId: Optional[Int] = None
+    id: ID
+    name: String
+    project: ProjectV2
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2Field']] = Field(
+        'ProjectV2Field', alias='__typename'
+    )
+
+
+class ProjectV2FieldConfigurationConnection(BaseModel):
+    """
+    The connection type for ProjectV2FieldConfiguration.
+    """
+
+    edges: Optional[List[Optional[ProjectV2FieldConfigurationEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2FieldConfiguration]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['ProjectV2FieldConfigurationConnection']
+    ] = Field('ProjectV2FieldConfigurationConnection', alias='__typename')
+
+
+class ProjectV2FieldConfigurationEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2FieldConfiguration] = None
+    typename__: Optional[Literal['ProjectV2FieldConfigurationEdge']] = Field(
+        'ProjectV2FieldConfigurationEdge', alias='__typename'
+    )
+
+
+class ProjectV2FieldConnection(BaseModel):
+    """
+    The connection type for ProjectV2Field.
+    """
+
+    edges: Optional[List[Optional[ProjectV2FieldEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2Field]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectV2FieldConnection']] = Field(
+        'ProjectV2FieldConnection', alias='__typename'
+    )
+
+
+class ProjectV2FieldEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2Field] = None
+    typename__: Optional[Literal['ProjectV2FieldEdge']] = Field(
+        'ProjectV2FieldEdge', alias='__typename'
+    )
+
+
+class ProjectV2Item(Node):
+    """
+    An item within a Project.
+    """
+
+    content: Optional[ProjectV2ItemContent] = None
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    fieldValueByName: Optional[ProjectV2ItemFieldValue] = None
+    fieldValues: ProjectV2ItemFieldValueConnection
+    id: ID
+    isArchived: Boolean
+    project: ProjectV2
+    type: ProjectV2ItemType
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2Item']] = Field(
+        'ProjectV2Item', alias='__typename'
+    )
+
+
+class ProjectV2ItemConnection(BaseModel):
+    """
+    The connection type for ProjectV2Item.
+    """
+
+    edges: Optional[List[Optional[ProjectV2ItemEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2Item]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectV2ItemConnection']] = Field(
+        'ProjectV2ItemConnection', alias='__typename'
+    )
+
+
+class ProjectV2ItemEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2Item] = None
+    typename__: Optional[Literal['ProjectV2ItemEdge']] = Field(
+        'ProjectV2ItemEdge', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldDateValue(Node, ProjectV2ItemFieldValueCommon):
+    """
+    The value of a date field in a Project item.
+    """
+
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    date: Optional[Date] = None
+    field: ProjectV2FieldConfiguration
+    id: ID
+    item: ProjectV2Item
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2ItemFieldDateValue']] = Field(
+        'ProjectV2ItemFieldDateValue', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldIterationValue(Node, ProjectV2ItemFieldValueCommon):
+    """
+    The value of an iteration field in a Project item.
+    """
+
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    duration: Int
+    field: ProjectV2FieldConfiguration
+    id: ID
+    item: ProjectV2Item
+    iterationId: String
+    startDate: Date
+    title: String
+    titleHTML: String
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2ItemFieldIterationValue']] = Field(
+        'ProjectV2ItemFieldIterationValue', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldLabelValue(BaseModel):
+    """
+    The value of the labels field in a Project item.
+    """
+
+    field: ProjectV2FieldConfiguration
+    labels: Optional[LabelConnection] = None
+    typename__: Optional[Literal['ProjectV2ItemFieldLabelValue']] = Field(
+        'ProjectV2ItemFieldLabelValue', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldMilestoneValue(BaseModel):
+    """
+    The value of a milestone field in a Project item.
+    """
+
+    field: ProjectV2FieldConfiguration
+    milestone: Optional[Milestone] = None
+    typename__: Optional[Literal['ProjectV2ItemFieldMilestoneValue']] = Field(
+        'ProjectV2ItemFieldMilestoneValue', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldNumberValue(Node, ProjectV2ItemFieldValueCommon):
+    """
+    The value of a number field in a Project item.
+    """
+
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    field: ProjectV2FieldConfiguration
+    id: ID
+    item: ProjectV2Item
+    number: Optional[Float] = None
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2ItemFieldNumberValue']] = Field(
+        'ProjectV2ItemFieldNumberValue', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldPullRequestValue(BaseModel):
+    """
+    The value of a pull request field in a Project item.
+    """
+
+    field: ProjectV2FieldConfiguration
+    pullRequests: Optional[PullRequestConnection] = None
+    typename__: Optional[
+        Literal['ProjectV2ItemFieldPullRequestValue']
+    ] = Field('ProjectV2ItemFieldPullRequestValue', alias='__typename')
+
+
+class ProjectV2ItemFieldRepositoryValue(BaseModel):
+    """
+    The value of a repository field in a Project item.
+    """
+
+    field: ProjectV2FieldConfiguration
+    repository: Optional[Repository] = None
+    typename__: Optional[Literal['ProjectV2ItemFieldRepositoryValue']] = Field(
+        'ProjectV2ItemFieldRepositoryValue', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldReviewerValue(BaseModel):
+    """
+    The value of a reviewers field in a Project item.
+    """
+
+    field: ProjectV2FieldConfiguration
+    reviewers: Optional[RequestedReviewerConnection] = None
+    typename__: Optional[Literal['ProjectV2ItemFieldReviewerValue']] = Field(
+        'ProjectV2ItemFieldReviewerValue', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldSingleSelectValue(Node, ProjectV2ItemFieldValueCommon):
+    """
+    The value of a single select field in a Project item.
+    """
+
+    color: ProjectV2SingleSelectFieldOptionColor
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    description: Optional[String] = None
+    descriptionHTML: Optional[String] = None
+    field: ProjectV2FieldConfiguration
+    id: ID
+    item: ProjectV2Item
+    name: Optional[String] = None
+    nameHTML: Optional[String] = None
+    optionId: Optional[String] = None
+    updatedAt: DateTime
+    typename__: Optional[
+        Literal['ProjectV2ItemFieldSingleSelectValue']
+    ] = Field('ProjectV2ItemFieldSingleSelectValue', alias='__typename')
+
+
+class ProjectV2ItemFieldTextValue(Node, ProjectV2ItemFieldValueCommon):
+    """
+    The value of a text field in a Project item.
+    """
+
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    databaseId: Optional[Int] = None
+    field: ProjectV2FieldConfiguration
+    id: ID
+    item: ProjectV2Item
+    text: Optional[String] = None
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2ItemFieldTextValue']] = Field(
+        'ProjectV2ItemFieldTextValue', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldUserValue(BaseModel):
+    """
+    The value of a user field in a Project item.
+    """
+
+    field: ProjectV2FieldConfiguration
+    users: Optional[UserConnection] = None
+    typename__: Optional[Literal['ProjectV2ItemFieldUserValue']] = Field(
+        'ProjectV2ItemFieldUserValue', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldValueConnection(BaseModel):
+    """
+    The connection type for ProjectV2ItemFieldValue.
+    """
+
+    edges: Optional[List[Optional[ProjectV2ItemFieldValueEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2ItemFieldValue]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectV2ItemFieldValueConnection']] = Field(
+        'ProjectV2ItemFieldValueConnection', alias='__typename'
+    )
+
+
+class ProjectV2ItemFieldValueEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2ItemFieldValue] = None
+    typename__: Optional[Literal['ProjectV2ItemFieldValueEdge']] = Field(
+        'ProjectV2ItemFieldValueEdge', alias='__typename'
+    )
+
+
+class ProjectV2IterationField(Node, ProjectV2FieldCommon):
+    """
+    An iteration field inside a project.
+    """
+
+    configuration: ProjectV2IterationFieldConfiguration
+    createdAt: DateTime
+    dataType: ProjectV2FieldType
+    databaseId: Optional[Int] = None
+    id: ID
+    name: String
+    project: ProjectV2
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2IterationField']] = Field(
+        'ProjectV2IterationField', alias='__typename'
+    )
+
+
+class ProjectV2SingleSelectField(Node, ProjectV2FieldCommon):
+    """
+    A single select field inside a project.
+    """
+
+    createdAt: DateTime
+    dataType: ProjectV2FieldType
+    databaseId: Optional[Int] = None
+    id: ID
+    name: String
+    options: List[ProjectV2SingleSelectFieldOption]
+    project: ProjectV2
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2SingleSelectField']] = Field(
+        'ProjectV2SingleSelectField', alias='__typename'
+    )
+
+
+class ProjectV2SortBy(BaseModel):
+    """
+    Represents a sort by field and direction.
+    """
+
+    direction: OrderDirection
+    field: ProjectV2Field
+    typename__: Optional[Literal['ProjectV2SortBy']] = Field(
+        'ProjectV2SortBy', alias='__typename'
+    )
+
+
+class ProjectV2SortByConnection(BaseModel):
+    """
+    The connection type for ProjectV2SortBy.
+    """
+
+    edges: Optional[List[Optional[ProjectV2SortByEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2SortBy]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectV2SortByConnection']] = Field(
+        'ProjectV2SortByConnection', alias='__typename'
+    )
+
+
+class ProjectV2SortByEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2SortBy] = None
+    typename__: Optional[Literal['ProjectV2SortByEdge']] = Field(
+        'ProjectV2SortByEdge', alias='__typename'
+    )
+
+
+class ProjectV2SortByField(BaseModel):
+    """
+    Represents a sort by field and direction.
+    """
+
+    direction: OrderDirection
+    field: ProjectV2FieldConfiguration
+    typename__: Optional[Literal['ProjectV2SortByField']] = Field(
+        'ProjectV2SortByField', alias='__typename'
+    )
+
+
+class ProjectV2SortByFieldConnection(BaseModel):
+    """
+    The connection type for ProjectV2SortByField.
+    """
+
+    edges: Optional[List[Optional[ProjectV2SortByFieldEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2SortByField]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectV2SortByFieldConnection']] = Field(
+        'ProjectV2SortByFieldConnection', alias='__typename'
+    )
+
+
+class ProjectV2SortByFieldEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2SortByField] = None
+    typename__: Optional[Literal['ProjectV2SortByFieldEdge']] = Field(
+        'ProjectV2SortByFieldEdge', alias='__typename'
+    )
+
+
+class ProjectV2View(Node):
+    """
+    A view within a ProjectV2.
+    """
+
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    fields: Optional[ProjectV2FieldConfigurationConnection] = None
+    filter: Optional[String] = None
+    groupBy: Optional[ProjectV2FieldConnection] = None
+    groupByFields: Optional[ProjectV2FieldConfigurationConnection] = None
+    id: ID
+    layout: ProjectV2ViewLayout
+    name: String
+    number: Int
+    project: ProjectV2
+    sortBy: Optional[ProjectV2SortByConnection] = None
+    sortByFields: Optional[ProjectV2SortByFieldConnection] = None
+    updatedAt: DateTime
+    verticalGroupBy: Optional[ProjectV2FieldConnection] = None
+    verticalGroupByFields: Optional[
+        ProjectV2FieldConfigurationConnection
+    ] = None
+    visibleFields: Optional[ProjectV2FieldConnection] = None
+    typename__: Optional[Literal['ProjectV2View']] = Field(
+        'ProjectV2View', alias='__typename'
+    )
+
+
+class ProjectV2ViewConnection(BaseModel):
+    """
+    The connection type for ProjectV2View.
+    """
+
+    edges: Optional[List[Optional[ProjectV2ViewEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2View]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectV2ViewConnection']] = Field(
+        'ProjectV2ViewConnection', alias='__typename'
+    )
+
+
+class ProjectV2ViewEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2View] = None
+    typename__: Optional[Literal['ProjectV2ViewEdge']] = Field(
+        'ProjectV2ViewEdge', alias='__typename'
+    )
+
+
+class ProjectV2Workflow(Node):
+    """
+    A workflow inside a project.
+    """
+
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    enabled: Boolean
+    id: ID
+    name: String
+    number: Int
+    project: ProjectV2
+    updatedAt: DateTime
+    typename__: Optional[Literal['ProjectV2Workflow']] = Field(
+        'ProjectV2Workflow', alias='__typename'
+    )
+
+
+class ProjectV2WorkflowConnection(BaseModel):
+    """
+    The connection type for ProjectV2Workflow.
+    """
+
+    edges: Optional[List[Optional[ProjectV2WorkflowEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2Workflow]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectV2WorkflowConnection']] = Field(
+        'ProjectV2WorkflowConnection', alias='__typename'
+    )
+
+
+class ProjectV2WorkflowEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2Workflow] = None
+    typename__: Optional[Literal['ProjectV2WorkflowEdge']] = Field(
+        'ProjectV2WorkflowEdge', alias='__typename'
+    )
+
+
+class PullRequest(
+    Assignable,
+    Closable,
+    Comment,
+    Labelable,
+    Lockable,
+    Node,
+    ProjectV2Owner,
+    Reactable,
+    RepositoryNode,
+    Subscribable,
+    UniformResourceLocatable,
+    Updatable,
+    UpdatableComment,
+):
+    """
+    A repository pull request.
+    """
+
+    activeLockReason: Optional[LockReason] = None
+    additions: Int
+    assignees: UserConnection
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    autoMergeRequest: Optional[AutoMergeRequest] = None
+    baseRef: Optional[Ref] = None
+    baseRefName: String
+    baseRefOid: GitObjectID
+    baseRepository: Optional[Repository] = None
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    canBeRebased: Boolean
+    changedFiles: Int
+    checksResourcePath: URI
+    checksUrl: URI
+    closed: Boolean
+    closedAt: Optional[DateTime] = None
+    closingIssuesReferences: Optional[IssueConnection] = None
+    comments: IssueCommentConnection
+    commits: PullRequestCommitConnection
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    deletions: Int
+    editor: Optional[Actor] = None
+    files: Optional[PullRequestChangedFileConnection] = None
+    headRef: Optional[Ref] = None
+    headRefName: String
+    headRefOid: GitObjectID
+    headRepository: Optional[Repository] = None
+    headRepositoryOwner: Optional[RepositoryOwner] = None
+    hovercard: Hovercard
+    id: ID
+    includesCreatedEdit: Boolean
+    isCrossRepository: Boolean
+    isDraft: Boolean
+    isReadByViewer: Optional[Boolean] = None
+    labels: Optional[LabelConnection] = None
+    lastEditedAt: Optional[DateTime] = None
+    latestOpinionatedReviews: Optional[PullRequestReviewConnection] = None
+    latestReviews: Optional[PullRequestReviewConnection] = None
+    locked: Boolean
+    maintainerCanModify: Boolean
+    mergeCommit: Optional[Commit] = None
+    mergeQueueEntry: Optional[MergeQueueEntry] = None
+    mergeStateStatus: MergeStateStatus
+    mergeable: MergeableState
+    merged: Boolean
+    mergedAt: Optional[DateTime] = None
+    mergedBy: Optional[Actor] = None
+    milestone: Optional[Milestone] = None
+    number: Int
+    participants: UserConnection
+    permalink: URI
+    potentialMergeCommit: Optional[Commit] = None
+    projectCards: ProjectCardConnection
+    projectItems: ProjectV2ItemConnection
+    projectV2: Optional[ProjectV2] = None
+    projectsV2: ProjectV2Connection
+    publishedAt: Optional[DateTime] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    repository: Repository
+    resourcePath: URI
+    revertResourcePath: URI
+    revertUrl: URI
+    reviewDecision: Optional[PullRequestReviewDecision] = None
+    reviewRequests: Optional[ReviewRequestConnection] = None
+    reviewThreads: PullRequestReviewThreadConnection
+    reviews: Optional[PullRequestReviewConnection] = None
+    state: PullRequestState
+    suggestedReviewers: List[Optional[SuggestedReviewer]]
+    timeline: PullRequestTimelineConnection
+    timelineItems: PullRequestTimelineItemsConnection
+    title: String
+    titleHTML: HTML
+    totalCommentsCount: Optional[Int] = None
+    updatedAt: DateTime
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanApplySuggestion: Boolean
+    viewerCanClose: Boolean
+    viewerCanDeleteHeadRef: Boolean
+    viewerCanDisableAutoMerge: Boolean
+    viewerCanEditFiles: Boolean
+    viewerCanEnableAutoMerge: Boolean
+    viewerCanMergeAsAdmin: Boolean
+    viewerCanReact: Boolean
+    viewerCanReopen: Boolean
+    viewerCanSubscribe: Boolean
+    viewerCanUpdate: Boolean
+    viewerCanUpdateBranch: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    viewerLatestReview: Optional[PullRequestReview] = None
+    viewerLatestReviewRequest: Optional[ReviewRequest] = None
+    viewerMergeBodyText: String
+    viewerMergeHeadlineText: String
+    viewerSubscription: Optional[SubscriptionState] = None
+    typename__: Optional[Literal['PullRequest']] = Field(
+        'PullRequest', alias='__typename'
+    )
+
+
+class PullRequestCommit(Node, UniformResourceLocatable):
+    """
+    Represents a Git commit part of a pull request.
+    """
+
+    commit: Commit
+    id: ID
+    pullRequest: PullRequest
+    resourcePath: URI
+    url: URI
+    typename__: Optional[Literal['PullRequestCommit']] = Field(
+        'PullRequestCommit', alias='__typename'
+    )
+
+
+class PullRequestCommitCommentThread(Node, RepositoryNode):
+    """
+    Represents a commit comment thread part of a pull request.
+    """
+
+    comments: CommitCommentConnection
+    commit: Commit
+    id: ID
+    path: Optional[String] = None
+    position: Optional[Int] = None
+    pullRequest: PullRequest
+    repository: Repository
+    typename__: Optional[Literal['PullRequestCommitCommentThread']] = Field(
+        'PullRequestCommitCommentThread', alias='__typename'
+    )
+
+
+class PullRequestCommitConnection(BaseModel):
+    """
+    The connection type for PullRequestCommit.
+    """
+
+    edges: Optional[List[Optional[PullRequestCommitEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PullRequestCommit]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PullRequestCommitConnection']] = Field(
+        'PullRequestCommitConnection', alias='__typename'
+    )
+
+
+class PullRequestCommitEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PullRequestCommit] = None
+    typename__: Optional[Literal['PullRequestCommitEdge']] = Field(
+        'PullRequestCommitEdge', alias='__typename'
+    )
+
+
+class PullRequestConnection(BaseModel):
+    """
+    The connection type for PullRequest.
+    """
+
+    edges: Optional[List[Optional[PullRequestEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PullRequest]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PullRequestConnection']] = Field(
+        'PullRequestConnection', alias='__typename'
+    )
+
+
+class PullRequestContributionsByRepository(BaseModel):
+    """
+    This aggregates pull requests opened by a user within one repository.
+    """
+
+    contributions: CreatedPullRequestContributionConnection
+    repository: Repository
+    typename__: Optional[
+        Literal['PullRequestContributionsByRepository']
+    ] = Field('PullRequestContributionsByRepository', alias='__typename')
+
+
+class PullRequestEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PullRequest] = None
+    typename__: Optional[Literal['PullRequestEdge']] = Field(
+        'PullRequestEdge', alias='__typename'
+    )
+
+
+class PullRequestReview(
+    Comment,
+    Deletable,
+    Minimizable,
+    Node,
+    Reactable,
+    RepositoryNode,
+    Updatable,
+    UpdatableComment,
+):
+    """
+    A review object for a given pull request.
+    """
+
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    authorCanPushToRepository: Boolean
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    comments: PullRequestReviewCommentConnection
+    commit: Optional[Commit] = None
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    editor: Optional[Actor] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    isMinimized: Boolean
+    lastEditedAt: Optional[DateTime] = None
+    minimizedReason: Optional[String] = None
+    onBehalfOf: TeamConnection
+    publishedAt: Optional[DateTime] = None
+    pullRequest: PullRequest
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    repository: Repository
+    resourcePath: URI
+    state: PullRequestReviewState
+    submittedAt: Optional[DateTime] = None
+    updatedAt: DateTime
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanDelete: Boolean
+    viewerCanMinimize: Boolean
+    viewerCanReact: Boolean
+    viewerCanUpdate: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    typename__: Optional[Literal['PullRequestReview']] = Field(
+        'PullRequestReview', alias='__typename'
+    )
+
+
+class PullRequestReviewComment(
+    Comment,
+    Deletable,
+    Minimizable,
+    Node,
+    Reactable,
+    RepositoryNode,
+    Updatable,
+    UpdatableComment,
+):
+    """
+    A review comment associated with a given repository pull request.
+    """
+
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    commit: Optional[Commit] = None
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    diffHunk: String
+    draftedAt: DateTime
+    editor: Optional[Actor] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    isMinimized: Boolean
+    lastEditedAt: Optional[DateTime] = None
+    line: Optional[Int] = None
+    minimizedReason: Optional[String] = None
+    originalCommit: Optional[Commit] = None
+    originalLine: Optional[Int] = None
+    originalPosition: Int
+    originalStartLine: Optional[Int] = None
+    outdated: Boolean
+    path: String
+    position: Optional[Int] = None
+    publishedAt: Optional[DateTime] = None
+    pullRequest: PullRequest
+    pullRequestReview: Optional[PullRequestReview] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    replyTo: Optional[PullRequestReviewComment] = None
+    repository: Repository
+    resourcePath: URI
+    startLine: Optional[Int] = None
+    state: PullRequestReviewCommentState
+    subjectType: PullRequestReviewThreadSubjectType
+    updatedAt: DateTime
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanDelete: Boolean
+    viewerCanMinimize: Boolean
+    viewerCanReact: Boolean
+    viewerCanUpdate: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    typename__: Optional[Literal['PullRequestReviewComment']] = Field(
+        'PullRequestReviewComment', alias='__typename'
+    )
+
+
+class PullRequestReviewCommentConnection(BaseModel):
+    """
+    The connection type for PullRequestReviewComment.
+    """
+
+    edges: Optional[List[Optional[PullRequestReviewCommentEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PullRequestReviewComment]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['PullRequestReviewCommentConnection']
+    ] = Field('PullRequestReviewCommentConnection', alias='__typename')
+
+
+class PullRequestReviewCommentEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PullRequestReviewComment] = None
+    typename__: Optional[Literal['PullRequestReviewCommentEdge']] = Field(
+        'PullRequestReviewCommentEdge', alias='__typename'
+    )
+
+
+class PullRequestReviewConnection(BaseModel):
+    """
+    The connection type for PullRequestReview.
+    """
+
+    edges: Optional[List[Optional[PullRequestReviewEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PullRequestReview]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PullRequestReviewConnection']] = Field(
+        'PullRequestReviewConnection', alias='__typename'
+    )
+
+
+class PullRequestReviewContributionsByRepository(BaseModel):
+    """
+    This aggregates pull request reviews made by a user within one repository.
+    """
+
+    contributions: CreatedPullRequestReviewContributionConnection
+    repository: Repository
+    typename__: Optional[
+        Literal['PullRequestReviewContributionsByRepository']
+    ] = Field('PullRequestReviewContributionsByRepository', alias='__typename')
+
+
+class PullRequestReviewEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PullRequestReview] = None
+    typename__: Optional[Literal['PullRequestReviewEdge']] = Field(
+        'PullRequestReviewEdge', alias='__typename'
+    )
+
+
+class PullRequestReviewThread(Node):
+    """
+    A threaded list of comments for a given pull request.
+    """
+
+    comments: PullRequestReviewCommentConnection
+    diffSide: DiffSide
+    id: ID
+    isCollapsed: Boolean
+    isOutdated: Boolean
+    isResolved: Boolean
+    line: Optional[Int] = None
+    originalLine: Optional[Int] = None
+    originalStartLine: Optional[Int] = None
+    path: String
+    pullRequest: PullRequest
+    repository: Repository
+    resolvedBy: Optional[User] = None
+    startDiffSide: Optional[DiffSide] = None
+    startLine: Optional[Int] = None
+    subjectType: PullRequestReviewThreadSubjectType
+    viewerCanReply: Boolean
+    viewerCanResolve: Boolean
+    viewerCanUnresolve: Boolean
+    typename__: Optional[Literal['PullRequestReviewThread']] = Field(
+        'PullRequestReviewThread', alias='__typename'
+    )
+
+
+class PullRequestReviewThreadConnection(BaseModel):
+    """
+    Review comment threads for a pull request review.
+    """
+
+    edges: Optional[List[Optional[PullRequestReviewThreadEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PullRequestReviewThread]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PullRequestReviewThreadConnection']] = Field(
+        'PullRequestReviewThreadConnection', alias='__typename'
+    )
+
+
+class PullRequestReviewThreadEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PullRequestReviewThread] = None
+    typename__: Optional[Literal['PullRequestReviewThreadEdge']] = Field(
+        'PullRequestReviewThreadEdge', alias='__typename'
+    )
+
+
+class PullRequestRevisionMarker(BaseModel):
+    """
+    Represents the latest point in the pull request timeline for which the viewer has seen the pull request's commits.
+    """
+
+    createdAt: DateTime
+    lastSeenCommit: Commit
+    pullRequest: PullRequest
+    typename__: Optional[Literal['PullRequestRevisionMarker']] = Field(
+        'PullRequestRevisionMarker', alias='__typename'
+    )
+
+
+class PullRequestTemplate(BaseModel):
+    """
+    A repository pull request template.
+    """
+
+    body: Optional[String] = None
+    filename: Optional[String] = None
+    repository: Repository
+    typename__: Optional[Literal['PullRequestTemplate']] = Field(
+        'PullRequestTemplate', alias='__typename'
+    )
+
+
+class PullRequestTimelineConnection(BaseModel):
+    """
+    The connection type for PullRequestTimelineItem.
+    """
+
+    edges: Optional[List[Optional[PullRequestTimelineItemEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PullRequestTimelineItem]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PullRequestTimelineConnection']] = Field(
+        'PullRequestTimelineConnection', alias='__typename'
+    )
+
+
+class PullRequestTimelineItemEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PullRequestTimelineItem] = None
+    typename__: Optional[Literal['PullRequestTimelineItemEdge']] = Field(
+        'PullRequestTimelineItemEdge', alias='__typename'
+    )
+
+
+class PullRequestTimelineItemsConnection(BaseModel):
+    """
+    The connection type for PullRequestTimelineItems.
+    """
+
+    edges: Optional[List[Optional[PullRequestTimelineItemsEdge]]] = Field(
+        default_factory=list
+    )
+    filteredCount: Int
+    nodes: Optional[List[Optional[PullRequestTimelineItems]]] = Field(
+        default_factory=list
+    )
+    pageCount: Int
+    pageInfo: PageInfo
+    totalCount: Int
+    updatedAt: DateTime
+    typename__: Optional[
+        Literal['PullRequestTimelineItemsConnection']
+    ] = Field('PullRequestTimelineItemsConnection', alias='__typename')
+
+
+class PullRequestTimelineItemsEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PullRequestTimelineItems] = None
+    typename__: Optional[Literal['PullRequestTimelineItemsEdge']] = Field(
+        'PullRequestTimelineItemsEdge', alias='__typename'
+    )
+
+
+class Push(Node):
+    """
+    A Git push.
+    """
+
+    id: ID
+    nextSha: Optional[GitObjectID] = None
+    permalink: URI
+    previousSha: Optional[GitObjectID] = None
+    pusher: Actor
+    repository: Repository
+    typename__: Optional[Literal['Push']] = Field('Push', alias='__typename')
+
+
+class PushAllowance(Node):
+    """
+    A team, user, or app who has the ability to push to a protected branch.
+    """
+
+    actor: Optional[PushAllowanceActor] = None
+    branchProtectionRule: Optional[BranchProtectionRule] = None
+    id: ID
+    typename__: Optional[Literal['PushAllowance']] = Field(
+        'PushAllowance', alias='__typename'
+    )
+
+
+class PushAllowanceConnection(BaseModel):
+    """
+    The connection type for PushAllowance.
+    """
+
+    edges: Optional[List[Optional[PushAllowanceEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PushAllowance]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PushAllowanceConnection']] = Field(
+        'PushAllowanceConnection', alias='__typename'
+    )
+
+
+class PushAllowanceEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PushAllowance] = None
+    typename__: Optional[Literal['PushAllowanceEdge']] = Field(
+        'PushAllowanceEdge', alias='__typename'
+    )
+
+
+class ReactingUserConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[ReactingUserEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ReactingUserConnection']] = Field(
+        'ReactingUserConnection', alias='__typename'
+    )
+
+
+class ReactingUserEdge(BaseModel):
+    """
+    Represents a user that's made a reaction.
+    """
+
+    cursor: String
+    node: User
+    reactedAt: DateTime
+    typename__: Optional[Literal['ReactingUserEdge']] = Field(
+        'ReactingUserEdge', alias='__typename'
+    )
+
+
+class Reaction(Node):
+    """
+    An emoji reaction to a particular piece of content.
+    """
+
+    content: ReactionContent
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    id: ID
+    reactable: Reactable
+    user: Optional[User] = None
+    typename__: Optional[Literal['Reaction']] = Field(
+        'Reaction', alias='__typename'
+    )
+
+
+class ReactionConnection(BaseModel):
+    """
+    A list of reactions that have been left on the subject.
+    """
+
+    edges: Optional[List[Optional[ReactionEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Reaction]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    viewerHasReacted: Boolean
+    typename__: Optional[Literal['ReactionConnection']] = Field(
+        'ReactionConnection', alias='__typename'
+    )
+
+
+class ReactionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Reaction] = None
+    typename__: Optional[Literal['ReactionEdge']] = Field(
+        'ReactionEdge', alias='__typename'
+    )
+
+
+class ReactionGroup(BaseModel):
+    """
+    A group of emoji reactions to a particular piece of content.
+    """
+
+    content: ReactionContent
+    createdAt: Optional[DateTime] = None
+    reactors: ReactorConnection
+    subject: Reactable
+    users: ReactingUserConnection
+    viewerHasReacted: Boolean
+    typename__: Optional[Literal['ReactionGroup']] = Field(
+        'ReactionGroup', alias='__typename'
+    )
+
+
+class ReactorConnection(BaseModel):
+    """
+    The connection type for Reactor.
+    """
+
+    edges: Optional[List[Optional[ReactorEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Reactor]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ReactorConnection']] = Field(
+        'ReactorConnection', alias='__typename'
+    )
+
+
+class ReactorEdge(BaseModel):
+    """
+    Represents an author of a reaction.
+    """
+
+    cursor: String
+    node: Reactor
+    reactedAt: DateTime
+    typename__: Optional[Literal['ReactorEdge']] = Field(
+        'ReactorEdge', alias='__typename'
+    )
+
+
+class ReadyForReviewEvent(Node, UniformResourceLocatable):
+    """
+    Represents a 'ready_for_review' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    pullRequest: PullRequest
+    resourcePath: URI
+    url: URI
+    typename__: Optional[Literal['ReadyForReviewEvent']] = Field(
+        'ReadyForReviewEvent', alias='__typename'
+    )
+
+
+class Ref(Node):
+    """
+    Represents a Git reference.
+    """
+
+    associatedPullRequests: PullRequestConnection
+    branchProtectionRule: Optional[BranchProtectionRule] = None
+    compare: Optional[Comparison] = None
+    id: ID
+    name: String
+    prefix: String
+    refUpdateRule: Optional[RefUpdateRule] = None
+    repository: Repository
+    target: Optional[GitObject] = None
+    typename__: Optional[Literal['Ref']] = Field('Ref', alias='__typename')
+
+
+class RefConnection(BaseModel):
+    """
+    The connection type for Ref.
+    """
+
+    edges: Optional[List[Optional[RefEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Ref]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['RefConnection']] = Field(
+        'RefConnection', alias='__typename'
+    )
+
+
+class RefEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Ref] = None
+    typename__: Optional[Literal['RefEdge']] = Field(
+        'RefEdge', alias='__typename'
+    )
+
+
+class ReferencedEvent(Node):
+    """
+    Represents a 'referenced' event on a given `ReferencedSubject`.
+    """
+
+    actor: Optional[Actor] = None
+    commit: Optional[Commit] = None
+    commitRepository: Repository
+    createdAt: DateTime
+    id: ID
+    isCrossRepository: Boolean
+    isDirectReference: Boolean
+    subject: ReferencedSubject
+    typename__: Optional[Literal['ReferencedEvent']] = Field(
+        'ReferencedEvent', alias='__typename'
+    )
+
+
+class Release(Node, Reactable, UniformResourceLocatable):
+    """
+    A release contains the content for a release.
+    """
+
+    author: Optional[User] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    description: Optional[String] = None
+    descriptionHTML: Optional[HTML] = None
+    id: ID
+    isDraft: Boolean
+    isLatest: Boolean
+    isPrerelease: Boolean
+    mentions: Optional[UserConnection] = None
+    name: Optional[String] = None
+    publishedAt: Optional[DateTime] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    releaseAssets: ReleaseAssetConnection
+    repository: Repository
+    resourcePath: URI
+    shortDescriptionHTML: Optional[HTML] = None
+    tag: Optional[Ref] = None
+    tagCommit: Optional[Commit] = None
+    tagName: String
+    updatedAt: DateTime
+    url: URI
+    viewerCanReact: Boolean
+    typename__: Optional[Literal['Release']] = Field(
+        'Release', alias='__typename'
+    )
+
+
+class ReleaseAsset(Node):
+    """
+    A release asset contains the content for a release asset.
+    """
+
+    contentType: String
+    createdAt: DateTime
+    downloadCount: Int
+    downloadUrl: URI
+    id: ID
+    name: String
+    release: Optional[Release] = None
+    size: Int
+    updatedAt: DateTime
+    uploadedBy: User
+    url: URI
+    typename__: Optional[Literal['ReleaseAsset']] = Field(
+        'ReleaseAsset', alias='__typename'
+    )
+
+
+class ReleaseAssetConnection(BaseModel):
+    """
+    The connection type for ReleaseAsset.
+    """
+
+    edges: Optional[List[Optional[ReleaseAssetEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ReleaseAsset]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ReleaseAssetConnection']] = Field(
+        'ReleaseAssetConnection', alias='__typename'
+    )
+
+
+class ReleaseAssetEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ReleaseAsset] = None
+    typename__: Optional[Literal['ReleaseAssetEdge']] = Field(
+        'ReleaseAssetEdge', alias='__typename'
+    )
+
+
+class ReleaseConnection(BaseModel):
+    """
+    The connection type for Release.
+    """
+
+    edges: Optional[List[Optional[ReleaseEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Release]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ReleaseConnection']] = Field(
+        'ReleaseConnection', alias='__typename'
+    )
+
+
+class ReleaseEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Release] = None
+    typename__: Optional[Literal['ReleaseEdge']] = Field(
+        'ReleaseEdge', alias='__typename'
+    )
+
+
+class RemovedFromMergeQueueEvent(Node):
+    """
+    Represents a 'removed_from_merge_queue' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    beforeCommit: Optional[Commit] = None
+    createdAt: DateTime
+    enqueuer: Optional[User] = None
+    id: ID
+    mergeQueue: Optional[MergeQueue] = None
+    pullRequest: Optional[PullRequest] = None
+    reason: Optional[String] = None
+    typename__: Optional[Literal['RemovedFromMergeQueueEvent']] = Field(
+        'RemovedFromMergeQueueEvent', alias='__typename'
+    )
+
+
+class RemovedFromProjectEvent(Node):
+    """
+    Represents a 'removed_from_project' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    id: ID
+    project: Optional[Project] = None
+    projectColumnName: String
+    typename__: Optional[Literal['RemovedFromProjectEvent']] = Field(
+        'RemovedFromProjectEvent', alias='__typename'
+    )
+
+
+class RenamedTitleEvent(Node):
+    """
+    Represents a 'renamed' event on a given issue or pull request
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    currentTitle: String
+    id: ID
+    previousTitle: String
+    subject: RenamedTitleSubject
+    typename__: Optional[Literal['RenamedTitleEvent']] = Field(
+        'RenamedTitleEvent', alias='__typename'
+    )
+
+
+class RepoAccessAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.access event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    visibility: Optional[RepoAccessAuditEntryVisibility] = None
+    typename__: Optional[Literal['RepoAccessAuditEntry']] = Field(
+        'RepoAccessAuditEntry', alias='__typename'
+    )
+
+
+class RepoAddMemberAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.add_member event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    visibility: Optional[RepoAddMemberAuditEntryVisibility] = None
+    typename__: Optional[Literal['RepoAddMemberAuditEntry']] = Field(
+        'RepoAddMemberAuditEntry', alias='__typename'
+    )
+
+
+class RepoAddTopicAuditEntry(
+    AuditEntry,
+    Node,
+    OrganizationAuditEntryData,
+    RepositoryAuditEntryData,
+    TopicAuditEntryData,
+):
+    """
+    Audit log entry for a repo.add_topic event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    topic: Optional[Topic] = None
+    topicName: Optional[String] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['RepoAddTopicAuditEntry']] = Field(
+        'RepoAddTopicAuditEntry', alias='__typename'
+    )
+
+
+class RepoArchivedAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.archived event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    visibility: Optional[RepoArchivedAuditEntryVisibility] = None
+    typename__: Optional[Literal['RepoArchivedAuditEntry']] = Field(
+        'RepoArchivedAuditEntry', alias='__typename'
+    )
+
+
+class RepoChangeMergeSettingAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.change_merge_setting event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    isEnabled: Optional[Boolean] = None
+    mergeType: Optional[RepoChangeMergeSettingAuditEntryMergeType] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['RepoChangeMergeSettingAuditEntry']] = Field(
+        'RepoChangeMergeSettingAuditEntry', alias='__typename'
+    )
+
+
+class RepoConfigDisableAnonymousGitAccessAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.disable_anonymous_git_access event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigDisableAnonymousGitAccessAuditEntry']
+    ] = Field(
+        'RepoConfigDisableAnonymousGitAccessAuditEntry', alias='__typename'
+    )
+
+
+class RepoConfigDisableCollaboratorsOnlyAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.disable_collaborators_only event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigDisableCollaboratorsOnlyAuditEntry']
+    ] = Field(
+        'RepoConfigDisableCollaboratorsOnlyAuditEntry', alias='__typename'
+    )
+
+
+class RepoConfigDisableContributorsOnlyAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.disable_contributors_only event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigDisableContributorsOnlyAuditEntry']
+    ] = Field(
+        'RepoConfigDisableContributorsOnlyAuditEntry', alias='__typename'
+    )
+
+
+class RepoConfigDisableSockpuppetDisallowedAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.disable_sockpuppet_disallowed event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigDisableSockpuppetDisallowedAuditEntry']
+    ] = Field(
+        'RepoConfigDisableSockpuppetDisallowedAuditEntry', alias='__typename'
+    )
+
+
+class RepoConfigEnableAnonymousGitAccessAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.enable_anonymous_git_access event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigEnableAnonymousGitAccessAuditEntry']
+    ] = Field(
+        'RepoConfigEnableAnonymousGitAccessAuditEntry', alias='__typename'
+    )
+
+
+class RepoConfigEnableCollaboratorsOnlyAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.enable_collaborators_only event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigEnableCollaboratorsOnlyAuditEntry']
+    ] = Field(
+        'RepoConfigEnableCollaboratorsOnlyAuditEntry', alias='__typename'
+    )
+
+
+class RepoConfigEnableContributorsOnlyAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.enable_contributors_only event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigEnableContributorsOnlyAuditEntry']
+    ] = Field('RepoConfigEnableContributorsOnlyAuditEntry', alias='__typename')
+
+
+class RepoConfigEnableSockpuppetDisallowedAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.enable_sockpuppet_disallowed event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigEnableSockpuppetDisallowedAuditEntry']
+    ] = Field(
+        'RepoConfigEnableSockpuppetDisallowedAuditEntry', alias='__typename'
+    )
+
+
+class RepoConfigLockAnonymousGitAccessAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.lock_anonymous_git_access event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigLockAnonymousGitAccessAuditEntry']
+    ] = Field('RepoConfigLockAnonymousGitAccessAuditEntry', alias='__typename')
+
+
+class RepoConfigUnlockAnonymousGitAccessAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.config.unlock_anonymous_git_access event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepoConfigUnlockAnonymousGitAccessAuditEntry']
+    ] = Field(
+        'RepoConfigUnlockAnonymousGitAccessAuditEntry', alias='__typename'
+    )
+
+
+class RepoCreateAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.create event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    forkParentName: Optional[String] = None
+    forkSourceName: Optional[String] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    visibility: Optional[RepoCreateAuditEntryVisibility] = None
+    typename__: Optional[Literal['RepoCreateAuditEntry']] = Field(
+        'RepoCreateAuditEntry', alias='__typename'
+    )
+
+
+class RepoDestroyAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.destroy event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    visibility: Optional[RepoDestroyAuditEntryVisibility] = None
+    typename__: Optional[Literal['RepoDestroyAuditEntry']] = Field(
+        'RepoDestroyAuditEntry', alias='__typename'
+    )
+
+
+class RepoRemoveMemberAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, RepositoryAuditEntryData
+):
+    """
+    Audit log entry for a repo.remove_member event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    visibility: Optional[RepoRemoveMemberAuditEntryVisibility] = None
+    typename__: Optional[Literal['RepoRemoveMemberAuditEntry']] = Field(
+        'RepoRemoveMemberAuditEntry', alias='__typename'
+    )
+
+
+class RepoRemoveTopicAuditEntry(
+    AuditEntry,
+    Node,
+    OrganizationAuditEntryData,
+    RepositoryAuditEntryData,
+    TopicAuditEntryData,
+):
+    """
+    Audit log entry for a repo.remove_topic event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    topic: Optional[Topic] = None
+    topicName: Optional[String] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['RepoRemoveTopicAuditEntry']] = Field(
+        'RepoRemoveTopicAuditEntry', alias='__typename'
+    )
+
+
+class Repository(
+    Node,
+    PackageOwner,
+    ProjectOwner,
+    ProjectV2Recent,
+    RepositoryInfo,
+    Starrable,
+    Subscribable,
+    UniformResourceLocatable,
+):
+    """
+    A repository contains the content for a project.
+    """
+
+    allowUpdateBranch: Boolean
+    archivedAt: Optional[DateTime] = None
+    assignableUsers: UserConnection
+    autoMergeAllowed: Boolean
+    branchProtectionRules: BranchProtectionRuleConnection
+    codeOfConduct: Optional[CodeOfConduct] = None
+    codeowners: Optional[RepositoryCodeowners] = None
+    collaborators: Optional[RepositoryCollaboratorConnection] = None
+    commitComments: CommitCommentConnection
+    contactLinks: Optional[List[RepositoryContactLink]] = Field(
+        default_factory=list
+    )
+    contributingGuidelines: Optional[ContributingGuidelines] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    defaultBranchRef: Optional[Ref] = None
+    deleteBranchOnMerge: Boolean
+    dependencyGraphManifests: Optional[
+        DependencyGraphManifestConnection
+    ] = None
+    deployKeys: DeployKeyConnection
+    deployments: DeploymentConnection
+    description: Optional[String] = None
+    descriptionHTML: HTML
+    discussion: Optional[Discussion] = None
+    discussionCategories: DiscussionCategoryConnection
+    discussionCategory: Optional[DiscussionCategory] = None
+    discussions: DiscussionConnection
+    diskUsage: Optional[Int] = None
+    environment: Optional[Environment] = None
+    environments: EnvironmentConnection
+    forkCount: Int
+    forkingAllowed: Boolean
+    forks: RepositoryConnection
+    fundingLinks: List[FundingLink]
+    hasDiscussionsEnabled: Boolean
+    hasIssuesEnabled: Boolean
+    hasProjectsEnabled: Boolean
+    hasVulnerabilityAlertsEnabled: Boolean
+    hasWikiEnabled: Boolean
+    homepageUrl: Optional[URI] = None
+    id: ID
+    interactionAbility: Optional[RepositoryInteractionAbility] = None
+    isArchived: Boolean
+    isBlankIssuesEnabled: Boolean
+    isDisabled: Boolean
+    isEmpty: Boolean
+    isFork: Boolean
+    isInOrganization: Boolean
+    isLocked: Boolean
+    isMirror: Boolean
+    isPrivate: Boolean
+    isSecurityPolicyEnabled: Optional[Boolean] = None
+    isTemplate: Boolean
+    isUserConfigurationRepository: Boolean
+    issue: Optional[Issue] = None
+    issueOrPullRequest: Optional[IssueOrPullRequest] = None
+    issueTemplates: Optional[List[IssueTemplate]] = Field(default_factory=list)
+    issues: IssueConnection
+    label: Optional[Label] = None
+    labels: Optional[LabelConnection] = None
+    languages: Optional[LanguageConnection] = None
+    latestRelease: Optional[Release] = None
+    licenseInfo: Optional[License] = None
+    lockReason: Optional[RepositoryLockReason] = None
+    mentionableUsers: UserConnection
+    mergeCommitAllowed: Boolean
+    mergeCommitMessage: MergeCommitMessage
+    mergeCommitTitle: MergeCommitTitle
+    mergeQueue: Optional[MergeQueue] = None
+    milestone: Optional[Milestone] = None
+    milestones: Optional[MilestoneConnection] = None
+    mirrorUrl: Optional[URI] = None
+    name: String
+    nameWithOwner: String
+    object: Optional[GitObject] = None
+    openGraphImageUrl: URI
+    owner: RepositoryOwner
+    packages: PackageConnection
+    parent: Optional[Repository] = None
+    pinnedDiscussions: PinnedDiscussionConnection
+    pinnedIssues: Optional[PinnedIssueConnection] = None
+    primaryLanguage: Optional[Language] = None
+    project: Optional[Project] = None
+    projectV2: Optional[ProjectV2] = None
+    projects: ProjectConnection
+    projectsResourcePath: URI
+    projectsUrl: URI
+    projectsV2: ProjectV2Connection
+    pullRequest: Optional[PullRequest] = None
+    pullRequestTemplates: Optional[List[PullRequestTemplate]] = Field(
+        default_factory=list
+    )
+    pullRequests: PullRequestConnection
+    pushedAt: Optional[DateTime] = None
+    rebaseMergeAllowed: Boolean
+    recentProjects: ProjectV2Connection
+    ref: Optional[Ref] = None
+    refs: Optional[RefConnection] = None
+    release: Optional[Release] = None
+    releases: ReleaseConnection
+    repositoryTopics: RepositoryTopicConnection
+    resourcePath: URI
+    ruleset: Optional[RepositoryRuleset] = None
+    rulesets: Optional[RepositoryRulesetConnection] = None
+    securityPolicyUrl: Optional[URI] = None
+    shortDescriptionHTML: HTML
+    squashMergeAllowed: Boolean
+    squashMergeCommitMessage: SquashMergeCommitMessage
+    squashMergeCommitTitle: SquashMergeCommitTitle
+    squashPrTitleUsedAsDefault: Boolean
+    sshUrl: GitSSHRemote
+    stargazerCount: Int
+    stargazers: StargazerConnection
+    submodules: SubmoduleConnection
+    tempCloneToken: Optional[String] = None
+    templateRepository: Optional[Repository] = None
+    updatedAt: DateTime
+    url: URI
+    usesCustomOpenGraphImage: Boolean
+    viewerCanAdminister: Boolean
+    viewerCanCreateProjects: Boolean
+    viewerCanSubscribe: Boolean
+    viewerCanUpdateTopics: Boolean
+    viewerDefaultCommitEmail: Optional[String] = None
+    viewerDefaultMergeMethod: PullRequestMergeMethod
+    viewerHasStarred: Boolean
+    viewerPermission: Optional[RepositoryPermission] = None
+    viewerPossibleCommitEmails: Optional[List[String]] = Field(
+        default_factory=list
+    )
+    viewerSubscription: Optional[SubscriptionState] = None
+    visibility: RepositoryVisibility
+    vulnerabilityAlert: Optional[RepositoryVulnerabilityAlert] = None
+    vulnerabilityAlerts: Optional[
+        RepositoryVulnerabilityAlertConnection
+    ] = None
+    watchers: UserConnection
+    webCommitSignoffRequired: Boolean
+    typename__: Optional[Literal['Repository']] = Field(
+        'Repository', alias='__typename'
+    )
+
+
+class RepositoryCollaboratorConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[RepositoryCollaboratorEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['RepositoryCollaboratorConnection']] = Field(
+        'RepositoryCollaboratorConnection', alias='__typename'
+    )
+
+
+class RepositoryCollaboratorEdge(BaseModel):
+    """
+    Represents a user who is a collaborator of a repository.
+    """
+
+    cursor: String
+    node: User
+    permission: RepositoryPermission
+    permissionSources: Optional[List[PermissionSource]] = Field(
+        default_factory=list
+    )
+    typename__: Optional[Literal['RepositoryCollaboratorEdge']] = Field(
+        'RepositoryCollaboratorEdge', alias='__typename'
+    )
+
+
+class RepositoryConnection(BaseModel):
+    """
+    A list of repositories owned by the subject.
+    """
+
+    edges: Optional[List[Optional[RepositoryEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Repository]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    totalDiskUsage: Int
+    typename__: Optional[Literal['RepositoryConnection']] = Field(
+        'RepositoryConnection', alias='__typename'
+    )
+
+
+class RepositoryEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Repository] = None
+    typename__: Optional[Literal['RepositoryEdge']] = Field(
+        'RepositoryEdge', alias='__typename'
+    )
+
+
+class RepositoryInvitation(Node):
+    """
+    An invitation for a user to be added to a repository.
+    """
+
+    email: Optional[String] = None
+    id: ID
+    invitee: Optional[User] = None
+    inviter: User
+    permalink: URI
+    permission: RepositoryPermission
+    repository: Optional[RepositoryInfo] = None
+    typename__: Optional[Literal['RepositoryInvitation']] = Field(
+        'RepositoryInvitation', alias='__typename'
+    )
+
+
+class RepositoryInvitationConnection(BaseModel):
+    """
+    A list of repository invitations.
+    """
+
+    edges: Optional[List[Optional[RepositoryInvitationEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[RepositoryInvitation]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['RepositoryInvitationConnection']] = Field(
+        'RepositoryInvitationConnection', alias='__typename'
+    )
+
+
+class RepositoryInvitationEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[RepositoryInvitation] = None
+    typename__: Optional[Literal['RepositoryInvitationEdge']] = Field(
+        'RepositoryInvitationEdge', alias='__typename'
+    )
+
+
+class RepositoryRule(Node):
+    """
+    A repository rule.
+    """
+
+    id: ID
+    parameters: Optional[RuleParameters] = None
+    repositoryRuleset: Optional[RepositoryRuleset] = None
+    type: RepositoryRuleType
+    typename__: Optional[Literal['RepositoryRule']] = Field(
+        'RepositoryRule', alias='__typename'
+    )
+
+
+class RepositoryRuleConnection(BaseModel):
+    """
+    The connection type for RepositoryRule.
+    """
+
+    edges: Optional[List[Optional[RepositoryRuleEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[RepositoryRule]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['RepositoryRuleConnection']] = Field(
+        'RepositoryRuleConnection', alias='__typename'
+    )
+
+
+class RepositoryRuleEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[RepositoryRule] = None
+    typename__: Optional[Literal['RepositoryRuleEdge']] = Field(
+        'RepositoryRuleEdge', alias='__typename'
+    )
+
+
+class RepositoryRuleset(Node):
+    """
+    A repository ruleset.
+    """
+
+    bypassActors: Optional[RepositoryRulesetBypassActorConnection] = None
+    conditions: RepositoryRuleConditions
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    enforcement: RuleEnforcement
+    id: ID
+    name: String
+    rules: Optional[RepositoryRuleConnection] = None
+    source: RuleSource
+    target: Optional[RepositoryRulesetTarget] = None
+    updatedAt: DateTime
+    typename__: Optional[Literal['RepositoryRuleset']] = Field(
+        'RepositoryRuleset', alias='__typename'
+    )
+
+
+class RepositoryRulesetBypassActor(Node):
+    """
+    A team or app that has the ability to bypass a rules defined on a ruleset
+    """
+
+    actor: Optional[BypassActor] = None
+    bypassMode: Optional[RepositoryRulesetBypassActorBypassMode] = None
+    id: ID
+    organizationAdmin: Boolean
+    repositoryRoleDatabaseId: Optional[Int] = None
+    repositoryRoleName: Optional[String] = None
+    repositoryRuleset: Optional[RepositoryRuleset] = None
+    typename__: Optional[Literal['RepositoryRulesetBypassActor']] = Field(
+        'RepositoryRulesetBypassActor', alias='__typename'
+    )
+
+
+class RepositoryRulesetBypassActorConnection(BaseModel):
+    """
+    The connection type for RepositoryRulesetBypassActor.
+    """
+
+    edges: Optional[List[Optional[RepositoryRulesetBypassActorEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[RepositoryRulesetBypassActor]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['RepositoryRulesetBypassActorConnection']
+    ] = Field('RepositoryRulesetBypassActorConnection', alias='__typename')
+
+
+class RepositoryRulesetBypassActorEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[RepositoryRulesetBypassActor] = None
+    typename__: Optional[Literal['RepositoryRulesetBypassActorEdge']] = Field(
+        'RepositoryRulesetBypassActorEdge', alias='__typename'
+    )
+
+
+class RepositoryRulesetConnection(BaseModel):
+    """
+    The connection type for RepositoryRuleset.
+    """
+
+    edges: Optional[List[Optional[RepositoryRulesetEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[RepositoryRuleset]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['RepositoryRulesetConnection']] = Field(
+        'RepositoryRulesetConnection', alias='__typename'
+    )
+
+
+class RepositoryRulesetEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[RepositoryRuleset] = None
+    typename__: Optional[Literal['RepositoryRulesetEdge']] = Field(
+        'RepositoryRulesetEdge', alias='__typename'
+    )
+
+
+class RepositoryTopic(Node, UniformResourceLocatable):
+    """
+    A repository-topic connects a repository to a topic.
+    """
+
+    id: ID
+    resourcePath: URI
+    topic: Topic
+    url: URI
+    typename__: Optional[Literal['RepositoryTopic']] = Field(
+        'RepositoryTopic', alias='__typename'
+    )
+
+
+class RepositoryTopicConnection(BaseModel):
+    """
+    The connection type for RepositoryTopic.
+    """
+
+    edges: Optional[List[Optional[RepositoryTopicEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[RepositoryTopic]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['RepositoryTopicConnection']] = Field(
+        'RepositoryTopicConnection', alias='__typename'
+    )
+
+
+class RepositoryTopicEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[RepositoryTopic] = None
+    typename__: Optional[Literal['RepositoryTopicEdge']] = Field(
+        'RepositoryTopicEdge', alias='__typename'
+    )
+
+
+class RepositoryVisibilityChangeDisableAuditEntry(
+    AuditEntry, EnterpriseAuditEntryData, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a repository_visibility_change.disable event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    enterpriseResourcePath: Optional[URI] = None
+    enterpriseSlug: Optional[String] = None
+    enterpriseUrl: Optional[URI] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepositoryVisibilityChangeDisableAuditEntry']
+    ] = Field(
+        'RepositoryVisibilityChangeDisableAuditEntry', alias='__typename'
+    )
+
+
+class RepositoryVisibilityChangeEnableAuditEntry(
+    AuditEntry, EnterpriseAuditEntryData, Node, OrganizationAuditEntryData
+):
+    """
+    Audit log entry for a repository_visibility_change.enable event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    enterpriseResourcePath: Optional[URI] = None
+    enterpriseSlug: Optional[String] = None
+    enterpriseUrl: Optional[URI] = None
+    id: ID
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[
+        Literal['RepositoryVisibilityChangeEnableAuditEntry']
+    ] = Field('RepositoryVisibilityChangeEnableAuditEntry', alias='__typename')
+
+
+class RepositoryVulnerabilityAlert(Node, RepositoryNode):
+    """
+    A Dependabot alert for a repository with a dependency affected by a security vulnerability.
+    """
+
+    autoDismissedAt: Optional[DateTime] = None
+    createdAt: DateTime
+    dependabotUpdate: Optional[DependabotUpdate] = None
+    dependencyScope: Optional[
+        RepositoryVulnerabilityAlertDependencyScope
+    ] = None
+    dismissComment: Optional[String] = None
+    dismissReason: Optional[String] = None
+    dismissedAt: Optional[DateTime] = None
+    dismisser: Optional[User] = None
+    fixedAt: Optional[DateTime] = None
+    id: ID
+    number: Int
+    repository: Repository
+    securityAdvisory: Optional[SecurityAdvisory] = None
+    securityVulnerability: Optional[SecurityVulnerability] = None
+    state: RepositoryVulnerabilityAlertState
+    vulnerableManifestFilename: String
+    vulnerableManifestPath: String
+    vulnerableRequirements: Optional[String] = None
+    typename__: Optional[Literal['RepositoryVulnerabilityAlert']] = Field(
+        'RepositoryVulnerabilityAlert', alias='__typename'
+    )
+
+
+class RepositoryVulnerabilityAlertConnection(BaseModel):
+    """
+    The connection type for RepositoryVulnerabilityAlert.
+    """
+
+    edges: Optional[List[Optional[RepositoryVulnerabilityAlertEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[RepositoryVulnerabilityAlert]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['RepositoryVulnerabilityAlertConnection']
+    ] = Field('RepositoryVulnerabilityAlertConnection', alias='__typename')
+
+
+class RepositoryVulnerabilityAlertEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[RepositoryVulnerabilityAlert] = None
+    typename__: Optional[Literal['RepositoryVulnerabilityAlertEdge']] = Field(
+        'RepositoryVulnerabilityAlertEdge', alias='__typename'
+    )
+
+
+class RequestedReviewerConnection(BaseModel):
+    """
+    The connection type for RequestedReviewer.
+    """
+
+    edges: Optional[List[Optional[RequestedReviewerEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[RequestedReviewer]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['RequestedReviewerConnection']] = Field(
+        'RequestedReviewerConnection', alias='__typename'
+    )
+
+
+class RequestedReviewerEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[RequestedReviewer] = None
+    typename__: Optional[Literal['RequestedReviewerEdge']] = Field(
+        'RequestedReviewerEdge', alias='__typename'
+    )
+
+
+class RequiredStatusCheckDescription(BaseModel):
+    """
+    Represents a required status check for a protected branch, but not any specific run of that check.
+    """
+
+    app: Optional[App] = None
+    context: String
+    typename__: Optional[Literal['RequiredStatusCheckDescription']] = Field(
+        'RequiredStatusCheckDescription', alias='__typename'
+    )
+
+
+class RestrictedContribution(Contribution):
+    """
+    Represents a private contribution a user made on GitHub.
+    """
+
+    isRestricted: Boolean
+    occurredAt: DateTime
+    resourcePath: URI
+    url: URI
+    user: User
+    typename__: Optional[Literal['RestrictedContribution']] = Field(
+        'RestrictedContribution', alias='__typename'
+    )
+
+
+class ReviewDismissalAllowance(Node):
+    """
+    A user, team, or app who has the ability to dismiss a review on a protected branch.
+    """
+
+    actor: Optional[ReviewDismissalAllowanceActor] = None
+    branchProtectionRule: Optional[BranchProtectionRule] = None
+    id: ID
+    typename__: Optional[Literal['ReviewDismissalAllowance']] = Field(
+        'ReviewDismissalAllowance', alias='__typename'
+    )
+
+
+class ReviewDismissalAllowanceConnection(BaseModel):
+    """
+    The connection type for ReviewDismissalAllowance.
+    """
+
+    edges: Optional[List[Optional[ReviewDismissalAllowanceEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ReviewDismissalAllowance]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[
+        Literal['ReviewDismissalAllowanceConnection']
+    ] = Field('ReviewDismissalAllowanceConnection', alias='__typename')
+
+
+class ReviewDismissalAllowanceEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ReviewDismissalAllowance] = None
+    typename__: Optional[Literal['ReviewDismissalAllowanceEdge']] = Field(
+        'ReviewDismissalAllowanceEdge', alias='__typename'
+    )
+
+
+class ReviewDismissedEvent(Node, UniformResourceLocatable):
+    """
+    Represents a 'review_dismissed' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    dismissalMessage: Optional[String] = None
+    dismissalMessageHTML: Optional[String] = None
+    id: ID
+    previousReviewState: PullRequestReviewState
+    pullRequest: PullRequest
+    pullRequestCommit: Optional[PullRequestCommit] = None
+    resourcePath: URI
+    review: Optional[PullRequestReview] = None
+    url: URI
+    typename__: Optional[Literal['ReviewDismissedEvent']] = Field(
+        'ReviewDismissedEvent', alias='__typename'
+    )
+
+
+class ReviewRequest(Node):
+    """
+    A request for a user to review a pull request.
+    """
+
+    asCodeOwner: Boolean
+    databaseId: Optional[Int] = None
+    id: ID
+    pullRequest: PullRequest
+    requestedReviewer: Optional[RequestedReviewer] = None
+    typename__: Optional[Literal['ReviewRequest']] = Field(
+        'ReviewRequest', alias='__typename'
+    )
+
+
+class ReviewRequestConnection(BaseModel):
+    """
+    The connection type for ReviewRequest.
+    """
+
+    edges: Optional[List[Optional[ReviewRequestEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ReviewRequest]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ReviewRequestConnection']] = Field(
+        'ReviewRequestConnection', alias='__typename'
+    )
+
+
+class ReviewRequestEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ReviewRequest] = None
+    typename__: Optional[Literal['ReviewRequestEdge']] = Field(
+        'ReviewRequestEdge', alias='__typename'
+    )
+
+
+class ReviewRequestRemovedEvent(Node):
+    """
+    Represents an 'review_request_removed' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    pullRequest: PullRequest
+    requestedReviewer: Optional[RequestedReviewer] = None
+    typename__: Optional[Literal['ReviewRequestRemovedEvent']] = Field(
+        'ReviewRequestRemovedEvent', alias='__typename'
+    )
+
+
+class ReviewRequestedEvent(Node):
+    """
+    Represents an 'review_requested' event on a given pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    pullRequest: PullRequest
+    requestedReviewer: Optional[RequestedReviewer] = None
+    typename__: Optional[Literal['ReviewRequestedEvent']] = Field(
+        'ReviewRequestedEvent', alias='__typename'
+    )
+
+
+class SponsorConnection(BaseModel):
+    """
+    The connection type for Sponsor.
+    """
+
+    edges: Optional[List[Optional[SponsorEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Sponsor]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['SponsorConnection']] = Field(
+        'SponsorConnection', alias='__typename'
+    )
+
+
+class SponsorEdge(BaseModel):
+    """
+    Represents a user or organization who is sponsoring someone in GitHub Sponsors.
+    """
+
+    cursor: String
+    node: Optional[Sponsor] = None
+    typename__: Optional[Literal['SponsorEdge']] = Field(
+        'SponsorEdge', alias='__typename'
+    )
+
+
+class SponsorsActivity(Node):
+    """
+    An event related to sponsorship activity.
+    """
+
+    action: SponsorsActivityAction
+    currentPrivacyLevel: Optional[SponsorshipPrivacy] = None
+    id: ID
+    paymentSource: Optional[SponsorshipPaymentSource] = None
+    previousSponsorsTier: Optional[SponsorsTier] = None
+    sponsor: Optional[Sponsor] = None
+    sponsorable: Sponsorable
+    sponsorsTier: Optional[SponsorsTier] = None
+    timestamp: Optional[DateTime] = None
+    viaBulkSponsorship: Boolean
+    typename__: Optional[Literal['SponsorsActivity']] = Field(
+        'SponsorsActivity', alias='__typename'
+    )
+
+
+class SponsorsActivityConnection(BaseModel):
+    """
+    The connection type for SponsorsActivity.
+    """
+
+    edges: Optional[List[Optional[SponsorsActivityEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[SponsorsActivity]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['SponsorsActivityConnection']] = Field(
+        'SponsorsActivityConnection', alias='__typename'
+    )
+
+
+class SponsorsActivityEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[SponsorsActivity] = None
+    typename__: Optional[Literal['SponsorsActivityEdge']] = Field(
+        'SponsorsActivityEdge', alias='__typename'
+    )
+
+
+class SponsorsListing(Node):
+    """
+    A GitHub Sponsors listing.
+    """
+
+    activeGoal: Optional[SponsorsGoal] = None
+    activeStripeConnectAccount: Optional[StripeConnectAccount] = None
+    billingCountryOrRegion: Optional[String] = None
+    contactEmailAddress: Optional[String] = None
+    createdAt: DateTime
+    dashboardResourcePath: URI
+    dashboardUrl: URI
+    featuredItems: List[SponsorsListingFeaturedItem]
+    fiscalHost: Optional[Organization] = None
+    fullDescription: String
+    fullDescriptionHTML: HTML
+    id: ID
+    isPublic: Boolean
+    name: String
+    nextPayoutDate: Optional[Date] = None
+    residenceCountryOrRegion: Optional[String] = None
+    resourcePath: URI
+    shortDescription: String
+    slug: String
+    sponsorable: Sponsorable
+    tiers: Optional[SponsorsTierConnection] = None
+    url: URI
+    typename__: Optional[Literal['SponsorsListing']] = Field(
+        'SponsorsListing', alias='__typename'
+    )
+
+
+class SponsorsListingFeaturedItem(Node):
+    """
+    A record that is promoted on a GitHub Sponsors profile.
+    """
+
+    createdAt: DateTime
+    description: Optional[String] = None
+    featureable: SponsorsListingFeatureableItem
+    id: ID
+    position: Int
+    sponsorsListing: SponsorsListing
+    updatedAt: DateTime
+    typename__: Optional[Literal['SponsorsListingFeaturedItem']] = Field(
+        'SponsorsListingFeaturedItem', alias='__typename'
+    )
+
+
+class SponsorsTier(Node):
+    """
+    A GitHub Sponsors tier associated with a GitHub Sponsors listing.
+    """
+
+    adminInfo: Optional[SponsorsTierAdminInfo] = None
+    closestLesserValueTier: Optional[SponsorsTier] = None
+    createdAt: DateTime
+    description: String
+    descriptionHTML: HTML
+    id: ID
+    isCustomAmount: Boolean
+    isOneTime: Boolean
+    monthlyPriceInCents: Int
+    monthlyPriceInDollars: Int
+    name: String
+    sponsorsListing: SponsorsListing
+    updatedAt: DateTime
+    typename__: Optional[Literal['SponsorsTier']] = Field(
+        'SponsorsTier', alias='__typename'
+    )
+
+
+class SponsorsTierAdminInfo(BaseModel):
+    """
+    SponsorsTier information only visible to users that can administer the associated Sponsors listing.
+    """
+
+    isDraft: Boolean
+    isPublished: Boolean
+    isRetired: Boolean
+    sponsorships: SponsorshipConnection
+    typename__: Optional[Literal['SponsorsTierAdminInfo']] = Field(
+        'SponsorsTierAdminInfo', alias='__typename'
+    )
+
+
+class SponsorsTierConnection(BaseModel):
+    """
+    The connection type for SponsorsTier.
+    """
+
+    edges: Optional[List[Optional[SponsorsTierEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[SponsorsTier]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['SponsorsTierConnection']] = Field(
+        'SponsorsTierConnection', alias='__typename'
+    )
+
+
+class SponsorsTierEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[SponsorsTier] = None
+    typename__: Optional[Literal['SponsorsTierEdge']] = Field(
+        'SponsorsTierEdge', alias='__typename'
+    )
+
+
+class Sponsorship(Node):
+    """
+    A sponsorship relationship between a sponsor and a maintainer
+    """
+
+    createdAt: DateTime
+    id: ID
+    isActive: Boolean
+    isOneTimePayment: Boolean
+    isSponsorOptedIntoEmail: Optional[Boolean] = None
+    maintainer: User
+    paymentSource: Optional[SponsorshipPaymentSource] = None
+    privacyLevel: SponsorshipPrivacy
+    sponsor: Optional[User] = None
+    sponsorEntity: Optional[Sponsor] = None
+    sponsorable: Sponsorable
+    tier: Optional[SponsorsTier] = None
+    tierSelectedAt: Optional[DateTime] = None
+    typename__: Optional[Literal['Sponsorship']] = Field(
+        'Sponsorship', alias='__typename'
+    )
+
+
+class SponsorshipConnection(BaseModel):
+    """
+    The connection type for Sponsorship.
+    """
+
+    edges: Optional[List[Optional[SponsorshipEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Sponsorship]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    totalRecurringMonthlyPriceInCents: Int
+    totalRecurringMonthlyPriceInDollars: Int
+    typename__: Optional[Literal['SponsorshipConnection']] = Field(
+        'SponsorshipConnection', alias='__typename'
+    )
+
+
+class SponsorshipEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Sponsorship] = None
+    typename__: Optional[Literal['SponsorshipEdge']] = Field(
+        'SponsorshipEdge', alias='__typename'
+    )
+
+
+class SponsorshipNewsletter(Node):
+    """
+    An update sent to sponsors of a user or organization on GitHub Sponsors.
+    """
+
+    author: Optional[User] = None
+    body: String
+    createdAt: DateTime
+    id: ID
+    isPublished: Boolean
+    sponsorable: Sponsorable
+    subject: String
+    updatedAt: DateTime
+    typename__: Optional[Literal['SponsorshipNewsletter']] = Field(
+        'SponsorshipNewsletter', alias='__typename'
+    )
+
+
+class SponsorshipNewsletterConnection(BaseModel):
+    """
+    The connection type for SponsorshipNewsletter.
+    """
+
+    edges: Optional[List[Optional[SponsorshipNewsletterEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[SponsorshipNewsletter]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['SponsorshipNewsletterConnection']] = Field(
+        'SponsorshipNewsletterConnection', alias='__typename'
+    )
+
+
+class SponsorshipNewsletterEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[SponsorshipNewsletter] = None
+    typename__: Optional[Literal['SponsorshipNewsletterEdge']] = Field(
+        'SponsorshipNewsletterEdge', alias='__typename'
+    )
+
+
+class StargazerConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[StargazerEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['StargazerConnection']] = Field(
+        'StargazerConnection', alias='__typename'
+    )
+
+
+class StargazerEdge(BaseModel):
+    """
+    Represents a user that's starred a repository.
+    """
+
+    cursor: String
+    node: User
+    starredAt: DateTime
+    typename__: Optional[Literal['StargazerEdge']] = Field(
+        'StargazerEdge', alias='__typename'
+    )
+
+
+class StarredRepositoryConnection(BaseModel):
+    """
+    The connection type for Repository.
+    """
+
+    edges: Optional[List[Optional[StarredRepositoryEdge]]] = Field(
+        default_factory=list
+    )
+    isOverLimit: Boolean
+    nodes: Optional[List[Optional[Repository]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['StarredRepositoryConnection']] = Field(
+        'StarredRepositoryConnection', alias='__typename'
+    )
+
+
+class StarredRepositoryEdge(BaseModel):
+    """
+    Represents a starred repository.
+    """
+
+    cursor: String
+    node: Repository
+    starredAt: DateTime
+    typename__: Optional[Literal['StarredRepositoryEdge']] = Field(
+        'StarredRepositoryEdge', alias='__typename'
+    )
+
+
+class Status(Node):
+    """
+    Represents a commit status.
+    """
+
+    combinedContexts: StatusCheckRollupContextConnection
+    commit: Optional[Commit] = None
+    context: Optional[StatusContext] = None
+    contexts: List[StatusContext]
+    id: ID
+    state: StatusState
+    typename__: Optional[Literal['Status']] = Field(
+        'Status', alias='__typename'
+    )
+
+
+class StatusCheckRollup(Node):
+    """
+    Represents the rollup for both the check runs and status for a commit.
+    """
+
+    commit: Optional[Commit] = None
+    contexts: StatusCheckRollupContextConnection
+    id: ID
+    state: StatusState
+    typename__: Optional[Literal['StatusCheckRollup']] = Field(
+        'StatusCheckRollup', alias='__typename'
+    )
+
+
+class StatusCheckRollupContextConnection(BaseModel):
+    """
+    The connection type for StatusCheckRollupContext.
+    """
+
+    checkRunCount: Int
+    checkRunCountsByState: Optional[List[CheckRunStateCount]] = Field(
+        default_factory=list
+    )
+    edges: Optional[List[Optional[StatusCheckRollupContextEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[StatusCheckRollupContext]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    statusContextCount: Int
+    statusContextCountsByState: Optional[
+        List[StatusContextStateCount]
+    ] = Field(default_factory=list)
+    totalCount: Int
+    typename__: Optional[
+        Literal['StatusCheckRollupContextConnection']
+    ] = Field('StatusCheckRollupContextConnection', alias='__typename')
+
+
+class StatusCheckRollupContextEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[StatusCheckRollupContext] = None
+    typename__: Optional[Literal['StatusCheckRollupContextEdge']] = Field(
+        'StatusCheckRollupContextEdge', alias='__typename'
+    )
+
+
+class StatusContext(Node, RequirableByPullRequest):
+    """
+    Represents an individual commit status context
+    """
+
+    avatarUrl: Optional[URI] = None
+    commit: Optional[Commit] = None
+    context: String
+    createdAt: DateTime
+    creator: Optional[Actor] = None
+    description: Optional[String] = None
+    id: ID
+    isRequired: Boolean
+    state: StatusState
+    targetUrl: Optional[URI] = None
+    typename__: Optional[Literal['StatusContext']] = Field(
+        'StatusContext', alias='__typename'
+    )
+
+
+class StripeConnectAccount(BaseModel):
+    """
+    A Stripe Connect account for receiving sponsorship funds from GitHub Sponsors.
+    """
+
+    accountId: String
+    billingCountryOrRegion: Optional[String] = None
+    countryOrRegion: Optional[String] = None
+    isActive: Boolean
+    sponsorsListing: SponsorsListing
+    stripeDashboardUrl: URI
+    typename__: Optional[Literal['StripeConnectAccount']] = Field(
+        'StripeConnectAccount', alias='__typename'
+    )
+
+
+class SuggestedReviewer(BaseModel):
+    """
+    A suggestion to review a pull request based on a user's commit history and review comments.
+    """
+
+    isAuthor: Boolean
+    isCommenter: Boolean
+    reviewer: User
+    typename__: Optional[Literal['SuggestedReviewer']] = Field(
+        'SuggestedReviewer', alias='__typename'
+    )
+
+
+class Team(MemberStatusable, Node, Subscribable):
+    """
+    A team of users in an organization.
+    """
+
+    ancestors: TeamConnection
+    avatarUrl: Optional[URI] = None
+    childTeams: TeamConnection
+    combinedSlug: String
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    description: Optional[String] = None
+    discussion: Optional[TeamDiscussion] = None
+    discussions: TeamDiscussionConnection
+    discussionsResourcePath: URI
+    discussionsUrl: URI
+    editTeamResourcePath: URI
+    editTeamUrl: URI
+    id: ID
+    invitations: Optional[OrganizationInvitationConnection] = None
+    memberStatuses: UserStatusConnection
+    members: TeamMemberConnection
+    membersResourcePath: URI
+    membersUrl: URI
+    name: String
+    newTeamResourcePath: URI
+    newTeamUrl: URI
+    notificationSetting: TeamNotificationSetting
+    organization: Organization
+    parentTeam: Optional[Team] = None
+    privacy: TeamPrivacy
+    projectV2: Optional[ProjectV2] = None
+    projectsV2: ProjectV2Connection
+    repositories: TeamRepositoryConnection
+    repositoriesResourcePath: URI
+    repositoriesUrl: URI
+    resourcePath: URI
+    reviewRequestDelegationAlgorithm: Optional[
+        TeamReviewAssignmentAlgorithm
+    ] = None
+    reviewRequestDelegationEnabled: Boolean
+    reviewRequestDelegationMemberCount: Optional[Int] = None
+    reviewRequestDelegationNotifyTeam: Boolean
+    slug: String
+    teamsResourcePath: URI
+    teamsUrl: URI
+    updatedAt: DateTime
+    url: URI
+    viewerCanAdminister: Boolean
+    viewerCanSubscribe: Boolean
+    viewerSubscription: Optional[SubscriptionState] = None
+    typename__: Optional[Literal['Team']] = Field('Team', alias='__typename')
+
+
+class TeamAddMemberAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, TeamAuditEntryData
+):
+    """
+    Audit log entry for a team.add_member event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    isLdapMapped: Optional[Boolean] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    team: Optional[Team] = None
+    teamName: Optional[String] = None
+    teamResourcePath: Optional[URI] = None
+    teamUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['TeamAddMemberAuditEntry']] = Field(
+        'TeamAddMemberAuditEntry', alias='__typename'
+    )
+
+
+class TeamAddRepositoryAuditEntry(
+    AuditEntry,
+    Node,
+    OrganizationAuditEntryData,
+    RepositoryAuditEntryData,
+    TeamAuditEntryData,
+):
+    """
+    Audit log entry for a team.add_repository event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    isLdapMapped: Optional[Boolean] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    team: Optional[Team] = None
+    teamName: Optional[String] = None
+    teamResourcePath: Optional[URI] = None
+    teamUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['TeamAddRepositoryAuditEntry']] = Field(
+        'TeamAddRepositoryAuditEntry', alias='__typename'
+    )
+
+
+class TeamChangeParentTeamAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, TeamAuditEntryData
+):
+    """
+    Audit log entry for a team.change_parent_team event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    isLdapMapped: Optional[Boolean] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    parentTeam: Optional[Team] = None
+    parentTeamName: Optional[String] = None
+    parentTeamNameWas: Optional[String] = None
+    parentTeamResourcePath: Optional[URI] = None
+    parentTeamUrl: Optional[URI] = None
+    parentTeamWas: Optional[Team] = None
+    parentTeamWasResourcePath: Optional[URI] = None
+    parentTeamWasUrl: Optional[URI] = None
+    team: Optional[Team] = None
+    teamName: Optional[String] = None
+    teamResourcePath: Optional[URI] = None
+    teamUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['TeamChangeParentTeamAuditEntry']] = Field(
+        'TeamChangeParentTeamAuditEntry', alias='__typename'
+    )
+
+
+class TeamConnection(BaseModel):
+    """
+    The connection type for Team.
+    """
+
+    edges: Optional[List[Optional[TeamEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Team]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['TeamConnection']] = Field(
+        'TeamConnection', alias='__typename'
+    )
+
+
+class TeamDiscussion(
+    Comment,
+    Deletable,
+    Node,
+    Reactable,
+    Subscribable,
+    UniformResourceLocatable,
+    Updatable,
+    UpdatableComment,
+):
+    """
+    A team discussion.
+    """
+
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    bodyVersion: String
+    comments: TeamDiscussionCommentConnection
+    commentsResourcePath: URI
+    commentsUrl: URI
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    editor: Optional[Actor] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    isPinned: Boolean
+    isPrivate: Boolean
+    lastEditedAt: Optional[DateTime] = None
+    number: Int
+    publishedAt: Optional[DateTime] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    resourcePath: URI
+    team: Team
+    title: String
+    updatedAt: DateTime
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanDelete: Boolean
+    viewerCanPin: Boolean
+    viewerCanReact: Boolean
+    viewerCanSubscribe: Boolean
+    viewerCanUpdate: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    viewerSubscription: Optional[SubscriptionState] = None
+    typename__: Optional[Literal['TeamDiscussion']] = Field(
+        'TeamDiscussion', alias='__typename'
+    )
+
+
+class TeamDiscussionComment(
+    Comment,
+    Deletable,
+    Node,
+    Reactable,
+    UniformResourceLocatable,
+    Updatable,
+    UpdatableComment,
+):
+    """
+    A comment on a team discussion.
+    """
+
+    author: Optional[Actor] = None
+    authorAssociation: CommentAuthorAssociation
+    body: String
+    bodyHTML: HTML
+    bodyText: String
+    bodyVersion: String
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    discussion: TeamDiscussion
+    editor: Optional[Actor] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    lastEditedAt: Optional[DateTime] = None
+    number: Int
+    publishedAt: Optional[DateTime] = None
+    reactionGroups: Optional[List[ReactionGroup]] = Field(default_factory=list)
+    reactions: ReactionConnection
+    resourcePath: URI
+    updatedAt: DateTime
+    url: URI
+    userContentEdits: Optional[UserContentEditConnection] = None
+    viewerCanDelete: Boolean
+    viewerCanReact: Boolean
+    viewerCanUpdate: Boolean
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    viewerDidAuthor: Boolean
+    typename__: Optional[Literal['TeamDiscussionComment']] = Field(
+        'TeamDiscussionComment', alias='__typename'
+    )
+
+
+class TeamDiscussionCommentConnection(BaseModel):
+    """
+    The connection type for TeamDiscussionComment.
+    """
+
+    edges: Optional[List[Optional[TeamDiscussionCommentEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[TeamDiscussionComment]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['TeamDiscussionCommentConnection']] = Field(
+        'TeamDiscussionCommentConnection', alias='__typename'
+    )
+
+
+class TeamDiscussionCommentEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[TeamDiscussionComment] = None
+    typename__: Optional[Literal['TeamDiscussionCommentEdge']] = Field(
+        'TeamDiscussionCommentEdge', alias='__typename'
+    )
+
+
+class TeamDiscussionConnection(BaseModel):
+    """
+    The connection type for TeamDiscussion.
+    """
+
+    edges: Optional[List[Optional[TeamDiscussionEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[TeamDiscussion]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['TeamDiscussionConnection']] = Field(
+        'TeamDiscussionConnection', alias='__typename'
+    )
+
+
+class TeamDiscussionEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[TeamDiscussion] = None
+    typename__: Optional[Literal['TeamDiscussionEdge']] = Field(
+        'TeamDiscussionEdge', alias='__typename'
+    )
+
+
+class TeamEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Team] = None
+    typename__: Optional[Literal['TeamEdge']] = Field(
+        'TeamEdge', alias='__typename'
+    )
+
+
+class TeamMemberConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[TeamMemberEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['TeamMemberConnection']] = Field(
+        'TeamMemberConnection', alias='__typename'
+    )
+
+
+class TeamMemberEdge(BaseModel):
+    """
+    Represents a user who is a member of a team.
+    """
+
+    cursor: String
+    memberAccessResourcePath: URI
+    memberAccessUrl: URI
+    node: User
+    role: TeamMemberRole
+    typename__: Optional[Literal['TeamMemberEdge']] = Field(
+        'TeamMemberEdge', alias='__typename'
+    )
+
+
+class TeamRemoveMemberAuditEntry(
+    AuditEntry, Node, OrganizationAuditEntryData, TeamAuditEntryData
+):
+    """
+    Audit log entry for a team.remove_member event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    isLdapMapped: Optional[Boolean] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    team: Optional[Team] = None
+    teamName: Optional[String] = None
+    teamResourcePath: Optional[URI] = None
+    teamUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['TeamRemoveMemberAuditEntry']] = Field(
+        'TeamRemoveMemberAuditEntry', alias='__typename'
+    )
+
+
+class TeamRemoveRepositoryAuditEntry(
+    AuditEntry,
+    Node,
+    OrganizationAuditEntryData,
+    RepositoryAuditEntryData,
+    TeamAuditEntryData,
+):
+    """
+    Audit log entry for a team.remove_repository event.
+    """
+
+    action: String
+    actor: Optional[AuditEntryActor] = None
+    actorIp: Optional[String] = None
+    actorLocation: Optional[ActorLocation] = None
+    actorLogin: Optional[String] = None
+    actorResourcePath: Optional[URI] = None
+    actorUrl: Optional[URI] = None
+    createdAt: PreciseDateTime
+    id: ID
+    isLdapMapped: Optional[Boolean] = None
+    operationType: Optional[OperationType] = None
+    organization: Optional[Organization] = None
+    organizationName: Optional[String] = None
+    organizationResourcePath: Optional[URI] = None
+    organizationUrl: Optional[URI] = None
+    repository: Optional[Repository] = None
+    repositoryName: Optional[String] = None
+    repositoryResourcePath: Optional[URI] = None
+    repositoryUrl: Optional[URI] = None
+    team: Optional[Team] = None
+    teamName: Optional[String] = None
+    teamResourcePath: Optional[URI] = None
+    teamUrl: Optional[URI] = None
+    user: Optional[User] = None
+    userLogin: Optional[String] = None
+    userResourcePath: Optional[URI] = None
+    userUrl: Optional[URI] = None
+    typename__: Optional[Literal['TeamRemoveRepositoryAuditEntry']] = Field(
+        'TeamRemoveRepositoryAuditEntry', alias='__typename'
+    )
+
+
+class TeamRepositoryConnection(BaseModel):
+    """
+    The connection type for Repository.
+    """
+
+    edges: Optional[List[Optional[TeamRepositoryEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Repository]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['TeamRepositoryConnection']] = Field(
+        'TeamRepositoryConnection', alias='__typename'
+    )
+
+
+class TeamRepositoryEdge(BaseModel):
+    """
+    Represents a team repository.
+    """
+
+    cursor: String
+    node: Repository
+    permission: RepositoryPermission
+    typename__: Optional[Literal['TeamRepositoryEdge']] = Field(
+        'TeamRepositoryEdge', alias='__typename'
+    )
+
+
+class Topic(Node, Starrable):
+    """
+    A topic aggregates entities that are related to a subject.
+    """
+
+    id: ID
+    name: String
+    relatedTopics: List[Topic]
+    repositories: RepositoryConnection
+    stargazerCount: Int
+    stargazers: StargazerConnection
+    viewerHasStarred: Boolean
+    typename__: Optional[Literal['Topic']] = Field('Topic', alias='__typename')
+
+
+class TransferredEvent(Node):
+    """
+    Represents a 'transferred' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    fromRepository: Optional[Repository] = None
+    id: ID
+    issue: Issue
+    typename__: Optional[Literal['TransferredEvent']] = Field(
+        'TransferredEvent', alias='__typename'
+    )
+
+
+class Tree(GitObject, Node):
+    """
+    Represents a Git tree.
+    """
+
+    abbreviatedOid: String
+    commitResourcePath: URI
+    commitUrl: URI
+    entries: Optional[List[TreeEntry]] = Field(default_factory=list)
+    id: ID
+    oid: GitObjectID
+    repository: Repository
+    typename__: Optional[Literal['Tree']] = Field('Tree', alias='__typename')
+
+
+class TreeEntry(BaseModel):
+    """
+    Represents a Git tree entry.
+    """
+
+    extension: Optional[String] = None
+    isGenerated: Boolean
+    language: Optional[Language] = None
+    lineCount: Optional[Int] = None
+    mode: Int
+    name: String
+    nameRaw: Base64String
+    object: Optional[GitObject] = None
+    oid: GitObjectID
+    path: Optional[String] = None
+    pathRaw: Optional[Base64String] = None
+    repository: Repository
+    size: Int
+    submodule: Optional[Submodule] = None
+    type: String
+    typename__: Optional[Literal['TreeEntry']] = Field(
+        'TreeEntry', alias='__typename'
+    )
+
+
+class UnassignedEvent(Node):
+    """
+    Represents an 'unassigned' event on any assignable object.
+    """
+
+    actor: Optional[Actor] = None
+    assignable: Assignable
+    assignee: Optional[Assignee] = None
+    createdAt: DateTime
+    id: ID
+    user: Optional[User] = None
+    typename__: Optional[Literal['UnassignedEvent']] = Field(
+        'UnassignedEvent', alias='__typename'
+    )
+
+
+class UnlabeledEvent(Node):
+    """
+    Represents an 'unlabeled' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    label: Label
+    labelable: Labelable
+    typename__: Optional[Literal['UnlabeledEvent']] = Field(
+        'UnlabeledEvent', alias='__typename'
+    )
+
+
+class UnmarkedAsDuplicateEvent(Node):
+    """
+    Represents an 'unmarked_as_duplicate' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    canonical: Optional[IssueOrPullRequest] = None
+    createdAt: DateTime
+    duplicate: Optional[IssueOrPullRequest] = None
+    id: ID
+    isCrossRepository: Boolean
+    typename__: Optional[Literal['UnmarkedAsDuplicateEvent']] = Field(
+        'UnmarkedAsDuplicateEvent', alias='__typename'
+    )
+
+
+class UnpinnedEvent(Node):
+    """
+    Represents an 'unpinned' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    issue: Issue
+    typename__: Optional[Literal['UnpinnedEvent']] = Field(
+        'UnpinnedEvent', alias='__typename'
+    )
+
+
+class User(
+    Actor,
+    Node,
+    PackageOwner,
+    ProfileOwner,
+    ProjectOwner,
+    ProjectV2Owner,
+    ProjectV2Recent,
+    RepositoryDiscussionAuthor,
+    RepositoryDiscussionCommentAuthor,
+    RepositoryOwner,
+    Sponsorable,
+    UniformResourceLocatable,
+):
+    """
+    A user is an individual's account on GitHub that owns repositories and can make new content.
+    """
+
+    anyPinnableItems: Boolean
+    avatarUrl: URI
+    bio: Optional[String] = None
+    bioHTML: HTML
+    canReceiveOrganizationEmailsWhenNotificationsRestricted: Boolean
+    commitComments: CommitCommentConnection
+    company: Optional[String] = None
+    companyHTML: HTML
+    contributionsCollection: ContributionsCollection
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    email: String
+    enterprises: Optional[EnterpriseConnection] = None
+    estimatedNextSponsorsPayoutInCents: Int
+    followers: FollowerConnection
+    following: FollowingConnection
+    gist: Optional[Gist] = None
+    gistComments: GistCommentConnection
+    gists: GistConnection
+    hasSponsorsListing: Boolean
+    hovercard: Hovercard
+    id: ID
+    interactionAbility: Optional[RepositoryInteractionAbility] = None
+    isBountyHunter: Boolean
+    isCampusExpert: Boolean
+    isDeveloperProgramMember: Boolean
+    isEmployee: Boolean
+    isFollowingViewer: Boolean
+    isGitHubStar: Boolean
+    isHireable: Boolean
+    isSiteAdmin: Boolean
+    isSponsoredBy: Boolean
+    isSponsoringViewer: Boolean
+    isViewer: Boolean
+    issueComments: IssueCommentConnection
+    issues: IssueConnection
+    itemShowcase: ProfileItemShowcase
+    lists: UserListConnection
+    location: Optional[String] = None
+    login: String
+    monthlyEstimatedSponsorsIncomeInCents: Int
+    name: Optional[String] = None
+    organization: Optional[Organization] = None
+    organizationVerifiedDomainEmails: List[String]
+    organizations: OrganizationConnection
+    packages: PackageConnection
+    pinnableItems: PinnableItemConnection
+    pinnedItems: PinnableItemConnection
+    pinnedItemsRemaining: Int
+    project: Optional[Project] = None
+    projectV2: Optional[ProjectV2] = None
+    projects: ProjectConnection
+    projectsResourcePath: URI
+    projectsUrl: URI
+    projectsV2: ProjectV2Connection
+    pronouns: Optional[String] = None
+    publicKeys: PublicKeyConnection
+    pullRequests: PullRequestConnection
+    recentProjects: ProjectV2Connection
+    repositories: RepositoryConnection
+    repositoriesContributedTo: RepositoryConnection
+    repository: Optional[Repository] = None
+    repositoryDiscussionComments: DiscussionCommentConnection
+    repositoryDiscussions: DiscussionConnection
+    resourcePath: URI
+    savedReplies: Optional[SavedReplyConnection] = None
+    socialAccounts: SocialAccountConnection
+    sponsoring: SponsorConnection
+    sponsors: SponsorConnection
+    sponsorsActivities: SponsorsActivityConnection
+    sponsorsListing: Optional[SponsorsListing] = None
+    sponsorshipForViewerAsSponsor: Optional[Sponsorship] = None
+    sponsorshipForViewerAsSponsorable: Optional[Sponsorship] = None
+    sponsorshipNewsletters: SponsorshipNewsletterConnection
+    sponsorshipsAsMaintainer: SponsorshipConnection
+    sponsorshipsAsSponsor: SponsorshipConnection
+    starredRepositories: StarredRepositoryConnection
+    status: Optional[UserStatus] = None
+    suggestedListNames: List[UserListSuggestion]
+    topRepositories: RepositoryConnection
+    totalSponsorshipAmountAsSponsorInCents: Optional[Int] = None
+    twitterUsername: Optional[String] = None
+    updatedAt: DateTime
+    url: URI
+    viewerCanChangePinnedItems: Boolean
+    viewerCanCreateProjects: Boolean
+    viewerCanFollow: Boolean
+    viewerCanSponsor: Boolean
+    viewerIsFollowing: Boolean
+    viewerIsSponsoring: Boolean
+    watching: RepositoryConnection
+    websiteUrl: Optional[URI] = None
+    typename__: Optional[Literal['User']] = Field('User', alias='__typename')
+
+
+class UserBlockedEvent(Node):
+    """
+    Represents a 'user_blocked' event on a given user.
+    """
+
+    actor: Optional[Actor] = None
+    blockDuration: UserBlockDuration
+    createdAt: DateTime
+    id: ID
+    subject: Optional[User] = None
+    typename__: Optional[Literal['UserBlockedEvent']] = Field(
+        'UserBlockedEvent', alias='__typename'
+    )
+
+
+class UserConnection(BaseModel):
+    """
+    The connection type for User.
+    """
+
+    edges: Optional[List[Optional[UserEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[User]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['UserConnection']] = Field(
+        'UserConnection', alias='__typename'
+    )
+
+
+class UserEdge(BaseModel):
+    """
+    Represents a user.
+    """
+
+    cursor: String
+    node: Optional[User] = None
+    typename__: Optional[Literal['UserEdge']] = Field(
+        'UserEdge', alias='__typename'
+    )
+
+
+class UserList(Node):
+    """
+    A user-curated list of repositories
+    """
+
+    createdAt: DateTime
+    description: Optional[String] = None
+    id: ID
+    isPrivate: Boolean
+    items: UserListItemsConnection
+    lastAddedAt: DateTime
+    name: String
+    slug: String
+    updatedAt: DateTime
+    user: User
+    typename__: Optional[Literal['UserList']] = Field(
+        'UserList', alias='__typename'
+    )
+
+
+class UserListConnection(BaseModel):
+    """
+    The connection type for UserList.
+    """
+
+    edges: Optional[List[Optional[UserListEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[UserList]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['UserListConnection']] = Field(
+        'UserListConnection', alias='__typename'
+    )
+
+
+class UserListEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[UserList] = None
+    typename__: Optional[Literal['UserListEdge']] = Field(
+        'UserListEdge', alias='__typename'
+    )
+
+
+class UserListItemsConnection(BaseModel):
+    """
+    The connection type for UserListItems.
+    """
+
+    edges: Optional[List[Optional[UserListItemsEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[UserListItems]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['UserListItemsConnection']] = Field(
+        'UserListItemsConnection', alias='__typename'
+    )
+
+
+class UserListItemsEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[UserListItems] = None
+    typename__: Optional[Literal['UserListItemsEdge']] = Field(
+        'UserListItemsEdge', alias='__typename'
+    )
+
+
+class UserStatus(Node):
+    """
+    The user's description of what they're currently doing.
+    """
+
+    createdAt: DateTime
+    emoji: Optional[String] = None
+    emojiHTML: Optional[HTML] = None
+    expiresAt: Optional[DateTime] = None
+    id: ID
+    indicatesLimitedAvailability: Boolean
+    message: Optional[String] = None
+    organization: Optional[Organization] = None
+    updatedAt: DateTime
+    user: User
+    typename__: Optional[Literal['UserStatus']] = Field(
+        'UserStatus', alias='__typename'
+    )
+
+
+class UserStatusConnection(BaseModel):
+    """
+    The connection type for UserStatus.
+    """
+
+    edges: Optional[List[Optional[UserStatusEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[UserStatus]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['UserStatusConnection']] = Field(
+        'UserStatusConnection', alias='__typename'
+    )
+
+
+class UserStatusEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[UserStatus] = None
+    typename__: Optional[Literal['UserStatusEdge']] = Field(
+        'UserStatusEdge', alias='__typename'
+    )
+
+
+class VerifiableDomain(Node):
+    """
+    A domain that can be verified or approved for an organization or an enterprise.
+    """
+
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    dnsHostName: Optional[URI] = None
+    domain: URI
+    hasFoundHostName: Boolean
+    hasFoundVerificationToken: Boolean
+    id: ID
+    isApproved: Boolean
+    isRequiredForPolicyEnforcement: Boolean
+    isVerified: Boolean
+    owner: VerifiableDomainOwner
+    punycodeEncodedDomain: URI
+    tokenExpirationTime: Optional[DateTime] = None
+    updatedAt: DateTime
+    verificationToken: Optional[String] = None
+    typename__: Optional[Literal['VerifiableDomain']] = Field(
+        'VerifiableDomain', alias='__typename'
+    )
+
+
+class VerifiableDomainConnection(BaseModel):
+    """
+    The connection type for VerifiableDomain.
+    """
+
+    edges: Optional[List[Optional[VerifiableDomainEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[VerifiableDomain]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['VerifiableDomainConnection']] = Field(
+        'VerifiableDomainConnection', alias='__typename'
+    )
+
+
+class VerifiableDomainEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[VerifiableDomain] = None
+    typename__: Optional[Literal['VerifiableDomainEdge']] = Field(
+        'VerifiableDomainEdge', alias='__typename'
+    )
+
+
+class Workflow(Node, UniformResourceLocatable):
+    """
+    A workflow contains meta information about an Actions workflow file.
+    """
+
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    id: ID
+    name: String
+    resourcePath: URI
+    runs: WorkflowRunConnection
+    state: WorkflowState
+    updatedAt: DateTime
+    url: URI
+    typename__: Optional[Literal['Workflow']] = Field(
+        'Workflow', alias='__typename'
+    )
+
+
+class WorkflowRun(Node, UniformResourceLocatable):
+    """
+    A workflow run.
+    """
+
+    checkSuite: CheckSuite
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    deploymentReviews: DeploymentReviewConnection
+    event: String
+    file: Optional[WorkflowRunFile] = None
+    id: ID
+    pendingDeploymentRequests: DeploymentRequestConnection
+    resourcePath: URI
+    runNumber: Int
+    updatedAt: DateTime
+    url: URI
+    workflow: Workflow
+    typename__: Optional[Literal['WorkflowRun']] = Field(
+        'WorkflowRun', alias='__typename'
+    )
+
+
+class WorkflowRunConnection(BaseModel):
+    """
+    The connection type for WorkflowRun.
+    """
+
+    edges: Optional[List[Optional[WorkflowRunEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[WorkflowRun]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['WorkflowRunConnection']] = Field(
+        'WorkflowRunConnection', alias='__typename'
+    )
+
+
+class WorkflowRunEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[WorkflowRun] = None
+    typename__: Optional[Literal['WorkflowRunEdge']] = Field(
+        'WorkflowRunEdge', alias='__typename'
+    )
+
+
+class WorkflowRunFile(Node, UniformResourceLocatable):
+    """
+    An executed workflow file for a workflow run.
+    """
+
+    id: ID
+    path: String
+    repositoryFileUrl: URI
+    repositoryName: URI
+    resourcePath: URI
+    run: WorkflowRun
+    url: URI
+    viewerCanPushRepository: Boolean
+    viewerCanReadRepository: Boolean
+    typename__: Optional[Literal['WorkflowRunFile']] = Field(
+        'WorkflowRunFile', alias='__typename'
+    )
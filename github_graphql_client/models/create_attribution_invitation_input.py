@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateAttributionInvitationInput(BaseModel):
+    """
+    Autogenerated input type of CreateAttributionInvitation
+    """
+
+    clientMutationId: Optional[String] = None
+    ownerId: ID
+    sourceId: ID
+    targetId: ID
+    typename__: Optional[Literal['CreateAttributionInvitationInput']] = Field(
+        'CreateAttributionInvitationInput', alias='__typename'
+    )
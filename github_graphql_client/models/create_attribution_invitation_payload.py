@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateAttributionInvitationPayload(BaseModel):
+    """
+    Autogenerated return type of CreateAttributionInvitation
+    """
+
+    clientMutationId: Optional[String] = None
+    owner: Optional[Organization] = None
+    source: Optional[Claimable] = None
+    target: Optional[Claimable] = None
+    typename__: Optional[
+        Literal['CreateAttributionInvitationPayload']
+    ] = Field('CreateAttributionInvitationPayload', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateBranchProtectionRulePayload(BaseModel):
+    """
+    Autogenerated return type of CreateBranchProtectionRule
+    """
+
+    branchProtectionRule: Optional[BranchProtectionRule] = None
+    clientMutationId: Optional[String] = None
+    typename__: Optional[Literal['CreateBranchProtectionRulePayload']] = Field(
+        'CreateBranchProtectionRulePayload', alias='__typename'
+    )
@@ -0,0 +1,31 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateCheckRunInput(BaseModel):
+    """
+    Autogenerated input type of CreateCheckRun
+    """
+
+    actions: Optional[List[CheckRunAction]] = None
+    clientMutationId: Optional[String] = None
+    completedAt: Optional[DateTime] = None
+    conclusion: Optional[CheckConclusionState] = None
+    detailsUrl: Optional[URI] = None
+    externalId: Optional[String] = None
+    headSha: GitObjectID
+    name: String
+    output: Optional[CheckRunOutput] = None
+    repositoryId: ID
+    startedAt: Optional[DateTime] = None
+    status: Optional[RequestableCheckStatusState] = None
+    typename__: Optional[Literal['CreateCheckRunInput']] = Field(
+        'CreateCheckRunInput', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateCommitOnBranchInput(BaseModel):
+    """
+    Autogenerated input type of CreateCommitOnBranch
+    """
+
+    branch: CommittableBranch
+    clientMutationId: Optional[String] = None
+    expectedHeadOid: GitObjectID
+    fileChanges: Optional[FileChanges] = None
+    message: CommitMessage
+    typename__: Optional[Literal['CreateCommitOnBranchInput']] = Field(
+        'CreateCommitOnBranchInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateCommitOnBranchPayload(BaseModel):
+    """
+    Autogenerated return type of CreateCommitOnBranch
+    """
+
+    clientMutationId: Optional[String] = None
+    commit: Optional[Commit] = None
+    ref: Optional[Ref] = None
+    typename__: Optional[Literal['CreateCommitOnBranchPayload']] = Field(
+        'CreateCommitOnBranchPayload', alias='__typename'
+    )
@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateDeploymentInput(BaseModel):
+    """
+    Autogenerated input type of CreateDeployment
+    """
+
+    autoMerge: Optional[Boolean] = True
+    clientMutationId: Optional[String] = None
+    description: Optional[String] = ''
+    environment: Optional[String] = 'production'
+    payload: Optional[String] = '{}'
+    refId: ID
+    repositoryId: ID
+    requiredContexts: Optional[List[String]] = None
+    task: Optional[String] = 'deploy'
+    typename__: Optional[Literal['CreateDeploymentInput']] = Field(
+        'CreateDeploymentInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateDeploymentPayload(BaseModel):
+    """
+    Autogenerated return type of CreateDeployment
+    """
+
+    autoMerged: Optional[Boolean] = None
+    clientMutationId: Optional[String] = None
+    deployment: Optional[Deployment] = None
+    typename__: Optional[Literal['CreateDeploymentPayload']] = Field(
+        'CreateDeploymentPayload', alias='__typename'
+    )
@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateDeploymentStatusInput(BaseModel):
+    """
+    Autogenerated input type of CreateDeploymentStatus
+    """
+
+    autoInactive: Optional[Boolean] = True
+    clientMutationId: Optional[String] = None
+    deploymentId: ID
+    description: Optional[String] = ''
+    environment: Optional[String] = None
+    environmentUrl: Optional[String] = ''
+    logUrl: Optional[String] = ''
+    state: DeploymentStatusState
+    typename__: Optional[Literal['CreateDeploymentStatusInput']] = Field(
+        'CreateDeploymentStatusInput', alias='__typename'
+    )
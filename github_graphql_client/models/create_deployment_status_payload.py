@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateDeploymentStatusPayload(BaseModel):
+    """
+    Autogenerated return type of CreateDeploymentStatus
+    """
+
+    clientMutationId: Optional[String] = None
+    deploymentStatus: Optional[DeploymentStatus] = None
+    typename__: Optional[Literal['CreateDeploymentStatusPayload']] = Field(
+        'CreateDeploymentStatusPayload', alias='__typename'
+    )
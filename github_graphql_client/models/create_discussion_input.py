@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateDiscussionInput(BaseModel):
+    """
+    Autogenerated input type of CreateDiscussion
+    """
+
+    body: String
+    categoryId: ID
+    clientMutationId: Optional[String] = None
+    repositoryId: ID
+    title: String
+    typename__: Optional[Literal['CreateDiscussionInput']] = Field(
+        'CreateDiscussionInput', alias='__typename'
+    )
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateEnterpriseOrganizationInput(BaseModel):
+    """
+    Autogenerated input type of CreateEnterpriseOrganization
+    """
+
+    adminLogins: List[String]
+    billingEmail: String
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    login: String
+    profileName: String
+    typename__: Optional[Literal['CreateEnterpriseOrganizationInput']] = Field(
+        'CreateEnterpriseOrganizationInput', alias='__typename'
+    )
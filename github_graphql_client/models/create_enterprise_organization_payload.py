@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateEnterpriseOrganizationPayload(BaseModel):
+    """
+    Autogenerated return type of CreateEnterpriseOrganization
+    """
+
+    clientMutationId: Optional[String] = None
+    enterprise: Optional[Enterprise] = None
+    organization: Optional[Organization] = None
+    typename__: Optional[
+        Literal['CreateEnterpriseOrganizationPayload']
+    ] = Field('CreateEnterpriseOrganizationPayload', alias='__typename')
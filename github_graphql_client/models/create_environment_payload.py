@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateEnvironmentPayload(BaseModel):
+    """
+    Autogenerated return type of CreateEnvironment
+    """
+
+    clientMutationId: Optional[String] = None
+    environment: Optional[Environment] = None
+    typename__: Optional[Literal['CreateEnvironmentPayload']] = Field(
+        'CreateEnvironmentPayload', alias='__typename'
+    )
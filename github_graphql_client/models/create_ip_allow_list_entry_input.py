@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateIpAllowListEntryInput(BaseModel):
+    """
+    Autogenerated input type of CreateIpAllowListEntry
+    """
+
+    allowListValue: String
+    clientMutationId: Optional[String] = None
+    isActive: Boolean
+    name: Optional[String] = None
+    ownerId: ID
+    typename__: Optional[Literal['CreateIpAllowListEntryInput']] = Field(
+        'CreateIpAllowListEntryInput', alias='__typename'
+    )
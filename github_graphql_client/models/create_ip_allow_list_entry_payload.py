@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateIpAllowListEntryPayload(BaseModel):
+    """
+    Autogenerated return type of CreateIpAllowListEntry
+    """
+
+    clientMutationId: Optional[String] = None
+    ipAllowListEntry: Optional[IpAllowListEntry] = None
+    typename__: Optional[Literal['CreateIpAllowListEntryPayload']] = Field(
+        'CreateIpAllowListEntryPayload', alias='__typename'
+    )
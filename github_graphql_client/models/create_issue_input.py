@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateIssueInput(BaseModel):
+    """
+    Autogenerated input type of CreateIssue
+    """
+
+    assigneeIds: Optional[List[ID]] = None
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    issueTemplate: Optional[String] = None
+    labelIds: Optional[List[ID]] = None
+    milestoneId: Optional[ID] = None
+    projectIds: Optional[List[ID]] = None
+    repositoryId: ID
+    title: String
+    typename__: Optional[Literal['CreateIssueInput']] = Field(
+        'CreateIssueInput', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateLabelInput(BaseModel):
+    """
+    Autogenerated input type of CreateLabel
+    """
+
+    clientMutationId: Optional[String] = None
+    color: String
+    description: Optional[String] = None
+    name: String
+    repositoryId: ID
+    typename__: Optional[Literal['CreateLabelInput']] = Field(
+        'CreateLabelInput', alias='__typename'
+    )
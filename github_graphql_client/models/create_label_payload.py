@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateLabelPayload(BaseModel):
+    """
+    Autogenerated return type of CreateLabel
+    """
+
+    clientMutationId: Optional[String] = None
+    label: Optional[Label] = None
+    typename__: Optional[Literal['CreateLabelPayload']] = Field(
+        'CreateLabelPayload', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateLinkedBranchInput(BaseModel):
+    """
+    Autogenerated input type of CreateLinkedBranch
+    """
+
+    clientMutationId: Optional[String] = None
+    issueId: ID
+    name: Optional[String] = None
+    oid: GitObjectID
+    repositoryId: Optional[ID] = None
+    typename__: Optional[Literal['CreateLinkedBranchInput']] = Field(
+        'CreateLinkedBranchInput', alias='__typename'
+    )
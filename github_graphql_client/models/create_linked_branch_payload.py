@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateLinkedBranchPayload(BaseModel):
+    """
+    Autogenerated return type of CreateLinkedBranch
+    """
+
+    clientMutationId: Optional[String] = None
+    issue: Optional[Issue] = None
+    linkedBranch: Optional[LinkedBranch] = None
+    typename__: Optional[Literal['CreateLinkedBranchPayload']] = Field(
+        'CreateLinkedBranchPayload', alias='__typename'
+    )
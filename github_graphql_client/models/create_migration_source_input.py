@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateMigrationSourceInput(BaseModel):
+    """
+    Autogenerated input type of CreateMigrationSource
+    """
+
+    accessToken: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    githubPat: Optional[String] = None
+    name: String
+    ownerId: ID
+    type: MigrationSourceType
+    url: Optional[String] = None
+    typename__: Optional[Literal['CreateMigrationSourceInput']] = Field(
+        'CreateMigrationSourceInput', alias='__typename'
+    )
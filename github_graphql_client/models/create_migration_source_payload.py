@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateMigrationSourcePayload(BaseModel):
+    """
+    Autogenerated return type of CreateMigrationSource
+    """
+
+    clientMutationId: Optional[String] = None
+    migrationSource: Optional[MigrationSource] = None
+    typename__: Optional[Literal['CreateMigrationSourcePayload']] = Field(
+        'CreateMigrationSourcePayload', alias='__typename'
+    )
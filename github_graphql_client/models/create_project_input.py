@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateProjectInput(BaseModel):
+    """
+    Autogenerated input type of CreateProject
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    name: String
+    ownerId: ID
+    repositoryIds: Optional[List[ID]] = None
+    template: Optional[ProjectTemplate] = None
+    typename__: Optional[Literal['CreateProjectInput']] = Field(
+        'CreateProjectInput', alias='__typename'
+    )
@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateProjectV2FieldInput(BaseModel):
+    """
+    Autogenerated input type of CreateProjectV2Field
+    """
+
+    clientMutationId: Optional[String] = None
+    dataType: ProjectV2CustomFieldType
+    name: String
+    projectId: ID
+    singleSelectOptions: Optional[
+        List[ProjectV2SingleSelectFieldOptionInput]
+    ] = None
+    typename__: Optional[Literal['CreateProjectV2FieldInput']] = Field(
+        'CreateProjectV2FieldInput', alias='__typename'
+    )
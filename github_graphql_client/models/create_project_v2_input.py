@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateProjectV2Input(BaseModel):
+    """
+    Autogenerated input type of CreateProjectV2
+    """
+
+    clientMutationId: Optional[String] = None
+    ownerId: ID
+    repositoryId: Optional[ID] = None
+    teamId: Optional[ID] = None
+    title: String
+    typename__: Optional[Literal['CreateProjectV2Input']] = Field(
+        'CreateProjectV2Input', alias='__typename'
+    )
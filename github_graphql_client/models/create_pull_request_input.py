@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreatePullRequestInput(BaseModel):
+    """
+    Autogenerated input type of CreatePullRequest
+    """
+
+    baseRefName: String
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    draft: Optional[Boolean] = False
+    headRefName: String
+    headRepositoryId: Optional[ID] = None
+    maintainerCanModify: Optional[Boolean] = True
+    repositoryId: ID
+    title: String
+    typename__: Optional[Literal['CreatePullRequestInput']] = Field(
+        'CreatePullRequestInput', alias='__typename'
+    )
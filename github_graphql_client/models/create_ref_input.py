@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateRefInput(BaseModel):
+    """
+    Autogenerated input type of CreateRef
+    """
+
+    clientMutationId: Optional[String] = None
+    name: String
+    oid: GitObjectID
+    repositoryId: ID
+    typename__: Optional[Literal['CreateRefInput']] = Field(
+        'CreateRefInput', alias='__typename'
+    )
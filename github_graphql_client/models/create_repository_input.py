@@ -0,0 +1,29 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateRepositoryInput(BaseModel):
+    """
+    Autogenerated input type of CreateRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    description: Optional[String] = None
+    hasIssuesEnabled: Optional[Boolean] = True
+    hasWikiEnabled: Optional[Boolean] = False
+    homepageUrl: Optional[URI] = None
+    name: String
+    ownerId: Optional[ID] = None
+    teamId: Optional[ID] = None
+    template: Optional[Boolean] = False
+    visibility: RepositoryVisibility
+    typename__: Optional[Literal['CreateRepositoryInput']] = Field(
+        'CreateRepositoryInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateRepositoryPayload(BaseModel):
+    """
+    Autogenerated return type of CreateRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    repository: Optional[Repository] = None
+    typename__: Optional[Literal['CreateRepositoryPayload']] = Field(
+        'CreateRepositoryPayload', alias='__typename'
+    )
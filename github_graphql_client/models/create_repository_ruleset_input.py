@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateRepositoryRulesetInput(BaseModel):
+    """
+    Autogenerated input type of CreateRepositoryRuleset
+    """
+
+    bypassActors: Optional[List[RepositoryRulesetBypassActorInput]] = None
+    clientMutationId: Optional[String] = None
+    conditions: RepositoryRuleConditionsInput
+    enforcement: RuleEnforcement
+    name: String
+    rules: Optional[List[RepositoryRuleInput]] = None
+    sourceId: ID
+    target: Optional[RepositoryRulesetTarget] = None
+    typename__: Optional[Literal['CreateRepositoryRulesetInput']] = Field(
+        'CreateRepositoryRulesetInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateRepositoryRulesetPayload(BaseModel):
+    """
+    Autogenerated return type of CreateRepositoryRuleset
+    """
+
+    clientMutationId: Optional[String] = None
+    ruleset: Optional[RepositoryRuleset] = None
+    typename__: Optional[Literal['CreateRepositoryRulesetPayload']] = Field(
+        'CreateRepositoryRulesetPayload', alias='__typename'
+    )
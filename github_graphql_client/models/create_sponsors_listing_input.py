@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateSponsorsListingInput(BaseModel):
+    """
+    Autogenerated input type of CreateSponsorsListing
+    """
+
+    billingCountryOrRegionCode: Optional[SponsorsCountryOrRegionCode] = None
+    clientMutationId: Optional[String] = None
+    contactEmail: Optional[String] = None
+    fiscalHostLogin: Optional[String] = None
+    fiscallyHostedProjectProfileUrl: Optional[String] = None
+    fullDescription: Optional[String] = None
+    residenceCountryOrRegionCode: Optional[SponsorsCountryOrRegionCode] = None
+    sponsorableLogin: Optional[String] = None
+    typename__: Optional[Literal['CreateSponsorsListingInput']] = Field(
+        'CreateSponsorsListingInput', alias='__typename'
+    )
@@ -0,0 +1,30 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateSponsorsTierInput(BaseModel):
+    """
+    Autogenerated input type of CreateSponsorsTier
+    """
+
+    amount: Int
+    clientMutationId: Optional[String] = None
+    description: String
+    isRecurring: Optional[Boolean] = True
+    publish: Optional[Boolean] = False
+    repositoryId: Optional[ID] = None
+    repositoryName: Optional[String] = None
+    repositoryOwnerLogin: Optional[String] = None
+    sponsorableId: Optional[ID] = None
+    sponsorableLogin: Optional[String] = None
+    welcomeMessage: Optional[String] = None
+    typename__: Optional[Literal['CreateSponsorsTierInput']] = Field(
+        'CreateSponsorsTierInput', alias='__typename'
+    )
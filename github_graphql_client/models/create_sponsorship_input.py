@@ -0,0 +1,29 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateSponsorshipInput(BaseModel):
+    """
+    Autogenerated input type of CreateSponsorship
+    """
+
+    amount: Optional[Int] = None
+    clientMutationId: Optional[String] = None
+    isRecurring: Optional[Boolean] = None
+    privacyLevel: Optional[SponsorshipPrivacy] = 'PUBLIC'
+    receiveEmails: Optional[Boolean] = True
+    sponsorId: Optional[ID] = None
+    sponsorLogin: Optional[String] = None
+    sponsorableId: Optional[ID] = None
+    sponsorableLogin: Optional[String] = None
+    tierId: Optional[ID] = None
+    typename__: Optional[Literal['CreateSponsorshipInput']] = Field(
+        'CreateSponsorshipInput', alias='__typename'
+    )
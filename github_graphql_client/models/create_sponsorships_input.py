@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateSponsorshipsInput(BaseModel):
+    """
+    Autogenerated input type of CreateSponsorships
+    """
+
+    clientMutationId: Optional[String] = None
+    privacyLevel: Optional[SponsorshipPrivacy] = 'PUBLIC'
+    receiveEmails: Optional[Boolean] = False
+    sponsorLogin: String
+    sponsorships: List[BulkSponsorship]
+    typename__: Optional[Literal['CreateSponsorshipsInput']] = Field(
+        'CreateSponsorshipsInput', alias='__typename'
+    )
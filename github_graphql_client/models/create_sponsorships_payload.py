@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateSponsorshipsPayload(BaseModel):
+    """
+    Autogenerated return type of CreateSponsorships
+    """
+
+    clientMutationId: Optional[String] = None
+    sponsorables: Optional[List[Sponsorable]] = Field(default_factory=list)
+    typename__: Optional[Literal['CreateSponsorshipsPayload']] = Field(
+        'CreateSponsorshipsPayload', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateTeamDiscussionCommentInput(BaseModel):
+    """
+    Autogenerated input type of CreateTeamDiscussionComment
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    discussionId: Optional[ID] = None
+    typename__: Optional[Literal['CreateTeamDiscussionCommentInput']] = Field(
+        'CreateTeamDiscussionCommentInput', alias='__typename'
+    )
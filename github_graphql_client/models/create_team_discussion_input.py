@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateTeamDiscussionInput(BaseModel):
+    """
+    Autogenerated input type of CreateTeamDiscussion
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    private: Optional[Boolean] = None
+    teamId: Optional[ID] = None
+    title: Optional[String] = None
+    typename__: Optional[Literal['CreateTeamDiscussionInput']] = Field(
+        'CreateTeamDiscussionInput', alias='__typename'
+    )
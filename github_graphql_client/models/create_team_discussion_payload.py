@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateTeamDiscussionPayload(BaseModel):
+    """
+    Autogenerated return type of CreateTeamDiscussion
+    """
+
+    clientMutationId: Optional[String] = None
+    teamDiscussion: Optional[TeamDiscussion] = None
+    typename__: Optional[Literal['CreateTeamDiscussionPayload']] = Field(
+        'CreateTeamDiscussionPayload', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateUserListInput(BaseModel):
+    """
+    Autogenerated input type of CreateUserList
+    """
+
+    clientMutationId: Optional[String] = None
+    description: Optional[String] = None
+    isPrivate: Optional[Boolean] = False
+    name: String
+    typename__: Optional[Literal['CreateUserListInput']] = Field(
+        'CreateUserListInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CreateUserListPayload(BaseModel):
+    """
+    Autogenerated return type of CreateUserList
+    """
+
+    clientMutationId: Optional[String] = None
+    list: Optional[UserList] = None
+    viewer: Optional[User] = None
+    typename__: Optional[Literal['CreateUserListPayload']] = Field(
+        'CreateUserListPayload', alias='__typename'
+    )
@@ -0,0 +1,19 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CVSS(BaseModel):
+    """
+    The Common Vulnerability Scoring System
+    """
+
+    score: Float
+    vectorString: Optional[String] = None
+    typename__: Optional[Literal['CVSS']] = Field('CVSS', alias='__typename')
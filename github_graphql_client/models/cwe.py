@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class CWE(Node):
+    """
+    A common weakness enumeration
+    """
+
+    cweId: String
+    description: String
+    id: ID
+    name: String
+    typename__: Optional[Literal['CWE']] = Field('CWE', alias='__typename')
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class CWEConnection(BaseModel):
+    """
+    The connection type for CWE.
+    """
+
+    edges: Optional[List[Optional[CWEEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[CWE]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['CWEConnection']] = Field(
+        'CWEConnection', alias='__typename'
+    )
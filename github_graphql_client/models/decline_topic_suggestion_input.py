@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeclineTopicSuggestionInput(BaseModel):
+    """
+    Autogenerated input type of DeclineTopicSuggestion
+    """
+
+    clientMutationId: Optional[String] = None
+    name: String
+    reason: TopicSuggestionDeclineReason
+    repositoryId: ID
+    typename__: Optional[Literal['DeclineTopicSuggestionInput']] = Field(
+        'DeclineTopicSuggestionInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteBranchProtectionRuleInput(BaseModel):
+    """
+    Autogenerated input type of DeleteBranchProtectionRule
+    """
+
+    branchProtectionRuleId: ID
+    clientMutationId: Optional[String] = None
+    typename__: Optional[Literal['DeleteBranchProtectionRuleInput']] = Field(
+        'DeleteBranchProtectionRuleInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteIpAllowListEntryInput(BaseModel):
+    """
+    Autogenerated input type of DeleteIpAllowListEntry
+    """
+
+    clientMutationId: Optional[String] = None
+    ipAllowListEntryId: ID
+    typename__: Optional[Literal['DeleteIpAllowListEntryInput']] = Field(
+        'DeleteIpAllowListEntryInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteIpAllowListEntryPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteIpAllowListEntry
+    """
+
+    clientMutationId: Optional[String] = None
+    ipAllowListEntry: Optional[IpAllowListEntry] = None
+    typename__: Optional[Literal['DeleteIpAllowListEntryPayload']] = Field(
+        'DeleteIpAllowListEntryPayload', alias='__typename'
+    )
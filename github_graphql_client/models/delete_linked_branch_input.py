@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteLinkedBranchInput(BaseModel):
+    """
+    Autogenerated input type of DeleteLinkedBranch
+    """
+
+    clientMutationId: Optional[String] = None
+    linkedBranchId: ID
+    typename__: Optional[Literal['DeleteLinkedBranchInput']] = Field(
+        'DeleteLinkedBranchInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteLinkedBranchPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteLinkedBranch
+    """
+
+    clientMutationId: Optional[String] = None
+    issue: Optional[Issue] = None
+    typename__: Optional[Literal['DeleteLinkedBranchPayload']] = Field(
+        'DeleteLinkedBranchPayload', alias='__typename'
+    )
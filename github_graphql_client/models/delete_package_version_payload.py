@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeletePackageVersionPayload(BaseModel):
+    """
+    Autogenerated return type of DeletePackageVersion
+    """
+
+    clientMutationId: Optional[String] = None
+    success: Optional[Boolean] = None
+    typename__: Optional[Literal['DeletePackageVersionPayload']] = Field(
+        'DeletePackageVersionPayload', alias='__typename'
+    )
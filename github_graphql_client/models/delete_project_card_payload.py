@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectCardPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteProjectCard
+    """
+
+    clientMutationId: Optional[String] = None
+    column: Optional[ProjectColumn] = None
+    deletedCardId: Optional[ID] = None
+    typename__: Optional[Literal['DeleteProjectCardPayload']] = Field(
+        'DeleteProjectCardPayload', alias='__typename'
+    )
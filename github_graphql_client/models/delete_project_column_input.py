@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectColumnInput(BaseModel):
+    """
+    Autogenerated input type of DeleteProjectColumn
+    """
+
+    clientMutationId: Optional[String] = None
+    columnId: ID
+    typename__: Optional[Literal['DeleteProjectColumnInput']] = Field(
+        'DeleteProjectColumnInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectColumnPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteProjectColumn
+    """
+
+    clientMutationId: Optional[String] = None
+    deletedColumnId: Optional[ID] = None
+    project: Optional[Project] = None
+    typename__: Optional[Literal['DeleteProjectColumnPayload']] = Field(
+        'DeleteProjectColumnPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteProject
+    """
+
+    clientMutationId: Optional[String] = None
+    owner: Optional[ProjectOwner] = None
+    typename__: Optional[Literal['DeleteProjectPayload']] = Field(
+        'DeleteProjectPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectV2FieldInput(BaseModel):
+    """
+    Autogenerated input type of DeleteProjectV2Field
+    """
+
+    clientMutationId: Optional[String] = None
+    fieldId: ID
+    typename__: Optional[Literal['DeleteProjectV2FieldInput']] = Field(
+        'DeleteProjectV2FieldInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectV2FieldPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteProjectV2Field
+    """
+
+    clientMutationId: Optional[String] = None
+    projectV2Field: Optional[ProjectV2FieldConfiguration] = None
+    typename__: Optional[Literal['DeleteProjectV2FieldPayload']] = Field(
+        'DeleteProjectV2FieldPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectV2ItemPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteProjectV2Item
+    """
+
+    clientMutationId: Optional[String] = None
+    deletedItemId: Optional[ID] = None
+    typename__: Optional[Literal['DeleteProjectV2ItemPayload']] = Field(
+        'DeleteProjectV2ItemPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectV2Payload(BaseModel):
+    """
+    Autogenerated return type of DeleteProjectV2
+    """
+
+    clientMutationId: Optional[String] = None
+    projectV2: Optional[ProjectV2] = None
+    typename__: Optional[Literal['DeleteProjectV2Payload']] = Field(
+        'DeleteProjectV2Payload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectV2WorkflowInput(BaseModel):
+    """
+    Autogenerated input type of DeleteProjectV2Workflow
+    """
+
+    clientMutationId: Optional[String] = None
+    workflowId: ID
+    typename__: Optional[Literal['DeleteProjectV2WorkflowInput']] = Field(
+        'DeleteProjectV2WorkflowInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteProjectV2WorkflowPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteProjectV2Workflow
+    """
+
+    clientMutationId: Optional[String] = None
+    deletedWorkflowId: Optional[ID] = None
+    projectV2: Optional[ProjectV2] = None
+    typename__: Optional[Literal['DeleteProjectV2WorkflowPayload']] = Field(
+        'DeleteProjectV2WorkflowPayload', alias='__typename'
+    )
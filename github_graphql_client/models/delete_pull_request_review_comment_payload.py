@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeletePullRequestReviewCommentPayload(BaseModel):
+    """
+    Autogenerated return type of DeletePullRequestReviewComment
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequestReview: Optional[PullRequestReview] = None
+    pullRequestReviewComment: Optional[PullRequestReviewComment] = None
+    typename__: Optional[
+        Literal['DeletePullRequestReviewCommentPayload']
+    ] = Field('DeletePullRequestReviewCommentPayload', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeletePullRequestReviewInput(BaseModel):
+    """
+    Autogenerated input type of DeletePullRequestReview
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequestReviewId: ID
+    typename__: Optional[Literal['DeletePullRequestReviewInput']] = Field(
+        'DeletePullRequestReviewInput', alias='__typename'
+    )
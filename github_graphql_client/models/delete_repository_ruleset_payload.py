@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteRepositoryRulesetPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteRepositoryRuleset
+    """
+
+    clientMutationId: Optional[String] = None
+    typename__: Optional[Literal['DeleteRepositoryRulesetPayload']] = Field(
+        'DeleteRepositoryRulesetPayload', alias='__typename'
+    )
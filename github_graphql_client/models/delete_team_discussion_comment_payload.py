@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteTeamDiscussionCommentPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteTeamDiscussionComment
+    """
+
+    clientMutationId: Optional[String] = None
+    typename__: Optional[
+        Literal['DeleteTeamDiscussionCommentPayload']
+    ] = Field('DeleteTeamDiscussionCommentPayload', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteUserListInput(BaseModel):
+    """
+    Autogenerated input type of DeleteUserList
+    """
+
+    clientMutationId: Optional[String] = None
+    listId: ID
+    typename__: Optional[Literal['DeleteUserListInput']] = Field(
+        'DeleteUserListInput', alias='__typename'
+    )
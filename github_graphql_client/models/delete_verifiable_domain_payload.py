@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeleteVerifiableDomainPayload(BaseModel):
+    """
+    Autogenerated return type of DeleteVerifiableDomain
+    """
+
+    clientMutationId: Optional[String] = None
+    owner: Optional[VerifiableDomainOwner] = None
+    typename__: Optional[Literal['DeleteVerifiableDomainPayload']] = Field(
+        'DeleteVerifiableDomainPayload', alias='__typename'
+    )
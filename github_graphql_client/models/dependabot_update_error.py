@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DependabotUpdateError(BaseModel):
+    """
+    An error produced from a Dependabot Update
+    """
+
+    body: String
+    errorType: String
+    title: String
+    typename__: Optional[Literal['DependabotUpdateError']] = Field(
+        'DependabotUpdateError', alias='__typename'
+    )
@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class DeployKey(Node):
+    """
+    A repository deploy key.
+    """
+
+    createdAt: DateTime
+    id: ID
+    key: String
+    readOnly: Boolean
+    title: String
+    verified: Boolean
+    typename__: Optional[Literal['DeployKey']] = Field(
+        'DeployKey', alias='__typename'
+    )
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeployKeyConnection(BaseModel):
+    """
+    The connection type for DeployKey.
+    """
+
+    edges: Optional[List[Optional[DeployKeyEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[DeployKey]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['DeployKeyConnection']] = Field(
+        'DeployKeyConnection', alias='__typename'
+    )
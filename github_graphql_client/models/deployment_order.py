@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DeploymentOrder(BaseModel):
+    """
+    Ordering options for deployment connections
+    """
+
+    direction: OrderDirection
+    field: DeploymentOrderField
+    typename__: Optional[Literal['DeploymentOrder']] = Field(
+        'DeploymentOrder', alias='__typename'
+    )
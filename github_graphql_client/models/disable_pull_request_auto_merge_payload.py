@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DisablePullRequestAutoMergePayload(BaseModel):
+    """
+    Autogenerated return type of DisablePullRequestAutoMerge
+    """
+
+    actor: Optional[Actor] = None
+    clientMutationId: Optional[String] = None
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[
+        Literal['DisablePullRequestAutoMergePayload']
+    ] = Field('DisablePullRequestAutoMergePayload', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DiscussionPollOptionOrder(BaseModel):
+    """
+    Ordering options for discussion poll option connections.
+    """
+
+    direction: OrderDirection
+    field: DiscussionPollOptionOrderField
+    typename__: Optional[Literal['DiscussionPollOptionOrder']] = Field(
+        'DiscussionPollOptionOrder', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DismissPullRequestReviewInput(BaseModel):
+    """
+    Autogenerated input type of DismissPullRequestReview
+    """
+
+    clientMutationId: Optional[String] = None
+    message: String
+    pullRequestReviewId: ID
+    typename__: Optional[Literal['DismissPullRequestReviewInput']] = Field(
+        'DismissPullRequestReviewInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DismissPullRequestReviewPayload(BaseModel):
+    """
+    Autogenerated return type of DismissPullRequestReview
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequestReview: Optional[PullRequestReview] = None
+    typename__: Optional[Literal['DismissPullRequestReviewPayload']] = Field(
+        'DismissPullRequestReviewPayload', alias='__typename'
+    )
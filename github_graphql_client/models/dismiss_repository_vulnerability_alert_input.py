@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DismissRepositoryVulnerabilityAlertInput(BaseModel):
+    """
+    Autogenerated input type of DismissRepositoryVulnerabilityAlert
+    """
+
+    clientMutationId: Optional[String] = None
+    dismissReason: DismissReason
+    repositoryVulnerabilityAlertId: ID
+    typename__: Optional[
+        Literal['DismissRepositoryVulnerabilityAlertInput']
+    ] = Field('DismissRepositoryVulnerabilityAlertInput', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DismissRepositoryVulnerabilityAlertPayload(BaseModel):
+    """
+    Autogenerated return type of DismissRepositoryVulnerabilityAlert
+    """
+
+    clientMutationId: Optional[String] = None
+    repositoryVulnerabilityAlert: Optional[RepositoryVulnerabilityAlert] = None
+    typename__: Optional[
+        Literal['DismissRepositoryVulnerabilityAlertPayload']
+    ] = Field('DismissRepositoryVulnerabilityAlertPayload', alias='__typename')
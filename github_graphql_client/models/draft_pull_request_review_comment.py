@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DraftPullRequestReviewComment(BaseModel):
+    """
+    Specifies a review comment to be left with a Pull Request Review.
+    """
+
+    body: String
+    path: String
+    position: Int
+    typename__: Optional[Literal['DraftPullRequestReviewComment']] = Field(
+        'DraftPullRequestReviewComment', alias='__typename'
+    )
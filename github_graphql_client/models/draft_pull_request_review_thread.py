@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class DraftPullRequestReviewThread(BaseModel):
+    """
+    Specifies a review comment thread to be left with a Pull Request Review.
+    """
+
+    body: String
+    line: Int
+    path: String
+    side: Optional[DiffSide] = 'RIGHT'
+    startLine: Optional[Int] = None
+    startSide: Optional[DiffSide] = 'RIGHT'
+    typename__: Optional[Literal['DraftPullRequestReviewThread']] = Field(
+        'DraftPullRequestReviewThread', alias='__typename'
+    )
@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnablePullRequestAutoMergeInput(BaseModel):
+    """
+    Autogenerated input type of EnablePullRequestAutoMerge
+    """
+
+    authorEmail: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    commitBody: Optional[String] = None
+    commitHeadline: Optional[String] = None
+    expectedHeadOid: Optional[GitObjectID] = None
+    mergeMethod: Optional[PullRequestMergeMethod] = 'MERGE'
+    pullRequestId: ID
+    typename__: Optional[Literal['EnablePullRequestAutoMergeInput']] = Field(
+        'EnablePullRequestAutoMergeInput', alias='__typename'
+    )
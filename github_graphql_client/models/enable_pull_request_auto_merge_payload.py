@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnablePullRequestAutoMergePayload(BaseModel):
+    """
+    Autogenerated return type of EnablePullRequestAutoMerge
+    """
+
+    actor: Optional[Actor] = None
+    clientMutationId: Optional[String] = None
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['EnablePullRequestAutoMergePayload']] = Field(
+        'EnablePullRequestAutoMergePayload', alias='__typename'
+    )
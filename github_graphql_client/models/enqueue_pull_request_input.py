@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnqueuePullRequestInput(BaseModel):
+    """
+    Autogenerated input type of EnqueuePullRequest
+    """
+
+    clientMutationId: Optional[String] = None
+    expectedHeadOid: Optional[GitObjectID] = None
+    jump: Optional[Boolean] = None
+    pullRequestId: ID
+    typename__: Optional[Literal['EnqueuePullRequestInput']] = Field(
+        'EnqueuePullRequestInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnterpriseAdministratorInvitationOrder(BaseModel):
+    """
+    Ordering options for enterprise administrator invitation connections
+    """
+
+    direction: OrderDirection
+    field: EnterpriseAdministratorInvitationOrderField
+    typename__: Optional[
+        Literal['EnterpriseAdministratorInvitationOrder']
+    ] = Field('EnterpriseAdministratorInvitationOrder', alias='__typename')
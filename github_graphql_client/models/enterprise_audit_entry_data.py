@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnterpriseAuditEntryData(BaseModel):
+    """
+    Metadata for an audit entry containing enterprise account information.
+    """
+
+    enterpriseResourcePath: Optional[URI] = None
+    enterpriseSlug: Optional[String] = None
+    enterpriseUrl: Optional[URI] = None
+    typename__: Optional[Literal['EnterpriseAuditEntryData']] = Field(
+        'EnterpriseAuditEntryData', alias='__typename'
+    )
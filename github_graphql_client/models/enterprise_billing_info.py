@@ -0,0 +1,29 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnterpriseBillingInfo(BaseModel):
+    """
+    Enterprise billing information visible to enterprise billing managers and owners.
+    """
+
+    allLicensableUsersCount: Int
+    assetPacks: Int
+    bandwidthQuota: Float
+    bandwidthUsage: Float
+    bandwidthUsagePercentage: Int
+    storageQuota: Float
+    storageUsage: Float
+    storageUsagePercentage: Int
+    totalAvailableLicenses: Int
+    totalLicenses: Int
+    typename__: Optional[Literal['EnterpriseBillingInfo']] = Field(
+        'EnterpriseBillingInfo', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnterpriseMemberOrder(BaseModel):
+    """
+    Ordering options for enterprise member connections.
+    """
+
+    direction: OrderDirection
+    field: EnterpriseMemberOrderField
+    typename__: Optional[Literal['EnterpriseMemberOrder']] = Field(
+        'EnterpriseMemberOrder', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnterpriseOrder(BaseModel):
+    """
+    Ordering options for enterprises.
+    """
+
+    direction: OrderDirection
+    field: EnterpriseOrderField
+    typename__: Optional[Literal['EnterpriseOrder']] = Field(
+        'EnterpriseOrder', alias='__typename'
+    )
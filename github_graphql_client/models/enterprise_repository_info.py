@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class EnterpriseRepositoryInfo(Node):
+    """
+    A subset of repository information queryable from an enterprise.
+    """
+
+    id: ID
+    isPrivate: Boolean
+    name: String
+    nameWithOwner: String
+    typename__: Optional[Literal['EnterpriseRepositoryInfo']] = Field(
+        'EnterpriseRepositoryInfo', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnterpriseRepositoryInfoEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[EnterpriseRepositoryInfo] = None
+    typename__: Optional[Literal['EnterpriseRepositoryInfoEdge']] = Field(
+        'EnterpriseRepositoryInfoEdge', alias='__typename'
+    )
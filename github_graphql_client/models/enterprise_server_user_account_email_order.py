@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnterpriseServerUserAccountEmailOrder(BaseModel):
+    """
+    Ordering options for Enterprise Server user account email connections.
+    """
+
+    direction: OrderDirection
+    field: EnterpriseServerUserAccountEmailOrderField
+    typename__: Optional[
+        Literal['EnterpriseServerUserAccountEmailOrder']
+    ] = Field('EnterpriseServerUserAccountEmailOrder', alias='__typename')
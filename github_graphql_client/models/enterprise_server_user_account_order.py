@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnterpriseServerUserAccountOrder(BaseModel):
+    """
+    Ordering options for Enterprise Server user account connections.
+    """
+
+    direction: OrderDirection
+    field: EnterpriseServerUserAccountOrderField
+    typename__: Optional[Literal['EnterpriseServerUserAccountOrder']] = Field(
+        'EnterpriseServerUserAccountOrder', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class EnterpriseServerUserAccountsUploadOrder(BaseModel):
+    """
+    Ordering options for Enterprise Server user accounts upload connections.
+    """
+
+    direction: OrderDirection
+    field: EnterpriseServerUserAccountsUploadOrderField
+    typename__: Optional[
+        Literal['EnterpriseServerUserAccountsUploadOrder']
+    ] = Field('EnterpriseServerUserAccountsUploadOrder', alias='__typename')
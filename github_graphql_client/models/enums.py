@@ -0,0 +1,2653 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from enum import Enum
+
+
+class ActorType(Enum):
+    """
+    The actor's type.
+    """
+
+    TEAM = 'TEAM'
+    USER = 'USER'
+
+
+class AuditLogOrderField(Enum):
+    """
+    Properties by which Audit Log connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class CheckAnnotationLevel(Enum):
+    """
+    Represents an annotation's information level.
+    """
+
+    FAILURE = 'FAILURE'
+    NOTICE = 'NOTICE'
+    WARNING = 'WARNING'
+
+
+class CheckConclusionState(Enum):
+    """
+    The possible states for a check suite or run conclusion.
+    """
+
+    ACTION_REQUIRED = 'ACTION_REQUIRED'
+    CANCELLED = 'CANCELLED'
+    FAILURE = 'FAILURE'
+    NEUTRAL = 'NEUTRAL'
+    SKIPPED = 'SKIPPED'
+    STALE = 'STALE'
+    STARTUP_FAILURE = 'STARTUP_FAILURE'
+    SUCCESS = 'SUCCESS'
+    TIMED_OUT = 'TIMED_OUT'
+
+
+class CheckRunState(Enum):
+    """
+    The possible states of a check run in a status rollup.
+    """
+
+    ACTION_REQUIRED = 'ACTION_REQUIRED'
+    CANCELLED = 'CANCELLED'
+    COMPLETED = 'COMPLETED'
+    FAILURE = 'FAILURE'
+    IN_PROGRESS = 'IN_PROGRESS'
+    NEUTRAL = 'NEUTRAL'
+    PENDING = 'PENDING'
+    QUEUED = 'QUEUED'
+    SKIPPED = 'SKIPPED'
+    STALE = 'STALE'
+    STARTUP_FAILURE = 'STARTUP_FAILURE'
+    SUCCESS = 'SUCCESS'
+    TIMED_OUT = 'TIMED_OUT'
+    WAITING = 'WAITING'
+
+
+class CheckRunType(Enum):
+    """
+    The possible types of check runs.
+    """
+
+    ALL = 'ALL'
+    LATEST = 'LATEST'
+
+
+class CheckStatusState(Enum):
+    """
+    The possible states for a check suite or run status.
+    """
+
+    COMPLETED = 'COMPLETED'
+    IN_PROGRESS = 'IN_PROGRESS'
+    PENDING = 'PENDING'
+    QUEUED = 'QUEUED'
+    REQUESTED = 'REQUESTED'
+    WAITING = 'WAITING'
+
+
+class CollaboratorAffiliation(Enum):
+    """
+    Collaborators affiliation level with a subject.
+    """
+
+    ALL = 'ALL'
+    DIRECT = 'DIRECT'
+    OUTSIDE = 'OUTSIDE'
+
+
+class CommentAuthorAssociation(Enum):
+    """
+    A comment author association with repository.
+    """
+
+    COLLABORATOR = 'COLLABORATOR'
+    CONTRIBUTOR = 'CONTRIBUTOR'
+    FIRST_TIMER = 'FIRST_TIMER'
+    FIRST_TIME_CONTRIBUTOR = 'FIRST_TIME_CONTRIBUTOR'
+    MANNEQUIN = 'MANNEQUIN'
+    MEMBER = 'MEMBER'
+    NONE = 'NONE'
+    OWNER = 'OWNER'
+
+
+class CommentCannotUpdateReason(Enum):
+    """
+    The possible errors that will prevent a user from updating a comment.
+    """
+
+    ARCHIVED = 'ARCHIVED'
+    DENIED = 'DENIED'
+    INSUFFICIENT_ACCESS = 'INSUFFICIENT_ACCESS'
+    LOCKED = 'LOCKED'
+    LOGIN_REQUIRED = 'LOGIN_REQUIRED'
+    MAINTENANCE = 'MAINTENANCE'
+    VERIFIED_EMAIL_REQUIRED = 'VERIFIED_EMAIL_REQUIRED'
+
+
+class CommitContributionOrderField(Enum):
+    """
+    Properties by which commit contribution connections can be ordered.
+    """
+
+    COMMIT_COUNT = 'COMMIT_COUNT'
+    OCCURRED_AT = 'OCCURRED_AT'
+
+
+class ComparisonStatus(Enum):
+    """
+    The status of a git comparison between two refs.
+    """
+
+    AHEAD = 'AHEAD'
+    BEHIND = 'BEHIND'
+    DIVERGED = 'DIVERGED'
+    IDENTICAL = 'IDENTICAL'
+
+
+class ContributionLevel(Enum):
+    """
+    Varying levels of contributions from none to many.
+    """
+
+    FIRST_QUARTILE = 'FIRST_QUARTILE'
+    FOURTH_QUARTILE = 'FOURTH_QUARTILE'
+    NONE = 'NONE'
+    SECOND_QUARTILE = 'SECOND_QUARTILE'
+    THIRD_QUARTILE = 'THIRD_QUARTILE'
+
+
+class DefaultRepositoryPermissionField(Enum):
+    """
+    The possible base permissions for repositories.
+    """
+
+    ADMIN = 'ADMIN'
+    NONE = 'NONE'
+    READ = 'READ'
+    WRITE = 'WRITE'
+
+
+class DependencyGraphEcosystem(Enum):
+    """
+    The possible ecosystems of a dependency graph package.
+    """
+
+    ACTIONS = 'ACTIONS'
+    COMPOSER = 'COMPOSER'
+    GO = 'GO'
+    MAVEN = 'MAVEN'
+    NPM = 'NPM'
+    NUGET = 'NUGET'
+    PIP = 'PIP'
+    PUB = 'PUB'
+    RUBYGEMS = 'RUBYGEMS'
+    RUST = 'RUST'
+    SWIFT = 'SWIFT'
+
+
+class DeploymentOrderField(Enum):
+    """
+    Properties by which deployment connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class DeploymentProtectionRuleType(Enum):
+    """
+    The possible protection rule types.
+    """
+
+    REQUIRED_REVIEWERS = 'REQUIRED_REVIEWERS'
+    WAIT_TIMER = 'WAIT_TIMER'
+
+
+class DeploymentReviewState(Enum):
+    """
+    The possible states for a deployment review.
+    """
+
+    APPROVED = 'APPROVED'
+    REJECTED = 'REJECTED'
+
+
+class DeploymentState(Enum):
+    """
+    The possible states in which a deployment can be.
+    """
+
+    ABANDONED = 'ABANDONED'
+    ACTIVE = 'ACTIVE'
+    DESTROYED = 'DESTROYED'
+    ERROR = 'ERROR'
+    FAILURE = 'FAILURE'
+    INACTIVE = 'INACTIVE'
+    IN_PROGRESS = 'IN_PROGRESS'
+    PENDING = 'PENDING'
+    QUEUED = 'QUEUED'
+    SUCCESS = 'SUCCESS'
+    WAITING = 'WAITING'
+
+
+class DeploymentStatusState(Enum):
+    """
+    The possible states for a deployment status.
+    """
+
+    ERROR = 'ERROR'
+    FAILURE = 'FAILURE'
+    INACTIVE = 'INACTIVE'
+    IN_PROGRESS = 'IN_PROGRESS'
+    PENDING = 'PENDING'
+    QUEUED = 'QUEUED'
+    SUCCESS = 'SUCCESS'
+    WAITING = 'WAITING'
+
+
+class DiffSide(Enum):
+    """
+    The possible sides of a diff.
+    """
+
+    LEFT = 'LEFT'
+    RIGHT = 'RIGHT'
+
+
+class DiscussionCloseReason(Enum):
+    """
+    The possible reasons for closing a discussion.
+    """
+
+    DUPLICATE = 'DUPLICATE'
+    OUTDATED = 'OUTDATED'
+    RESOLVED = 'RESOLVED'
+
+
+class DiscussionOrderField(Enum):
+    """
+    Properties by which discussion connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class DiscussionPollOptionOrderField(Enum):
+    """
+    Properties by which discussion poll option connections can be ordered.
+    """
+
+    AUTHORED_ORDER = 'AUTHORED_ORDER'
+    VOTE_COUNT = 'VOTE_COUNT'
+
+
+class DiscussionState(Enum):
+    """
+    The possible states of a discussion.
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+
+class DiscussionStateReason(Enum):
+    """
+    The possible state reasons of a discussion.
+    """
+
+    DUPLICATE = 'DUPLICATE'
+    OUTDATED = 'OUTDATED'
+    REOPENED = 'REOPENED'
+    RESOLVED = 'RESOLVED'
+
+
+class DismissReason(Enum):
+    """
+    The possible reasons that a Dependabot alert was dismissed.
+    """
+
+    FIX_STARTED = 'FIX_STARTED'
+    INACCURATE = 'INACCURATE'
+    NOT_USED = 'NOT_USED'
+    NO_BANDWIDTH = 'NO_BANDWIDTH'
+    TOLERABLE_RISK = 'TOLERABLE_RISK'
+
+
+class EnterpriseAdministratorInvitationOrderField(Enum):
+    """
+    Properties by which enterprise administrator invitation connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class EnterpriseAdministratorRole(Enum):
+    """
+    The possible administrator roles in an enterprise account.
+    """
+
+    BILLING_MANAGER = 'BILLING_MANAGER'
+    OWNER = 'OWNER'
+
+
+class EnterpriseAllowPrivateRepositoryForkingPolicyValue(Enum):
+    """
+    The possible values for the enterprise allow private repository forking policy value.
+    """
+
+    ENTERPRISE_ORGANIZATIONS = 'ENTERPRISE_ORGANIZATIONS'
+    ENTERPRISE_ORGANIZATIONS_USER_ACCOUNTS = (
+        'ENTERPRISE_ORGANIZATIONS_USER_ACCOUNTS'
+    )
+    EVERYWHERE = 'EVERYWHERE'
+    SAME_ORGANIZATION = 'SAME_ORGANIZATION'
+    SAME_ORGANIZATION_USER_ACCOUNTS = 'SAME_ORGANIZATION_USER_ACCOUNTS'
+    USER_ACCOUNTS = 'USER_ACCOUNTS'
+
+
+class EnterpriseDefaultRepositoryPermissionSettingValue(Enum):
+    """
+    The possible values for the enterprise base repository permission setting.
+    """
+
+    ADMIN = 'ADMIN'
+    NONE = 'NONE'
+    NO_POLICY = 'NO_POLICY'
+    READ = 'READ'
+    WRITE = 'WRITE'
+
+
+class EnterpriseEnabledDisabledSettingValue(Enum):
+    """
+    The possible values for an enabled/disabled enterprise setting.
+    """
+
+    DISABLED = 'DISABLED'
+    ENABLED = 'ENABLED'
+    NO_POLICY = 'NO_POLICY'
+
+
+class EnterpriseEnabledSettingValue(Enum):
+    """
+    The possible values for an enabled/no policy enterprise setting.
+    """
+
+    ENABLED = 'ENABLED'
+    NO_POLICY = 'NO_POLICY'
+
+
+class EnterpriseMemberOrderField(Enum):
+    """
+    Properties by which enterprise member connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    LOGIN = 'LOGIN'
+
+
+class EnterpriseMembersCanCreateRepositoriesSettingValue(Enum):
+    """
+    The possible values for the enterprise members can create repositories setting.
+    """
+
+    ALL = 'ALL'
+    DISABLED = 'DISABLED'
+    NO_POLICY = 'NO_POLICY'
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class EnterpriseMembersCanMakePurchasesSettingValue(Enum):
+    """
+    The possible values for the members can make purchases setting.
+    """
+
+    DISABLED = 'DISABLED'
+    ENABLED = 'ENABLED'
+
+
+class EnterpriseMembershipType(Enum):
+    """
+    The possible values we have for filtering Platform::Objects::User#enterprises.
+    """
+
+    ADMIN = 'ADMIN'
+    ALL = 'ALL'
+    BILLING_MANAGER = 'BILLING_MANAGER'
+    ORG_MEMBERSHIP = 'ORG_MEMBERSHIP'
+
+
+class EnterpriseOrderField(Enum):
+    """
+    Properties by which enterprise connections can be ordered.
+    """
+
+    NAME = 'NAME'
+
+
+class EnterpriseServerInstallationOrderField(Enum):
+    """
+    Properties by which Enterprise Server installation connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    CUSTOMER_NAME = 'CUSTOMER_NAME'
+    HOST_NAME = 'HOST_NAME'
+
+
+class EnterpriseServerUserAccountEmailOrderField(Enum):
+    """
+    Properties by which Enterprise Server user account email connections can be ordered.
+    """
+
+    EMAIL = 'EMAIL'
+
+
+class EnterpriseServerUserAccountOrderField(Enum):
+    """
+    Properties by which Enterprise Server user account connections can be ordered.
+    """
+
+    LOGIN = 'LOGIN'
+    REMOTE_CREATED_AT = 'REMOTE_CREATED_AT'
+
+
+class EnterpriseServerUserAccountsUploadOrderField(Enum):
+    """
+    Properties by which Enterprise Server user accounts upload connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class EnterpriseServerUserAccountsUploadSyncState(Enum):
+    """
+    Synchronization state of the Enterprise Server user accounts upload
+    """
+
+    FAILURE = 'FAILURE'
+    PENDING = 'PENDING'
+    SUCCESS = 'SUCCESS'
+
+
+class EnterpriseUserAccountMembershipRole(Enum):
+    """
+    The possible roles for enterprise membership.
+    """
+
+    MEMBER = 'MEMBER'
+    OWNER = 'OWNER'
+    UNAFFILIATED = 'UNAFFILIATED'
+
+
+class EnterpriseUserDeployment(Enum):
+    """
+    The possible GitHub Enterprise deployments where this user can exist.
+    """
+
+    CLOUD = 'CLOUD'
+    SERVER = 'SERVER'
+
+
+class EnvironmentOrderField(Enum):
+    """
+    Properties by which environments connections can be ordered
+    """
+
+    NAME = 'NAME'
+
+
+class FileViewedState(Enum):
+    """
+    The possible viewed states of a file .
+    """
+
+    DISMISSED = 'DISMISSED'
+    UNVIEWED = 'UNVIEWED'
+    VIEWED = 'VIEWED'
+
+
+class FundingPlatform(Enum):
+    """
+    The possible funding platforms for repository funding links.
+    """
+
+    COMMUNITY_BRIDGE = 'COMMUNITY_BRIDGE'
+    CUSTOM = 'CUSTOM'
+    GITHUB = 'GITHUB'
+    ISSUEHUNT = 'ISSUEHUNT'
+    KO_FI = 'KO_FI'
+    LFX_CROWDFUNDING = 'LFX_CROWDFUNDING'
+    LIBERAPAY = 'LIBERAPAY'
+    OPEN_COLLECTIVE = 'OPEN_COLLECTIVE'
+    OTECHIE = 'OTECHIE'
+    PATREON = 'PATREON'
+    TIDELIFT = 'TIDELIFT'
+
+
+class GistOrderField(Enum):
+    """
+    Properties by which gist connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    PUSHED_AT = 'PUSHED_AT'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class GistPrivacy(Enum):
+    """
+    The privacy of a Gist
+    """
+
+    ALL = 'ALL'
+    PUBLIC = 'PUBLIC'
+    SECRET = 'SECRET'
+
+
+class GitSignatureState(Enum):
+    """
+    The state of a Git signature.
+    """
+
+    BAD_CERT = 'BAD_CERT'
+    BAD_EMAIL = 'BAD_EMAIL'
+    EXPIRED_KEY = 'EXPIRED_KEY'
+    GPGVERIFY_ERROR = 'GPGVERIFY_ERROR'
+    GPGVERIFY_UNAVAILABLE = 'GPGVERIFY_UNAVAILABLE'
+    INVALID = 'INVALID'
+    MALFORMED_SIG = 'MALFORMED_SIG'
+    NOT_SIGNING_KEY = 'NOT_SIGNING_KEY'
+    NO_USER = 'NO_USER'
+    OCSP_ERROR = 'OCSP_ERROR'
+    OCSP_PENDING = 'OCSP_PENDING'
+    OCSP_REVOKED = 'OCSP_REVOKED'
+    UNKNOWN_KEY = 'UNKNOWN_KEY'
+    UNKNOWN_SIG_TYPE = 'UNKNOWN_SIG_TYPE'
+    UNSIGNED = 'UNSIGNED'
+    UNVERIFIED_EMAIL = 'UNVERIFIED_EMAIL'
+    VALID = 'VALID'
+
+
+class IdentityProviderConfigurationState(Enum):
+    """
+    The possible states in which authentication can be configured with an identity provider.
+    """
+
+    CONFIGURED = 'CONFIGURED'
+    ENFORCED = 'ENFORCED'
+    UNCONFIGURED = 'UNCONFIGURED'
+
+
+class IpAllowListEnabledSettingValue(Enum):
+    """
+    The possible values for the IP allow list enabled setting.
+    """
+
+    DISABLED = 'DISABLED'
+    ENABLED = 'ENABLED'
+
+
+class IpAllowListEntryOrderField(Enum):
+    """
+    Properties by which IP allow list entry connections can be ordered.
+    """
+
+    ALLOW_LIST_VALUE = 'ALLOW_LIST_VALUE'
+    CREATED_AT = 'CREATED_AT'
+
+
+class IpAllowListForInstalledAppsEnabledSettingValue(Enum):
+    """
+    The possible values for the IP allow list configuration for installed GitHub Apps setting.
+    """
+
+    DISABLED = 'DISABLED'
+    ENABLED = 'ENABLED'
+
+
+class IssueClosedStateReason(Enum):
+    """
+    The possible state reasons of a closed issue.
+    """
+
+    COMPLETED = 'COMPLETED'
+    NOT_PLANNED = 'NOT_PLANNED'
+
+
+class IssueCommentOrderField(Enum):
+    """
+    Properties by which issue comment connections can be ordered.
+    """
+
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class IssueOrderField(Enum):
+    """
+    Properties by which issue connections can be ordered.
+    """
+
+    COMMENTS = 'COMMENTS'
+    CREATED_AT = 'CREATED_AT'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class IssueState(Enum):
+    """
+    The possible states of an issue.
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+
+class IssueStateReason(Enum):
+    """
+    The possible state reasons of an issue.
+    """
+
+    COMPLETED = 'COMPLETED'
+    NOT_PLANNED = 'NOT_PLANNED'
+    REOPENED = 'REOPENED'
+
+
+class IssueTimelineItemsItemType(Enum):
+    """
+    The possible item types found in a timeline.
+    """
+
+    ADDED_TO_PROJECT_EVENT = 'ADDED_TO_PROJECT_EVENT'
+    ASSIGNED_EVENT = 'ASSIGNED_EVENT'
+    CLOSED_EVENT = 'CLOSED_EVENT'
+    COMMENT_DELETED_EVENT = 'COMMENT_DELETED_EVENT'
+    CONNECTED_EVENT = 'CONNECTED_EVENT'
+    CONVERTED_NOTE_TO_ISSUE_EVENT = 'CONVERTED_NOTE_TO_ISSUE_EVENT'
+    CONVERTED_TO_DISCUSSION_EVENT = 'CONVERTED_TO_DISCUSSION_EVENT'
+    CROSS_REFERENCED_EVENT = 'CROSS_REFERENCED_EVENT'
+    DEMILESTONED_EVENT = 'DEMILESTONED_EVENT'
+    DISCONNECTED_EVENT = 'DISCONNECTED_EVENT'
+    ISSUE_COMMENT = 'ISSUE_COMMENT'
+    LABELED_EVENT = 'LABELED_EVENT'
+    LOCKED_EVENT = 'LOCKED_EVENT'
+    MARKED_AS_DUPLICATE_EVENT = 'MARKED_AS_DUPLICATE_EVENT'
+    MENTIONED_EVENT = 'MENTIONED_EVENT'
+    MILESTONED_EVENT = 'MILESTONED_EVENT'
+    MOVED_COLUMNS_IN_PROJECT_EVENT = 'MOVED_COLUMNS_IN_PROJECT_EVENT'
+    PINNED_EVENT = 'PINNED_EVENT'
+    REFERENCED_EVENT = 'REFERENCED_EVENT'
+    REMOVED_FROM_PROJECT_EVENT = 'REMOVED_FROM_PROJECT_EVENT'
+    RENAMED_TITLE_EVENT = 'RENAMED_TITLE_EVENT'
+    REOPENED_EVENT = 'REOPENED_EVENT'
+    SUBSCRIBED_EVENT = 'SUBSCRIBED_EVENT'
+    TRANSFERRED_EVENT = 'TRANSFERRED_EVENT'
+    UNASSIGNED_EVENT = 'UNASSIGNED_EVENT'
+    UNLABELED_EVENT = 'UNLABELED_EVENT'
+    UNLOCKED_EVENT = 'UNLOCKED_EVENT'
+    UNMARKED_AS_DUPLICATE_EVENT = 'UNMARKED_AS_DUPLICATE_EVENT'
+    UNPINNED_EVENT = 'UNPINNED_EVENT'
+    UNSUBSCRIBED_EVENT = 'UNSUBSCRIBED_EVENT'
+    USER_BLOCKED_EVENT = 'USER_BLOCKED_EVENT'
+
+
+class LabelOrderField(Enum):
+    """
+    Properties by which label connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    NAME = 'NAME'
+
+
+class LanguageOrderField(Enum):
+    """
+    Properties by which language connections can be ordered.
+    """
+
+    SIZE = 'SIZE'
+
+
+class LockReason(Enum):
+    """
+    The possible reasons that an issue or pull request was locked.
+    """
+
+    OFF_TOPIC = 'OFF_TOPIC'
+    RESOLVED = 'RESOLVED'
+    SPAM = 'SPAM'
+    TOO_HEATED = 'TOO_HEATED'
+
+
+class MannequinOrderField(Enum):
+    """
+    Properties by which mannequins can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    LOGIN = 'LOGIN'
+
+
+class MergeCommitMessage(Enum):
+    """
+    The possible default commit messages for merges.
+    """
+
+    BLANK = 'BLANK'
+    PR_BODY = 'PR_BODY'
+    PR_TITLE = 'PR_TITLE'
+
+
+class MergeCommitTitle(Enum):
+    """
+    The possible default commit titles for merges.
+    """
+
+    MERGE_MESSAGE = 'MERGE_MESSAGE'
+    PR_TITLE = 'PR_TITLE'
+
+
+class MergeQueueEntryState(Enum):
+    """
+    The possible states for a merge queue entry.
+    """
+
+    AWAITING_CHECKS = 'AWAITING_CHECKS'
+    LOCKED = 'LOCKED'
+    MERGEABLE = 'MERGEABLE'
+    QUEUED = 'QUEUED'
+    UNMERGEABLE = 'UNMERGEABLE'
+
+
+class MergeQueueMergingStrategy(Enum):
+    """
+    The possible merging strategies for a merge queue.
+    """
+
+    ALLGREEN = 'ALLGREEN'
+    HEADGREEN = 'HEADGREEN'
+
+
+class MergeStateStatus(Enum):
+    """
+    Detailed status information about a pull request merge.
+    """
+
+    BEHIND = 'BEHIND'
+    BLOCKED = 'BLOCKED'
+    CLEAN = 'CLEAN'
+    DIRTY = 'DIRTY'
+    DRAFT = 'DRAFT'
+    HAS_HOOKS = 'HAS_HOOKS'
+    UNKNOWN = 'UNKNOWN'
+    UNSTABLE = 'UNSTABLE'
+
+
+class MergeableState(Enum):
+    """
+    Whether or not a PullRequest can be merged.
+    """
+
+    CONFLICTING = 'CONFLICTING'
+    MERGEABLE = 'MERGEABLE'
+    UNKNOWN = 'UNKNOWN'
+
+
+class MigrationSourceType(Enum):
+    """
+    Represents the different GitHub Enterprise Importer (GEI) migration sources.
+    """
+
+    AZURE_DEVOPS = 'AZURE_DEVOPS'
+    BITBUCKET_SERVER = 'BITBUCKET_SERVER'
+    GITHUB_ARCHIVE = 'GITHUB_ARCHIVE'
+
+
+class MigrationState(Enum):
+    """
+    The GitHub Enterprise Importer (GEI) migration state.
+    """
+
+    FAILED = 'FAILED'
+    FAILED_VALIDATION = 'FAILED_VALIDATION'
+    IN_PROGRESS = 'IN_PROGRESS'
+    NOT_STARTED = 'NOT_STARTED'
+    PENDING_VALIDATION = 'PENDING_VALIDATION'
+    QUEUED = 'QUEUED'
+    SUCCEEDED = 'SUCCEEDED'
+
+
+class MilestoneOrderField(Enum):
+    """
+    Properties by which milestone connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    DUE_DATE = 'DUE_DATE'
+    NUMBER = 'NUMBER'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class MilestoneState(Enum):
+    """
+    The possible states of a milestone.
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+
+class NotificationRestrictionSettingValue(Enum):
+    """
+    The possible values for the notification restriction setting.
+    """
+
+    DISABLED = 'DISABLED'
+    ENABLED = 'ENABLED'
+
+
+class OIDCProviderType(Enum):
+    """
+    The OIDC identity provider type
+    """
+
+    AAD = 'AAD'
+
+
+class OauthApplicationCreateAuditEntryState(Enum):
+    """
+    The state of an OAuth application when it was created.
+    """
+
+    ACTIVE = 'ACTIVE'
+    PENDING_DELETION = 'PENDING_DELETION'
+    SUSPENDED = 'SUSPENDED'
+
+
+class OperationType(Enum):
+    """
+    The corresponding operation type for the action
+    """
+
+    ACCESS = 'ACCESS'
+    AUTHENTICATION = 'AUTHENTICATION'
+    CREATE = 'CREATE'
+    MODIFY = 'MODIFY'
+    REMOVE = 'REMOVE'
+    RESTORE = 'RESTORE'
+    TRANSFER = 'TRANSFER'
+
+
+class OrderDirection(Enum):
+    """
+    Possible directions in which to order a list of items when provided an `orderBy` argument.
+    """
+
+    ASC = 'ASC'
+    DESC = 'DESC'
+
+
+class OrgAddMemberAuditEntryPermission(Enum):
+    """
+    The permissions available to members on an Organization.
+    """
+
+    ADMIN = 'ADMIN'
+    READ = 'READ'
+
+
+class OrgCreateAuditEntryBillingPlan(Enum):
+    """
+    The billing plans available for organizations.
+    """
+
+    BUSINESS = 'BUSINESS'
+    BUSINESS_PLUS = 'BUSINESS_PLUS'
+    FREE = 'FREE'
+    TIERED_PER_SEAT = 'TIERED_PER_SEAT'
+    UNLIMITED = 'UNLIMITED'
+
+
+class OrgEnterpriseOwnerOrderField(Enum):
+    """
+    Properties by which enterprise owners can be ordered.
+    """
+
+    LOGIN = 'LOGIN'
+
+
+class OrgRemoveBillingManagerAuditEntryReason(Enum):
+    """
+    The reason a billing manager was removed from an Organization.
+    """
+
+    SAML_EXTERNAL_IDENTITY_MISSING = 'SAML_EXTERNAL_IDENTITY_MISSING'
+    SAML_SSO_ENFORCEMENT_REQUIRES_EXTERNAL_IDENTITY = (
+        'SAML_SSO_ENFORCEMENT_REQUIRES_EXTERNAL_IDENTITY'
+    )
+    TWO_FACTOR_REQUIREMENT_NON_COMPLIANCE = (
+        'TWO_FACTOR_REQUIREMENT_NON_COMPLIANCE'
+    )
+
+
+class OrgRemoveMemberAuditEntryMembershipType(Enum):
+    """
+    The type of membership a user has with an Organization.
+    """
+
+    ADMIN = 'ADMIN'
+    BILLING_MANAGER = 'BILLING_MANAGER'
+    DIRECT_MEMBER = 'DIRECT_MEMBER'
+    OUTSIDE_COLLABORATOR = 'OUTSIDE_COLLABORATOR'
+    SUSPENDED = 'SUSPENDED'
+    UNAFFILIATED = 'UNAFFILIATED'
+
+
+class OrgRemoveMemberAuditEntryReason(Enum):
+    """
+    The reason a member was removed from an Organization.
+    """
+
+    SAML_EXTERNAL_IDENTITY_MISSING = 'SAML_EXTERNAL_IDENTITY_MISSING'
+    SAML_SSO_ENFORCEMENT_REQUIRES_EXTERNAL_IDENTITY = (
+        'SAML_SSO_ENFORCEMENT_REQUIRES_EXTERNAL_IDENTITY'
+    )
+    TWO_FACTOR_ACCOUNT_RECOVERY = 'TWO_FACTOR_ACCOUNT_RECOVERY'
+    TWO_FACTOR_REQUIREMENT_NON_COMPLIANCE = (
+        'TWO_FACTOR_REQUIREMENT_NON_COMPLIANCE'
+    )
+    USER_ACCOUNT_DELETED = 'USER_ACCOUNT_DELETED'
+
+
+class OrgRemoveOutsideCollaboratorAuditEntryMembershipType(Enum):
+    """
+    The type of membership a user has with an Organization.
+    """
+
+    BILLING_MANAGER = 'BILLING_MANAGER'
+    OUTSIDE_COLLABORATOR = 'OUTSIDE_COLLABORATOR'
+    UNAFFILIATED = 'UNAFFILIATED'
+
+
+class OrgRemoveOutsideCollaboratorAuditEntryReason(Enum):
+    """
+    The reason an outside collaborator was removed from an Organization.
+    """
+
+    SAML_EXTERNAL_IDENTITY_MISSING = 'SAML_EXTERNAL_IDENTITY_MISSING'
+    TWO_FACTOR_REQUIREMENT_NON_COMPLIANCE = (
+        'TWO_FACTOR_REQUIREMENT_NON_COMPLIANCE'
+    )
+
+
+class OrgUpdateDefaultRepositoryPermissionAuditEntryPermission(Enum):
+    """
+    The default permission a repository can have in an Organization.
+    """
+
+    ADMIN = 'ADMIN'
+    NONE = 'NONE'
+    READ = 'READ'
+    WRITE = 'WRITE'
+
+
+class OrgUpdateMemberAuditEntryPermission(Enum):
+    """
+    The permissions available to members on an Organization.
+    """
+
+    ADMIN = 'ADMIN'
+    READ = 'READ'
+
+
+class OrgUpdateMemberRepositoryCreationPermissionAuditEntryVisibility(Enum):
+    """
+    The permissions available for repository creation on an Organization.
+    """
+
+    ALL = 'ALL'
+    INTERNAL = 'INTERNAL'
+    NONE = 'NONE'
+    PRIVATE = 'PRIVATE'
+    PRIVATE_INTERNAL = 'PRIVATE_INTERNAL'
+    PUBLIC = 'PUBLIC'
+    PUBLIC_INTERNAL = 'PUBLIC_INTERNAL'
+    PUBLIC_PRIVATE = 'PUBLIC_PRIVATE'
+
+
+class OrganizationInvitationRole(Enum):
+    """
+    The possible organization invitation roles.
+    """
+
+    ADMIN = 'ADMIN'
+    BILLING_MANAGER = 'BILLING_MANAGER'
+    DIRECT_MEMBER = 'DIRECT_MEMBER'
+    REINSTATE = 'REINSTATE'
+
+
+class OrganizationInvitationSource(Enum):
+    """
+    The possible organization invitation sources.
+    """
+
+    MEMBER = 'MEMBER'
+    SCIM = 'SCIM'
+    UNKNOWN = 'UNKNOWN'
+
+
+class OrganizationInvitationType(Enum):
+    """
+    The possible organization invitation types.
+    """
+
+    EMAIL = 'EMAIL'
+    USER = 'USER'
+
+
+class OrganizationMemberRole(Enum):
+    """
+    The possible roles within an organization for its members.
+    """
+
+    ADMIN = 'ADMIN'
+    MEMBER = 'MEMBER'
+
+
+class OrganizationMembersCanCreateRepositoriesSettingValue(Enum):
+    """
+    The possible values for the members can create repositories setting on an organization.
+    """
+
+    ALL = 'ALL'
+    DISABLED = 'DISABLED'
+    INTERNAL = 'INTERNAL'
+    PRIVATE = 'PRIVATE'
+
+
+class OrganizationMigrationState(Enum):
+    """
+    The Octoshift Organization migration state.
+    """
+
+    FAILED = 'FAILED'
+    FAILED_VALIDATION = 'FAILED_VALIDATION'
+    IN_PROGRESS = 'IN_PROGRESS'
+    NOT_STARTED = 'NOT_STARTED'
+    PENDING_VALIDATION = 'PENDING_VALIDATION'
+    POST_REPO_MIGRATION = 'POST_REPO_MIGRATION'
+    PRE_REPO_MIGRATION = 'PRE_REPO_MIGRATION'
+    QUEUED = 'QUEUED'
+    REPO_MIGRATION = 'REPO_MIGRATION'
+    SUCCEEDED = 'SUCCEEDED'
+
+
+class OrganizationOrderField(Enum):
+    """
+    Properties by which organization connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    LOGIN = 'LOGIN'
+
+
+class PackageFileOrderField(Enum):
+    """
+    Properties by which package file connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class PackageOrderField(Enum):
+    """
+    Properties by which package connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class PackageType(Enum):
+    """
+    The possible types of a package.
+    """
+
+    DEBIAN = 'DEBIAN'
+    DOCKER = 'DOCKER'
+    MAVEN = 'MAVEN'
+    NPM = 'NPM'
+    NUGET = 'NUGET'
+    PYPI = 'PYPI'
+    RUBYGEMS = 'RUBYGEMS'
+
+
+class PackageVersionOrderField(Enum):
+    """
+    Properties by which package version connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class PatchStatus(Enum):
+    """
+    The possible types of patch statuses.
+    """
+
+    ADDED = 'ADDED'
+    CHANGED = 'CHANGED'
+    COPIED = 'COPIED'
+    DELETED = 'DELETED'
+    MODIFIED = 'MODIFIED'
+    RENAMED = 'RENAMED'
+
+
+class PinnableItemType(Enum):
+    """
+    Represents items that can be pinned to a profile page or dashboard.
+    """
+
+    GIST = 'GIST'
+    ISSUE = 'ISSUE'
+    ORGANIZATION = 'ORGANIZATION'
+    PROJECT = 'PROJECT'
+    PULL_REQUEST = 'PULL_REQUEST'
+    REPOSITORY = 'REPOSITORY'
+    TEAM = 'TEAM'
+    USER = 'USER'
+
+
+class PinnedDiscussionGradient(Enum):
+    """
+    Preconfigured gradients that may be used to style discussions pinned within a repository.
+    """
+
+    BLUE_MINT = 'BLUE_MINT'
+    BLUE_PURPLE = 'BLUE_PURPLE'
+    PINK_BLUE = 'PINK_BLUE'
+    PURPLE_CORAL = 'PURPLE_CORAL'
+    RED_ORANGE = 'RED_ORANGE'
+
+
+class PinnedDiscussionPattern(Enum):
+    """
+    Preconfigured background patterns that may be used to style discussions pinned within a repository.
+    """
+
+    CHEVRON_UP = 'CHEVRON_UP'
+    DOT = 'DOT'
+    DOT_FILL = 'DOT_FILL'
+    HEART_FILL = 'HEART_FILL'
+    PLUS = 'PLUS'
+    ZAP = 'ZAP'
+
+
+class ProjectCardArchivedState(Enum):
+    """
+    The possible archived states of a project card.
+    """
+
+    ARCHIVED = 'ARCHIVED'
+    NOT_ARCHIVED = 'NOT_ARCHIVED'
+
+
+class ProjectCardState(Enum):
+    """
+    Various content states of a ProjectCard
+    """
+
+    CONTENT_ONLY = 'CONTENT_ONLY'
+    NOTE_ONLY = 'NOTE_ONLY'
+    REDACTED = 'REDACTED'
+
+
+class ProjectColumnPurpose(Enum):
+    """
+    The semantic purpose of the column - todo, in progress, or done.
+    """
+
+    DONE = 'DONE'
+    IN_PROGRESS = 'IN_PROGRESS'
+    TODO = 'TODO'
+
+
+class ProjectOrderField(Enum):
+    """
+    Properties by which project connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    NAME = 'NAME'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class ProjectState(Enum):
+    """
+    State of the project; either 'open' or 'closed'
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+
+class ProjectTemplate(Enum):
+    """
+    GitHub-provided templates for Projects
+    """
+
+    AUTOMATED_KANBAN_V2 = 'AUTOMATED_KANBAN_V2'
+    AUTOMATED_REVIEWS_KANBAN = 'AUTOMATED_REVIEWS_KANBAN'
+    BASIC_KANBAN = 'BASIC_KANBAN'
+    BUG_TRIAGE = 'BUG_TRIAGE'
+
+
+class ProjectV2CustomFieldType(Enum):
+    """
+    The type of a project field.
+    """
+
+    DATE = 'DATE'
+    NUMBER = 'NUMBER'
+    SINGLE_SELECT = 'SINGLE_SELECT'
+    TEXT = 'TEXT'
+
+
+class ProjectV2FieldOrderField(Enum):
+    """
+    Properties by which project v2 field connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    NAME = 'NAME'
+    POSITION = 'POSITION'
+
+
+class ProjectV2FieldType(Enum):
+    """
+    The type of a project field.
+    """
+
+    ASSIGNEES = 'ASSIGNEES'
+    DATE = 'DATE'
+    ITERATION = 'ITERATION'
+    LABELS = 'LABELS'
+    LINKED_PULL_REQUESTS = 'LINKED_PULL_REQUESTS'
+    MILESTONE = 'MILESTONE'
+    NUMBER = 'NUMBER'
+    REPOSITORY = 'REPOSITORY'
+    REVIEWERS = 'REVIEWERS'
+    SINGLE_SELECT = 'SINGLE_SELECT'
+    TEXT = 'TEXT'
+    TITLE = 'TITLE'
+    TRACKED_BY = 'TRACKED_BY'
+    TRACKS = 'TRACKS'
+
+
+class ProjectV2ItemFieldValueOrderField(Enum):
+    """
+    Properties by which project v2 item field value connections can be ordered.
+    """
+
+    POSITION = 'POSITION'
+
+
+class ProjectV2ItemOrderField(Enum):
+    """
+    Properties by which project v2 item connections can be ordered.
+    """
+
+    POSITION = 'POSITION'
+
+
+class ProjectV2ItemType(Enum):
+    """
+    The type of a project item.
+    """
+
+    DRAFT_ISSUE = 'DRAFT_ISSUE'
+    ISSUE = 'ISSUE'
+    PULL_REQUEST = 'PULL_REQUEST'
+    REDACTED = 'REDACTED'
+
+
+class ProjectV2OrderField(Enum):
+    """
+    Properties by which projects can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    NUMBER = 'NUMBER'
+    TITLE = 'TITLE'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class ProjectV2Roles(Enum):
+    """
+    The possible roles of a collaborator on a project.
+    """
+
+    ADMIN = 'ADMIN'
+    NONE = 'NONE'
+    READER = 'READER'
+    WRITER = 'WRITER'
+
+
+class ProjectV2SingleSelectFieldOptionColor(Enum):
+    """
+    The display color of a single-select field option.
+    """
+
+    BLUE = 'BLUE'
+    GRAY = 'GRAY'
+    GREEN = 'GREEN'
+    ORANGE = 'ORANGE'
+    PINK = 'PINK'
+    PURPLE = 'PURPLE'
+    RED = 'RED'
+    YELLOW = 'YELLOW'
+
+
+class ProjectV2State(Enum):
+    """
+    The possible states of a project v2.
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+
+class ProjectV2ViewLayout(Enum):
+    """
+    The layout of a project v2 view.
+    """
+
+    BOARD_LAYOUT = 'BOARD_LAYOUT'
+    ROADMAP_LAYOUT = 'ROADMAP_LAYOUT'
+    TABLE_LAYOUT = 'TABLE_LAYOUT'
+
+
+class ProjectV2ViewOrderField(Enum):
+    """
+    Properties by which project v2 view connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    NAME = 'NAME'
+    POSITION = 'POSITION'
+
+
+class ProjectV2WorkflowsOrderField(Enum):
+    """
+    Properties by which project workflows can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    NAME = 'NAME'
+    NUMBER = 'NUMBER'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class PullRequestBranchUpdateMethod(Enum):
+    """
+    The possible methods for updating a pull request's head branch with the base branch.
+    """
+
+    MERGE = 'MERGE'
+    REBASE = 'REBASE'
+
+
+class PullRequestMergeMethod(Enum):
+    """
+    Represents available types of methods to use when merging a pull request.
+    """
+
+    MERGE = 'MERGE'
+    REBASE = 'REBASE'
+    SQUASH = 'SQUASH'
+
+
+class PullRequestOrderField(Enum):
+    """
+    Properties by which pull_requests connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class PullRequestReviewCommentState(Enum):
+    """
+    The possible states of a pull request review comment.
+    """
+
+    PENDING = 'PENDING'
+    SUBMITTED = 'SUBMITTED'
+
+
+class PullRequestReviewDecision(Enum):
+    """
+    The review status of a pull request.
+    """
+
+    APPROVED = 'APPROVED'
+    CHANGES_REQUESTED = 'CHANGES_REQUESTED'
+    REVIEW_REQUIRED = 'REVIEW_REQUIRED'
+
+
+class PullRequestReviewEvent(Enum):
+    """
+    The possible events to perform on a pull request review.
+    """
+
+    APPROVE = 'APPROVE'
+    COMMENT = 'COMMENT'
+    DISMISS = 'DISMISS'
+    REQUEST_CHANGES = 'REQUEST_CHANGES'
+
+
+class PullRequestReviewState(Enum):
+    """
+    The possible states of a pull request review.
+    """
+
+    APPROVED = 'APPROVED'
+    CHANGES_REQUESTED = 'CHANGES_REQUESTED'
+    COMMENTED = 'COMMENTED'
+    DISMISSED = 'DISMISSED'
+    PENDING = 'PENDING'
+
+
+class PullRequestReviewThreadSubjectType(Enum):
+    """
+    The possible subject types of a pull request review comment.
+    """
+
+    FILE = 'FILE'
+    LINE = 'LINE'
+
+
+class PullRequestState(Enum):
+    """
+    The possible states of a pull request.
+    """
+
+    CLOSED = 'CLOSED'
+    MERGED = 'MERGED'
+    OPEN = 'OPEN'
+
+
+class PullRequestTimelineItemsItemType(Enum):
+    """
+    The possible item types found in a timeline.
+    """
+
+    ADDED_TO_MERGE_QUEUE_EVENT = 'ADDED_TO_MERGE_QUEUE_EVENT'
+    ADDED_TO_PROJECT_EVENT = 'ADDED_TO_PROJECT_EVENT'
+    ASSIGNED_EVENT = 'ASSIGNED_EVENT'
+    AUTOMATIC_BASE_CHANGE_FAILED_EVENT = 'AUTOMATIC_BASE_CHANGE_FAILED_EVENT'
+    AUTOMATIC_BASE_CHANGE_SUCCEEDED_EVENT = (
+        'AUTOMATIC_BASE_CHANGE_SUCCEEDED_EVENT'
+    )
+    AUTO_MERGE_DISABLED_EVENT = 'AUTO_MERGE_DISABLED_EVENT'
+    AUTO_MERGE_ENABLED_EVENT = 'AUTO_MERGE_ENABLED_EVENT'
+    AUTO_REBASE_ENABLED_EVENT = 'AUTO_REBASE_ENABLED_EVENT'
+    AUTO_SQUASH_ENABLED_EVENT = 'AUTO_SQUASH_ENABLED_EVENT'
+    BASE_REF_CHANGED_EVENT = 'BASE_REF_CHANGED_EVENT'
+    BASE_REF_DELETED_EVENT = 'BASE_REF_DELETED_EVENT'
+    BASE_REF_FORCE_PUSHED_EVENT = 'BASE_REF_FORCE_PUSHED_EVENT'
+    CLOSED_EVENT = 'CLOSED_EVENT'
+    COMMENT_DELETED_EVENT = 'COMMENT_DELETED_EVENT'
+    CONNECTED_EVENT = 'CONNECTED_EVENT'
+    CONVERTED_NOTE_TO_ISSUE_EVENT = 'CONVERTED_NOTE_TO_ISSUE_EVENT'
+    CONVERTED_TO_DISCUSSION_EVENT = 'CONVERTED_TO_DISCUSSION_EVENT'
+    CONVERT_TO_DRAFT_EVENT = 'CONVERT_TO_DRAFT_EVENT'
+    CROSS_REFERENCED_EVENT = 'CROSS_REFERENCED_EVENT'
+    DEMILESTONED_EVENT = 'DEMILESTONED_EVENT'
+    DEPLOYED_EVENT = 'DEPLOYED_EVENT'
+    DEPLOYMENT_ENVIRONMENT_CHANGED_EVENT = (
+        'DEPLOYMENT_ENVIRONMENT_CHANGED_EVENT'
+    )
+    DISCONNECTED_EVENT = 'DISCONNECTED_EVENT'
+    HEAD_REF_DELETED_EVENT = 'HEAD_REF_DELETED_EVENT'
+    HEAD_REF_FORCE_PUSHED_EVENT = 'HEAD_REF_FORCE_PUSHED_EVENT'
+    HEAD_REF_RESTORED_EVENT = 'HEAD_REF_RESTORED_EVENT'
+    ISSUE_COMMENT = 'ISSUE_COMMENT'
+    LABELED_EVENT = 'LABELED_EVENT'
+    LOCKED_EVENT = 'LOCKED_EVENT'
+    MARKED_AS_DUPLICATE_EVENT = 'MARKED_AS_DUPLICATE_EVENT'
+    MENTIONED_EVENT = 'MENTIONED_EVENT'
+    MERGED_EVENT = 'MERGED_EVENT'
+    MILESTONED_EVENT = 'MILESTONED_EVENT'
+    MOVED_COLUMNS_IN_PROJECT_EVENT = 'MOVED_COLUMNS_IN_PROJECT_EVENT'
+    PINNED_EVENT = 'PINNED_EVENT'
+    PULL_REQUEST_COMMIT = 'PULL_REQUEST_COMMIT'
+    PULL_REQUEST_COMMIT_COMMENT_THREAD = 'PULL_REQUEST_COMMIT_COMMENT_THREAD'
+    PULL_REQUEST_REVIEW = 'PULL_REQUEST_REVIEW'
+    PULL_REQUEST_REVIEW_THREAD = 'PULL_REQUEST_REVIEW_THREAD'
+    PULL_REQUEST_REVISION_MARKER = 'PULL_REQUEST_REVISION_MARKER'
+    READY_FOR_REVIEW_EVENT = 'READY_FOR_REVIEW_EVENT'
+    REFERENCED_EVENT = 'REFERENCED_EVENT'
+    REMOVED_FROM_MERGE_QUEUE_EVENT = 'REMOVED_FROM_MERGE_QUEUE_EVENT'
+    REMOVED_FROM_PROJECT_EVENT = 'REMOVED_FROM_PROJECT_EVENT'
+    RENAMED_TITLE_EVENT = 'RENAMED_TITLE_EVENT'
+    REOPENED_EVENT = 'REOPENED_EVENT'
+    REVIEW_DISMISSED_EVENT = 'REVIEW_DISMISSED_EVENT'
+    REVIEW_REQUESTED_EVENT = 'REVIEW_REQUESTED_EVENT'
+    REVIEW_REQUEST_REMOVED_EVENT = 'REVIEW_REQUEST_REMOVED_EVENT'
+    SUBSCRIBED_EVENT = 'SUBSCRIBED_EVENT'
+    TRANSFERRED_EVENT = 'TRANSFERRED_EVENT'
+    UNASSIGNED_EVENT = 'UNASSIGNED_EVENT'
+    UNLABELED_EVENT = 'UNLABELED_EVENT'
+    UNLOCKED_EVENT = 'UNLOCKED_EVENT'
+    UNMARKED_AS_DUPLICATE_EVENT = 'UNMARKED_AS_DUPLICATE_EVENT'
+    UNPINNED_EVENT = 'UNPINNED_EVENT'
+    UNSUBSCRIBED_EVENT = 'UNSUBSCRIBED_EVENT'
+    USER_BLOCKED_EVENT = 'USER_BLOCKED_EVENT'
+
+
+class PullRequestUpdateState(Enum):
+    """
+    The possible target states when updating a pull request.
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+
+class ReactionContent(Enum):
+    """
+    Emojis that can be attached to Issues, Pull Requests and Comments.
+    """
+
+    CONFUSED = 'CONFUSED'
+    EYES = 'EYES'
+    HEART = 'HEART'
+    HOORAY = 'HOORAY'
+    LAUGH = 'LAUGH'
+    ROCKET = 'ROCKET'
+    THUMBS_DOWN = 'THUMBS_DOWN'
+    THUMBS_UP = 'THUMBS_UP'
+
+
+class ReactionOrderField(Enum):
+    """
+    A list of fields that reactions can be ordered by.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class RefOrderField(Enum):
+    """
+    Properties by which ref connections can be ordered.
+    """
+
+    ALPHABETICAL = 'ALPHABETICAL'
+    TAG_COMMIT_DATE = 'TAG_COMMIT_DATE'
+
+
+class ReleaseOrderField(Enum):
+    """
+    Properties by which release connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    NAME = 'NAME'
+
+
+class RepoAccessAuditEntryVisibility(Enum):
+    """
+    The privacy of a repository
+    """
+
+    INTERNAL = 'INTERNAL'
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class RepoAddMemberAuditEntryVisibility(Enum):
+    """
+    The privacy of a repository
+    """
+
+    INTERNAL = 'INTERNAL'
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class RepoArchivedAuditEntryVisibility(Enum):
+    """
+    The privacy of a repository
+    """
+
+    INTERNAL = 'INTERNAL'
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class RepoChangeMergeSettingAuditEntryMergeType(Enum):
+    """
+    The merge options available for pull requests to this repository.
+    """
+
+    MERGE = 'MERGE'
+    REBASE = 'REBASE'
+    SQUASH = 'SQUASH'
+
+
+class RepoCreateAuditEntryVisibility(Enum):
+    """
+    The privacy of a repository
+    """
+
+    INTERNAL = 'INTERNAL'
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class RepoDestroyAuditEntryVisibility(Enum):
+    """
+    The privacy of a repository
+    """
+
+    INTERNAL = 'INTERNAL'
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class RepoRemoveMemberAuditEntryVisibility(Enum):
+    """
+    The privacy of a repository
+    """
+
+    INTERNAL = 'INTERNAL'
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class ReportedContentClassifiers(Enum):
+    """
+    The reasons a piece of content can be reported or minimized.
+    """
+
+    ABUSE = 'ABUSE'
+    DUPLICATE = 'DUPLICATE'
+    OFF_TOPIC = 'OFF_TOPIC'
+    OUTDATED = 'OUTDATED'
+    RESOLVED = 'RESOLVED'
+    SPAM = 'SPAM'
+
+
+class RepositoryAffiliation(Enum):
+    """
+    The affiliation of a user to a repository
+    """
+
+    COLLABORATOR = 'COLLABORATOR'
+    ORGANIZATION_MEMBER = 'ORGANIZATION_MEMBER'
+    OWNER = 'OWNER'
+
+
+class RepositoryContributionType(Enum):
+    """
+    The reason a repository is listed as 'contributed'.
+    """
+
+    COMMIT = 'COMMIT'
+    ISSUE = 'ISSUE'
+    PULL_REQUEST = 'PULL_REQUEST'
+    PULL_REQUEST_REVIEW = 'PULL_REQUEST_REVIEW'
+    REPOSITORY = 'REPOSITORY'
+
+
+class RepositoryInteractionLimit(Enum):
+    """
+    A repository interaction limit.
+    """
+
+    COLLABORATORS_ONLY = 'COLLABORATORS_ONLY'
+    CONTRIBUTORS_ONLY = 'CONTRIBUTORS_ONLY'
+    EXISTING_USERS = 'EXISTING_USERS'
+    NO_LIMIT = 'NO_LIMIT'
+
+
+class RepositoryInteractionLimitExpiry(Enum):
+    """
+    The length for a repository interaction limit to be enabled for.
+    """
+
+    ONE_DAY = 'ONE_DAY'
+    ONE_MONTH = 'ONE_MONTH'
+    ONE_WEEK = 'ONE_WEEK'
+    SIX_MONTHS = 'SIX_MONTHS'
+    THREE_DAYS = 'THREE_DAYS'
+
+
+class RepositoryInteractionLimitOrigin(Enum):
+    """
+    Indicates where an interaction limit is configured.
+    """
+
+    ORGANIZATION = 'ORGANIZATION'
+    REPOSITORY = 'REPOSITORY'
+    USER = 'USER'
+
+
+class RepositoryInvitationOrderField(Enum):
+    """
+    Properties by which repository invitation connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class RepositoryLockReason(Enum):
+    """
+    The possible reasons a given repository could be in a locked state.
+    """
+
+    BILLING = 'BILLING'
+    MIGRATING = 'MIGRATING'
+    MOVING = 'MOVING'
+    RENAME = 'RENAME'
+    TRADE_RESTRICTION = 'TRADE_RESTRICTION'
+    TRANSFERRING_OWNERSHIP = 'TRANSFERRING_OWNERSHIP'
+
+
+class RepositoryMigrationOrderDirection(Enum):
+    """
+    Possible directions in which to order a list of repository migrations when provided an `orderBy` argument.
+    """
+
+    ASC = 'ASC'
+    DESC = 'DESC'
+
+
+class RepositoryMigrationOrderField(Enum):
+    """
+    Properties by which repository migrations can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class RepositoryOrderField(Enum):
+    """
+    Properties by which repository connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    NAME = 'NAME'
+    PUSHED_AT = 'PUSHED_AT'
+    STARGAZERS = 'STARGAZERS'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class RepositoryPermission(Enum):
+    """
+    The access level to a repository
+    """
+
+    ADMIN = 'ADMIN'
+    MAINTAIN = 'MAINTAIN'
+    READ = 'READ'
+    TRIAGE = 'TRIAGE'
+    WRITE = 'WRITE'
+
+
+class RepositoryPrivacy(Enum):
+    """
+    The privacy of a repository
+    """
+
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class RepositoryRuleType(Enum):
+    """
+    The rule types supported in rulesets
+    """
+
+    AUTHORIZATION = 'AUTHORIZATION'
+    BRANCH_NAME_PATTERN = 'BRANCH_NAME_PATTERN'
+    COMMITTER_EMAIL_PATTERN = 'COMMITTER_EMAIL_PATTERN'
+    COMMIT_AUTHOR_EMAIL_PATTERN = 'COMMIT_AUTHOR_EMAIL_PATTERN'
+    COMMIT_MESSAGE_PATTERN = 'COMMIT_MESSAGE_PATTERN'
+    CREATION = 'CREATION'
+    DELETION = 'DELETION'
+    LOCK_BRANCH = 'LOCK_BRANCH'
+    MAX_REF_UPDATES = 'MAX_REF_UPDATES'
+    MERGE_QUEUE = 'MERGE_QUEUE'
+    MERGE_QUEUE_LOCKED_REF = 'MERGE_QUEUE_LOCKED_REF'
+    NON_FAST_FORWARD = 'NON_FAST_FORWARD'
+    PULL_REQUEST = 'PULL_REQUEST'
+    REQUIRED_DEPLOYMENTS = 'REQUIRED_DEPLOYMENTS'
+    REQUIRED_LINEAR_HISTORY = 'REQUIRED_LINEAR_HISTORY'
+    REQUIRED_REVIEW_THREAD_RESOLUTION = 'REQUIRED_REVIEW_THREAD_RESOLUTION'
+    REQUIRED_SIGNATURES = 'REQUIRED_SIGNATURES'
+    REQUIRED_STATUS_CHECKS = 'REQUIRED_STATUS_CHECKS'
+    REQUIRED_WORKFLOW_STATUS_CHECKS = 'REQUIRED_WORKFLOW_STATUS_CHECKS'
+    RULESET_REQUIRED_SIGNATURES = 'RULESET_REQUIRED_SIGNATURES'
+    SECRET_SCANNING = 'SECRET_SCANNING'
+    TAG = 'TAG'
+    TAG_NAME_PATTERN = 'TAG_NAME_PATTERN'
+    UPDATE = 'UPDATE'
+    WORKFLOWS = 'WORKFLOWS'
+    WORKFLOW_UPDATES = 'WORKFLOW_UPDATES'
+
+
+class RepositoryRulesetBypassActorBypassMode(Enum):
+    """
+    The bypass mode for a specific actor on a ruleset.
+    """
+
+    ALWAYS = 'ALWAYS'
+    PULL_REQUEST = 'PULL_REQUEST'
+
+
+class RepositoryRulesetTarget(Enum):
+    """
+    The targets supported for rulesets
+    """
+
+    BRANCH = 'BRANCH'
+    TAG = 'TAG'
+
+
+class RepositoryVisibility(Enum):
+    """
+    The repository's visibility level.
+    """
+
+    INTERNAL = 'INTERNAL'
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class RepositoryVulnerabilityAlertDependencyScope(Enum):
+    """
+    The possible scopes of an alert's dependency.
+    """
+
+    DEVELOPMENT = 'DEVELOPMENT'
+    RUNTIME = 'RUNTIME'
+
+
+class RepositoryVulnerabilityAlertState(Enum):
+    """
+    The possible states of an alert
+    """
+
+    AUTO_DISMISSED = 'AUTO_DISMISSED'
+    DISMISSED = 'DISMISSED'
+    FIXED = 'FIXED'
+    OPEN = 'OPEN'
+
+
+class RequestableCheckStatusState(Enum):
+    """
+    The possible states that can be requested when creating a check run.
+    """
+
+    COMPLETED = 'COMPLETED'
+    IN_PROGRESS = 'IN_PROGRESS'
+    PENDING = 'PENDING'
+    QUEUED = 'QUEUED'
+    WAITING = 'WAITING'
+
+
+class RoleInOrganization(Enum):
+    """
+    Possible roles a user may have in relation to an organization.
+    """
+
+    DIRECT_MEMBER = 'DIRECT_MEMBER'
+    OWNER = 'OWNER'
+    UNAFFILIATED = 'UNAFFILIATED'
+
+
+class RuleEnforcement(Enum):
+    """
+    The level of enforcement for a rule or ruleset.
+    """
+
+    ACTIVE = 'ACTIVE'
+    DISABLED = 'DISABLED'
+    EVALUATE = 'EVALUATE'
+
+
+class SamlDigestAlgorithm(Enum):
+    """
+    The possible digest algorithms used to sign SAML requests for an identity provider.
+    """
+
+    SHA1 = 'SHA1'
+    SHA256 = 'SHA256'
+    SHA384 = 'SHA384'
+    SHA512 = 'SHA512'
+
+
+class SamlSignatureAlgorithm(Enum):
+    """
+    The possible signature algorithms used to sign SAML requests for a Identity Provider.
+    """
+
+    RSA_SHA1 = 'RSA_SHA1'
+    RSA_SHA256 = 'RSA_SHA256'
+    RSA_SHA384 = 'RSA_SHA384'
+    RSA_SHA512 = 'RSA_SHA512'
+
+
+class SavedReplyOrderField(Enum):
+    """
+    Properties by which saved reply connections can be ordered.
+    """
+
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class SearchType(Enum):
+    """
+    Represents the individual results of a search.
+    """
+
+    DISCUSSION = 'DISCUSSION'
+    ISSUE = 'ISSUE'
+    REPOSITORY = 'REPOSITORY'
+    USER = 'USER'
+
+
+class SecurityAdvisoryClassification(Enum):
+    """
+    Classification of the advisory.
+    """
+
+    GENERAL = 'GENERAL'
+    MALWARE = 'MALWARE'
+
+
+class SecurityAdvisoryEcosystem(Enum):
+    """
+    The possible ecosystems of a security vulnerability's package.
+    """
+
+    ACTIONS = 'ACTIONS'
+    COMPOSER = 'COMPOSER'
+    ERLANG = 'ERLANG'
+    GO = 'GO'
+    MAVEN = 'MAVEN'
+    NPM = 'NPM'
+    NUGET = 'NUGET'
+    PIP = 'PIP'
+    PUB = 'PUB'
+    RUBYGEMS = 'RUBYGEMS'
+    RUST = 'RUST'
+    SWIFT = 'SWIFT'
+
+
+class SecurityAdvisoryIdentifierType(Enum):
+    """
+    Identifier formats available for advisories.
+    """
+
+    CVE = 'CVE'
+    GHSA = 'GHSA'
+
+
+class SecurityAdvisoryOrderField(Enum):
+    """
+    Properties by which security advisory connections can be ordered.
+    """
+
+    PUBLISHED_AT = 'PUBLISHED_AT'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class SecurityAdvisorySeverity(Enum):
+    """
+    Severity of the vulnerability.
+    """
+
+    CRITICAL = 'CRITICAL'
+    HIGH = 'HIGH'
+    LOW = 'LOW'
+    MODERATE = 'MODERATE'
+
+
+class SecurityVulnerabilityOrderField(Enum):
+    """
+    Properties by which security vulnerability connections can be ordered.
+    """
+
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class SocialAccountProvider(Enum):
+    """
+    Software or company that hosts social media accounts.
+    """
+
+    FACEBOOK = 'FACEBOOK'
+    GENERIC = 'GENERIC'
+    HOMETOWN = 'HOMETOWN'
+    INSTAGRAM = 'INSTAGRAM'
+    LINKEDIN = 'LINKEDIN'
+    MASTODON = 'MASTODON'
+    NPM = 'NPM'
+    REDDIT = 'REDDIT'
+    TWITCH = 'TWITCH'
+    TWITTER = 'TWITTER'
+    YOUTUBE = 'YOUTUBE'
+
+
+class SponsorOrderField(Enum):
+    """
+    Properties by which sponsor connections can be ordered.
+    """
+
+    LOGIN = 'LOGIN'
+    RELEVANCE = 'RELEVANCE'
+
+
+class SponsorableOrderField(Enum):
+    """
+    Properties by which sponsorable connections can be ordered.
+    """
+
+    LOGIN = 'LOGIN'
+
+
+class SponsorsActivityAction(Enum):
+    """
+    The possible actions that GitHub Sponsors activities can represent.
+    """
+
+    CANCELLED_SPONSORSHIP = 'CANCELLED_SPONSORSHIP'
+    NEW_SPONSORSHIP = 'NEW_SPONSORSHIP'
+    PENDING_CHANGE = 'PENDING_CHANGE'
+    REFUND = 'REFUND'
+    SPONSOR_MATCH_DISABLED = 'SPONSOR_MATCH_DISABLED'
+    TIER_CHANGE = 'TIER_CHANGE'
+
+
+class SponsorsActivityOrderField(Enum):
+    """
+    Properties by which GitHub Sponsors activity connections can be ordered.
+    """
+
+    TIMESTAMP = 'TIMESTAMP'
+
+
+class SponsorsActivityPeriod(Enum):
+    """
+    The possible time periods for which Sponsors activities can be requested.
+    """
+
+    ALL = 'ALL'
+    DAY = 'DAY'
+    MONTH = 'MONTH'
+    WEEK = 'WEEK'
+
+
+class SponsorsCountryOrRegionCode(Enum):
+    """
+    Represents countries or regions for billing and residence for a GitHub Sponsors profile.
+    """
+
+    AD = 'AD'
+    AE = 'AE'
+    AF = 'AF'
+    AG = 'AG'
+    AI = 'AI'
+    AL = 'AL'
+    AM = 'AM'
+    AO = 'AO'
+    AQ = 'AQ'
+    AR = 'AR'
+    AS = 'AS'
+    AT = 'AT'
+    AU = 'AU'
+    AW = 'AW'
+    AX = 'AX'
+    AZ = 'AZ'
+    BA = 'BA'
+    BB = 'BB'
+    BD = 'BD'
+    BE = 'BE'
+    BF = 'BF'
+    BG = 'BG'
+    BH = 'BH'
+    BI = 'BI'
+    BJ = 'BJ'
+    BL = 'BL'
+    BM = 'BM'
+    BN = 'BN'
+    BO = 'BO'
+    BQ = 'BQ'
+    BR = 'BR'
+    BS = 'BS'
+    BT = 'BT'
+    BV = 'BV'
+    BW = 'BW'
+    BY = 'BY'
+    BZ = 'BZ'
+    CA = 'CA'
+    CC = 'CC'
+    CD = 'CD'
+    CF = 'CF'
+    CG = 'CG'
+    CH = 'CH'
+    CI = 'CI'
+    CK = 'CK'
+    CL = 'CL'
+    CM = 'CM'
+    CN = 'CN'
+    CO = 'CO'
+    CR = 'CR'
+    CV = 'CV'
+    CW = 'CW'
+    CX = 'CX'
+    CY = 'CY'
+    CZ = 'CZ'
+    DE = 'DE'
+    DJ = 'DJ'
+    DK = 'DK'
+    DM = 'DM'
+    DO = 'DO'
+    DZ = 'DZ'
+    EC = 'EC'
+    EE = 'EE'
+    EG = 'EG'
+    EH = 'EH'
+    ER = 'ER'
+    ES = 'ES'
+    ET = 'ET'
+    FI = 'FI'
+    FJ = 'FJ'
+    FK = 'FK'
+    FM = 'FM'
+    FO = 'FO'
+    FR = 'FR'
+    GA = 'GA'
+    GB = 'GB'
+    GD = 'GD'
+    GE = 'GE'
+    GF = 'GF'
+    GG = 'GG'
+    GH = 'GH'
+    GI = 'GI'
+    GL = 'GL'
+    GM = 'GM'
+    GN = 'GN'
+    GP = 'GP'
+    GQ = 'GQ'
+    GR = 'GR'
+    GS = 'GS'
+    GT = 'GT'
+    GU = 'GU'
+    GW = 'GW'
+    GY = 'GY'
+    HK = 'HK'
+    HM = 'HM'
+    HN = 'HN'
+    HR = 'HR'
+    HT = 'HT'
+    HU = 'HU'
+    ID = 'ID'
+    IE = 'IE'
+    IL = 'IL'
+    IM = 'IM'
+    IN = 'IN'
+    IO = 'IO'
+    IQ = 'IQ'
+    IR = 'IR'
+    IS = 'IS'
+    IT = 'IT'
+    JE = 'JE'
+    JM = 'JM'
+    JO = 'JO'
+    JP = 'JP'
+    KE = 'KE'
+    KG = 'KG'
+    KH = 'KH'
+    KI = 'KI'
+    KM = 'KM'
+    KN = 'KN'
+    KR = 'KR'
+    KW = 'KW'
+    KY = 'KY'
+    KZ = 'KZ'
+    LA = 'LA'
+    LB = 'LB'
+    LC = 'LC'
+    LI = 'LI'
+    LK = 'LK'
+    LR = 'LR'
+    LS = 'LS'
+    LT = 'LT'
+    LU = 'LU'
+    LV = 'LV'
+    LY = 'LY'
+    MA = 'MA'
+    MC = 'MC'
+    MD = 'MD'
+    ME = 'ME'
+    MF = 'MF'
+    MG = 'MG'
+    MH = 'MH'
+    MK = 'MK'
+    ML = 'ML'
+    MM = 'MM'
+    MN = 'MN'
+    MO = 'MO'
+    MP = 'MP'
+    MQ = 'MQ'
+    MR = 'MR'
+    MS = 'MS'
+    MT = 'MT'
+    MU = 'MU'
+    MV = 'MV'
+    MW = 'MW'
+    MX = 'MX'
+    MY = 'MY'
+    MZ = 'MZ'
+    NA = 'NA'
+    NC = 'NC'
+    NE = 'NE'
+    NF = 'NF'
+    NG = 'NG'
+    NI = 'NI'
+    NL = 'NL'
+    NO = 'NO'
+    NP = 'NP'
+    NR = 'NR'
+    NU = 'NU'
+    NZ = 'NZ'
+    OM = 'OM'
+    PA = 'PA'
+    PE = 'PE'
+    PF = 'PF'
+    PG = 'PG'
+    PH = 'PH'
+    PK = 'PK'
+    PL = 'PL'
+    PM = 'PM'
+    PN = 'PN'
+    PR = 'PR'
+    PS = 'PS'
+    PT = 'PT'
+    PW = 'PW'
+    PY = 'PY'
+    QA = 'QA'
+    RE = 'RE'
+    RO = 'RO'
+    RS = 'RS'
+    RU = 'RU'
+    RW = 'RW'
+    SA = 'SA'
+    SB = 'SB'
+    SC = 'SC'
+    SD = 'SD'
+    SE = 'SE'
+    SG = 'SG'
+    SH = 'SH'
+    SI = 'SI'
+    SJ = 'SJ'
+    SK = 'SK'
+    SL = 'SL'
+    SM = 'SM'
+    SN = 'SN'
+    SO = 'SO'
+    SR = 'SR'
+    SS = 'SS'
+    ST = 'ST'
+    SV = 'SV'
+    SX = 'SX'
+    SZ = 'SZ'
+    TC = 'TC'
+    TD = 'TD'
+    TF = 'TF'
+    TG = 'TG'
+    TH = 'TH'
+    TJ = 'TJ'
+    TK = 'TK'
+    TL = 'TL'
+    TM = 'TM'
+    TN = 'TN'
+    TO = 'TO'
+    TR = 'TR'
+    TT = 'TT'
+    TV = 'TV'
+    TW = 'TW'
+    TZ = 'TZ'
+    UA = 'UA'
+    UG = 'UG'
+    UM = 'UM'
+    US = 'US'
+    UY = 'UY'
+    UZ = 'UZ'
+    VA = 'VA'
+    VC = 'VC'
+    VE = 'VE'
+    VG = 'VG'
+    VI = 'VI'
+    VN = 'VN'
+    VU = 'VU'
+    WF = 'WF'
+    WS = 'WS'
+    YE = 'YE'
+    YT = 'YT'
+    ZA = 'ZA'
+    ZM = 'ZM'
+    ZW = 'ZW'
+
+
+class SponsorsGoalKind(Enum):
+    """
+    The different kinds of goals a GitHub Sponsors member can have.
+    """
+
+    MONTHLY_SPONSORSHIP_AMOUNT = 'MONTHLY_SPONSORSHIP_AMOUNT'
+    TOTAL_SPONSORS_COUNT = 'TOTAL_SPONSORS_COUNT'
+
+
+class SponsorsListingFeaturedItemFeatureableType(Enum):
+    """
+    The different kinds of records that can be featured on a GitHub Sponsors profile page.
+    """
+
+    REPOSITORY = 'REPOSITORY'
+    USER = 'USER'
+
+
+class SponsorsTierOrderField(Enum):
+    """
+    Properties by which Sponsors tiers connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    MONTHLY_PRICE_IN_CENTS = 'MONTHLY_PRICE_IN_CENTS'
+
+
+class SponsorshipNewsletterOrderField(Enum):
+    """
+    Properties by which sponsorship update connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class SponsorshipOrderField(Enum):
+    """
+    Properties by which sponsorship connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class SponsorshipPaymentSource(Enum):
+    """
+    How payment was made for funding a GitHub Sponsors sponsorship.
+    """
+
+    GITHUB = 'GITHUB'
+    PATREON = 'PATREON'
+
+
+class SponsorshipPrivacy(Enum):
+    """
+    The privacy of a sponsorship
+    """
+
+    PRIVATE = 'PRIVATE'
+    PUBLIC = 'PUBLIC'
+
+
+class SquashMergeCommitMessage(Enum):
+    """
+    The possible default commit messages for squash merges.
+    """
+
+    BLANK = 'BLANK'
+    COMMIT_MESSAGES = 'COMMIT_MESSAGES'
+    PR_BODY = 'PR_BODY'
+
+
+class SquashMergeCommitTitle(Enum):
+    """
+    The possible default commit titles for squash merges.
+    """
+
+    COMMIT_OR_PR_TITLE = 'COMMIT_OR_PR_TITLE'
+    PR_TITLE = 'PR_TITLE'
+
+
+class StarOrderField(Enum):
+    """
+    Properties by which star connections can be ordered.
+    """
+
+    STARRED_AT = 'STARRED_AT'
+
+
+class StatusState(Enum):
+    """
+    The possible commit status states.
+    """
+
+    ERROR = 'ERROR'
+    EXPECTED = 'EXPECTED'
+    FAILURE = 'FAILURE'
+    PENDING = 'PENDING'
+    SUCCESS = 'SUCCESS'
+
+
+class SubscriptionState(Enum):
+    """
+    The possible states of a subscription.
+    """
+
+    IGNORED = 'IGNORED'
+    SUBSCRIBED = 'SUBSCRIBED'
+    UNSUBSCRIBED = 'UNSUBSCRIBED'
+
+
+class TeamDiscussionCommentOrderField(Enum):
+    """
+    Properties by which team discussion comment connections can be ordered.
+    """
+
+    NUMBER = 'NUMBER'
+
+
+class TeamDiscussionOrderField(Enum):
+    """
+    Properties by which team discussion connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class TeamMemberOrderField(Enum):
+    """
+    Properties by which team member connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    LOGIN = 'LOGIN'
+
+
+class TeamMemberRole(Enum):
+    """
+    The possible team member roles; either 'maintainer' or 'member'.
+    """
+
+    MAINTAINER = 'MAINTAINER'
+    MEMBER = 'MEMBER'
+
+
+class TeamMembershipType(Enum):
+    """
+    Defines which types of team members are included in the returned list. Can be one of IMMEDIATE, CHILD_TEAM or ALL.
+    """
+
+    ALL = 'ALL'
+    CHILD_TEAM = 'CHILD_TEAM'
+    IMMEDIATE = 'IMMEDIATE'
+
+
+class TeamNotificationSetting(Enum):
+    """
+    The possible team notification values.
+    """
+
+    NOTIFICATIONS_DISABLED = 'NOTIFICATIONS_DISABLED'
+    NOTIFICATIONS_ENABLED = 'NOTIFICATIONS_ENABLED'
+
+
+class TeamOrderField(Enum):
+    """
+    Properties by which team connections can be ordered.
+    """
+
+    NAME = 'NAME'
+
+
+class TeamPrivacy(Enum):
+    """
+    The possible team privacy values.
+    """
+
+    SECRET = 'SECRET'
+    VISIBLE = 'VISIBLE'
+
+
+class TeamRepositoryOrderField(Enum):
+    """
+    Properties by which team repository connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    NAME = 'NAME'
+    PERMISSION = 'PERMISSION'
+    PUSHED_AT = 'PUSHED_AT'
+    STARGAZERS = 'STARGAZERS'
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class TeamReviewAssignmentAlgorithm(Enum):
+    """
+    The possible team review assignment algorithms
+    """
+
+    LOAD_BALANCE = 'LOAD_BALANCE'
+    ROUND_ROBIN = 'ROUND_ROBIN'
+
+
+class TeamRole(Enum):
+    """
+    The role of a user on a team.
+    """
+
+    ADMIN = 'ADMIN'
+    MEMBER = 'MEMBER'
+
+
+class ThreadSubscriptionFormAction(Enum):
+    """
+    The possible states of a thread subscription form action
+    """
+
+    NONE = 'NONE'
+    SUBSCRIBE = 'SUBSCRIBE'
+    UNSUBSCRIBE = 'UNSUBSCRIBE'
+
+
+class ThreadSubscriptionState(Enum):
+    """
+    The possible states of a subscription.
+    """
+
+    DISABLED = 'DISABLED'
+    IGNORING_LIST = 'IGNORING_LIST'
+    IGNORING_THREAD = 'IGNORING_THREAD'
+    NONE = 'NONE'
+    SUBSCRIBED_TO_LIST = 'SUBSCRIBED_TO_LIST'
+    SUBSCRIBED_TO_THREAD = 'SUBSCRIBED_TO_THREAD'
+    SUBSCRIBED_TO_THREAD_EVENTS = 'SUBSCRIBED_TO_THREAD_EVENTS'
+    SUBSCRIBED_TO_THREAD_TYPE = 'SUBSCRIBED_TO_THREAD_TYPE'
+    UNAVAILABLE = 'UNAVAILABLE'
+
+
+class TopicSuggestionDeclineReason(Enum):
+    """
+    Reason that the suggested topic is declined.
+    """
+
+    NOT_RELEVANT = 'NOT_RELEVANT'
+    PERSONAL_PREFERENCE = 'PERSONAL_PREFERENCE'
+    TOO_GENERAL = 'TOO_GENERAL'
+    TOO_SPECIFIC = 'TOO_SPECIFIC'
+
+
+class TrackedIssueStates(Enum):
+    """
+    The possible states of a tracked issue.
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+
+class UserBlockDuration(Enum):
+    """
+    The possible durations that a user can be blocked for.
+    """
+
+    ONE_DAY = 'ONE_DAY'
+    ONE_MONTH = 'ONE_MONTH'
+    ONE_WEEK = 'ONE_WEEK'
+    PERMANENT = 'PERMANENT'
+    THREE_DAYS = 'THREE_DAYS'
+
+
+class UserStatusOrderField(Enum):
+    """
+    Properties by which user status connections can be ordered.
+    """
+
+    UPDATED_AT = 'UPDATED_AT'
+
+
+class VerifiableDomainOrderField(Enum):
+    """
+    Properties by which verifiable domain connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+    DOMAIN = 'DOMAIN'
+
+
+class WorkflowRunOrderField(Enum):
+    """
+    Properties by which workflow run connections can be ordered.
+    """
+
+    CREATED_AT = 'CREATED_AT'
+
+
+class WorkflowState(Enum):
+    """
+    The possible states for a workflow.
+    """
+
+    ACTIVE = 'ACTIVE'
+    DELETED = 'DELETED'
+    DISABLED_FORK = 'DISABLED_FORK'
+    DISABLED_INACTIVITY = 'DISABLED_INACTIVITY'
+    DISABLED_MANUALLY = 'DISABLED_MANUALLY'
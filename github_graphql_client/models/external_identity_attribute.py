@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ExternalIdentityAttribute(BaseModel):
+    """
+    An attribute for the External Identity attributes collection
+    """
+
+    metadata: Optional[String] = None
+    name: String
+    value: String
+    typename__: Optional[Literal['ExternalIdentityAttribute']] = Field(
+        'ExternalIdentityAttribute', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ExternalIdentityScimAttributes(BaseModel):
+    """
+    SCIM attributes for the External Identity
+    """
+
+    emails: Optional[List[UserEmailMetadata]] = Field(default_factory=list)
+    familyName: Optional[String] = None
+    givenName: Optional[String] = None
+    groups: Optional[List[String]] = Field(default_factory=list)
+    username: Optional[String] = None
+    typename__: Optional[Literal['ExternalIdentityScimAttributes']] = Field(
+        'ExternalIdentityScimAttributes', alias='__typename'
+    )
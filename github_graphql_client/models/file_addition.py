@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class FileAddition(BaseModel):
+    """
+    A command to add a file at the given path with the given contents as part of a
+    commit.  Any existing file at that that path will be replaced.
+    """
+
+    contents: Base64String
+    path: String
+    typename__: Optional[Literal['FileAddition']] = Field(
+        'FileAddition', alias='__typename'
+    )
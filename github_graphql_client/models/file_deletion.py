@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class FileDeletion(BaseModel):
+    """
+    A command to delete the file at the given path as part of a commit.
+    """
+
+    path: String
+    typename__: Optional[Literal['FileDeletion']] = Field(
+        'FileDeletion', alias='__typename'
+    )
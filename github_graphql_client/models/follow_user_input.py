@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class FollowUserInput(BaseModel):
+    """
+    Autogenerated input type of FollowUser
+    """
+
+    clientMutationId: Optional[String] = None
+    userId: ID
+    typename__: Optional[Literal['FollowUserInput']] = Field(
+        'FollowUserInput', alias='__typename'
+    )
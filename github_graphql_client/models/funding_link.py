@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class FundingLink(BaseModel):
+    """
+    A funding platform link for a repository.
+    """
+
+    platform: FundingPlatform
+    url: URI
+    typename__: Optional[Literal['FundingLink']] = Field(
+        'FundingLink', alias='__typename'
+    )
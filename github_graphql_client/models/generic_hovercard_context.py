@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .hovercard_context import HovercardContext
+
+
+class GenericHovercardContext(HovercardContext):
+    """
+    A generic hovercard context with a message and icon
+    """
+
+    message: String
+    octicon: String
+    typename__: Optional[Literal['GenericHovercardContext']] = Field(
+        'GenericHovercardContext', alias='__typename'
+    )
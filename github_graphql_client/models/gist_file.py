@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class GistFile(BaseModel):
+    """
+    A file in a gist.
+    """
+
+    encodedName: Optional[String] = None
+    encoding: Optional[String] = None
+    extension: Optional[String] = None
+    isImage: Boolean
+    isTruncated: Boolean
+    language: Optional[Language] = None
+    name: Optional[String] = None
+    size: Optional[Int] = None
+    text: Optional[String] = None
+    typename__: Optional[Literal['GistFile']] = Field(
+        'GistFile', alias='__typename'
+    )
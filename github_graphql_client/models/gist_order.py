@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class GistOrder(BaseModel):
+    """
+    Ordering options for gist connections
+    """
+
+    direction: OrderDirection
+    field: GistOrderField
+    typename__: Optional[Literal['GistOrder']] = Field(
+        'GistOrder', alias='__typename'
+    )
@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class GitHubMetadata(BaseModel):
+    """
+    Represents information about the GitHub instance.
+    """
+
+    gitHubServicesSha: GitObjectID
+    gitIpAddresses: Optional[List[String]] = Field(default_factory=list)
+    githubEnterpriseImporterIpAddresses: Optional[List[String]] = Field(
+        default_factory=list
+    )
+    hookIpAddresses: Optional[List[String]] = Field(default_factory=list)
+    importerIpAddresses: Optional[List[String]] = Field(default_factory=list)
+    isPasswordAuthenticationVerifiable: Boolean
+    pagesIpAddresses: Optional[List[String]] = Field(default_factory=list)
+    typename__: Optional[Literal['GitHubMetadata']] = Field(
+        'GitHubMetadata', alias='__typename'
+    )
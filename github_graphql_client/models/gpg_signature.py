@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .core import GitSignature
+
+
+class GpgSignature(GitSignature):
+    """
+    Represents a GPG signature on a Commit or Tag.
+    """
+
+    email: String
+    isValid: Boolean
+    keyId: Optional[String] = None
+    payload: String
+    signature: String
+    signer: Optional[User] = None
+    state: GitSignatureState
+    wasSignedByGitHub: Boolean
+    typename__: Optional[Literal['GpgSignature']] = Field(
+        'GpgSignature', alias='__typename'
+    )
@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Hovercard(BaseModel):
+    """
+    Detail needed to display a hovercard for a user
+    """
+
+    contexts: List[HovercardContext]
+    typename__: Optional[Literal['Hovercard']] = Field(
+        'Hovercard', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class HovercardContext(BaseModel):
+    """
+    An individual line of a hovercard
+    """
+
+    message: String
+    octicon: String
+    typename__: Optional[Literal['HovercardContext']] = Field(
+        'HovercardContext', alias='__typename'
+    )
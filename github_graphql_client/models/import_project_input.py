@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ImportProjectInput(BaseModel):
+    """
+    Autogenerated input type of ImportProject
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    columnImports: List[ProjectColumnImport]
+    name: String
+    ownerName: String
+    public: Optional[Boolean] = False
+    typename__: Optional[Literal['ImportProjectInput']] = Field(
+        'ImportProjectInput', alias='__typename'
+    )
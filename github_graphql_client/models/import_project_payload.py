@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ImportProjectPayload(BaseModel):
+    """
+    Autogenerated return type of ImportProject
+    """
+
+    clientMutationId: Optional[String] = None
+    project: Optional[Project] = None
+    typename__: Optional[Literal['ImportProjectPayload']] = Field(
+        'ImportProjectPayload', alias='__typename'
+    )
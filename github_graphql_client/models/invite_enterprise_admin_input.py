@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class InviteEnterpriseAdminInput(BaseModel):
+    """
+    Autogenerated input type of InviteEnterpriseAdmin
+    """
+
+    clientMutationId: Optional[String] = None
+    email: Optional[String] = None
+    enterpriseId: ID
+    invitee: Optional[String] = None
+    role: Optional[EnterpriseAdministratorRole] = None
+    typename__: Optional[Literal['InviteEnterpriseAdminInput']] = Field(
+        'InviteEnterpriseAdminInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class InviteEnterpriseAdminPayload(BaseModel):
+    """
+    Autogenerated return type of InviteEnterpriseAdmin
+    """
+
+    clientMutationId: Optional[String] = None
+    invitation: Optional[EnterpriseAdministratorInvitation] = None
+    typename__: Optional[Literal['InviteEnterpriseAdminPayload']] = Field(
+        'InviteEnterpriseAdminPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class IpAllowListEntryOrder(BaseModel):
+    """
+    Ordering options for IP allow list entry connections.
+    """
+
+    direction: OrderDirection
+    field: IpAllowListEntryOrderField
+    typename__: Optional[Literal['IpAllowListEntryOrder']] = Field(
+        'IpAllowListEntryOrder', alias='__typename'
+    )
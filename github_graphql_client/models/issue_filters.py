@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class IssueFilters(BaseModel):
+    """
+    Ways in which to filter lists of issues.
+    """
+
+    assignee: Optional[String] = None
+    createdBy: Optional[String] = None
+    labels: Optional[List[String]] = None
+    mentioned: Optional[String] = None
+    milestone: Optional[String] = None
+    milestoneNumber: Optional[String] = None
+    since: Optional[DateTime] = None
+    states: Optional[List[IssueState]] = None
+    viewerSubscribed: Optional[Boolean] = False
+    typename__: Optional[Literal['IssueFilters']] = Field(
+        'IssueFilters', alias='__typename'
+    )
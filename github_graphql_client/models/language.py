@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class Language(Node):
+    """
+    Represents a given language found in repositories.
+    """
+
+    color: Optional[String] = None
+    id: ID
+    name: String
+    typename__: Optional[Literal['Language']] = Field(
+        'Language', alias='__typename'
+    )
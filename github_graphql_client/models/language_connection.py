@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class LanguageConnection(BaseModel):
+    """
+    A list of languages associated with the parent.
+    """
+
+    edges: Optional[List[Optional[LanguageEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Language]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    totalSize: Int
+    typename__: Optional[Literal['LanguageConnection']] = Field(
+        'LanguageConnection', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class LanguageEdge(BaseModel):
+    """
+    Represents the language of a repository.
+    """
+
+    cursor: String
+    node: Language
+    size: Int
+    typename__: Optional[Literal['LanguageEdge']] = Field(
+        'LanguageEdge', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class LanguageOrder(BaseModel):
+    """
+    Ordering options for language connections.
+    """
+
+    direction: OrderDirection
+    field: LanguageOrderField
+    typename__: Optional[Literal['LanguageOrder']] = Field(
+        'LanguageOrder', alias='__typename'
+    )
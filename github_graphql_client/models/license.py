@@ -0,0 +1,35 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class License(Node):
+    """
+    A repository's open source license
+    """
+
+    body: String
+    conditions: List[Optional[LicenseRule]]
+    description: Optional[String] = None
+    featured: Boolean
+    hidden: Boolean
+    id: ID
+    implementation: Optional[String] = None
+    key: String
+    limitations: List[Optional[LicenseRule]]
+    name: String
+    nickname: Optional[String] = None
+    permissions: List[Optional[LicenseRule]]
+    pseudoLicense: Boolean
+    spdxId: Optional[String] = None
+    url: Optional[URI] = None
+    typename__: Optional[Literal['License']] = Field(
+        'License', alias='__typename'
+    )
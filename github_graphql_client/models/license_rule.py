@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class LicenseRule(BaseModel):
+    """
+    Describes a License's conditions, permissions, and limitations
+    """
+
+    description: String
+    key: String
+    label: String
+    typename__: Optional[Literal['LicenseRule']] = Field(
+        'LicenseRule', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class LinkProjectV2ToRepositoryInput(BaseModel):
+    """
+    Autogenerated input type of LinkProjectV2ToRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    projectId: ID
+    repositoryId: ID
+    typename__: Optional[Literal['LinkProjectV2ToRepositoryInput']] = Field(
+        'LinkProjectV2ToRepositoryInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class LinkProjectV2ToRepositoryPayload(BaseModel):
+    """
+    Autogenerated return type of LinkProjectV2ToRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    repository: Optional[Repository] = None
+    typename__: Optional[Literal['LinkProjectV2ToRepositoryPayload']] = Field(
+        'LinkProjectV2ToRepositoryPayload', alias='__typename'
+    )
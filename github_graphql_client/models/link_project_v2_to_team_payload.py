@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class LinkProjectV2ToTeamPayload(BaseModel):
+    """
+    Autogenerated return type of LinkProjectV2ToTeam
+    """
+
+    clientMutationId: Optional[String] = None
+    team: Optional[Team] = None
+    typename__: Optional[Literal['LinkProjectV2ToTeamPayload']] = Field(
+        'LinkProjectV2ToTeamPayload', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class LinkRepositoryToProjectInput(BaseModel):
+    """
+    Autogenerated input type of LinkRepositoryToProject
+    """
+
+    clientMutationId: Optional[String] = None
+    projectId: ID
+    repositoryId: ID
+    typename__: Optional[Literal['LinkRepositoryToProjectInput']] = Field(
+        'LinkRepositoryToProjectInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class LockLockableInput(BaseModel):
+    """
+    Autogenerated input type of LockLockable
+    """
+
+    clientMutationId: Optional[String] = None
+    lockReason: Optional[LockReason] = None
+    lockableId: ID
+    typename__: Optional[Literal['LockLockableInput']] = Field(
+        'LockLockableInput', alias='__typename'
+    )
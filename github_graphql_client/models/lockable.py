@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Lockable(BaseModel):
+    """
+    An object that can be locked.
+    """
+
+    activeLockReason: Optional[LockReason] = None
+    locked: Boolean
+    typename__: Optional[Literal['Lockable']] = Field(
+        'Lockable', alias='__typename'
+    )
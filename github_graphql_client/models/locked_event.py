@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class LockedEvent(Node):
+    """
+    Represents a 'locked' event on a given issue or pull request.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    lockReason: Optional[LockReason] = None
+    lockable: Lockable
+    typename__: Optional[Literal['LockedEvent']] = Field(
+        'LockedEvent', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MannequinOrder(BaseModel):
+    """
+    Ordering options for mannequins.
+    """
+
+    direction: OrderDirection
+    field: MannequinOrderField
+    typename__: Optional[Literal['MannequinOrder']] = Field(
+        'MannequinOrder', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MarkFileAsViewedPayload(BaseModel):
+    """
+    Autogenerated return type of MarkFileAsViewed
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['MarkFileAsViewedPayload']] = Field(
+        'MarkFileAsViewedPayload', alias='__typename'
+    )
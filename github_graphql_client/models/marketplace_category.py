@@ -0,0 +1,29 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class MarketplaceCategory(Node):
+    """
+    A public description of a Marketplace category.
+    """
+
+    description: Optional[String] = None
+    howItWorks: Optional[String] = None
+    id: ID
+    name: String
+    primaryListingCount: Int
+    resourcePath: URI
+    secondaryListingCount: Int
+    slug: String
+    url: URI
+    typename__: Optional[Literal['MarketplaceCategory']] = Field(
+        'MarketplaceCategory', alias='__typename'
+    )
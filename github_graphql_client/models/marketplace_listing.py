@@ -0,0 +1,76 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class MarketplaceListing(Node):
+    """
+    A listing in the GitHub integration marketplace.
+    """
+
+    app: Optional[App] = None
+    companyUrl: Optional[URI] = None
+    configurationResourcePath: URI
+    configurationUrl: URI
+    documentationUrl: Optional[URI] = None
+    extendedDescription: Optional[String] = None
+    extendedDescriptionHTML: HTML
+    fullDescription: String
+    fullDescriptionHTML: HTML
+    hasPublishedFreeTrialPlans: Boolean
+    hasTermsOfService: Boolean
+    hasVerifiedOwner: Boolean
+    howItWorks: Optional[String] = None
+    howItWorksHTML: HTML
+    id: ID
+    installationUrl: Optional[URI] = None
+    installedForViewer: Boolean
+    isArchived: Boolean
+    isDraft: Boolean
+    isPaid: Boolean
+    isPublic: Boolean
+    isRejected: Boolean
+    isUnverified: Boolean
+    isUnverifiedPending: Boolean
+    isVerificationPendingFromDraft: Boolean
+    isVerificationPendingFromUnverified: Boolean
+    isVerified: Boolean
+    logoBackgroundColor: String
+    logoUrl: Optional[URI] = None
+    name: String
+    normalizedShortDescription: String
+    pricingUrl: Optional[URI] = None
+    primaryCategory: MarketplaceCategory
+    privacyPolicyUrl: URI
+    resourcePath: URI
+    screenshotUrls: List[Optional[String]]
+    secondaryCategory: Optional[MarketplaceCategory] = None
+    shortDescription: String
+    slug: String
+    statusUrl: Optional[URI] = None
+    supportEmail: Optional[String] = None
+    supportUrl: URI
+    termsOfServiceUrl: Optional[URI] = None
+    url: URI
+    viewerCanAddPlans: Boolean
+    viewerCanApprove: Boolean
+    viewerCanDelist: Boolean
+    viewerCanEdit: Boolean
+    viewerCanEditCategories: Boolean
+    viewerCanEditPlans: Boolean
+    viewerCanRedraft: Boolean
+    viewerCanReject: Boolean
+    viewerCanRequestApproval: Boolean
+    viewerHasPurchased: Boolean
+    viewerHasPurchasedForAllOrganizations: Boolean
+    viewerIsListingAdmin: Boolean
+    typename__: Optional[Literal['MarketplaceListing']] = Field(
+        'MarketplaceListing', alias='__typename'
+    )
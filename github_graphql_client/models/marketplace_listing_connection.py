@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MarketplaceListingConnection(BaseModel):
+    """
+    Look up Marketplace Listings
+    """
+
+    edges: Optional[List[Optional[MarketplaceListingEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[MarketplaceListing]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['MarketplaceListingConnection']] = Field(
+        'MarketplaceListingConnection', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class MemberFeatureRequestNotification(Node):
+    """
+    Represents a member feature request notification
+    """
+
+    body: String
+    id: ID
+    title: String
+    updatedAt: DateTime
+    typename__: Optional[Literal['MemberFeatureRequestNotification']] = Field(
+        'MemberFeatureRequestNotification', alias='__typename'
+    )
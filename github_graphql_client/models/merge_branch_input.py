@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MergeBranchInput(BaseModel):
+    """
+    Autogenerated input type of MergeBranch
+    """
+
+    authorEmail: Optional[String] = None
+    base: String
+    clientMutationId: Optional[String] = None
+    commitMessage: Optional[String] = None
+    head: String
+    repositoryId: ID
+    typename__: Optional[Literal['MergeBranchInput']] = Field(
+        'MergeBranchInput', alias='__typename'
+    )
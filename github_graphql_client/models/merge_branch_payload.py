@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MergeBranchPayload(BaseModel):
+    """
+    Autogenerated return type of MergeBranch
+    """
+
+    clientMutationId: Optional[String] = None
+    mergeCommit: Optional[Commit] = None
+    typename__: Optional[Literal['MergeBranchPayload']] = Field(
+        'MergeBranchPayload', alias='__typename'
+    )
@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MergeQueueConfiguration(BaseModel):
+    """
+    Configuration for a MergeQueue
+    """
+
+    checkResponseTimeout: Optional[Int] = None
+    maximumEntriesToBuild: Optional[Int] = None
+    maximumEntriesToMerge: Optional[Int] = None
+    mergeMethod: Optional[PullRequestMergeMethod] = None
+    mergingStrategy: Optional[MergeQueueMergingStrategy] = None
+    minimumEntriesToMerge: Optional[Int] = None
+    minimumEntriesToMergeWaitTime: Optional[Int] = None
+    typename__: Optional[Literal['MergeQueueConfiguration']] = Field(
+        'MergeQueueConfiguration', alias='__typename'
+    )
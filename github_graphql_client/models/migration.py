@@ -0,0 +1,30 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Migration(BaseModel):
+    """
+    Represents a GitHub Enterprise Importer (GEI) migration.
+    """
+
+    continueOnError: Boolean
+    createdAt: DateTime
+    databaseId: Optional[String] = None
+    failureReason: Optional[String] = None
+    id: ID
+    migrationLogUrl: Optional[URI] = None
+    migrationSource: MigrationSource
+    repositoryName: String
+    sourceUrl: URI
+    state: MigrationState
+    warningsCount: Int
+    typename__: Optional[Literal['Migration']] = Field(
+        'Migration', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class MigrationSource(Node):
+    """
+    A GitHub Enterprise Importer (GEI) migration source.
+    """
+
+    id: ID
+    name: String
+    type: MigrationSourceType
+    url: URI
+    typename__: Optional[Literal['MigrationSource']] = Field(
+        'MigrationSource', alias='__typename'
+    )
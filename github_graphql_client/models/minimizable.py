@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Minimizable(BaseModel):
+    """
+    Entities that can be minimized.
+    """
+
+    isMinimized: Boolean
+    minimizedReason: Optional[String] = None
+    viewerCanMinimize: Boolean
+    typename__: Optional[Literal['Minimizable']] = Field(
+        'Minimizable', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MinimizeCommentPayload(BaseModel):
+    """
+    Autogenerated return type of MinimizeComment
+    """
+
+    clientMutationId: Optional[String] = None
+    minimizedComment: Optional[Minimizable] = None
+    typename__: Optional[Literal['MinimizeCommentPayload']] = Field(
+        'MinimizeCommentPayload', alias='__typename'
+    )
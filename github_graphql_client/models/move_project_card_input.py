@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MoveProjectCardInput(BaseModel):
+    """
+    Autogenerated input type of MoveProjectCard
+    """
+
+    afterCardId: Optional[ID] = None
+    cardId: ID
+    clientMutationId: Optional[String] = None
+    columnId: ID
+    typename__: Optional[Literal['MoveProjectCardInput']] = Field(
+        'MoveProjectCardInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MoveProjectColumnInput(BaseModel):
+    """
+    Autogenerated input type of MoveProjectColumn
+    """
+
+    afterColumnId: Optional[ID] = None
+    clientMutationId: Optional[String] = None
+    columnId: ID
+    typename__: Optional[Literal['MoveProjectColumnInput']] = Field(
+        'MoveProjectColumnInput', alias='__typename'
+    )
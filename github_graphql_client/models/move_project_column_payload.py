@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class MoveProjectColumnPayload(BaseModel):
+    """
+    Autogenerated return type of MoveProjectColumn
+    """
+
+    clientMutationId: Optional[String] = None
+    columnEdge: Optional[ProjectColumnEdge] = None
+    typename__: Optional[Literal['MoveProjectColumnPayload']] = Field(
+        'MoveProjectColumnPayload', alias='__typename'
+    )
@@ -0,0 +1,18 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Node(BaseModel):
+    """
+    An object with an ID.
+    """
+
+    id: ID
+    typename__: Optional[Literal['Node']] = Field('Node', alias='__typename')
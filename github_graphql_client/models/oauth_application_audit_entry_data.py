@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class OauthApplicationAuditEntryData(BaseModel):
+    """
+    Metadata for an audit entry with action oauth_application.*
+    """
+
+    oauthApplicationName: Optional[String] = None
+    oauthApplicationResourcePath: Optional[URI] = None
+    oauthApplicationUrl: Optional[URI] = None
+    typename__: Optional[Literal['OauthApplicationAuditEntryData']] = Field(
+        'OauthApplicationAuditEntryData', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class OrgEnterpriseOwnerOrder(BaseModel):
+    """
+    Ordering options for an organization's enterprise owner connections.
+    """
+
+    direction: OrderDirection
+    field: OrgEnterpriseOwnerOrderField
+    typename__: Optional[Literal['OrgEnterpriseOwnerOrder']] = Field(
+        'OrgEnterpriseOwnerOrder', alias='__typename'
+    )
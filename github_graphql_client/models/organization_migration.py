@@ -0,0 +1,30 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class OrganizationMigration(Node):
+    """
+    A GitHub Enterprise Importer (GEI) organization migration.
+    """
+
+    createdAt: DateTime
+    databaseId: Optional[String] = None
+    failureReason: Optional[String] = None
+    id: ID
+    remainingRepositoriesCount: Optional[Int] = None
+    sourceOrgName: String
+    sourceOrgUrl: URI
+    state: OrganizationMigrationState
+    targetOrgName: String
+    totalRepositoriesCount: Optional[Int] = None
+    typename__: Optional[Literal['OrganizationMigration']] = Field(
+        'OrganizationMigration', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class OrganizationOrder(BaseModel):
+    """
+    Ordering options for organization connections.
+    """
+
+    direction: OrderDirection
+    field: OrganizationOrderField
+    typename__: Optional[Literal['OrganizationOrder']] = Field(
+        'OrganizationOrder', alias='__typename'
+    )
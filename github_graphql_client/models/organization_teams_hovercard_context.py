@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .hovercard_context import HovercardContext
+
+
+class OrganizationTeamsHovercardContext(HovercardContext):
+    """
+    An organization teams hovercard context
+    """
+
+    message: String
+    octicon: String
+    relevantTeams: TeamConnection
+    teamsResourcePath: URI
+    teamsUrl: URI
+    totalTeamCount: Int
+    typename__: Optional[Literal['OrganizationTeamsHovercardContext']] = Field(
+        'OrganizationTeamsHovercardContext', alias='__typename'
+    )
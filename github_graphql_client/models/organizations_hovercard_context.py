@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .hovercard_context import HovercardContext
+
+
+class OrganizationsHovercardContext(HovercardContext):
+    """
+    An organization list hovercard context
+    """
+
+    message: String
+    octicon: String
+    relevantOrganizations: OrganizationConnection
+    totalOrganizationCount: Int
+    typename__: Optional[Literal['OrganizationsHovercardContext']] = Field(
+        'OrganizationsHovercardContext', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PackageOrder(BaseModel):
+    """
+    Ways in which lists of packages can be ordered upon return.
+    """
+
+    direction: Optional[OrderDirection] = None
+    field: Optional[PackageOrderField] = None
+    typename__: Optional[Literal['PackageOrder']] = Field(
+        'PackageOrder', alias='__typename'
+    )
@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PackageStatistics(BaseModel):
+    """
+    Represents a object that contains package activity statistics such as downloads.
+    """
+
+    downloadsTotalCount: Int
+    typename__: Optional[Literal['PackageStatistics']] = Field(
+        'PackageStatistics', alias='__typename'
+    )
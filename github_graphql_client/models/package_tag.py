@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class PackageTag(Node):
+    """
+    A version tag contains the mapping between a tag name and a version.
+    """
+
+    id: ID
+    name: String
+    version: Optional[PackageVersion] = None
+    typename__: Optional[Literal['PackageTag']] = Field(
+        'PackageTag', alias='__typename'
+    )
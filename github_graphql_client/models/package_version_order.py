@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PackageVersionOrder(BaseModel):
+    """
+    Ways in which lists of package versions can be ordered upon return.
+    """
+
+    direction: Optional[OrderDirection] = None
+    field: Optional[PackageVersionOrderField] = None
+    typename__: Optional[Literal['PackageVersionOrder']] = Field(
+        'PackageVersionOrder', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PageInfo(BaseModel):
+    """
+    Information about pagination in a connection.
+    """
+
+    endCursor: Optional[String] = None
+    hasNextPage: Boolean
+    hasPreviousPage: Boolean
+    startCursor: Optional[String] = None
+    typename__: Optional[Literal['PageInfo']] = Field(
+        'PageInfo', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectCardImport(BaseModel):
+    """
+    An issue or PR and its owning repository to be used in a project card.
+    """
+
+    number: Int
+    repository: String
+    typename__: Optional[Literal['ProjectCardImport']] = Field(
+        'ProjectCardImport', alias='__typename'
+    )
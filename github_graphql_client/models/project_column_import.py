@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectColumnImport(BaseModel):
+    """
+    A project column and a list of its issues and PRs.
+    """
+
+    columnName: String
+    issues: Optional[List[ProjectCardImport]] = None
+    position: Int
+    typename__: Optional[Literal['ProjectColumnImport']] = Field(
+        'ProjectColumnImport', alias='__typename'
+    )
@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectProgress(BaseModel):
+    """
+    Project progress stats.
+    """
+
+    doneCount: Int
+    donePercentage: Float
+    enabled: Boolean
+    inProgressCount: Int
+    inProgressPercentage: Float
+    todoCount: Int
+    todoPercentage: Float
+    typename__: Optional[Literal['ProjectProgress']] = Field(
+        'ProjectProgress', alias='__typename'
+    )
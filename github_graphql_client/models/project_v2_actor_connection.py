@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2ActorConnection(BaseModel):
+    """
+    The connection type for ProjectV2Actor.
+    """
+
+    edges: Optional[List[Optional[ProjectV2ActorEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[ProjectV2Actor]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['ProjectV2ActorConnection']] = Field(
+        'ProjectV2ActorConnection', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2ActorEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[ProjectV2Actor] = None
+    typename__: Optional[Literal['ProjectV2ActorEdge']] = Field(
+        'ProjectV2ActorEdge', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2Collaborator(BaseModel):
+    """
+    A collaborator to update on a project. Only one of the userId or teamId should be provided.
+    """
+
+    role: ProjectV2Roles
+    teamId: Optional[ID] = None
+    userId: Optional[ID] = None
+    typename__: Optional[Literal['ProjectV2Collaborator']] = Field(
+        'ProjectV2Collaborator', alias='__typename'
+    )
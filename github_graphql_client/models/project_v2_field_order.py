@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2FieldOrder(BaseModel):
+    """
+    Ordering options for project v2 field connections
+    """
+
+    direction: OrderDirection
+    field: ProjectV2FieldOrderField
+    typename__: Optional[Literal['ProjectV2FieldOrder']] = Field(
+        'ProjectV2FieldOrder', alias='__typename'
+    )
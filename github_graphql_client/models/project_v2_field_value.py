@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2FieldValue(BaseModel):
+    """
+    The values that can be used to update a field of an item inside a Project. Only 1 value can be updated at a time.
+    """
+
+    date: Optional[Date] = None
+    iterationId: Optional[String] = None
+    number: Optional[Float] = None
+    singleSelectOptionId: Optional[String] = None
+    text: Optional[String] = None
+    typename__: Optional[Literal['ProjectV2FieldValue']] = Field(
+        'ProjectV2FieldValue', alias='__typename'
+    )
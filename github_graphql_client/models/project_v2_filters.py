@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2Filters(BaseModel):
+    """
+    Ways in which to filter lists of projects.
+    """
+
+    state: Optional[ProjectV2State] = None
+    typename__: Optional[Literal['ProjectV2Filters']] = Field(
+        'ProjectV2Filters', alias='__typename'
+    )
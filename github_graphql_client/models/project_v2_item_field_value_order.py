@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2ItemFieldValueOrder(BaseModel):
+    """
+    Ordering options for project v2 item field value connections
+    """
+
+    direction: OrderDirection
+    field: ProjectV2ItemFieldValueOrderField
+    typename__: Optional[Literal['ProjectV2ItemFieldValueOrder']] = Field(
+        'ProjectV2ItemFieldValueOrder', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2IterationFieldConfiguration(BaseModel):
+    """
+    Iteration field configuration for a project.
+    """
+
+    completedIterations: List[ProjectV2IterationFieldIteration]
+    duration: Int
+    iterations: List[ProjectV2IterationFieldIteration]
+    startDay: Int
+    typename__: Optional[
+        Literal['ProjectV2IterationFieldConfiguration']
+    ] = Field('ProjectV2IterationFieldConfiguration', alias='__typename')
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2IterationFieldIteration(BaseModel):
+    """
+    Iteration field iteration settings for a project.
+    """
+
+    duration: Int
+    id: String
+    startDate: Date
+    title: String
+    titleHTML: String
+    typename__: Optional[Literal['ProjectV2IterationFieldIteration']] = Field(
+        'ProjectV2IterationFieldIteration', alias='__typename'
+    )
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2SingleSelectFieldOption(BaseModel):
+    """
+    Single select field option for a configuration for a project.
+    """
+
+    color: ProjectV2SingleSelectFieldOptionColor
+    description: String
+    descriptionHTML: String
+    id: String
+    name: String
+    nameHTML: String
+    typename__: Optional[Literal['ProjectV2SingleSelectFieldOption']] = Field(
+        'ProjectV2SingleSelectFieldOption', alias='__typename'
+    )
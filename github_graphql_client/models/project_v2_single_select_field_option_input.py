@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2SingleSelectFieldOptionInput(BaseModel):
+    """
+    Represents a single select field option
+    """
+
+    color: ProjectV2SingleSelectFieldOptionColor
+    description: String
+    name: String
+    typename__: Optional[
+        Literal['ProjectV2SingleSelectFieldOptionInput']
+    ] = Field('ProjectV2SingleSelectFieldOptionInput', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ProjectV2WorkflowOrder(BaseModel):
+    """
+    Ordering options for project v2 workflows connections
+    """
+
+    direction: OrderDirection
+    field: ProjectV2WorkflowsOrderField
+    typename__: Optional[Literal['ProjectV2WorkflowOrder']] = Field(
+        'ProjectV2WorkflowOrder', alias='__typename'
+    )
@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class PublicKey(Node):
+    """
+    A user's public key.
+    """
+
+    accessedAt: Optional[DateTime] = None
+    createdAt: Optional[DateTime] = None
+    fingerprint: String
+    id: ID
+    isReadOnly: Optional[Boolean] = None
+    key: String
+    updatedAt: Optional[DateTime] = None
+    typename__: Optional[Literal['PublicKey']] = Field(
+        'PublicKey', alias='__typename'
+    )
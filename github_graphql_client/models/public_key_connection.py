@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PublicKeyConnection(BaseModel):
+    """
+    The connection type for PublicKey.
+    """
+
+    edges: Optional[List[Optional[PublicKeyEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PublicKey]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PublicKeyConnection']] = Field(
+        'PublicKeyConnection', alias='__typename'
+    )
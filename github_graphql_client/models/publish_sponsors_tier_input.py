@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PublishSponsorsTierInput(BaseModel):
+    """
+    Autogenerated input type of PublishSponsorsTier
+    """
+
+    clientMutationId: Optional[String] = None
+    tierId: ID
+    typename__: Optional[Literal['PublishSponsorsTierInput']] = Field(
+        'PublishSponsorsTierInput', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PullRequestChangedFile(BaseModel):
+    """
+    A file changed in a pull request.
+    """
+
+    additions: Int
+    changeType: PatchStatus
+    deletions: Int
+    path: String
+    viewerViewedState: FileViewedState
+    typename__: Optional[Literal['PullRequestChangedFile']] = Field(
+        'PullRequestChangedFile', alias='__typename'
+    )
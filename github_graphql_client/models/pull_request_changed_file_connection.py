@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PullRequestChangedFileConnection(BaseModel):
+    """
+    The connection type for PullRequestChangedFile.
+    """
+
+    edges: Optional[List[Optional[PullRequestChangedFileEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[PullRequestChangedFile]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['PullRequestChangedFileConnection']] = Field(
+        'PullRequestChangedFileConnection', alias='__typename'
+    )
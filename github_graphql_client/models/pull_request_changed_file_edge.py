@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PullRequestChangedFileEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[PullRequestChangedFile] = None
+    typename__: Optional[Literal['PullRequestChangedFileEdge']] = Field(
+        'PullRequestChangedFileEdge', alias='__typename'
+    )
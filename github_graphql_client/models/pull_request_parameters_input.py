@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class PullRequestParametersInput(BaseModel):
+    """
+    Require all commits be made to a non-target branch and submitted via a pull request before they can be merged.
+    """
+
+    dismissStaleReviewsOnPush: Boolean
+    requireCodeOwnerReview: Boolean
+    requireLastPushApproval: Boolean
+    requiredApprovingReviewCount: Int
+    requiredReviewThreadResolution: Boolean
+    typename__: Optional[Literal['PullRequestParametersInput']] = Field(
+        'PullRequestParametersInput', alias='__typename'
+    )
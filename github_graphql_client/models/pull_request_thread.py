@@ -0,0 +1,37 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class PullRequestThread(Node):
+    """
+    A threaded list of comments for a given pull request.
+    """
+
+    comments: PullRequestReviewCommentConnection
+    diffSide: DiffSide
+    id: ID
+    isCollapsed: Boolean
+    isOutdated: Boolean
+    isResolved: Boolean
+    line: Optional[Int] = None
+    path: String
+    pullRequest: PullRequest
+    repository: Repository
+    resolvedBy: Optional[User] = None
+    startDiffSide: Optional[DiffSide] = None
+    startLine: Optional[Int] = None
+    subjectType: PullRequestReviewThreadSubjectType
+    viewerCanReply: Boolean
+    viewerCanResolve: Boolean
+    viewerCanUnresolve: Boolean
+    typename__: Optional[Literal['PullRequestThread']] = Field(
+        'PullRequestThread', alias='__typename'
+    )
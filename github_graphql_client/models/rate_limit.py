@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RateLimit(BaseModel):
+    """
+    Represents the client's rate limit.
+    """
+
+    cost: Int
+    limit: Int
+    nodeCount: Int
+    remaining: Int
+    resetAt: DateTime
+    used: Int
+    typename__: Optional[Literal['RateLimit']] = Field(
+        'RateLimit', alias='__typename'
+    )
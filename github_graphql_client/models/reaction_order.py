@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ReactionOrder(BaseModel):
+    """
+    Ways in which lists of reactions can be ordered upon return.
+    """
+
+    direction: OrderDirection
+    field: ReactionOrderField
+    typename__: Optional[Literal['ReactionOrder']] = Field(
+        'ReactionOrder', alias='__typename'
+    )
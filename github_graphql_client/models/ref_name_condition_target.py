@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RefNameConditionTarget(BaseModel):
+    """
+    Parameters to be used for the ref_name condition
+    """
+
+    exclude: List[String]
+    include: List[String]
+    typename__: Optional[Literal['RefNameConditionTarget']] = Field(
+        'RefNameConditionTarget', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RefOrder(BaseModel):
+    """
+    Ways in which lists of git refs can be ordered upon return.
+    """
+
+    direction: OrderDirection
+    field: RefOrderField
+    typename__: Optional[Literal['RefOrder']] = Field(
+        'RefOrder', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RefUpdate(BaseModel):
+    """
+    A ref update
+    """
+
+    afterOid: GitObjectID
+    beforeOid: Optional[GitObjectID] = None
+    force: Optional[Boolean] = False
+    name: GitRefname
+    typename__: Optional[Literal['RefUpdate']] = Field(
+        'RefUpdate', alias='__typename'
+    )
@@ -0,0 +1,33 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RefUpdateRule(BaseModel):
+    """
+    Branch protection rules that are enforced on the viewer.
+    """
+
+    allowsDeletions: Boolean
+    allowsForcePushes: Boolean
+    blocksCreations: Boolean
+    pattern: String
+    requiredApprovingReviewCount: Optional[Int] = None
+    requiredStatusCheckContexts: Optional[List[Optional[String]]] = Field(
+        default_factory=list
+    )
+    requiresCodeOwnerReviews: Boolean
+    requiresConversationResolution: Boolean
+    requiresLinearHistory: Boolean
+    requiresSignatures: Boolean
+    viewerAllowedToDismissReviews: Boolean
+    viewerCanPush: Boolean
+    typename__: Optional[Literal['RefUpdateRule']] = Field(
+        'RefUpdateRule', alias='__typename'
+    )
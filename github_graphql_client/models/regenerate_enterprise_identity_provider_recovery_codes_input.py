@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RegenerateEnterpriseIdentityProviderRecoveryCodesInput(BaseModel):
+    """
+    Autogenerated input type of RegenerateEnterpriseIdentityProviderRecoveryCodes
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    typename__: Optional[
+        Literal['RegenerateEnterpriseIdentityProviderRecoveryCodesInput']
+    ] = Field(
+        'RegenerateEnterpriseIdentityProviderRecoveryCodesInput',
+        alias='__typename',
+    )
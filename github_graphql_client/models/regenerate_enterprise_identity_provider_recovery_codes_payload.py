@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RegenerateEnterpriseIdentityProviderRecoveryCodesPayload(BaseModel):
+    """
+    Autogenerated return type of RegenerateEnterpriseIdentityProviderRecoveryCodes
+    """
+
+    clientMutationId: Optional[String] = None
+    identityProvider: Optional[EnterpriseIdentityProvider] = None
+    typename__: Optional[
+        Literal['RegenerateEnterpriseIdentityProviderRecoveryCodesPayload']
+    ] = Field(
+        'RegenerateEnterpriseIdentityProviderRecoveryCodesPayload',
+        alias='__typename',
+    )
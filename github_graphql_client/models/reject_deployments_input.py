@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RejectDeploymentsInput(BaseModel):
+    """
+    Autogenerated input type of RejectDeployments
+    """
+
+    clientMutationId: Optional[String] = None
+    comment: Optional[String] = ''
+    environmentIds: List[ID]
+    workflowRunId: ID
+    typename__: Optional[Literal['RejectDeploymentsInput']] = Field(
+        'RejectDeploymentsInput', alias='__typename'
+    )
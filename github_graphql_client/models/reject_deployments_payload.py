@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RejectDeploymentsPayload(BaseModel):
+    """
+    Autogenerated return type of RejectDeployments
+    """
+
+    clientMutationId: Optional[String] = None
+    deployments: Optional[List[Deployment]] = Field(default_factory=list)
+    typename__: Optional[Literal['RejectDeploymentsPayload']] = Field(
+        'RejectDeploymentsPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ReleaseOrder(BaseModel):
+    """
+    Ways in which lists of releases can be ordered upon return.
+    """
+
+    direction: OrderDirection
+    field: ReleaseOrderField
+    typename__: Optional[Literal['ReleaseOrder']] = Field(
+        'ReleaseOrder', alias='__typename'
+    )
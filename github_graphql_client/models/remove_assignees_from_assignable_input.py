@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveAssigneesFromAssignableInput(BaseModel):
+    """
+    Autogenerated input type of RemoveAssigneesFromAssignable
+    """
+
+    assignableId: ID
+    assigneeIds: List[ID]
+    clientMutationId: Optional[String] = None
+    typename__: Optional[
+        Literal['RemoveAssigneesFromAssignableInput']
+    ] = Field('RemoveAssigneesFromAssignableInput', alias='__typename')
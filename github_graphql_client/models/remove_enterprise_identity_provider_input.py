@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveEnterpriseIdentityProviderInput(BaseModel):
+    """
+    Autogenerated input type of RemoveEnterpriseIdentityProvider
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    typename__: Optional[
+        Literal['RemoveEnterpriseIdentityProviderInput']
+    ] = Field('RemoveEnterpriseIdentityProviderInput', alias='__typename')
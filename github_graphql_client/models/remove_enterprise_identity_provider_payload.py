@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveEnterpriseIdentityProviderPayload(BaseModel):
+    """
+    Autogenerated return type of RemoveEnterpriseIdentityProvider
+    """
+
+    clientMutationId: Optional[String] = None
+    identityProvider: Optional[EnterpriseIdentityProvider] = None
+    typename__: Optional[
+        Literal['RemoveEnterpriseIdentityProviderPayload']
+    ] = Field('RemoveEnterpriseIdentityProviderPayload', alias='__typename')
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveEnterpriseMemberInput(BaseModel):
+    """
+    Autogenerated input type of RemoveEnterpriseMember
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    userId: ID
+    typename__: Optional[Literal['RemoveEnterpriseMemberInput']] = Field(
+        'RemoveEnterpriseMemberInput', alias='__typename'
+    )
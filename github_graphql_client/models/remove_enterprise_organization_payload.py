@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveEnterpriseOrganizationPayload(BaseModel):
+    """
+    Autogenerated return type of RemoveEnterpriseOrganization
+    """
+
+    clientMutationId: Optional[String] = None
+    enterprise: Optional[Enterprise] = None
+    organization: Optional[Organization] = None
+    viewer: Optional[User] = None
+    typename__: Optional[
+        Literal['RemoveEnterpriseOrganizationPayload']
+    ] = Field('RemoveEnterpriseOrganizationPayload', alias='__typename')
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveEnterpriseSupportEntitlementInput(BaseModel):
+    """
+    Autogenerated input type of RemoveEnterpriseSupportEntitlement
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    login: String
+    typename__: Optional[
+        Literal['RemoveEnterpriseSupportEntitlementInput']
+    ] = Field('RemoveEnterpriseSupportEntitlementInput', alias='__typename')
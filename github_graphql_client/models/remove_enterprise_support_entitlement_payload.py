@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveEnterpriseSupportEntitlementPayload(BaseModel):
+    """
+    Autogenerated return type of RemoveEnterpriseSupportEntitlement
+    """
+
+    clientMutationId: Optional[String] = None
+    message: Optional[String] = None
+    typename__: Optional[
+        Literal['RemoveEnterpriseSupportEntitlementPayload']
+    ] = Field('RemoveEnterpriseSupportEntitlementPayload', alias='__typename')
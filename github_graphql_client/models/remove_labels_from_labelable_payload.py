@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveLabelsFromLabelablePayload(BaseModel):
+    """
+    Autogenerated return type of RemoveLabelsFromLabelable
+    """
+
+    clientMutationId: Optional[String] = None
+    labelable: Optional[Labelable] = None
+    typename__: Optional[Literal['RemoveLabelsFromLabelablePayload']] = Field(
+        'RemoveLabelsFromLabelablePayload', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveOutsideCollaboratorInput(BaseModel):
+    """
+    Autogenerated input type of RemoveOutsideCollaborator
+    """
+
+    clientMutationId: Optional[String] = None
+    organizationId: ID
+    userId: ID
+    typename__: Optional[Literal['RemoveOutsideCollaboratorInput']] = Field(
+        'RemoveOutsideCollaboratorInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveOutsideCollaboratorPayload(BaseModel):
+    """
+    Autogenerated return type of RemoveOutsideCollaborator
+    """
+
+    clientMutationId: Optional[String] = None
+    removedUser: Optional[User] = None
+    typename__: Optional[Literal['RemoveOutsideCollaboratorPayload']] = Field(
+        'RemoveOutsideCollaboratorPayload', alias='__typename'
+    )
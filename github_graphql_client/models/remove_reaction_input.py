@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveReactionInput(BaseModel):
+    """
+    Autogenerated input type of RemoveReaction
+    """
+
+    clientMutationId: Optional[String] = None
+    content: ReactionContent
+    subjectId: ID
+    typename__: Optional[Literal['RemoveReactionInput']] = Field(
+        'RemoveReactionInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveUpvoteInput(BaseModel):
+    """
+    Autogenerated input type of RemoveUpvote
+    """
+
+    clientMutationId: Optional[String] = None
+    subjectId: ID
+    typename__: Optional[Literal['RemoveUpvoteInput']] = Field(
+        'RemoveUpvoteInput', alias='__typename'
+    )
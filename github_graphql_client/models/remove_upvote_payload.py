@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RemoveUpvotePayload(BaseModel):
+    """
+    Autogenerated return type of RemoveUpvote
+    """
+
+    clientMutationId: Optional[String] = None
+    subject: Optional[Votable] = None
+    typename__: Optional[Literal['RemoveUpvotePayload']] = Field(
+        'RemoveUpvotePayload', alias='__typename'
+    )
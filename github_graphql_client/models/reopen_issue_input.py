@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ReopenIssueInput(BaseModel):
+    """
+    Autogenerated input type of ReopenIssue
+    """
+
+    clientMutationId: Optional[String] = None
+    issueId: ID
+    typename__: Optional[Literal['ReopenIssueInput']] = Field(
+        'ReopenIssueInput', alias='__typename'
+    )
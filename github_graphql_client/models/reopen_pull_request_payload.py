@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ReopenPullRequestPayload(BaseModel):
+    """
+    Autogenerated return type of ReopenPullRequest
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['ReopenPullRequestPayload']] = Field(
+        'ReopenPullRequestPayload', alias='__typename'
+    )
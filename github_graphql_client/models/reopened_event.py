@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class ReopenedEvent(Node):
+    """
+    Represents a 'reopened' event on any `Closable`.
+    """
+
+    actor: Optional[Actor] = None
+    closable: Closable
+    createdAt: DateTime
+    id: ID
+    stateReason: Optional[IssueStateReason] = None
+    typename__: Optional[Literal['ReopenedEvent']] = Field(
+        'ReopenedEvent', alias='__typename'
+    )
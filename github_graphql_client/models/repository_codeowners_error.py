@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryCodeownersError(BaseModel):
+    """
+    An error in a `CODEOWNERS` file.
+    """
+
+    column: Int
+    kind: String
+    line: Int
+    message: String
+    path: String
+    source: String
+    suggestion: Optional[String] = None
+    typename__: Optional[Literal['RepositoryCodeownersError']] = Field(
+        'RepositoryCodeownersError', alias='__typename'
+    )
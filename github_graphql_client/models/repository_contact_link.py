@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryContactLink(BaseModel):
+    """
+    A repository contact link.
+    """
+
+    about: String
+    name: String
+    url: URI
+    typename__: Optional[Literal['RepositoryContactLink']] = Field(
+        'RepositoryContactLink', alias='__typename'
+    )
@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryIdConditionTargetInput(BaseModel):
+    """
+    Parameters to be used for the repository_id condition
+    """
+
+    repositoryIds: List[ID]
+    typename__: Optional[Literal['RepositoryIdConditionTargetInput']] = Field(
+        'RepositoryIdConditionTargetInput', alias='__typename'
+    )
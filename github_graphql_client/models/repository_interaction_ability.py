@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryInteractionAbility(BaseModel):
+    """
+    Repository interaction limit that applies to this object.
+    """
+
+    expiresAt: Optional[DateTime] = None
+    limit: RepositoryInteractionLimit
+    origin: RepositoryInteractionLimitOrigin
+    typename__: Optional[Literal['RepositoryInteractionAbility']] = Field(
+        'RepositoryInteractionAbility', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryInvitationOrder(BaseModel):
+    """
+    Ordering options for repository invitation connections.
+    """
+
+    direction: OrderDirection
+    field: RepositoryInvitationOrderField
+    typename__: Optional[Literal['RepositoryInvitationOrder']] = Field(
+        'RepositoryInvitationOrder', alias='__typename'
+    )
@@ -0,0 +1,32 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .migration import Migration
+from .node import Node
+
+
+class RepositoryMigration(Migration, Node):
+    """
+    A GitHub Enterprise Importer (GEI) repository migration.
+    """
+
+    continueOnError: Boolean
+    createdAt: DateTime
+    databaseId: Optional[String] = None
+    failureReason: Optional[String] = None
+    id: ID
+    migrationLogUrl: Optional[URI] = None
+    migrationSource: MigrationSource
+    repositoryName: String
+    sourceUrl: URI
+    state: MigrationState
+    warningsCount: Int
+    typename__: Optional[Literal['RepositoryMigration']] = Field(
+        'RepositoryMigration', alias='__typename'
+    )
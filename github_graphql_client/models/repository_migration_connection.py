@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryMigrationConnection(BaseModel):
+    """
+    The connection type for RepositoryMigration.
+    """
+
+    edges: Optional[List[Optional[RepositoryMigrationEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[RepositoryMigration]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['RepositoryMigrationConnection']] = Field(
+        'RepositoryMigrationConnection', alias='__typename'
+    )
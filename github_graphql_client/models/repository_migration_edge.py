@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryMigrationEdge(BaseModel):
+    """
+    Represents a repository migration.
+    """
+
+    cursor: String
+    node: Optional[RepositoryMigration] = None
+    typename__: Optional[Literal['RepositoryMigrationEdge']] = Field(
+        'RepositoryMigrationEdge', alias='__typename'
+    )
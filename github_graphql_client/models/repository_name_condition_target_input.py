@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryNameConditionTargetInput(BaseModel):
+    """
+    Parameters to be used for the repository_name condition
+    """
+
+    exclude: List[String]
+    include: List[String]
+    protected: Optional[Boolean] = None
+    typename__: Optional[
+        Literal['RepositoryNameConditionTargetInput']
+    ] = Field('RepositoryNameConditionTargetInput', alias='__typename')
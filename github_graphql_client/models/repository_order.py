@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryOrder(BaseModel):
+    """
+    Ordering options for repository connections
+    """
+
+    direction: OrderDirection
+    field: RepositoryOrderField
+    typename__: Optional[Literal['RepositoryOrder']] = Field(
+        'RepositoryOrder', alias='__typename'
+    )
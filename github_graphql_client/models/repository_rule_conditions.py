@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryRuleConditions(BaseModel):
+    """
+    Set of conditions that determine if a ruleset will evaluate
+    """
+
+    refName: Optional[RefNameConditionTarget] = None
+    repositoryId: Optional[RepositoryIdConditionTarget] = None
+    repositoryName: Optional[RepositoryNameConditionTarget] = None
+    typename__: Optional[Literal['RepositoryRuleConditions']] = Field(
+        'RepositoryRuleConditions', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryRuleConditionsInput(BaseModel):
+    """
+    Specifies the conditions required for a ruleset to evaluate
+    """
+
+    refName: Optional[RefNameConditionTargetInput] = None
+    repositoryId: Optional[RepositoryIdConditionTargetInput] = None
+    repositoryName: Optional[RepositoryNameConditionTargetInput] = None
+    typename__: Optional[Literal['RepositoryRuleConditionsInput']] = Field(
+        'RepositoryRuleConditionsInput', alias='__typename'
+    )
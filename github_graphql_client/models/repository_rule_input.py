@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryRuleInput(BaseModel):
+    """
+    Specifies the attributes for a new or updated rule.
+    """
+
+    id: Optional[ID] = None
+    parameters: Optional[RuleParametersInput] = None
+    type: RepositoryRuleType
+    typename__: Optional[Literal['RepositoryRuleInput']] = Field(
+        'RepositoryRuleInput', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RepositoryRulesetBypassActorInput(BaseModel):
+    """
+    Specifies the attributes for a new or updated ruleset bypass actor. Only one of
+    `actor_id`, `repository_role_database_id`, or `organization_admin` should be specified.
+    """
+
+    actorId: Optional[ID] = None
+    bypassMode: RepositoryRulesetBypassActorBypassMode
+    organizationAdmin: Optional[Boolean] = None
+    repositoryRoleDatabaseId: Optional[Int] = None
+    typename__: Optional[Literal['RepositoryRulesetBypassActorInput']] = Field(
+        'RepositoryRulesetBypassActorInput', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RequestReviewsInput(BaseModel):
+    """
+    Autogenerated input type of RequestReviews
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequestId: ID
+    teamIds: Optional[List[ID]] = None
+    union: Optional[Boolean] = False
+    userIds: Optional[List[ID]] = None
+    typename__: Optional[Literal['RequestReviewsInput']] = Field(
+        'RequestReviewsInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RequestReviewsPayload(BaseModel):
+    """
+    Autogenerated return type of RequestReviews
+    """
+
+    actor: Optional[Actor] = None
+    clientMutationId: Optional[String] = None
+    pullRequest: Optional[PullRequest] = None
+    requestedReviewersEdge: Optional[UserEdge] = None
+    typename__: Optional[Literal['RequestReviewsPayload']] = Field(
+        'RequestReviewsPayload', alias='__typename'
+    )
@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RequirableByPullRequest(BaseModel):
+    """
+    Represents a type that can be required by a pull request for merging.
+    """
+
+    isRequired: Boolean
+    typename__: Optional[Literal['RequirableByPullRequest']] = Field(
+        'RequirableByPullRequest', alias='__typename'
+    )
@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RequiredDeploymentsParametersInput(BaseModel):
+    """
+    Choose which environments must be successfully deployed to before refs can be pushed into a ref that matches this rule.
+    """
+
+    requiredDeploymentEnvironments: List[String]
+    typename__: Optional[
+        Literal['RequiredDeploymentsParametersInput']
+    ] = Field('RequiredDeploymentsParametersInput', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RequiredStatusCheckInput(BaseModel):
+    """
+    Specifies the attributes for a new or updated required status check.
+    """
+
+    appId: Optional[ID] = None
+    context: String
+    typename__: Optional[Literal['RequiredStatusCheckInput']] = Field(
+        'RequiredStatusCheckInput', alias='__typename'
+    )
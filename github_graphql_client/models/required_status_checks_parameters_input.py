@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RequiredStatusChecksParametersInput(BaseModel):
+    """
+    Choose which status checks must pass before the ref is updated. When enabled,
+    commits must first be pushed to another ref where the checks pass.
+    """
+
+    requiredStatusChecks: List[StatusCheckConfigurationInput]
+    strictRequiredStatusChecksPolicy: Boolean
+    typename__: Optional[
+        Literal['RequiredStatusChecksParametersInput']
+    ] = Field('RequiredStatusChecksParametersInput', alias='__typename')
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RerequestCheckSuiteInput(BaseModel):
+    """
+    Autogenerated input type of RerequestCheckSuite
+    """
+
+    checkSuiteId: ID
+    clientMutationId: Optional[String] = None
+    repositoryId: ID
+    typename__: Optional[Literal['RerequestCheckSuiteInput']] = Field(
+        'RerequestCheckSuiteInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class ResolveReviewThreadPayload(BaseModel):
+    """
+    Autogenerated return type of ResolveReviewThread
+    """
+
+    clientMutationId: Optional[String] = None
+    thread: Optional[PullRequestReviewThread] = None
+    typename__: Optional[Literal['ResolveReviewThreadPayload']] = Field(
+        'ResolveReviewThreadPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RetireSponsorsTierPayload(BaseModel):
+    """
+    Autogenerated return type of RetireSponsorsTier
+    """
+
+    clientMutationId: Optional[String] = None
+    sponsorsTier: Optional[SponsorsTier] = None
+    typename__: Optional[Literal['RetireSponsorsTierPayload']] = Field(
+        'RetireSponsorsTierPayload', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RevertPullRequestInput(BaseModel):
+    """
+    Autogenerated input type of RevertPullRequest
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    draft: Optional[Boolean] = False
+    pullRequestId: ID
+    title: Optional[String] = None
+    typename__: Optional[Literal['RevertPullRequestInput']] = Field(
+        'RevertPullRequestInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RevertPullRequestPayload(BaseModel):
+    """
+    Autogenerated return type of RevertPullRequest
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequest: Optional[PullRequest] = None
+    revertPullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['RevertPullRequestPayload']] = Field(
+        'RevertPullRequestPayload', alias='__typename'
+    )
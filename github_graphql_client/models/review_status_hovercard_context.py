@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .hovercard_context import HovercardContext
+
+
+class ReviewStatusHovercardContext(HovercardContext):
+    """
+    A hovercard context with a message describing the current code review state of the pull
+    request.
+    """
+
+    message: String
+    octicon: String
+    reviewDecision: Optional[PullRequestReviewDecision] = None
+    typename__: Optional[Literal['ReviewStatusHovercardContext']] = Field(
+        'ReviewStatusHovercardContext', alias='__typename'
+    )
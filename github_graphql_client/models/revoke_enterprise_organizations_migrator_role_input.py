@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RevokeEnterpriseOrganizationsMigratorRoleInput(BaseModel):
+    """
+    Autogenerated input type of RevokeEnterpriseOrganizationsMigratorRole
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    login: String
+    typename__: Optional[
+        Literal['RevokeEnterpriseOrganizationsMigratorRoleInput']
+    ] = Field(
+        'RevokeEnterpriseOrganizationsMigratorRoleInput', alias='__typename'
+    )
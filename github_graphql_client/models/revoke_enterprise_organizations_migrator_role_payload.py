@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RevokeEnterpriseOrganizationsMigratorRolePayload(BaseModel):
+    """
+    Autogenerated return type of RevokeEnterpriseOrganizationsMigratorRole
+    """
+
+    clientMutationId: Optional[String] = None
+    organizations: Optional[OrganizationConnection] = None
+    typename__: Optional[
+        Literal['RevokeEnterpriseOrganizationsMigratorRolePayload']
+    ] = Field(
+        'RevokeEnterpriseOrganizationsMigratorRolePayload', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RevokeMigratorRoleInput(BaseModel):
+    """
+    Autogenerated input type of RevokeMigratorRole
+    """
+
+    actor: String
+    actorType: ActorType
+    clientMutationId: Optional[String] = None
+    organizationId: ID
+    typename__: Optional[Literal['RevokeMigratorRoleInput']] = Field(
+        'RevokeMigratorRoleInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RevokeMigratorRolePayload(BaseModel):
+    """
+    Autogenerated return type of RevokeMigratorRole
+    """
+
+    clientMutationId: Optional[String] = None
+    success: Optional[Boolean] = None
+    typename__: Optional[Literal['RevokeMigratorRolePayload']] = Field(
+        'RevokeMigratorRolePayload', alias='__typename'
+    )
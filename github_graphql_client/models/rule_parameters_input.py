@@ -0,0 +1,33 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class RuleParametersInput(BaseModel):
+    """
+    Specifies the parameters for a `RepositoryRule` object. Only one of the fields should be specified.
+    """
+
+    branchNamePattern: Optional[BranchNamePatternParametersInput] = None
+    commitAuthorEmailPattern: Optional[
+        CommitAuthorEmailPatternParametersInput
+    ] = None
+    commitMessagePattern: Optional[CommitMessagePatternParametersInput] = None
+    committerEmailPattern: Optional[
+        CommitterEmailPatternParametersInput
+    ] = None
+    pullRequest: Optional[PullRequestParametersInput] = None
+    requiredDeployments: Optional[RequiredDeploymentsParametersInput] = None
+    requiredStatusChecks: Optional[RequiredStatusChecksParametersInput] = None
+    tagNamePattern: Optional[TagNamePatternParametersInput] = None
+    update: Optional[UpdateParametersInput] = None
+    workflows: Optional[WorkflowsParametersInput] = None
+    typename__: Optional[Literal['RuleParametersInput']] = Field(
+        'RuleParametersInput', alias='__typename'
+    )
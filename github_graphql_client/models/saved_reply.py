@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class SavedReply(Node):
+    """
+    A Saved Reply is text a user can use to reply quickly.
+    """
+
+    body: String
+    bodyHTML: HTML
+    databaseId: Optional[Int] = None
+    id: ID
+    title: String
+    user: Optional[Actor] = None
+    typename__: Optional[Literal['SavedReply']] = Field(
+        'SavedReply', alias='__typename'
+    )
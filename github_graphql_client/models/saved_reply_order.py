@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SavedReplyOrder(BaseModel):
+    """
+    Ordering options for saved reply connections.
+    """
+
+    direction: OrderDirection
+    field: SavedReplyOrderField
+    typename__: Optional[Literal['SavedReplyOrder']] = Field(
+        'SavedReplyOrder', alias='__typename'
+    )
@@ -0,0 +1,34 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SearchResultItemConnection(BaseModel):
+    """
+    A list of results that matched against a search query. Regardless of the number
+    of matches, a maximum of 1,000 results will be available across all types,
+    potentially split across many pages.
+    """
+
+    codeCount: Int
+    discussionCount: Int
+    edges: Optional[List[Optional[SearchResultItemEdge]]] = Field(
+        default_factory=list
+    )
+    issueCount: Int
+    nodes: Optional[List[Optional[SearchResultItem]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    repositoryCount: Int
+    userCount: Int
+    wikiCount: Int
+    typename__: Optional[Literal['SearchResultItemConnection']] = Field(
+        'SearchResultItemConnection', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SearchResultItemEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[SearchResultItem] = None
+    textMatches: Optional[List[Optional[TextMatch]]] = Field(
+        default_factory=list
+    )
+    typename__: Optional[Literal['SearchResultItemEdge']] = Field(
+        'SearchResultItemEdge', alias='__typename'
+    )
@@ -0,0 +1,38 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class SecurityAdvisory(Node):
+    """
+    A GitHub Security Advisory
+    """
+
+    classification: SecurityAdvisoryClassification
+    cvss: CVSS
+    cwes: CWEConnection
+    databaseId: Optional[Int] = None
+    description: String
+    ghsaId: String
+    id: ID
+    identifiers: List[SecurityAdvisoryIdentifier]
+    notificationsPermalink: Optional[URI] = None
+    origin: String
+    permalink: Optional[URI] = None
+    publishedAt: DateTime
+    references: List[SecurityAdvisoryReference]
+    severity: SecurityAdvisorySeverity
+    summary: String
+    updatedAt: DateTime
+    vulnerabilities: SecurityVulnerabilityConnection
+    withdrawnAt: Optional[DateTime] = None
+    typename__: Optional[Literal['SecurityAdvisory']] = Field(
+        'SecurityAdvisory', alias='__typename'
+    )
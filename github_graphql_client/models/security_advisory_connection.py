@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SecurityAdvisoryConnection(BaseModel):
+    """
+    The connection type for SecurityAdvisory.
+    """
+
+    edges: Optional[List[Optional[SecurityAdvisoryEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[SecurityAdvisory]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['SecurityAdvisoryConnection']] = Field(
+        'SecurityAdvisoryConnection', alias='__typename'
+    )
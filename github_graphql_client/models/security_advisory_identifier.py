@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SecurityAdvisoryIdentifier(BaseModel):
+    """
+    A GitHub Security Advisory Identifier
+    """
+
+    type: String
+    value: String
+    typename__: Optional[Literal['SecurityAdvisoryIdentifier']] = Field(
+        'SecurityAdvisoryIdentifier', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SecurityAdvisoryIdentifierFilter(BaseModel):
+    """
+    An advisory identifier to filter results on.
+    """
+
+    type: SecurityAdvisoryIdentifierType
+    value: String
+    typename__: Optional[Literal['SecurityAdvisoryIdentifierFilter']] = Field(
+        'SecurityAdvisoryIdentifierFilter', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SecurityAdvisoryOrder(BaseModel):
+    """
+    Ordering options for security advisory connections
+    """
+
+    direction: OrderDirection
+    field: SecurityAdvisoryOrderField
+    typename__: Optional[Literal['SecurityAdvisoryOrder']] = Field(
+        'SecurityAdvisoryOrder', alias='__typename'
+    )
@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SecurityAdvisoryReference(BaseModel):
+    """
+    A GitHub Security Advisory Reference
+    """
+
+    url: URI
+    typename__: Optional[Literal['SecurityAdvisoryReference']] = Field(
+        'SecurityAdvisoryReference', alias='__typename'
+    )
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SecurityVulnerability(BaseModel):
+    """
+    An individual vulnerability within an Advisory
+    """
+
+    advisory: SecurityAdvisory
+    firstPatchedVersion: Optional[SecurityAdvisoryPackageVersion] = None
+    package: SecurityAdvisoryPackage
+    severity: SecurityAdvisorySeverity
+    updatedAt: DateTime
+    vulnerableVersionRange: String
+    typename__: Optional[Literal['SecurityVulnerability']] = Field(
+        'SecurityVulnerability', alias='__typename'
+    )
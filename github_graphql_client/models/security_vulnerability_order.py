@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SecurityVulnerabilityOrder(BaseModel):
+    """
+    Ordering options for security vulnerability connections
+    """
+
+    direction: OrderDirection
+    field: SecurityVulnerabilityOrderField
+    typename__: Optional[Literal['SecurityVulnerabilityOrder']] = Field(
+        'SecurityVulnerabilityOrder', alias='__typename'
+    )
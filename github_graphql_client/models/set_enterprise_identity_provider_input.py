@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SetEnterpriseIdentityProviderInput(BaseModel):
+    """
+    Autogenerated input type of SetEnterpriseIdentityProvider
+    """
+
+    clientMutationId: Optional[String] = None
+    digestMethod: SamlDigestAlgorithm
+    enterpriseId: ID
+    idpCertificate: String
+    issuer: Optional[String] = None
+    signatureMethod: SamlSignatureAlgorithm
+    ssoUrl: URI
+    typename__: Optional[
+        Literal['SetEnterpriseIdentityProviderInput']
+    ] = Field('SetEnterpriseIdentityProviderInput', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SetEnterpriseIdentityProviderPayload(BaseModel):
+    """
+    Autogenerated return type of SetEnterpriseIdentityProvider
+    """
+
+    clientMutationId: Optional[String] = None
+    identityProvider: Optional[EnterpriseIdentityProvider] = None
+    typename__: Optional[
+        Literal['SetEnterpriseIdentityProviderPayload']
+    ] = Field('SetEnterpriseIdentityProviderPayload', alias='__typename')
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SetOrganizationInteractionLimitInput(BaseModel):
+    """
+    Autogenerated input type of SetOrganizationInteractionLimit
+    """
+
+    clientMutationId: Optional[String] = None
+    expiry: Optional[RepositoryInteractionLimitExpiry] = None
+    limit: RepositoryInteractionLimit
+    organizationId: ID
+    typename__: Optional[
+        Literal['SetOrganizationInteractionLimitInput']
+    ] = Field('SetOrganizationInteractionLimitInput', alias='__typename')
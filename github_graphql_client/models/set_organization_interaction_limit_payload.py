@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SetOrganizationInteractionLimitPayload(BaseModel):
+    """
+    Autogenerated return type of SetOrganizationInteractionLimit
+    """
+
+    clientMutationId: Optional[String] = None
+    organization: Optional[Organization] = None
+    typename__: Optional[
+        Literal['SetOrganizationInteractionLimitPayload']
+    ] = Field('SetOrganizationInteractionLimitPayload', alias='__typename')
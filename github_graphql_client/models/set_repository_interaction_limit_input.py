@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SetRepositoryInteractionLimitInput(BaseModel):
+    """
+    Autogenerated input type of SetRepositoryInteractionLimit
+    """
+
+    clientMutationId: Optional[String] = None
+    expiry: Optional[RepositoryInteractionLimitExpiry] = None
+    limit: RepositoryInteractionLimit
+    repositoryId: ID
+    typename__: Optional[
+        Literal['SetRepositoryInteractionLimitInput']
+    ] = Field('SetRepositoryInteractionLimitInput', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SetRepositoryInteractionLimitPayload(BaseModel):
+    """
+    Autogenerated return type of SetRepositoryInteractionLimit
+    """
+
+    clientMutationId: Optional[String] = None
+    repository: Optional[Repository] = None
+    typename__: Optional[
+        Literal['SetRepositoryInteractionLimitPayload']
+    ] = Field('SetRepositoryInteractionLimitPayload', alias='__typename')
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SetUserInteractionLimitInput(BaseModel):
+    """
+    Autogenerated input type of SetUserInteractionLimit
+    """
+
+    clientMutationId: Optional[String] = None
+    expiry: Optional[RepositoryInteractionLimitExpiry] = None
+    limit: RepositoryInteractionLimit
+    userId: ID
+    typename__: Optional[Literal['SetUserInteractionLimitInput']] = Field(
+        'SetUserInteractionLimitInput', alias='__typename'
+    )
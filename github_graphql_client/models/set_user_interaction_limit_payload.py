@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SetUserInteractionLimitPayload(BaseModel):
+    """
+    Autogenerated return type of SetUserInteractionLimit
+    """
+
+    clientMutationId: Optional[String] = None
+    user: Optional[User] = None
+    typename__: Optional[Literal['SetUserInteractionLimitPayload']] = Field(
+        'SetUserInteractionLimitPayload', alias='__typename'
+    )
@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .core import GitSignature
+
+
+class SmimeSignature(GitSignature):
+    """
+    Represents an S/MIME signature on a Commit or Tag.
+    """
+
+    email: String
+    isValid: Boolean
+    payload: String
+    signature: String
+    signer: Optional[User] = None
+    state: GitSignatureState
+    wasSignedByGitHub: Boolean
+    typename__: Optional[Literal['SmimeSignature']] = Field(
+        'SmimeSignature', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SocialAccount(BaseModel):
+    """
+    Social media profile associated with a user.
+    """
+
+    displayName: String
+    provider: SocialAccountProvider
+    url: URI
+    typename__: Optional[Literal['SocialAccount']] = Field(
+        'SocialAccount', alias='__typename'
+    )
@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SocialAccountConnection(BaseModel):
+    """
+    The connection type for SocialAccount.
+    """
+
+    edges: Optional[List[Optional[SocialAccountEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[SocialAccount]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['SocialAccountConnection']] = Field(
+        'SocialAccountConnection', alias='__typename'
+    )
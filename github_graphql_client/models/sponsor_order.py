@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SponsorOrder(BaseModel):
+    """
+    Ordering options for connections to get sponsor entities for GitHub Sponsors.
+    """
+
+    direction: OrderDirection
+    field: SponsorOrderField
+    typename__: Optional[Literal['SponsorOrder']] = Field(
+        'SponsorOrder', alias='__typename'
+    )
@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SponsorableItemConnection(BaseModel):
+    """
+    The connection type for SponsorableItem.
+    """
+
+    edges: Optional[List[Optional[SponsorableItemEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[SponsorableItem]]] = Field(
+        default_factory=list
+    )
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['SponsorableItemConnection']] = Field(
+        'SponsorableItemConnection', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SponsorsActivityOrder(BaseModel):
+    """
+    Ordering options for GitHub Sponsors activity connections.
+    """
+
+    direction: OrderDirection
+    field: SponsorsActivityOrderField
+    typename__: Optional[Literal['SponsorsActivityOrder']] = Field(
+        'SponsorsActivityOrder', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SponsorsGoal(BaseModel):
+    """
+    A goal associated with a GitHub Sponsors listing, representing a target the sponsored maintainer would like to attain.
+    """
+
+    description: Optional[String] = None
+    kind: SponsorsGoalKind
+    percentComplete: Int
+    targetValue: Int
+    title: String
+    typename__: Optional[Literal['SponsorsGoal']] = Field(
+        'SponsorsGoal', alias='__typename'
+    )
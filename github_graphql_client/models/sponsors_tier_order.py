@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SponsorsTierOrder(BaseModel):
+    """
+    Ordering options for Sponsors tiers connections.
+    """
+
+    direction: OrderDirection
+    field: SponsorsTierOrderField
+    typename__: Optional[Literal['SponsorsTierOrder']] = Field(
+        'SponsorsTierOrder', alias='__typename'
+    )
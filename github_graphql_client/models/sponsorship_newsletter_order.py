@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SponsorshipNewsletterOrder(BaseModel):
+    """
+    Ordering options for sponsorship newsletter connections.
+    """
+
+    direction: OrderDirection
+    field: SponsorshipNewsletterOrderField
+    typename__: Optional[Literal['SponsorshipNewsletterOrder']] = Field(
+        'SponsorshipNewsletterOrder', alias='__typename'
+    )
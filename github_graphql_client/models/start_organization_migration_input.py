@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class StartOrganizationMigrationInput(BaseModel):
+    """
+    Autogenerated input type of StartOrganizationMigration
+    """
+
+    clientMutationId: Optional[String] = None
+    sourceAccessToken: String
+    sourceOrgUrl: URI
+    targetEnterpriseId: ID
+    targetOrgName: String
+    typename__: Optional[Literal['StartOrganizationMigrationInput']] = Field(
+        'StartOrganizationMigrationInput', alias='__typename'
+    )
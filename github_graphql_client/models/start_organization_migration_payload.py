@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class StartOrganizationMigrationPayload(BaseModel):
+    """
+    Autogenerated return type of StartOrganizationMigration
+    """
+
+    clientMutationId: Optional[String] = None
+    orgMigration: Optional[OrganizationMigration] = None
+    typename__: Optional[Literal['StartOrganizationMigrationPayload']] = Field(
+        'StartOrganizationMigrationPayload', alias='__typename'
+    )
@@ -0,0 +1,32 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class StartRepositoryMigrationInput(BaseModel):
+    """
+    Autogenerated input type of StartRepositoryMigration
+    """
+
+    accessToken: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    continueOnError: Optional[Boolean] = None
+    gitArchiveUrl: Optional[String] = None
+    githubPat: Optional[String] = None
+    lockSource: Optional[Boolean] = None
+    metadataArchiveUrl: Optional[String] = None
+    ownerId: ID
+    repositoryName: String
+    skipReleases: Optional[Boolean] = None
+    sourceId: ID
+    sourceRepositoryUrl: Optional[URI] = None
+    targetRepoVisibility: Optional[String] = None
+    typename__: Optional[Literal['StartRepositoryMigrationInput']] = Field(
+        'StartRepositoryMigrationInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class StartRepositoryMigrationPayload(BaseModel):
+    """
+    Autogenerated return type of StartRepositoryMigration
+    """
+
+    clientMutationId: Optional[String] = None
+    repositoryMigration: Optional[RepositoryMigration] = None
+    typename__: Optional[Literal['StartRepositoryMigrationPayload']] = Field(
+        'StartRepositoryMigrationPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class StatusCheckConfigurationInput(BaseModel):
+    """
+    Required status check
+    """
+
+    context: String
+    integrationId: Optional[Int] = None
+    typename__: Optional[Literal['StatusCheckConfigurationInput']] = Field(
+        'StatusCheckConfigurationInput', alias='__typename'
+    )
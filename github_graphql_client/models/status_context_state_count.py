@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class StatusContextStateCount(BaseModel):
+    """
+    Represents a count of the state of a status context.
+    """
+
+    count: Int
+    state: StatusState
+    typename__: Optional[Literal['StatusContextStateCount']] = Field(
+        'StatusContextStateCount', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SubmitPullRequestReviewInput(BaseModel):
+    """
+    Autogenerated input type of SubmitPullRequestReview
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    event: PullRequestReviewEvent
+    pullRequestId: Optional[ID] = None
+    pullRequestReviewId: Optional[ID] = None
+    typename__: Optional[Literal['SubmitPullRequestReviewInput']] = Field(
+        'SubmitPullRequestReviewInput', alias='__typename'
+    )
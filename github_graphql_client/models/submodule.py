@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Submodule(BaseModel):
+    """
+    A pointer to a repository at a specific revision embedded inside another repository.
+    """
+
+    branch: Optional[String] = None
+    gitUrl: URI
+    name: String
+    nameRaw: Base64String
+    path: String
+    pathRaw: Base64String
+    subprojectCommitOid: Optional[GitObjectID] = None
+    typename__: Optional[Literal['Submodule']] = Field(
+        'Submodule', alias='__typename'
+    )
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SubmoduleConnection(BaseModel):
+    """
+    The connection type for Submodule.
+    """
+
+    edges: Optional[List[Optional[SubmoduleEdge]]] = Field(
+        default_factory=list
+    )
+    nodes: Optional[List[Optional[Submodule]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['SubmoduleConnection']] = Field(
+        'SubmoduleConnection', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Subscribable(BaseModel):
+    """
+    Entities that can be subscribed to for web and email notifications.
+    """
+
+    id: ID
+    viewerCanSubscribe: Boolean
+    viewerSubscription: Optional[SubscriptionState] = None
+    typename__: Optional[Literal['Subscribable']] = Field(
+        'Subscribable', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class SubscribableThread(BaseModel):
+    """
+    Entities that can be subscribed to for web and email notifications.
+    """
+
+    id: ID
+    viewerThreadSubscriptionFormAction: Optional[
+        ThreadSubscriptionFormAction
+    ] = None
+    viewerThreadSubscriptionStatus: Optional[ThreadSubscriptionState] = None
+    typename__: Optional[Literal['SubscribableThread']] = Field(
+        'SubscribableThread', alias='__typename'
+    )
@@ -0,0 +1,29 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .core import GitObject
+from .node import Node
+
+
+class Tag(GitObject, Node):
+    """
+    Represents a Git tag.
+    """
+
+    abbreviatedOid: String
+    commitResourcePath: URI
+    commitUrl: URI
+    id: ID
+    message: Optional[String] = None
+    name: String
+    oid: GitObjectID
+    repository: Repository
+    tagger: Optional[GitActor] = None
+    target: GitObject
+    typename__: Optional[Literal['Tag']] = Field('Tag', alias='__typename')
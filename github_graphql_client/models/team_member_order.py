@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class TeamMemberOrder(BaseModel):
+    """
+    Ordering options for team member connections
+    """
+
+    direction: OrderDirection
+    field: TeamMemberOrderField
+    typename__: Optional[Literal['TeamMemberOrder']] = Field(
+        'TeamMemberOrder', alias='__typename'
+    )
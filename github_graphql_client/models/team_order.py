@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class TeamOrder(BaseModel):
+    """
+    Ways in which team connections can be ordered.
+    """
+
+    direction: OrderDirection
+    field: TeamOrderField
+    typename__: Optional[Literal['TeamOrder']] = Field(
+        'TeamOrder', alias='__typename'
+    )
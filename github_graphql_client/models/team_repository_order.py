@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class TeamRepositoryOrder(BaseModel):
+    """
+    Ordering options for team repository connections
+    """
+
+    direction: OrderDirection
+    field: TeamRepositoryOrderField
+    typename__: Optional[Literal['TeamRepositoryOrder']] = Field(
+        'TeamRepositoryOrder', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class TextMatch(BaseModel):
+    """
+    A text match within a search result.
+    """
+
+    fragment: String
+    highlights: List[TextMatchHighlight]
+    property: String
+    typename__: Optional[Literal['TextMatch']] = Field(
+        'TextMatch', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class TextMatchHighlight(BaseModel):
+    """
+    Represents a single highlight in a search result match.
+    """
+
+    beginIndice: Int
+    endIndice: Int
+    text: String
+    typename__: Optional[Literal['TextMatchHighlight']] = Field(
+        'TextMatchHighlight', alias='__typename'
+    )
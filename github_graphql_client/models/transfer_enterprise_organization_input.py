@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class TransferEnterpriseOrganizationInput(BaseModel):
+    """
+    Autogenerated input type of TransferEnterpriseOrganization
+    """
+
+    clientMutationId: Optional[String] = None
+    destinationEnterpriseId: ID
+    organizationId: ID
+    typename__: Optional[
+        Literal['TransferEnterpriseOrganizationInput']
+    ] = Field('TransferEnterpriseOrganizationInput', alias='__typename')
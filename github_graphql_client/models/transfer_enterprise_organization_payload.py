@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class TransferEnterpriseOrganizationPayload(BaseModel):
+    """
+    Autogenerated return type of TransferEnterpriseOrganization
+    """
+
+    clientMutationId: Optional[String] = None
+    organization: Optional[Organization] = None
+    typename__: Optional[
+        Literal['TransferEnterpriseOrganizationPayload']
+    ] = Field('TransferEnterpriseOrganizationPayload', alias='__typename')
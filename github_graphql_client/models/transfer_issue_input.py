@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class TransferIssueInput(BaseModel):
+    """
+    Autogenerated input type of TransferIssue
+    """
+
+    clientMutationId: Optional[String] = None
+    createLabelsIfMissing: Optional[Boolean] = False
+    issueId: ID
+    repositoryId: ID
+    typename__: Optional[Literal['TransferIssueInput']] = Field(
+        'TransferIssueInput', alias='__typename'
+    )
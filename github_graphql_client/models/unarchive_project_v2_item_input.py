@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnarchiveProjectV2ItemInput(BaseModel):
+    """
+    Autogenerated input type of UnarchiveProjectV2Item
+    """
+
+    clientMutationId: Optional[String] = None
+    itemId: ID
+    projectId: ID
+    typename__: Optional[Literal['UnarchiveProjectV2ItemInput']] = Field(
+        'UnarchiveProjectV2ItemInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnarchiveProjectV2ItemPayload(BaseModel):
+    """
+    Autogenerated return type of UnarchiveProjectV2Item
+    """
+
+    clientMutationId: Optional[String] = None
+    item: Optional[ProjectV2Item] = None
+    typename__: Optional[Literal['UnarchiveProjectV2ItemPayload']] = Field(
+        'UnarchiveProjectV2ItemPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnfollowUserInput(BaseModel):
+    """
+    Autogenerated input type of UnfollowUser
+    """
+
+    clientMutationId: Optional[String] = None
+    userId: ID
+    typename__: Optional[Literal['UnfollowUserInput']] = Field(
+        'UnfollowUserInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UniformResourceLocatable(BaseModel):
+    """
+    Represents a type that can be retrieved by a URL.
+    """
+
+    resourcePath: URI
+    url: URI
+    typename__: Optional[Literal['UniformResourceLocatable']] = Field(
+        'UniformResourceLocatable', alias='__typename'
+    )
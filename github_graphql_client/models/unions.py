@@ -0,0 +1,1016 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import Annotated, TypeAlias, Union
+
+from pydantic import Tag
+
+from github_graphql_client.codegen.runtime import typename_discriminator
+
+
+# Types that can be assigned to issues.
+Assignee: TypeAlias = Annotated[
+    Union[
+        Annotated['Bot', Tag('Bot')],
+        Annotated['Mannequin', Tag('Mannequin')],
+        Annotated['Organization', Tag('Organization')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Bot',
+        'Mannequin',
+        'Organization',
+        'User',
+    ),
+]
+
+
+# Types that can initiate an audit log event.
+AuditEntryActor: TypeAlias = Annotated[
+    Union[
+        Annotated['Bot', Tag('Bot')],
+        Annotated['Organization', Tag('Organization')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Bot',
+        'Organization',
+        'User',
+    ),
+]
+
+
+# Types which can be actors for `BranchActorAllowance` objects.
+BranchActorAllowanceActor: TypeAlias = Annotated[
+    Union[
+        Annotated['App', Tag('App')],
+        Annotated['Team', Tag('Team')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'App',
+        'Team',
+        'User',
+    ),
+]
+
+
+# Types that can represent a repository ruleset bypass actor.
+BypassActor: TypeAlias = Annotated[
+    Union[
+        Annotated['App', Tag('App')],
+        Annotated['Team', Tag('Team')],
+    ],
+    typename_discriminator(
+        'App',
+        'Team',
+    ),
+]
+
+
+# An object which can have its data claimed or claim data from another.
+Claimable: TypeAlias = Annotated[
+    Union[
+        Annotated['Mannequin', Tag('Mannequin')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Mannequin',
+        'User',
+    ),
+]
+
+
+# The object which triggered a `ClosedEvent`.
+Closer: TypeAlias = Annotated[
+    Union[
+        Annotated['Commit', Tag('Commit')],
+        Annotated['PullRequest', Tag('PullRequest')],
+    ],
+    typename_discriminator(
+        'Commit',
+        'PullRequest',
+    ),
+]
+
+
+# Represents either a issue the viewer can access or a restricted contribution.
+CreatedIssueOrRestrictedContribution: TypeAlias = Annotated[
+    Union[
+        Annotated['CreatedIssueContribution', Tag('CreatedIssueContribution')],
+        Annotated['RestrictedContribution', Tag('RestrictedContribution')],
+    ],
+    typename_discriminator(
+        'CreatedIssueContribution',
+        'RestrictedContribution',
+    ),
+]
+
+
+# Represents either a pull request the viewer can access or a restricted contribution.
+CreatedPullRequestOrRestrictedContribution: TypeAlias = Annotated[
+    Union[
+        Annotated['CreatedPullRequestContribution', Tag('CreatedPullRequestContribution')],
+        Annotated['RestrictedContribution', Tag('RestrictedContribution')],
+    ],
+    typename_discriminator(
+        'CreatedPullRequestContribution',
+        'RestrictedContribution',
+    ),
+]
+
+
+# Represents either a repository the viewer can access or a restricted contribution.
+CreatedRepositoryOrRestrictedContribution: TypeAlias = Annotated[
+    Union[
+        Annotated['CreatedRepositoryContribution', Tag('CreatedRepositoryContribution')],
+        Annotated['RestrictedContribution', Tag('RestrictedContribution')],
+    ],
+    typename_discriminator(
+        'CreatedRepositoryContribution',
+        'RestrictedContribution',
+    ),
+]
+
+
+# Users and teams.
+DeploymentReviewer: TypeAlias = Annotated[
+    Union[
+        Annotated['Team', Tag('Team')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Team',
+        'User',
+    ),
+]
+
+
+# An object that is a member of an enterprise.
+EnterpriseMember: TypeAlias = Annotated[
+    Union[
+        Annotated['EnterpriseUserAccount', Tag('EnterpriseUserAccount')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'EnterpriseUserAccount',
+        'User',
+    ),
+]
+
+
+# Types that can own an IP allow list.
+IpAllowListOwner: TypeAlias = Annotated[
+    Union[
+        Annotated['App', Tag('App')],
+        Annotated['Enterprise', Tag('Enterprise')],
+        Annotated['Organization', Tag('Organization')],
+    ],
+    typename_discriminator(
+        'App',
+        'Enterprise',
+        'Organization',
+    ),
+]
+
+
+# Used for return value of Repository.issueOrPullRequest.
+IssueOrPullRequest: TypeAlias = Annotated[
+    Union[
+        Annotated['Issue', Tag('Issue')],
+        Annotated['PullRequest', Tag('PullRequest')],
+    ],
+    typename_discriminator(
+        'Issue',
+        'PullRequest',
+    ),
+]
+
+
+# An item in an issue timeline
+IssueTimelineItem: TypeAlias = Annotated[
+    Union[
+        Annotated['AssignedEvent', Tag('AssignedEvent')],
+        Annotated['ClosedEvent', Tag('ClosedEvent')],
+        Annotated['Commit', Tag('Commit')],
+        Annotated['CrossReferencedEvent', Tag('CrossReferencedEvent')],
+        Annotated['DemilestonedEvent', Tag('DemilestonedEvent')],
+        Annotated['IssueComment', Tag('IssueComment')],
+        Annotated['LabeledEvent', Tag('LabeledEvent')],
+        Annotated['LockedEvent', Tag('LockedEvent')],
+        Annotated['MilestonedEvent', Tag('MilestonedEvent')],
+        Annotated['ReferencedEvent', Tag('ReferencedEvent')],
+        Annotated['RenamedTitleEvent', Tag('RenamedTitleEvent')],
+        Annotated['ReopenedEvent', Tag('ReopenedEvent')],
+        Annotated['SubscribedEvent', Tag('SubscribedEvent')],
+        Annotated['TransferredEvent', Tag('TransferredEvent')],
+        Annotated['UnassignedEvent', Tag('UnassignedEvent')],
+        Annotated['UnlabeledEvent', Tag('UnlabeledEvent')],
+        Annotated['UnlockedEvent', Tag('UnlockedEvent')],
+        Annotated['UnsubscribedEvent', Tag('UnsubscribedEvent')],
+        Annotated['UserBlockedEvent', Tag('UserBlockedEvent')],
+    ],
+    typename_discriminator(
+        'AssignedEvent',
+        'ClosedEvent',
+        'Commit',
+        'CrossReferencedEvent',
+        'DemilestonedEvent',
+        'IssueComment',
+        'LabeledEvent',
+        'LockedEvent',
+        'MilestonedEvent',
+        'ReferencedEvent',
+        'RenamedTitleEvent',
+        'ReopenedEvent',
+        'SubscribedEvent',
+        'TransferredEvent',
+        'UnassignedEvent',
+        'UnlabeledEvent',
+        'UnlockedEvent',
+        'UnsubscribedEvent',
+        'UserBlockedEvent',
+    ),
+]
+
+
+# An item in an issue timeline
+IssueTimelineItems: TypeAlias = Annotated[
+    Union[
+        Annotated['AddedToProjectEvent', Tag('AddedToProjectEvent')],
+        Annotated['AssignedEvent', Tag('AssignedEvent')],
+        Annotated['ClosedEvent', Tag('ClosedEvent')],
+        Annotated['CommentDeletedEvent', Tag('CommentDeletedEvent')],
+        Annotated['ConnectedEvent', Tag('ConnectedEvent')],
+        Annotated['ConvertedNoteToIssueEvent', Tag('ConvertedNoteToIssueEvent')],
+        Annotated['ConvertedToDiscussionEvent', Tag('ConvertedToDiscussionEvent')],
+        Annotated['CrossReferencedEvent', Tag('CrossReferencedEvent')],
+        Annotated['DemilestonedEvent', Tag('DemilestonedEvent')],
+        Annotated['DisconnectedEvent', Tag('DisconnectedEvent')],
+        Annotated['IssueComment', Tag('IssueComment')],
+        Annotated['LabeledEvent', Tag('LabeledEvent')],
+        Annotated['LockedEvent', Tag('LockedEvent')],
+        Annotated['MarkedAsDuplicateEvent', Tag('MarkedAsDuplicateEvent')],
+        Annotated['MentionedEvent', Tag('MentionedEvent')],
+        Annotated['MilestonedEvent', Tag('MilestonedEvent')],
+        Annotated['MovedColumnsInProjectEvent', Tag('MovedColumnsInProjectEvent')],
+        Annotated['PinnedEvent', Tag('PinnedEvent')],
+        Annotated['ReferencedEvent', Tag('ReferencedEvent')],
+        Annotated['RemovedFromProjectEvent', Tag('RemovedFromProjectEvent')],
+        Annotated['RenamedTitleEvent', Tag('RenamedTitleEvent')],
+        Annotated['ReopenedEvent', Tag('ReopenedEvent')],
+        Annotated['SubscribedEvent', Tag('SubscribedEvent')],
+        Annotated['TransferredEvent', Tag('TransferredEvent')],
+        Annotated['UnassignedEvent', Tag('UnassignedEvent')],
+        Annotated['UnlabeledEvent', Tag('UnlabeledEvent')],
+        Annotated['UnlockedEvent', Tag('UnlockedEvent')],
+        Annotated['UnmarkedAsDuplicateEvent', Tag('UnmarkedAsDuplicateEvent')],
+        Annotated['UnpinnedEvent', Tag('UnpinnedEvent')],
+        Annotated['UnsubscribedEvent', Tag('UnsubscribedEvent')],
+        Annotated['UserBlockedEvent', Tag('UserBlockedEvent')],
+    ],
+    typename_discriminator(
+        'AddedToProjectEvent',
+        'AssignedEvent',
+        'ClosedEvent',
+        'CommentDeletedEvent',
+        'ConnectedEvent',
+        'ConvertedNoteToIssueEvent',
+        'ConvertedToDiscussionEvent',
+        'CrossReferencedEvent',
+        'DemilestonedEvent',
+        'DisconnectedEvent',
+        'IssueComment',
+        'LabeledEvent',
+        'LockedEvent',
+        'MarkedAsDuplicateEvent',
+        'MentionedEvent',
+        'MilestonedEvent',
+        'MovedColumnsInProjectEvent',
+        'PinnedEvent',
+        'ReferencedEvent',
+        'RemovedFromProjectEvent',
+        'RenamedTitleEvent',
+        'ReopenedEvent',
+        'SubscribedEvent',
+        'TransferredEvent',
+        'UnassignedEvent',
+        'UnlabeledEvent',
+        'UnlockedEvent',
+        'UnmarkedAsDuplicateEvent',
+        'UnpinnedEvent',
+        'UnsubscribedEvent',
+        'UserBlockedEvent',
+    ),
+]
+
+
+# Types that can be inside a Milestone.
+MilestoneItem: TypeAlias = Annotated[
+    Union[
+        Annotated['Issue', Tag('Issue')],
+        Annotated['PullRequest', Tag('PullRequest')],
+    ],
+    typename_discriminator(
+        'Issue',
+        'PullRequest',
+    ),
+]
+
+
+# Types of memberships that can be restored for an Organization member.
+OrgRestoreMemberAuditEntryMembership: TypeAlias = Annotated[
+    Union[
+        Annotated['OrgRestoreMemberMembershipOrganizationAuditEntryData', Tag('OrgRestoreMemberMembershipOrganizationAuditEntryData')],
+        Annotated['OrgRestoreMemberMembershipRepositoryAuditEntryData', Tag('OrgRestoreMemberMembershipRepositoryAuditEntryData')],
+        Annotated['OrgRestoreMemberMembershipTeamAuditEntryData', Tag('OrgRestoreMemberMembershipTeamAuditEntryData')],
+    ],
+    typename_discriminator(
+        'OrgRestoreMemberMembershipOrganizationAuditEntryData',
+        'OrgRestoreMemberMembershipRepositoryAuditEntryData',
+        'OrgRestoreMemberMembershipTeamAuditEntryData',
+    ),
+]
+
+
+# An audit entry in an organization audit log.
+OrganizationAuditEntry: TypeAlias = Annotated[
+    Union[
+        Annotated['MembersCanDeleteReposClearAuditEntry', Tag('MembersCanDeleteReposClearAuditEntry')],
+        Annotated['MembersCanDeleteReposDisableAuditEntry', Tag('MembersCanDeleteReposDisableAuditEntry')],
+        Annotated['MembersCanDeleteReposEnableAuditEntry', Tag('MembersCanDeleteReposEnableAuditEntry')],
+        Annotated['OauthApplicationCreateAuditEntry', Tag('OauthApplicationCreateAuditEntry')],
+        Annotated['OrgAddBillingManagerAuditEntry', Tag('OrgAddBillingManagerAuditEntry')],
+        Annotated['OrgAddMemberAuditEntry', Tag('OrgAddMemberAuditEntry')],
+        Annotated['OrgBlockUserAuditEntry', Tag('OrgBlockUserAuditEntry')],
+        Annotated['OrgConfigDisableCollaboratorsOnlyAuditEntry', Tag('OrgConfigDisableCollaboratorsOnlyAuditEntry')],
+        Annotated['OrgConfigEnableCollaboratorsOnlyAuditEntry', Tag('OrgConfigEnableCollaboratorsOnlyAuditEntry')],
+        Annotated['OrgCreateAuditEntry', Tag('OrgCreateAuditEntry')],
+        Annotated['OrgDisableOauthAppRestrictionsAuditEntry', Tag('OrgDisableOauthAppRestrictionsAuditEntry')],
+        Annotated['OrgDisableSamlAuditEntry', Tag('OrgDisableSamlAuditEntry')],
+        Annotated['OrgDisableTwoFactorRequirementAuditEntry', Tag('OrgDisableTwoFactorRequirementAuditEntry')],
+        Annotated['OrgEnableOauthAppRestrictionsAuditEntry', Tag('OrgEnableOauthAppRestrictionsAuditEntry')],
+        Annotated['OrgEnableSamlAuditEntry', Tag('OrgEnableSamlAuditEntry')],
+        Annotated['OrgEnableTwoFactorRequirementAuditEntry', Tag('OrgEnableTwoFactorRequirementAuditEntry')],
+        Annotated['OrgInviteMemberAuditEntry', Tag('OrgInviteMemberAuditEntry')],
+        Annotated['OrgInviteToBusinessAuditEntry', Tag('OrgInviteToBusinessAuditEntry')],
+        Annotated['OrgOauthAppAccessApprovedAuditEntry', Tag('OrgOauthAppAccessApprovedAuditEntry')],
+        Annotated['OrgOauthAppAccessBlockedAuditEntry', Tag('OrgOauthAppAccessBlockedAuditEntry')],
+        Annotated['OrgOauthAppAccessDeniedAuditEntry', Tag('OrgOauthAppAccessDeniedAuditEntry')],
+        Annotated['OrgOauthAppAccessRequestedAuditEntry', Tag('OrgOauthAppAccessRequestedAuditEntry')],
+        Annotated['OrgOauthAppAccessUnblockedAuditEntry', Tag('OrgOauthAppAccessUnblockedAuditEntry')],
+        Annotated['OrgRemoveBillingManagerAuditEntry', Tag('OrgRemoveBillingManagerAuditEntry')],
+        Annotated['OrgRemoveMemberAuditEntry', Tag('OrgRemoveMemberAuditEntry')],
+        Annotated['OrgRemoveOutsideCollaboratorAuditEntry', Tag('OrgRemoveOutsideCollaboratorAuditEntry')],
+        Annotated['OrgRestoreMemberAuditEntry', Tag('OrgRestoreMemberAuditEntry')],
+        Annotated['OrgUnblockUserAuditEntry', Tag('OrgUnblockUserAuditEntry')],
+        Annotated['OrgUpdateDefaultRepositoryPermissionAuditEntry', Tag('OrgUpdateDefaultRepositoryPermissionAuditEntry')],
+        Annotated['OrgUpdateMemberAuditEntry', Tag('OrgUpdateMemberAuditEntry')],
+        Annotated['OrgUpdateMemberRepositoryCreationPermissionAuditEntry', Tag('OrgUpdateMemberRepositoryCreationPermissionAuditEntry')],
+        Annotated['OrgUpdateMemberRepositoryInvitationPermissionAuditEntry', Tag('OrgUpdateMemberRepositoryInvitationPermissionAuditEntry')],
+        Annotated['PrivateRepositoryForkingDisableAuditEntry', Tag('PrivateRepositoryForkingDisableAuditEntry')],
+        Annotated['PrivateRepositoryForkingEnableAuditEntry', Tag('PrivateRepositoryForkingEnableAuditEntry')],
+        Annotated['RepoAccessAuditEntry', Tag('RepoAccessAuditEntry')],
+        Annotated['RepoAddMemberAuditEntry', Tag('RepoAddMemberAuditEntry')],
+        Annotated['RepoAddTopicAuditEntry', Tag('RepoAddTopicAuditEntry')],
+        Annotated['RepoArchivedAuditEntry', Tag('RepoArchivedAuditEntry')],
+        Annotated['RepoChangeMergeSettingAuditEntry', Tag('RepoChangeMergeSettingAuditEntry')],
+        Annotated['RepoConfigDisableAnonymousGitAccessAuditEntry', Tag('RepoConfigDisableAnonymousGitAccessAuditEntry')],
+        Annotated['RepoConfigDisableCollaboratorsOnlyAuditEntry', Tag('RepoConfigDisableCollaboratorsOnlyAuditEntry')],
+        Annotated['RepoConfigDisableContributorsOnlyAuditEntry', Tag('RepoConfigDisableContributorsOnlyAuditEntry')],
+        Annotated['RepoConfigDisableSockpuppetDisallowedAuditEntry', Tag('RepoConfigDisableSockpuppetDisallowedAuditEntry')],
+        Annotated['RepoConfigEnableAnonymousGitAccessAuditEntry', Tag('RepoConfigEnableAnonymousGitAccessAuditEntry')],
+        Annotated['RepoConfigEnableCollaboratorsOnlyAuditEntry', Tag('RepoConfigEnableCollaboratorsOnlyAuditEntry')],
+        Annotated['RepoConfigEnableContributorsOnlyAuditEntry', Tag('RepoConfigEnableContributorsOnlyAuditEntry')],
+        Annotated['RepoConfigEnableSockpuppetDisallowedAuditEntry', Tag('RepoConfigEnableSockpuppetDisallowedAuditEntry')],
+        Annotated['RepoConfigLockAnonymousGitAccessAuditEntry', Tag('RepoConfigLockAnonymousGitAccessAuditEntry')],
+        Annotated['RepoConfigUnlockAnonymousGitAccessAuditEntry', Tag('RepoConfigUnlockAnonymousGitAccessAuditEntry')],
+        Annotated['RepoCreateAuditEntry', Tag('RepoCreateAuditEntry')],
+        Annotated['RepoDestroyAuditEntry', Tag('RepoDestroyAuditEntry')],
+        Annotated['RepoRemoveMemberAuditEntry', Tag('RepoRemoveMemberAuditEntry')],
+        Annotated['RepoRemoveTopicAuditEntry', Tag('RepoRemoveTopicAuditEntry')],
+        Annotated['RepositoryVisibilityChangeDisableAuditEntry', Tag('RepositoryVisibilityChangeDisableAuditEntry')],
+        Annotated['RepositoryVisibilityChangeEnableAuditEntry', Tag('RepositoryVisibilityChangeEnableAuditEntry')],
+        Annotated['TeamAddMemberAuditEntry', Tag('TeamAddMemberAuditEntry')],
+        Annotated['TeamAddRepositoryAuditEntry', Tag('TeamAddRepositoryAuditEntry')],
+        Annotated['TeamChangeParentTeamAuditEntry', Tag('TeamChangeParentTeamAuditEntry')],
+        Annotated['TeamRemoveMemberAuditEntry', Tag('TeamRemoveMemberAuditEntry')],
+        Annotated['TeamRemoveRepositoryAuditEntry', Tag('TeamRemoveRepositoryAuditEntry')],
+    ],
+    typename_discriminator(
+        'MembersCanDeleteReposClearAuditEntry',
+        'MembersCanDeleteReposDisableAuditEntry',
+        'MembersCanDeleteReposEnableAuditEntry',
+        'OauthApplicationCreateAuditEntry',
+        'OrgAddBillingManagerAuditEntry',
+        'OrgAddMemberAuditEntry',
+        'OrgBlockUserAuditEntry',
+        'OrgConfigDisableCollaboratorsOnlyAuditEntry',
+        'OrgConfigEnableCollaboratorsOnlyAuditEntry',
+        'OrgCreateAuditEntry',
+        'OrgDisableOauthAppRestrictionsAuditEntry',
+        'OrgDisableSamlAuditEntry',
+        'OrgDisableTwoFactorRequirementAuditEntry',
+        'OrgEnableOauthAppRestrictionsAuditEntry',
+        'OrgEnableSamlAuditEntry',
+        'OrgEnableTwoFactorRequirementAuditEntry',
+        'OrgInviteMemberAuditEntry',
+        'OrgInviteToBusinessAuditEntry',
+        'OrgOauthAppAccessApprovedAuditEntry',
+        'OrgOauthAppAccessBlockedAuditEntry',
+        'OrgOauthAppAccessDeniedAuditEntry',
+        'OrgOauthAppAccessRequestedAuditEntry',
+        'OrgOauthAppAccessUnblockedAuditEntry',
+        'OrgRemoveBillingManagerAuditEntry',
+        'OrgRemoveMemberAuditEntry',
+        'OrgRemoveOutsideCollaboratorAuditEntry',
+        'OrgRestoreMemberAuditEntry',
+        'OrgUnblockUserAuditEntry',
+        'OrgUpdateDefaultRepositoryPermissionAuditEntry',
+        'OrgUpdateMemberAuditEntry',
+        'OrgUpdateMemberRepositoryCreationPermissionAuditEntry',
+        'OrgUpdateMemberRepositoryInvitationPermissionAuditEntry',
+        'PrivateRepositoryForkingDisableAuditEntry',
+        'PrivateRepositoryForkingEnableAuditEntry',
+        'RepoAccessAuditEntry',
+        'RepoAddMemberAuditEntry',
+        'RepoAddTopicAuditEntry',
+        'RepoArchivedAuditEntry',
+        'RepoChangeMergeSettingAuditEntry',
+        'RepoConfigDisableAnonymousGitAccessAuditEntry',
+        'RepoConfigDisableCollaboratorsOnlyAuditEntry',
+        'RepoConfigDisableContributorsOnlyAuditEntry',
+        'RepoConfigDisableSockpuppetDisallowedAuditEntry',
+        'RepoConfigEnableAnonymousGitAccessAuditEntry',
+        'RepoConfigEnableCollaboratorsOnlyAuditEntry',
+        'RepoConfigEnableContributorsOnlyAuditEntry',
+        'RepoConfigEnableSockpuppetDisallowedAuditEntry',
+        'RepoConfigLockAnonymousGitAccessAuditEntry',
+        'RepoConfigUnlockAnonymousGitAccessAuditEntry',
+        'RepoCreateAuditEntry',
+        'RepoDestroyAuditEntry',
+        'RepoRemoveMemberAuditEntry',
+        'RepoRemoveTopicAuditEntry',
+        'RepositoryVisibilityChangeDisableAuditEntry',
+        'RepositoryVisibilityChangeEnableAuditEntry',
+        'TeamAddMemberAuditEntry',
+        'TeamAddRepositoryAuditEntry',
+        'TeamChangeParentTeamAuditEntry',
+        'TeamRemoveMemberAuditEntry',
+        'TeamRemoveRepositoryAuditEntry',
+    ),
+]
+
+
+# Used for argument of CreateProjectV2 mutation.
+OrganizationOrUser: TypeAlias = Annotated[
+    Union[
+        Annotated['Organization', Tag('Organization')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Organization',
+        'User',
+    ),
+]
+
+
+# Types that can grant permissions on a repository to a user
+PermissionGranter: TypeAlias = Annotated[
+    Union[
+        Annotated['Organization', Tag('Organization')],
+        Annotated['Repository', Tag('Repository')],
+        Annotated['Team', Tag('Team')],
+    ],
+    typename_discriminator(
+        'Organization',
+        'Repository',
+        'Team',
+    ),
+]
+
+
+# Types that can be pinned to a profile page.
+PinnableItem: TypeAlias = Annotated[
+    Union[
+        Annotated['Gist', Tag('Gist')],
+        Annotated['Repository', Tag('Repository')],
+    ],
+    typename_discriminator(
+        'Gist',
+        'Repository',
+    ),
+]
+
+
+# Types that can be inside Project Cards.
+ProjectCardItem: TypeAlias = Annotated[
+    Union[
+        Annotated['Issue', Tag('Issue')],
+        Annotated['PullRequest', Tag('PullRequest')],
+    ],
+    typename_discriminator(
+        'Issue',
+        'PullRequest',
+    ),
+]
+
+
+# Possible collaborators for a project.
+ProjectV2Actor: TypeAlias = Annotated[
+    Union[
+        Annotated['Team', Tag('Team')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Team',
+        'User',
+    ),
+]
+
+
+# Configurations for project fields.
+ProjectV2FieldConfiguration: TypeAlias = Annotated[
+    Union[
+        Annotated['ProjectV2Field', Tag('ProjectV2Field')],
+        Annotated['ProjectV2IterationField', Tag('ProjectV2IterationField')],
+        Annotated['ProjectV2SingleSelectField', Tag('ProjectV2SingleSelectField')],
+    ],
+    typename_discriminator(
+        'ProjectV2Field',
+        'ProjectV2IterationField',
+        'ProjectV2SingleSelectField',
+    ),
+]
+
+
+# Types that can be inside Project Items.
+ProjectV2ItemContent: TypeAlias = Annotated[
+    Union[
+        Annotated['DraftIssue', Tag('DraftIssue')],
+        Annotated['Issue', Tag('Issue')],
+        Annotated['PullRequest', Tag('PullRequest')],
+    ],
+    typename_discriminator(
+        'DraftIssue',
+        'Issue',
+        'PullRequest',
+    ),
+]
+
+
+# Project field values
+ProjectV2ItemFieldValue: TypeAlias = Annotated[
+    Union[
+        Annotated['ProjectV2ItemFieldDateValue', Tag('ProjectV2ItemFieldDateValue')],
+        Annotated['ProjectV2ItemFieldIterationValue', Tag('ProjectV2ItemFieldIterationValue')],
+        Annotated['ProjectV2ItemFieldLabelValue', Tag('ProjectV2ItemFieldLabelValue')],
+        Annotated['ProjectV2ItemFieldMilestoneValue', Tag('ProjectV2ItemFieldMilestoneValue')],
+        Annotated['ProjectV2ItemFieldNumberValue', Tag('ProjectV2ItemFieldNumberValue')],
+        Annotated['ProjectV2ItemFieldPullRequestValue', Tag('ProjectV2ItemFieldPullRequestValue')],
+        Annotated['ProjectV2ItemFieldRepositoryValue', Tag('ProjectV2ItemFieldRepositoryValue')],
+        Annotated['ProjectV2ItemFieldReviewerValue', Tag('ProjectV2ItemFieldReviewerValue')],
+        Annotated['ProjectV2ItemFieldSingleSelectValue', Tag('ProjectV2ItemFieldSingleSelectValue')],
+        Annotated['ProjectV2ItemFieldTextValue', Tag('ProjectV2ItemFieldTextValue')],
+        Annotated['ProjectV2ItemFieldUserValue', Tag('ProjectV2ItemFieldUserValue')],
+    ],
+    typename_discriminator(
+        'ProjectV2ItemFieldDateValue',
+        'ProjectV2ItemFieldIterationValue',
+        'ProjectV2ItemFieldLabelValue',
+        'ProjectV2ItemFieldMilestoneValue',
+        'ProjectV2ItemFieldNumberValue',
+        'ProjectV2ItemFieldPullRequestValue',
+        'ProjectV2ItemFieldRepositoryValue',
+        'ProjectV2ItemFieldReviewerValue',
+        'ProjectV2ItemFieldSingleSelectValue',
+        'ProjectV2ItemFieldTextValue',
+        'ProjectV2ItemFieldUserValue',
+    ),
+]
+
+
+# An item in a pull request timeline
+PullRequestTimelineItem: TypeAlias = Annotated[
+    Union[
+        Annotated['AssignedEvent', Tag('AssignedEvent')],
+        Annotated['BaseRefDeletedEvent', Tag('BaseRefDeletedEvent')],
+        Annotated['BaseRefForcePushedEvent', Tag('BaseRefForcePushedEvent')],
+        Annotated['ClosedEvent', Tag('ClosedEvent')],
+        Annotated['Commit', Tag('Commit')],
+        Annotated['CommitCommentThread', Tag('CommitCommentThread')],
+        Annotated['CrossReferencedEvent', Tag('CrossReferencedEvent')],
+        Annotated['DemilestonedEvent', Tag('DemilestonedEvent')],
+        Annotated['DeployedEvent', Tag('DeployedEvent')],
+        Annotated['DeploymentEnvironmentChangedEvent', Tag('DeploymentEnvironmentChangedEvent')],
+        Annotated['HeadRefDeletedEvent', Tag('HeadRefDeletedEvent')],
+        Annotated['HeadRefForcePushedEvent', Tag('HeadRefForcePushedEvent')],
+        Annotated['HeadRefRestoredEvent', Tag('HeadRefRestoredEvent')],
+        Annotated['IssueComment', Tag('IssueComment')],
+        Annotated['LabeledEvent', Tag('LabeledEvent')],
+        Annotated['LockedEvent', Tag('LockedEvent')],
+        Annotated['MergedEvent', Tag('MergedEvent')],
+        Annotated['MilestonedEvent', Tag('MilestonedEvent')],
+        Annotated['PullRequestReview', Tag('PullRequestReview')],
+        Annotated['PullRequestReviewComment', Tag('PullRequestReviewComment')],
+        Annotated['PullRequestReviewThread', Tag('PullRequestReviewThread')],
+        Annotated['ReferencedEvent', Tag('ReferencedEvent')],
+        Annotated['RenamedTitleEvent', Tag('RenamedTitleEvent')],
+        Annotated['ReopenedEvent', Tag('ReopenedEvent')],
+        Annotated['ReviewDismissedEvent', Tag('ReviewDismissedEvent')],
+        Annotated['ReviewRequestRemovedEvent', Tag('ReviewRequestRemovedEvent')],
+        Annotated['ReviewRequestedEvent', Tag('ReviewRequestedEvent')],
+        Annotated['SubscribedEvent', Tag('SubscribedEvent')],
+        Annotated['UnassignedEvent', Tag('UnassignedEvent')],
+        Annotated['UnlabeledEvent', Tag('UnlabeledEvent')],
+        Annotated['UnlockedEvent', Tag('UnlockedEvent')],
+        Annotated['UnsubscribedEvent', Tag('UnsubscribedEvent')],
+        Annotated['UserBlockedEvent', Tag('UserBlockedEvent')],
+    ],
+    typename_discriminator(
+        'AssignedEvent',
+        'BaseRefDeletedEvent',
+        'BaseRefForcePushedEvent',
+        'ClosedEvent',
+        'Commit',
+        'CommitCommentThread',
+        'CrossReferencedEvent',
+        'DemilestonedEvent',
+        'DeployedEvent',
+        'DeploymentEnvironmentChangedEvent',
+        'HeadRefDeletedEvent',
+        'HeadRefForcePushedEvent',
+        'HeadRefRestoredEvent',
+        'IssueComment',
+        'LabeledEvent',
+        'LockedEvent',
+        'MergedEvent',
+        'MilestonedEvent',
+        'PullRequestReview',
+        'PullRequestReviewComment',
+        'PullRequestReviewThread',
+        'ReferencedEvent',
+        'RenamedTitleEvent',
+        'ReopenedEvent',
+        'ReviewDismissedEvent',
+        'ReviewRequestRemovedEvent',
+        'ReviewRequestedEvent',
+        'SubscribedEvent',
+        'UnassignedEvent',
+        'UnlabeledEvent',
+        'UnlockedEvent',
+        'UnsubscribedEvent',
+        'UserBlockedEvent',
+    ),
+]
+
+
+# An item in a pull request timeline
+PullRequestTimelineItems: TypeAlias = Annotated[
+    Union[
+        Annotated['AddedToMergeQueueEvent', Tag('AddedToMergeQueueEvent')],
+        Annotated['AddedToProjectEvent', Tag('AddedToProjectEvent')],
+        Annotated['AssignedEvent', Tag('AssignedEvent')],
+        Annotated['AutoMergeDisabledEvent', Tag('AutoMergeDisabledEvent')],
+        Annotated['AutoMergeEnabledEvent', Tag('AutoMergeEnabledEvent')],
+        Annotated['AutoRebaseEnabledEvent', Tag('AutoRebaseEnabledEvent')],
+        Annotated['AutoSquashEnabledEvent', Tag('AutoSquashEnabledEvent')],
+        Annotated['AutomaticBaseChangeFailedEvent', Tag('AutomaticBaseChangeFailedEvent')],
+        Annotated['AutomaticBaseChangeSucceededEvent', Tag('AutomaticBaseChangeSucceededEvent')],
+        Annotated['BaseRefChangedEvent', Tag('BaseRefChangedEvent')],
+        Annotated['BaseRefDeletedEvent', Tag('BaseRefDeletedEvent')],
+        Annotated['BaseRefForcePushedEvent', Tag('BaseRefForcePushedEvent')],
+        Annotated['ClosedEvent', Tag('ClosedEvent')],
+        Annotated['CommentDeletedEvent', Tag('CommentDeletedEvent')],
+        Annotated['ConnectedEvent', Tag('ConnectedEvent')],
+        Annotated['ConvertToDraftEvent', Tag('ConvertToDraftEvent')],
+        Annotated['ConvertedNoteToIssueEvent', Tag('ConvertedNoteToIssueEvent')],
+        Annotated['ConvertedToDiscussionEvent', Tag('ConvertedToDiscussionEvent')],
+        Annotated['CrossReferencedEvent', Tag('CrossReferencedEvent')],
+        Annotated['DemilestonedEvent', Tag('DemilestonedEvent')],
+        Annotated['DeployedEvent', Tag('DeployedEvent')],
+        Annotated['DeploymentEnvironmentChangedEvent', Tag('DeploymentEnvironmentChangedEvent')],
+        Annotated['DisconnectedEvent', Tag('DisconnectedEvent')],
+        Annotated['HeadRefDeletedEvent', Tag('HeadRefDeletedEvent')],
+        Annotated['HeadRefForcePushedEvent', Tag('HeadRefForcePushedEvent')],
+        Annotated['HeadRefRestoredEvent', Tag('HeadRefRestoredEvent')],
+        Annotated['IssueComment', Tag('IssueComment')],
+        Annotated['LabeledEvent', Tag('LabeledEvent')],
+        Annotated['LockedEvent', Tag('LockedEvent')],
+        Annotated['MarkedAsDuplicateEvent', Tag('MarkedAsDuplicateEvent')],
+        Annotated['MentionedEvent', Tag('MentionedEvent')],
+        Annotated['MergedEvent', Tag('MergedEvent')],
+        Annotated['MilestonedEvent', Tag('MilestonedEvent')],
+        Annotated['MovedColumnsInProjectEvent', Tag('MovedColumnsInProjectEvent')],
+        Annotated['PinnedEvent', Tag('PinnedEvent')],
+        Annotated['PullRequestCommit', Tag('PullRequestCommit')],
+        Annotated['PullRequestCommitCommentThread', Tag('PullRequestCommitCommentThread')],
+        Annotated['PullRequestReview', Tag('PullRequestReview')],
+        Annotated['PullRequestReviewThread', Tag('PullRequestReviewThread')],
+        Annotated['PullRequestRevisionMarker', Tag('PullRequestRevisionMarker')],
+        Annotated['ReadyForReviewEvent', Tag('ReadyForReviewEvent')],
+        Annotated['ReferencedEvent', Tag('ReferencedEvent')],
+        Annotated['RemovedFromMergeQueueEvent', Tag('RemovedFromMergeQueueEvent')],
+        Annotated['RemovedFromProjectEvent', Tag('RemovedFromProjectEvent')],
+        Annotated['RenamedTitleEvent', Tag('RenamedTitleEvent')],
+        Annotated['ReopenedEvent', Tag('ReopenedEvent')],
+        Annotated['ReviewDismissedEvent', Tag('ReviewDismissedEvent')],
+        Annotated['ReviewRequestRemovedEvent', Tag('ReviewRequestRemovedEvent')],
+        Annotated['ReviewRequestedEvent', Tag('ReviewRequestedEvent')],
+        Annotated['SubscribedEvent', Tag('SubscribedEvent')],
+        Annotated['TransferredEvent', Tag('TransferredEvent')],
+        Annotated['UnassignedEvent', Tag('UnassignedEvent')],
+        Annotated['UnlabeledEvent', Tag('UnlabeledEvent')],
+        Annotated['UnlockedEvent', Tag('UnlockedEvent')],
+        Annotated['UnmarkedAsDuplicateEvent', Tag('UnmarkedAsDuplicateEvent')],
+        Annotated['UnpinnedEvent', Tag('UnpinnedEvent')],
+        Annotated['UnsubscribedEvent', Tag('UnsubscribedEvent')],
+        Annotated['UserBlockedEvent', Tag('UserBlockedEvent')],
+    ],
+    typename_discriminator(
+        'AddedToMergeQueueEvent',
+        'AddedToProjectEvent',
+        'AssignedEvent',
+        'AutoMergeDisabledEvent',
+        'AutoMergeEnabledEvent',
+        'AutoRebaseEnabledEvent',
+        'AutoSquashEnabledEvent',
+        'AutomaticBaseChangeFailedEvent',
+        'AutomaticBaseChangeSucceededEvent',
+        'BaseRefChangedEvent',
+        'BaseRefDeletedEvent',
+        'BaseRefForcePushedEvent',
+        'ClosedEvent',
+        'CommentDeletedEvent',
+        'ConnectedEvent',
+        'ConvertToDraftEvent',
+        'ConvertedNoteToIssueEvent',
+        'ConvertedToDiscussionEvent',
+        'CrossReferencedEvent',
+        'DemilestonedEvent',
+        'DeployedEvent',
+        'DeploymentEnvironmentChangedEvent',
+        'DisconnectedEvent',
+        'HeadRefDeletedEvent',
+        'HeadRefForcePushedEvent',
+        'HeadRefRestoredEvent',
+        'IssueComment',
+        'LabeledEvent',
+        'LockedEvent',
+        'MarkedAsDuplicateEvent',
+        'MentionedEvent',
+        'MergedEvent',
+        'MilestonedEvent',
+        'MovedColumnsInProjectEvent',
+        'PinnedEvent',
+        'PullRequestCommit',
+        'PullRequestCommitCommentThread',
+        'PullRequestReview',
+        'PullRequestReviewThread',
+        'PullRequestRevisionMarker',
+        'ReadyForReviewEvent',
+        'ReferencedEvent',
+        'RemovedFromMergeQueueEvent',
+        'RemovedFromProjectEvent',
+        'RenamedTitleEvent',
+        'ReopenedEvent',
+        'ReviewDismissedEvent',
+        'ReviewRequestRemovedEvent',
+        'ReviewRequestedEvent',
+        'SubscribedEvent',
+        'TransferredEvent',
+        'UnassignedEvent',
+        'UnlabeledEvent',
+        'UnlockedEvent',
+        'UnmarkedAsDuplicateEvent',
+        'UnpinnedEvent',
+        'UnsubscribedEvent',
+        'UserBlockedEvent',
+    ),
+]
+
+
+# Types that can be an actor.
+PushAllowanceActor: TypeAlias = Annotated[
+    Union[
+        Annotated['App', Tag('App')],
+        Annotated['Team', Tag('Team')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'App',
+        'Team',
+        'User',
+    ),
+]
+
+
+# Types that can be assigned to reactions.
+Reactor: TypeAlias = Annotated[
+    Union[
+        Annotated['Bot', Tag('Bot')],
+        Annotated['Mannequin', Tag('Mannequin')],
+        Annotated['Organization', Tag('Organization')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Bot',
+        'Mannequin',
+        'Organization',
+        'User',
+    ),
+]
+
+
+# Any referencable object
+ReferencedSubject: TypeAlias = Annotated[
+    Union[
+        Annotated['Issue', Tag('Issue')],
+        Annotated['PullRequest', Tag('PullRequest')],
+    ],
+    typename_discriminator(
+        'Issue',
+        'PullRequest',
+    ),
+]
+
+
+# An object which has a renamable title
+RenamedTitleSubject: TypeAlias = Annotated[
+    Union[
+        Annotated['Issue', Tag('Issue')],
+        Annotated['PullRequest', Tag('PullRequest')],
+    ],
+    typename_discriminator(
+        'Issue',
+        'PullRequest',
+    ),
+]
+
+
+# Types that can be requested reviewers.
+RequestedReviewer: TypeAlias = Annotated[
+    Union[
+        Annotated['Bot', Tag('Bot')],
+        Annotated['Mannequin', Tag('Mannequin')],
+        Annotated['Team', Tag('Team')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Bot',
+        'Mannequin',
+        'Team',
+        'User',
+    ),
+]
+
+
+# Types that can be an actor.
+ReviewDismissalAllowanceActor: TypeAlias = Annotated[
+    Union[
+        Annotated['App', Tag('App')],
+        Annotated['Team', Tag('Team')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'App',
+        'Team',
+        'User',
+    ),
+]
+
+
+# Types which can be parameters for `RepositoryRule` objects.
+RuleParameters: TypeAlias = Annotated[
+    Union[
+        Annotated['BranchNamePatternParameters', Tag('BranchNamePatternParameters')],
+        Annotated['CommitAuthorEmailPatternParameters', Tag('CommitAuthorEmailPatternParameters')],
+        Annotated['CommitMessagePatternParameters', Tag('CommitMessagePatternParameters')],
+        Annotated['CommitterEmailPatternParameters', Tag('CommitterEmailPatternParameters')],
+        Annotated['PullRequestParameters', Tag('PullRequestParameters')],
+        Annotated['RequiredDeploymentsParameters', Tag('RequiredDeploymentsParameters')],
+        Annotated['RequiredStatusChecksParameters', Tag('RequiredStatusChecksParameters')],
+        Annotated['TagNamePatternParameters', Tag('TagNamePatternParameters')],
+        Annotated['UpdateParameters', Tag('UpdateParameters')],
+        Annotated['WorkflowsParameters', Tag('WorkflowsParameters')],
+    ],
+    typename_discriminator(
+        'BranchNamePatternParameters',
+        'CommitAuthorEmailPatternParameters',
+        'CommitMessagePatternParameters',
+        'CommitterEmailPatternParameters',
+        'PullRequestParameters',
+        'RequiredDeploymentsParameters',
+        'RequiredStatusChecksParameters',
+        'TagNamePatternParameters',
+        'UpdateParameters',
+        'WorkflowsParameters',
+    ),
+]
+
+
+# Types which can have `RepositoryRule` objects.
+RuleSource: TypeAlias = Annotated[
+    Union[
+        Annotated['Organization', Tag('Organization')],
+        Annotated['Repository', Tag('Repository')],
+    ],
+    typename_discriminator(
+        'Organization',
+        'Repository',
+    ),
+]
+
+
+# The results of a search.
+SearchResultItem: TypeAlias = Annotated[
+    Union[
+        Annotated['App', Tag('App')],
+        Annotated['Discussion', Tag('Discussion')],
+        Annotated['Issue', Tag('Issue')],
+        Annotated['MarketplaceListing', Tag('MarketplaceListing')],
+        Annotated['Organization', Tag('Organization')],
+        Annotated['PullRequest', Tag('PullRequest')],
+        Annotated['Repository', Tag('Repository')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'App',
+        'Discussion',
+        'Issue',
+        'MarketplaceListing',
+        'Organization',
+        'PullRequest',
+        'Repository',
+        'User',
+    ),
+]
+
+
+# Entities that can sponsor others via GitHub Sponsors
+Sponsor: TypeAlias = Annotated[
+    Union[
+        Annotated['Organization', Tag('Organization')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Organization',
+        'User',
+    ),
+]
+
+
+# Entities that can be sponsored via GitHub Sponsors
+SponsorableItem: TypeAlias = Annotated[
+    Union[
+        Annotated['Organization', Tag('Organization')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Organization',
+        'User',
+    ),
+]
+
+
+# A record that can be featured on a GitHub Sponsors profile.
+SponsorsListingFeatureableItem: TypeAlias = Annotated[
+    Union[
+        Annotated['Repository', Tag('Repository')],
+        Annotated['User', Tag('User')],
+    ],
+    typename_discriminator(
+        'Repository',
+        'User',
+    ),
+]
+
+
+# Types that can be inside a StatusCheckRollup context.
+StatusCheckRollupContext: TypeAlias = Annotated[
+    Union[
+        Annotated['CheckRun', Tag('CheckRun')],
+        Annotated['StatusContext', Tag('StatusContext')],
+    ],
+    typename_discriminator(
+        'CheckRun',
+        'StatusContext',
+    ),
+]
+
+
+# Types that can be added to a user list.
+UserListItems: TypeAlias = 'Repository'
+
+
+# Types that can own a verifiable domain.
+VerifiableDomainOwner: TypeAlias = Annotated[
+    Union[
+        Annotated['Enterprise', Tag('Enterprise')],
+        Annotated['Organization', Tag('Organization')],
+    ],
+    typename_discriminator(
+        'Enterprise',
+        'Organization',
+    ),
+]
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnlinkProjectV2FromTeamInput(BaseModel):
+    """
+    Autogenerated input type of UnlinkProjectV2FromTeam
+    """
+
+    clientMutationId: Optional[String] = None
+    projectId: ID
+    teamId: ID
+    typename__: Optional[Literal['UnlinkProjectV2FromTeamInput']] = Field(
+        'UnlinkProjectV2FromTeamInput', alias='__typename'
+    )
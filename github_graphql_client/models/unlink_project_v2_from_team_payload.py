@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnlinkProjectV2FromTeamPayload(BaseModel):
+    """
+    Autogenerated return type of UnlinkProjectV2FromTeam
+    """
+
+    clientMutationId: Optional[String] = None
+    team: Optional[Team] = None
+    typename__: Optional[Literal['UnlinkProjectV2FromTeamPayload']] = Field(
+        'UnlinkProjectV2FromTeamPayload', alias='__typename'
+    )
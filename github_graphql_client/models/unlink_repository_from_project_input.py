@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnlinkRepositoryFromProjectInput(BaseModel):
+    """
+    Autogenerated input type of UnlinkRepositoryFromProject
+    """
+
+    clientMutationId: Optional[String] = None
+    projectId: ID
+    repositoryId: ID
+    typename__: Optional[Literal['UnlinkRepositoryFromProjectInput']] = Field(
+        'UnlinkRepositoryFromProjectInput', alias='__typename'
+    )
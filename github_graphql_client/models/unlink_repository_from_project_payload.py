@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnlinkRepositoryFromProjectPayload(BaseModel):
+    """
+    Autogenerated return type of UnlinkRepositoryFromProject
+    """
+
+    clientMutationId: Optional[String] = None
+    project: Optional[Project] = None
+    repository: Optional[Repository] = None
+    typename__: Optional[
+        Literal['UnlinkRepositoryFromProjectPayload']
+    ] = Field('UnlinkRepositoryFromProjectPayload', alias='__typename')
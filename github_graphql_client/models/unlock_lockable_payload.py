@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnlockLockablePayload(BaseModel):
+    """
+    Autogenerated return type of UnlockLockable
+    """
+
+    actor: Optional[Actor] = None
+    clientMutationId: Optional[String] = None
+    unlockedRecord: Optional[Lockable] = None
+    typename__: Optional[Literal['UnlockLockablePayload']] = Field(
+        'UnlockLockablePayload', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnmarkFileAsViewedInput(BaseModel):
+    """
+    Autogenerated input type of UnmarkFileAsViewed
+    """
+
+    clientMutationId: Optional[String] = None
+    path: String
+    pullRequestId: ID
+    typename__: Optional[Literal['UnmarkFileAsViewedInput']] = Field(
+        'UnmarkFileAsViewedInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnmarkIssueAsDuplicateInput(BaseModel):
+    """
+    Autogenerated input type of UnmarkIssueAsDuplicate
+    """
+
+    canonicalId: ID
+    clientMutationId: Optional[String] = None
+    duplicateId: ID
+    typename__: Optional[Literal['UnmarkIssueAsDuplicateInput']] = Field(
+        'UnmarkIssueAsDuplicateInput', alias='__typename'
+    )
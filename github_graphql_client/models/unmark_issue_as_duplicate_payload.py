@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnmarkIssueAsDuplicatePayload(BaseModel):
+    """
+    Autogenerated return type of UnmarkIssueAsDuplicate
+    """
+
+    clientMutationId: Optional[String] = None
+    duplicate: Optional[IssueOrPullRequest] = None
+    typename__: Optional[Literal['UnmarkIssueAsDuplicatePayload']] = Field(
+        'UnmarkIssueAsDuplicatePayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnmarkProjectV2AsTemplateInput(BaseModel):
+    """
+    Autogenerated input type of UnmarkProjectV2AsTemplate
+    """
+
+    clientMutationId: Optional[String] = None
+    projectId: ID
+    typename__: Optional[Literal['UnmarkProjectV2AsTemplateInput']] = Field(
+        'UnmarkProjectV2AsTemplateInput', alias='__typename'
+    )
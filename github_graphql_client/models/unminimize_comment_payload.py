@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnminimizeCommentPayload(BaseModel):
+    """
+    Autogenerated return type of UnminimizeComment
+    """
+
+    clientMutationId: Optional[String] = None
+    unminimizedComment: Optional[Minimizable] = None
+    typename__: Optional[Literal['UnminimizeCommentPayload']] = Field(
+        'UnminimizeCommentPayload', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UnsubscribeFromNotificationsInput(BaseModel):
+    """
+    Autogenerated input type of UnsubscribeFromNotifications
+    """
+
+    clientMutationId: Optional[String] = None
+    ids: List[ID]
+    typename__: Optional[Literal['UnsubscribeFromNotificationsInput']] = Field(
+        'UnsubscribeFromNotificationsInput', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class UnsubscribedEvent(Node):
+    """
+    Represents an 'unsubscribed' event on a given `Subscribable`.
+    """
+
+    actor: Optional[Actor] = None
+    createdAt: DateTime
+    id: ID
+    subscribable: Subscribable
+    typename__: Optional[Literal['UnsubscribedEvent']] = Field(
+        'UnsubscribedEvent', alias='__typename'
+    )
@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Updatable(BaseModel):
+    """
+    Entities that can be updated.
+    """
+
+    viewerCanUpdate: Boolean
+    typename__: Optional[Literal['Updatable']] = Field(
+        'Updatable', alias='__typename'
+    )
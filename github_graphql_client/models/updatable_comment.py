@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdatableComment(BaseModel):
+    """
+    Comments that can be updated.
+    """
+
+    viewerCannotUpdateReasons: List[CommentCannotUpdateReason]
+    typename__: Optional[Literal['UpdatableComment']] = Field(
+        'UpdatableComment', alias='__typename'
+    )
@@ -0,0 +1,48 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateBranchProtectionRuleInput(BaseModel):
+    """
+    Autogenerated input type of UpdateBranchProtectionRule
+    """
+
+    allowsDeletions: Optional[Boolean] = None
+    allowsForcePushes: Optional[Boolean] = None
+    blocksCreations: Optional[Boolean] = None
+    branchProtectionRuleId: ID
+    bypassForcePushActorIds: Optional[List[ID]] = None
+    bypassPullRequestActorIds: Optional[List[ID]] = None
+    clientMutationId: Optional[String] = None
+    dismissesStaleReviews: Optional[Boolean] = None
+    isAdminEnforced: Optional[Boolean] = None
+    lockAllowsFetchAndMerge: Optional[Boolean] = None
+    lockBranch: Optional[Boolean] = None
+    pattern: Optional[String] = None
+    pushActorIds: Optional[List[ID]] = None
+    requireLastPushApproval: Optional[Boolean] = None
+    requiredApprovingReviewCount: Optional[Int] = None
+    requiredDeploymentEnvironments: Optional[List[String]] = None
+    requiredStatusCheckContexts: Optional[List[String]] = None
+    requiredStatusChecks: Optional[List[RequiredStatusCheckInput]] = None
+    requiresApprovingReviews: Optional[Boolean] = None
+    requiresCodeOwnerReviews: Optional[Boolean] = None
+    requiresCommitSignatures: Optional[Boolean] = None
+    requiresConversationResolution: Optional[Boolean] = None
+    requiresDeployments: Optional[Boolean] = None
+    requiresLinearHistory: Optional[Boolean] = None
+    requiresStatusChecks: Optional[Boolean] = None
+    requiresStrictStatusChecks: Optional[Boolean] = None
+    restrictsPushes: Optional[Boolean] = None
+    restrictsReviewDismissals: Optional[Boolean] = None
+    reviewDismissalActorIds: Optional[List[ID]] = None
+    typename__: Optional[Literal['UpdateBranchProtectionRuleInput']] = Field(
+        'UpdateBranchProtectionRuleInput', alias='__typename'
+    )
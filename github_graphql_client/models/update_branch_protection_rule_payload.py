@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateBranchProtectionRulePayload(BaseModel):
+    """
+    Autogenerated return type of UpdateBranchProtectionRule
+    """
+
+    branchProtectionRule: Optional[BranchProtectionRule] = None
+    clientMutationId: Optional[String] = None
+    typename__: Optional[Literal['UpdateBranchProtectionRulePayload']] = Field(
+        'UpdateBranchProtectionRulePayload', alias='__typename'
+    )
@@ -0,0 +1,31 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateCheckRunInput(BaseModel):
+    """
+    Autogenerated input type of UpdateCheckRun
+    """
+
+    actions: Optional[List[CheckRunAction]] = None
+    checkRunId: ID
+    clientMutationId: Optional[String] = None
+    completedAt: Optional[DateTime] = None
+    conclusion: Optional[CheckConclusionState] = None
+    detailsUrl: Optional[URI] = None
+    externalId: Optional[String] = None
+    name: Optional[String] = None
+    output: Optional[CheckRunOutput] = None
+    repositoryId: ID
+    startedAt: Optional[DateTime] = None
+    status: Optional[RequestableCheckStatusState] = None
+    typename__: Optional[Literal['UpdateCheckRunInput']] = Field(
+        'UpdateCheckRunInput', alias='__typename'
+    )
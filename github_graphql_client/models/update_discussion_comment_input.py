@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateDiscussionCommentInput(BaseModel):
+    """
+    Autogenerated input type of UpdateDiscussionComment
+    """
+
+    body: String
+    clientMutationId: Optional[String] = None
+    commentId: ID
+    typename__: Optional[Literal['UpdateDiscussionCommentInput']] = Field(
+        'UpdateDiscussionCommentInput', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateDiscussionInput(BaseModel):
+    """
+    Autogenerated input type of UpdateDiscussion
+    """
+
+    body: Optional[String] = None
+    categoryId: Optional[ID] = None
+    clientMutationId: Optional[String] = None
+    discussionId: ID
+    title: Optional[String] = None
+    typename__: Optional[Literal['UpdateDiscussionInput']] = Field(
+        'UpdateDiscussionInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseAdministratorRoleInput(BaseModel):
+    """
+    Autogenerated input type of UpdateEnterpriseAdministratorRole
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    login: String
+    role: EnterpriseAdministratorRole
+    typename__: Optional[
+        Literal['UpdateEnterpriseAdministratorRoleInput']
+    ] = Field('UpdateEnterpriseAdministratorRoleInput', alias='__typename')
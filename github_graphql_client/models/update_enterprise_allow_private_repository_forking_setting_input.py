@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseAllowPrivateRepositoryForkingSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateEnterpriseAllowPrivateRepositoryForkingSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    policyValue: Optional[
+        EnterpriseAllowPrivateRepositoryForkingPolicyValue
+    ] = None
+    settingValue: EnterpriseEnabledDisabledSettingValue
+    typename__: Optional[
+        Literal['UpdateEnterpriseAllowPrivateRepositoryForkingSettingInput']
+    ] = Field(
+        'UpdateEnterpriseAllowPrivateRepositoryForkingSettingInput',
+        alias='__typename',
+    )
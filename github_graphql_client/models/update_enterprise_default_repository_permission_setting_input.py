@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseDefaultRepositoryPermissionSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateEnterpriseDefaultRepositoryPermissionSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    settingValue: EnterpriseDefaultRepositoryPermissionSettingValue
+    typename__: Optional[
+        Literal['UpdateEnterpriseDefaultRepositoryPermissionSettingInput']
+    ] = Field(
+        'UpdateEnterpriseDefaultRepositoryPermissionSettingInput',
+        alias='__typename',
+    )
@@ -0,0 +1,31 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseMembersCanCreateRepositoriesSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateEnterpriseMembersCanCreateRepositoriesSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    membersCanCreateInternalRepositories: Optional[Boolean] = None
+    membersCanCreatePrivateRepositories: Optional[Boolean] = None
+    membersCanCreatePublicRepositories: Optional[Boolean] = None
+    membersCanCreateRepositoriesPolicyEnabled: Optional[Boolean] = None
+    settingValue: Optional[
+        EnterpriseMembersCanCreateRepositoriesSettingValue
+    ] = None
+    typename__: Optional[
+        Literal['UpdateEnterpriseMembersCanCreateRepositoriesSettingInput']
+    ] = Field(
+        'UpdateEnterpriseMembersCanCreateRepositoriesSettingInput',
+        alias='__typename',
+    )
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseMembersCanCreateRepositoriesSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateEnterpriseMembersCanCreateRepositoriesSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    enterprise: Optional[Enterprise] = None
+    message: Optional[String] = None
+    typename__: Optional[
+        Literal['UpdateEnterpriseMembersCanCreateRepositoriesSettingPayload']
+    ] = Field(
+        'UpdateEnterpriseMembersCanCreateRepositoriesSettingPayload',
+        alias='__typename',
+    )
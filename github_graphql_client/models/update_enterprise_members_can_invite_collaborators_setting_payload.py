@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseMembersCanInviteCollaboratorsSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateEnterpriseMembersCanInviteCollaboratorsSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    enterprise: Optional[Enterprise] = None
+    message: Optional[String] = None
+    typename__: Optional[
+        Literal['UpdateEnterpriseMembersCanInviteCollaboratorsSettingPayload']
+    ] = Field(
+        'UpdateEnterpriseMembersCanInviteCollaboratorsSettingPayload',
+        alias='__typename',
+    )
@@ -0,0 +1,29 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingPayload(
+    BaseModel
+):
+    """
+    Autogenerated return type of UpdateEnterpriseMembersCanUpdateProtectedBranchesSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    enterprise: Optional[Enterprise] = None
+    message: Optional[String] = None
+    typename__: Optional[
+        Literal[
+            'UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingPayload'
+        ]
+    ] = Field(
+        'UpdateEnterpriseMembersCanUpdateProtectedBranchesSettingPayload',
+        alias='__typename',
+    )
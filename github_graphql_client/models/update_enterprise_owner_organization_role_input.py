@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseOwnerOrganizationRoleInput(BaseModel):
+    """
+    Autogenerated input type of UpdateEnterpriseOwnerOrganizationRole
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    organizationId: ID
+    organizationRole: RoleInOrganization
+    typename__: Optional[
+        Literal['UpdateEnterpriseOwnerOrganizationRoleInput']
+    ] = Field('UpdateEnterpriseOwnerOrganizationRoleInput', alias='__typename')
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseProfileInput(BaseModel):
+    """
+    Autogenerated input type of UpdateEnterpriseProfile
+    """
+
+    clientMutationId: Optional[String] = None
+    description: Optional[String] = None
+    enterpriseId: ID
+    location: Optional[String] = None
+    name: Optional[String] = None
+    websiteUrl: Optional[String] = None
+    typename__: Optional[Literal['UpdateEnterpriseProfileInput']] = Field(
+        'UpdateEnterpriseProfileInput', alias='__typename'
+    )
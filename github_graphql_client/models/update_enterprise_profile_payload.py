@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseProfilePayload(BaseModel):
+    """
+    Autogenerated return type of UpdateEnterpriseProfile
+    """
+
+    clientMutationId: Optional[String] = None
+    enterprise: Optional[Enterprise] = None
+    typename__: Optional[Literal['UpdateEnterpriseProfilePayload']] = Field(
+        'UpdateEnterpriseProfilePayload', alias='__typename'
+    )
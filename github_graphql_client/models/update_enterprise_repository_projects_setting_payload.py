@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseRepositoryProjectsSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateEnterpriseRepositoryProjectsSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    enterprise: Optional[Enterprise] = None
+    message: Optional[String] = None
+    typename__: Optional[
+        Literal['UpdateEnterpriseRepositoryProjectsSettingPayload']
+    ] = Field(
+        'UpdateEnterpriseRepositoryProjectsSettingPayload', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseTeamDiscussionsSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateEnterpriseTeamDiscussionsSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    enterpriseId: ID
+    settingValue: EnterpriseEnabledDisabledSettingValue
+    typename__: Optional[
+        Literal['UpdateEnterpriseTeamDiscussionsSettingInput']
+    ] = Field(
+        'UpdateEnterpriseTeamDiscussionsSettingInput', alias='__typename'
+    )
@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnterpriseTwoFactorAuthenticationRequiredSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateEnterpriseTwoFactorAuthenticationRequiredSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    enterprise: Optional[Enterprise] = None
+    message: Optional[String] = None
+    typename__: Optional[
+        Literal[
+            'UpdateEnterpriseTwoFactorAuthenticationRequiredSettingPayload'
+        ]
+    ] = Field(
+        'UpdateEnterpriseTwoFactorAuthenticationRequiredSettingPayload',
+        alias='__typename',
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateEnvironmentInput(BaseModel):
+    """
+    Autogenerated input type of UpdateEnvironment
+    """
+
+    clientMutationId: Optional[String] = None
+    environmentId: ID
+    preventSelfReview: Optional[Boolean] = None
+    reviewers: Optional[List[ID]] = None
+    waitTimer: Optional[Int] = None
+    typename__: Optional[Literal['UpdateEnvironmentInput']] = Field(
+        'UpdateEnvironmentInput', alias='__typename'
+    )
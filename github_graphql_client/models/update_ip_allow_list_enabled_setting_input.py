@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateIpAllowListEnabledSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateIpAllowListEnabledSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    ownerId: ID
+    settingValue: IpAllowListEnabledSettingValue
+    typename__: Optional[
+        Literal['UpdateIpAllowListEnabledSettingInput']
+    ] = Field('UpdateIpAllowListEnabledSettingInput', alias='__typename')
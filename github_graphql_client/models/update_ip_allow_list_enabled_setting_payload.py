@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateIpAllowListEnabledSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateIpAllowListEnabledSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    owner: Optional[IpAllowListOwner] = None
+    typename__: Optional[
+        Literal['UpdateIpAllowListEnabledSettingPayload']
+    ] = Field('UpdateIpAllowListEnabledSettingPayload', alias='__typename')
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateIpAllowListEntryInput(BaseModel):
+    """
+    Autogenerated input type of UpdateIpAllowListEntry
+    """
+
+    allowListValue: String
+    clientMutationId: Optional[String] = None
+    ipAllowListEntryId: ID
+    isActive: Boolean
+    name: Optional[String] = None
+    typename__: Optional[Literal['UpdateIpAllowListEntryInput']] = Field(
+        'UpdateIpAllowListEntryInput', alias='__typename'
+    )
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateIpAllowListForInstalledAppsEnabledSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateIpAllowListForInstalledAppsEnabledSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    ownerId: ID
+    settingValue: IpAllowListForInstalledAppsEnabledSettingValue
+    typename__: Optional[
+        Literal['UpdateIpAllowListForInstalledAppsEnabledSettingInput']
+    ] = Field(
+        'UpdateIpAllowListForInstalledAppsEnabledSettingInput',
+        alias='__typename',
+    )
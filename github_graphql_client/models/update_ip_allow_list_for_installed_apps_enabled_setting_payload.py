@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateIpAllowListForInstalledAppsEnabledSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateIpAllowListForInstalledAppsEnabledSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    owner: Optional[IpAllowListOwner] = None
+    typename__: Optional[
+        Literal['UpdateIpAllowListForInstalledAppsEnabledSettingPayload']
+    ] = Field(
+        'UpdateIpAllowListForInstalledAppsEnabledSettingPayload',
+        alias='__typename',
+    )
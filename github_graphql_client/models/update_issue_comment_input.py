@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateIssueCommentInput(BaseModel):
+    """
+    Autogenerated input type of UpdateIssueComment
+    """
+
+    body: String
+    clientMutationId: Optional[String] = None
+    id: ID
+    typename__: Optional[Literal['UpdateIssueCommentInput']] = Field(
+        'UpdateIssueCommentInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateIssueCommentPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateIssueComment
+    """
+
+    clientMutationId: Optional[String] = None
+    issueComment: Optional[IssueComment] = None
+    typename__: Optional[Literal['UpdateIssueCommentPayload']] = Field(
+        'UpdateIssueCommentPayload', alias='__typename'
+    )
@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateIssueInput(BaseModel):
+    """
+    Autogenerated input type of UpdateIssue
+    """
+
+    assigneeIds: Optional[List[ID]] = None
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    id: ID
+    labelIds: Optional[List[ID]] = None
+    milestoneId: Optional[ID] = None
+    projectIds: Optional[List[ID]] = None
+    state: Optional[IssueState] = None
+    title: Optional[String] = None
+    typename__: Optional[Literal['UpdateIssueInput']] = Field(
+        'UpdateIssueInput', alias='__typename'
+    )
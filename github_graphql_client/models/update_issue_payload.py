@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateIssuePayload(BaseModel):
+    """
+    Autogenerated return type of UpdateIssue
+    """
+
+    actor: Optional[Actor] = None
+    clientMutationId: Optional[String] = None
+    issue: Optional[Issue] = None
+    typename__: Optional[Literal['UpdateIssuePayload']] = Field(
+        'UpdateIssuePayload', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateLabelInput(BaseModel):
+    """
+    Autogenerated input type of UpdateLabel
+    """
+
+    clientMutationId: Optional[String] = None
+    color: Optional[String] = None
+    description: Optional[String] = None
+    id: ID
+    name: Optional[String] = None
+    typename__: Optional[Literal['UpdateLabelInput']] = Field(
+        'UpdateLabelInput', alias='__typename'
+    )
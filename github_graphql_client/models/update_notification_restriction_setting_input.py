@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateNotificationRestrictionSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateNotificationRestrictionSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    ownerId: ID
+    settingValue: NotificationRestrictionSettingValue
+    typename__: Optional[
+        Literal['UpdateNotificationRestrictionSettingInput']
+    ] = Field('UpdateNotificationRestrictionSettingInput', alias='__typename')
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateNotificationRestrictionSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateNotificationRestrictionSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    owner: Optional[VerifiableDomainOwner] = None
+    typename__: Optional[
+        Literal['UpdateNotificationRestrictionSettingPayload']
+    ] = Field(
+        'UpdateNotificationRestrictionSettingPayload', alias='__typename'
+    )
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateOrganizationAllowPrivateRepositoryForkingSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateOrganizationAllowPrivateRepositoryForkingSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    forkingEnabled: Boolean
+    organizationId: ID
+    typename__: Optional[
+        Literal['UpdateOrganizationAllowPrivateRepositoryForkingSettingInput']
+    ] = Field(
+        'UpdateOrganizationAllowPrivateRepositoryForkingSettingInput',
+        alias='__typename',
+    )
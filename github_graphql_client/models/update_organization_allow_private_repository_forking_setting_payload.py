@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateOrganizationAllowPrivateRepositoryForkingSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateOrganizationAllowPrivateRepositoryForkingSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    message: Optional[String] = None
+    organization: Optional[Organization] = None
+    typename__: Optional[
+        Literal[
+            'UpdateOrganizationAllowPrivateRepositoryForkingSettingPayload'
+        ]
+    ] = Field(
+        'UpdateOrganizationAllowPrivateRepositoryForkingSettingPayload',
+        alias='__typename',
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateOrganizationWebCommitSignoffSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateOrganizationWebCommitSignoffSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    organizationId: ID
+    webCommitSignoffRequired: Boolean
+    typename__: Optional[
+        Literal['UpdateOrganizationWebCommitSignoffSettingInput']
+    ] = Field(
+        'UpdateOrganizationWebCommitSignoffSettingInput', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateOrganizationWebCommitSignoffSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateOrganizationWebCommitSignoffSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    message: Optional[String] = None
+    organization: Optional[Organization] = None
+    typename__: Optional[
+        Literal['UpdateOrganizationWebCommitSignoffSettingPayload']
+    ] = Field(
+        'UpdateOrganizationWebCommitSignoffSettingPayload', alias='__typename'
+    )
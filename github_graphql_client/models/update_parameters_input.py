@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateParametersInput(BaseModel):
+    """
+    Only allow users with bypass permission to update matching refs.
+    """
+
+    updateAllowsFetchAndMerge: Boolean
+    typename__: Optional[Literal['UpdateParametersInput']] = Field(
+        'UpdateParametersInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdatePatreonSponsorabilityInput(BaseModel):
+    """
+    Autogenerated input type of UpdatePatreonSponsorability
+    """
+
+    clientMutationId: Optional[String] = None
+    enablePatreonSponsorships: Boolean
+    sponsorableLogin: Optional[String] = None
+    typename__: Optional[Literal['UpdatePatreonSponsorabilityInput']] = Field(
+        'UpdatePatreonSponsorabilityInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdatePatreonSponsorabilityPayload(BaseModel):
+    """
+    Autogenerated return type of UpdatePatreonSponsorability
+    """
+
+    clientMutationId: Optional[String] = None
+    sponsorsListing: Optional[SponsorsListing] = None
+    typename__: Optional[
+        Literal['UpdatePatreonSponsorabilityPayload']
+    ] = Field('UpdatePatreonSponsorabilityPayload', alias='__typename')
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectCardInput(BaseModel):
+    """
+    Autogenerated input type of UpdateProjectCard
+    """
+
+    clientMutationId: Optional[String] = None
+    isArchived: Optional[Boolean] = None
+    note: Optional[String] = None
+    projectCardId: ID
+    typename__: Optional[Literal['UpdateProjectCardInput']] = Field(
+        'UpdateProjectCardInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectColumnInput(BaseModel):
+    """
+    Autogenerated input type of UpdateProjectColumn
+    """
+
+    clientMutationId: Optional[String] = None
+    name: String
+    projectColumnId: ID
+    typename__: Optional[Literal['UpdateProjectColumnInput']] = Field(
+        'UpdateProjectColumnInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectColumnPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateProjectColumn
+    """
+
+    clientMutationId: Optional[String] = None
+    projectColumn: Optional[ProjectColumn] = None
+    typename__: Optional[Literal['UpdateProjectColumnPayload']] = Field(
+        'UpdateProjectColumnPayload', alias='__typename'
+    )
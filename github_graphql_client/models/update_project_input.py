@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectInput(BaseModel):
+    """
+    Autogenerated input type of UpdateProject
+    """
+
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    name: Optional[String] = None
+    projectId: ID
+    public: Optional[Boolean] = None
+    state: Optional[ProjectState] = None
+    typename__: Optional[Literal['UpdateProjectInput']] = Field(
+        'UpdateProjectInput', alias='__typename'
+    )
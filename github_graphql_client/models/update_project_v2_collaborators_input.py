@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2CollaboratorsInput(BaseModel):
+    """
+    Autogenerated input type of UpdateProjectV2Collaborators
+    """
+
+    clientMutationId: Optional[String] = None
+    collaborators: List[ProjectV2Collaborator]
+    projectId: ID
+    typename__: Optional[Literal['UpdateProjectV2CollaboratorsInput']] = Field(
+        'UpdateProjectV2CollaboratorsInput', alias='__typename'
+    )
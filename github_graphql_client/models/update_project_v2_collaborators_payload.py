@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2CollaboratorsPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateProjectV2Collaborators
+    """
+
+    clientMutationId: Optional[String] = None
+    collaborators: Optional[ProjectV2ActorConnection] = None
+    typename__: Optional[
+        Literal['UpdateProjectV2CollaboratorsPayload']
+    ] = Field('UpdateProjectV2CollaboratorsPayload', alias='__typename')
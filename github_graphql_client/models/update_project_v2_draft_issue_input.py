@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2DraftIssueInput(BaseModel):
+    """
+    Autogenerated input type of UpdateProjectV2DraftIssue
+    """
+
+    assigneeIds: Optional[List[ID]] = None
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    draftIssueId: ID
+    title: Optional[String] = None
+    typename__: Optional[Literal['UpdateProjectV2DraftIssueInput']] = Field(
+        'UpdateProjectV2DraftIssueInput', alias='__typename'
+    )
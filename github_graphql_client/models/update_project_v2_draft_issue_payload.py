@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2DraftIssuePayload(BaseModel):
+    """
+    Autogenerated return type of UpdateProjectV2DraftIssue
+    """
+
+    clientMutationId: Optional[String] = None
+    draftIssue: Optional[DraftIssue] = None
+    typename__: Optional[Literal['UpdateProjectV2DraftIssuePayload']] = Field(
+        'UpdateProjectV2DraftIssuePayload', alias='__typename'
+    )
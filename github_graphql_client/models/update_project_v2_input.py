@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2Input(BaseModel):
+    """
+    Autogenerated input type of UpdateProjectV2
+    """
+
+    clientMutationId: Optional[String] = None
+    closed: Optional[Boolean] = None
+    projectId: ID
+    public: Optional[Boolean] = None
+    readme: Optional[String] = None
+    shortDescription: Optional[String] = None
+    title: Optional[String] = None
+    typename__: Optional[Literal['UpdateProjectV2Input']] = Field(
+        'UpdateProjectV2Input', alias='__typename'
+    )
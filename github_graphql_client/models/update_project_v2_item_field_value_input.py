@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2ItemFieldValueInput(BaseModel):
+    """
+    Autogenerated input type of UpdateProjectV2ItemFieldValue
+    """
+
+    clientMutationId: Optional[String] = None
+    fieldId: ID
+    itemId: ID
+    projectId: ID
+    value: ProjectV2FieldValue
+    typename__: Optional[
+        Literal['UpdateProjectV2ItemFieldValueInput']
+    ] = Field('UpdateProjectV2ItemFieldValueInput', alias='__typename')
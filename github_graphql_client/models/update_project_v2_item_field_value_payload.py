@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2ItemFieldValuePayload(BaseModel):
+    """
+    Autogenerated return type of UpdateProjectV2ItemFieldValue
+    """
+
+    clientMutationId: Optional[String] = None
+    projectV2Item: Optional[ProjectV2Item] = None
+    typename__: Optional[
+        Literal['UpdateProjectV2ItemFieldValuePayload']
+    ] = Field('UpdateProjectV2ItemFieldValuePayload', alias='__typename')
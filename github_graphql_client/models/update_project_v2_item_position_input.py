@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2ItemPositionInput(BaseModel):
+    """
+    Autogenerated input type of UpdateProjectV2ItemPosition
+    """
+
+    afterId: Optional[ID] = None
+    clientMutationId: Optional[String] = None
+    itemId: ID
+    projectId: ID
+    typename__: Optional[Literal['UpdateProjectV2ItemPositionInput']] = Field(
+        'UpdateProjectV2ItemPositionInput', alias='__typename'
+    )
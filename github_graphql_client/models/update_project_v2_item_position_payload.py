@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2ItemPositionPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateProjectV2ItemPosition
+    """
+
+    clientMutationId: Optional[String] = None
+    items: Optional[ProjectV2ItemConnection] = None
+    typename__: Optional[
+        Literal['UpdateProjectV2ItemPositionPayload']
+    ] = Field('UpdateProjectV2ItemPositionPayload', alias='__typename')
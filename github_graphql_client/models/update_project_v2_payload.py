@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateProjectV2Payload(BaseModel):
+    """
+    Autogenerated return type of UpdateProjectV2
+    """
+
+    clientMutationId: Optional[String] = None
+    projectV2: Optional[ProjectV2] = None
+    typename__: Optional[Literal['UpdateProjectV2Payload']] = Field(
+        'UpdateProjectV2Payload', alias='__typename'
+    )
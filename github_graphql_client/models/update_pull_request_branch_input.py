@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdatePullRequestBranchInput(BaseModel):
+    """
+    Autogenerated input type of UpdatePullRequestBranch
+    """
+
+    clientMutationId: Optional[String] = None
+    expectedHeadOid: Optional[GitObjectID] = None
+    pullRequestId: ID
+    updateMethod: Optional[PullRequestBranchUpdateMethod] = None
+    typename__: Optional[Literal['UpdatePullRequestBranchInput']] = Field(
+        'UpdatePullRequestBranchInput', alias='__typename'
+    )
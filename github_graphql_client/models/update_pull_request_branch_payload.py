@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdatePullRequestBranchPayload(BaseModel):
+    """
+    Autogenerated return type of UpdatePullRequestBranch
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequest: Optional[PullRequest] = None
+    typename__: Optional[Literal['UpdatePullRequestBranchPayload']] = Field(
+        'UpdatePullRequestBranchPayload', alias='__typename'
+    )
@@ -0,0 +1,30 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdatePullRequestInput(BaseModel):
+    """
+    Autogenerated input type of UpdatePullRequest
+    """
+
+    assigneeIds: Optional[List[ID]] = None
+    baseRefName: Optional[String] = None
+    body: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    labelIds: Optional[List[ID]] = None
+    maintainerCanModify: Optional[Boolean] = None
+    milestoneId: Optional[ID] = None
+    projectIds: Optional[List[ID]] = None
+    pullRequestId: ID
+    state: Optional[PullRequestUpdateState] = None
+    title: Optional[String] = None
+    typename__: Optional[Literal['UpdatePullRequestInput']] = Field(
+        'UpdatePullRequestInput', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdatePullRequestReviewCommentInput(BaseModel):
+    """
+    Autogenerated input type of UpdatePullRequestReviewComment
+    """
+
+    body: String
+    clientMutationId: Optional[String] = None
+    pullRequestReviewCommentId: ID
+    typename__: Optional[
+        Literal['UpdatePullRequestReviewCommentInput']
+    ] = Field('UpdatePullRequestReviewCommentInput', alias='__typename')
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdatePullRequestReviewCommentPayload(BaseModel):
+    """
+    Autogenerated return type of UpdatePullRequestReviewComment
+    """
+
+    clientMutationId: Optional[String] = None
+    pullRequestReviewComment: Optional[PullRequestReviewComment] = None
+    typename__: Optional[
+        Literal['UpdatePullRequestReviewCommentPayload']
+    ] = Field('UpdatePullRequestReviewCommentPayload', alias='__typename')
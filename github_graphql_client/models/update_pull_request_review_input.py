@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdatePullRequestReviewInput(BaseModel):
+    """
+    Autogenerated input type of UpdatePullRequestReview
+    """
+
+    body: String
+    clientMutationId: Optional[String] = None
+    pullRequestReviewId: ID
+    typename__: Optional[Literal['UpdatePullRequestReviewInput']] = Field(
+        'UpdatePullRequestReviewInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateRefInput(BaseModel):
+    """
+    Autogenerated input type of UpdateRef
+    """
+
+    clientMutationId: Optional[String] = None
+    force: Optional[Boolean] = False
+    oid: GitObjectID
+    refId: ID
+    typename__: Optional[Literal['UpdateRefInput']] = Field(
+        'UpdateRefInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateRefPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateRef
+    """
+
+    clientMutationId: Optional[String] = None
+    ref: Optional[Ref] = None
+    typename__: Optional[Literal['UpdateRefPayload']] = Field(
+        'UpdateRefPayload', alias='__typename'
+    )
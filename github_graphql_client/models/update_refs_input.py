@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateRefsInput(BaseModel):
+    """
+    Autogenerated input type of UpdateRefs
+    """
+
+    clientMutationId: Optional[String] = None
+    refUpdates: List[RefUpdate]
+    repositoryId: ID
+    typename__: Optional[Literal['UpdateRefsInput']] = Field(
+        'UpdateRefsInput', alias='__typename'
+    )
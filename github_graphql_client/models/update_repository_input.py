@@ -0,0 +1,29 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateRepositoryInput(BaseModel):
+    """
+    Autogenerated input type of UpdateRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    description: Optional[String] = None
+    hasDiscussionsEnabled: Optional[Boolean] = None
+    hasIssuesEnabled: Optional[Boolean] = None
+    hasProjectsEnabled: Optional[Boolean] = None
+    hasWikiEnabled: Optional[Boolean] = None
+    homepageUrl: Optional[URI] = None
+    name: Optional[String] = None
+    repositoryId: ID
+    template: Optional[Boolean] = None
+    typename__: Optional[Literal['UpdateRepositoryInput']] = Field(
+        'UpdateRepositoryInput', alias='__typename'
+    )
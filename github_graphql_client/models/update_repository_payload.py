@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateRepositoryPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    repository: Optional[Repository] = None
+    typename__: Optional[Literal['UpdateRepositoryPayload']] = Field(
+        'UpdateRepositoryPayload', alias='__typename'
+    )
@@ -0,0 +1,27 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateRepositoryRulesetInput(BaseModel):
+    """
+    Autogenerated input type of UpdateRepositoryRuleset
+    """
+
+    bypassActors: Optional[List[RepositoryRulesetBypassActorInput]] = None
+    clientMutationId: Optional[String] = None
+    conditions: Optional[RepositoryRuleConditionsInput] = None
+    enforcement: Optional[RuleEnforcement] = None
+    name: Optional[String] = None
+    repositoryRulesetId: ID
+    rules: Optional[List[RepositoryRuleInput]] = None
+    target: Optional[RepositoryRulesetTarget] = None
+    typename__: Optional[Literal['UpdateRepositoryRulesetInput']] = Field(
+        'UpdateRepositoryRulesetInput', alias='__typename'
+    )
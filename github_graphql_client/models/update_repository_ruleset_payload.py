@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateRepositoryRulesetPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateRepositoryRuleset
+    """
+
+    clientMutationId: Optional[String] = None
+    ruleset: Optional[RepositoryRuleset] = None
+    typename__: Optional[Literal['UpdateRepositoryRulesetPayload']] = Field(
+        'UpdateRepositoryRulesetPayload', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateRepositoryWebCommitSignoffSettingInput(BaseModel):
+    """
+    Autogenerated input type of UpdateRepositoryWebCommitSignoffSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    repositoryId: ID
+    webCommitSignoffRequired: Boolean
+    typename__: Optional[
+        Literal['UpdateRepositoryWebCommitSignoffSettingInput']
+    ] = Field(
+        'UpdateRepositoryWebCommitSignoffSettingInput', alias='__typename'
+    )
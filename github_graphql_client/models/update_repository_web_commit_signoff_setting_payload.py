@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateRepositoryWebCommitSignoffSettingPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateRepositoryWebCommitSignoffSetting
+    """
+
+    clientMutationId: Optional[String] = None
+    message: Optional[String] = None
+    repository: Optional[Repository] = None
+    typename__: Optional[
+        Literal['UpdateRepositoryWebCommitSignoffSettingPayload']
+    ] = Field(
+        'UpdateRepositoryWebCommitSignoffSettingPayload', alias='__typename'
+    )
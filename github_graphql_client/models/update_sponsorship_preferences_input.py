@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateSponsorshipPreferencesInput(BaseModel):
+    """
+    Autogenerated input type of UpdateSponsorshipPreferences
+    """
+
+    clientMutationId: Optional[String] = None
+    privacyLevel: Optional[SponsorshipPrivacy] = 'PUBLIC'
+    receiveEmails: Optional[Boolean] = True
+    sponsorId: Optional[ID] = None
+    sponsorLogin: Optional[String] = None
+    sponsorableId: Optional[ID] = None
+    sponsorableLogin: Optional[String] = None
+    typename__: Optional[Literal['UpdateSponsorshipPreferencesInput']] = Field(
+        'UpdateSponsorshipPreferencesInput', alias='__typename'
+    )
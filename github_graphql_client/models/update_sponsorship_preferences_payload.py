@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateSponsorshipPreferencesPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateSponsorshipPreferences
+    """
+
+    clientMutationId: Optional[String] = None
+    sponsorship: Optional[Sponsorship] = None
+    typename__: Optional[
+        Literal['UpdateSponsorshipPreferencesPayload']
+    ] = Field('UpdateSponsorshipPreferencesPayload', alias='__typename')
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateSubscriptionInput(BaseModel):
+    """
+    Autogenerated input type of UpdateSubscription
+    """
+
+    clientMutationId: Optional[String] = None
+    state: SubscriptionState
+    subscribableId: ID
+    typename__: Optional[Literal['UpdateSubscriptionInput']] = Field(
+        'UpdateSubscriptionInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateSubscriptionPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateSubscription
+    """
+
+    clientMutationId: Optional[String] = None
+    subscribable: Optional[Subscribable] = None
+    typename__: Optional[Literal['UpdateSubscriptionPayload']] = Field(
+        'UpdateSubscriptionPayload', alias='__typename'
+    )
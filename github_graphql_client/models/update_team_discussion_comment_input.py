@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateTeamDiscussionCommentInput(BaseModel):
+    """
+    Autogenerated input type of UpdateTeamDiscussionComment
+    """
+
+    body: String
+    bodyVersion: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    id: ID
+    typename__: Optional[Literal['UpdateTeamDiscussionCommentInput']] = Field(
+        'UpdateTeamDiscussionCommentInput', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateTeamDiscussionCommentPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateTeamDiscussionComment
+    """
+
+    clientMutationId: Optional[String] = None
+    teamDiscussionComment: Optional[TeamDiscussionComment] = None
+    typename__: Optional[
+        Literal['UpdateTeamDiscussionCommentPayload']
+    ] = Field('UpdateTeamDiscussionCommentPayload', alias='__typename')
@@ -0,0 +1,25 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateTeamDiscussionInput(BaseModel):
+    """
+    Autogenerated input type of UpdateTeamDiscussion
+    """
+
+    body: Optional[String] = None
+    bodyVersion: Optional[String] = None
+    clientMutationId: Optional[String] = None
+    id: ID
+    pinned: Optional[Boolean] = None
+    title: Optional[String] = None
+    typename__: Optional[Literal['UpdateTeamDiscussionInput']] = Field(
+        'UpdateTeamDiscussionInput', alias='__typename'
+    )
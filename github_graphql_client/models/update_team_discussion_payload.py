@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateTeamDiscussionPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateTeamDiscussion
+    """
+
+    clientMutationId: Optional[String] = None
+    teamDiscussion: Optional[TeamDiscussion] = None
+    typename__: Optional[Literal['UpdateTeamDiscussionPayload']] = Field(
+        'UpdateTeamDiscussionPayload', alias='__typename'
+    )
@@ -0,0 +1,26 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateTeamReviewAssignmentInput(BaseModel):
+    """
+    Autogenerated input type of UpdateTeamReviewAssignment
+    """
+
+    algorithm: Optional[TeamReviewAssignmentAlgorithm] = 'ROUND_ROBIN'
+    clientMutationId: Optional[String] = None
+    enabled: Boolean
+    excludedTeamMemberIds: Optional[List[ID]] = None
+    id: ID
+    notifyTeam: Optional[Boolean] = True
+    teamMemberCount: Optional[Int] = 1
+    typename__: Optional[Literal['UpdateTeamReviewAssignmentInput']] = Field(
+        'UpdateTeamReviewAssignmentInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateTeamsRepositoryInput(BaseModel):
+    """
+    Autogenerated input type of UpdateTeamsRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    permission: RepositoryPermission
+    repositoryId: ID
+    teamIds: List[ID]
+    typename__: Optional[Literal['UpdateTeamsRepositoryInput']] = Field(
+        'UpdateTeamsRepositoryInput', alias='__typename'
+    )
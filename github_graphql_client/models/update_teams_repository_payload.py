@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateTeamsRepositoryPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateTeamsRepository
+    """
+
+    clientMutationId: Optional[String] = None
+    repository: Optional[Repository] = None
+    teams: Optional[List[Team]] = Field(default_factory=list)
+    typename__: Optional[Literal['UpdateTeamsRepositoryPayload']] = Field(
+        'UpdateTeamsRepositoryPayload', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateTopicsInput(BaseModel):
+    """
+    Autogenerated input type of UpdateTopics
+    """
+
+    clientMutationId: Optional[String] = None
+    repositoryId: ID
+    topicNames: List[String]
+    typename__: Optional[Literal['UpdateTopicsInput']] = Field(
+        'UpdateTopicsInput', alias='__typename'
+    )
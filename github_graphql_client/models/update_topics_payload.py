@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateTopicsPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateTopics
+    """
+
+    clientMutationId: Optional[String] = None
+    invalidTopicNames: Optional[List[String]] = Field(default_factory=list)
+    repository: Optional[Repository] = None
+    typename__: Optional[Literal['UpdateTopicsPayload']] = Field(
+        'UpdateTopicsPayload', alias='__typename'
+    )
@@ -0,0 +1,24 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateUserListInput(BaseModel):
+    """
+    Autogenerated input type of UpdateUserList
+    """
+
+    clientMutationId: Optional[String] = None
+    description: Optional[String] = None
+    isPrivate: Optional[Boolean] = None
+    listId: ID
+    name: Optional[String] = None
+    typename__: Optional[Literal['UpdateUserListInput']] = Field(
+        'UpdateUserListInput', alias='__typename'
+    )
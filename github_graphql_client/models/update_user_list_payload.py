@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateUserListPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateUserList
+    """
+
+    clientMutationId: Optional[String] = None
+    list: Optional[UserList] = None
+    typename__: Optional[Literal['UpdateUserListPayload']] = Field(
+        'UpdateUserListPayload', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateUserListsForItemInput(BaseModel):
+    """
+    Autogenerated input type of UpdateUserListsForItem
+    """
+
+    clientMutationId: Optional[String] = None
+    itemId: ID
+    listIds: List[ID]
+    suggestedListIds: Optional[List[ID]] = None
+    typename__: Optional[Literal['UpdateUserListsForItemInput']] = Field(
+        'UpdateUserListsForItemInput', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UpdateUserListsForItemPayload(BaseModel):
+    """
+    Autogenerated return type of UpdateUserListsForItem
+    """
+
+    clientMutationId: Optional[String] = None
+    item: Optional[UserListItems] = None
+    lists: Optional[List[UserList]] = Field(default_factory=list)
+    user: Optional[User] = None
+    typename__: Optional[Literal['UpdateUserListsForItemPayload']] = Field(
+        'UpdateUserListsForItemPayload', alias='__typename'
+    )
@@ -0,0 +1,28 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .node import Node
+
+
+class UserContentEdit(Node):
+    """
+    An edit on user content
+    """
+
+    createdAt: DateTime
+    deletedAt: Optional[DateTime] = None
+    deletedBy: Optional[Actor] = None
+    diff: Optional[String] = None
+    editedAt: DateTime
+    editor: Optional[Actor] = None
+    id: ID
+    updatedAt: DateTime
+    typename__: Optional[Literal['UserContentEdit']] = Field(
+        'UserContentEdit', alias='__typename'
+    )
@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UserEmailMetadata(BaseModel):
+    """
+    Email attributes from External Identity
+    """
+
+    primary: Optional[Boolean] = None
+    type: Optional[String] = None
+    value: String
+    typename__: Optional[Literal['UserEmailMetadata']] = Field(
+        'UserEmailMetadata', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UserListSuggestion(BaseModel):
+    """
+    Represents a suggested user list.
+    """
+
+    id: Optional[ID] = None
+    name: Optional[String] = None
+    typename__: Optional[Literal['UserListSuggestion']] = Field(
+        'UserListSuggestion', alias='__typename'
+    )
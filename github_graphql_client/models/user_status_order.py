@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class UserStatusOrder(BaseModel):
+    """
+    Ordering options for user status connections.
+    """
+
+    direction: OrderDirection
+    field: UserStatusOrderField
+    typename__: Optional[Literal['UserStatusOrder']] = Field(
+        'UserStatusOrder', alias='__typename'
+    )
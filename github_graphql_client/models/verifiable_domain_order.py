@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class VerifiableDomainOrder(BaseModel):
+    """
+    Ordering options for verifiable domain connections.
+    """
+
+    direction: OrderDirection
+    field: VerifiableDomainOrderField
+    typename__: Optional[Literal['VerifiableDomainOrder']] = Field(
+        'VerifiableDomainOrder', alias='__typename'
+    )
@@ -0,0 +1,21 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class VerifyVerifiableDomainPayload(BaseModel):
+    """
+    Autogenerated return type of VerifyVerifiableDomain
+    """
+
+    clientMutationId: Optional[String] = None
+    domain: Optional[VerifiableDomain] = None
+    typename__: Optional[Literal['VerifyVerifiableDomainPayload']] = Field(
+        'VerifyVerifiableDomainPayload', alias='__typename'
+    )
@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+from .hovercard_context import HovercardContext
+
+
+class ViewerHovercardContext(HovercardContext):
+    """
+    A hovercard context with a message describing how the viewer is related.
+    """
+
+    message: String
+    octicon: String
+    viewer: User
+    typename__: Optional[Literal['ViewerHovercardContext']] = Field(
+        'ViewerHovercardContext', alias='__typename'
+    )
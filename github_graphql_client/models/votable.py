@@ -0,0 +1,22 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class Votable(BaseModel):
+    """
+    A subject that may be upvoted.
+    """
+
+    upvoteCount: Int
+    viewerCanUpvote: Boolean
+    viewerHasUpvoted: Boolean
+    typename__: Optional[Literal['Votable']] = Field(
+        'Votable', alias='__typename'
+    )
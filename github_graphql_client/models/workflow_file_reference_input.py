@@ -0,0 +1,23 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class WorkflowFileReferenceInput(BaseModel):
+    """
+    A workflow that must run for this rule to pass
+    """
+
+    path: String
+    ref: Optional[String] = None
+    repositoryId: Int
+    sha: Optional[String] = None
+    typename__: Optional[Literal['WorkflowFileReferenceInput']] = Field(
+        'WorkflowFileReferenceInput', alias='__typename'
+    )
@@ -0,0 +1,20 @@
+# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel
+
+
+class WorkflowsParametersInput(BaseModel):
+    """
+    Require all changes made to a targeted branch to pass the specified workflows before they can be merged.
+    """
+
+    workflows: List[WorkflowFileReferenceInput]
+    typename__: Optional[Literal['WorkflowsParametersInput']] = Field(
+        'WorkflowsParametersInput', alias='__typename'
+    )
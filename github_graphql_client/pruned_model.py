@@ -0,0 +1,249 @@
+# generated by scripts/prune_schema.py, do not edit
+from __future__ import annotations
+
+from enum import Enum
+from typing import List, Optional, TypeAlias
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from github_graphql_client.models._base import BaseModel
+
+
+Boolean: TypeAlias = bool
+"""
+The `Boolean` scalar type represents `true` or `false`.
+"""
+
+
+DateTime: TypeAlias = str
+"""
+An ISO-8601 encoded UTC date string.
+"""
+
+
+Float: TypeAlias = float
+"""
+The `Float` scalar type represents signed double-precision fractional values as specified by [IEEE 754](https://en.wikipedia.org/wiki/IEEE_floating_point).
+"""
+
+
+ID: TypeAlias = str
+"""
+The `ID` scalar type represents a unique identifier, often used to refetch an object or as key for a cache. The ID type appears in a JSON response as a String; however, it is not intended to be human-readable. When expected as an input type, any string (such as `"4"`) or integer (such as `4`) input value will be accepted as an ID.
+"""
+
+
+Int: TypeAlias = int
+"""
+The `Int` scalar type represents non-fractional signed whole numeric values. Int can represent values between -(2^31) and 2^31 - 1.
+"""
+
+
+String: TypeAlias = str
+"""
+The `String` scalar type represents textual data, represented as UTF-8 character sequences. The String type is most often used by GraphQL to represent free-form human-readable text.
+"""
+
+
+URI: TypeAlias = str
+"""
+An RFC 3986, RFC 3987, and RFC 6570 (level 4) compliant URI string.
+"""
+
+
+class IssueState(Enum):
+    """
+    The possible states of an issue.
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+
+class Issue(BaseModel):
+    """
+    An Issue is a place to discuss ideas, enhancements, tasks, and bugs for a project.
+    """
+
+    body: String
+    bodyResourcePath: URI
+    bodyText: String
+    bodyUrl: URI
+    closed: Boolean
+    closedAt: Optional[DateTime] = None
+    createdAt: DateTime
+    createdViaEmail: Boolean
+    databaseId: Optional[Int] = None
+    id: ID
+    includesCreatedEdit: Boolean
+    isPinned: Optional[Boolean] = None
+    isReadByViewer: Optional[Boolean] = None
+    lastEditedAt: Optional[DateTime] = None
+    locked: Boolean
+    number: Int
+    publishedAt: Optional[DateTime] = None
+    repository: Repository
+    resourcePath: URI
+    state: IssueState
+    title: String
+    titleHTML: String
+    trackedInIssues: IssueConnection
+    trackedIssues: IssueConnection
+    trackedIssuesCount: Int
+    updatedAt: DateTime
+    url: URI
+    viewerCanClose: Boolean
+    viewerCanDelete: Boolean
+    viewerCanReact: Boolean
+    viewerCanReopen: Boolean
+    viewerCanSubscribe: Boolean
+    viewerCanUpdate: Boolean
+    viewerDidAuthor: Boolean
+    typename__: Optional[Literal['Issue']] = Field('Issue', alias='__typename')
+
+
+class IssueConnection(BaseModel):
+    """
+    The connection type for Issue.
+    """
+
+    edges: Optional[List[Optional[IssueEdge]]] = Field(default_factory=list)
+    nodes: Optional[List[Optional[Issue]]] = Field(default_factory=list)
+    pageInfo: PageInfo
+    totalCount: Int
+    typename__: Optional[Literal['IssueConnection']] = Field(
+        'IssueConnection', alias='__typename'
+    )
+
+
+class IssueEdge(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    cursor: String
+    node: Optional[Issue] = None
+    typename__: Optional[Literal['IssueEdge']] = Field(
+        'IssueEdge', alias='__typename'
+    )
+
+
+class MarketplaceCategory(BaseModel):
+    """
+    A public description of a Marketplace category.
+    """
+
+    description: Optional[String] = None
+    howItWorks: Optional[String] = None
+    id: ID
+    name: String
+    primaryListingCount: Int
+    resourcePath: URI
+    secondaryListingCount: Int
+    slug: String
+    url: URI
+    typename__: Optional[Literal['MarketplaceCategory']] = Field(
+        'MarketplaceCategory', alias='__typename'
+    )
+
+
+class PageInfo(BaseModel):
+    """
+    Information about pagination in a connection.
+    """
+
+    endCursor: Optional[String] = None
+    hasNextPage: Boolean
+    hasPreviousPage: Boolean
+    startCursor: Optional[String] = None
+    typename__: Optional[Literal['PageInfo']] = Field(
+        'PageInfo', alias='__typename'
+    )
+
+
+class RateLimit(BaseModel):
+    """
+    Represents the client's rate limit.
+    """
+
+    cost: Int
+    limit: Int
+    nodeCount: Int
+    remaining: Int
+    resetAt: DateTime
+    used: Int
+    typename__: Optional[Literal['RateLimit']] = Field(
+        'RateLimit', alias='__typename'
+    )
+
+
+class Repository(BaseModel):
+    """
+    A repository contains the content for a project.
+    """
+
+    allowUpdateBranch: Boolean
+    archivedAt: Optional[DateTime] = None
+    autoMergeAllowed: Boolean
+    createdAt: DateTime
+    databaseId: Optional[Int] = None
+    deleteBranchOnMerge: Boolean
+    description: Optional[String] = None
+    diskUsage: Optional[Int] = None
+    forkCount: Int
+    forkingAllowed: Boolean
+    hasDiscussionsEnabled: Boolean
+    hasIssuesEnabled: Boolean
+    hasProjectsEnabled: Boolean
+    hasVulnerabilityAlertsEnabled: Boolean
+    hasWikiEnabled: Boolean
+    homepageUrl: Optional[URI] = None
+    id: ID
+    isArchived: Boolean
+    isBlankIssuesEnabled: Boolean
+    isDisabled: Boolean
+    isEmpty: Boolean
+    isFork: Boolean
+    isInOrganization: Boolean
+    isLocked: Boolean
+    isMirror: Boolean
+    isPrivate: Boolean
+    isSecurityPolicyEnabled: Optional[Boolean] = None
+    isTemplate: Boolean
+    isUserConfigurationRepository: Boolean
+    issue: Optional[Issue] = None
+    issues: IssueConnection
+    mergeCommitAllowed: Boolean
+    mirrorUrl: Optional[URI] = None
+    name: String
+    nameWithOwner: String
+    openGraphImageUrl: URI
+    parent: Optional[Repository] = None
+    projectsResourcePath: URI
+    projectsUrl: URI
+    pushedAt: Optional[DateTime] = None
+    rebaseMergeAllowed: Boolean
+    resourcePath: URI
+    securityPolicyUrl: Optional[URI] = None
+    squashMergeAllowed: Boolean
+    squashPrTitleUsedAsDefault: Boolean
+    stargazerCount: Int
+    tempCloneToken: Optional[String] = None
+    templateRepository: Optional[Repository] = None
+    updatedAt: DateTime
+    url: URI
+    usesCustomOpenGraphImage: Boolean
+    viewerCanAdminister: Boolean
+    viewerCanCreateProjects: Boolean
+    viewerCanSubscribe: Boolean
+    viewerCanUpdateTopics: Boolean
+    viewerDefaultCommitEmail: Optional[String] = None
+    viewerHasStarred: Boolean
+    viewerPossibleCommitEmails: Optional[List[String]] = Field(
+        default_factory=list
+    )
+    webCommitSignoffRequired: Boolean
+    typename__: Optional[Literal['Repository']] = Field(
+        'Repository', alias='__typename'
+    )
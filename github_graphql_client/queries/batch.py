@@ -0,0 +1,286 @@
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Union
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+from graphql_query.types import Fragment, InlineFragment
+
+OperationItem = tuple[Operation, dict[str, Any]]
+
+
+@dataclass
+class MergedQuery:
+    """One GraphQL document holding the root queries of many operations.
+
+    `aliases[i]` maps the merged alias of every root query of the i-th
+    operation to its original response key.
+    """
+
+    query: str
+    variables: dict[str, Any]
+    aliases: list[dict[str, str]]
+
+    def split(self, data: Optional[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Split the merged response `data` into per-operation results.
+
+        GraphQL errors are not part of `data`, see `split_payload`.
+        """
+        data = data or {}
+
+        return [
+            {key: data.get(alias) for alias, key in aliases.items()}
+            for aliases in self.aliases
+        ]
+
+    def split_payload(self, payload: dict[str, Any]) -> list[dict[str, Any]]:
+        """Split the whole merged response `payload` into per-operation
+        payloads with their `data` and `errors`, e.g. for
+        `ExecutionResult.from_payload`.
+
+        An error goes to the operation of the root alias its `path` starts
+        with, which is rewritten back to the original key. Errors without
+        such a path concern the whole document and go to every operation.
+        """
+        payloads = [{"data": data} for data in self.split(payload.get("data"))]
+        owners = {
+            alias: (i, key)
+            for i, aliases in enumerate(self.aliases)
+            for alias, key in aliases.items()
+        }
+
+        for error in payload.get("errors") or []:
+            path = error.get("path") or [None]
+            owner = owners.get(path[0])
+            if owner is None:
+                for item in payloads:
+                    item.setdefault("errors", []).append(error)
+                continue
+
+            i, key = owner
+            payloads[i].setdefault("errors", []).append(
+                {**error, "path": [key, *path[1:]]}
+            )
+
+        return payloads
+
+
+def _prefix(index: int) -> str:
+    return f"q{index}_"
+
+
+def _rename_value(value: Any, names: dict[str, Variable]) -> Any:
+    if isinstance(value, Variable):
+        return names[value.name]
+    if isinstance(value, Argument):
+        return value.model_copy(
+            update={"value": _rename_value(value.value, names)}
+        )
+    if isinstance(value, list):
+        return [_rename_value(v, names) for v in value]
+    return value
+
+
+def _rename_arguments(
+    arguments: list[Argument], names: dict[str, Variable]
+) -> list[Argument]:
+    return [_rename_value(argument, names) for argument in arguments]
+
+
+def _rename_field(
+    field: Union[str, Field, InlineFragment, Fragment, Any],
+    names: dict[str, Variable],
+    fragments: dict[str, str],
+) -> Any:
+    if isinstance(field, (Field, Query, InlineFragment)):
+        update: dict[str, Any] = {
+            "arguments": _rename_arguments(field.arguments, names),
+            "fields": [
+                _rename_field(f, names, fragments) for f in field.fields
+            ],
+        }
+        if isinstance(field, Field):
+            update["directives"] = [
+                directive.model_copy(
+                    update={
+                        "arguments": _rename_arguments(
+                            directive.arguments, names
+                        )
+                    }
+                )
+                for directive in field.directives
+            ]
+
+        return field.model_copy(update=update)
+
+    if isinstance(field, Fragment):
+        # fragment definitions and named fragment spreads
+        return field.model_copy(
+            update={
+                "name": fragments.get(field.name, field.name),
+                "fields": [
+                    _rename_field(f, names, fragments) for f in field.fields
+                ],
+            }
+        )
+
+    # plain field names
+    return field
+
+
+def _uses_variables(value: Any) -> bool:
+    if isinstance(value, Variable):
+        return True
+    if isinstance(value, Argument):
+        return _uses_variables(value.value)
+    if isinstance(value, list):
+        return any(_uses_variables(v) for v in value)
+    if isinstance(value, (Field, Query, InlineFragment, Fragment)):
+        # a spread holds the fields of its fragment, so this is transitive
+        return (
+            _uses_variables(getattr(value, "arguments", []))
+            or any(
+                _uses_variables(directive.arguments)
+                for directive in getattr(value, "directives", [])
+            )
+            or _uses_variables(value.fields)
+        )
+    return False
+
+
+def _rename_fragments(
+    fragments: list[Fragment],
+    names: dict[str, Variable],
+    prefix: str,
+    shared: dict[str, str],
+) -> tuple[list[Fragment], dict[str, str]]:
+    """Copy the fragment definitions of one operation for the merged
+    document, see `merge_operations`."""
+    renamed = {
+        fragment.name: prefix + fragment.name
+        for fragment in fragments
+        if _uses_variables(fragment)
+    }
+
+    while True:
+        copies = [_rename_field(f, names, renamed) for f in fragments]
+        # a different fragment of a shared name, also one differing only
+        # by the spread of a renamed fragment
+        conflicts = {
+            fragment.name: prefix + fragment.name
+            for fragment, copy in zip(fragments, copies)
+            if fragment.name not in renamed
+            and fragment.name in shared
+            and shared[fragment.name] != copy.render()
+        }
+        if not conflicts:
+            return copies, renamed
+        renamed.update(conflicts)
+
+
+def merge_operations(
+    operations: Sequence[OperationItem], name: str = "mergedQuery"
+) -> MergedQuery:
+    """Merge `operations` into one document.
+
+    Variables and root aliases of the i-th operation get a `q{i}_` prefix
+    so the root queries of different operations do not collide. Fragments
+    are shared by the operations, except fragments using variables and
+    fragments differing from an earlier one of the same name: those are
+    copied with the `q{i}_` prefix as well.
+    """
+    if not operations:
+        raise ValueError("Nothing to merge")
+
+    types = {operation.type for operation, _ in operations}
+    if len(types) != 1:
+        raise ValueError(f"Cannot merge operations of types {types}")
+
+    merged_variables: list[Variable] = []
+    merged_queries: list[Query] = []
+    fragments: list[Fragment] = []
+    shared: dict[str, str] = {}
+    values: dict[str, Any] = {}
+    aliases: list[dict[str, str]] = []
+
+    for i, (operation, variables) in enumerate(operations):
+        prefix = _prefix(i)
+
+        names = {
+            variable.name: variable.model_copy(
+                update={"name": prefix + variable.name}
+            )
+            for variable in operation.variables
+        }
+        merged_variables.extend(names.values())
+
+        for variable_name, value in variables.items():
+            values[prefix + variable_name] = value
+
+        copies, renamed_fragments = _rename_fragments(
+            operation.fragments, names, prefix, shared
+        )
+        for copy in copies:
+            if copy.name not in shared:
+                shared[copy.name] = copy.render()
+                fragments.append(copy)
+
+        item_aliases = {}
+        for query in operation.queries:
+            key = query.alias or query.name
+            alias = prefix + key
+            item_aliases[alias] = key
+
+            renamed = _rename_field(query, names, renamed_fragments)
+            merged_queries.append(renamed.model_copy(update={"alias": alias}))
+        aliases.append(item_aliases)
+
+    merged = Operation(
+        type=types.pop(),
+        name=name,
+        variables=merged_variables,
+        queries=merged_queries,
+        fragments=fragments,
+    )
+
+    return MergedQuery(merged.render(), values, aliases)
+
+
+def batch_operations(
+    operations: Sequence[OperationItem],
+    batch_size: int = 50,
+    name: str = "mergedQuery",
+) -> list[MergedQuery]:
+    """Merge `operations` into documents of at most `batch_size` each.
+
+    GitHub limits the cost of a single document, so very large merges
+    should be split into a few requests.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+
+    return [
+        merge_operations(operations[i : i + batch_size], name=name)
+        for i in range(0, len(operations), batch_size)
+    ]
+
+
+def split_batches(
+    batches: Sequence[MergedQuery], data: Sequence[Optional[dict[str, Any]]]
+) -> list[dict[str, Any]]:
+    """Split the responses of `batches` back into per-operation results."""
+    results = []
+    for batch, batch_data in zip(batches, data):
+        results.extend(batch.split(batch_data))
+
+    return results
+
+
+def split_batch_payloads(
+    batches: Sequence[MergedQuery], payloads: Sequence[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Split the whole responses of `batches` back into per-operation
+    payloads with their `data` and `errors`, see `split_payload`."""
+    results = []
+    for batch, payload in zip(batches, payloads):
+        results.extend(batch.split_payload(payload))
+
+    return results
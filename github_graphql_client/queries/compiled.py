@@ -0,0 +1,103 @@
+import json
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Optional, Union
+
+from graphql import GraphQLSchema, parse, validate
+from graphql.utilities import strip_ignored_characters
+from graphql_query import Operation
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """A query document rendered and minified once.
+
+    `query` is the ready query text. The transports accept a
+    `CompiledQuery` in place of the query text and only encode the
+    variables of each request, see `request_prefix`.
+    """
+
+    name: str
+    query: str
+
+    @cached_property
+    def request_prefix(self) -> bytes:
+        """The start of the JSON request body up to the variables:
+        `{"query":"...","variables":`."""
+        return b'{"query":%s,"variables":' % json.dumps(self.query).encode()
+
+    @classmethod
+    def from_query(cls, name: str, query: str) -> "CompiledQuery":
+        return cls(name, strip_ignored_characters(query))
+
+    @classmethod
+    def from_operation(cls, operation: Operation) -> "CompiledQuery":
+        return cls.from_query(operation.name, operation.render())
+
+
+class QueryRegistry:
+    """Compiled queries of the query builders by operation name.
+
+    A builder only registers how to build its `Operation`; the document
+    does not depend on the variable values, so it is rendered on the first
+    `get` and the same `CompiledQuery` is returned afterwards. With a
+    `schema` every query is validated once when it is compiled.
+
+    The module-level `registry` of the query builders is created at import
+    time, without a schema. To validate the builders' queries up front,
+    call `registry.validate(schema)` once at startup, e.g. with
+    `github_graphql_client.schema.load_schema`.
+    """
+
+    def __init__(self, schema: Optional[GraphQLSchema] = None) -> None:
+        self.schema = schema
+        self._builders: dict[str, Callable[[], Operation]] = {}
+        self._compiled: dict[str, CompiledQuery] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, build: Callable[[], Operation]) -> None:
+        if name in self._builders:
+            raise ValueError(f"Query {name!r} is already registered")
+        self._builders[name] = build
+
+    def names(self) -> list[str]:
+        return sorted(self._builders)
+
+    def get(self, name: str) -> CompiledQuery:
+        compiled = self._compiled.get(name)
+        if compiled is not None:
+            return compiled
+
+        with self._lock:
+            compiled = self._compiled.get(name)
+            if compiled is None:
+                compiled = CompiledQuery.from_operation(self._builders[name]())
+                if self.schema is not None:
+                    _check(compiled, self.schema)
+                self._compiled[name] = compiled
+
+        return compiled
+
+    def validate(self, schema: GraphQLSchema) -> None:
+        """Compile every registered query and validate it against
+        `schema`, raising the first `GraphQLError`."""
+        for name in self.names():
+            _check(self.get(name), schema)
+
+
+def _check(compiled: CompiledQuery, schema: GraphQLSchema) -> None:
+    errors = validate(schema, parse(compiled.query))
+    if errors:
+        raise errors[0]
+
+
+# a query for the transports and clients
+QueryLike = Union[str, CompiledQuery]
+
+
+def get_query_text(query: QueryLike) -> str:
+    return query if isinstance(query, str) else query.query
+
+
+registry = QueryRegistry()
@@ -2,6 +2,9 @@ from typing import Any
 
 from graphql_query import Operation, Argument, Variable, Field, Query
 
+from .compiled import CompiledQuery, registry
+from .typename import with_typename
+
 
 var_exclude_empty = Variable(name="excludeEmpty", type="Boolean")
 var_exclude_subcategories = Variable(
@@ -10,11 +13,11 @@ var_exclude_subcategories = Variable(
 var_include_categories = Variable(name="includeCategories", type="[String!]")
 
 
-def get_marketplace_categories(
+def get_marketplace_categories_operation(
     exclude_empty: bool,
     exclude_subcategories: bool,
     include_categories: list[str],
-) -> tuple[str, dict[str, Any]]:
+) -> tuple[Operation, dict[str, Any]]:
     marketplace_categories_query = Query(
         name="marketplaceCategories",
         arguments=[
@@ -39,10 +42,52 @@ def get_marketplace_categories(
         queries=[marketplace_categories_query],
     )
 
-    variables = {
+    # the projection models are generated for the selections with __typename
+    return with_typename(operation), get_marketplace_categories_variables(
+        exclude_empty, exclude_subcategories, include_categories
+    )
+
+
+def get_marketplace_categories_variables(
+    exclude_empty: bool,
+    exclude_subcategories: bool,
+    include_categories: list[str],
+) -> dict[str, Any]:
+    return {
         var_exclude_empty.name: exclude_empty,
         var_exclude_subcategories.name: exclude_subcategories,
         var_include_categories.name: include_categories,
     }
 
-    return operation.render(), variables
+
+# the variable values do not change the document
+registry.register(
+    "getMarketplaceCategories",
+    lambda: get_marketplace_categories_operation(False, False, [])[0],
+)
+
+
+def get_marketplace_categories_compiled(
+    exclude_empty: bool,
+    exclude_subcategories: bool,
+    include_categories: list[str],
+) -> tuple[CompiledQuery, dict[str, Any]]:
+    """The compiled query, rendered once, and the variables. The clients
+    only encode the variables of a `CompiledQuery`."""
+    return registry.get("getMarketplaceCategories"), (
+        get_marketplace_categories_variables(
+            exclude_empty, exclude_subcategories, include_categories
+        )
+    )
+
+
+def get_marketplace_categories(
+    exclude_empty: bool,
+    exclude_subcategories: bool,
+    include_categories: list[str],
+) -> tuple[str, dict[str, Any]]:
+    """The compiled query text, rendered once, and the variables."""
+    compiled, variables = get_marketplace_categories_compiled(
+        exclude_empty, exclude_subcategories, include_categories
+    )
+    return compiled.query, variables
@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from graphql_query import Argument, Field, Operation, Query, Variable
+
+FORWARD = "forward"
+BACKWARD = "backward"
+
+PAGE_INFO_FIELDS = {
+    FORWARD: ("after", "hasNextPage", "endCursor"),
+    BACKWARD: ("before", "hasPreviousPage", "startCursor"),
+}
+
+
+@dataclass
+class PaginatedOperation:
+    """An operation prepared for cursor pagination over one connection."""
+
+    operation: Operation
+    path: list[str]
+    cursor_variable: str
+    has_more_field: str
+    cursor_field: str
+
+    def get_connection(
+        self, data: Optional[dict[str, Any]]
+    ) -> Optional[dict[str, Any]]:
+        """Return the connection object from the response `data`."""
+        for key in self.path:
+            if data is None:
+                return None
+            data = data.get(key)
+
+        return data
+
+    def next_cursor(self, connection: Optional[dict[str, Any]]) -> Any:
+        """Return the cursor of the next page or `None` on the last page."""
+        if connection is None:
+            return None
+
+        page_info = connection.get("pageInfo") or {}
+        if not page_info.get(self.has_more_field):
+            return None
+
+        return page_info.get(self.cursor_field)
+
+
+def _key(field: Union[Field, Query]) -> str:
+    return field.alias or field.name
+
+
+def _find_child(field: Union[Field, Query], key: str) -> int:
+    for i, child in enumerate(field.fields):
+        if isinstance(child, Field) and _key(child) == key:
+            return i
+
+    raise ValueError(f"Field `{key}` not found in `{_key(field)}`")
+
+
+def _paginate_field(
+    field: Union[Field, Query],
+    path: list[str],
+    variable: Variable,
+    direction: Optional[str],
+) -> tuple[Union[Field, Query], str]:
+    if path:
+        i = _find_child(field, path[0])
+        child, direction = _paginate_field(
+            field.fields[i], path[1:], variable, direction
+        )
+
+        fields = list(field.fields)
+        fields[i] = child
+        return field.model_copy(update={"fields": fields}), direction
+
+    names = {argument.name for argument in field.arguments}
+    if direction is None:
+        direction = BACKWARD if "last" in names else FORWARD
+
+    cursor_argument, has_more_field, cursor_field = PAGE_INFO_FIELDS[direction]
+    if cursor_argument in names:
+        raise ValueError(
+            f"Connection `{_key(field)}` already has `{cursor_argument}`"
+        )
+
+    fields = [
+        child
+        for child in field.fields
+        if not (isinstance(child, Field) and _key(child) == "pageInfo")
+    ]
+    fields.append(
+        Field(name="pageInfo", fields=[has_more_field, cursor_field])
+    )
+
+    arguments = [
+        *field.arguments,
+        Argument(name=cursor_argument, value=variable),
+    ]
+
+    updated = field.model_copy(
+        update={"arguments": arguments, "fields": fields}
+    )
+    return updated, direction
+
+
+def paginate_operation(
+    operation: Operation,
+    path: str,
+    cursor_variable: str = "Cursor",
+    direction: Optional[str] = None,
+) -> PaginatedOperation:
+    """Prepare `operation` for pagination over the connection at `path`.
+
+    `path` is a dotted list of response keys, e.g. `repository.issues`.
+    A `pageInfo` selection and an `after` (or `before` for connections
+    requested with `last`) cursor argument are injected into the
+    connection field.
+    """
+    keys = path.split(".")
+    variable = Variable(name=cursor_variable, type="String")
+
+    if any(v.name == cursor_variable for v in operation.variables):
+        raise ValueError(f"Variable `{cursor_variable}` already exists")
+
+    queries = list(operation.queries)
+    for i, query in enumerate(queries):
+        if _key(query) == keys[0]:
+            queries[i], direction = _paginate_field(
+                query, keys[1:], variable, direction
+            )
+            break
+    else:
+        raise ValueError(f"Query `{keys[0]}` not found in the operation")
+
+    _, has_more_field, cursor_field = PAGE_INFO_FIELDS[direction]
+
+    paginated = operation.model_copy(
+        update={
+            "variables": [*operation.variables, variable],
+            "queries": queries,
+        }
+    )
+
+    return PaginatedOperation(
+        operation=paginated,
+        path=keys,
+        cursor_variable=cursor_variable,
+        has_more_field=has_more_field,
+        cursor_field=cursor_field,
+    )
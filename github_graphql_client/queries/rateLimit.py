@@ -0,0 +1,19 @@
+from graphql_query import Operation, Query
+
+rate_limit_query = Query(
+    name="rateLimit", fields=["cost", "remaining", "resetAt"]
+)
+
+
+def with_rate_limit(operation: Operation) -> Operation:
+    """Add a `rateLimit { cost remaining resetAt }` selection to
+    `operation` so a `RateLimiter` can track the point budget."""
+    if any(
+        (query.alias or query.name) == rate_limit_query.name
+        for query in operation.queries
+    ):
+        return operation
+
+    return operation.model_copy(
+        update={"queries": [*operation.queries, rate_limit_query]}
+    )
@@ -1,6 +1,9 @@
 from typing import Any
 from graphql_query import Operation, Argument, Variable, Field, Query
 
+from .compiled import CompiledQuery, registry
+from .typename import with_typename
+
 
 var_owner = Variable(name="Owner", type="String!")
 var_name = Variable(name="Name", type="String!")
@@ -10,12 +13,12 @@ var_issue_state = Variable(name="IssueState", type="[IssueState!]")
 f_node = Field(name="node", fields=["title", "url"])
 
 
-def get_repository_issues_query(
+def get_repository_issues_operation(
     owner: str,
     name: str,
     last: int,
     state: str,
-) -> tuple[str, dict[str, Any]]:
+) -> tuple[Operation, dict[str, Any]]:
     f_issues = Field(
         name="issues",
         arguments=[
@@ -41,9 +44,54 @@ def get_repository_issues_query(
         ],
     )
 
-    return operation.render(), {
+    # the projection models are generated for the selections with __typename
+    return with_typename(operation), get_repository_issues_variables(
+        owner, name, last, state
+    )
+
+
+def get_repository_issues_variables(
+    owner: str,
+    name: str,
+    last: int,
+    state: str,
+) -> dict[str, Any]:
+    return {
         var_owner.name: owner,
         var_name.name: name,
         var_last.name: last,
         var_issue_state.name: state,
     }
+
+
+# the variable values do not change the document
+registry.register(
+    "getRepositoryIssues",
+    lambda: get_repository_issues_operation("", "", 0, "")[0],
+)
+
+
+def get_repository_issues_compiled(
+    owner: str,
+    name: str,
+    last: int,
+    state: str,
+) -> tuple[CompiledQuery, dict[str, Any]]:
+    """The compiled query, rendered once, and the variables. The clients
+    only encode the variables of a `CompiledQuery`."""
+    return registry.get("getRepositoryIssues"), (
+        get_repository_issues_variables(owner, name, last, state)
+    )
+
+
+def get_repository_issues_query(
+    owner: str,
+    name: str,
+    last: int,
+    state: str,
+) -> tuple[str, dict[str, Any]]:
+    """The compiled query text, rendered once, and the variables."""
+    compiled, variables = get_repository_issues_compiled(
+        owner, name, last, state
+    )
+    return compiled.query, variables
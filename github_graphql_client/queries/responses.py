@@ -0,0 +1,69 @@
+# generated by github_graphql_client.codegen, do not edit
+from __future__ import annotations
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class GetRepositoryIssuesRepositoryIssuesEdgesNode(BaseModel):
+    """
+    An Issue is a place to discuss ideas, enhancements, tasks, and bugs for a project.
+    """
+
+    typename__: Literal['Issue'] = Field(..., alias='__typename')
+    title: str
+    url: str
+
+
+class GetRepositoryIssuesRepositoryIssuesEdges(BaseModel):
+    """
+    An edge in a connection.
+    """
+
+    typename__: Literal['IssueEdge'] = Field(..., alias='__typename')
+    node: Optional[GetRepositoryIssuesRepositoryIssuesEdgesNode] = None
+
+
+class GetRepositoryIssuesRepositoryIssues(BaseModel):
+    """
+    The connection type for Issue.
+    """
+
+    typename__: Literal['IssueConnection'] = Field(..., alias='__typename')
+    edges: Optional[List[Optional[GetRepositoryIssuesRepositoryIssuesEdges]]] = None
+
+
+class GetRepositoryIssuesRepository(BaseModel):
+    """
+    A repository contains the content for a project.
+    """
+
+    typename__: Literal['Repository'] = Field(..., alias='__typename')
+    issues: GetRepositoryIssuesRepositoryIssues
+
+
+class GetRepositoryIssues(BaseModel):
+    """
+    The query root of GitHub's GraphQL interface.
+    """
+
+    repository: Optional[GetRepositoryIssuesRepository] = None
+
+
+class GetMarketplaceCategoriesMarketplaceCategories(BaseModel):
+    """
+    A public description of a Marketplace category.
+    """
+
+    typename__: Literal['MarketplaceCategory'] = Field(..., alias='__typename')
+    id: str
+    description: Optional[str] = None
+
+
+class GetMarketplaceCategories(BaseModel):
+    """
+    The query root of GitHub's GraphQL interface.
+    """
+
+    marketplaceCategories: List[GetMarketplaceCategoriesMarketplaceCategories]
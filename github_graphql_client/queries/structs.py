@@ -0,0 +1,69 @@
+# generated by github_graphql_client.codegen, do not edit
+from __future__ import annotations
+
+from typing import List, Literal, Optional
+
+from msgspec import Struct, field
+
+
+class GetRepositoryIssuesRepositoryIssuesEdgesNode(Struct, kw_only=True, gc=False):
+    """
+    An Issue is a place to discuss ideas, enhancements, tasks, and bugs for a project.
+    """
+
+    typename__: Literal['Issue'] = field(name='__typename')
+    title: str
+    url: str
+
+
+class GetRepositoryIssuesRepositoryIssuesEdges(Struct, kw_only=True, gc=False):
+    """
+    An edge in a connection.
+    """
+
+    typename__: Literal['IssueEdge'] = field(name='__typename')
+    node: Optional[GetRepositoryIssuesRepositoryIssuesEdgesNode] = None
+
+
+class GetRepositoryIssuesRepositoryIssues(Struct, kw_only=True, gc=False):
+    """
+    The connection type for Issue.
+    """
+
+    typename__: Literal['IssueConnection'] = field(name='__typename')
+    edges: Optional[List[Optional[GetRepositoryIssuesRepositoryIssuesEdges]]] = None
+
+
+class GetRepositoryIssuesRepository(Struct, kw_only=True, gc=False):
+    """
+    A repository contains the content for a project.
+    """
+
+    typename__: Literal['Repository'] = field(name='__typename')
+    issues: GetRepositoryIssuesRepositoryIssues
+
+
+class GetRepositoryIssues(Struct, kw_only=True, gc=False):
+    """
+    The query root of GitHub's GraphQL interface.
+    """
+
+    repository: Optional[GetRepositoryIssuesRepository] = None
+
+
+class GetMarketplaceCategoriesMarketplaceCategories(Struct, kw_only=True, gc=False):
+    """
+    A public description of a Marketplace category.
+    """
+
+    typename__: Literal['MarketplaceCategory'] = field(name='__typename')
+    id: str
+    description: Optional[str] = None
+
+
+class GetMarketplaceCategories(Struct, kw_only=True, gc=False):
+    """
+    The query root of GitHub's GraphQL interface.
+    """
+
+    marketplaceCategories: List[GetMarketplaceCategoriesMarketplaceCategories]
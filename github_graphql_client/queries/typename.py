@@ -0,0 +1,37 @@
+from typing import Any
+
+from graphql_query import Field, Fragment, Operation, Query
+from graphql_query.types import InlineFragment
+
+TYPENAME = "__typename"
+
+
+def _add_typename(field: Any) -> Any:
+    if not isinstance(field, (Field, Query, InlineFragment, Fragment)):
+        # plain field names and named fragment spreads
+        return field
+    if not field.fields:
+        return field
+
+    update: dict[str, Any] = {
+        "fields": [_add_typename(f) for f in field.fields]
+    }
+    if isinstance(field, (Field, Query)):
+        # fragments are spread into a selection set which has it already
+        update["typename"] = field.typename or TYPENAME not in field.fields
+
+    return field.model_copy(update=update)
+
+
+def with_typename(operation: Operation) -> Operation:
+    """Add `__typename` to every selection set of `operation`, so unions
+    and interfaces can be decoded by type, see
+    `github_graphql_client.codegen.projection`."""
+    return operation.model_copy(
+        update={
+            "queries": [_add_typename(query) for query in operation.queries],
+            "fragments": [
+                _add_typename(fragment) for fragment in operation.fragments
+            ],
+        }
+    )
@@ -0,0 +1,158 @@
+"""Loading of the GitHub GraphQL schema with an on-disk cache.
+
+Building the schema from the 1.1 MB `schema.docs.graphql` takes over a
+second: the SDL is parsed, validated and turned into types. `load_schema`
+pickles the built and validated `GraphQLSchema` into a cache file keyed by
+the hash of the SDL and the graphql-core version, later loads only
+unpickle it. AST nodes are not cached, the types keep everything
+validation and introspection need.
+"""
+
+import copyreg
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import graphql
+from graphql import (
+    GraphQLDirective,
+    GraphQLNamedType,
+    GraphQLSchema,
+    assert_valid_schema,
+    build_schema,
+    introspection_types,
+    specified_directives,
+    specified_scalar_types,
+)
+from graphql.pyutils import Undefined
+
+# bump when the cached form changes
+CACHE_VERSION = 1
+
+_BUILTIN_TYPES = {**specified_scalar_types, **introspection_types}
+_BUILTIN_DIRECTIVES = {
+    directive.name: directive for directive in specified_directives
+}
+
+_schemas: dict[str, GraphQLSchema] = {}
+_lock = threading.Lock()
+
+
+def default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "github_graphql_client"
+
+
+def _builtin_type(name: str) -> GraphQLNamedType:
+    return _BUILTIN_TYPES[name]
+
+
+def _builtin_directive(name: str) -> GraphQLDirective:
+    return _BUILTIN_DIRECTIVES[name]
+
+
+def _undefined() -> Any:
+    return Undefined
+
+
+class _SchemaPickler(pickle.Pickler):
+    """Pickles built types by their resolved state, without the thunks
+    and AST nodes, and the singletons of graphql-core by reference."""
+
+    def reducer_override(self, obj: Any) -> Any:
+        if obj is Undefined:
+            return _undefined, ()
+        if isinstance(obj, GraphQLNamedType):
+            if _BUILTIN_TYPES.get(obj.name) is obj:
+                return _builtin_type, (obj.name,)
+        elif isinstance(obj, GraphQLDirective):
+            if _BUILTIN_DIRECTIVES.get(obj.name) is obj:
+                return _builtin_directive, (obj.name,)
+
+        state = getattr(obj, "__dict__", None)
+        if state is None or "ast_node" not in state:
+            return NotImplemented
+
+        state = {**state, "ast_node": None}
+        if "extension_ast_nodes" in state:
+            state["extension_ast_nodes"] = ()
+        # the thunks of fields, interfaces and union members have been
+        # resolved into attributes by schema validation
+        for name in ("fields", "interfaces", "types"):
+            if f"_{name}" in state:
+                state[f"_{name}"] = getattr(obj, name)
+        return copyreg.__newobj__, (type(obj),), state
+
+
+def dump_schema(schema: GraphQLSchema) -> bytes:
+    """Serialize a built `schema` for `pickle.loads`."""
+    assert_valid_schema(schema)
+    buffer = io.BytesIO()
+    _SchemaPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(schema)
+    return buffer.getvalue()
+
+
+def _cache_path(cache_dir: Path, name: str, digest: str) -> Path:
+    version = f"{graphql.__version__}-{CACHE_VERSION}"
+    return cache_dir / f"{name}-{digest[:16]}-{version}.pickle"
+
+
+def _load_cached(path: Path) -> Optional[GraphQLSchema]:
+    try:
+        schema = pickle.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # a truncated or otherwise broken file is rebuilt
+        return None
+    return schema if isinstance(schema, GraphQLSchema) else None
+
+
+def _write_cached(path: Path, data: bytes) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, suffix=".tmp", delete=False
+        ) as file:
+            file.write(data)
+        os.replace(file.name, path)
+    except OSError:
+        # the cache is an optimization, a read-only location is fine
+        pass
+
+
+def load_schema(
+    filename: Union[str, os.PathLike],
+    cache_dir: Union[str, os.PathLike, None] = None,
+) -> GraphQLSchema:
+    """Build the schema from the SDL in `filename`, going through the
+    on-disk cache in `cache_dir` (by default `default_cache_dir()`) and an
+    in-process one. The caches are keyed by the SDL's SHA-256, so editing
+    or replacing the file invalidates them.
+    """
+    path = Path(filename)
+    source = path.read_bytes()
+    digest = hashlib.sha256(source).hexdigest()
+
+    with _lock:
+        schema = _schemas.get(digest)
+        if schema is not None:
+            return schema
+
+        cache_path = _cache_path(
+            Path(cache_dir) if cache_dir else default_cache_dir(),
+            path.stem,
+            digest,
+        )
+        schema = _load_cached(cache_path)
+        if schema is None:
+            schema = build_schema(source.decode("utf8"), no_location=True)
+            _write_cached(cache_path, dump_schema(schema))
+
+        _schemas[digest] = schema
+        return schema
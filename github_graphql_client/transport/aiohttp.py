@@ -1,21 +1,64 @@
-from typing import Any, Optional
+import asyncio
+from functools import partial
+from typing import Any, AsyncIterator, Optional
 
 import aiohttp
 
+from github_graphql_client.queries.compiled import QueryLike
 from github_graphql_client.transport.base import BaseAsyncTransport
+from github_graphql_client.transport.codec import (
+    JSONCodec,
+    encode_body,
+    get_default_codec,
+)
+from github_graphql_client.transport.compression import RequestCompression
+from github_graphql_client.transport.exceptions import TransportServerError
+from github_graphql_client.transport.ratelimit import RateLimiter
+from github_graphql_client.transport.retry import (
+    RetryPolicy,
+    call_with_retry_async,
+    get_retry_after,
+)
 
 
 class AIOHTTPTransport(BaseAsyncTransport):
-    """The transport based on aiohttp library."""
+    """The transport based on aiohttp library.
+
+    `limit` and `limit_per_host` are passed to `aiohttp.TCPConnector` and
+    cap the total and per-host number of open connections. An optional
+    `rate_limiter` paces the requests by the GitHub rate limit budget and
+    an optional `retry` policy retries failed requests. An optional
+    `compression` compresses large request bodies.
+    """
 
     DEFAULT_TIMEOUT = 1
+    DEFAULT_LIMIT = 100
+    DEFAULT_LIMIT_PER_HOST = 0
     session: Optional[aiohttp.ClientSession]
+    rate_limiter: Optional[RateLimiter]
+    retry: Optional[RetryPolicy]
+    codec: JSONCodec
+    compression: Optional[RequestCompression]
+
+    RETRY_EXCEPTIONS = (
+        aiohttp.ClientConnectionError,
+        asyncio.TimeoutError,
+        TransportServerError,
+    )
 
     def __init__(self, endpoint: str, token: str, **kwargs: Any) -> None:
         self.endpoint = endpoint
         self.token = token
         self.auth_header = {"Authorization": f"Bearer {self.token}"}
         self.timeout = kwargs.get("timeout", AIOHTTPTransport.DEFAULT_TIMEOUT)
+        self.limit = kwargs.get("limit", AIOHTTPTransport.DEFAULT_LIMIT)
+        self.limit_per_host = kwargs.get(
+            "limit_per_host", AIOHTTPTransport.DEFAULT_LIMIT_PER_HOST
+        )
+        self.rate_limiter = kwargs.get("rate_limiter")
+        self.retry = kwargs.get("retry")
+        self.codec = kwargs.get("codec") or get_default_codec()
+        self.compression = kwargs.get("compression")
 
         self.session = None
 
@@ -24,7 +67,13 @@ class AIOHTTPTransport(BaseAsyncTransport):
         if self.session is None:
             self.session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=self.timeout),
-                headers=self.auth_header,
+                headers={
+                    **self.auth_header,
+                    "Content-Type": self.codec.content_type,
+                },
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                ),
             )
         else:
             raise Exception(f"AIOHTTPTransport is already connected")
@@ -35,17 +84,108 @@ class AIOHTTPTransport(BaseAsyncTransport):
             await self.session.close()
             self.session = None
 
+    async def _post(
+        self, query: QueryLike, variables: dict[str, Any]
+    ) -> bytes:
+        """Send one request and return the response body."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+
+        body, headers = encode_body(
+            self.codec,
+            self.compression,
+            query,
+            variables,
+        )
+
+        async with self.session.post(
+            self.endpoint, data=body, headers=headers
+        ) as response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(response.headers)
+
+            if response.status >= 400:
+                raise TransportServerError(
+                    f"{response.status} {response.reason}",
+                    response.status,
+                    get_retry_after(response.headers),
+                )
+
+            return await response.read()
+
+    async def execute_bytes(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> bytes:
+        """Execute GraphQL query with aiohttp and return the undecoded
+        response body."""
+        if self.session is None:
+            raise Exception(f"AIOHTTPTransport session not connected")
+
+        return await call_with_retry_async(
+            self.retry,
+            AIOHTTPTransport.RETRY_EXCEPTIONS,
+            partial(self._post, query, variables),
+        )
+
+    async def execute_raw(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Execute GraphQL query with aiohttp and return the whole
+        response payload including `errors`."""
+        data = self.codec.loads(
+            await self.execute_bytes(query, variables, **kwargs)
+        )
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_payload(data.get("data"))
+
+        return data
+
     async def execute(
-        self, query: str, variables: dict[str, Any], **kwargs: Any
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
     ) -> dict[str, Any]:
         """Execute GraphQL query with aiohttp."""
+        data = await self.execute_raw(query, variables, **kwargs)
+        return data.get("data")
+
+    async def execute_stream(
+        self, query: QueryLike, variables: dict[str, Any], path: str
+    ) -> AsyncIterator[Any]:
+        """Execute GraphQL query and yield the items of the list at
+        `data.<path>` (e.g. `repository.issues.nodes`) while the response
+        body is still arriving. Requires the `ijson` package.
+
+        The body is never buffered as a whole, so streamed requests are
+        not retried. GraphQL `errors` in the body are raised as
+        `TransportQueryError` after the last item.
+        """
+        from github_graphql_client.transport.streaming import iter_items_async
+
         if self.session is None:
             raise Exception(f"AIOHTTPTransport session not connected")
 
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+
+        body, headers = encode_body(
+            self.codec,
+            self.compression,
+            query,
+            variables,
+        )
+
         async with self.session.post(
-            self.endpoint,
-            json={"query": query, "variables": variables},
+            self.endpoint, data=body, headers=headers
         ) as response:
-            data = await response.json()
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(response.headers)
 
-        return data.get("data")
+            if response.status >= 400:
+                raise TransportServerError(
+                    f"{response.status} {response.reason}",
+                    response.status,
+                    get_retry_after(response.headers),
+                )
+
+            async for item in iter_items_async(response.content, path):
+                yield item
@@ -1,15 +1,35 @@
 from typing import Any
 
+from github_graphql_client.queries.compiled import QueryLike
+from github_graphql_client.transport.codec import JSONCodec
+
 
 class BaseTransport:
-    """An abstract transport."""
+    """An abstract transport.
+
+    `codec` encodes request bodies and decodes response bodies.
+    """
+
+    codec: JSONCodec
 
     def execute(
-        self, query: str, variables: dict[str, Any], **kwargs: Any
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
     ) -> dict[str, Any]:
         """Execute GraphQL query."""
         raise NotImplementedError
 
+    def execute_raw(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Execute GraphQL query and return the whole response payload."""
+        raise NotImplementedError
+
+    def execute_bytes(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> bytes:
+        """Execute GraphQL query and return the undecoded response body."""
+        raise NotImplementedError
+
     def connect(self) -> None:
         """Establish a session with the transport."""
         raise NotImplementedError
@@ -20,14 +40,31 @@ class BaseTransport:
 
 
 class BaseAsyncTransport:
-    """An abstract async transport."""
+    """An abstract async transport.
+
+    `codec` encodes request bodies and decodes response bodies.
+    """
+
+    codec: JSONCodec
 
     async def execute(
-        self, query: str, variables: dict[str, Any], **kwargs: Any
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
     ) -> dict[str, Any]:
         """Execute GraphQL query."""
         raise NotImplementedError
 
+    async def execute_raw(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Execute GraphQL query and return the whole response payload."""
+        raise NotImplementedError
+
+    async def execute_bytes(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> bytes:
+        """Execute GraphQL query and return the undecoded response body."""
+        raise NotImplementedError
+
     async def connect(self) -> None:
         """Establish a session with the transport."""
         raise NotImplementedError
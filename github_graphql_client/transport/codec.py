@@ -0,0 +1,99 @@
+import json
+from typing import Any, Optional
+
+from github_graphql_client.queries.compiled import QueryLike
+from github_graphql_client.transport.compression import RequestCompression
+
+
+class JSONCodec:
+    """Encodes request payloads to bytes and decodes response bytes."""
+
+    content_type = "application/json"
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class StdlibJSONCodec(JSONCodec):
+    """The codec based on the standard `json` module."""
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """The codec based on orjson library, see the `orjson` extra."""
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """The codec based on msgspec library, see the `msgspec` extra."""
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+def get_default_codec() -> JSONCodec:
+    """Return the fastest installed codec: orjson, msgspec or stdlib.
+
+    Install the `orjson` or `msgspec` extra for a faster codec.
+    """
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            pass
+
+    return StdlibJSONCodec()
+
+
+def encode_request(
+    codec: JSONCodec, query: QueryLike, variables: dict[str, Any]
+) -> bytes:
+    """Encode the request payload of `query` and `variables`. The query
+    part of a `CompiledQuery` is encoded once, only the variables are
+    encoded per request."""
+    if isinstance(query, str):
+        return codec.dumps({"query": query, "variables": variables})
+
+    return query.request_prefix + codec.dumps(variables) + b"}"
+
+
+def encode_body(
+    codec: JSONCodec,
+    compression: Optional[RequestCompression],
+    query: QueryLike,
+    variables: dict[str, Any],
+) -> tuple[bytes, dict[str, str]]:
+    """Encode the request payload and compress it if configured."""
+    body = encode_request(codec, query, variables)
+    if compression is None:
+        return body, {}
+
+    return compression.compress(body)
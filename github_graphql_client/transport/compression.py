@@ -0,0 +1,81 @@
+import gzip
+import zlib
+from typing import Callable
+
+Compressor = Callable[[bytes], bytes]
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def _get_compressors() -> dict[str, Compressor]:
+    compressors: dict[str, Compressor] = {
+        "gzip": _gzip,
+        "deflate": zlib.compress,
+    }
+
+    try:
+        import brotli
+
+        compressors["br"] = brotli.compress
+    except ImportError:
+        pass
+
+    try:
+        import zstandard
+
+        compressors["zstd"] = zstandard.ZstdCompressor().compress
+    except ImportError:
+        pass
+
+    return compressors
+
+
+COMPRESSORS = _get_compressors()
+
+# the package extras providing the optional encodings
+EXTRAS = {"br": "brotli", "zstd": "zstd"}
+
+
+def check_encoding(encoding: str) -> None:
+    if encoding in COMPRESSORS:
+        return
+
+    if encoding in EXTRAS:
+        raise ValueError(
+            f"Request encoding `{encoding}` requires the "
+            f"`{EXTRAS[encoding]}` extra"
+        )
+    raise ValueError(
+        f"Unsupported request encoding `{encoding}`, "
+        f"available: {', '.join(COMPRESSORS)}"
+    )
+
+
+class RequestCompression:
+    """Compresses request bodies of at least `threshold` bytes.
+
+    Response bodies are decompressed by the HTTP libraries themselves:
+    they advertise every encoding they can decode in `Accept-Encoding`
+    (`br` and `zstd` with the `brotli` and `zstd` extras) and
+    decompress the body chunk by chunk while it is read.
+    """
+
+    DEFAULT_THRESHOLD = 1024
+
+    def __init__(
+        self, encoding: str = "gzip", threshold: int = DEFAULT_THRESHOLD
+    ) -> None:
+        check_encoding(encoding)
+
+        self.encoding = encoding
+        self.threshold = threshold
+        self._compress = COMPRESSORS[encoding]
+
+    def compress(self, body: bytes) -> tuple[bytes, dict[str, str]]:
+        """Return the body to send and the headers describing it."""
+        if len(body) < self.threshold:
+            return body, {}
+
+        return self._compress(body), {"Content-Encoding": self.encoding}
@@ -0,0 +1,27 @@
+from typing import Any, Optional
+
+
+class TransportError(Exception):
+    """Base class for the transport errors."""
+
+
+class TransportServerError(TransportError):
+    """The server answered with an HTTP error status."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class TransportQueryError(TransportError):
+    """The server answered with GraphQL `errors`."""
+
+    def __init__(self, errors: list[dict[str, Any]]) -> None:
+        super().__init__(str(errors[0].get("message", errors[0])))
+        self.errors = errors
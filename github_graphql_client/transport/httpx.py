@@ -0,0 +1,149 @@
+from functools import partial
+from typing import Any, Optional
+
+import httpx
+
+from github_graphql_client.queries.compiled import QueryLike
+from github_graphql_client.transport.base import BaseAsyncTransport
+from github_graphql_client.transport.codec import (
+    JSONCodec,
+    encode_body,
+    get_default_codec,
+)
+from github_graphql_client.transport.compression import RequestCompression
+from github_graphql_client.transport.exceptions import TransportServerError
+from github_graphql_client.transport.ratelimit import RateLimiter
+from github_graphql_client.transport.retry import (
+    RetryPolicy,
+    call_with_retry_async,
+    get_retry_after,
+)
+
+
+class HTTPXTransport(BaseAsyncTransport):
+    """The HTTP/2 transport based on httpx library.
+
+    Concurrent requests are multiplexed as streams over a few HTTP/2
+    connections instead of opening one connection per in-flight request.
+    `max_connections` caps the number of connections. Requires the `h2`
+    package (`pip install httpx[http2]`).
+
+    `http1=False` talks HTTP/2 with prior knowledge, which is needed for
+    plain-text `http://` endpoints such as local test servers.
+
+    `rate_limiter`, `retry`, `codec` and `compression` work as in
+    `AIOHTTPTransport`.
+    """
+
+    DEFAULT_TIMEOUT = 1
+    DEFAULT_MAX_CONNECTIONS = 10
+    session: Optional[httpx.AsyncClient]
+    rate_limiter: Optional[RateLimiter]
+    retry: Optional[RetryPolicy]
+    codec: JSONCodec
+    compression: Optional[RequestCompression]
+
+    RETRY_EXCEPTIONS = (httpx.TransportError, TransportServerError)
+
+    def __init__(self, endpoint: str, token: str, **kwargs: Any) -> None:
+        self.endpoint = endpoint
+        self.token = token
+        self.auth_header = {"Authorization": f"Bearer {self.token}"}
+        self.timeout = kwargs.get("timeout", HTTPXTransport.DEFAULT_TIMEOUT)
+        self.max_connections = kwargs.get(
+            "max_connections", HTTPXTransport.DEFAULT_MAX_CONNECTIONS
+        )
+        self.http1 = kwargs.get("http1", True)
+        self.rate_limiter = kwargs.get("rate_limiter")
+        self.retry = kwargs.get("retry")
+        self.codec = kwargs.get("codec") or get_default_codec()
+        self.compression = kwargs.get("compression")
+
+        self.session = None
+
+    async def connect(self) -> None:
+        """Coroutine which will create an httpx AsyncClient as self.session."""
+        if self.session is None:
+            self.session = httpx.AsyncClient(
+                http1=self.http1,
+                http2=True,
+                timeout=self.timeout,
+                headers={
+                    **self.auth_header,
+                    "Content-Type": self.codec.content_type,
+                },
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+        else:
+            raise Exception(f"HTTPXTransport is already connected")
+
+    async def close(self) -> None:
+        """Coroutine which will close the httpx client."""
+        if self.session is not None:
+            await self.session.aclose()
+            self.session = None
+
+    async def _post(
+        self, query: QueryLike, variables: dict[str, Any]
+    ) -> bytes:
+        """Send one request and return the response body."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+
+        body, headers = encode_body(
+            self.codec,
+            self.compression,
+            query,
+            variables,
+        )
+
+        response = await self.session.post(
+            self.endpoint, content=body, headers=headers
+        )
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(response.headers)
+
+        if response.status_code >= 400:
+            raise TransportServerError(
+                f"{response.status_code} {response.reason_phrase}",
+                response.status_code,
+                get_retry_after(response.headers),
+            )
+
+        return response.content
+
+    async def execute_bytes(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> bytes:
+        """Execute GraphQL query with httpx and return the undecoded
+        response body."""
+        if self.session is None:
+            raise Exception(f"HTTPXTransport session not connected")
+
+        return await call_with_retry_async(
+            self.retry,
+            HTTPXTransport.RETRY_EXCEPTIONS,
+            partial(self._post, query, variables),
+        )
+
+    async def execute_raw(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Execute GraphQL query with httpx and return the whole
+        response payload including `errors`."""
+        data = self.codec.loads(
+            await self.execute_bytes(query, variables, **kwargs)
+        )
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_payload(data.get("data"))
+
+        return data
+
+    async def execute(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Execute GraphQL query with httpx."""
+        data = await self.execute_raw(query, variables, **kwargs)
+        return data.get("data")
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Mapping, Optional
+
+
+class RateLimiter:
+    """A token bucket pacing requests by GitHub's rate limit budget.
+
+    The bucket refills at `remaining / seconds until reset` points per
+    second, so a long job spreads the remaining budget over the rest of
+    the rate limit window instead of using it up in minutes. Up to `burst`
+    points can be spent at once. The budget is taken from the
+    `x-ratelimit-*` response headers or from a `rateLimit` selection in the
+    response data. Until the first response is seen the bucket assumes a
+    fresh window of `limit` points per `window` seconds, GitHub's primary
+    rate limit, so the first requests of a large batch are paced too.
+
+    One instance may be shared by several transports and threads.
+    """
+
+    DEFAULT_BURST: int = 100
+    DEFAULT_LIMIT: int = 5000
+    DEFAULT_WINDOW: float = 3600.0
+
+    def __init__(
+        self,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.time,
+        limit: int = DEFAULT_LIMIT,
+        window: float = DEFAULT_WINDOW,
+    ) -> None:
+        self.burst = burst
+        self.clock = clock
+        self.limit = limit
+        self.window = window
+
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.cost = 1
+
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, cost: Optional[int] = None) -> float:
+        """Take `cost` points and return the delay before dispatching."""
+        cost = self.cost if cost is None else cost
+
+        with self._lock:
+            now = self.clock()
+
+            if self.reset_at is not None and now >= self.reset_at:
+                self.remaining = None
+                self.reset_at = None
+
+            if self.remaining is None or self.reset_at is None:
+                # no budget seen in this window yet
+                rate = self.limit / self.window
+            elif self.remaining < cost:
+                return self.reset_at - now
+            else:
+                rate = self.remaining / max(self.reset_at - now, 1.0)
+                self.remaining -= cost
+
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * rate
+            )
+            self._updated_at = now
+            self._tokens -= cost
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / rate
+
+    def acquire(self, cost: Optional[int] = None) -> None:
+        """Block until `cost` points may be spent."""
+        delay = self.reserve(cost)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, cost: Optional[int] = None) -> None:
+        """Wait until `cost` points may be spent."""
+        delay = self.reserve(cost)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _update(self, remaining: int, reset_at: float) -> None:
+        with self._lock:
+            if self.reset_at is None or reset_at > self.reset_at:
+                # a new rate limit window has started
+                self.remaining = remaining
+            else:
+                self.remaining = min(self.remaining, remaining)
+            self.reset_at = reset_at
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Update the budget from `x-ratelimit-*` response headers."""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+
+        self._update(int(remaining), float(reset))
+
+    def update_from_payload(self, data: Optional[dict[str, Any]]) -> None:
+        """Update the budget from a `rateLimit { cost remaining resetAt }`
+        selection in the response data."""
+        rate_limit = (data or {}).get("rateLimit")
+        if not rate_limit:
+            return
+
+        if rate_limit.get("cost") is not None:
+            self.cost = rate_limit["cost"]
+
+        remaining = rate_limit.get("remaining")
+        reset_at = rate_limit.get("resetAt")
+        if remaining is None or reset_at is None:
+            return
+
+        reset_at = datetime.fromisoformat(reset_at.replace("Z", "+00:00"))
+        self._update(remaining, reset_at.timestamp())
@@ -1,28 +1,87 @@
-from typing import Any, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, Optional
 
 import requests as r
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
+from github_graphql_client.queries.compiled import QueryLike
 from github_graphql_client.transport.base import BaseTransport
+from github_graphql_client.transport.codec import (
+    JSONCodec,
+    encode_body,
+    get_default_codec,
+)
+from github_graphql_client.transport.compression import RequestCompression
+from github_graphql_client.transport.exceptions import TransportServerError
+from github_graphql_client.transport.ratelimit import RateLimiter
+from github_graphql_client.transport.retry import (
+    RetryPolicy,
+    call_with_retry,
+    get_retry_after,
+)
 
 
 class RequestsTransport(BaseTransport):
-    """The transport based on requests library."""
+    """The transport based on requests library.
+
+    `pool_maxsize` is the number of connections kept per host. The
+    transport can be shared by worker threads, set it to at least their
+    number or the connections of the extra threads are discarded after
+    every request (`GraphQLClient` does it for `max_workers`). An optional
+    `rate_limiter` paces the requests by the GitHub rate limit budget and
+    an optional `retry` policy retries failed requests. An optional
+    `compression` compresses large request bodies.
+    """
 
     DEFAULT_TIMEOUT: int = 1
+    DEFAULT_POOL_MAXSIZE: int = DEFAULT_POOLSIZE
     session: Optional[r.Session]
+    headers: Mapping[str, str]
+    rate_limiter: Optional[RateLimiter]
+    retry: Optional[RetryPolicy]
+    codec: JSONCodec
+    compression: Optional[RequestCompression]
+
+    RETRY_EXCEPTIONS = (r.ConnectionError, r.Timeout, TransportServerError)
 
     def __init__(self, endpoint: str, token: str, **kwargs: Any) -> None:
         self.endpoint = endpoint
         self.token = token
         self.auth_header = {"Authorization": f"Bearer {self.token}"}
         self.timeout = kwargs.get("timeout", RequestsTransport.DEFAULT_TIMEOUT)
+        self.pool_maxsize = kwargs.get(
+            "pool_maxsize", RequestsTransport.DEFAULT_POOL_MAXSIZE
+        )
+        self.rate_limiter = kwargs.get("rate_limiter")
+        self.retry = kwargs.get("retry")
+        self.codec = kwargs.get("codec") or get_default_codec()
+        self.compression = kwargs.get("compression")
+        self.headers = MappingProxyType(
+            {**self.auth_header, "Content-Type": self.codec.content_type}
+        )
 
         self.session = None
 
+    def _create_session(self, adapter: HTTPAdapter) -> r.Session:
+        session = r.Session()
+        session.headers.update(self.headers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get_session(self) -> r.Session:
+        if self.session is None:
+            raise Exception(f"RequestsTransport session not connected")
+
+        return self.session
+
     def connect(self) -> None:
         """Start a `requests.Session` connection."""
         if self.session is None:
-            self.session = r.Session()
+            self.session = self._create_session(
+                HTTPAdapter(pool_maxsize=self.pool_maxsize)
+            )
         else:
             raise Exception("Session already started")
 
@@ -32,21 +91,114 @@ class RequestsTransport(BaseTransport):
             self.session.close()
             self.session = None
 
-    def execute(
-        self, query: str, variables: dict[str, Any], **kwargs: Any
-    ) -> dict[str, Any]:
-        """Execute GraphQL query."""
-        if self.session is None:
-            raise Exception(f"RequestsTransport session not connected")
-
+    def _post(
+        self, session: r.Session, query: QueryLike, variables: dict[str, Any]
+    ) -> bytes:
+        """Send one request and return the response body."""
+        body, headers = encode_body(
+            self.codec,
+            self.compression,
+            query,
+            variables,
+        )
         post_args = {
-            "headers": self.auth_header,
-            "json": {"query": query, "variables": variables},
+            "data": body,
+            "headers": headers,
             "timeout": self.timeout,
         }
-        post_args["headers"]["Content-Type"] = "application/json"
 
-        response = self.session.request("POST", self.endpoint, **post_args)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        response = session.request("POST", self.endpoint, **post_args)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(response.headers)
+
+        if response.status_code >= 400:
+            raise TransportServerError(
+                f"{response.status_code} {response.reason}",
+                response.status_code,
+                get_retry_after(response.headers),
+            )
+
+        return response.content
 
-        result = response.json()
+    def execute_bytes(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> bytes:
+        """Execute GraphQL query and return the undecoded response body."""
+        session = self._get_session()
+
+        return call_with_retry(
+            self.retry,
+            RequestsTransport.RETRY_EXCEPTIONS,
+            partial(self._post, session, query, variables),
+        )
+
+    def execute_raw(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Execute GraphQL query and return the whole response payload
+        including `errors`."""
+        result = self.codec.loads(
+            self.execute_bytes(query, variables, **kwargs)
+        )
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_payload(result.get("data"))
+
+        return result
+
+    def execute(
+        self, query: QueryLike, variables: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Execute GraphQL query."""
+        result = self.execute_raw(query, variables, **kwargs)
         return result.get("data")
+
+    def execute_stream(
+        self, query: QueryLike, variables: dict[str, Any], path: str
+    ) -> Iterator[Any]:
+        """Execute GraphQL query and yield the items of the list at
+        `data.<path>` (e.g. `repository.issues.nodes`) while the response
+        body is still arriving. Requires the `ijson` package.
+
+        The body is never buffered as a whole, so streamed requests are
+        not retried. GraphQL `errors` in the body are raised as
+        `TransportQueryError` after the last item.
+        """
+        from github_graphql_client.transport.streaming import iter_items
+
+        session = self._get_session()
+
+        body, headers = encode_body(
+            self.codec,
+            self.compression,
+            query,
+            variables,
+        )
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        with session.request(
+            "POST",
+            self.endpoint,
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            stream=True,
+        ) as response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(response.headers)
+
+            if response.status_code >= 400:
+                raise TransportServerError(
+                    f"{response.status_code} {response.reason}",
+                    response.status_code,
+                    get_retry_after(response.headers),
+                )
+
+            response.raw.decode_content = True
+            yield from iter_items(response.raw, path)
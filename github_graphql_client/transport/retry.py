@@ -0,0 +1,184 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Mapping, Optional, TypeVar
+
+from github_graphql_client.transport.exceptions import TransportServerError
+
+T = TypeVar("T")
+
+
+class RetryBudget:
+    """Limits retries to a fraction of the successful requests.
+
+    Every success deposits `ratio` tokens and every retry withdraws one,
+    so an outage cannot multiply the load by `max_attempts`. The budget
+    starts with `min_retries` tokens and never holds more.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10) -> None:
+        self.ratio = ratio
+        self.min_retries = min_retries
+
+        self._tokens = float(min_retries)
+        self._lock = threading.Lock()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self.min_retries, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a token for one retry, return `False` if none is left."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            return True
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Retries use exponential backoff `backoff * 2 ** (attempt - 1)` capped
+    at `max_backoff`, of which a random `jitter` fraction is dropped. A
+    `Retry-After` value sent by the server takes precedence. A request
+    the server asks to delay by more than `max_retry_after`, e.g. until an
+    exhausted rate limit window resets, is not retried but fails at once.
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    max_retry_after: float = 60.0
+    jitter: float = 1.0
+    statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    budget: Optional[RetryBudget] = None
+    rng: random.Random = field(default_factory=random.Random)
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, TransportServerError):
+            # secondary rate limits are 403s with a Retry-After
+            return error.status_code in self.statuses or (
+                error.status_code == 403 and error.retry_after is not None
+            )
+
+        # network errors and timeouts
+        return True
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """Whether to retry after the `attempt`-th failed attempt."""
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return False
+
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None and retry_after > self.max_retry_after:
+            # sent any earlier, the request would fail again
+            return False
+
+        return self.budget is None or self.budget.withdraw()
+
+    def get_delay(self, error: Exception, attempt: int) -> float:
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return retry_after
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * self.rng.random())
+
+    def record_success(self) -> None:
+        if self.budget is not None:
+            self.budget.record_success()
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Seconds until a `Retry-After` value given in seconds or as a date,
+    `None` if it is malformed."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        # HTTP dates are GMT
+        date = date.replace(tzinfo=timezone.utc)
+    return date.timestamp() - time.time()
+
+
+def get_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds to wait as requested by the response headers, if any.
+
+    Malformed values are ignored, so the request is retried with the
+    backoff of the policy instead.
+    """
+    retry_after = headers.get("retry-after")
+    if retry_after is not None:
+        delay = _parse_retry_after(retry_after)
+        if delay is not None:
+            return max(0.0, delay)
+
+    if headers.get("x-ratelimit-remaining") == "0":
+        reset = headers.get("x-ratelimit-reset")
+        if reset is not None:
+            try:
+                return max(0.0, float(reset) - time.time())
+            except ValueError:
+                return None
+
+    return None
+
+
+def call_with_retry(
+    retry: Optional[RetryPolicy],
+    exceptions: tuple[type[Exception], ...],
+    fn: Callable[[], T],
+) -> T:
+    """Call `fn` until it succeeds or `retry` gives up on `exceptions`."""
+    attempt = 0
+    while True:
+        try:
+            result = fn()
+        except exceptions as e:
+            attempt += 1
+            if retry is None or not retry.should_retry(e, attempt):
+                raise
+
+            time.sleep(retry.get_delay(e, attempt))
+        else:
+            if retry is not None:
+                retry.record_success()
+
+            return result
+
+
+async def call_with_retry_async(
+    retry: Optional[RetryPolicy],
+    exceptions: tuple[type[Exception], ...],
+    fn: Callable[[], Awaitable[T]],
+) -> T:
+    """Await `fn()` until it succeeds or `retry` gives up on `exceptions`."""
+    attempt = 0
+    while True:
+        try:
+            result = await fn()
+        except exceptions as e:
+            attempt += 1
+            if retry is None or not retry.should_retry(e, attempt):
+                raise
+
+            await asyncio.sleep(retry.get_delay(e, attempt))
+        else:
+            if retry is not None:
+                retry.record_success()
+
+            return result
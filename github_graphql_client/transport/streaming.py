@@ -0,0 +1,78 @@
+from typing import IO, Any, AsyncIterator, Iterator, Optional, Protocol
+
+import ijson
+
+from github_graphql_client.transport.exceptions import TransportQueryError
+
+ERRORS_PREFIX = "errors"
+
+
+class AsyncReader(Protocol):
+    async def read(self, n: int = -1) -> bytes:
+        ...
+
+
+def get_prefix(path: str) -> str:
+    """The ijson prefix of the items of the list at `data.<path>`."""
+    return f"data.{path}.item"
+
+
+class ResponseParser:
+    """Build the items at `prefix` and the top-level `errors` from the
+    events of a single `ijson.parse` pass over a response body."""
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self.errors: Optional[list[dict[str, Any]]] = None
+        self._builder: Optional[ijson.ObjectBuilder] = None
+        self._target: Optional[str] = None
+
+    def feed(self, prefix: str, event: str, value: Any) -> Iterator[Any]:
+        """Yield the items completed by this event."""
+        if self._builder is not None:
+            self._builder.event(event, value)
+            if prefix == self._target and event in ("end_map", "end_array"):
+                if self._target == ERRORS_PREFIX:
+                    self.errors = self._builder.value
+                else:
+                    yield self._builder.value
+                self._builder = None
+        elif prefix == self.prefix or prefix == ERRORS_PREFIX:
+            if event in ("start_map", "start_array"):
+                self._builder = ijson.ObjectBuilder()
+                self._builder.event(event, value)
+                self._target = prefix
+            elif prefix == self.prefix:
+                yield value
+
+    def check(self) -> None:
+        """Raise `TransportQueryError` if the response had `errors`."""
+        if self.errors:
+            raise TransportQueryError(self.errors)
+
+
+def iter_items(stream: IO[bytes], path: str) -> Iterator[Any]:
+    """Yield the items of the list at `data.<path>` of a response body as
+    soon as each of them is parsed.
+
+    Raises `TransportQueryError` once the body ends if it had `errors`."""
+    parser = ResponseParser(get_prefix(path))
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        yield from parser.feed(prefix, event, value)
+    parser.check()
+
+
+async def iter_items_async(
+    stream: AsyncReader, path: str
+) -> AsyncIterator[Any]:
+    """Yield the items of the list at `data.<path>` of a response body as
+    soon as each of them is parsed.
+
+    Raises `TransportQueryError` once the body ends if it had `errors`."""
+    parser = ResponseParser(get_prefix(path))
+    async for prefix, event, value in ijson.parse_async(
+        stream, use_float=True
+    ):
+        for item in parser.feed(prefix, event, value):
+            yield item
+    parser.check()
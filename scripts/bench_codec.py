@@ -0,0 +1,45 @@
+"""Compare the JSON codecs on large `repository.issues` payloads.
+
+    python scripts/bench_codec.py
+"""
+
+import timeit
+
+from payloads import make_issues_payload
+
+from github_graphql_client.transport.codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+)
+
+NUMBER = 50
+
+
+def main():
+    codecs = {"stdlib": StdlibJSONCodec()}
+    for name, codec_class in (
+        ("orjson", OrjsonCodec),
+        ("msgspec", MsgspecCodec),
+    ):
+        try:
+            codecs[name] = codec_class()
+        except ImportError:
+            print(f"{name} is not installed, skipping")
+
+    for nodes in (100, 1000):
+        payload = make_issues_payload(nodes)
+        body = StdlibJSONCodec().dumps(payload)
+        print(f"\n{nodes} issue nodes, {len(body) / 1024:0.0f} KiB")
+
+        for name, codec in codecs.items():
+            loads = timeit.timeit(lambda: codec.loads(body), number=NUMBER)
+            dumps = timeit.timeit(lambda: codec.dumps(payload), number=NUMBER)
+            print(
+                f"{name:>8}: loads {loads / NUMBER * 1000:0.3f} ms, "
+                f"dumps {dumps / NUMBER * 1000:0.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare building the query of `get_repository_issues_query` on every
+call with the compiled query of the registry.
+
+    python scripts/bench_compiled.py
+"""
+
+import timeit
+
+from github_graphql_client.queries.repository import (
+    get_repository_issues_operation,
+    get_repository_issues_query,
+)
+
+NUMBER = 100_000
+
+
+def render(owner, name, last, state):
+    operation, variables = get_repository_issues_operation(
+        owner, name, last, state
+    )
+    return operation.render(), variables
+
+
+def main():
+    cases = {"render": render, "compiled": get_repository_issues_query}
+    for name, build in cases.items():
+        number = NUMBER if name == "compiled" else NUMBER // 100
+        duration = timeit.timeit(
+            lambda: build("pydantic", "pydantic", 100, "OPEN"), number=number
+        )
+        print(
+            f"{name:>10}: {duration / number * 1e6:8.2f} us per call, "
+            f"{duration / number * NUMBER:6.2f} s per {NUMBER} calls"
+        )
+
+
+if __name__ == "__main__":
+    main()
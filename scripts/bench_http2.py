@@ -0,0 +1,66 @@
+"""Compare `AIOHTTPTransport` (HTTP/1.1) and `HTTPXTransport` (HTTP/2)
+running a large concurrent batch against local stub servers which answer
+after a fixed latency.
+
+    python scripts/bench_http2.py
+"""
+
+import asyncio
+import time
+
+from stub_h2_server import run_h2_stub_server
+from stub_server import run_stub_server
+
+from github_graphql_client.client.scheduler import BatchScheduler
+from github_graphql_client.transport.aiohttp import AIOHTTPTransport
+from github_graphql_client.transport.httpx import HTTPXTransport
+
+QUERY = "query { viewer { login } }"
+REQUESTS = 2000
+IN_FLIGHT = 200
+LATENCY = 0.02
+TIMEOUT = 30
+
+
+async def bench(transport) -> float:
+    scheduler = BatchScheduler(IN_FLIGHT)
+    jobs = [lambda: transport.execute(QUERY, {})] * REQUESTS
+
+    await transport.connect()
+    try:
+        tic = time.perf_counter()
+        await scheduler.run(jobs)
+        toc = time.perf_counter()
+    finally:
+        await transport.close()
+
+    return toc - tic
+
+
+def report(name: str, duration: float) -> None:
+    print(
+        f"{name}: {REQUESTS} requests in {duration:0.4f} seconds "
+        f"({REQUESTS / duration:0.0f} req/s)"
+    )
+
+
+async def bench_http2() -> float:
+    async with run_h2_stub_server(delay=LATENCY) as endpoint:
+        transport = HTTPXTransport(
+            endpoint, "token", timeout=TIMEOUT, http1=False, max_connections=2
+        )
+        return await bench(transport)
+
+
+def main():
+    with run_stub_server(delay=LATENCY) as endpoint:
+        transport = AIOHTTPTransport(endpoint, "token", timeout=TIMEOUT)
+        report("AIOHTTPTransport (HTTP/1.1)", asyncio.run(bench(transport)))
+
+    report(
+        "HTTPXTransport (HTTP/2, 2 connections)", asyncio.run(bench_http2())
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Measure the time and memory of importing and using the schema models,
+each case in a fresh interpreter.
+
+    python scripts/bench_model_import.py [monolithic_model.py]
+
+Pass the single-module datamodel-codegen output (e.g. `git show
+baseline:github_graphql_client/model.py > /tmp/model.py`) to compare with
+the lazily loaded modules of `github_graphql_client.model`.
+"""
+
+import subprocess
+import sys
+
+CASES = {
+    "import": "import {module}",
+    "PageInfo": (
+        "from {module} import PageInfo\n"
+        "PageInfo.model_validate("
+        "{{'hasNextPage': False, 'hasPreviousPage': False}})"
+    ),
+    "Repository": "from {module} import Repository\nRepository.model_rebuild()",
+}
+
+SCRIPT = """
+import resource, sys, time
+tic = time.perf_counter()
+{case}
+elapsed = time.perf_counter() - tic
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss)
+"""
+
+REPEAT = 3
+
+
+def measure(case: str, module: str, path: str) -> tuple[float, float]:
+    script = SCRIPT.format(case=case.format(module=module))
+    if path:
+        script = f"import sys; sys.path.insert(0, {path!r})\n" + script
+
+    results = []
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        elapsed, rss = output.split()
+        results.append((float(elapsed), int(rss) / 1024))
+
+    return min(results)
+
+
+def main():
+    targets = {
+        "github_graphql_client.model": ("github_graphql_client.model", "")
+    }
+    if len(sys.argv) > 1:
+        directory, _, filename = sys.argv[1].rpartition("/")
+        targets["monolithic"] = (
+            filename.removesuffix(".py"),
+            directory or ".",
+        )
+
+    for name, case in CASES.items():
+        print(f"\n{name}")
+        for target, (module, path) in targets.items():
+            elapsed, rss = measure(case, module, path)
+            print(f"{target:>30}: {elapsed:0.3f} s, max RSS {rss:0.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
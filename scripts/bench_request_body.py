@@ -0,0 +1,59 @@
+"""Compare encoding the whole request body with splicing the variables
+into the pre-encoded query part of a `CompiledQuery`, for a merged
+document of many repository issues queries.
+
+    python scripts/bench_request_body.py
+"""
+
+import timeit
+
+from github_graphql_client.queries.batch import merge_operations
+from github_graphql_client.queries.compiled import CompiledQuery
+from github_graphql_client.queries.repository import (
+    get_repository_issues_operation,
+)
+from github_graphql_client.transport.codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    encode_request,
+)
+
+NUMBER = 10_000
+
+
+def main():
+    for size in (1, 50):
+        merged = merge_operations(
+            [
+                get_repository_issues_operation(
+                    "pydantic", f"repository-{i}", 100, "OPEN"
+                )
+                for i in range(size)
+            ]
+        )
+        compiled = CompiledQuery.from_query("mergedQuery", merged.query)
+        print(
+            f"\n{size} merged queries, {len(merged.query)} characters "
+            f"({len(compiled.query)} minified)"
+        )
+
+        for codec in (StdlibJSONCodec(), OrjsonCodec(), MsgspecCodec()):
+            name = type(codec).__name__
+            for kind, query in (
+                ("text", merged.query),
+                ("minified text", compiled.query),
+                ("compiled", compiled),
+            ):
+                duration = timeit.timeit(
+                    lambda: encode_request(codec, query, merged.variables),
+                    number=NUMBER,
+                )
+                print(
+                    f"{name:>16} {kind:>13}: "
+                    f"{duration / NUMBER * 1e6:8.2f} us"
+                )
+
+
+if __name__ == "__main__":
+    main()
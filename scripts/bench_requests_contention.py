@@ -0,0 +1,57 @@
+"""Compare the connection pool sizes of a `RequestsTransport` shared by a
+pool of worker threads.
+
+    python scripts/bench_requests_contention.py
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from stub_server import run_stub_server
+
+from github_graphql_client.transport.requests import RequestsTransport
+
+QUERY = "query { viewer { login } }"
+THREADS = 16
+REQUESTS = 4000
+TIMEOUT = 10
+
+
+def bench(transport) -> float:
+    transport.connect()
+    try:
+        with ThreadPoolExecutor(THREADS) as executor:
+            tic = time.perf_counter()
+            list(
+                executor.map(
+                    lambda _: transport.execute(QUERY, {}), range(REQUESTS)
+                )
+            )
+            toc = time.perf_counter()
+    finally:
+        transport.close()
+
+    return toc - tic
+
+
+def main():
+    with run_stub_server() as endpoint:
+        transports = {
+            "RequestsTransport (default pool)": RequestsTransport(
+                endpoint, "token", timeout=TIMEOUT
+            ),
+            f"RequestsTransport (pool_maxsize={THREADS})": RequestsTransport(
+                endpoint, "token", timeout=TIMEOUT, pool_maxsize=THREADS
+            ),
+        }
+
+        for name, transport in transports.items():
+            duration = bench(transport)
+            print(
+                f"{name}: {REQUESTS} requests in {duration:0.4f} seconds "
+                f"({REQUESTS / duration:0.0f} req/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measure building the GitHub schema from SDL against loading it from the
+on-disk cache of `load_schema` and building the pruned schema of
+`scripts/prune_schema.py`, each case in a fresh interpreter.
+
+    python scripts/bench_schema.py
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SCHEMA_FILENAME = (
+    Path(__file__).parent.parent / "tests/data/schema.docs.graphql"
+)
+PRUNED_SCHEMA_FILENAME = SCHEMA_FILENAME.with_name("schema.pruned.graphql")
+
+CASES = {
+    "build_schema": (
+        "from graphql import build_schema\n"
+        "build_schema(open({filename!r}, encoding='utf8').read())"
+    ),
+    "load_schema, cold": (
+        "from github_graphql_client.schema import load_schema\n"
+        "load_schema({filename!r}, {cache_dir!r})"
+    ),
+    "load_schema, warm": (
+        "from github_graphql_client.schema import load_schema\n"
+        "load_schema({filename!r}, {cache_dir!r})"
+    ),
+    "build_schema, pruned": (
+        "from graphql import build_schema\n"
+        "build_schema(open({pruned!r}, encoding='utf8').read())"
+    ),
+}
+
+SCRIPT = """
+import time
+tic = time.perf_counter()
+{case}
+print(time.perf_counter() - tic)
+"""
+
+REPEAT = 3
+
+
+def measure(case: str, cache_dir: str) -> float:
+    script = SCRIPT.format(
+        case=case.format(
+            filename=str(SCHEMA_FILENAME),
+            pruned=str(PRUNED_SCHEMA_FILENAME),
+            cache_dir=cache_dir,
+        )
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output)
+
+
+def main():
+    for name, case in CASES.items():
+        results = []
+        for _ in range(REPEAT):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                if name.endswith("warm"):
+                    measure(case, cache_dir)
+                results.append(measure(case, cache_dir))
+        print(f"{name:>20}: {min(results):0.3f} s")
+
+
+if __name__ == "__main__":
+    main()
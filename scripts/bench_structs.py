@@ -0,0 +1,90 @@
+"""Compare decoding large `repository.issues` responses into pydantic
+projection models with decoding them into msgspec Structs.
+
+    python scripts/bench_structs.py
+"""
+
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+import types
+from pathlib import Path
+
+from payloads import make_issues_payload
+
+from github_graphql_client.client.typed import decode_response
+from github_graphql_client.codegen.projection import generate_projection_models
+from github_graphql_client.schema import load_schema
+
+SCHEMA_FILENAME = (
+    Path(__file__).parent.parent / "tests/data/schema.docs.graphql"
+)
+
+QUERY = """
+query repositoryIssues {
+  repository(owner: "pydantic", name: "pydantic") {
+    issues(first: 100) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        __typename id number title url state createdAt body
+        author { __typename login }
+        labels(first: 10) { nodes { name color } }
+      }
+    }
+  }
+}
+"""
+
+NUMBER = 5
+
+
+def load_models(schema, backend):
+    module = types.ModuleType(f"bench_{backend}")
+    sys.modules[module.__name__] = module
+    source = generate_projection_models([QUERY], schema, backend)
+    exec(compile(source, module.__name__, "exec"), module.__dict__)
+    return module.RepositoryIssues
+
+
+def measure_memory(body, response_model):
+    gc.collect()
+    tracemalloc.start()
+    response = decode_response(body, response_model)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del response
+    return size
+
+
+def main():
+    schema = load_schema(SCHEMA_FILENAME)
+    models = {
+        backend: load_models(schema, backend)
+        for backend in ("pydantic", "msgspec")
+    }
+
+    for nodes in (1000, 10000):
+        body = json.dumps(make_issues_payload(nodes)).encode()
+        print(f"\n{nodes} issue nodes, {len(body) / 1024 / 1024:0.1f} MiB")
+
+        for backend, response_model in models.items():
+            decode_response(body, response_model)
+            duration = (
+                timeit.timeit(
+                    lambda: decode_response(body, response_model),
+                    number=NUMBER,
+                )
+                / NUMBER
+            )
+            size = measure_memory(body, response_model)
+            print(
+                f"{backend:>10}: {duration * 1000:8.1f} ms, "
+                f"{size / 1024 / 1024:6.1f} MiB retained"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare validating large `repository.issues` responses with building
+the models in trusted mode, for projection models and for the schema
+models of `github_graphql_client.model`. The schema models cannot be
+validated from a selection, their required fields are missing.
+
+    python scripts/bench_trusted.py
+"""
+
+import json
+import sys
+import timeit
+import types
+from pathlib import Path
+from typing import Optional
+
+from payloads import make_issues_payload
+from pydantic import BaseModel
+
+from github_graphql_client import model
+from github_graphql_client.client.typed import decode_response
+from github_graphql_client.codegen.projection import generate_projection_models
+from github_graphql_client.schema import load_schema
+
+SCHEMA_FILENAME = (
+    Path(__file__).parent.parent / "tests/data/schema.docs.graphql"
+)
+
+QUERY = """
+query repositoryIssues {
+  repository(owner: "pydantic", name: "pydantic") {
+    issues(first: 100) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        __typename id number title url state createdAt body
+        author { __typename login }
+        labels(first: 10) { nodes { name color } }
+      }
+    }
+  }
+}
+"""
+
+NUMBER = 5
+
+
+class RepositoryData(BaseModel):
+    repository: Optional[model.Repository] = None
+
+
+def load_projection(schema):
+    module = types.ModuleType("bench_trusted")
+    sys.modules[module.__name__] = module
+    source = generate_projection_models([QUERY], schema)
+    exec(compile(source, module.__name__, "exec"), module.__dict__)
+    return module.RepositoryIssues
+
+
+def measure(body, response_model, trusted):
+    decode_response(body, response_model, trusted)
+    return (
+        timeit.timeit(
+            lambda: decode_response(body, response_model, trusted),
+            number=NUMBER,
+        )
+        / NUMBER
+    )
+
+
+def main():
+    schema = load_schema(SCHEMA_FILENAME)
+    projection = load_projection(schema)
+    cases = {
+        "projection, validated": (projection, False),
+        "projection, trusted": (projection, True),
+        "schema models, trusted": (RepositoryData, True),
+    }
+
+    for nodes in (1000, 10000):
+        body = json.dumps(make_issues_payload(nodes)).encode()
+        print(f"\n{nodes} issue nodes, {len(body) / 1024 / 1024:0.1f} MiB")
+
+        for name, (response_model, trusted) in cases.items():
+            duration = measure(body, response_model, trusted)
+            print(f"{name:>25}: {duration * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Compare decoding a response into pydantic models through a dict
+(`json.loads` + `model_validate`) with the single-pass
+`model_validate_json` path used by `GraphQLClient.execute_typed`.
+
+    python scripts/bench_typed.py
+"""
+
+import json
+import timeit
+from typing import Optional
+
+from payloads import make_issues_payload
+from pydantic import BaseModel, Field
+
+from github_graphql_client.client.typed import (
+    GraphQLResponse,
+    decode_response,
+)
+from github_graphql_client.transport.codec import get_default_codec
+
+NUMBER = 20
+
+
+class Actor(BaseModel):
+    login: str
+
+
+class Label(BaseModel):
+    name: str
+    color: str
+
+
+class LabelConnection(BaseModel):
+    nodes: list[Label]
+
+
+class Issue(BaseModel):
+    typename__: Optional[str] = Field(None, alias="__typename")
+    id: str
+    number: int
+    title: str
+    url: str
+    state: str
+    createdAt: str
+    body: str
+    author: Optional[Actor]
+    labels: LabelConnection
+
+
+class PageInfo(BaseModel):
+    hasNextPage: bool
+    endCursor: Optional[str]
+
+
+class IssueConnection(BaseModel):
+    totalCount: int
+    pageInfo: PageInfo
+    nodes: list[Issue]
+
+
+class Repository(BaseModel):
+    issues: IssueConnection
+
+
+class RepositoryIssues(BaseModel):
+    repository: Repository
+
+
+def main():
+    codec = get_default_codec()
+    response_model = GraphQLResponse[RepositoryIssues]
+
+    for nodes in (100, 1000):
+        body = json.dumps(make_issues_payload(nodes)).encode()
+        print(f"\n{nodes} issue nodes, {len(body) / 1024:0.0f} KiB")
+
+        cases = {
+            "json.loads + model_validate": lambda: response_model.model_validate(
+                json.loads(body)
+            ),
+            f"{type(codec).__name__} + model_validate": (
+                lambda: response_model.model_validate(codec.loads(body))
+            ),
+            "decode_response (validate_json)": lambda: decode_response(
+                body, RepositoryIssues
+            ),
+        }
+
+        for name, fn in cases.items():
+            duration = timeit.timeit(fn, number=NUMBER) / NUMBER
+            print(f"{name:>40}: {duration * 1000:0.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Generate the projection models of the query builders.
+
+    python scripts/generate_query_models.py
+
+Writes `github_graphql_client/queries/responses.py` with pydantic models
+and `github_graphql_client/queries/structs.py` with msgspec Structs (the
+`msgspec` extra) of the exact response `data` of every operation below,
+see `github_graphql_client.codegen.projection`.
+"""
+
+from pathlib import Path
+
+from github_graphql_client.codegen.projection import generate_projection_models
+from github_graphql_client.queries.marketplaceCategories import (
+    get_marketplace_categories_operation,
+)
+from github_graphql_client.queries.repository import (
+    get_repository_issues_operation,
+)
+from github_graphql_client.schema import load_schema
+
+ROOT = Path(__file__).parent.parent
+SCHEMA_FILENAME = ROOT / "tests/data/schema.docs.graphql"
+OUTPUTS = {
+    "pydantic": ROOT / "github_graphql_client/queries/responses.py",
+    "msgspec": ROOT / "github_graphql_client/queries/structs.py",
+}
+
+# the variable values do not change the documents
+OPERATIONS = [
+    get_repository_issues_operation("owner", "name", 1, "OPEN")[0],
+    get_marketplace_categories_operation(False, False, [])[0],
+]
+
+
+def main():
+    schema = load_schema(SCHEMA_FILENAME)
+    for backend, filename in OUTPUTS.items():
+        source = generate_projection_models(OPERATIONS, schema, backend)
+        filename.write_text(source, encoding="utf8")
+        print(f"{filename.relative_to(ROOT)}: {len(OPERATIONS)} operations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import random
+from typing import Any
+
+LOREM = (
+    "GraphQL responses from the GitHub API carry whole issue bodies, "
+    "labels and authors for every node of a connection. "
+)
+
+
+def make_issue(i: int, rng: random.Random) -> dict[str, Any]:
+    return {
+        "__typename": "Issue",
+        "id": f"I_kwDOAbCdEf{i:08d}",
+        "number": i,
+        "title": f"Issue number {i}: {LOREM[: rng.randint(20, 80)]}",
+        "url": f"https://github.com/pydantic/pydantic/issues/{i}",
+        "state": rng.choice(["OPEN", "CLOSED"]),
+        "createdAt": "2023-12-21T09:54:26Z",
+        "body": LOREM * rng.randint(5, 30),
+        "author": {"__typename": "User", "login": f"user{i % 97}"},
+        "labels": {
+            "nodes": [
+                {"name": f"label-{j}", "color": "ededed"}
+                for j in range(rng.randint(0, 4))
+            ]
+        },
+    }
+
+
+def make_issues_payload(nodes: int = 100, seed: int = 0) -> dict[str, Any]:
+    """A GitHub-shaped `repository.issues` page with `nodes` issues."""
+    rng = random.Random(seed)
+
+    return {
+        "data": {
+            "repository": {
+                "issues": {
+                    "totalCount": nodes,
+                    "pageInfo": {
+                        "hasNextPage": False,
+                        "endCursor": "Y3Vyc29yOnYyOpHOAAAAAA==",
+                    },
+                    "nodes": [make_issue(i, rng) for i in range(nodes)],
+                }
+            }
+        }
+    }
@@ -0,0 +1,182 @@
+"""Prune the schema and the schema models to the types the query builders
+reach.
+
+    python scripts/prune_schema.py
+
+Writes `tests/data/schema.pruned.graphql`, the SDL of the schema pruned to
+the operations of `get_query_operations` (see
+`github_graphql_client.codegen.prune`), and
+`github_graphql_client/pruned_model.py`, the models of
+`github_graphql_client.models` of the pruned types with just the pruned
+fields, in a single module.
+"""
+
+import ast
+from pathlib import Path
+
+from graphql import (
+    GraphQLEnumType,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLUnionType,
+    print_schema,
+)
+from split_models import parse_definitions, union_lines
+
+from github_graphql_client.codegen.prune import (
+    get_query_operations,
+    prune_schema,
+)
+from github_graphql_client.schema import load_schema
+
+ROOT = Path(__file__).parent.parent
+SCHEMA_FILENAME = ROOT / "tests/data/schema.docs.graphql"
+PRUNED_SCHEMA_FILENAME = ROOT / "tests/data/schema.pruned.graphql"
+MODELS = ROOT / "github_graphql_client/models"
+PRUNED_MODEL_FILENAME = ROOT / "github_graphql_client/pruned_model.py"
+
+HEADER = """# generated by scripts/prune_schema.py, do not edit
+from __future__ import annotations
+
+{imports}
+"""
+
+MODEL_IMPORTS = """from enum import Enum
+from typing import List, Optional, TypeAlias
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from github_graphql_client.models._base import BaseModel"""
+
+MODEL_UNION_IMPORTS = """from enum import Enum
+from typing import Annotated, List, Optional, TypeAlias, Union
+
+from pydantic import Field, Tag
+from typing_extensions import Literal
+
+from github_graphql_client.codegen.runtime import typename_discriminator
+from github_graphql_client.models._base import BaseModel"""
+
+
+def load_definitions() -> dict[str, tuple[ast.stmt, str]]:
+    definitions = {}
+    for module in sorted(MODELS.glob("*.py")):
+        if not module.name.startswith("_"):
+            definitions.update(
+                parse_definitions(module.read_text(encoding="utf8"))
+            )
+    return definitions
+
+
+def field_name(node: ast.AnnAssign) -> str:
+    """The GraphQL name of a model field, its alias if it has one."""
+    value = node.value
+    if isinstance(value, ast.Call):
+        for keyword in value.keywords:
+            if keyword.arg == "alias":
+                return keyword.value.value
+    return node.target.id
+
+
+def render_model(
+    node: ast.ClassDef, source: str, fields: set[str], names: set[str]
+) -> str:
+    lines = source.splitlines()
+    # line numbers of `node` are those of its module
+    offset = node.lineno - next(
+        i for i, line in enumerate(lines) if line.startswith("class ")
+    )
+
+    bases = [base.id for base in node.bases if base.id in names]
+    bases = bases or ["BaseModel"]
+    header = f"class {node.name}({', '.join(bases)}):"
+    if len(header) > 88:
+        header = "\n".join(
+            [f"class {node.name}(", *(f"    {b}," for b in bases), "):"]
+        )
+
+    body = []
+    for statement in node.body:
+        if isinstance(statement, ast.AnnAssign):
+            if field_name(statement) not in fields | {"__typename"}:
+                continue
+        elif not isinstance(statement, ast.Expr):
+            continue
+        start = statement.lineno - offset
+        body.append(
+            "\n".join(lines[start : statement.end_lineno - offset + 1])
+        )
+        if isinstance(statement, ast.Expr):
+            # the docstring
+            body.append("")
+
+    return header + "\n" + "\n".join(body)
+
+
+def prune_models(
+    schema: GraphQLSchema, definitions: dict[str, tuple[ast.stmt, str]]
+) -> str:
+    # there are no models of the root types
+    names = set(schema.type_map) & set(definitions)
+    kinds = {
+        GraphQLScalarType: [],
+        GraphQLEnumType: [],
+        GraphQLObjectType: [],
+        GraphQLUnionType: [],
+    }
+    emitted: set[str] = set()
+
+    def add_model(name: str) -> None:
+        if name in emitted:
+            return
+        emitted.add(name)
+        node, source = definitions[name]
+        # bases come first
+        for base in node.bases:
+            if base.id in names:
+                add_model(base.id)
+        kinds[GraphQLObjectType].append(
+            render_model(
+                node, source, set(schema.type_map[name].fields), names
+            )
+        )
+
+    for name in sorted(names):
+        type_ = schema.type_map[name]
+        if isinstance(type_, (GraphQLObjectType, GraphQLInterfaceType)):
+            add_model(name)
+        elif isinstance(type_, GraphQLUnionType):
+            node, source = definitions[name]
+            comments = [
+                line for line in source.splitlines() if line.startswith("#")
+            ]
+            members = [member.name for member in type_.types]
+            kinds[GraphQLUnionType].append(
+                "\n".join(comments + union_lines(name, members))
+            )
+        else:
+            kinds[type(type_)].append(definitions[name][1])
+
+    imports = MODEL_UNION_IMPORTS if kinds[GraphQLUnionType] else MODEL_IMPORTS
+    texts = [text for texts in kinds.values() for text in texts]
+    return (
+        HEADER.format(imports=imports) + "\n\n" + "\n\n\n".join(texts) + "\n"
+    )
+
+
+def main():
+    schema = prune_schema(load_schema(SCHEMA_FILENAME), get_query_operations())
+
+    PRUNED_SCHEMA_FILENAME.write_text(print_schema(schema) + "\n")
+    PRUNED_MODEL_FILENAME.write_text(
+        prune_models(schema, load_definitions()), encoding="utf8"
+    )
+
+    print(f"{len(schema.type_map)} types")
+
+
+if __name__ == "__main__":
+    main()
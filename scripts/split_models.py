@@ -0,0 +1,349 @@
+"""Split the datamodel-codegen output into lazily loaded model modules.
+
+    datamodel-codegen --input tests/data/schema.docs.graphql \\
+        --input-file-type graphql --output model.py ...
+    python scripts/split_models.py model.py github_graphql_client/models
+
+Every definition goes to a module of the output package:
+
+- scalar aliases to `scalars`, enums to `enums` and union aliases to
+  `unions`;
+- the models forming the large reference cycle of the schema (every model
+  reachable from `Repository`, `Issue`, `User`, ... refers back to them)
+  to `core`, since loading any of them loads all of them anyway;
+- every other model to a module of its own.
+
+Union aliases are discriminated by `__typename`. Base classes are
+imported by the modules, all other references are only
+resolved when a model is validated for the first time. They are listed in
+`_index.DEPENDENCIES` and injected into the module namespace by
+`github_graphql_client.model` when the module is loaded.
+"""
+
+import ast
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+HEADER = """# generated by scripts/split_models.py, do not edit
+from __future__ import annotations
+
+{imports}
+"""
+
+MODEL_IMPORTS = """from typing import List, Optional, TypeAlias, Union
+
+from pydantic import Field
+from typing_extensions import Literal
+
+from ._base import BaseModel"""
+
+UNION_IMPORTS = """from typing import Annotated, TypeAlias, Union
+
+from pydantic import Tag
+
+from github_graphql_client.codegen.runtime import typename_discriminator"""
+
+CORE_MODULE = "core"
+CORE_ROOT = "Repository"
+
+
+def module_name(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
+
+
+def parse_definitions(source: str) -> dict[str, tuple[ast.stmt, str]]:
+    """Map every top-level name to its node and source text, including the
+    comments above it and the docstring below it."""
+    lines = source.splitlines()
+    tree = ast.parse(source)
+
+    definitions: dict[str, tuple[ast.stmt, str]] = {}
+    last_name = None
+    previous_end = 0
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            name = node.name
+        elif isinstance(node, (ast.AnnAssign, ast.Assign)):
+            target = (
+                node.target
+                if isinstance(node, ast.AnnAssign)
+                else node.targets[0]
+            )
+            name = target.id
+        elif (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant)
+            and last_name is not None
+        ):
+            # the docstring of a type alias
+            alias, text = definitions[last_name]
+            docstring = "\n".join(lines[previous_end : node.end_lineno])
+            definitions[last_name] = (
+                alias,
+                text + "\n" + docstring.strip("\n"),
+            )
+            previous_end = node.end_lineno
+            continue
+        else:
+            # imports
+            previous_end = node.end_lineno
+            continue
+
+        start = node.lineno - 1
+        if isinstance(node, ast.ClassDef) and node.decorator_list:
+            start = node.decorator_list[0].lineno - 1
+        while start > previous_end and lines[start - 1].startswith("#"):
+            start -= 1
+
+        definitions[name] = (node, "\n".join(lines[start : node.end_lineno]))
+        last_name = name
+        previous_end = node.end_lineno
+
+    return definitions
+
+
+def get_kind(node: ast.stmt) -> str:
+    if isinstance(node, ast.ClassDef):
+        bases = {getattr(base, "id", None) for base in node.bases}
+        return "enum" if "Enum" in bases else "model"
+
+    value = node.value
+    if isinstance(value, ast.Name) and value.id in {
+        "str",
+        "int",
+        "bool",
+        "float",
+    }:
+        return "scalar"
+    return "union"
+
+
+def get_references(node: ast.stmt, names: set[str]) -> set[str]:
+    references = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and child.id in names:
+            references.add(child.id)
+        elif (
+            isinstance(child, ast.Constant)
+            and isinstance(child.value, str)
+            and child.value in names
+        ):
+            references.add(child.value)
+    return references
+
+
+def get_bases(node: ast.stmt, names: set[str]) -> list[str]:
+    if not isinstance(node, ast.ClassDef):
+        return []
+    return [
+        base.id for base in node.bases if getattr(base, "id", None) in names
+    ]
+
+
+def get_closure(graph: dict[str, set[str]], root: str) -> set[str]:
+    seen = set()
+    stack = [root]
+    while stack:
+        name = stack.pop()
+        if name not in seen:
+            seen.add(name)
+            stack.extend(graph[name])
+    return seen
+
+
+def render_union(node: ast.stmt, text: str) -> str:
+    """Make a union alias discriminated by `__typename`.
+
+    Bare names are quoted, so loading `unions` does not load the models
+    (e.g. `UserListItems: TypeAlias = Repository`).
+    """
+    name = node.target.id
+    value = node.value
+    comments = [line for line in text.splitlines() if line.startswith("#")]
+
+    if isinstance(value, ast.Subscript):
+        members = [element.value for element in value.slice.elts]
+    else:
+        members = [getattr(value, "id", None) or value.value]
+
+    return "\n".join(comments + union_lines(name, members))
+
+
+def union_lines(name: str, members: list[str]) -> list[str]:
+    if len(members) == 1:
+        return [f"{name}: TypeAlias = '{members[0]}'"]
+
+    return [
+        f"{name}: TypeAlias = Annotated[",
+        "    Union[",
+        *(
+            f"        Annotated['{member}', Tag('{member}')],"
+            for member in members
+        ),
+        "    ],",
+        "    typename_discriminator(",
+        *(f"        '{member}'," for member in members),
+        "    ),",
+        "]",
+    ]
+
+
+def split(
+    source: str,
+) -> tuple[dict[str, list[str]], dict[str, str], dict[str, set[str]]]:
+    definitions = parse_definitions(source)
+    names = set(definitions)
+    kinds = {name: get_kind(node) for name, (node, _) in definitions.items()}
+    graph = {
+        name: get_references(node, names) - {name}
+        for name, (node, _) in definitions.items()
+    }
+
+    # models on a reference cycle through the core root
+    reachable = get_closure(graph, CORE_ROOT)
+    core = {
+        name
+        for name in reachable
+        if kinds[name] == "model" and CORE_ROOT in get_closure(graph, name)
+    }
+
+    modules: dict[str, list[str]] = defaultdict(list)
+    for name in definitions:
+        if kinds[name] == "scalar":
+            modules["scalars"].append(name)
+        elif kinds[name] == "enum":
+            modules["enums"].append(name)
+        elif kinds[name] == "union":
+            modules["unions"].append(name)
+        elif name in core:
+            modules[CORE_MODULE].append(name)
+        else:
+            modules[module_name(name)].append(name)
+
+    index = {
+        name: module for module, members in modules.items() for name in members
+    }
+
+    # names an annotation may refer to through a union alias
+    def expand(name: str) -> set[str]:
+        if kinds[name] != "union":
+            return {name}
+        result = {name}
+        for member in graph[name]:
+            result |= expand(member)
+        return result
+
+    dependencies: dict[str, set[str]] = {}
+    for module, members in modules.items():
+        if module in ("scalars", "enums", "unions"):
+            dependencies[module] = set()
+            continue
+
+        needed = set()
+        for name in members:
+            for reference in graph[name]:
+                needed |= expand(reference)
+        hard = {
+            base
+            for name in members
+            for base in get_bases(definitions[name][0], names)
+        }
+        dependencies[module] = {
+            name for name in needed - hard if index[name] != module
+        }
+
+    return modules, index, dependencies, definitions, kinds, names
+
+
+def render_module(
+    module: str,
+    members: list[str],
+    definitions: dict,
+    kinds: dict[str, str],
+    index: dict[str, str],
+    names: set[str],
+) -> str:
+    if module == "scalars":
+        imports = "from typing import TypeAlias"
+    elif module == "enums":
+        imports = "from enum import Enum"
+    elif module == "unions":
+        imports = UNION_IMPORTS
+    else:
+        imports = MODEL_IMPORTS
+        hard = defaultdict(set)
+        for name in members:
+            for base in get_bases(definitions[name][0], names):
+                if index[base] != module:
+                    hard[index[base]].add(base)
+        for other, bases in sorted(hard.items()):
+            imports += f"\nfrom .{other} import {', '.join(sorted(bases))}"
+
+    texts = []
+    for name in members:
+        text = definitions[name][1]
+        if module == "unions":
+            text = render_union(definitions[name][0], text)
+        texts.append(text)
+
+    return (
+        HEADER.format(imports=imports) + "\n\n" + "\n\n\n".join(texts) + "\n"
+    )
+
+
+def render_index(
+    modules: dict[str, list[str]], dependencies: dict[str, set[str]]
+) -> str:
+    lines = ["# generated by scripts/split_models.py, do not edit", ""]
+
+    lines.append("MODULES = {")
+    for module, members in sorted(modules.items()):
+        for name in members:
+            lines.append(f'    "{name}": "{module}",')
+    lines.append("}")
+    lines.append("")
+
+    lines.append("DEPENDENCIES = {")
+    for module in sorted(modules):
+        names = sorted(dependencies[module])
+        if not names:
+            lines.append(f'    "{module}": (),')
+            continue
+        lines.append(f'    "{module}": (')
+        for name in names:
+            lines.append(f'        "{name}",')
+        lines.append("    ),")
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+def main(source_path: str, package_path: str) -> None:
+    source = Path(source_path).read_text(encoding="utf8")
+    package = Path(package_path)
+
+    modules, index, dependencies, definitions, kinds, names = split(source)
+
+    for module in list(package.glob("*.py")):
+        if module.name not in ("__init__.py", "_base.py"):
+            module.unlink()
+
+    for module, members in modules.items():
+        text = render_module(module, members, definitions, kinds, index, names)
+        (package / f"{module}.py").write_text(text, encoding="utf8")
+
+    (package / "_index.py").write_text(
+        render_index(modules, dependencies), encoding="utf8"
+    )
+
+    print(
+        f"{len(definitions)} definitions in {len(modules)} modules, "
+        f"{len(modules[CORE_MODULE])} in `{CORE_MODULE}`"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
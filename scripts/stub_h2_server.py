@@ -0,0 +1,75 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import DataReceived, StreamEnded
+
+
+class H2StubProtocol(asyncio.Protocol):
+    """Answers every HTTP/2 request with `payload` after `delay` seconds.
+
+    Speaks cleartext HTTP/2 with prior knowledge (h2c). The payload must
+    fit into a single DATA frame (16 KiB).
+    """
+
+    def __init__(self, payload: bytes, delay: float) -> None:
+        self.payload = payload
+        self.delay = delay
+        self.conn = H2Connection(H2Configuration(client_side=False))
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        for event in self.conn.receive_data(data):
+            if isinstance(event, DataReceived):
+                self.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, StreamEnded):
+                loop = asyncio.get_running_loop()
+                loop.call_later(self.delay, self.respond, event.stream_id)
+
+        self.transport.write(self.conn.data_to_send())
+
+    def respond(self, stream_id: int) -> None:
+        if self.transport.is_closing():
+            return
+
+        self.conn.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(self.payload))),
+            ],
+        )
+        self.conn.send_data(stream_id, self.payload, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+@asynccontextmanager
+async def run_h2_stub_server(
+    payload: Optional[Any] = None, delay: float = 0.0
+) -> AsyncIterator[str]:
+    """Serve a canned GraphQL response over h2c, yield its endpoint."""
+    if payload is None:
+        payload = {"data": {"viewer": {"login": "octocat"}}}
+
+    body = json.dumps(payload).encode()
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(
+        lambda: H2StubProtocol(body, delay), "127.0.0.1", 0
+    )
+
+    try:
+        host, port = server.sockets[0].getsockname()[:2]
+        yield f"http://{host}:{port}/graphql"
+    finally:
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,57 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every POST with `server.payload` after `server.delay`."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.server.payload)))
+        self.end_headers()
+        self.wfile.write(self.server.payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+@contextmanager
+def run_stub_server(
+    payload: Optional[Any] = None, delay: float = 0.0
+) -> Iterator[str]:
+    """Serve a canned GraphQL response on localhost, yield its endpoint."""
+    if payload is None:
+        payload = {"data": {"viewer": {"login": "octocat"}}}
+
+    server = StubServer(("127.0.0.1", 0), StubHandler)
+    server.payload = json.dumps(payload).encode()
+    server.delay = delay
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        host, port = server.server_address
+        yield f"http://{host}:{port}/graphql"
+    finally:
+        server.shutdown()
+        server.server_close()
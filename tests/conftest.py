@@ -0,0 +1,102 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from github_graphql_client.schema import load_schema
+
+SCHEMA_FILENAME = Path(__file__).parent / "data/schema.docs.graphql"
+
+
+class GraphQLStubHandler(BaseHTTPRequestHandler):
+    """Answers every POST with the request variables under `data.echo`
+    and `variables.errors`, if any, as the GraphQL `errors`.
+
+    Gzipped request bodies are accepted and with `server.gzip` responses
+    are gzipped for clients accepting it.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        body = json.loads(body)
+
+        self.server.requests.append(
+            {
+                "client": self.client_address,
+                "headers": dict(self.headers),
+                "body": body,
+            }
+        )
+
+        status, headers = 200, self.server.headers
+        if self.server.failures:
+            status, headers = self.server.failures.pop(0)
+
+        response = {"data": {"echo": body["variables"]}}
+        if "errors" in body["variables"]:
+            response["errors"] = body["variables"]["errors"]
+        payload = json.dumps(response).encode()
+
+        gzipped = self.server.gzip and "gzip" in self.headers.get(
+            "Accept-Encoding", ""
+        )
+        if gzipped:
+            payload = gzip.compress(payload)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class GraphQLStubServer(ThreadingHTTPServer):
+    # concurrent tests open more connections than the default backlog of 5
+    request_queue_size = 128
+
+
+@pytest.fixture
+def graphql_server():
+    server = GraphQLStubServer(("127.0.0.1", 0), GraphQLStubHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.headers = {}
+    server.failures = []
+    server.gzip = False
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def graphql_endpoint(graphql_server):
+    host, port = graphql_server.server_address
+    return f"http://{host}:{port}/graphql"
+
+
+@pytest.fixture(scope="session")
+def github_schema(pytestconfig):
+    return load_schema(
+        SCHEMA_FILENAME, pytestconfig.cache.mkdir("github_schema")
+    )
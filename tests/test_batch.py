@@ -0,0 +1,200 @@
+import pytest
+from graphql import parse, validate
+from graphql_query import Argument, Field, Operation, Query, Variable
+from graphql_query.types import Fragment
+
+from github_graphql_client.client.result import ExecutionResult
+from github_graphql_client.queries.batch import (
+    batch_operations,
+    merge_operations,
+    split_batch_payloads,
+    split_batches,
+)
+from github_graphql_client.queries.marketplaceCategories import (
+    get_marketplace_categories_operation,
+)
+from github_graphql_client.queries.repository import (
+    get_repository_issues_operation,
+)
+
+
+def test_merge_operations_renames_variables_and_aliases():
+    merged = merge_operations(
+        [
+            get_repository_issues_operation("pydantic", "FastUI", 2, "OPEN"),
+            get_repository_issues_operation(
+                "denisart", "graphql", 3, "CLOSED"
+            ),
+        ]
+    )
+
+    assert "q0_repository: repository(" in merged.query
+    assert "q1_repository: repository(" in merged.query
+    assert "last: $q1_Last" in merged.query
+    assert merged.variables == {
+        "q0_Owner": "pydantic",
+        "q0_Name": "FastUI",
+        "q0_Last": 2,
+        "q0_IssueState": "OPEN",
+        "q1_Owner": "denisart",
+        "q1_Name": "graphql",
+        "q1_Last": 3,
+        "q1_IssueState": "CLOSED",
+    }
+
+
+def test_merge_operations_split():
+    merged = merge_operations(
+        [
+            get_repository_issues_operation("a", "b", 1, "OPEN"),
+            get_marketplace_categories_operation(True, False, []),
+        ]
+    )
+
+    data = {
+        "q0_repository": {"issues": {"edges": []}},
+        "q1_marketplaceCategories": [{"id": "1", "description": "d"}],
+    }
+
+    assert merged.split(data) == [
+        {"repository": {"issues": {"edges": []}}},
+        {"marketplaceCategories": [{"id": "1", "description": "d"}]},
+    ]
+
+
+def test_merge_operations_split_payload():
+    merged = merge_operations(
+        [
+            get_repository_issues_operation("a", "b", 1, "OPEN"),
+            get_repository_issues_operation("a", "missing", 1, "OPEN"),
+        ]
+    )
+    not_found = {
+        "type": "NOT_FOUND",
+        "path": ["q1_repository"],
+        "message": "Could not resolve to a Repository",
+    }
+    rate_limited = {"type": "RATE_LIMITED", "message": "API rate limit"}
+    payload = {
+        "data": {"q0_repository": {"issues": {}}, "q1_repository": None},
+        "errors": [not_found, rate_limited],
+    }
+
+    ok, failed = merged.split_payload(payload)
+
+    assert ok == {
+        "data": {"repository": {"issues": {}}},
+        "errors": [rate_limited],
+    }
+    assert failed == {
+        "data": {"repository": None},
+        "errors": [{**not_found, "path": ["repository"]}, rate_limited],
+    }
+    assert ExecutionResult.from_payload(failed, 0).errors == failed["errors"]
+    assert split_batch_payloads([merged], [{"data": None}]) == [
+        {"data": {"repository": None}},
+        {"data": {"repository": None}},
+    ]
+
+
+def test_batch_operations():
+    operations = [
+        get_repository_issues_operation("owner", f"repo{i}", 1, "OPEN")
+        for i in range(5)
+    ]
+    batches = batch_operations(operations, batch_size=2)
+
+    assert len(batches) == 3
+
+    data = [
+        {alias: {"name": alias} for item in batch.aliases for alias in item}
+        for batch in batches
+    ]
+    results = split_batches(batches, data)
+
+    assert [r["repository"]["name"] for r in results] == [
+        "q0_repository",
+        "q1_repository",
+        "q0_repository",
+        "q1_repository",
+        "q0_repository",
+    ]
+
+
+def test_merge_operations_rejects_empty():
+    with pytest.raises(ValueError):
+        merge_operations([])
+
+
+def repository_operation(fragment: Fragment, variables: list[Variable]):
+    name = Variable(name="Name", type="String!")
+    return Operation(
+        type="query",
+        name="getRepository",
+        variables=[name, *variables],
+        queries=[
+            Query(
+                name="repository",
+                arguments=[
+                    Argument(name="owner", value='"owner"'),
+                    Argument(name="name", value=name),
+                ],
+                fields=[fragment],
+            )
+        ],
+        fragments=[fragment],
+    )
+
+
+def test_merge_operations_renames_fragment_variables(github_schema):
+    last = Variable(name="Last", type="Int!")
+    fragment = Fragment(
+        name="RepositoryIssues",
+        type="Repository",
+        fields=[
+            Field(
+                name="issues",
+                arguments=[Argument(name="last", value=last)],
+                fields=["totalCount"],
+            )
+        ],
+    )
+    operation = repository_operation(fragment, [last])
+
+    merged = merge_operations(
+        [
+            (operation, {"Name": "a", "Last": 1}),
+            (operation, {"Name": "b", "Last": 2}),
+        ]
+    )
+
+    assert validate(github_schema, parse(merged.query)) == []
+    assert "fragment q0_RepositoryIssues on Repository" in merged.query
+    assert "fragment q1_RepositoryIssues on Repository" in merged.query
+    assert "...q1_RepositoryIssues" in merged.query
+    assert "last: $q1_Last" in merged.query
+
+
+def test_merge_operations_renames_conflicting_fragments(github_schema):
+    def operation(field: str) -> Operation:
+        return repository_operation(
+            Fragment(
+                name="RepositoryFields", type="Repository", fields=[field]
+            ),
+            [],
+        )
+
+    merged = merge_operations(
+        [
+            (operation("name"), {"Name": "a"}),
+            (operation("name"), {"Name": "b"}),
+            (operation("url"), {"Name": "c"}),
+        ]
+    )
+
+    assert validate(github_schema, parse(merged.query)) == []
+    assert merged.query.count("fragment RepositoryFields on") == 1
+    assert "fragment q2_RepositoryFields on Repository {\n  url" in (
+        merged.query
+    )
+    assert merged.query.count("...q2_RepositoryFields") == 1
@@ -0,0 +1,211 @@
+import asyncio
+
+import pytest
+from graphql import GraphQLError
+from pydantic import BaseModel
+
+from github_graphql_client.client.client import GraphQLClient
+from github_graphql_client.transport.aiohttp import AIOHTTPTransport
+from github_graphql_client.transport.exceptions import TransportServerError
+from github_graphql_client.transport.requests import RequestsTransport
+
+QUERY = "query { viewer { login } }"
+
+
+def test_execute_async_transport(graphql_endpoint):
+    client = GraphQLClient(AIOHTTPTransport(graphql_endpoint, "token"))
+
+    assert client.execute(QUERY, {"i": 1}) == {"echo": {"i": 1}}
+    assert client.transport.session is None
+
+
+def test_persistent_async_transport_reuses_session(
+    graphql_server, graphql_endpoint
+):
+    client = GraphQLClient(
+        AIOHTTPTransport(graphql_endpoint, "token"), persistent=True
+    )
+
+    assert client.execute(QUERY, {"i": 1}) == {"echo": {"i": 1}}
+    session = client.transport.session
+    assert client.execute_batch([QUERY, QUERY], [{"i": 2}, {"i": 3}]) == [
+        {"echo": {"i": 2}},
+        {"echo": {"i": 3}},
+    ]
+    assert client.execute(QUERY, {"i": 4}) == {"echo": {"i": 4}}
+    assert client.transport.session is session
+
+    client.close()
+    assert client.transport.session is None
+
+    clients = {request["client"] for request in graphql_server.requests}
+    assert len(clients) < len(graphql_server.requests)
+
+
+def test_persistent_sync_transport_reuses_session(graphql_endpoint):
+    client = GraphQLClient(
+        RequestsTransport(graphql_endpoint, "token"), persistent=True
+    )
+
+    assert client.execute(QUERY, {"i": 1}) == {"echo": {"i": 1}}
+    session = client.transport.session
+    assert client.execute_batch([QUERY], [{"i": 2}]) == [{"echo": {"i": 2}}]
+    assert client.transport.session is session
+
+    client.close()
+    assert client.transport.session is None
+
+
+def test_bounded_async_batch(graphql_endpoint):
+    client = GraphQLClient(
+        AIOHTTPTransport(graphql_endpoint, "token", limit_per_host=2),
+        max_in_flight=3,
+    )
+    variables = [{"i": i} for i in range(20)]
+
+    assert client.execute_batch([QUERY] * 20, variables) == [
+        {"echo": v} for v in variables
+    ]
+
+
+def test_threaded_sync_batch(graphql_server, graphql_endpoint):
+    client = GraphQLClient(
+        RequestsTransport(graphql_endpoint, "token", pool_maxsize=4),
+        max_workers=4,
+    )
+    variables = [{"i": i} for i in range(20)]
+
+    assert client.execute_batch([QUERY] * 20, variables) == [
+        {"echo": v} for v in variables
+    ]
+    assert len(graphql_server.requests) == 20
+
+
+def test_threaded_sync_batch_sizes_pool(graphql_endpoint):
+    transport = RequestsTransport(graphql_endpoint, "token")
+    client = GraphQLClient(transport, max_workers=16)
+    assert transport.pool_maxsize == 16
+
+    variables = [{"i": i} for i in range(32)]
+    assert client.execute_batch([QUERY] * 32, variables) == [
+        {"echo": v} for v in variables
+    ]
+
+    transport = RequestsTransport(graphql_endpoint, "token")
+    transport.connect()
+    with pytest.warns(UserWarning, match="max_workers=16"):
+        GraphQLClient(transport, max_workers=16)
+    transport.close()
+
+
+@pytest.mark.parametrize(
+    "transport_class", [AIOHTTPTransport, RequestsTransport]
+)
+def test_execute_batch_results(
+    graphql_server, graphql_endpoint, transport_class
+):
+    graphql_server.failures = [(401, {})]
+    client = GraphQLClient(
+        transport_class(graphql_endpoint, "token"), max_in_flight=1
+    )
+    errors = [{"message": "Could not resolve to a Repository"}]
+
+    results = client.execute_batch_results(
+        [QUERY, QUERY, QUERY], [{"i": 1}, {"errors": errors}, {"i": 3}]
+    )
+
+    assert isinstance(results[0].exception, TransportServerError)
+    assert results[0].data is None
+    assert not results[1].ok
+    assert results[1].errors == errors
+    assert results[2].ok
+    assert results[2].data == {"echo": {"i": 3}}
+    assert all(result.elapsed > 0 for result in results)
+
+
+@pytest.mark.parametrize(
+    "transport_class", [AIOHTTPTransport, RequestsTransport]
+)
+def test_queries_are_validated_before_sending(
+    graphql_server, graphql_endpoint, github_schema, transport_class
+):
+    client = GraphQLClient(
+        transport_class(graphql_endpoint, "token"), schema=github_schema
+    )
+    invalid = "query { viewer { notAField } }"
+
+    with pytest.raises(GraphQLError, match="notAField"):
+        client.execute(invalid, {})
+    with pytest.raises(GraphQLError, match="notAField"):
+        client.execute_batch([QUERY, invalid], [{"i": 1}, {}])
+    assert graphql_server.requests == []
+
+    results = client.execute_batch_results([QUERY, invalid], [{"i": 1}, {}])
+    assert results[0].data == {"echo": {"i": 1}}
+    assert isinstance(results[1].exception, GraphQLError)
+    assert client.execute(QUERY, {"i": 2}) == {"echo": {"i": 2}}
+    assert len(graphql_server.requests) == 2
+
+
+class Echo(BaseModel):
+    i: int
+
+
+class EchoData(BaseModel):
+    echo: Echo
+
+
+def test_async_queries_are_validated_before_sending(
+    graphql_server, graphql_endpoint, github_schema
+):
+    client = GraphQLClient(
+        AIOHTTPTransport(graphql_endpoint, "token"), schema=github_schema
+    )
+    invalid = "query { viewer { notAField } }"
+
+    async def execute():
+        async with client:
+            for method in (client.execute_async, client.execute_raw_async):
+                with pytest.raises(GraphQLError, match="notAField"):
+                    await method(invalid, {})
+            with pytest.raises(GraphQLError, match="notAField"):
+                await client.execute_typed_async(invalid, {}, EchoData)
+
+            return await client.execute_async(QUERY, {"i": 1})
+
+    assert asyncio.run(execute()) == {"echo": {"i": 1}}
+    assert len(graphql_server.requests) == 1
+
+
+@pytest.mark.parametrize(
+    "transport_class", [AIOHTTPTransport, RequestsTransport]
+)
+def test_execute_typed(graphql_endpoint, transport_class):
+    client = GraphQLClient(transport_class(graphql_endpoint, "token"))
+
+    response = client.execute_typed(QUERY, {"i": 7}, EchoData)
+
+    assert response.data == EchoData(echo=Echo(i=7))
+    assert response.errors is None
+
+    errors = [{"message": "Something went wrong"}]
+    response = client.execute_typed(
+        QUERY, {"i": 1, "errors": errors}, EchoData
+    )
+    assert response.errors == errors
+
+
+@pytest.mark.parametrize(
+    "transport_class", [AIOHTTPTransport, RequestsTransport]
+)
+def test_execute_typed_trusted(graphql_endpoint, transport_class):
+    client = GraphQLClient(transport_class(graphql_endpoint, "token"))
+
+    response = client.execute_typed(QUERY, {"i": 7}, EchoData, trusted=True)
+    assert response.data == EchoData(echo=Echo(i=7))
+
+    # not validated
+    response = client.execute_typed(
+        QUERY, {"i": "seven"}, EchoData, trusted=True
+    )
+    assert response.data.echo.i == "seven"
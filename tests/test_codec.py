@@ -0,0 +1,40 @@
+import pytest
+
+from github_graphql_client.transport.codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    get_default_codec,
+)
+from github_graphql_client.transport.requests import RequestsTransport
+
+PAYLOAD = {"query": "query { viewer { login } }", "variables": {"a": [1, "é"]}}
+
+
+@pytest.mark.parametrize(
+    "codec_class", [StdlibJSONCodec, OrjsonCodec, MsgspecCodec]
+)
+def test_codec_roundtrip(codec_class):
+    try:
+        codec = codec_class()
+    except ImportError:
+        pytest.skip(f"{codec_class.__name__} is not installed")
+
+    data = codec.dumps(PAYLOAD)
+
+    assert isinstance(data, bytes)
+    assert codec.loads(data) == PAYLOAD
+
+
+def test_get_default_codec():
+    assert get_default_codec().loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_transport_uses_codec(graphql_endpoint):
+    transport = RequestsTransport(
+        graphql_endpoint, "token", codec=StdlibJSONCodec()
+    )
+
+    transport.connect()
+    assert transport.execute("query { a }", {"i": 1}) == {"echo": {"i": 1}}
+    transport.close()
@@ -0,0 +1,171 @@
+import json
+import sys
+import types
+from pathlib import Path
+
+import pydantic
+import pytest
+from graphql import GraphQLError
+
+from github_graphql_client.client.typed import decode_response
+from github_graphql_client.codegen.projection import generate_projection_models
+from github_graphql_client.queries import responses
+from github_graphql_client.queries.marketplaceCategories import (
+    get_marketplace_categories_operation,
+)
+from github_graphql_client.queries.repository import (
+    get_repository_issues_operation,
+)
+
+SEARCH_QUERY = """
+query searchIssues($query: String!) {
+  search(query: $query, type: ISSUE, first: 2) {
+    total: issueCount
+    nodes {
+      __typename
+      ... on Issue { title state }
+      ...pullRequest
+    }
+  }
+}
+
+fragment pullRequest on PullRequest { title isDraft }
+"""
+
+
+def load(source):
+    # annotations are resolved through the module when decoding
+    module = types.ModuleType(f"projection_{len(sys.modules)}")
+    sys.modules[module.__name__] = module
+    exec(compile(source, module.__name__, "exec"), module.__dict__)
+    return module.__dict__
+
+
+@pytest.mark.parametrize(
+    "backend,filename",
+    [("pydantic", "responses.py"), ("msgspec", "structs.py")],
+)
+def test_generated_modules_are_up_to_date(github_schema, backend, filename):
+    source = generate_projection_models(
+        [
+            get_repository_issues_operation("owner", "name", 1, "OPEN")[0],
+            get_marketplace_categories_operation(False, False, [])[0],
+        ],
+        github_schema,
+        backend,
+    )
+
+    path = Path(responses.__file__).with_name(filename)
+    assert source == path.read_text(encoding="utf8")
+
+
+def test_projection_has_exactly_the_selected_fields():
+    node = {"__typename": "Issue", "title": "Bug", "url": "https://x/1"}
+    data = responses.GetRepositoryIssues.model_validate(
+        {
+            "repository": {
+                "__typename": "Repository",
+                "issues": {
+                    "__typename": "IssueConnection",
+                    "edges": [{"__typename": "IssueEdge", "node": node}, None],
+                },
+            }
+        }
+    )
+
+    node = data.repository.issues.edges[0].node
+    assert (node.title, node.url) == ("Bug", "https://x/1")
+    assert set(type(node).model_fields) == {"typename__", "title", "url"}
+
+    with pytest.raises(pydantic.ValidationError):
+        responses.GetRepositoryIssuesRepositoryIssuesEdgesNode.model_validate(
+            {"__typename": "Issue", "title": "Bug"}
+        )
+
+
+def test_aliases_and_fragments(github_schema):
+    models = load(generate_projection_models([SEARCH_QUERY], github_schema))
+
+    data = models["SearchIssues"].model_validate(
+        {
+            "search": {
+                "total": 3,
+                "nodes": [
+                    {"__typename": "Issue", "title": "a", "state": "OPEN"},
+                    {"__typename": "PullRequest", "title": "b", "isDraft": 1},
+                    {"__typename": "Repository"},
+                ],
+            }
+        }
+    )
+
+    issue, pull_request, repository = data.search.nodes
+    assert data.search.total == 3
+    assert isinstance(issue, models["SearchIssuesSearchNodesIssue"])
+    assert issue.state == models["IssueState"].OPEN
+    assert isinstance(
+        pull_request, models["SearchIssuesSearchNodesPullRequest"]
+    )
+    assert pull_request.isDraft is True
+    assert isinstance(repository, models["SearchIssuesSearchNodesOther"])
+    assert repository.typename__ == "Repository"
+
+
+def test_union_is_discriminated_by_typename(github_schema):
+    models = load(generate_projection_models([SEARCH_QUERY], github_schema))
+
+    with pytest.raises(pydantic.ValidationError) as info:
+        models["SearchIssuesSearch"].model_validate(
+            {"total": 1, "nodes": [{"__typename": "PullRequest"}]}
+        )
+
+    # only the member of the type is tried
+    assert {error["loc"][:3] for error in info.value.errors()} == {
+        ("nodes", 0, "PullRequest")
+    }
+
+
+def test_union_needs_typename(github_schema):
+    query = SEARCH_QUERY.replace("__typename", "")
+
+    with pytest.raises(GraphQLError, match="__typename"):
+        generate_projection_models([query], github_schema)
+
+
+def test_msgspec_backend_decodes_bytes(github_schema):
+    pytest.importorskip("msgspec")
+    models = load(
+        generate_projection_models([SEARCH_QUERY], github_schema, "msgspec")
+    )
+
+    body = json.dumps(
+        {
+            "data": {
+                "search": {
+                    "total": 2,
+                    "nodes": [
+                        {"__typename": "Issue", "title": "a", "state": "OPEN"},
+                        {"__typename": "Repository"},
+                    ],
+                }
+            }
+        }
+    ).encode()
+    response = decode_response(body, models["SearchIssues"])
+
+    assert response.errors is None
+    assert response.data.search.total == 2
+    issue, repository = response.data.search.nodes
+    assert isinstance(issue, models["SearchIssuesSearchNodesIssue"])
+    assert issue.state == models["IssueState"].OPEN
+    assert isinstance(repository, models["SearchIssuesSearchNodesOther"])
+
+
+def test_invalid_query(github_schema):
+    with pytest.raises(GraphQLError):
+        generate_projection_models(
+            ["query invalid { viewer { notAField } }"], github_schema
+        )
+
+    with pytest.raises(GraphQLError):
+        generate_projection_models(["{ viewer { login } }"], github_schema)
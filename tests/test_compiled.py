@@ -0,0 +1,165 @@
+import json
+
+import pytest
+from graphql import GraphQLError
+from graphql_query import Operation, Query
+
+from github_graphql_client.client.client import GraphQLClient
+from github_graphql_client.queries.compiled import (
+    CompiledQuery,
+    QueryRegistry,
+    registry,
+)
+from github_graphql_client.queries.marketplaceCategories import (
+    get_marketplace_categories,
+    get_marketplace_categories_compiled,
+)
+from github_graphql_client.queries.repository import (
+    get_repository_issues_compiled,
+    get_repository_issues_operation,
+    get_repository_issues_query,
+)
+from github_graphql_client.transport.aiohttp import AIOHTTPTransport
+from github_graphql_client.transport.codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    encode_request,
+)
+from github_graphql_client.transport.requests import RequestsTransport
+
+
+def test_builders_return_the_compiled_query():
+    query, variables = get_repository_issues_query("a", "b", 2, "OPEN")
+    operation, expected_variables = get_repository_issues_operation(
+        "a", "b", 2, "OPEN"
+    )
+
+    assert query == (
+        "query getRepositoryIssues($Owner:String!$Name:String!$Last:Int"
+        "$IssueState:[IssueState!]){repository(owner:$Owner name:$Name)"
+        "{__typename issues(last:$Last states:$IssueState){__typename"
+        " edges{__typename node{__typename title url}}}}}"
+    )
+    assert query is get_repository_issues_query("c", "d", 3, "CLOSED")[0]
+    assert variables == expected_variables
+    compiled, variables = get_repository_issues_compiled("a", "b", 2, "OPEN")
+    assert compiled is registry.get("getRepositoryIssues")
+    assert variables == expected_variables
+
+    query, variables = get_marketplace_categories(True, False, ["1"])
+    assert query == registry.get("getMarketplaceCategories").query
+    assert variables == {
+        "excludeEmpty": True,
+        "excludeSubcategories": False,
+        "includeCategories": ["1"],
+    }
+
+
+def test_queries_are_compiled_once():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return Operation(
+            type="query", name="viewer", queries=[Query(name="viewer")]
+        )
+
+    queries = QueryRegistry()
+    queries.register("viewer", build)
+
+    compiled = queries.get("viewer")
+    assert compiled == CompiledQuery("viewer", "query viewer{viewer}")
+    assert queries.get("viewer") is compiled
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError):
+        queries.register("viewer", build)
+
+
+def test_registered_queries_are_valid(github_schema):
+    assert registry.names() == [
+        "getMarketplaceCategories",
+        "getRepositoryIssues",
+    ]
+    registry.validate(github_schema)
+
+
+def test_invalid_query(github_schema):
+    queries = QueryRegistry(github_schema)
+    queries.register(
+        "invalid",
+        lambda: Operation(
+            type="query",
+            name="invalid",
+            queries=[Query(name="viewer", fields=["notAField"])],
+        ),
+    )
+
+    with pytest.raises(GraphQLError, match="notAField"):
+        queries.get("invalid")
+
+
+def test_request_prefix():
+    compiled = CompiledQuery.from_query(
+        "viewer", 'query viewer {\n  viewer {\n    login(x: "\\u00e9")\n  }\n}'
+    )
+
+    assert compiled.query == 'query viewer{viewer{login(x:"\\u00e9")}}'
+    assert json.loads(compiled.request_prefix + b"{}}") == {
+        "query": compiled.query,
+        "variables": {},
+    }
+
+
+@pytest.mark.parametrize(
+    "codec_class", [StdlibJSONCodec, OrjsonCodec, MsgspecCodec]
+)
+def test_encode_compiled_query(codec_class):
+    try:
+        codec = codec_class()
+    except ImportError:
+        pytest.skip(f"{codec_class.__name__} is not installed")
+
+    compiled = CompiledQuery("q", 'query q { a(s: "\\"é\\"") }')
+    variables = {"a": [1, "é"], "b": None}
+
+    body = encode_request(codec, compiled, variables)
+
+    assert json.loads(body) == {
+        "query": compiled.query,
+        "variables": variables,
+    }
+    assert json.loads(body) == json.loads(
+        encode_request(codec, compiled.query, variables)
+    )
+
+
+@pytest.mark.parametrize(
+    "transport_class", [AIOHTTPTransport, RequestsTransport]
+)
+def test_compiled_query_transfer(
+    graphql_server, graphql_endpoint, github_schema, transport_class
+):
+    compiled, variables = get_repository_issues_compiled("a", "b", 1, "OPEN")
+    categories, categories_variables = get_marketplace_categories_compiled(
+        True, False, []
+    )
+    client = GraphQLClient(
+        transport_class(graphql_endpoint, "token"), schema=github_schema
+    )
+
+    assert client.execute(compiled, variables) == {"echo": variables}
+    assert client.execute_batch(
+        [compiled, categories], [variables, categories_variables]
+    ) == [{"echo": variables}, {"echo": categories_variables}]
+
+    bodies = [request["body"] for request in graphql_server.requests]
+    assert len(bodies) == 3
+    assert bodies.count({"query": compiled.query, "variables": variables}) == 2
+    assert {"query": categories.query, "variables": categories_variables} in (
+        bodies
+    )
+    # the bodies were spliced from the cached prefixes
+    assert "request_prefix" in vars(compiled)
+    assert "request_prefix" in vars(categories)
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from github_graphql_client.transport.aiohttp import AIOHTTPTransport
+from github_graphql_client.transport.compression import (
+    COMPRESSORS,
+    RequestCompression,
+)
+from github_graphql_client.transport.requests import RequestsTransport
+
+QUERY = "query { viewer { login } }"
+
+
+def test_request_compression_threshold():
+    compression = RequestCompression("gzip", threshold=100)
+
+    assert compression.compress(b"{}") == (b"{}", {})
+
+    body, headers = compression.compress(b"x" * 1000)
+    assert headers == {"Content-Encoding": "gzip"}
+    assert len(body) < 1000
+
+
+def test_request_compression_unknown_encoding():
+    with pytest.raises(ValueError):
+        RequestCompression("lzma")
+
+
+@pytest.mark.parametrize(
+    "encoding, extra", [("br", "brotli"), ("zstd", "zstd")]
+)
+def test_request_compression_missing_extra(monkeypatch, encoding, extra):
+    monkeypatch.delitem(COMPRESSORS, encoding, raising=False)
+
+    with pytest.raises(ValueError, match=f"`{extra}` extra"):
+        RequestCompression(encoding)
+
+
+@pytest.mark.parametrize("encoding", list(COMPRESSORS))
+def test_compressors(encoding):
+    body, _ = RequestCompression(encoding, threshold=0).compress(b"x" * 100)
+    assert body != b"x" * 100
+
+
+def execute(transport, variables):
+    if isinstance(transport, RequestsTransport):
+        transport.connect()
+        try:
+            return transport.execute(QUERY, variables)
+        finally:
+            transport.close()
+
+    async def execute_async():
+        await transport.connect()
+        try:
+            return await transport.execute(QUERY, variables)
+        finally:
+            await transport.close()
+
+    return asyncio.run(execute_async())
+
+
+@pytest.mark.parametrize(
+    "transport_class", [AIOHTTPTransport, RequestsTransport]
+)
+def test_compressed_transfer(
+    graphql_server, graphql_endpoint, transport_class
+):
+    graphql_server.gzip = True
+    transport = transport_class(
+        graphql_endpoint,
+        "token",
+        compression=RequestCompression("gzip", threshold=10),
+    )
+    variables = {"ids": [f"R_{i}" for i in range(100)]}
+
+    assert execute(transport, variables) == {"echo": variables}
+
+    headers = graphql_server.requests[0]["headers"]
+    assert headers["Content-Encoding"] == "gzip"
+    assert "gzip" in headers["Accept-Encoding"]
@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+import pydantic
+import pytest
+
+from github_graphql_client import model
+
+
+def test_leaf_model_loads_without_core():
+    script = (
+        "import sys\n"
+        "from github_graphql_client.model import PageInfo\n"
+        "PageInfo.model_validate("
+        "{'hasNextPage': True, 'hasPreviousPage': False})\n"
+        "assert 'github_graphql_client.models.core' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_model_resolves_lazily_loaded_references():
+    connection = model.LabelConnection.model_validate(
+        {
+            "totalCount": 1,
+            "pageInfo": {"hasNextPage": False, "hasPreviousPage": False},
+            "edges": [{"cursor": "a"}],
+        }
+    )
+
+    assert isinstance(connection.pageInfo, model.PageInfo)
+    assert isinstance(connection.edges[0], model.LabelEdge)
+
+
+def test_union_alias_members_are_loaded():
+    model.SponsorableItemConnection.model_rebuild()
+
+    assert model.SponsorableItemConnection.__pydantic_complete__
+
+
+def test_unions_are_discriminated_by_typename():
+    with pytest.raises(pydantic.ValidationError) as info:
+        model.SponsorableItemConnection.model_validate(
+            {
+                "totalCount": 1,
+                "pageInfo": {"hasNextPage": False, "hasPreviousPage": False},
+                "nodes": [{"__typename": "Organization"}],
+            }
+        )
+
+    # only the member of the type is tried
+    assert {error["loc"][:3] for error in info.value.errors()} == {
+        ("nodes", 0, "Organization")
+    }
+
+
+def test_dir_lists_all_models():
+    assert {"PageInfo", "Repository", "SearchResultItem"} <= set(dir(model))
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        model.NotAGraphQLType
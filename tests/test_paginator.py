@@ -0,0 +1,156 @@
+import asyncio
+import time
+
+import pytest
+
+from github_graphql_client.client.paginator import Paginator
+from github_graphql_client.queries.pagination import paginate_operation
+from github_graphql_client.queries.repository import (
+    get_repository_issues_operation,
+)
+
+
+class FakeClient:
+    """Serves `pages` of `repository.issues` keyed by the cursor."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.cursors = []
+
+    def execute(self, query, variables, **kwargs):
+        cursor = variables["Cursor"]
+        self.cursors.append(cursor)
+        index = 0 if cursor is None else int(cursor)
+        has_previous = index + 1 < len(self.pages)
+
+        return {
+            "repository": {
+                "issues": {
+                    "edges": self.pages[index],
+                    "pageInfo": {
+                        "hasPreviousPage": has_previous,
+                        "startCursor": str(index + 1)
+                        if has_previous
+                        else None,
+                    },
+                }
+            }
+        }
+
+    async def execute_async(self, query, variables, **kwargs):
+        return self.execute(query, variables, **kwargs)
+
+
+def test_paginate_operation_forward():
+    operation, _ = get_repository_issues_operation("a", "b", 2, "OPEN")
+    operation.queries[0].fields[0].arguments[0].name = "first"
+
+    paginated = paginate_operation(operation, "repository.issues")
+
+    assert "after: $Cursor" in paginated.operation.render()
+    assert paginated.has_more_field == "hasNextPage"
+    assert paginated.cursor_field == "endCursor"
+
+
+def test_paginate_operation_unknown_path():
+    operation, _ = get_repository_issues_operation("a", "b", 2, "OPEN")
+
+    with pytest.raises(ValueError):
+        paginate_operation(operation, "repository.pullRequests")
+
+
+def test_paginator_sync():
+    client = FakeClient([[1, 2], [3, 4], [5]])
+    operation, variables = get_repository_issues_operation("a", "b", 2, "OPEN")
+
+    pages = Paginator(client, operation, variables, "repository.issues")
+
+    assert [page["edges"] for page in pages] == [[1, 2], [3, 4], [5]]
+    assert client.cursors == [None, "1", "2"]
+
+
+def test_paginator_async():
+    client = FakeClient([[1], [2]])
+    operation, variables = get_repository_issues_operation("a", "b", 1, "OPEN")
+
+    async def collect():
+        pages = Paginator(client, operation, variables, "repository.issues")
+        return [page["edges"] async for page in pages]
+
+    assert asyncio.run(collect()) == [[1], [2]]
+
+
+def test_paginator_prefetch_sync():
+    client = FakeClient([[1], [2], [3], [4]])
+    operation, variables = get_repository_issues_operation("a", "b", 1, "OPEN")
+
+    pages = Paginator(
+        client, operation, variables, "repository.issues", prefetch=2
+    )
+    edges = []
+    for page in pages:
+        if not edges:
+            # the next page is requested while the first one is processed
+            for _ in range(100):
+                if len(client.cursors) > 1:
+                    break
+                time.sleep(0.01)
+            assert len(client.cursors) > 1
+        edges.append(page["edges"])
+
+    assert edges == [[1], [2], [3], [4]]
+
+
+def test_paginator_prefetch_sync_early_exit_and_errors():
+    client = FakeClient([[1], [2], [3]])
+    operation, variables = get_repository_issues_operation("a", "b", 1, "OPEN")
+
+    for page in Paginator(
+        client, operation, variables, "repository.issues", prefetch=1
+    ):
+        break
+
+    def fail(query, variables, **kwargs):
+        raise RuntimeError("boom")
+
+    client.execute = fail
+    pages = Paginator(
+        client, operation, variables, "repository.issues", prefetch=1
+    )
+    with pytest.raises(RuntimeError):
+        list(pages)
+
+
+def test_paginator_prefetch_async():
+    client = FakeClient([[1], [2], [3]])
+    operation, variables = get_repository_issues_operation("a", "b", 1, "OPEN")
+
+    async def collect():
+        pages = Paginator(
+            client, operation, variables, "repository.issues", prefetch=2
+        )
+        return [page["edges"] async for page in pages]
+
+    assert asyncio.run(collect()) == [[1], [2], [3]]
+
+
+def test_paginator_prefetch_async_early_exit():
+    client = FakeClient([[1], [2], [3]])
+    operation, variables = get_repository_issues_operation("a", "b", 1, "OPEN")
+
+    async def execute_async(query, variables, **kwargs):
+        await asyncio.sleep(0.01)
+        return client.execute(query, variables, **kwargs)
+
+    client.execute_async = execute_async
+
+    async def first_page():
+        pages = Paginator(
+            client, operation, variables, "repository.issues", prefetch=2
+        ).__aiter__()
+        page = await anext(pages)
+        await pages.aclose()
+        # the prefetching task is cancelled and awaited, not left pending
+        return page["edges"], asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(first_page()) == ([1], set())
@@ -0,0 +1,115 @@
+import importlib
+from pathlib import Path
+
+import pydantic
+import pytest
+from graphql import (
+    GraphQLError,
+    assert_valid_schema,
+    build_schema,
+    parse,
+    print_schema,
+    validate,
+)
+
+from github_graphql_client import pruned_model
+from github_graphql_client.codegen.prune import (
+    get_query_operations,
+    prune_schema,
+)
+
+ROOT = Path(__file__).parent.parent
+PRUNED_SCHEMA_FILENAME = ROOT / "tests/data/schema.pruned.graphql"
+
+SEARCH_QUERY = """
+query searchIssues($query: String!) {
+  search(query: $query, type: ISSUE, first: 2) {
+    nodes {
+      __typename
+      ... on Issue { title author { login } }
+    }
+  }
+}
+"""
+
+
+def test_pruned_schema_is_up_to_date(github_schema):
+    pruned = prune_schema(github_schema, get_query_operations())
+
+    sdl = PRUNED_SCHEMA_FILENAME.read_text(encoding="utf8")
+    assert print_schema(pruned) + "\n" == sdl
+
+    schema = build_schema(sdl)
+    for operation in get_query_operations():
+        assert validate(schema, parse(operation.render())) == []
+
+
+def test_pruned_models_are_up_to_date(github_schema, monkeypatch):
+    monkeypatch.syspath_prepend(str(ROOT / "scripts"))
+    script = importlib.import_module("prune_schema")
+
+    pruned = prune_schema(github_schema, get_query_operations())
+    source = script.prune_models(pruned, script.load_definitions())
+
+    assert source == Path(pruned_model.__file__).read_text(encoding="utf8")
+
+
+def test_pruned_schema(github_schema):
+    pruned = prune_schema(github_schema, [SEARCH_QUERY])
+    assert_valid_schema(pruned)
+
+    assert "viewer" not in pruned.query_type.fields
+    # fields of reached types are kept
+    assert "body" in pruned.type_map["Issue"].fields
+    assert "repository" not in pruned.type_map["Issue"].fields
+    # the members of the union only reached by fragments
+    assert [t.name for t in pruned.type_map["SearchResultItem"].types] == [
+        "Issue"
+    ]
+    assert "Repository" not in pruned.type_map
+    assert pruned.mutation_type is None
+    assert validate(pruned, parse(SEARCH_QUERY)) == []
+    assert validate(pruned, parse("{ viewer { login } }"))
+
+
+def test_interface_fields_are_implemented(github_schema):
+    query = """
+    query {
+      node(id: "1") {
+        ... on Actor { login url }
+        ... on User { name }
+      }
+    }
+    """
+    pruned = prune_schema(github_schema, [query])
+    assert_valid_schema(pruned)
+
+    user = pruned.type_map["User"]
+    assert [interface.name for interface in user.interfaces] == [
+        "Actor",
+        "Node",
+    ]
+    assert {"login", "url", "id"} <= set(user.fields)
+
+
+def test_invalid_query(github_schema):
+    with pytest.raises(GraphQLError, match="notAField"):
+        prune_schema(github_schema, ["{ viewer { notAField } }"])
+
+
+def test_pruned_models():
+    models = [
+        value
+        for value in vars(pruned_model).values()
+        if isinstance(value, type)
+        and issubclass(value, pydantic.BaseModel)
+        and value.__module__ == pruned_model.__name__
+    ]
+    for model in models:
+        model.model_rebuild()
+
+    assert "labels" not in pruned_model.Issue.model_fields
+    page_info = pruned_model.PageInfo.model_validate(
+        {"hasNextPage": False, "hasPreviousPage": False}
+    )
+    assert page_info.typename__ == "PageInfo"
@@ -1,40 +1,83 @@
-from pathlib import Path
-
-from graphql import GraphQLSchema, Source, build_schema, parse, validate
+from graphql import Source, parse, validate
 
+from github_graphql_client.queries.batch import merge_operations
 from github_graphql_client.queries.marketplaceCategories import (
     get_marketplace_categories,
 )
+from github_graphql_client.queries.pagination import paginate_operation
+from github_graphql_client.queries.rateLimit import with_rate_limit
 from github_graphql_client.queries.repository import (
+    get_repository_issues_operation,
     get_repository_issues_query,
 )
+from github_graphql_client.queries.typename import with_typename
 
-SCHEMA_FILENAME = Path(__file__).parent / Path("data/schema.docs.graphql")
 
+def test_repository_issues_query(github_schema):
+    query, _ = get_repository_issues_query("pydantic", "FastUI", 2, "OPEN")
+    document = parse(Source(query))
 
-def get_schema() -> GraphQLSchema:
-    with SCHEMA_FILENAME.open("r", encoding="utf8") as f:
-        schema_str = f.read()
+    validation_errors = validate(github_schema, document)
+    if validation_errors:
+        raise validation_errors[0]
 
-    return build_schema(schema_str)
 
+def test_get_marketplace_categories(github_schema):
+    query, _ = get_marketplace_categories(True, False, ["1", "2", "3"])
+    document = parse(Source(query))
 
-schema = get_schema()
+    validation_errors = validate(github_schema, document)
+    if validation_errors:
+        raise validation_errors[0]
 
 
-def test_repository_issues_query():
-    query, _ = get_repository_issues_query("pydantic", "FastUI", 2, "OPEN")
-    document = parse(Source(query))
+def test_merged_repository_issues_query(github_schema):
+    merged = merge_operations(
+        [
+            get_repository_issues_operation("pydantic", "FastUI", 2, "OPEN"),
+            get_repository_issues_operation("pydantic", "pydantic", 5, "OPEN"),
+        ]
+    )
+    document = parse(Source(merged.query))
 
-    validation_errors = validate(schema, document)
+    validation_errors = validate(github_schema, document)
     if validation_errors:
         raise validation_errors[0]
 
 
-def test_get_marketplace_categories():
-    query, _ = get_marketplace_categories(True, False, ["1", "2", "3"])
+def test_paginated_repository_issues_query(github_schema):
+    operation, _ = get_repository_issues_operation(
+        "pydantic", "FastUI", 2, "OPEN"
+    )
+    paginated = paginate_operation(operation, "repository.issues")
+    document = parse(Source(paginated.operation.render()))
+
+    validation_errors = validate(github_schema, document)
+    if validation_errors:
+        raise validation_errors[0]
+
+
+def test_repository_issues_query_with_rate_limit(github_schema):
+    operation, _ = get_repository_issues_operation(
+        "pydantic", "FastUI", 2, "OPEN"
+    )
+    document = parse(Source(with_rate_limit(operation).render()))
+
+    validation_errors = validate(github_schema, document)
+    if validation_errors:
+        raise validation_errors[0]
+
+
+def test_repository_issues_query_with_typename(github_schema):
+    operation, _ = get_repository_issues_operation(
+        "pydantic", "FastUI", 2, "OPEN"
+    )
+    query = with_typename(with_typename(operation)).render()
     document = parse(Source(query))
 
-    validation_errors = validate(schema, document)
+    validation_errors = validate(github_schema, document)
     if validation_errors:
         raise validation_errors[0]
+
+    # every selection set but the root, once
+    assert query.count("__typename") == 4
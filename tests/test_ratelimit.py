@@ -0,0 +1,77 @@
+import pytest
+
+from github_graphql_client.transport.ratelimit import RateLimiter
+from github_graphql_client.transport.requests import RequestsTransport
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limiter_paces_before_first_response():
+    limiter = RateLimiter(burst=2, clock=FakeClock(), limit=100, window=100)
+
+    # the default budget of 100 points over 100 seconds
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(1)
+    assert limiter.reserve() == pytest.approx(2)
+
+
+def test_rate_limiter_paces_after_burst():
+    clock = FakeClock()
+    limiter = RateLimiter(burst=2, clock=clock)
+    limiter.update_from_headers(
+        {"x-ratelimit-remaining": "100", "x-ratelimit-reset": "1100"}
+    )
+
+    # 100 points over 100 seconds is one point per second
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(1, rel=0.1)
+    assert limiter.reserve() == pytest.approx(2, rel=0.1)
+
+    clock.now += 2
+    assert limiter.reserve() == pytest.approx(1, rel=0.1)
+
+
+def test_rate_limiter_waits_for_reset_when_exhausted():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limiter.update_from_payload(
+        {
+            "rateLimit": {
+                "cost": 3,
+                "remaining": 2,
+                "resetAt": "1970-01-01T00:20:00Z",
+            }
+        }
+    )
+
+    assert limiter.cost == 3
+    assert limiter.reserve() == 200
+
+    clock.now = 1200
+    assert limiter.reserve() == 0
+
+
+def test_transport_updates_rate_limiter(graphql_server, graphql_endpoint):
+    graphql_server.headers = {
+        "x-ratelimit-remaining": "4999",
+        "x-ratelimit-reset": "4102444800",
+    }
+    limiter = RateLimiter()
+    transport = RequestsTransport(
+        graphql_endpoint, "token", rate_limiter=limiter
+    )
+
+    transport.connect()
+    transport.execute("query { viewer { login } }", {})
+    transport.close()
+
+    assert limiter.remaining == 4999
+    assert limiter.reset_at == 4102444800
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from github_graphql_client.transport.aiohttp import AIOHTTPTransport
+from github_graphql_client.transport.exceptions import TransportServerError
+from github_graphql_client.transport.requests import RequestsTransport
+from github_graphql_client.transport.retry import (
+    RetryBudget,
+    RetryPolicy,
+    get_retry_after,
+)
+
+QUERY = "query { viewer { login } }"
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=0)
+
+    assert policy.get_delay(Exception(), 1) == 1
+    assert policy.get_delay(Exception(), 3) == 4
+    assert policy.get_delay(Exception(), 10) == 5
+    assert policy.get_delay(TransportServerError("", 429, 7), 1) == 7
+
+
+def test_retry_policy_should_retry():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry(TransportServerError("", 502), 1)
+    assert not policy.should_retry(TransportServerError("", 502), 3)
+    assert not policy.should_retry(TransportServerError("", 401), 1)
+    assert not policy.should_retry(TransportServerError("", 403), 1)
+    assert policy.should_retry(TransportServerError("", 403, 60), 1)
+    # the rate limit window resets too late
+    assert not policy.should_retry(TransportServerError("", 403, 3600), 1)
+    assert not policy.should_retry(TransportServerError("", 429, 61), 1)
+
+
+def test_retry_budget():
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.record_success()
+    budget.record_success()
+    assert budget.withdraw()
+
+
+def test_get_retry_after():
+    assert get_retry_after({"retry-after": "3"}) == 3
+    assert get_retry_after({}) is None
+    assert (
+        get_retry_after(
+            {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "0"}
+        )
+        == 0
+    )
+
+
+@pytest.fixture
+def local_time_zone(monkeypatch):
+    """A local time zone far from GMT."""
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_get_retry_after_dates(local_time_zone):
+    date = formatdate(time.time() + 100, usegmt=True)
+    assert get_retry_after({"retry-after": date}) == pytest.approx(100, abs=2)
+
+    # "-0000" is a date without a zone, which is GMT as well
+    naive = formatdate(time.time() + 100)
+    assert get_retry_after({"retry-after": naive}) == pytest.approx(100, abs=2)
+
+
+@pytest.mark.parametrize("value", ["soon", "", "Mon, 99 Foo 2024"])
+def test_get_retry_after_malformed(value):
+    assert get_retry_after({"retry-after": value}) is None
+
+
+def test_requests_transport_retries(graphql_server, graphql_endpoint):
+    graphql_server.failures = [(502, {}), (403, {"Retry-After": "0"})]
+    transport = RequestsTransport(
+        graphql_endpoint, "token", retry=RetryPolicy(backoff=0)
+    )
+
+    transport.connect()
+    assert transport.execute(QUERY, {"i": 1}) == {"echo": {"i": 1}}
+    transport.close()
+
+    assert len(graphql_server.requests) == 3
+
+
+def test_requests_transport_retries_malformed_retry_after(
+    graphql_server, graphql_endpoint
+):
+    graphql_server.failures = [(503, {"Retry-After": "soon"})]
+    transport = RequestsTransport(
+        graphql_endpoint, "token", retry=RetryPolicy(backoff=0)
+    )
+
+    transport.connect()
+    assert transport.execute(QUERY, {"i": 1}) == {"echo": {"i": 1}}
+    transport.close()
+
+    assert len(graphql_server.requests) == 2
+
+
+def test_requests_transport_raises_exhausted_rate_limit(
+    graphql_server, graphql_endpoint
+):
+    reset = str(int(time.time()) + 3600)
+    graphql_server.failures = [
+        (403, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset})
+    ]
+    transport = RequestsTransport(
+        graphql_endpoint, "token", retry=RetryPolicy(backoff=0)
+    )
+
+    transport.connect()
+    with pytest.raises(TransportServerError) as e:
+        transport.execute(QUERY, {})
+    transport.close()
+
+    assert e.value.status_code == 403
+    assert len(graphql_server.requests) == 1
+
+
+def test_requests_transport_raises_http_errors(
+    graphql_server, graphql_endpoint
+):
+    graphql_server.failures = [(401, {})]
+    transport = RequestsTransport(
+        graphql_endpoint, "token", retry=RetryPolicy(backoff=0)
+    )
+
+    transport.connect()
+    with pytest.raises(TransportServerError) as e:
+        transport.execute(QUERY, {})
+    transport.close()
+
+    assert e.value.status_code == 401
+    assert len(graphql_server.requests) == 1
+
+
+def test_aiohttp_transport_retries(graphql_server, graphql_endpoint):
+    graphql_server.failures = [(503, {}), (503, {}), (503, {})]
+    transport = AIOHTTPTransport(
+        graphql_endpoint, "token", retry=RetryPolicy(backoff=0)
+    )
+
+    async def execute():
+        await transport.connect()
+        try:
+            return await transport.execute(QUERY, {"i": 1})
+        finally:
+            await transport.close()
+
+    with pytest.raises(TransportServerError):
+        asyncio.run(execute())
+
+    assert len(graphql_server.requests) == 3
+    assert asyncio.run(execute()) == {"echo": {"i": 1}}
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from github_graphql_client.client.scheduler import BatchScheduler
+
+
+def test_scheduler_respects_max_in_flight():
+    in_flight = 0
+    peak = 0
+
+    async def job(i):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (i % 3))
+        in_flight -= 1
+        return i
+
+    scheduler = BatchScheduler(max_in_flight=4)
+    jobs = [lambda i=i: job(i) for i in range(50)]
+
+    assert asyncio.run(scheduler.run(jobs)) == list(range(50))
+    assert peak == 4
+
+
+def test_scheduler_propagates_errors():
+    async def job(i):
+        if i == 3:
+            raise ValueError(i)
+        return i
+
+    scheduler = BatchScheduler(max_in_flight=2)
+
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run([lambda i=i: job(i) for i in range(10)]))
+
+
+def test_scheduler_rejects_invalid_limit():
+    with pytest.raises(ValueError):
+        BatchScheduler(max_in_flight=0)
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pytest
+from graphql import GraphQLString, Source, parse, print_schema, validate
+from graphql.pyutils import Undefined
+
+from github_graphql_client import schema as schema_module
+from github_graphql_client.schema import load_schema
+
+SCHEMA_FILENAME = Path(__file__).parent / "data/schema.docs.graphql"
+
+SDL = """
+type Query {
+  viewer(first: Int, after: String = null, state: State): User!
+}
+
+enum State {
+  OPEN
+  CLOSED
+}
+
+type User {
+  login: String!
+  name: String @deprecated(reason: "Use `login`.")
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def schemas(monkeypatch):
+    # only the on-disk cache
+    monkeypatch.setattr(schema_module, "_schemas", {})
+
+
+def load_uncached(filename, cache_dir, monkeypatch):
+    monkeypatch.setattr(schema_module, "_schemas", {})
+    return load_schema(filename, cache_dir)
+
+
+def test_schema_is_cached(tmp_path, monkeypatch):
+    filename = tmp_path / "schema.graphql"
+    filename.write_text(SDL)
+    cache_dir = tmp_path / "cache"
+
+    built = load_schema(filename, cache_dir)
+    assert load_schema(filename, cache_dir) is built
+    [cache_file] = cache_dir.iterdir()
+
+    def build_schema(*args, **kwargs):
+        raise AssertionError("not cached")
+
+    monkeypatch.setattr(schema_module, "build_schema", build_schema)
+    cached = load_uncached(filename, cache_dir, monkeypatch)
+
+    assert cached is not built
+    assert print_schema(cached) == print_schema(built)
+    assert cached.type_map["String"] is GraphQLString
+    argument = cached.query_type.fields["viewer"].args["state"]
+    assert argument.default_value is Undefined
+    assert argument.type is cached.type_map["State"]
+    assert list(cache_dir.iterdir()) == [cache_file]
+
+
+def test_changed_schema_is_rebuilt(tmp_path, monkeypatch):
+    filename = tmp_path / "schema.graphql"
+    filename.write_text(SDL)
+    load_schema(filename, tmp_path)
+
+    filename.write_text(SDL.replace("CLOSED", "MERGED"))
+    schema = load_uncached(filename, tmp_path, monkeypatch)
+
+    assert list(schema.type_map["State"].values) == ["OPEN", "MERGED"]
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+
+def test_broken_cache_is_rebuilt(tmp_path, monkeypatch):
+    filename = tmp_path / "schema.graphql"
+    filename.write_text(SDL)
+    load_schema(filename, tmp_path)
+    [cache_file] = tmp_path.glob("*.pickle")
+    cache_file.write_bytes(cache_file.read_bytes()[:100])
+
+    schema = load_uncached(filename, tmp_path, monkeypatch)
+
+    assert "User" in schema.type_map
+    assert load_uncached(filename, tmp_path, monkeypatch) is not schema
+
+
+def test_cached_github_schema_validates(tmp_path, monkeypatch):
+    load_schema(SCHEMA_FILENAME, tmp_path)
+    schema = load_uncached(SCHEMA_FILENAME, tmp_path, monkeypatch)
+
+    document = parse(
+        Source(
+            """
+            query {
+              repository(owner: "a", name: "b") {
+                issues(first: 1, states: [OPENED]) { nodes { title } }
+                notAField
+              }
+            }
+            """
+        )
+    )
+    errors = [error.message for error in validate(schema, document)]
+
+    assert errors == [
+        "Value 'OPENED' does not exist in 'IssueState' enum."
+        " Did you mean the enum value 'OPEN'?",
+        "Cannot query field 'notAField' on type 'Repository'.",
+    ]
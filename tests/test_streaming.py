@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from github_graphql_client.transport.aiohttp import AIOHTTPTransport
+from github_graphql_client.transport.exceptions import TransportQueryError
+from github_graphql_client.transport.requests import RequestsTransport
+
+pytest.importorskip("ijson")
+
+QUERY = "query { viewer { login } }"
+NODES = [{"title": f"issue {i}", "score": i / 2} for i in range(50)]
+ERRORS = [{"message": "Something went wrong", "path": ["echo", "nodes"]}]
+
+
+def test_requests_execute_stream(graphql_server, graphql_endpoint):
+    graphql_server.gzip = True
+    transport = RequestsTransport(graphql_endpoint, "token")
+
+    transport.connect()
+    items = transport.execute_stream(QUERY, {"nodes": NODES}, "echo.nodes")
+    assert list(items) == NODES
+    transport.close()
+
+
+def test_aiohttp_execute_stream(graphql_endpoint):
+    transport = AIOHTTPTransport(graphql_endpoint, "token")
+
+    async def collect():
+        await transport.connect()
+        try:
+            items = transport.execute_stream(
+                QUERY, {"nodes": NODES}, "echo.nodes"
+            )
+            return [item async for item in items]
+        finally:
+            await transport.close()
+
+    assert asyncio.run(collect()) == NODES
+
+
+def test_requests_execute_stream_raises_errors(
+    graphql_server, graphql_endpoint
+):
+    transport = RequestsTransport(graphql_endpoint, "token")
+
+    transport.connect()
+    items = []
+    with pytest.raises(TransportQueryError) as info:
+        for item in transport.execute_stream(
+            QUERY, {"nodes": NODES, "errors": ERRORS}, "echo.nodes"
+        ):
+            items.append(item)
+    transport.close()
+
+    assert items == NODES
+    assert info.value.errors == ERRORS
+
+
+def test_aiohttp_execute_stream_raises_errors(graphql_endpoint):
+    transport = AIOHTTPTransport(graphql_endpoint, "token")
+    items = []
+
+    async def collect():
+        await transport.connect()
+        try:
+            async for item in transport.execute_stream(
+                QUERY, {"nodes": NODES, "errors": ERRORS}, "echo.nodes"
+            ):
+                items.append(item)
+        finally:
+            await transport.close()
+
+    with pytest.raises(TransportQueryError) as info:
+        asyncio.run(collect())
+
+    assert items == NODES
+    assert info.value.errors == ERRORS
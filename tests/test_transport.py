@@ -0,0 +1,53 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from github_graphql_client.transport.requests import RequestsTransport
+
+QUERY = "query { viewer { login } }"
+
+
+def test_requests_transport_headers_are_immutable(graphql_endpoint):
+    transport = RequestsTransport(graphql_endpoint, "token")
+    headers = dict(transport.headers)
+
+    transport.connect()
+    transport.execute(QUERY, {})
+    transport.close()
+
+    assert transport.headers == headers
+    assert transport.auth_header == {"Authorization": "Bearer token"}
+
+
+def test_requests_transport_shared_by_threads(graphql_endpoint):
+    transport = RequestsTransport(graphql_endpoint, "t", pool_maxsize=4)
+    transport.connect()
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(
+            executor.map(
+                lambda i: transport.execute(QUERY, {"i": i}), range(40)
+            )
+        )
+
+    assert results == [{"echo": {"i": i}} for i in range(40)]
+    transport.close()
+
+
+def test_httpx_transport(graphql_endpoint):
+    pytest.importorskip("h2")
+    from github_graphql_client.transport.httpx import HTTPXTransport
+
+    transport = HTTPXTransport(graphql_endpoint, "token")
+
+    async def execute():
+        await transport.connect()
+        try:
+            return await asyncio.gather(
+                *(transport.execute(QUERY, {"i": i}) for i in range(10))
+            )
+        finally:
+            await transport.close()
+
+    assert asyncio.run(execute()) == [{"echo": {"i": i}} for i in range(10)]
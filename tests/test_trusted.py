@@ -0,0 +1,94 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from github_graphql_client import model
+from github_graphql_client.client.trusted import construct_model
+from github_graphql_client.queries import responses
+
+
+class RepositoryData(BaseModel):
+    repository: Optional[model.Repository] = None
+
+
+def test_construct_schema_models_from_partial_selection():
+    data = construct_model(
+        RepositoryData,
+        {
+            "repository": {
+                "__typename": "Repository",
+                "issues": {
+                    "totalCount": 1,
+                    "nodes": [
+                        {
+                            "number": 3,
+                            "state": "OPEN",
+                            "labels": {"nodes": [{"name": "bug"}, None]},
+                        }
+                    ],
+                },
+            }
+        },
+    )
+
+    issues = data.repository.issues
+    assert isinstance(issues, model.IssueConnection)
+    [issue] = issues.nodes
+    assert isinstance(issue, model.Issue)
+    assert issue.state == model.IssueState.OPEN
+    assert issue.labels.nodes[0].name == "bug"
+    assert issue.labels.nodes[1] is None
+    # defaults are filled in, but not marked as set
+    assert issue.typename__ == "Issue"
+    assert issue.model_fields_set == {"number", "state", "labels"}
+
+
+def test_construct_unions_by_typename():
+    connection = construct_model(
+        model.SponsorableItemConnection,
+        {
+            "totalCount": 2,
+            "nodes": [
+                {"__typename": "User", "login": "octocat"},
+                {"__typename": "Organization", "login": "github"},
+            ],
+        },
+    )
+
+    user, organization = connection.nodes
+    assert isinstance(user, model.User)
+    assert isinstance(organization, model.Organization)
+
+
+def test_construct_unions_without_known_typename():
+    untyped = {"login": "octocat"}
+    bot = {"__typename": "Bot", "login": "dependabot"}
+    connection = construct_model(
+        model.SponsorableItemConnection, {"nodes": [untyped, bot]}
+    )
+
+    assert connection.nodes == [untyped, bot]
+
+
+def test_construct_projection_models():
+    payload = {
+        "repository": {
+            "__typename": "Repository",
+            "issues": {
+                "__typename": "IssueConnection",
+                "edges": [
+                    {
+                        "__typename": "IssueEdge",
+                        "node": {
+                            "__typename": "Issue",
+                            "title": "a",
+                            "url": "b",
+                        },
+                    }
+                ],
+            },
+        }
+    }
+    data = construct_model(responses.GetRepositoryIssues, payload)
+
+    assert data == responses.GetRepositoryIssues.model_validate(payload)
@@ -0,0 +1,34 @@
+import pytest
+from graphql import GraphQLError, GraphQLSyntaxError
+
+from github_graphql_client.client import validation
+from github_graphql_client.client.validation import QueryValidator
+
+
+def test_verdicts_are_cached(github_schema, monkeypatch):
+    calls = []
+
+    def validate(schema, document):
+        calls.append(document)
+        return original(schema, document)
+
+    original = validation.validate
+    monkeypatch.setattr(validation, "validate", validate)
+    validator = QueryValidator(github_schema)
+
+    for _ in range(3):
+        validator.validate("query { viewer { login } }")
+        with pytest.raises(GraphQLError) as error:
+            validator.validate("query { viewer { notAField } }")
+
+    assert len(calls) == 2
+    assert error.value.locations[0].line == 1
+    # tracebacks do not pile up on the cached error
+    assert len(list(error.traceback)) < 5
+
+
+def test_syntax_errors(github_schema):
+    validator = QueryValidator(github_schema)
+
+    with pytest.raises(GraphQLSyntaxError):
+        validator.validate("query { viewer { login }")